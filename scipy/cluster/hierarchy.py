@@ -439,7 +439,7 @@ def ward(y):
     return linkage(y, method='ward', metric='euclidean')
 
 
-def linkage(y, method='single', metric='euclidean'):
+def linkage(y, method='single', metric='euclidean', save_memory=False):
     """
     Performs hierarchical/agglomerative clustering on the
      condensed distance matrix y. y must be a :math:`{n \\choose 2}` sized
@@ -565,6 +565,12 @@ def linkage(y, method='single', metric='euclidean'):
      implementation may chose a different minimum than the MATLAB(TM)
      version.
 
+     The single linkage is computed from a minimum spanning tree of the
+     observations, and the complete, average, weighted and ward
+     linkages by the nearest-neighbor chain algorithm, all in
+     :math:`O(n^2)` time. The centroid and median linkages use the
+     generic :math:`O(n^3)` algorithm described above.
+
      :Parameters:
         - y : ndarray
             A condensed or redundant distance matrix. A condensed
@@ -579,6 +585,16 @@ def linkage(y, method='single', metric='euclidean'):
         - metric : string
             The distance metric to use. See the ``distance.pdist``
             function for a list of valid distance metrics.
+        - save_memory : bool
+            If True and ``y`` is a collection of observation vectors,
+            the distances are computed as they are needed rather than
+            stored in a condensed distance matrix, so that only
+            :math:`O(n)` memory is used instead of :math:`O(n^2)`.
+            This is supported for ``single`` linkage, which is
+            computed from a minimum spanning tree of the observations
+            under any metric, and for ``ward`` linkage, which is
+            computed by the nearest-neighbor chain algorithm from the
+            centroids of the clusters.
 
     :Returns:
 
@@ -601,29 +617,163 @@ def linkage(y, method='single', metric='euclidean'):
         [y] = _copy_arrays_if_base_present([y])
 
         Z = np.zeros((d - 1, 4))
-        _hierarchy_wrap.linkage_wrap(y, Z, int(d), \
-                                   int(_cpy_non_euclid_methods[method]))
+        _linkage_reducible(y, Z, int(d), method)
     elif len(s) == 2:
         X = y
         n = s[0]
         m = s[1]
         if method not in _cpy_linkage_methods:
             raise ValueError('Invalid method: %s' % method)
-        if method in _cpy_non_euclid_methods.keys():
+        if save_memory:
+            if method == 'single':
+                Z = _mst_single_linkage(X, metric)
+            elif method == 'ward':
+                if metric != 'euclidean':
+                    raise ValueError('Method %s requires the distance metric to be euclidean' % method)
+                Z = _nn_chain_ward(X)
+            else:
+                raise ValueError("Valid methods when save_memory is True are 'single' and 'ward'.")
+        elif method in _cpy_non_euclid_methods.keys():
             dm = distance.pdist(X, metric)
             Z = np.zeros((n - 1, 4))
-            _hierarchy_wrap.linkage_wrap(dm, Z, n, \
-                                       int(_cpy_non_euclid_methods[method]))
+            _linkage_reducible(dm, Z, n, method)
         elif method in _cpy_euclid_methods.keys():
             if metric != 'euclidean':
                 raise ValueError('Method %s requires the distance metric to be euclidean' % s)
             dm = distance.pdist(X, metric)
             Z = np.zeros((n - 1, 4))
-            _hierarchy_wrap.linkage_euclid_wrap(dm, Z, X, m, n,
+            if method == 'ward':
+                _linkage_reducible(dm, Z, n, method)
+            else:
+                _hierarchy_wrap.linkage_euclid_wrap(dm, Z, X, m, n,
                                               int(_cpy_euclid_methods[method]))
     return Z
 
-class ClusterNode:
+def _linkage_reducible(dm, Z, n, method):
+    """
+    Computes the linkage Z of the condensed distance matrix dm by one of
+    the reducible methods: single linkage from a minimum spanning tree,
+    and the others by the nearest-neighbor chain algorithm, both in
+    O(n^2) time instead of the O(n^3) of the generic algorithm used for
+    centroid and median linkage.
+    """
+    if method == 'single':
+        _hierarchy_wrap.mst_single_linkage_wrap(dm, Z, n)
+    elif method == 'ward':
+        _hierarchy_wrap.nn_chain_linkage_wrap(dm, Z, n,
+                                              int(_cpy_euclid_methods[method]))
+    else:
+        _hierarchy_wrap.nn_chain_linkage_wrap(dm, Z, n,
+                                              int(_cpy_non_euclid_methods[method]))
+
+def _label_merges(merges, n):
+    """
+    Converts the n - 1 merges (a, b, d) of a clustering, each given by
+    an observation from either of the two clusters joined and the
+    distance between them, into a linkage matrix. The merges are
+    ordered by distance and the clusters numbered as ``linkage`` does.
+    """
+    Z = np.zeros((n - 1, 4))
+    if n < 2:
+        return Z
+    merges = np.asarray(merges, dtype=np.double).reshape((n - 1, 3))
+    order = np.argsort(merges[:, 2], kind='mergesort')
+    # union-find over the observations; the root of each set holds the
+    # id and the size of the cluster formed so far
+    parent = range(n)
+    cluster = range(n)
+    size = [1] * n
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    for k in xrange(n - 1):
+        a, b, d = merges[order[k]]
+        ra = find(int(a))
+        rb = find(int(b))
+        Z[k, 0] = min(cluster[ra], cluster[rb])
+        Z[k, 1] = max(cluster[ra], cluster[rb])
+        Z[k, 2] = d
+        Z[k, 3] = size[ra] + size[rb]
+        parent[rb] = ra
+        cluster[ra] = n + k
+        size[ra] += size[rb]
+    return Z
+
+def _mst_single_linkage(X, metric):
+    """
+    Single linkage of the observations X by Prim's algorithm, computing
+    one row of distances at a time: O(n^2) distance evaluations and
+    O(n) memory. The merges of single linkage are the edges of a
+    minimum spanning tree.
+    """
+    n = X.shape[0]
+    V = VI = None
+    if metric in ('seuclidean', 'se', 's'):
+        V = np.var(X, axis=0, ddof=1)
+    elif metric in ('mahalanobis', 'mahal', 'mah'):
+        VI = np.linalg.inv(np.cov(X.T)).T.copy()
+    merges = np.zeros((max(n - 1, 0), 3))
+    # the observations not yet in the tree, their distances to it and
+    # the tree observations at those distances
+    rest = np.arange(1, n)
+    D = np.empty(n - 1)
+    D.fill(np.inf)
+    nearest = np.zeros(n - 1, dtype=np.int)
+    x = 0
+    for k in xrange(n - 1):
+        d = distance.cdist(X[x:x+1], X[rest], metric, V=V, VI=VI)[0]
+        closer = d < D
+        D[closer] = d[closer]
+        nearest[closer] = x
+        i = D.argmin()
+        x = rest[i]
+        merges[k] = (nearest[i], x, D[i])
+        rest = np.delete(rest, i)
+        D = np.delete(D, i)
+        nearest = np.delete(nearest, i)
+    return _label_merges(merges, n)
+
+def _nn_chain_ward(X):
+    """
+    Ward linkage of the observations X by the nearest-neighbor chain
+    algorithm, computing the distances between clusters from their
+    centroids and sizes: O(n^2) distance evaluations and O(n) memory.
+    """
+    n = X.shape[0]
+    centroids = X.copy()
+    size = np.ones(n)
+    active = np.ones(n, dtype=np.bool)
+    merges = []
+    chain = []
+    for k in xrange(n - 1):
+        if not chain:
+            chain.append(int(np.flatnonzero(active)[0]))
+        while True:
+            a = chain[-1]
+            # squared Ward distances from cluster a to the others
+            diff = centroids - centroids[a]
+            d = (diff * diff).sum(axis=1) * (2.0 * size * size[a] / (size + size[a]))
+            d[~active] = np.inf
+            d[a] = np.inf
+            b = int(d.argmin())
+            # prefer the previous cluster of the chain on a tie so the
+            # chain always ends in a pair of reciprocal nearest neighbors
+            if len(chain) > 1 and d[chain[-2]] <= d[b]:
+                b = chain[-2]
+                break
+            chain.append(b)
+        chain.pop()
+        chain.pop()
+        merges.append((a, b, np.sqrt(d[b])))
+        # the merged cluster takes the place of b
+        centroids[b] = (centroids[a] * size[a] + centroids[b] * size[b]) / (size[a] + size[b])
+        size[b] += size[a]
+        active[a] = False
+    return _label_merges(merges, n)
+
+class ClusterNode(object):
     """
     A tree node class for representing a cluster. Leaf nodes correspond
     to original observations, while non-leaf nodes correspond to
@@ -637,6 +787,8 @@ class ClusterNode:
        - to_tree: for converting a linkage matrix ``Z`` into a tree object.
     """
 
+    __slots__ = ('id', 'left', 'right', 'dist', 'count')
+
     def __init__(self, id, left=None, right=None, dist=0, count=1):
         if id < 0:
             raise ValueError('The id must be non-negative.')
@@ -656,6 +808,13 @@ class ClusterNode:
         else:
             self.count = left.count + right.count
 
+    def __getstate__(self):
+        # classes with __slots__ need these to pickle with protocols 0 and 1
+        return (self.id, self.left, self.right, self.dist, self.count)
+
+    def __setstate__(self, state):
+        (self.id, self.left, self.right, self.dist, self.count) = state
+
     def get_id(self):
         r"""
         The identifier of the target node. For :math:`0 \leq i < n`,
@@ -745,35 +904,18 @@ class ClusterNode:
              The pre-order traversal.
         """
 
-        # Do a preorder traversal, caching the result. To avoid having to do
-        # recursion, we'll store the previous index we've visited in a vector.
-        n = self.count
-
-        curNode = [None] * (2 * n)
-        lvisited = np.zeros((2 * n,), dtype=bool)
-        rvisited = np.zeros((2 * n,), dtype=bool)
-        curNode[0] = self
-        k = 0
+        # Do a preorder traversal with an explicit stack of the nodes
+        # still to visit, pushing the right child first so that the left
+        # one is visited first.
+        stack = [self]
         preorder = []
-        while k >= 0:
-            nd = curNode[k]
-            ndid = nd.id
-            if nd.is_leaf():
+        while stack:
+            nd = stack.pop()
+            if nd.left is None:
                 preorder.append(func(nd))
-                k = k - 1
             else:
-                if not lvisited[ndid]:
-                    curNode[k + 1] = nd.left
-                    lvisited[ndid] = True
-                    k = k + 1
-                elif not rvisited[ndid]:
-                    curNode[k + 1] = nd.right
-                    rvisited[ndid] = True
-                    k = k + 1
-                # If we've visited the left and right of this non-leaf
-                # node already, go up in the tree.
-                else:
-                    k = k - 1
+                stack.append(nd.right)
+                stack.append(nd.left)
 
         return preorder
 
@@ -834,16 +976,18 @@ def to_tree(Z, rd=False):
 
     nd = None
 
-    for i in xrange(0, n - 1):
-        fi = int(Z[i, 0])
-        fj = int(Z[i, 1])
+    # The rows are read as Python floats, which is much faster than
+    # indexing Z one element at a time.
+    for i, (zi, zj, dist, count) in enumerate(Z.tolist()):
+        fi = int(zi)
+        fj = int(zj)
         if fi > i + n:
             raise ValueError('Corrupt matrix Z. Index to derivative cluster is used before it is formed. See row %d, column 0' % fi)
         if fj > i + n:
             raise ValueError('Corrupt matrix Z. Index to derivative cluster is used before it is formed. See row %d, column 1' % fj)
-        nd = ClusterNode(i + n, d[fi], d[fj],  Z[i, 2])
+        nd = ClusterNode(i + n, d[fi], d[fj], dist)
         #          ^ id   ^ left ^ right ^ dist
-        if Z[i,3] != nd.count:
+        if count != nd.count:
             raise ValueError('Corrupt matrix Z. The count Z[%d,3] is incorrect.' % i)
         d[n + i] = nd
 
@@ -2109,69 +2253,24 @@ def _append_nonsingleton_leaf_node(Z, p, n, level, lvs, ivl, leaf_label_func, i,
                 ivl.append("")
 
 def _append_contraction_marks(Z, iv, i, n, contraction_marks):
-    _append_contraction_marks_sub(Z, iv, Z[i-n, 0], n, contraction_marks)
-    _append_contraction_marks_sub(Z, iv, Z[i-n, 1], n, contraction_marks)
-
-def _append_contraction_marks_sub(Z, iv, i, n, contraction_marks):
-    if (i >= n):
-        contraction_marks.append((iv, Z[i-n, 2]))
-        _append_contraction_marks_sub(Z, iv, Z[i-n, 0], n, contraction_marks)
-        _append_contraction_marks_sub(Z, iv, Z[i-n, 1], n, contraction_marks)
-
-
-def _dendrogram_calculate_info(Z, p, truncate_mode, \
-                               color_threshold=np.inf, get_leaves=True, \
-                               orientation='top', labels=None, \
-                               count_sort=False, distance_sort=False, \
-                               show_leaf_counts=False, i=-1, iv=0.0, \
-                               ivl=[], n=0, icoord_list=[], dcoord_list=[], \
-                               lvs=None, mhr=False, \
-                               current_color=[], color_list=[], \
-                               currently_below_threshold=[], \
-                               leaf_label_func=None, level=0,
-                               contraction_marks=None,
-                               link_color_func=None):
+    # The heights of all the links below the truncated cluster i, in
+    # pre-order, without recursion.
+    stack = [int(Z[i-n, 1]), int(Z[i-n, 0])]
+    while stack:
+        i = stack.pop()
+        if i >= n:
+            contraction_marks.append((iv, Z[i-n, 2]))
+            stack.append(int(Z[i-n, 1]))
+            stack.append(int(Z[i-n, 0]))
+
+def _dendrogram_leaf(Z, p, truncate_mode, n, i, iv, level, lvs, ivl,
+                     leaf_label_func, labels, show_leaf_counts,
+                     contraction_marks):
     """
-    Calculates the endpoints of the links as well as the labels for the
-    the dendrogram rooted at the node with index i. iv is the independent
-    variable value to plot the left-most leaf node below the root node i
-    (if orientation='top', this would be the left-most x value where the
-    plotting of this root node i and its descendents should begin).
-
-    ivl is a list to store the labels of the leaf nodes. The leaf_label_func
-    is called whenever ivl != None, labels == None, and
-    leaf_label_func != None. When ivl != None and labels != None, the
-    labels list is used only for labeling the the leaf nodes. When
-    ivl == None, no labels are generated for leaf nodes.
-
-    When get_leaves==True, a list of leaves is built as they are visited
-    in the dendrogram.
-
-    Returns a tuple with l being the independent variable coordinate that
-    corresponds to the midpoint of cluster to the left of cluster i if
-    i is non-singleton, otherwise the independent coordinate of the leaf
-    node if i is a leaf node.
-
-    Returns a tuple (left, w, h, md)
-
-      * left is the independent variable coordinate of the center of the
-        the U of the subtree
-
-      * w is the amount of space used for the subtree (in independent
-        variable units)
-
-      * h is the height of the subtree in dependent variable units
-
-      * md is the max(Z[*,2]) for all nodes * below and including
-        the target node.
-
+    If cluster i is drawn as a leaf of the dendrogram, records its
+    label and returns the tuple that _dendrogram_calculate_info returns
+    for it. Otherwise, returns None.
     """
-    if n == 0:
-        raise ValueError("Invalid singleton cluster count n.")
-
-    if i == -1:
-        raise ValueError("Invalid root cluster index i.")
-
     if truncate_mode == 'lastp':
         # If the node is a leaf node but corresponds to a non-single cluster,
         # it's label is either the empty string or the number of original
@@ -2183,9 +2282,6 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
             if contraction_marks is not None:
                 _append_contraction_marks(Z, iv + 5.0, i, n, contraction_marks)
             return (iv + 5.0, 10.0, 0.0, d)
-        elif i < n:
-            _append_singleton_leaf_node(Z, p, n, level, lvs, ivl, leaf_label_func, i, labels)
-            return (iv + 5.0, 10.0, 0.0, 0.0)
     elif truncate_mode in ('mtica', 'level'):
         if i > n and level > p:
             d = Z[i-n, 2]
@@ -2194,12 +2290,6 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
             if contraction_marks is not None:
                 _append_contraction_marks(Z, iv + 5.0, i, n, contraction_marks)
             return (iv + 5.0, 10.0, 0.0, d)
-        elif i < n:
-            _append_singleton_leaf_node(Z, p, n, level, lvs, ivl, leaf_label_func, i, labels)
-            return (iv + 5.0, 10.0, 0.0, 0.0)
-    elif truncate_mode in ('mlab',):
-        pass
-
 
     # Otherwise, only truncate if we have a leaf node.
     #
@@ -2210,12 +2300,16 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
     if i < n:
         _append_singleton_leaf_node(Z, p, n, level, lvs, ivl, leaf_label_func, i, labels)
         return (iv + 5.0, 10.0, 0.0, 0.0)
+    return None
 
-    # !!! Otherwise, we don't have a leaf node, so work on plotting a
-    # non-leaf node.
+def _dendrogram_children(Z, n, i, count_sort, distance_sort):
+    """
+    Returns the children (ua, ub) of the non-singleton cluster i in the
+    order they are drawn, left to right.
+    """
     # Actual indices of a and b
-    aa = Z[i-n, 0]
-    ab = Z[i-n, 1]
+    aa = int(Z[i-n, 0])
+    ab = int(Z[i-n, 1])
     if aa > n:
         # The number of singletons below cluster a
         na = Z[aa-n, 3]
@@ -2237,128 +2331,149 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
         if na > nb:
             # The cluster index to draw to the left (ua) will be ab
             # and the one to draw to the right (ub) will be aa
-            ua = ab
-            ub = aa
+            return (ab, aa)
         else:
-            ua = aa
-            ub = ab
+            return (aa, ab)
     elif count_sort == 'descending':
         # If a has a count less than or equal to b, it and its
         # descendents should be drawn to the left. Otherwise, to
         # the right.
         if na > nb:
-            ua = aa
-            ub = ab
+            return (aa, ab)
         else:
-            ua = ab
-            ub = aa
+            return (ab, aa)
     elif distance_sort == 'ascending' or distance_sort == True:
         # If a has a distance greater than b, it and its descendents should
         # be drawn to the right. Otherwise, to the left.
         if da > db:
-            ua = ab
-            ub = aa
+            return (ab, aa)
         else:
-            ua = aa
-            ub = ab
+            return (aa, ab)
     elif distance_sort == 'descending':
         # If a has a distance less than or equal to b, it and its
         # descendents should be drawn to the left. Otherwise, to
         # the right.
         if da > db:
-            ua = aa
-            ub = ab
+            return (aa, ab)
         else:
-            ua = ab
-            ub = aa
-    else:
-        ua = aa
-        ub = ab
-
-    # The distance of the cluster to draw to the left (ua) is uad
-    # and its count is uan. Likewise, the cluster to draw to the
-    # right has distance ubd and count ubn.
-    if ua < n:
-        uad = 0.0
-        uan = 1
+            return (ab, aa)
     else:
-        uad = Z[ua-n, 2]
-        uan = Z[ua-n, 3]
-    if ub < n:
-        ubd = 0.0
-        ubn = 1
-    else:
-        ubd = Z[ub-n, 2]
-        ubn = Z[ub-n, 3]
-
-    # Updated iv variable and the amount of space used.
-    (uiva, uwa, uah, uamd) = \
-          _dendrogram_calculate_info(Z=Z, p=p, \
-                                     truncate_mode=truncate_mode, \
-                                     color_threshold=color_threshold, \
-                                     get_leaves=get_leaves, \
-                                     orientation=orientation, \
-                                     labels=labels, \
-                                     count_sort=count_sort, \
-                                     distance_sort=distance_sort, \
-                                     show_leaf_counts=show_leaf_counts, \
-                                     i=ua, iv=iv, ivl=ivl, n=n, \
-                                     icoord_list=icoord_list, \
-                                     dcoord_list=dcoord_list, lvs=lvs, \
-                                     current_color=current_color, \
-                                     color_list=color_list, \
-                                     currently_below_threshold=currently_below_threshold, \
-                                     leaf_label_func=leaf_label_func, \
-                                     level=level+1, contraction_marks=contraction_marks, \
-                                     link_color_func=link_color_func)
-
-    h = Z[i-n, 2]
-    if h >= color_threshold or color_threshold <= 0:
-        c = 'b'
-
-        if currently_below_threshold[0]:
-            current_color[0] = (current_color[0] + 1) % len(_link_line_colors)
-        currently_below_threshold[0] = False
-    else:
-        currently_below_threshold[0] = True
-        c = _link_line_colors[current_color[0]]
-
-    (uivb, uwb, ubh, ubmd) = \
-          _dendrogram_calculate_info(Z=Z, p=p, \
-                                     truncate_mode=truncate_mode, \
-                                     color_threshold=color_threshold, \
-                                     get_leaves=get_leaves, \
-                                     orientation=orientation, \
-                                     labels=labels, \
-                                     count_sort=count_sort, \
-                                     distance_sort=distance_sort, \
-                                     show_leaf_counts=show_leaf_counts, \
-                                     i=ub, iv=iv+uwa, ivl=ivl, n=n, \
-                                     icoord_list=icoord_list, \
-                                     dcoord_list=dcoord_list, lvs=lvs, \
-                                     current_color=current_color, \
-                                     color_list=color_list, \
-                                     currently_below_threshold=currently_below_threshold,
-                                     leaf_label_func=leaf_label_func, \
-                                     level=level+1, contraction_marks=contraction_marks, \
-                                     link_color_func=link_color_func)
-
-    # The height of clusters a and b
-    ah = uad
-    bh = ubd
-
-    max_dist = max(uamd, ubmd, h)
-
-    icoord_list.append([uiva, uiva, uivb, uivb])
-    dcoord_list.append([uah, h, h, ubh])
-    if link_color_func is not None:
-        v = link_color_func(int(i))
-        if type(v) != types.StringType:
-            raise TypeError("link_color_func must return a matplotlib color string!")
-        color_list.append(v)
-    else:
-        color_list.append(c)
-    return ( ((uiva + uivb) / 2), uwa+uwb, h, max_dist)
+        return (aa, ab)
+
+def _dendrogram_calculate_info(Z, p, truncate_mode, \
+                               color_threshold=np.inf, get_leaves=True, \
+                               orientation='top', labels=None, \
+                               count_sort=False, distance_sort=False, \
+                               show_leaf_counts=False, i=-1, iv=0.0, \
+                               ivl=[], n=0, icoord_list=[], dcoord_list=[], \
+                               lvs=None, mhr=False, \
+                               current_color=[], color_list=[], \
+                               currently_below_threshold=[], \
+                               leaf_label_func=None, level=0,
+                               contraction_marks=None,
+                               link_color_func=None):
+    """
+    Calculates the endpoints of the links as well as the labels for the
+    the dendrogram rooted at the node with index i. iv is the independent
+    variable value to plot the left-most leaf node below the root node i
+    (if orientation='top', this would be the left-most x value where the
+    plotting of this root node i and its descendents should begin).
+
+    ivl is a list to store the labels of the leaf nodes. The leaf_label_func
+    is called whenever ivl != None, labels == None, and
+    leaf_label_func != None. When ivl != None and labels != None, the
+    labels list is used only for labeling the the leaf nodes. When
+    ivl == None, no labels are generated for leaf nodes.
+
+    When get_leaves==True, a list of leaves is built as they are visited
+    in the dendrogram.
+
+    The tree is walked with an explicit stack rather than by recursion,
+    so that the depth of the hierarchy is not limited by Python's
+    recursion limit.
+
+    Returns a tuple with l being the independent variable coordinate that
+    corresponds to the midpoint of cluster to the left of cluster i if
+    i is non-singleton, otherwise the independent coordinate of the leaf
+    node if i is a leaf node.
+
+    Returns a tuple (left, w, h, md)
+
+      * left is the independent variable coordinate of the center of the
+        the U of the subtree
+
+      * w is the amount of space used for the subtree (in independent
+        variable units)
+
+      * h is the height of the subtree in dependent variable units
+
+      * md is the max(Z[*,2]) for all nodes * below and including
+        the target node.
+
+    """
+    if n == 0:
+        raise ValueError("Invalid singleton cluster count n.")
+
+    if i == -1:
+        raise ValueError("Invalid root cluster index i.")
+
+    # Each frame of the stack is [i, iv, level, ua, ub, left], where
+    # left is None until the subtree of the left child ua has been
+    # drawn, and then holds the tuple returned for it and the color of
+    # the link of cluster i.
+    stack = [[int(i), iv, level, None, None, None]]
+    result = None
+    while stack:
+        frame = stack[-1]
+        i, iv, level, ua, ub, left = frame
+        if ua is None:
+            # The frame is new: either draw a leaf, or descend into the
+            # left child.
+            result = _dendrogram_leaf(Z, p, truncate_mode, n, i, iv, level,
+                                      lvs, ivl, leaf_label_func, labels,
+                                      show_leaf_counts, contraction_marks)
+            if result is not None:
+                stack.pop()
+                continue
+            ua, ub = _dendrogram_children(Z, n, i, count_sort, distance_sort)
+            frame[3] = ua
+            frame[4] = ub
+            stack.append([ua, iv, level + 1, None, None, None])
+        elif left is None:
+            # The left subtree is drawn: pick the color of the link and
+            # descend into the right child.
+            (uiva, uwa, uah, uamd) = result
+            h = Z[i-n, 2]
+            if h >= color_threshold or color_threshold <= 0:
+                c = 'b'
+
+                if currently_below_threshold[0]:
+                    current_color[0] = (current_color[0] + 1) % len(_link_line_colors)
+                currently_below_threshold[0] = False
+            else:
+                currently_below_threshold[0] = True
+                c = _link_line_colors[current_color[0]]
+            frame[5] = (result, c)
+            stack.append([ub, iv + uwa, level + 1, None, None, None])
+        else:
+            # Both subtrees are drawn: draw the link of cluster i.
+            ((uiva, uwa, uah, uamd), c) = left
+            (uivb, uwb, ubh, ubmd) = result
+            h = Z[i-n, 2]
+            max_dist = max(uamd, ubmd, h)
+
+            icoord_list.append([uiva, uiva, uivb, uivb])
+            dcoord_list.append([uah, h, h, ubh])
+            if link_color_func is not None:
+                v = link_color_func(int(i))
+                if type(v) != types.StringType:
+                    raise TypeError("link_color_func must return a matplotlib color string!")
+                color_list.append(v)
+            else:
+                color_list.append(c)
+            result = ( ((uiva + uivb) / 2), uwa+uwb, h, max_dist)
+            stack.pop()
+    return result
 
 def is_isomorphic(T1, T2):
     r"""
@@ -873,6 +873,263 @@ void linkage_alt(double *dm, double *Z, double *X,
   free(centroids);
 }
 
+/** The index of the distance between observations i < j in a condensed
+    distance matrix over n observations. */
+#define CPY_CONDENSED_IDX(_n, _i, _j) \
+  ((npy_intp)(_n) * (_i) - ((npy_intp)(_i) * ((_i) + 1)) / 2 + (_j) - (_i) - 1)
+
+typedef struct cmerge {
+  int a;
+  int b;
+  int k;
+  double d;
+} cmerge;
+
+static int cmp_merges(const void *x, const void *y) {
+  const cmerge *mx = (const cmerge*)x, *my = (const cmerge*)y;
+  if (mx->d < my->d) {
+    return -1;
+  }
+  if (mx->d > my->d) {
+    return 1;
+  }
+  /** Keep merges at equal distances in the order they were found. */
+  return mx->k - my->k;
+}
+
+static int find_root(int *parent, int x) {
+  while (parent[x] != x) {
+    parent[x] = parent[parent[x]];
+    x = parent[x];
+  }
+  return x;
+}
+
+/**
+ * Forms the linkage matrix Z from the n-1 merges of a hierarchy, each
+ * given by an observation from either of the two clusters merged. The
+ * merges are sorted by distance and the clusters are numbered in the
+ * order they are formed, as linkage does.
+ */
+static void label_merges(cmerge *merges, double *Z, int n) {
+  int *parent, *cluster, *size;
+  int i, k, ra, rb, ida, idb;
+  double *Zrow;
+
+  qsort(merges, n - 1, sizeof(cmerge), cmp_merges);
+  parent = (int*)malloc(sizeof(int) * n);
+  cluster = (int*)malloc(sizeof(int) * n);
+  size = (int*)malloc(sizeof(int) * n);
+  for (i = 0; i < n; i++) {
+    parent[i] = i;
+    cluster[i] = i;
+    size[i] = 1;
+  }
+  for (k = 0; k < n - 1; k++) {
+    ra = find_root(parent, merges[k].a);
+    rb = find_root(parent, merges[k].b);
+    ida = cluster[ra];
+    idb = cluster[rb];
+    Zrow = Z + (k * CPY_LIS);
+    Zrow[CPY_LIN_LEFT] = CPY_MIN(ida, idb);
+    Zrow[CPY_LIN_RIGHT] = CPY_MAX(ida, idb);
+    Zrow[CPY_LIN_DIST] = merges[k].d;
+    Zrow[CPY_LIN_CNT] = size[ra] + size[rb];
+    parent[rb] = ra;
+    cluster[ra] = n + k;
+    size[ra] += size[rb];
+  }
+  free(parent);
+  free(cluster);
+  free(size);
+}
+
+/**
+ * Performs single, complete, average, weighted or ward linkage on the
+ * condensed distance matrix dm by the nearest-neighbor chain algorithm
+ * in O(n^2) time. Each of these methods is reducible: merging two
+ * clusters never brings the new cluster closer to a third one than
+ * either of them was. Therefore any pair of reciprocal nearest
+ * neighbors can be merged as soon as it is found, and the chain of
+ * nearest neighbors leading to it stays valid afterwards.
+ *
+ * The distances are updated as by the dist_* functions of linkage.
+ *
+ * dm:     The condensed distance matrix, which is not modified.
+ * Z:      The result of the linkage, a (n-1) x 4 matrix.
+ * n:      The number of observations.
+ * method: One of the CPY_LINKAGE_* methods above except centroid and
+ *         median.
+ */
+void nn_chain_linkage(const double *dm, double *Z, int n, int method) {
+  double *D, dmin, dax, dbx, rn, sn, xn, rf, sf, xf, dabSq, mply;
+  int *size, *chain;
+  int i, k, a, b, x, len;
+  npy_intp ax, bx;
+  cmerge *merges;
+
+  if (n < 2) {
+    return;
+  }
+  D = (double*)malloc(sizeof(double) * NCHOOSE2((npy_intp)n));
+  memcpy(D, dm, sizeof(double) * NCHOOSE2((npy_intp)n));
+  size = (int*)malloc(sizeof(int) * n);
+  chain = (int*)malloc(sizeof(int) * n);
+  merges = (cmerge*)malloc(sizeof(cmerge) * (n - 1));
+  for (i = 0; i < n; i++) {
+    size[i] = 1;
+  }
+
+  len = 0;
+  for (k = 0; k < n - 1; k++) {
+    if (len == 0) {
+      for (i = 0; size[i] == 0; i++);
+      chain[len++] = i;
+    }
+    while (1) {
+      a = chain[len - 1];
+      /** Prefer the previous cluster of the chain on a tie, so that the
+          chain always ends with a pair of reciprocal nearest
+          neighbors. */
+      if (len > 1) {
+	b = chain[len - 2];
+	dmin = D[a < b ? CPY_CONDENSED_IDX(n, a, b) : CPY_CONDENSED_IDX(n, b, a)];
+      }
+      else {
+	b = -1;
+	dmin = 0.0;
+      }
+      for (x = 0; x < n; x++) {
+	if (size[x] == 0 || x == a) {
+	  continue;
+	}
+	ax = a < x ? CPY_CONDENSED_IDX(n, a, x) : CPY_CONDENSED_IDX(n, x, a);
+	if (b < 0 || D[ax] < dmin) {
+	  dmin = D[ax];
+	  b = x;
+	}
+      }
+      if (len > 1 && b == chain[len - 2]) {
+	break;
+      }
+      chain[len++] = b;
+    }
+    len -= 2;
+    merges[k].a = a;
+    merges[k].b = b;
+    merges[k].k = k;
+    merges[k].d = dmin;
+
+    /** The new cluster takes the place of b. */
+    rn = (double)size[a];
+    sn = (double)size[b];
+    dabSq = dmin * dmin;
+    for (x = 0; x < n; x++) {
+      if (size[x] == 0 || x == a || x == b) {
+	continue;
+      }
+      ax = a < x ? CPY_CONDENSED_IDX(n, a, x) : CPY_CONDENSED_IDX(n, x, a);
+      bx = b < x ? CPY_CONDENSED_IDX(n, b, x) : CPY_CONDENSED_IDX(n, x, b);
+      dax = D[ax];
+      dbx = D[bx];
+      xn = (double)size[x];
+      switch (method) {
+      case CPY_LINKAGE_SINGLE:
+	D[bx] = CPY_MIN(dax, dbx);
+	break;
+      case CPY_LINKAGE_COMPLETE:
+	D[bx] = CPY_MAX(dax, dbx);
+	break;
+      case CPY_LINKAGE_AVERAGE:
+	mply = (double)1.0 / (xn * (rn + sn));
+	D[bx] = mply * ((dax * (rn * xn)) + (dbx * (sn * xn)));
+	break;
+      case CPY_LINKAGE_WEIGHTED:
+	D[bx] = (dax + dbx) / 2;
+	break;
+      case CPY_LINKAGE_WARD:
+      default:
+	rf = (rn + xn) / (rn + sn + xn);
+	sf = (sn + xn) / (rn + sn + xn);
+	xf = -xn / (rn + sn + xn);
+	D[bx] = sqrt(rf * (dax * dax) +
+		     sf * (dbx * dbx) +
+		     xf * dabSq);
+	break;
+      }
+    }
+    size[b] += size[a];
+    size[a] = 0;
+  }
+
+  label_merges(merges, Z, n);
+  free(D);
+  free(size);
+  free(chain);
+  free(merges);
+}
+
+/**
+ * Performs single linkage on the condensed distance matrix dm in
+ * O(n^2) time and O(n) additional memory. The merges of single linkage
+ * are the edges of a minimum spanning tree of the observations, which
+ * is found by Prim's algorithm.
+ *
+ * dm:     The condensed distance matrix.
+ * Z:      The result of the linkage, a (n-1) x 4 matrix.
+ * n:      The number of observations.
+ */
+void mst_single_linkage(const double *dm, double *Z, int n) {
+  double *dmin, d;
+  int *nearest;
+  char *merged;
+  int i, k, x, y;
+  cmerge *merges;
+
+  if (n < 2) {
+    return;
+  }
+  dmin = (double*)malloc(sizeof(double) * n);
+  nearest = (int*)malloc(sizeof(int) * n);
+  merged = (char*)malloc(sizeof(char) * n);
+  merges = (cmerge*)malloc(sizeof(cmerge) * (n - 1));
+  for (i = 0; i < n; i++) {
+    dmin[i] = HUGE_VAL;
+    nearest[i] = 0;
+    merged[i] = 0;
+  }
+
+  x = 0;
+  for (k = 0; k < n - 1; k++) {
+    merged[x] = 1;
+    y = -1;
+    for (i = 0; i < n; i++) {
+      if (merged[i]) {
+	continue;
+      }
+      d = dm[x < i ? CPY_CONDENSED_IDX(n, x, i) : CPY_CONDENSED_IDX(n, i, x)];
+      if (d < dmin[i]) {
+	dmin[i] = d;
+	nearest[i] = x;
+      }
+      if (y < 0 || dmin[i] < dmin[y]) {
+	y = i;
+      }
+    }
+    merges[k].a = nearest[y];
+    merges[k].b = y;
+    merges[k].k = k;
+    merges[k].d = dmin[y];
+    x = y;
+  }
+
+  label_merges(merges, Z, n);
+  free(dmin);
+  free(nearest);
+  free(merged);
+  free(merges);
+}
+
 void cpy_to_tree(const double *Z, cnode **tnodes, int n) {
   const double *row;
   cnode *node;
@@ -104,6 +104,8 @@ int leaders(const double *Z, const int *T, int *L, int *M, int kk, int n);
 
 void linkage(double *dm, double *Z, double *X, int m, int n, int ml, int kc, distfunc dfunc, int method);
 void linkage_alt(double *dm, double *Z, double *X, int m, int n, int ml, int kc, distfunc dfunc, int method);
+void nn_chain_linkage(const double *dm, double *Z, int n, int method);
+void mst_single_linkage(const double *dm, double *Z, int n);
 
 void cophenetic_distances(const double *Z, double *d, int n);
 void cpy_to_tree(const double *Z, cnode **tnodes, int n);
@@ -74,6 +74,37 @@ extern PyObject *linkage_wrap(PyObject *self, PyObject *args) {
   return Py_BuildValue("d", 0.0);
 }
 
+extern PyObject *nn_chain_linkage_wrap(PyObject *self, PyObject *args) {
+  int method, n;
+  PyArrayObject *dm, *Z;
+  if (!PyArg_ParseTuple(args, "O!O!ii",
+			&PyArray_Type, &dm,
+			&PyArray_Type, &Z,
+			&n,
+			&method)) {
+    return 0;
+  }
+  else {
+    nn_chain_linkage((const double*)dm->data, (double*)Z->data, n, method);
+  }
+  return Py_BuildValue("d", 0.0);
+}
+
+extern PyObject *mst_single_linkage_wrap(PyObject *self, PyObject *args) {
+  int n;
+  PyArrayObject *dm, *Z;
+  if (!PyArg_ParseTuple(args, "O!O!i",
+			&PyArray_Type, &dm,
+			&PyArray_Type, &Z,
+			&n)) {
+    return 0;
+  }
+  else {
+    mst_single_linkage((const double*)dm->data, (double*)Z->data, n);
+  }
+  return Py_BuildValue("d", 0.0);
+}
+
 extern PyObject *linkage_euclid_wrap(PyObject *self, PyObject *args) {
   int method, m, n, ml;
   PyArrayObject *dm, *Z, *X;
@@ -369,6 +400,8 @@ static PyMethodDef _hierarchyWrapMethods[] = {
   {"leaders_wrap", leaders_wrap, METH_VARARGS},
   {"linkage_euclid_wrap", linkage_euclid_wrap, METH_VARARGS},
   {"linkage_wrap", linkage_wrap, METH_VARARGS},
+  {"mst_single_linkage_wrap", mst_single_linkage_wrap, METH_VARARGS},
+  {"nn_chain_linkage_wrap", nn_chain_linkage_wrap, METH_VARARGS},
   {"prelist_wrap", prelist_wrap, METH_VARARGS},
   {NULL, NULL}     /* Sentinel - marks the end of this structure */
 };
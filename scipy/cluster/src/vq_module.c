@@ -102,8 +102,10 @@ PyObject* compute_vq(PyObject* self, PyObject* args)
             if (index_a == NULL) {
                 goto clean_dist_a;
             }
+            Py_BEGIN_ALLOW_THREADS
             float_tvq((float*)obs_a->data, (float*)code_a->data, n, nc, d,
                     (npy_intp*)index_a->data, (float*)dist_a->data);
+            Py_END_ALLOW_THREADS
             break;
         case NPY_DOUBLE:
             dist_a = (PyArrayObject*)PyArray_EMPTY(1, &n, typenum1, 0);
@@ -114,8 +116,10 @@ PyObject* compute_vq(PyObject* self, PyObject* args)
             if (index_a == NULL) {
                 goto clean_dist_a;
             }
+            Py_BEGIN_ALLOW_THREADS
             double_tvq((double*)obs_a->data, (double*)code_a->data, n, nc, d,
                     (npy_intp*)index_a->data, (double*)dist_a->data);
+            Py_END_ALLOW_THREADS
             break;
         default:
             PyErr_Format(PyExc_ValueError,
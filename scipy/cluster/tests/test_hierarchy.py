@@ -38,7 +38,7 @@ import os.path
 import numpy as np
 from numpy.testing import *
 
-from scipy.cluster.hierarchy import linkage, from_mlab_linkage, to_mlab_linkage, num_obs_linkage, inconsistent, cophenet, from_mlab_linkage, fclusterdata, fcluster, is_isomorphic, single, complete, average, weighted, centroid, median, ward, leaders, correspond, is_monotonic, maxdists, maxinconsts, maxRstat, is_valid_linkage, is_valid_im, to_tree, leaves_list
+from scipy.cluster.hierarchy import linkage, from_mlab_linkage, to_mlab_linkage, num_obs_linkage, inconsistent, cophenet, from_mlab_linkage, fclusterdata, fcluster, is_isomorphic, single, complete, average, weighted, centroid, median, ward, leaders, correspond, is_monotonic, maxdists, maxinconsts, maxRstat, is_valid_linkage, is_valid_im, to_tree, leaves_list, dendrogram
 from scipy.spatial.distance import squareform, pdist
 
 _tdist = np.array([[0,    662,  877,  255,  412,  996],
@@ -185,6 +185,71 @@ class TestLinkage(TestCase):
         #print abs(Z-expectedZ).max()
         self.failUnless(within_tol(Z, expectedZ, eps))
 
+    def test_linkage_reducible_random(self):
+        "Tests the O(n^2) linkage algorithms against the generic one on random data."
+        from scipy.cluster import _hierarchy_wrap
+        from scipy.cluster.hierarchy import _cpy_non_euclid_methods, _cpy_euclid_methods
+        np.random.seed(1234)
+        X = np.random.rand(80, 3)
+        y = pdist(X)
+        n = X.shape[0]
+        for method in ['single', 'complete', 'average', 'weighted', 'ward']:
+            expectedZ = np.zeros((n - 1, 4))
+            if method == 'ward':
+                Z = linkage(X, method)
+                _hierarchy_wrap.linkage_euclid_wrap(y.copy(), expectedZ, X, 3, n,
+                                                    _cpy_euclid_methods[method])
+            else:
+                Z = linkage(y, method)
+                _hierarchy_wrap.linkage_wrap(y.copy(), expectedZ, n,
+                                             _cpy_non_euclid_methods[method])
+            self.failUnless(within_tol(Z, expectedZ, 1e-10))
+
+    def test_linkage_two_observations(self):
+        "Tests linkage(Y) on a distance matrix of two observations."
+        for method in ['single', 'complete', 'average', 'weighted']:
+            assert_array_equal(linkage(np.array([3.0]), method), [[0, 1, 3.0, 2]])
+
+    ################### linkage with save_memory
+    def test_linkage_single_q_save_memory(self):
+        "Tests linkage(X, 'single', save_memory=True) on the Q data set."
+        X = eo['Q-X']
+        Z = linkage(X, 'single', save_memory=True)
+        expectedZ = from_mlab_linkage(eo['linkage-Q-single'])
+        self.failUnless(within_tol(Z, expectedZ, 1e-06))
+
+    def test_linkage_single_save_memory_metrics(self):
+        "Tests linkage(X, 'single', metric, save_memory=True) against linkage(X, 'single', metric)."
+        X = eo['iris']
+        for metric in ['cityblock', 'seuclidean', 'cosine', 'mahalanobis']:
+            Z = linkage(X, 'single', metric, save_memory=True)
+            expectedZ = linkage(X, 'single', metric)
+            # the iris data set has ties, so compare the clusterings
+            # through their heights and cophenetic distances
+            assert_array_almost_equal(Z[:,2], expectedZ[:,2])
+            assert_array_almost_equal(cophenet(Z), cophenet(expectedZ))
+
+    def test_linkage_ward_q_save_memory(self):
+        "Tests linkage(X, 'ward', save_memory=True) on the Q data set."
+        X = eo['Q-X']
+        Z = linkage(X, 'ward', save_memory=True)
+        expectedZ = from_mlab_linkage(eo['linkage-Q-ward'])
+        self.failUnless(within_tol(Z, expectedZ, 1e-06))
+
+    def test_linkage_ward_random_save_memory(self):
+        "Tests linkage(X, 'ward', save_memory=True) against linkage(X, 'ward') on random data."
+        np.random.seed(1234)
+        X = np.random.rand(60, 3)
+        Z = linkage(X, 'ward', save_memory=True)
+        self.failUnless(within_tol(Z, ward(X), 1e-10))
+        self.failUnless(is_valid_linkage(Z))
+
+    def test_linkage_save_memory_invalid(self):
+        "Tests linkage(X, method, save_memory=True) with unsupported methods and metrics."
+        X = eo['Q-X']
+        self.failUnlessRaises(ValueError, linkage, X, 'average', save_memory=True)
+        self.failUnlessRaises(ValueError, linkage, X, 'ward', 'cityblock', save_memory=True)
+
 class TestInconsistent(TestCase):
 
     def test_single_inconsistent_tdist_1(self):
@@ -789,6 +854,64 @@ class TestLeavesList(TestCase):
         node = to_tree(Z)
         self.failUnless((node.pre_order() == leaves_list(Z)).all())
 
+    def test_leaves_list_deep_tree(self):
+        "Tests leaves_list(Z) and pre_order on a tree deeper than the recursion limit."
+        Z = _chain_linkage(5000)
+        node = to_tree(Z)
+        self.failUnless((node.pre_order() == leaves_list(Z)).all())
+
+    def test_to_tree_pickle(self):
+        "Tests that the tree returned by to_tree(Z) can be pickled."
+        import pickle
+        Z = linkage(eo['iris'], 'single')
+        node = to_tree(Z)
+        for protocol in [0, pickle.HIGHEST_PROTOCOL]:
+            copy = pickle.loads(pickle.dumps(node, protocol))
+            self.failUnless(copy.get_id() == node.get_id())
+            self.failUnless(copy.get_count() == node.get_count())
+            self.failUnless((copy.pre_order() == leaves_list(Z)).all())
+
+class TestDendrogram(TestCase):
+
+    def test_dendrogram_leaves(self):
+        "Tests dendrogram(Z, no_plot=True) draws the leaves in the order of leaves_list(Z)."
+        Z = linkage(eo['Q-X'], 'single')
+        R = dendrogram(Z, no_plot=True)
+        n = Z.shape[0] + 1
+        assert_array_equal(R['leaves'], leaves_list(Z))
+        assert_equal(R['ivl'], [str(i) for i in leaves_list(Z)])
+        assert_equal(len(R['icoord']), n - 1)
+        assert_equal(len(R['color_list']), n - 1)
+        # the links are drawn at the heights of the clusters
+        assert_array_almost_equal(sorted([d[1] for d in R['dcoord']]), sorted(Z[:,2]))
+
+    def test_dendrogram_lastp(self):
+        "Tests dendrogram(Z, p, truncate_mode='lastp') shows p leaves."
+        Z = linkage(eo['Q-X'], 'average')
+        R = dendrogram(Z, 5, truncate_mode='lastp', no_plot=True)
+        assert_equal(len(R['leaves']), 5)
+        counts = [int(s.strip('()')) for s in R['ivl'] if s.startswith('(')]
+        assert_equal(sum(counts) + len(R['ivl']) - len(counts), Z.shape[0] + 1)
+
+    def test_dendrogram_deep_tree(self):
+        "Tests dendrogram(Z, no_plot=True) on a tree deeper than the recursion limit."
+        n = 5000
+        Z = _chain_linkage(n)
+        R = dendrogram(Z, no_plot=True, no_labels=True)
+        assert_array_equal(R['leaves'], leaves_list(Z))
+        assert_equal(len(R['icoord']), n - 1)
+        # the root link joins the midpoint of the rest of the tree to the
+        # last leaf, on the right
+        assert_equal(R['icoord'][-1][2], 10.0 * n - 5.0)
+
+def _chain_linkage(n):
+    "A linkage in which each cluster is formed by adding one observation."
+    Z = np.zeros((n - 1, 4))
+    Z[0] = [0, 1, 1.0, 2]
+    for i in xrange(1, n - 1):
+        Z[i] = [n + i - 1, i + 1, i + 1.0, i + 2]
+    return Z
+
 class TestCorrespond(TestCase):
 
     def test_correspond_empty(self):
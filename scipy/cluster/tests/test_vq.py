@@ -9,7 +9,8 @@ import warnings
 import numpy as np
 from numpy.testing import *
 
-from scipy.cluster.vq import kmeans, kmeans2, py_vq, py_vq2, vq, ClusterError
+from scipy.cluster.vq import kmeans, kmeans2, kmeans_minibatch, py_vq, \
+     py_vq2, vq, ClusterError
 try:
     from scipy.cluster import _vq
     TESTC=True
@@ -82,6 +83,23 @@ class TestVq(TestCase):
         else:
             print "== not testing C imp of vq (rank 1) =="
 
+    def test_vq_kdtree(self):
+        np.random.seed(5)
+        obs = np.random.randn(500, 3)
+        code_book = np.random.randn(300, 3)
+        code, dist = vq(obs, code_book)
+        code2, dist2 = vq(obs, code_book, 'kdtree')
+        assert_array_equal(code, code2)
+        assert_array_almost_equal(dist, dist2)
+        initc = np.concatenate(([[X[0]], [X[1]], [X[2]]]))
+        label, dist = vq(X, initc, method='kdtree')
+        assert_array_equal(label, LABEL1)
+        # rank 1
+        code2, dist2 = vq(obs[:, 0], code_book[:, 0], 'kdtree')
+        assert_array_equal(code2, np.argmin(np.abs(obs[:, :1] -
+                                                   code_book[:, 0]), 1))
+        self.failUnlessRaises(ValueError, vq, obs, code_book, 'foo')
+
 class TestKMean(TestCase):
     def test_large_features(self):
         # Generate a data set with large values, and run kmeans on it to
@@ -199,5 +217,162 @@ class TestKMean(TestCase):
         except ValueError:
             pass
 
+    def test_kmeans2_kpp(self):
+        """k-means++ and k-means|| seed one centroid in each blob."""
+        np.random.seed(3)
+        centers = np.array([[0., 0.], [10., 0.], [0., 10.], [10., 10.]])
+        data = np.concatenate([c + 0.1 * np.random.randn(50, 2)
+                               for c in centers])
+        for minit in ['++', '||']:
+            for i in range(10):
+                code, label = kmeans2(data, 4, iter=1, minit=minit)
+                self.failUnless(len(np.unique(label)) == 4)
+                for c in centers:
+                    d = np.sqrt(np.sum((code - c) ** 2, 1))
+                    self.failUnless(d.min() < 0.5)
+
+    def test_kmeans2_kpp_rank1(self):
+        data = np.fromfile(open(DATAFILE1), sep = ", ")
+        data = data.reshape((200, 2))[:, 0]
+        for minit in ['++', '||']:
+            code, label = kmeans2(data, 3, minit=minit)
+            self.failUnless(code.shape == (3,))
+
+    def test_kmeans_minit(self):
+        data = np.fromfile(open(DATAFILE1), sep = ", ")
+        data = data.reshape((200, 2))
+        for minit in ['++', '||', 'points']:
+            book, dist = kmeans(data, 3, iter=3, minit=minit)
+            self.failUnless(book.shape[1] == 2)
+        self.failUnlessRaises(ValueError, kmeans, data, 3, minit='foo')
+
+    def test_kmeans_n_jobs(self):
+        """The runs give the same result whatever the number of threads."""
+        data = np.fromfile(open(DATAFILE1), sep = ", ")
+        data = data.reshape((200, 2))
+        np.random.seed(7)
+        book1, dist1 = kmeans(data, 3, iter=8)
+        for n_jobs in [2, 5, -1]:
+            np.random.seed(7)
+            book2, dist2 = kmeans(data, 3, iter=8, n_jobs=n_jobs)
+            assert_array_equal(book1, book2)
+            self.failUnless(dist1 == dist2)
+        self.failUnlessRaises(ValueError, kmeans, data, 3, n_jobs=0)
+
+    def test_bounded_vq(self):
+        """The bounds only skip observations which keep their code."""
+        from scipy.cluster.vq import _BoundedVq
+        np.random.seed(11)
+        obs = np.random.randn(1000, 2)
+        code_book = np.random.randn(40, 2)
+        assign = _BoundedVq(obs)
+        for i in range(6):
+            label, dist = assign(code_book)
+            label2, dist2 = vq(obs, code_book)
+            assert_array_equal(label, label2)
+            assert_array_almost_equal(dist, dist2)
+            code_book = code_book + 0.05 * np.random.randn(40, 2)
+        label, dist = assign(code_book[:1])
+        assert_array_equal(label, np.zeros(1000))
+
+    def test_vq_method(self):
+        data = np.fromfile(open(DATAFILE1), sep = ", ")
+        data = data.reshape((200, 2))
+        initc = data[:5].copy()
+        book, dist = kmeans(data, initc)
+        code, label = kmeans2(data, initc, iter=10)
+        for vq_method in ['kdtree', 'bounds']:
+            book2, dist2 = kmeans(data, initc, vq_method=vq_method)
+            assert_array_almost_equal(book, book2)
+            assert_almost_equal(dist, dist2)
+            code2, label2 = kmeans2(data, initc, iter=10, vq_method=vq_method)
+            assert_array_almost_equal(code, code2)
+            assert_array_equal(label, label2)
+        code2, label2 = kmeans2(data[:, 0], initc[:, 0], vq_method='bounds')
+        code, label = kmeans2(data[:, 0], initc[:, 0])
+        assert_array_almost_equal(code, code2)
+        self.failUnlessRaises(ValueError, kmeans, data, 3, vq_method='foo')
+        self.failUnlessRaises(ValueError, kmeans2, data, 3, vq_method='foo')
+
+class TestKMeansMiniBatch(TestCase):
+    def _blobs(self):
+        np.random.seed(12)
+        centers = np.array([[0., 0.], [10., 0.], [0., 10.]])
+        data = centers[np.random.randint(0, 3, 3000)] + \
+               0.5 * np.random.randn(3000, 2)
+        return centers, data
+
+    def _check_centers(self, book, centers):
+        for c in centers:
+            d = np.sqrt(np.sum((book - c) ** 2, 1))
+            self.failUnless(d.min() < 0.2)
+
+    def test_single_batch_is_kmeans_step(self):
+        """One batch from fresh counts is a plain k-means update."""
+        initc = np.concatenate(([[X[0]], [X[1]], [X[2]]]))
+        book = kmeans_minibatch(X, initc, batch_size=len(X))[0]
+        assert_array_almost_equal(book, CODET1)
+        assert_array_almost_equal(initc, X[:3])
+
+    def test_running_mean(self):
+        """Splitting the data into batches gives the same running means
+        as long as no observation changes centroid."""
+        initc = np.array([[0., 0.], [10., 10.]])
+        data = np.array([[1., 1.], [9., 9.], [2., 2.], [8., 8.], [0., 3.]])
+        book = kmeans_minibatch(data, initc, batch_size=2)[0]
+        assert_array_almost_equal(book, [[1., 2.], [8.5, 8.5]])
+
+    def test_array(self):
+        centers, data = self._blobs()
+        book, dist = kmeans_minibatch(data, centers + 1., batch_size=100,
+                                      iter=2)
+        self._check_centers(book, centers)
+        self.failUnless(dist < 1.)
+
+    def test_memmap(self):
+        import tempfile
+        centers, data = self._blobs()
+        f = tempfile.NamedTemporaryFile()
+        try:
+            mm = np.memmap(f.name, dtype=np.float32, mode='w+',
+                           shape=data.shape)
+            mm[:] = data
+            mm.flush()
+            mm = np.memmap(f.name, dtype=np.float32, mode='r',
+                           shape=data.shape)
+            book, dist = kmeans_minibatch(mm, centers + 1., batch_size=256)
+            self._check_centers(book, centers)
+            del mm
+        finally:
+            f.close()
+
+    def test_generator(self):
+        centers, data = self._blobs()
+        def chunks():
+            for i in range(0, len(data), 700):
+                yield data[i:i+700]
+        book, dist = kmeans_minibatch(chunks(), 3, batch_size=100)
+        self.failUnless(book.shape == (3, 2))
+        book, dist = kmeans_minibatch(chunks(), centers + 1., batch_size=100)
+        self._check_centers(book, centers)
+        # a list of chunks can be passed over several times
+        chunk_list = list(chunks())
+        book, dist = kmeans_minibatch(chunk_list, centers + 1., iter=3)
+        self._check_centers(book, centers)
+        self.failUnlessRaises(ValueError, kmeans_minibatch, chunks(), 3,
+                              iter=2)
+
+    def test_invalid(self):
+        self.failUnlessRaises(ValueError, kmeans_minibatch, X, 0)
+        self.failUnlessRaises(ValueError, kmeans_minibatch, X, 2, iter=0)
+        self.failUnlessRaises(ValueError, kmeans_minibatch, X, 2,
+                              batch_size=0)
+        self.failUnlessRaises(ValueError, kmeans_minibatch, X[:, 0], 2)
+        self.failUnlessRaises(ValueError, kmeans_minibatch, [], 2)
+        self.failUnlessRaises(ValueError, kmeans_minibatch, X, 20,
+                              batch_size=5)
+        self.failUnlessRaises(ValueError, kmeans_minibatch, X,
+                              np.zeros((2, 3)))
+
 if __name__ == "__main__":
     run_module_suite()
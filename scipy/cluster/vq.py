@@ -57,7 +57,7 @@
     vq(obs,code_book) --
         Calculate code book membership of a set of observation
         vectors.
-    kmeans(obs,k_or_guess,iter=20,thresh=1e-5) --
+    kmeans(obs,k_or_guess,iter=20,thresh=1e-5,minit=None,n_jobs=1) --
         Clusters a set of observation vectors. Learns centroids with
         the k-means algorithm, trying to minimize distortion.  A code
         book is generated that can be used to quantize vectors.
@@ -65,11 +65,16 @@
         A different implementation of k-means with more methods for
         initializing centroids.  Uses maximum number of iterations as
         opposed to a distortion threshold as its stopping criterion.
+    kmeans_minibatch(obs,k_or_guess,batch_size=1000,iter=1) --
+        Mini-batch k-means. Updates the code book incrementally from
+        batches of observations, which may come from a memory-mapped
+        array or from an iterator of chunks too large to hold in
+        memory at once.
 
 """
 __docformat__ = 'restructuredtext'
 
-__all__ = ['whiten', 'vq', 'kmeans', 'kmeans2']
+__all__ = ['whiten', 'vq', 'kmeans', 'kmeans2', 'kmeans_minibatch']
 
 # TODO:
 #   - implements high level method for running several times k-means with
@@ -84,6 +89,9 @@ from numpy import shape, zeros, sqrt, argmin, minimum, array, \
      newaxis, arange, compress, equal, common_type, single, double, take, \
      std, mean
 import numpy as np
+from scipy.spatial import cKDTree
+from scipy.lib._threads import check_n_jobs as _check_n_jobs, \
+     map_threads as _map_threads
 
 class ClusterError(Exception):
     pass
@@ -132,7 +140,7 @@ def whiten(obs):
     std_dev = std(obs, axis=0)
     return obs / std_dev
 
-def vq(obs, code_book):
+def vq(obs, code_book, method='brute'):
     """ Vector Quantization: assign codes from a code book to observations.
 
     Assigns a code from a code book to each observation. Each
@@ -162,6 +170,14 @@ def vq(obs, code_book):
                              [  1.,   2.,   3.,   4.],  #c1
                              [  1.,   2.,   3.,   4.]]) #c2
 
+        method : string
+            'brute' compares each observation with every code.
+            'kdtree' builds a kd-tree over the code book and searches
+            it for the nearest code of each observation, which is much
+            faster for large code books with a moderate number of
+            features (up to a few dozen).  Distances are then computed
+            in double precision.
+
     :Returns:
         code : ndarray
             A length N array holding the code book index for each observation.
@@ -187,6 +203,10 @@ def vq(obs, code_book):
     (array([1, 1, 0],'i'), array([ 0.43588989,  0.73484692,  0.83066239]))
 
     """
+    if method == 'kdtree':
+        return _kdtree_vq(obs, code_book)
+    elif method != 'brute':
+        raise ValueError("Unknown vq method: %s" % str(method))
     try:
         import _vq
         ct = common_type(obs, code_book)
@@ -335,7 +355,114 @@ def py_vq2(obs, code_book):
                                   # much difference.
     return code, min_dist
 
-def _kmeans(obs, guess, thresh=1e-5):
+def _as_rank2(obs, code_book):
+    """Returns obs and code_book as rank 2 double arrays, treating rank 1
+    arrays as one-dimensional observations."""
+    obs = np.asarray(obs, dtype=double)
+    code_book = np.asarray(code_book, dtype=double)
+    if obs.ndim != code_book.ndim:
+        raise ValueError("Observation and code_book should have the same rank")
+    if obs.ndim == 1:
+        return obs[:, newaxis], code_book[:, newaxis]
+    if obs.ndim != 2:
+        raise ValueError("rank different than 1 or 2 are not supported")
+    if obs.shape[1] != code_book.shape[1]:
+        raise ValueError("Code book(%d) and obs(%d) should have the same "
+                         "number of features (eg columns)" %
+                         (code_book.shape[1], obs.shape[1]))
+    return obs, code_book
+
+def _kdtree_vq(obs, code_book):
+    """kd-tree version of vq: the code book is put in a kd-tree, which is
+    searched for the nearest code of each observation."""
+    obs, code_book = _as_rank2(obs, code_book)
+    dist, code = cKDTree(code_book).query(obs)
+    return np.asarray(code, dtype=np.intp), dist
+
+class _BoundedVq(object):
+    """vq for the successive code books of a k-means loop.
+
+    Calling an instance with a code book returns the same codes and
+    distances as vq(obs, code_book).  Between calls, a lower bound on
+    the distance of each observation to its second nearest code is
+    kept, following Hamerly (2010).  When the codes move a little, as
+    they do after the first few iterations, the triangle inequality
+    shows that most observations keep their code, and only the
+    remaining ones are searched for their two nearest codes again.
+    """
+
+    def __init__(self, obs):
+        self.obs = obs
+        self.code_book = None
+
+    def _search(self, obs, code_book):
+        """Returns the nearest code, the distance to it and the distance
+        to the second nearest one."""
+        if code_book.shape[0] == 1:
+            dist = np.sqrt(np.sum((obs - code_book[0]) ** 2, 1))
+            return np.zeros(len(obs), dtype=np.intp), dist, \
+                   np.inf * np.ones(len(obs))
+        dist, code = cKDTree(code_book).query(obs, k=2)
+        return code[:, 0], dist[:, 0], dist[:, 1]
+
+    def __call__(self, code_book):
+        obs, code_book = _as_rank2(self.obs, code_book)
+        if self.code_book is None or self.code_book.shape != code_book.shape:
+            label, dist, lower = self._search(obs, code_book)
+        else:
+            label = self.label
+            delta = np.sqrt(np.sum((code_book - self.code_book) ** 2, 1))
+            lower = self.lower - delta.max()
+            # No other code is nearer than half the distance between the
+            # code and the nearest other code.
+            if code_book.shape[0] > 1:
+                half = 0.5 * cKDTree(code_book).query(code_book, k=2)[0][:, 1]
+                bound = np.maximum(lower, half[label])
+            else:
+                bound = np.inf * np.ones(len(obs))
+            dist = np.sqrt(np.sum((obs - code_book[label]) ** 2, 1))
+            changed = np.nonzero(dist > bound)[0]
+            if changed.size > 0:
+                label = label.copy()
+                l, d, low = self._search(obs[changed], code_book)
+                label[changed] = l
+                dist[changed] = d
+                lower[changed] = low
+        self.code_book = code_book.copy()
+        self.label, self.dist, self.lower = label, dist, lower
+        return label, dist
+
+def _vq_function(obs, method):
+    """Returns a function of the code book which assigns codes to obs as
+    vq does, using the given method for the repeated assignments of a
+    k-means loop."""
+    if method == 'bounds':
+        return _BoundedVq(obs)
+    elif method in _valid_vq_meth:
+        return lambda code_book: vq(obs, code_book, method)
+    raise ValueError("Unknown vq method: %s" % str(method))
+
+_valid_vq_meth = ('brute', 'kdtree', 'bounds')
+
+def _centroids(obs, label, nc):
+    """Returns the mean of the observations with each label, and the
+    number of them, in a single pass over the observations. The mean is
+    undefined for labels without any observation."""
+    counts = np.zeros(nc, dtype=int)
+    c = np.bincount(label)
+    counts[:len(c)] = c
+    sums = np.zeros((nc,) + np.shape(obs)[1:])
+    if np.ndim(obs) == 1:
+        sums[:len(c)] = np.bincount(label, weights=obs)
+    else:
+        for j in range(obs.shape[1]):
+            sums[:len(c), j] = np.bincount(label, weights=obs[:, j])
+    nonzero = np.maximum(counts, 1)
+    if np.ndim(obs) > 1:
+        nonzero = nonzero[:, newaxis]
+    return sums / nonzero, counts
+
+def _kmeans(obs, guess, thresh=1e-5, vq_method='brute'):
     """ "raw" version of k-means.
 
     :Returns:
@@ -372,19 +499,17 @@ def _kmeans(obs, guess, thresh=1e-5):
     code_book = array(guess, copy = True)
     avg_dist = []
     diff = thresh+1.
+    assign = _vq_function(obs, vq_method)
     while diff > thresh:
         nc = code_book.shape[0]
         #compute membership and distances between obs and code_book
-        obs_code, distort = vq(obs, code_book)
+        obs_code, distort = assign(code_book)
         avg_dist.append(mean(distort, axis=-1))
         #recalc code_book as centroids of associated obs
         if(diff > thresh):
-            has_members = []
-            for i in arange(nc):
-                cell_members = compress(equal(obs_code, i), obs, 0)
-                if cell_members.shape[0] > 0:
-                    code_book[i] = mean(cell_members, 0)
-                    has_members.append(i)
+            centroids, counts = _centroids(obs, obs_code, nc)
+            has_members = np.nonzero(counts)[0]
+            code_book[has_members] = centroids[has_members]
             #remove code_books that didn't have any members
             code_book = take(code_book, has_members, 0)
         if len(avg_dist) > 1:
@@ -392,7 +517,8 @@ def _kmeans(obs, guess, thresh=1e-5):
     #print avg_dist
     return code_book, avg_dist[-1]
 
-def kmeans(obs, k_or_guess, iter=20, thresh=1e-5):
+def kmeans(obs, k_or_guess, iter=20, thresh=1e-5, minit=None, n_jobs=1,
+           vq_method='brute'):
     """Performs k-means on a set of observation vectors forming k
        clusters. This yields a code book mapping centroids to codes
        and vice versa. The k-means algorithm adjusts the centroids
@@ -428,6 +554,27 @@ def kmeans(obs, k_or_guess, iter=20, thresh=1e-5):
             distortion since the last k-means iteration is less than
             thresh.
 
+        minit : string
+            Method for picking the initial centroids of each run
+            when k_or_guess is an int. By default they are k
+            observations drawn at random; any of the methods of
+            kmeans2 may be given instead, '++' (k-means++) usually
+            needing the fewest iterations and runs.
+
+        n_jobs : int
+            The number of threads the runs are spread over, or -1 to
+            use one per processor.  The initial centroids of all the
+            runs are drawn beforehand, so the result for a given
+            random seed does not depend on n_jobs.
+
+        vq_method : string
+            How the observations are assigned to the centroids at
+            each iteration: 'brute' and 'kdtree' as for vq, or
+            'bounds' to keep triangle inequality bounds between
+            iterations so that only the observations whose centroid
+            may have changed are searched again.  'kdtree' and
+            'bounds' pay off with many centroids.
+
     :Returns:
         codebook : ndarray
             A k by N array of k centroids. The i'th centroid
@@ -477,12 +624,17 @@ def kmeans(obs, k_or_guess, iter=20, thresh=1e-5):
     """
     if int(iter) < 1:
         raise ValueError, 'iter must be >= to 1.'
+    n_jobs = _check_n_jobs(n_jobs)
+    if minit is not None and minit not in _valid_init_meth:
+        raise ValueError("unknown init method %s" % str(minit))
+    if vq_method not in _valid_vq_meth:
+        raise ValueError("Unknown vq method: %s" % str(vq_method))
     if type(k_or_guess) == type(array([])):
         guess = k_or_guess
         if guess.size < 1:
             raise ValueError("Asked for 0 cluster ? initial book was %s" % \
                              guess)
-        result = _kmeans(obs, guess, thresh = thresh)
+        result = _kmeans(obs, guess, thresh = thresh, vq_method = vq_method)
     else:
         #initialize best distance value to a large value
         best_dist = np.inf
@@ -490,16 +642,181 @@ def kmeans(obs, k_or_guess, iter=20, thresh=1e-5):
         k = k_or_guess
         if k < 1:
             raise ValueError("Asked for 0 cluster ? ")
+        guesses = []
         for i in range(iter):
-            #the intial code book is randomly selected from observations
-            guess = take(obs, randint(0, No, k), 0)
-            book, dist = _kmeans(obs, guess, thresh = thresh)
+            if minit is None:
+                #the intial code book is randomly selected from observations
+                guess = take(obs, randint(0, No, k), 0)
+            else:
+                guess = _valid_init_meth[minit](obs, k)
+            guesses.append((obs, guess, thresh, vq_method))
+        for book, dist in _map_threads(_kmeans, guesses, n_jobs):
             if dist < best_dist:
                 best_book = book
                 best_dist = dist
         result = best_book, best_dist
     return result
 
+def _minibatch_update(code_book, counts, batch):
+    """Move the centroids towards the members of one batch.
+
+    Each observation pulls its nearest centroid towards it with a
+    learning rate of one over the number of observations the centroid
+    has been assigned so far, so that a centroid is the running mean of
+    its members. The update is done in place; the distances of the
+    batch to their centroids before the update are returned.
+    """
+    label, dist = vq(batch, code_book)
+    # bincount only counts up to the largest label present
+    m = label.max() + 1
+    n = np.zeros(code_book.shape[0], dtype=int)
+    n[:m] = np.bincount(label)
+    has_members = np.nonzero(n)[0]
+    sums = np.zeros(code_book.shape)
+    for j in range(code_book.shape[1]):
+        sums[:m, j] = np.bincount(label, weights=batch[:, j])
+    counts[has_members] += n[has_members]
+    code_book[has_members] += (sums[has_members] - n[has_members, newaxis] *
+                               code_book[has_members]) / \
+                              counts[has_members, newaxis]
+    return dist
+
+def _minibatches(obs, batch_size, npass):
+    """Yield (pass, batch) pairs of rank 2 double batches of at most
+    batch_size observations.
+
+    Arrays, including memory-mapped ones, are read one contiguous
+    batch at a time, in a random order on each pass.  Any other
+    iterable is taken to produce chunks of observations, and is
+    iterated over once per pass.
+    """
+    if isinstance(obs, np.ndarray):
+        starts = np.arange(0, obs.shape[0], batch_size)
+        for i in range(npass):
+            for start in np.random.permutation(starts):
+                yield i, np.asarray(obs[start:start+batch_size],
+                                    dtype=double)
+        return
+    if npass > 1 and iter(obs) is obs:
+        raise ValueError("An iterator can only be read once; pass a "
+                         "re-iterable sequence of chunks for iter > 1.")
+    for i in range(npass):
+        for chunk in obs:
+            chunk = np.asarray(chunk, dtype=double)
+            if chunk.ndim != 2:
+                raise ValueError("Chunks of observations must be rank 2 "
+                                 "arrays, got rank %d" % chunk.ndim)
+            for start in range(0, chunk.shape[0], batch_size):
+                yield i, chunk[start:start+batch_size]
+
+def kmeans_minibatch(obs, k_or_guess, batch_size=1000, iter=1):
+    """Performs mini-batch k-means on a stream of observation vectors.
+
+    Unlike kmeans and kmeans2, which make full passes over all the
+    observations in every iteration, the code book is refined one
+    batch of observations at a time: each observation of a batch is
+    assigned to its nearest centroid, which then moves towards it with
+    a learning rate of one over the number of observations assigned to
+    that centroid so far (Sculley 2010).  Only a single batch is held
+    in memory, so the observations can be read from a memory-mapped
+    array or produced chunk by chunk from disk.
+
+    :Parameters:
+        obs : ndarray or iterable
+            Either an M by N array of observations (typically a
+            memory-mapped numpy.memmap), which is read in contiguous
+            batches taken in random order, or an iterable yielding
+            chunks, each an array of observations with N columns.
+            Chunks are split into batches of at most batch_size
+            observations.  As with kmeans, the features should be
+            whitened beforehand.
+        k_or_guess : int or ndarray
+            The number of centroids to generate, in which case the
+            initial centroids are picked at random among the
+            observations of the first batch, or a k by N array of
+            initial centroids.
+        batch_size : int
+            The number of observations used for each update.
+        iter : int
+            The number of passes to make over the observations.  An
+            iterator can only be passed over once, so iter > 1
+            requires obs to be an array or a sequence of chunks.
+
+    :Returns:
+        codebook : ndarray
+            A k by N array of centroids.  Centroids that were never
+            the nearest to any observation keep their initial value.
+        distortion : float
+            The mean distance between the observations of the last
+            pass and their nearest centroid, each taken when its batch
+            was assigned.  It is an estimate which doesn't require
+            another pass over the data.
+
+    :SeeAlso:
+        - kmeans: k-means over observations held in memory.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from scipy.cluster.vq import kmeans_minibatch
+    >>> obs = np.memmap('features.dat', dtype=np.float32, mode='r')
+    >>> obs = obs.reshape((-1, 16))
+    >>> book, dist = kmeans_minibatch(obs, 256, batch_size=10000, iter=3)
+
+    Chunks may also be generated on the fly:
+
+    >>> def chunks():
+    ...     for name in filenames:
+    ...         yield np.load(name)
+    >>> book, dist = kmeans_minibatch(chunks(), 256)
+    """
+    if int(iter) < 1:
+        raise ValueError('iter must be >= to 1.')
+    batch_size = int(batch_size)
+    if batch_size < 1:
+        raise ValueError('batch_size must be >= to 1.')
+    if isinstance(obs, np.ndarray) and obs.ndim != 2:
+        raise ValueError("Input of rank %d not supported" % obs.ndim)
+    batches = _minibatches(obs, batch_size, int(iter))
+    if np.size(k_or_guess) > 1:
+        code_book = np.array(k_or_guess, dtype=double)
+        if code_book.ndim != 2:
+            raise ValueError("initial book must be a rank 2 array")
+    else:
+        k = int(k_or_guess)
+        if k < 1:
+            raise ValueError("Asked for 0 cluster ? ")
+        code_book = None
+    counts = np.zeros(0, dtype=int)
+    last_pass = 0
+    total = 0.
+    seen = 0
+    for i, batch in batches:
+        if batch.shape[0] == 0:
+            continue
+        if i != last_pass:
+            # only the last pass counts towards the distortion
+            last_pass = i
+            total = 0.
+            seen = 0
+        if code_book is None:
+            if batch.shape[0] < k:
+                raise ValueError("The first batch has only %d observations "
+                                 "for %d clusters" % (batch.shape[0], k))
+            code_book = _kpoints(batch, k)
+        if batch.shape[1] != code_book.shape[1]:
+            raise ValueError("Code book(%d) and obs(%d) should have the same "
+                             "number of features (eg columns)" %
+                             (code_book.shape[1], batch.shape[1]))
+        if len(counts) == 0:
+            counts = np.zeros(code_book.shape[0], dtype=int)
+        dist = _minibatch_update(code_book, counts, batch)
+        total += np.sum(dist)
+        seen += dist.shape[0]
+    if code_book is None or seen == 0:
+        raise ValueError("Input has 0 items.")
+    return code_book, total / seen
+
 def _kpoints(data, k):
     """Pick k points at random in data (one row = one observation).
 
@@ -563,7 +880,102 @@ def _krandinit(data, k):
     else:
         return init_rankn(data)
 
-_valid_init_meth = {'random': _krandinit, 'points': _kpoints}
+def _kpp_seed(data, k, weights=None):
+    """Pick k rows of a rank 2 array with the k-means++ rule.
+
+    The first row is drawn at random, and each following one with a
+    probability proportional to its squared distance to the nearest
+    row already picked (times its weight, if weights is given).
+    """
+    n = data.shape[0]
+    if weights is None:
+        weights = np.ones(n)
+    cumw = np.cumsum(weights)
+    first = np.searchsorted(cumw, np.random.uniform(0, cumw[-1]), 'right')
+    code = np.empty((k, data.shape[1]))
+    code[0] = data[min(first, n - 1)]
+    d2 = np.sum((data - code[0]) ** 2, 1)
+    for i in range(1, k):
+        cump = np.cumsum(weights * d2)
+        if cump[-1] > 0:
+            j = np.searchsorted(cump, np.random.uniform(0, cump[-1]), 'right')
+        else:
+            # all the points coincide with a centroid already
+            j = np.random.randint(0, n)
+        code[i] = data[min(j, n - 1)]
+        d2 = minimum(d2, np.sum((data - code[i]) ** 2, 1))
+    return code
+
+def _kpp(data, k):
+    """Returns k observations picked with the k-means++ seeding rule.
+
+    The first centroid is picked at random among the observations, and
+    each following one among the observations with a probability
+    proportional to the squared distance to the nearest centroid
+    already picked (Arthur and Vassilvitskii 2007).  The initial code
+    book is then expected to be within O(log k) of the optimal
+    distortion, so that far fewer iterations and restarts are needed
+    than with uniformly random centroids.
+
+    :Parameters:
+        data : ndarray
+            Expect a rank 1 or 2 array. Rank 1 are assumed to describe one
+            dimensional data, rank 2 multidimensional data, in which case one
+            row is one observation.
+        k : int
+            Number of samples to generate.
+    """
+    if np.ndim(data) == 1:
+        return _kpp_seed(data[:, newaxis], k)[:, 0]
+    return _kpp_seed(data, k)
+
+def _kparallel(data, k, rounds=5):
+    """Returns k centroids picked with the scalable k-means|| rule.
+
+    Instead of the k sequential passes over the observations of
+    k-means++, a few rounds each sample about 2*k observations
+    independently, with probabilities proportional to their squared
+    distance to the candidates sampled so far (Bahmani et al. 2012).
+    The candidates are weighted by the number of observations closest
+    to them and reduced to k centroids with weighted k-means++.
+
+    :Parameters:
+        data : ndarray
+            Expect a rank 1 or 2 array. Rank 1 are assumed to describe one
+            dimensional data, rank 2 multidimensional data, in which case one
+            row is one observation.
+        k : int
+            Number of samples to generate.
+        rounds : int
+            Number of sampling rounds.
+    """
+    if np.ndim(data) == 1:
+        return _kparallel(data[:, newaxis], k, rounds)[:, 0]
+    data = np.asarray(data, dtype=double)
+    n = data.shape[0]
+    ell = 2. * k
+    candidates = [np.random.randint(0, n)]
+    d2 = np.sum((data - data[candidates[0]]) ** 2, 1)
+    for r in range(rounds):
+        psi = np.sum(d2)
+        if psi == 0:
+            break
+        new = np.nonzero(np.random.uniform(size=n) < ell * d2 / psi)[0]
+        if new.size > 0:
+            d2 = minimum(d2, vq(data, data[new])[1] ** 2)
+            candidates.extend(new)
+    # k-means++ needs at least k candidates to choose from
+    if len(candidates) < k:
+        candidates.extend(np.random.permutation(n)[:k - len(candidates)])
+    candidates = data[np.array(candidates)]
+    weights = np.zeros(candidates.shape[0])
+    label = vq(data, candidates)[0]
+    counts = np.bincount(label)
+    weights[:len(counts)] = counts
+    return _kpp_seed(candidates, k, weights)
+
+_valid_init_meth = {'random': _krandinit, 'points': _kpoints, '++': _kpp,
+                    '||': _kparallel}
 
 def _missing_warn():
     """Print a warning when called."""
@@ -578,7 +990,7 @@ def _missing_raise():
 _valid_miss_meth = {'warn': _missing_warn, 'raise': _missing_raise}
 
 def kmeans2(data, k, iter = 10, thresh = 1e-5, minit = 'random',
-        missing = 'warn'):
+        missing = 'warn', vq_method = 'brute'):
     """Classify a set of observations into k clusters using the k-means
        algorithm.
 
@@ -603,7 +1015,7 @@ def kmeans2(data, k, iter = 10, thresh = 1e-5, minit = 'random',
             (not used yet).
         minit : string
             Method for initialization. Available methods are 'random',
-            'points', 'uniform', and 'matrix':
+            'points', 'uniform', 'matrix', '++' and '||':
 
             'random': generate k centroids from a Gaussian with mean and
             variance estimated from the data.
@@ -617,6 +1029,22 @@ def kmeans2(data, k, iter = 10, thresh = 1e-5, minit = 'random',
             'matrix': interpret the k parameter as a k by M (or length k
             array for one-dimensional data) array of initial centroids.
 
+            '++': choose k observations with the k-means++ rule, each
+            with a probability proportional to its squared distance to
+            the centroids already chosen.
+
+            '||': choose k centroids with k-means||, the variant of
+            k-means++ which samples many observations per pass over the
+            data.
+
+        missing : string
+            Method to deal with empty clusters: 'warn' or 'raise'.
+
+        vq_method : string
+            How the observations are assigned to the centroids at
+            each iteration: 'brute', 'kdtree' or 'bounds', as for
+            kmeans.
+
     :Returns:
         centroid : ndarray
             A k by N array of centroids found at the last iteration of
@@ -627,6 +1055,8 @@ def kmeans2(data, k, iter = 10, thresh = 1e-5, minit = 'random',
     """
     if missing not in _valid_miss_meth.keys():
         raise ValueError("Unkown missing method: %s" % str(missing))
+    if vq_method not in _valid_vq_meth:
+        raise ValueError("Unknown vq method: %s" % str(vq_method))
     # If data is rank 1, then we have 1 dimension problem.
     nd  = np.ndim(data)
     if nd == 1:
@@ -671,21 +1101,23 @@ def kmeans2(data, k, iter = 10, thresh = 1e-5, minit = 'random',
         clusters = init(data, k)
 
     assert not iter == 0
-    return _kmeans2(data, clusters, iter, nc, _valid_miss_meth[missing])
+    return _kmeans2(data, clusters, iter, nc, _valid_miss_meth[missing],
+                    vq_method)
 
-def _kmeans2(data, code, niter, nc, missing):
+def _kmeans2(data, code, niter, nc, missing, vq_method='brute'):
     """ "raw" version of kmeans2. Do not use directly.
 
     Run k-means with a given initial codebook.  """
+    assign = _vq_function(data, vq_method)
     for i in range(niter):
         # Compute the nearest neighbour for each obs
         # using the current code book
-        label = vq(data, code)[0]
+        label = assign(code)[0]
         # Update the code by computing centroids using the new code book
+        centroids, counts = _centroids(data, label, nc)
         for j in range(nc):
-            mbs = np.where(label==j)
-            if mbs[0].size > 0:
-                code[j] = np.mean(data[mbs], axis=0)
+            if counts[j] > 0:
+                code[j] = centroids[j]
             else:
                 missing()
 
@@ -17,7 +17,10 @@ for k in ['fft', 'ifft', 'fftn', 'ifftn', 'fft2', 'ifft2']:
 del k, register_func
 
 from realtransforms import *
-__all__.extend(['dct', 'idct'])
+__all__.extend(['dct', 'idct', 'dst', 'idst'])
+
+from plan import *
+__all__.extend(['plan', 'Plan', 'set_cache_size', 'cache_info', 'clear_cache'])
 
 from numpy.testing import Tester
 test = Tester().test
@@ -6,11 +6,14 @@ Discrete Fourier Transforms - basic.py
 # Created by Pearu Peterson, August,September 2002
 
 __all__ = ['fft','ifft','fftn','ifftn','rfft','irfft',
-           'fft2','ifft2', 'rfftfreq']
+           'fft2','ifft2', 'rfftfreq', 'rfftn', 'irfftn']
 
 from numpy import asarray, zeros, swapaxes, integer, array
 import numpy
 import _fftpack as fftpack
+from helper import next_fast_len
+from scipy.lib._threads import check_n_jobs as _check_n_jobs, \
+     run_threads as _run_threads
 
 import atexit
 atexit.register(fftpack.destroy_zfft_cache)
@@ -41,6 +44,142 @@ def _fix_shape(x, n, axis):
     return x
 
 
+# dtype char -> (init function, work function)
+_work_functions = {
+    'D': (fftpack.zfft_init, fftpack.zfft_work),
+    'F': (fftpack.cfft_init, fftpack.cfft_work),
+    'd': (fftpack.drfft_init, fftpack.drfft_work),
+    'f': (fftpack.rfft_init, fftpack.rfft_work),
+    }
+
+def _raw_fft_threaded(x, n, axis, direction, n_jobs, wsave=None):
+    """ Internal auxiliary function for the n_jobs argument of the FFTs.
+
+    The 1-D transforms of length n along axis are split into n_jobs
+    blocks transformed in parallel; the work functions release the GIL.
+    x must have the dtype of the transform (complex for fft, real for
+    rfft).
+    """
+    if n != x.shape[axis]:
+        x = _fix_shape(x, n, axis)
+    init, work = _work_functions[x.dtype.char]
+    if wsave is None:
+        wsave = init(n)
+    r = numpy.array(swapaxes(x, axis, -1), order='C')
+    rows = r.reshape((-1, n))
+    if rows.shape[0] == 0:
+        return swapaxes(r, axis, -1)
+    nblocks = min(n_jobs, rows.shape[0])
+    bounds = [rows.shape[0]*i // nblocks for i in range(nblocks+1)]
+    def transform(start, stop):
+        # wsave doubles as scratch space, so each block needs a copy
+        rows[start:stop] = work(rows[start:stop], wsave.copy(), n,
+                                direction, overwrite_x=1)
+    _run_threads(transform, zip(bounds[:-1], bounds[1:]), n_jobs)
+    return swapaxes(r, axis, -1)
+
+def _complex_input(x):
+    """ Internal auxiliary function: x as complex array for the threaded
+    transforms."""
+    tmp = asarray(x)
+    if istype(tmp, numpy.complex128) or istype(tmp, numpy.complex64):
+        return tmp
+    if istype(tmp, numpy.float32):
+        return tmp.astype(numpy.complex64)
+    return tmp.astype(numpy.complex128)
+
+# Lengths whose largest prime factor is above this are transformed with
+# Bluestein's algorithm: FFTPACK takes O(n*p) operations for a factor p.
+_BLUESTEIN_MIN_FACTOR = 300
+
+_largest_factors = {}
+
+def _largest_prime_factor(n):
+    """ Internal auxiliary function: largest prime factor of n > 1."""
+    try:
+        return _largest_factors[n]
+    except KeyError:
+        pass
+    m = n
+    p = 2
+    largest = 1
+    while p * p <= m:
+        while m % p == 0:
+            m //= p
+            largest = p
+        p += 1 + (p > 2)
+    if m > 1:
+        largest = m
+    if len(_largest_factors) > 1000:
+        _largest_factors.clear()
+    _largest_factors[n] = largest
+    return largest
+
+def _use_bluestein(n):
+    """ Internal auxiliary function: whether to transform length n with
+    Bluestein's algorithm."""
+    return n > _BLUESTEIN_MIN_FACTOR and \
+           _largest_prime_factor(n) > _BLUESTEIN_MIN_FACTOR
+
+def _raw_fft_bluestein(x, n, axis, direction, n_jobs):
+    """ Internal auxiliary function for fft, ifft of awkward lengths.
+
+    Bluestein's algorithm writes the DFT of length n as a convolution
+    with the chirp w[k] = exp(-+i*pi*k**2/n), which is computed with
+    FFTs of a length m >= 2*n-1 that FFTPACK handles fast:
+
+      y[j] = w[j] * sum[k] (x[k]*w[k]) * conj(w[j-k])
+    """
+    if n != x.shape[axis]:
+        x = _fix_shape(x, n, axis)
+    x = swapaxes(x, axis, -1)
+    k = numpy.arange(n)
+    # k**2 is reduced modulo 2*n to keep the phase accurate for large n
+    w = numpy.exp(-direction * 1j * numpy.pi * ((k * k) % (2 * n)) / n)
+    m = next_fast_len(2 * n - 1)
+    b = zeros(m, numpy.complex128)
+    b[:n] = w.conj()
+    b[m-n+1:] = w[:0:-1].conj()
+    a = fft(x * w, m, n_jobs=n_jobs)
+    a *= fft(b)
+    y = ifft(a, n_jobs=n_jobs, overwrite_x=1)[..., :n]
+    y *= w
+    if direction < 0:
+        y /= n
+    return swapaxes(y.astype(x.dtype), axis, -1)
+
+def _raw_rfft_bluestein(x, n, axis, direction, n_jobs):
+    """ Internal auxiliary function for rfft, irfft of awkward lengths.
+
+    The complex transform is computed with Bluestein's algorithm and
+    converted from or to the packing of rfft.
+    """
+    if n != x.shape[axis]:
+        x = _fix_shape(x, n, axis)
+    x = swapaxes(x, axis, -1)
+    h = (n - 1) // 2
+    if direction > 0:
+        y = _raw_fft_bluestein(x.astype(numpy.complex128), n, -1, 1, n_jobs)
+        r = numpy.empty(y.shape, numpy.float64)
+        r[..., 0] = y[..., 0].real
+        r[..., 1:2*h+1:2] = y[..., 1:h+1].real
+        r[..., 2:2*h+1:2] = y[..., 1:h+1].imag
+        if n % 2 == 0:
+            r[..., n-1] = y[..., n//2].real
+    else:
+        y = zeros(x.shape, numpy.complex128)
+        y[..., 0] = x[..., 0]
+        y[..., 1:h+1] = x[..., 1:2*h+1:2] + 1j * x[..., 2:2*h+1:2]
+        if n % 2 == 0:
+            y[..., n//2] = x[..., n-1]
+        y[..., n-h:] = y[..., h:0:-1].conj()
+        r = _raw_fft_bluestein(y, n, -1, -1, n_jobs).real
+    if istype(x, numpy.float32):
+        r = r.astype(numpy.float32)
+    else:
+        r = r.astype(numpy.float64)
+    return swapaxes(r, axis, -1)
+
 def _raw_fft(x, n, axis, direction, overwrite_x, work_function):
     """ Internal auxiliary function for fft, ifft, rfft, irfft."""
     if n is None:
@@ -57,7 +196,7 @@ def _raw_fft(x, n, axis, direction, overwrite_x, work_function):
     return r
 
 
-def fft(x, n=None, axis=-1, overwrite_x=0):
+def fft(x, n=None, axis=-1, overwrite_x=0, n_jobs=1):
     """
     Return discrete Fourier transform of arbitrary type sequence x.
 
@@ -73,6 +212,10 @@ def fft(x, n=None, axis=-1, overwrite_x=0):
         Axis along which the fft's are computed. (default=-1)
     overwrite_x : bool, optional
         If True the contents of x can be destroyed. (default=False)
+    n_jobs : int, optional
+        Number of threads the 1-D transforms along axis are spread
+        over when x has more than one dimension, or -1 to use one per
+        processor. (default=1)
 
     Returns
     -------
@@ -97,7 +240,11 @@ def fft(x, n=None, axis=-1, overwrite_x=0):
     terms, in order of decreasingly negative frequency. So for an 8-point
     transform, the frequencies of the result are [ 0, 1, 2, 3, 4, -3, -2, -1].
 
-    This is most efficient for n a power of two.
+    This is most efficient for n a power of two, and generally for n
+    whose prime factors are small (see next_fast_len). Lengths with a
+    prime factor above 300 are computed with Bluestein's algorithm,
+    which takes O(n log n) operations instead of FFTPACK's O(n*p) for
+    a prime factor p.
 
     Examples
     --------
@@ -106,6 +253,14 @@ def fft(x, n=None, axis=-1, overwrite_x=0):
     True
 
     """
+    n_jobs = _check_n_jobs(n_jobs)
+    if n is None:
+        n = numpy.shape(x)[axis]
+    if _use_bluestein(n):
+        return _raw_fft_bluestein(_complex_input(x),n,axis,1,n_jobs)
+    if n_jobs > 1:
+        return _raw_fft_threaded(_complex_input(x),n,axis,1,n_jobs)
+
     tmp = asarray(x)
     if istype(tmp, numpy.complex128):
         overwrite_x = overwrite_x or (tmp is not x and not \
@@ -136,8 +291,8 @@ def fft(x, n=None, axis=-1, overwrite_x=0):
     tmp = work_function(tmp,n,1,0,overwrite_x)
     return swapaxes(tmp, axis, -1)
 
-def ifft(x, n=None, axis=-1, overwrite_x=0):
-    """ ifft(x, n=None, axis=-1, overwrite_x=0) -> y
+def ifft(x, n=None, axis=-1, overwrite_x=0, n_jobs=1):
+    """ ifft(x, n=None, axis=-1, overwrite_x=0, n_jobs=1) -> y
 
     Return inverse discrete Fourier transform of arbitrary type
     sequence x.
@@ -149,6 +304,14 @@ def ifft(x, n=None, axis=-1, overwrite_x=0):
 
     Optional input: see fft.__doc__
     """
+    n_jobs = _check_n_jobs(n_jobs)
+    if n is None:
+        n = numpy.shape(x)[axis]
+    if _use_bluestein(n):
+        return _raw_fft_bluestein(_complex_input(x),n,axis,-1,n_jobs)
+    if n_jobs > 1:
+        return _raw_fft_threaded(_complex_input(x),n,axis,-1,n_jobs)
+
     tmp = asarray(x)
     if istype(tmp, numpy.complex128):
         overwrite_x = overwrite_x or (tmp is not x and not \
@@ -180,8 +343,8 @@ def ifft(x, n=None, axis=-1, overwrite_x=0):
     return swapaxes(tmp, axis, -1)
 
 
-def rfft(x, n=None, axis=-1, overwrite_x=0):
-    """ rfft(x, n=None, axis=-1, overwrite_x=0) -> y
+def rfft(x, n=None, axis=-1, overwrite_x=0, n_jobs=1):
+    """ rfft(x, n=None, axis=-1, overwrite_x=0, n_jobs=1) -> y
 
     Return discrete Fourier transform of real sequence x.
 
@@ -203,6 +366,10 @@ def rfft(x, n=None, axis=-1, overwrite_x=0):
         array (or the newly constructed array if n argument was used).
       overwrite_x
         If set to true, the contents of x can be destroyed.
+      n_jobs
+        Number of threads the 1-D transforms along axis are spread
+        over when x has more than one dimension, or -1 to use one per
+        processor.
 
     Notes:
       y == rfft(irfft(y)) within numerical accuracy.
@@ -210,6 +377,15 @@ def rfft(x, n=None, axis=-1, overwrite_x=0):
     tmp = asarray(x)
     if not numpy.isrealobj(tmp):
         raise TypeError,"1st argument must be real sequence"
+    n_jobs = _check_n_jobs(n_jobs)
+    if n is None:
+        n = tmp.shape[axis]
+    if _use_bluestein(n):
+        return _raw_rfft_bluestein(tmp,n,axis,1,n_jobs)
+    if n_jobs > 1:
+        if not istype(tmp, numpy.float32):
+            tmp = tmp.astype(numpy.float64)
+        return _raw_fft_threaded(tmp,n,axis,1,n_jobs)
     if istype(tmp, numpy.float32):
         work_function = fftpack.rfft
     else:
@@ -233,8 +409,8 @@ def rfftfreq(n,d=1.0):
     return array(range(1,n+1),dtype=int)/2/float(n*d)
 
 
-def irfft(x, n=None, axis=-1, overwrite_x=0):
-    """ irfft(x, n=None, axis=-1, overwrite_x=0) -> y
+def irfft(x, n=None, axis=-1, overwrite_x=0, n_jobs=1):
+    """ irfft(x, n=None, axis=-1, overwrite_x=0, n_jobs=1) -> y
 
     Return inverse discrete Fourier transform of real sequence x.
     The contents of x is interpreted as the output of rfft(..)
@@ -257,6 +433,15 @@ def irfft(x, n=None, axis=-1, overwrite_x=0):
     tmp = asarray(x)
     if not numpy.isrealobj(tmp):
         raise TypeError,"1st argument must be real sequence"
+    n_jobs = _check_n_jobs(n_jobs)
+    if n is None:
+        n = tmp.shape[axis]
+    if _use_bluestein(n):
+        return _raw_rfft_bluestein(tmp,n,axis,-1,n_jobs)
+    if n_jobs > 1:
+        if not istype(tmp, numpy.float32):
+            tmp = tmp.astype(numpy.float64)
+        return _raw_fft_threaded(tmp,n,axis,-1,n_jobs)
     if istype(tmp, numpy.float32):
         work_function = fftpack.rfft
     else:
@@ -320,8 +505,29 @@ def _raw_fftnd(x, s, axes, direction, overwrite_x, work_function):
     return r
 
 
-def fftn(x, shape=None, axes=None, overwrite_x=0):
-    """ fftn(x, shape=None, axes=None, overwrite_x=0) -> y
+def _raw_fftnd_threaded(x, s, axes, direction, n_jobs):
+    """ Internal auxiliary function for the n_jobs argument of fftn, ifftn.
+
+    The transform is done one axis at a time, with the 1-D transforms
+    along each axis spread over n_jobs threads.
+    """
+    if s is None:
+        if axes is None:
+            s = x.shape
+        else:
+            s = numpy.take(x.shape, axes)
+    s = tuple(s)
+    if axes is None:
+        axes = range(-x.ndim, 0)
+    if len(axes) != len(s):
+        raise ValueError("when given, axes and shape arguments "\
+                         "have to be of the same length")
+    for n, axis in zip(s, axes):
+        x = _raw_fft_threaded(x, n, axis, direction, n_jobs)
+    return x
+
+def fftn(x, shape=None, axes=None, overwrite_x=0, n_jobs=1):
+    """ fftn(x, shape=None, axes=None, overwrite_x=0, n_jobs=1) -> y
 
     Return multi-dimensional discrete Fourier transform of arbitrary
     type sequence x.
@@ -347,13 +553,20 @@ def fftn(x, shape=None, axes=None, overwrite_x=0):
         used).
       overwrite_x
         If set to true, the contents of x can be destroyed.
+      n_jobs
+        Number of threads the 1-D transforms along each axis are
+        spread over, or -1 to use one per processor.
 
     Notes:
       y == fftn(ifftn(y)) within numerical accuracy.
     """
-    return _raw_fftn_dispatch(x, shape, axes, overwrite_x, 1)
+    return _raw_fftn_dispatch(x, shape, axes, overwrite_x, 1, n_jobs)
 
-def _raw_fftn_dispatch(x, shape, axes, overwrite_x, direction):
+def _raw_fftn_dispatch(x, shape, axes, overwrite_x, direction, n_jobs=1):
+    n_jobs = _check_n_jobs(n_jobs)
+    if n_jobs > 1:
+        return _raw_fftnd_threaded(_complex_input(x), shape, axes,
+                                   direction, n_jobs)
     tmp = asarray(x)
     if istype(tmp, numpy.complex128):
         overwrite_x = overwrite_x or (tmp is not x and not \
@@ -370,8 +583,8 @@ def _raw_fftn_dispatch(x, shape, axes, overwrite_x, direction):
     return _raw_fftnd(tmp,shape,axes,direction,overwrite_x,work_function)
 
 
-def ifftn(x, shape=None, axes=None, overwrite_x=0):
-    """ ifftn(x, s=None, axes=None, overwrite_x=0) -> y
+def ifftn(x, shape=None, axes=None, overwrite_x=0, n_jobs=1):
+    """ ifftn(x, s=None, axes=None, overwrite_x=0, n_jobs=1) -> y
 
     Return inverse multi-dimensional discrete Fourier transform of
     arbitrary type sequence x.
@@ -385,9 +598,9 @@ def ifftn(x, shape=None, axes=None, overwrite_x=0):
 
     Optional input: see fftn.__doc__
     """
-    return _raw_fftn_dispatch(x, shape, axes, overwrite_x, -1)
+    return _raw_fftn_dispatch(x, shape, axes, overwrite_x, -1, n_jobs)
 
-def fft2(x, shape=None, axes=(-2,-1), overwrite_x=0):
+def fft2(x, shape=None, axes=(-2,-1), overwrite_x=0, n_jobs=1):
     """
     2-D discrete Fourier transform.
 
@@ -399,15 +612,132 @@ def fft2(x, shape=None, axes=(-2,-1), overwrite_x=0):
     fftn : for detailed information.
 
     """
-    return fftn(x,shape,axes,overwrite_x)
+    return fftn(x,shape,axes,overwrite_x,n_jobs)
 
 
-def ifft2(x, shape=None, axes=(-2,-1), overwrite_x=0):
-    """ ifft2(x, shape=None, axes=(-2,-1), overwrite_x=0) -> y
+def ifft2(x, shape=None, axes=(-2,-1), overwrite_x=0, n_jobs=1):
+    """ ifft2(x, shape=None, axes=(-2,-1), overwrite_x=0, n_jobs=1) -> y
 
     Return inverse two-dimensional discrete Fourier transform of
     arbitrary type sequence x.
 
     See ifftn.__doc__ for more information.
     """
-    return ifftn(x,shape,axes,overwrite_x)
+    return ifftn(x,shape,axes,overwrite_x,n_jobs)
+
+def _nd_shape_and_axes(x, shape, axes):
+    """ Internal auxiliary function for rfftn, irfftn: the lengths and
+    axes of the transform as lists."""
+    if axes is None:
+        if shape is None:
+            axes = range(-x.ndim, 0)
+        else:
+            axes = range(-len(shape), 0)
+    axes = list(axes)
+    if shape is None:
+        shape = [x.shape[a] for a in axes]
+    shape = [int(n) for n in shape]
+    if len(axes) != len(shape):
+        raise ValueError("when given, axes and shape arguments "\
+                         "have to be of the same length")
+    if len(axes) == 0:
+        raise ValueError("at least one axis must be transformed")
+    return shape, axes
+
+def rfftn(x, shape=None, axes=None, n_jobs=1):
+    """ rfftn(x, shape=None, axes=None, n_jobs=1) -> y
+
+    Return multi-dimensional discrete Fourier transform of a real
+    sequence x.
+
+    Only the non-negative frequencies of the last transformed axis are
+    returned, the others being the complex conjugates of these: if
+    n = shape[-1], y has n/2+1 elements along axes[-1] and otherwise the
+    same values as fftn(x, shape, axes). Half of the time and memory of
+    fftn is saved by computing a real FFT along that axis first.
+
+    Optional input:
+      shape
+        Defines the shape of the Fourier transform, as for fftn. If axes
+        is not specified, the last len(shape) axes are transformed.
+      axes
+        The transform is applied along the given axes of the input
+        array (default all axes).
+      n_jobs
+        Number of threads the 1-D transforms along each axis are
+        spread over, or -1 to use one per processor.
+
+    Notes:
+      x == irfftn(rfftn(x), x.shape) within numerical accuracy.
+    """
+    tmp = asarray(x)
+    if not numpy.isrealobj(tmp):
+        raise TypeError("1st argument must be real sequence")
+    if not istype(tmp, numpy.float32):
+        tmp = tmp.astype(numpy.float64)
+    shape, axes = _nd_shape_and_axes(tmp, shape, axes)
+    n = shape[-1]
+    r = swapaxes(rfft(tmp, n, axes[-1], n_jobs=n_jobs), axes[-1], -1)
+    # unpack [y(0),Re(y(1)),Im(y(1)),...] into the complex half spectrum
+    h = (n - 1) // 2
+    if istype(r, numpy.float32):
+        y = zeros(r.shape[:-1] + (n//2 + 1,), numpy.complex64)
+    else:
+        y = zeros(r.shape[:-1] + (n//2 + 1,), numpy.complex128)
+    y.real[..., 0] = r[..., 0]
+    y.real[..., 1:h+1] = r[..., 1:2*h+1:2]
+    y.imag[..., 1:h+1] = r[..., 2:2*h+1:2]
+    if n % 2 == 0:
+        y.real[..., n//2] = r[..., n-1]
+    del r
+    y = swapaxes(y, axes[-1], -1)
+    if len(axes) > 1:
+        y = _raw_fftn_dispatch(y, shape[:-1], axes[:-1], 1, 1, n_jobs)
+    return y
+
+def irfftn(x, shape=None, axes=None, n_jobs=1):
+    """ irfftn(x, shape=None, axes=None, n_jobs=1) -> y
+
+    Return inverse multi-dimensional discrete Fourier transform of the
+    half spectrum x computed by rfftn, which is a real array.
+
+    Optional input:
+      shape
+        Defines the shape of the real output. By default, shape[i] is
+        x.shape[axes[i]] except for the last axis, where it is
+        2*(x.shape[axes[-1]]-1); pass the shape of the original array
+        when its last transformed length was odd. x is truncated or
+        padded with zeros along the last axis to shape[-1]/2+1 elements.
+      axes
+        The axes over which to compute the inverse transform, as for
+        rfftn.
+      n_jobs
+        Number of threads the 1-D transforms along each axis are
+        spread over, or -1 to use one per processor.
+    """
+    tmp = asarray(x)
+    if shape is None:
+        s, axes = _nd_shape_and_axes(tmp, None, axes)
+        s[-1] = 2 * (s[-1] - 1)
+    else:
+        s, axes = _nd_shape_and_axes(tmp, shape, axes)
+    n = s[-1]
+    if n < 1:
+        raise ValueError("Invalid number of data points (%d) specified" % n)
+    if len(axes) > 1:
+        tmp = _raw_fftn_dispatch(tmp, s[:-1], axes[:-1], 0, -1, n_jobs)
+    y = swapaxes(_fix_shape(tmp, n//2 + 1, axes[-1]), axes[-1], -1)
+    # pack the half spectrum as [y(0),Re(y(1)),Im(y(1)),...] for irfft
+    h = (n - 1) // 2
+    if istype(y, numpy.complex64) or istype(y, numpy.float32):
+        r = zeros(y.shape[:-1] + (n,), numpy.float32)
+    else:
+        r = zeros(y.shape[:-1] + (n,), numpy.float64)
+    r[..., 0] = y[..., 0].real
+    r[..., 1:2*h+1:2] = y[..., 1:h+1].real
+    r[..., 2:2*h+1:2] = y[..., 1:h+1].imag
+    if n % 2 == 0:
+        r[..., n-1] = y[..., n//2].real
+    del y
+    return irfft(swapaxes(r, axes[-1], -1), n, axes[-1], overwrite_x=1,
+                 n_jobs=n_jobs)
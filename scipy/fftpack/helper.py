@@ -1,4 +1,4 @@
-__all__ = ['fftshift', 'ifftshift', 'fftfreq', 'rfftfreq']
+__all__ = ['fftshift', 'ifftshift', 'fftfreq', 'rfftfreq', 'next_fast_len']
 
 from numpy import array
 from numpy.fft.helper import fftshift, ifftshift, fftfreq
@@ -17,3 +17,37 @@ def rfftfreq(n,d=1.0):
     """
     assert isinstance(n,int)
     return array(range(1,n+1),dtype=int)/2/float(n*d)
+
+def next_fast_len(target):
+    """ next_fast_len(target) -> n
+
+    Smallest length n >= target whose only prime factors are 2, 3 and 5.
+
+    FFTPACK is fastest for such lengths, so padding an input of length
+    target to n with zeros (e.g. fft(x, next_fast_len(len(x))))
+    minimizes the time of the transform; this is useful for
+    convolutions, where the padding does not change the result.
+    """
+    target = int(target)
+    if target < 1:
+        raise ValueError("target must be a positive integer (got %d)" % target)
+    if target <= 6:
+        return target
+    best = 2 * target
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            # smallest power of two bringing p35 to at least target
+            p2 = p35
+            while p2 < target:
+                p2 *= 2
+            if p2 < best:
+                best = p2
+            if p35 >= target:
+                break
+            p35 *= 3
+        if p5 >= target:
+            break
+        p5 *= 5
+    return best
@@ -13,6 +13,8 @@ Fast Fourier Transforms:
   ifft2     --- Inverse of fft2
   rfft      --- FFT of real periodic sequences
   irfft     --- Inverse of rfft
+  rfftn     --- Multi-dimensional FFT of real sequences (half spectrum)
+  irfftn    --- Inverse of rfftn
 
 Differential and pseudo-differential operators:
 
@@ -27,28 +29,44 @@ Differential and pseudo-differential operators:
   cc_diff   --- cosh/cosh pseudo-derivative of periodic sequences
   shift     --- Shift periodic sequences
 
+Real spectrum transforms:
+
+  dct       --- Discrete Cosine Transform, types I-III
+  idct      --- Inverse of dct
+  dst       --- Discrete Sine Transform, types I-III
+  idst      --- Inverse of dst
+
+Plans and caches:
+
+  plan           --- Reusable FFT of a given length, type and axis
+  set_cache_size --- Number of lengths kept by each work array cache
+  cache_info     --- Sizes, hits, misses and evictions of the caches
+  clear_cache    --- Free the cached work arrays
+
 Helper functions:
 
   fftshift  --- Shift zero-frequency component to center of spectrum
   ifftshift --- Inverse of freqshift
   dftfreq   --- DFT sample frequencies
   rfftfreq  --- DFT sample frequencies (specific to rfft,irfft)
+  next_fast_len --- Smallest length >= target with factors 2, 3 and 5
 
 Extension modules:
 
   _fftpack   --- Provides functions zfft, drfft, zrfft, zfftnd,
-                destroy_*_cache
+                zfft_work, drfft_work, destroy_*_cache,
+                set_*_cache_size, get_*_cache_info
   convolve  --- Provides functions convolve, convolve_z,
                 init_convolution_kernel, destroy_convolve_cache
 """
 
 __all__ = ['fft','ifft','fftn','ifftn','rfft','irfft',
-           'fft2','ifft2',
+           'fft2','ifft2', 'rfftn', 'irfftn',
            'diff',
            'tilbert','itilbert','hilbert','ihilbert',
            'sc_diff','cs_diff','cc_diff','ss_diff',
            'shift',
-           'rfftfreq'
+           'rfftfreq', 'next_fast_len'
            ]
 
 if __doc__:
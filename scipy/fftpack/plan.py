@@ -0,0 +1,208 @@
+"""
+FFT plans and control of the work array caches - plan.py
+"""
+
+__all__ = ['plan', 'Plan', 'set_cache_size', 'cache_info', 'clear_cache']
+
+import numpy
+from numpy import asarray
+import _fftpack
+import convolve
+from basic import _raw_fft, _raw_fft_threaded, _check_n_jobs
+
+# name of the cache -> extension module holding it
+_caches = [('zfft', _fftpack), ('cfft', _fftpack),
+           ('drfft', _fftpack), ('rfft', _fftpack),
+           ('zfftnd', _fftpack), ('cfftnd', _fftpack),
+           ('ddct1', _fftpack), ('ddct2', _fftpack),
+           ('dct1', _fftpack), ('dct2', _fftpack),
+           ('ddst1', _fftpack), ('ddst2', _fftpack),
+           ('dst1', _fftpack), ('dst2', _fftpack),
+           ('dfftpack', convolve)]
+
+def set_cache_size(size):
+    """ set_cache_size(size)
+
+    Set the number of lengths for which each FFT routine keeps its
+    twiddle factors and work arrays.
+
+    Each routine (complex and real FFTs in single and double
+    precision, multi-dimensional FFTs, DCTs, DSTs and convolutions) has
+    its own cache. When a length that is not in the cache is requested
+    while the cache is full, the least recently used length is
+    evicted. The default size is 10 (20 for convolutions); a larger
+    cache avoids recomputing the work arrays when many different
+    lengths are transformed in turn.
+
+    Parameters
+    ----------
+    size : int
+        The number of lengths to keep in each cache, at least 1.
+        Caches holding more are shrunk immediately.
+    """
+    size = int(size)
+    if size < 1:
+        raise ValueError("cache size must be at least 1 (got %d)" % size)
+    for name, module in _caches:
+        getattr(module, 'set_%s_cache_size' % name)(size)
+
+def cache_info():
+    """ cache_info() -> info
+
+    Return the state of the work array caches.
+
+    Returns
+    -------
+    info : dict
+        Maps the name of each cache ('zfft', 'drfft', 'zfftnd', 'ddct2',
+        'ddst2', ... for double precision, 'cfft', 'rfft', 'cfftnd',
+        'dct2', 'dst2', ... for single precision, 'dfftpack' for
+        convolutions) to a dict with the keys
+          size      --- maximum number of items
+          items     --- number of items in the cache
+          hits      --- number of lookups that found their item
+          misses    --- number of lookups that had to compute it
+          evictions --- number of items dropped to make room for others
+        Hits, misses and evictions are counted since the last call to
+        clear_cache.
+    """
+    info = {}
+    for name, module in _caches:
+        values = getattr(module, 'get_%s_cache_info' % name)()
+        info[name] = dict(zip(['size', 'items', 'hits', 'misses',
+                               'evictions'], [int(v) for v in values]))
+    return info
+
+def clear_cache():
+    """ clear_cache()
+
+    Free all the cached work arrays and reset the statistics reported
+    by cache_info.
+    """
+    for name, module in _caches:
+        if module is convolve:
+            module.destroy_convolve_cache()
+        else:
+            getattr(module, 'destroy_%s_cache' % name)()
+        getattr(module, 'reset_%s_cache_info' % name)()
+
+# dtype char -> (init function, work function, complex transform)
+_plan_functions = {
+    'D': (_fftpack.zfft_init, _fftpack.zfft_work, True),
+    'F': (_fftpack.cfft_init, _fftpack.cfft_work, True),
+    'd': (_fftpack.drfft_init, _fftpack.drfft_work, False),
+    'f': (_fftpack.rfft_init, _fftpack.rfft_work, False),
+    }
+
+class Plan(object):
+    """
+    Precomputed FFT of a given length, type and axis.
+
+    A plan holds its own twiddle factors and work array, so that
+    transforming many arrays with it neither recomputes them nor
+    touches the caches shared by fft, ifft, rfft and irfft.
+
+    Complex plans (complex128 or complex64) compute the transforms
+    of fft and ifft, and real plans (float64 or float32) those of
+    rfft and irfft, with the same packing of the result.
+
+    Attributes
+    ----------
+    n : int
+        Length of the transform.
+    dtype : numpy dtype
+        Type of the transformed arrays; inputs are converted to it.
+    axis : int
+        Axis along which the transforms are computed.
+
+    See Also
+    --------
+    plan : create a plan
+    """
+
+    def __init__(self, n, dtype=numpy.complex128, axis=-1):
+        n = int(n)
+        if n < 1:
+            raise ValueError("invalid length %d" % n)
+        dtype = numpy.dtype(dtype)
+        if dtype.char not in _plan_functions:
+            raise ValueError("plans support complex128, complex64, "
+                             "float64 and float32, not %s" % dtype)
+        init, self._work, self._complex = _plan_functions[dtype.char]
+        self.n = n
+        self.dtype = dtype
+        self.axis = int(axis)
+        self._wsave = init(n)
+
+    def __repr__(self):
+        return "Plan(%d, %s, axis=%d)" % (self.n, self.dtype, self.axis)
+
+    def _execute(self, x, direction, overwrite_x, n_jobs):
+        tmp = asarray(x)
+        if not self._complex and not numpy.isrealobj(tmp):
+            raise TypeError("a real plan needs a real sequence")
+        n_jobs = _check_n_jobs(n_jobs)
+        if tmp.dtype != self.dtype:
+            tmp = tmp.astype(self.dtype)
+            overwrite_x = 1
+        else:
+            overwrite_x = overwrite_x or (tmp is not x and not \
+                                          hasattr(x, '__array__'))
+        if n_jobs > 1:
+            return _raw_fft_threaded(tmp, self.n, self.axis, direction,
+                                     n_jobs, self._wsave)
+        # wsave doubles as scratch space and the work functions release
+        # the GIL, so concurrent calls on one plan each need a copy
+        wsave, work = self._wsave.copy(), self._work
+        def work_function(x, n, direction, overwrite_x):
+            return work(x, wsave, n, direction, overwrite_x=overwrite_x)
+        return _raw_fft(tmp, self.n, self.axis, direction, overwrite_x,
+                        work_function)
+
+    def forward(self, x, overwrite_x=0, n_jobs=1):
+        """ forward(x, overwrite_x=0, n_jobs=1) -> y
+
+        Forward transform of x: fft(x, n, axis) for complex plans and
+        rfft(x, n, axis) for real plans. x is truncated or zero-padded
+        to length n along axis. The transforms of the sequences are
+        spread over n_jobs threads, or one per processor if n_jobs is -1.
+        """
+        return self._execute(x, 1, overwrite_x, n_jobs)
+
+    def backward(self, x, overwrite_x=0, n_jobs=1):
+        """ backward(x, overwrite_x=0, n_jobs=1) -> y
+
+        Inverse transform of x: ifft(x, n, axis) for complex plans and
+        irfft(x, n, axis) for real plans. x is truncated or zero-padded
+        to length n along axis. n_jobs is as for forward.
+        """
+        return self._execute(x, -1, overwrite_x, n_jobs)
+
+def plan(n, dtype=numpy.complex128, axis=-1):
+    """ plan(n, dtype=numpy.complex128, axis=-1) -> p
+
+    Create a reusable plan for FFTs of length n.
+
+    Parameters
+    ----------
+    n : int
+        Length of the transform.
+    dtype : numpy dtype, optional
+        complex128 or complex64 for the transforms of fft and ifft,
+        float64 or float32 for those of rfft and irfft.
+    axis : int, optional
+        Axis along which the transforms are computed.
+
+    Returns
+    -------
+    p : Plan
+        p.forward(x) and p.backward(x) compute the transforms.
+
+    Examples
+    --------
+    >>> p = plan(1024)
+    >>> y = p.forward(x)
+    >>> np.allclose(p.backward(y), x)
+    True
+    """
+    return Plan(n, dtype, axis)
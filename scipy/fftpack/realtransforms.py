@@ -2,16 +2,21 @@
 Real spectrum tranforms (DCT, DST, MDCT)
 """
 
-__all__ = ['dct', 'idct']
+__all__ = ['dct', 'idct', 'dst', 'idst']
 
 import numpy as np
 from scipy.fftpack import _fftpack
+from scipy.fftpack.basic import _fix_shape
 
 import atexit
 atexit.register(_fftpack.destroy_ddct1_cache)
 atexit.register(_fftpack.destroy_ddct2_cache)
 atexit.register(_fftpack.destroy_dct1_cache)
 atexit.register(_fftpack.destroy_dct2_cache)
+atexit.register(_fftpack.destroy_ddst1_cache)
+atexit.register(_fftpack.destroy_ddst2_cache)
+atexit.register(_fftpack.destroy_dst1_cache)
+atexit.register(_fftpack.destroy_dst2_cache)
 
 def dct(x, type=2, n=None, axis=-1, norm=None):
     """
@@ -223,3 +228,197 @@ def _dct(x, type, n=None, axis=-1, overwrite_x=0, normalize=None):
     tmp = np.swapaxes(tmp, axis, -1)
     tmp = f(tmp, n, nm, overwrite_x)
     return np.swapaxes(tmp, axis, -1)
+
+def dst(x, type=2, n=None, axis=-1, norm=None):
+    """
+    Return the Discrete Sine Transform of arbitrary type sequence x.
+
+    Parameters
+    ----------
+    x : array-like
+        input array.
+    type : {1, 2, 3}
+        type of the DST (see Notes).
+    n : int, optional
+        Length of the transform. If n < x.shape[axis], x is truncated,
+        if n > x.shape[axis], x is zero-padded. (default n=x.shape[axis])
+    axis : int, optional
+        axis over which to compute the transform.
+    norm : {None, 'ortho'}
+        normalization mode (see Notes).
+
+    Returns
+    -------
+    y : real ndarray
+
+    Notes
+    -----
+    For a single dimension array ``x``, ``dst(x, type=1, norm='ortho')``
+    is equal to matlab ``dst(x) * sqrt(2/(N+1))``.
+
+    There are theoretically 8 types of the DST, only the first 3 types are
+    implemented in scipy. 'The' DST generally refers to DST type 2, and 'the'
+    Inverse DST generally refers to DST type 3. The transforms use the
+    work array caches of set_cache_size and cache_info ('ddst1', 'ddst2',
+    'dst1' and 'dst2').
+
+    type I
+    ~~~~~~
+    There are several definitions of the DST-I; we use the following
+    (for ``norm=None``):
+
+    .. math::
+        y_k = 2 \\sum_{n=0}^{N-1} x_n
+        \\sin\\left({\\pi (n+1)(k+1)\\over N+1}\\right),
+        \\qquad 0 \\le k < N.
+
+    If ``norm='ortho'``, :math:`y_k` is multiplied by the scaling factor
+    :math:`f = \\sqrt{1/(2(N+1))}`, which makes the DST-I orthonormal and
+    its own inverse.
+
+    type II
+    ~~~~~~~
+    There are several definitions of the DST-II; we use the following
+    (for ``norm=None``):
+
+    .. math::
+        y_k = 2 \\sum_{n=0}^{N-1} x_n
+        \\sin\\left({\\pi(2n+1)(k+1)\\over 2N}\\right)
+        \\qquad 0 \\le k < N.
+
+    If ``norm='ortho'``, :math:`y_k` is multiplied by a scaling factor `f`:
+
+    .. math::
+        f = \\begin{cases} \\sqrt{1/(4N)}, & \\text{if $k = N-1$} \\\\
+        \\sqrt{1/(2N)}, & \\text{otherwise} \\end{cases}
+
+    Which makes the corresponding matrix of coefficients orthonormal
+    (`OO' = Id`).
+
+    type III
+    ~~~~~~~~
+
+    There are several definitions, we use the following
+    (for ``norm=None``):
+
+    .. math::
+        y_k = (-1)^k x_{N-1} + 2 \\sum_{n=0}^{N-2} x_n
+        \\sin\\left({\\pi(2k+1)(n+1) \\over 2N}\\right)
+        \\qquad 0 \\le k < N.
+
+    If ``norm='ortho'``, :math:`x_{N-1}` is first multiplied by
+    :math:`\\sqrt{1/N}` and the other terms by :math:`\\sqrt{1/(2N)}`.
+
+    The (unnormalized) DST-III is the inverse of the (unnormalized) DST-II, up
+    to a factor `2N`, and the (unnormalized) DST-I is its own inverse up to
+    a factor `2(N+1)`. The orthonormalized DST-III is exactly the inverse of
+    the orthonormalized DST-II.
+
+    References
+    ----------
+
+    http://en.wikipedia.org/wiki/Discrete_sine_transform
+
+    See Also
+    --------
+    idst, dct
+    """
+    return _dst(x, type, n, axis, normalize=norm)
+
+def idst(x, type=2, n=None, axis=-1, norm=None):
+    """
+    Return the Inverse Discrete Sine Transform of arbitrary type sequence x.
+
+    Parameters
+    ----------
+    x : array-like
+        input array.
+    type : {1, 2, 3}
+        type of the IDST (see Notes).
+    n : int, optional
+        Length of the transform.
+    axis : int, optional
+        axis over which to compute the transform.
+    norm : {None, 'ortho'}
+        normalization mode (see Notes).
+
+    Returns
+    -------
+    y : real ndarray
+
+    Notes
+    -----
+    'The' IDST is the IDST of type 2, which is the same as DST of type 3.
+
+    IDST of type 1 is the DST of type 1, IDST of type 2 is the DST of type 3,
+    and IDST of type 3 is the DST of type 2. With ``norm='ortho'`` the IDST
+    is exactly the inverse of the DST of the same type.
+
+    See Also
+    --------
+    dst
+    """
+    # Inverse/forward type table
+    _TP = {1:1, 2:3, 3:2}
+    if type not in _TP:
+        raise ValueError("Type %d not understood" % type)
+    return _dst(x, _TP[type], n, axis, normalize=norm)
+
+def _dst(x, type, n=None, axis=-1, overwrite_x=0, normalize=None):
+    """
+    Return Discrete Sine Transform of arbitrary type sequence x.
+
+    Parameters
+    ----------
+    x : array-like
+        input array.
+    n : int, optional
+        Length of the transform.
+    axis : int, optional
+        Axis along which the dst is computed. (default=-1)
+    overwrite_x : bool, optional
+        If True the contents of x can be destroyed. (default=False)
+
+    Returns
+    -------
+    z : real ndarray
+
+    """
+    tmp = np.asarray(x)
+    if not np.isrealobj(tmp):
+        raise TypeError,"1st argument must be real sequence"
+
+    if tmp.dtype == np.double:
+        functions = {1: _fftpack.ddst1, 2: _fftpack.ddst2, 3: _fftpack.ddst3}
+    elif tmp.dtype == np.float32:
+        functions = {1: _fftpack.dst1, 2: _fftpack.dst2, 3: _fftpack.dst3}
+    else:
+        raise ValueError("dtype %s not supported" % tmp.dtype)
+    if type not in functions:
+        raise ValueError("Type %d not understood" % type)
+    f = functions[type]
+
+    if normalize:
+        if normalize == "ortho":
+            nm = 1
+        else:
+            raise ValueError("Unknown normalize mode %s" % normalize)
+    else:
+        nm = 0
+
+    if n is None:
+        n = tmp.shape[axis]
+    elif n != tmp.shape[axis]:
+        # truncating gives a view of x, padding a copy
+        overwrite_x = overwrite_x or n > tmp.shape[axis]
+        tmp = _fix_shape(tmp, n, axis)
+    if n < 1:
+        raise ValueError("Invalid number of DST data points (%d) "
+                         "specified." % n)
+
+    if axis == -1 or axis == len(tmp.shape) - 1:
+        return f(tmp, n, nm, overwrite_x)
+
+    tmp = np.swapaxes(tmp, axis, -1)
+    tmp = f(tmp, n, nm, overwrite_x)
+    return np.swapaxes(tmp, axis, -1)
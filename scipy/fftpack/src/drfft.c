@@ -32,14 +32,11 @@ GEN_CACHE(rfft, (int n)
 	  , free(caches_rfft[id].wsave);
 	  , 10)
 
-void drfft(double *inout, int n, int direction, int howmany,
-			  int normalize)
+void drfft_work(double *inout, int n, int direction, int howmany,
+			  int normalize, double *wsave)
 {
     int i;
     double *ptr = inout;
-    double *wsave = NULL;
-    wsave = caches_drfft[get_cache_id_drfft(n)].wsave;
-
 
     switch (direction) {
         case 1:
@@ -67,14 +64,11 @@ void drfft(double *inout, int n, int direction, int howmany,
     }
 }
 
-void rfft(float *inout, int n, int direction, int howmany,
-			 int normalize)
+void rfft_work(float *inout, int n, int direction, int howmany,
+			 int normalize, float *wsave)
 {
     int i;
     float *ptr = inout;
-    float *wsave = NULL;
-    wsave = caches_rfft[get_cache_id_rfft(n)].wsave;
-
 
     switch (direction) {
         case 1:
@@ -101,3 +95,31 @@ void rfft(float *inout, int n, int direction, int howmany,
         }
     }
 }
+
+void drfft(double *inout, int n, int direction, int howmany,
+    int normalize)
+{
+    int id = get_cache_id_drfft(n);
+    drfft_work(inout, n, direction, howmany, normalize,
+        caches_drfft[id].wsave);
+}
+
+/* wsave must have room for 2*n+15 elements */
+void drfft_init(int n, double *wsave)
+{
+    F_FUNC(dffti,DFFTI)(&n, wsave);
+}
+
+void rfft(float *inout, int n, int direction, int howmany,
+    int normalize)
+{
+    int id = get_cache_id_rfft(n);
+    rfft_work(inout, n, direction, howmany, normalize,
+        caches_rfft[id].wsave);
+}
+
+/* wsave must have room for 2*n+15 elements */
+void rfft_init(int n, float *wsave)
+{
+    F_FUNC(rffti,RFFTI)(&n, wsave);
+}
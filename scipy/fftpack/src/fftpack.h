@@ -40,16 +40,38 @@ extern int ispow2le2e13(int n);
 #endif
 
 /*
-  Simple cyclic cache.
+  Least recently used cache of at most cache_size_<name> items. The
+  items array is grown on demand; its entries are only valid until the
+  next call to get_cache_id_<name>, but the memory they point to stays
+  valid until the item is evicted.
+
+  info[0..4] of get_<name>_cache_info are the maximum size, the number
+  of items, and the number of hits, misses and evictions.
  */
 #define GEN_CACHE(name,CACHEARG,CACHETYPE,CHECK,MALLOC,FREE,CACHESIZE) \
 typedef struct {\
   int n;\
+  unsigned long last_used;\
   CACHETYPE \
 } cache_type_##name;\
-static cache_type_##name caches_##name[CACHESIZE];\
+static cache_type_##name *caches_##name = NULL;\
 static int nof_in_cache_##name = 0;\
-static int last_cache_id_##name = 0;\
+static int allocated_cache_##name = 0;\
+static int cache_size_##name = CACHESIZE;\
+static unsigned long clock_cache_##name = 0;\
+static long stats_cache_##name[3] = {0, 0, 0};\
+static void evict_cache_##name(int size) {\
+  int i,id;\
+  while (nof_in_cache_##name > size) {\
+    id = 0;\
+    for (i=1;i<nof_in_cache_##name;i++)\
+      if (caches_##name[i].last_used < caches_##name[id].last_used)\
+        id = i;\
+    FREE \
+    caches_##name[id] = caches_##name[--nof_in_cache_##name];\
+    stats_cache_##name[2]++;\
+  }\
+}\
 static int get_cache_id_##name CACHEARG { \
   int i,id = -1; \
   for (i=0;i<nof_in_cache_##name;i++) \
@@ -57,29 +79,44 @@ static int get_cache_id_##name CACHEARG { \
       id=i; \
       break; \
     } \
-  if (id>=0) goto exit;\
-  if (nof_in_cache_##name<CACHESIZE) {\
-    id = nof_in_cache_##name++;\
-  } else {\
-    id = (last_cache_id_##name<CACHESIZE-1)?last_cache_id_##name+1:0;\
-    /*fprintf(stderr,"Removing cache item n=%d\n",caches_##name[id].n);*/\
-    FREE \
-    caches_##name[id].n = 0;\
+  if (id>=0) {\
+    stats_cache_##name[0]++;\
+    goto exit;\
   }\
-  /*fprintf(stderr,"New cache item n=%d\n",n);*/\
+  stats_cache_##name[1]++;\
+  evict_cache_##name(cache_size_##name - 1);\
+  if (nof_in_cache_##name == allocated_cache_##name) {\
+    allocated_cache_##name = cache_size_##name;\
+    caches_##name = (cache_type_##name *)realloc(caches_##name,\
+        sizeof(cache_type_##name) * allocated_cache_##name);\
+  }\
+  id = nof_in_cache_##name++;\
   caches_##name[id].n = n;\
   MALLOC \
  exit:\
-  last_cache_id_##name = id;\
+  caches_##name[id].last_used = ++clock_cache_##name;\
   return id;\
 }\
 void destroy_##name##_cache(void) {\
   int id;\
   for (id=0;id<nof_in_cache_##name;++id) {\
     FREE \
-    caches_##name[id].n = 0;\
   }\
-  nof_in_cache_##name = last_cache_id_##name = 0;\
+  nof_in_cache_##name = 0;\
+}\
+void set_##name##_cache_size(int size) {\
+  evict_cache_##name(size);\
+  cache_size_##name = size;\
+}\
+void get_##name##_cache_info(int *info) {\
+  info[0] = cache_size_##name;\
+  info[1] = nof_in_cache_##name;\
+  info[2] = stats_cache_##name[0];\
+  info[3] = stats_cache_##name[1];\
+  info[4] = stats_cache_##name[2];\
+}\
+void reset_##name##_cache_info(void) {\
+  stats_cache_##name[0] = stats_cache_##name[1] = stats_cache_##name[2] = 0;\
 }
 
 #endif
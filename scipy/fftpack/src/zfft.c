@@ -29,14 +29,11 @@ GEN_CACHE(cfft,(int n)
 	  ,free(caches_cfft[id].wsave);
 	  ,10)
 
-void zfft(complex_double * inout, int n, int direction, int howmany,
-		int normalize)
+void zfft_work(complex_double * inout, int n, int direction, int howmany,
+		int normalize, double *wsave)
 {
 	int i;
 	complex_double *ptr = inout;
-	double *wsave = NULL;
-
-	wsave = caches_zfft[get_cache_id_zfft(n)].wsave;
 
 	switch (direction) {
 	case 1:
@@ -63,14 +60,11 @@ void zfft(complex_double * inout, int n, int direction, int howmany,
 	}
 }
 
-void cfft(complex_float * inout, int n, int direction, int howmany,
-	int normalize)
+void cfft_work(complex_float * inout, int n, int direction, int howmany,
+	int normalize, float *wsave)
 {
 	int i;
 	complex_float *ptr = inout;
-	float *wsave = NULL;
-
-	wsave = caches_cfft[get_cache_id_cfft(n)].wsave;
 
 	switch (direction) {
 	case 1:
@@ -97,3 +91,31 @@ void cfft(complex_float * inout, int n, int direction, int howmany,
 		}
 	}
 }
+
+void zfft(complex_double * inout, int n, int direction, int howmany,
+	int normalize)
+{
+	int id = get_cache_id_zfft(n);
+	zfft_work(inout, n, direction, howmany, normalize,
+		caches_zfft[id].wsave);
+}
+
+/* wsave must have room for 4*n+15 elements */
+void zfft_init(int n, double *wsave)
+{
+	F_FUNC(zffti,ZFFTI)(&n, wsave);
+}
+
+void cfft(complex_float * inout, int n, int direction, int howmany,
+	int normalize)
+{
+	int id = get_cache_id_cfft(n);
+	cfft_work(inout, n, direction, howmany, normalize,
+		caches_cfft[id].wsave);
+}
+
+/* wsave must have room for 4*n+15 elements */
+void cfft_init(int n, float *wsave)
+{
+	F_FUNC(cffti,CFFTI)(&n, wsave);
+}
@@ -10,6 +10,7 @@ GEN_CACHE(zfftnd, (int n, int rank)
 	  , ((caches_zfftnd[i].n == n)
 	     && (caches_zfftnd[i].rank == rank))
 	  , caches_zfftnd[id].n = n;
+	  caches_zfftnd[id].rank = rank;
 	  caches_zfftnd[id].ptr =
 	  (complex_double *) malloc(2 * sizeof(double) * n);
 	  caches_zfftnd[id].iptr =
@@ -24,6 +25,7 @@ GEN_CACHE(cfftnd, (int n, int rank)
 	  , ((caches_cfftnd[i].n == n)
 	     && (caches_cfftnd[i].rank == rank))
 	  , caches_cfftnd[id].n = n;
+	  caches_cfftnd[id].rank = rank;
 	  caches_cfftnd[id].ptr =
 	  (complex_float *) malloc(2 * sizeof(float) * n);
 	  caches_cfftnd[id].iptr =
@@ -12,7 +12,8 @@ Run tests if fftpack is not installed:
 """
 
 from numpy.testing import *
-from scipy.fftpack import ifft,fft,fftn,ifftn,rfft,irfft, fft2
+from scipy.fftpack import ifft,fft,fftn,ifftn,rfft,irfft, fft2, ifft2, \
+     rfftn, irfftn
 from scipy.fftpack import _fftpack as fftpack
 
 from numpy import arange, add, array, asarray, zeros, dot, exp, pi,\
@@ -515,5 +516,152 @@ class TestIfftnSingle(_TestIfftn):
     cdtype = np.complex64
     maxnlp = 2000
 
+class TestNJobs(TestCase):
+    """The threaded transforms give the same results as the serial ones."""
+
+    def test_fft(self):
+        x = random((13,3,20)) + 1j*random((13,3,20))
+        for n_jobs in [2, 4, -1]:
+            for axis in [-1, 0, 1]:
+                assert_array_almost_equal(fft(x, axis=axis, n_jobs=n_jobs),
+                                          fft(x, axis=axis))
+                assert_array_almost_equal(ifft(x, axis=axis, n_jobs=n_jobs),
+                                          ifft(x, axis=axis))
+            assert_array_almost_equal(fft(x, 16, n_jobs=n_jobs), fft(x, 16))
+            assert_array_almost_equal(fft(x, 32, n_jobs=n_jobs), fft(x, 32))
+
+    def test_real_input(self):
+        x = random((10,30))
+        y = fft(x, n_jobs=3)
+        assert_array_almost_equal(y, fft(x))
+        self.failUnless(y.dtype == cdouble)
+        y = fft(x.astype(np.float32), n_jobs=3)
+        self.failUnless(y.dtype == np.complex64)
+
+    def test_rfft(self):
+        x = random((7,25))
+        for n_jobs in [2, 5]:
+            assert_array_almost_equal(rfft(x, n_jobs=n_jobs), rfft(x))
+            assert_array_almost_equal(irfft(x, n_jobs=n_jobs), irfft(x))
+            assert_array_almost_equal(rfft(x, axis=0, n_jobs=n_jobs),
+                                      rfft(x, axis=0))
+        y = rfft(x.astype(np.float32), n_jobs=2)
+        self.failUnless(y.dtype == np.float32)
+
+    def test_fftn(self):
+        x = random((6,5,8)) + 1j*random((6,5,8))
+        for n_jobs in [2, 3]:
+            assert_array_almost_equal(fftn(x, n_jobs=n_jobs), fftn(x))
+            assert_array_almost_equal(ifftn(x, n_jobs=n_jobs), ifftn(x))
+            assert_array_almost_equal(fftn(x, axes=(0,2), n_jobs=n_jobs),
+                                      fftn(x, axes=(0,2)))
+            assert_array_almost_equal(fftn(x, shape=(4,7), axes=(2,0),
+                                           n_jobs=n_jobs),
+                                      fftn(x, shape=(4,7), axes=(2,0)))
+            assert_array_almost_equal(fft2(x, n_jobs=n_jobs), fft2(x))
+            assert_array_almost_equal(ifft2(x, n_jobs=n_jobs), ifft2(x))
+        x = random((4,5))
+        assert_array_almost_equal(fftn(x, n_jobs=2), direct_dftn(x))
+
+    def test_single_row(self):
+        x = random((30,)) + 1j*random((30,))
+        assert_array_almost_equal(fft(x, n_jobs=4), fft(x))
+
+    def test_invalid(self):
+        x = random((4,8))
+        self.failUnlessRaises(ValueError, fft, x, n_jobs=0)
+        self.failUnlessRaises(ValueError, fftn, x, n_jobs=-2)
+        self.failUnlessRaises(ValueError, rfft, x, n_jobs=0)
+
+class TestRfftn(TestCase):
+
+    def test_definition(self):
+        for shape in [(4,6), (5,7), (3,4,5), (8,)]:
+            x = random(shape)
+            y = rfftn(x)
+            n = shape[-1]
+            self.failUnless(y.shape == shape[:-1] + (n//2+1,))
+            assert_array_almost_equal(y, fftn(x)[..., :n//2+1])
+            assert_array_almost_equal(irfftn(y, shape), x)
+            assert_array_almost_equal(y, numpy.fft.rfftn(x))
+            if n % 2 == 0:
+                assert_array_almost_equal(irfftn(y), x)
+
+    def test_axes_and_shape(self):
+        x = random((4,5,6))
+        for axes in [(0,), (1,), (0,2), (2,0), (1,2)]:
+            y = rfftn(x, axes=axes)
+            assert_array_almost_equal(y, numpy.fft.rfftn(x, axes=axes))
+            s = [x.shape[a] for a in axes]
+            assert_array_almost_equal(irfftn(y, s, axes), x)
+        assert_array_almost_equal(rfftn(x, (3,8)),
+                                  numpy.fft.rfftn(x, (3,8)))
+        assert_array_almost_equal(rfftn(x, (7,3), axes=(0,1)),
+                                  numpy.fft.rfftn(x, (7,3), axes=(0,1)))
+        y = numpy.fft.rfftn(x)
+        assert_array_almost_equal(irfftn(y, (4,5,9)),
+                                  numpy.fft.irfftn(y, (4,5,9)))
+
+    def test_single(self):
+        x = random((6,8)).astype(np.float32)
+        y = rfftn(x)
+        self.failUnless(y.dtype == np.complex64)
+        assert_array_almost_equal(y, numpy.fft.rfftn(x), 4)
+        z = irfftn(y)
+        self.failUnless(z.dtype == np.float32)
+        assert_array_almost_equal(z, x, 5)
+
+    def test_n_jobs(self):
+        x = random((6,5,8))
+        y = rfftn(x)
+        assert_array_almost_equal(rfftn(x, n_jobs=3), y)
+        assert_array_almost_equal(irfftn(y, n_jobs=3), irfftn(y))
+
+    def test_invalid(self):
+        x = random((4,4))
+        self.failUnlessRaises(TypeError, rfftn, x + 1j)
+        self.failUnlessRaises(ValueError, rfftn, x, (4,4), (0,))
+        self.failUnlessRaises(ValueError, irfftn, x[:, :1])
+
+class TestBluestein(TestCase):
+    """Lengths with a large prime factor go through Bluestein's algorithm."""
+
+    def test_fft(self):
+        for n in [401, 1009, 2*401, 4099]:
+            x = random((n,)) + 1j*random((n,))
+            assert_array_almost_equal(fft(x), numpy.fft.fft(x))
+            assert_array_almost_equal(ifft(x), numpy.fft.ifft(x))
+            assert_array_almost_equal(ifft(fft(x)), x)
+        x = random((1009,)) + 1j*random((1009,))
+        assert_array_almost_equal(fft(x), direct_dft(x))
+
+    def test_rfft(self):
+        for n in [401, 1009, 2*3*307]:
+            x = random((n,))
+            y = rfft(x)
+            assert_array_almost_equal(y, direct_rdft(x))
+            assert_array_almost_equal(irfft(y), x)
+            assert_array_almost_equal(irfft(x), direct_irdft(x))
+
+    def test_axis_and_shape(self):
+        x = random((1009,3)) + 1j*random((1009,3))
+        assert_array_almost_equal(fft(x, axis=0), numpy.fft.fft(x, axis=0))
+        assert_array_almost_equal(fft(x, 1013, axis=0),
+                                  numpy.fft.fft(x, 1013, axis=0))
+        assert_array_almost_equal(fft(x[:,0], 1009), fft(x[:1009,0]))
+        y = random((4,1013))
+        assert_array_almost_equal(rfft(y, axis=1, n_jobs=2), rfft(y))
+        assert_array_almost_equal(irfft(y, n_jobs=2), irfft(y))
+        assert_array_almost_equal(fft(x, axis=0, n_jobs=2), fft(x, axis=0))
+
+    def test_single(self):
+        x = random((1009,)) + 1j*random((1009,))
+        y = fft(x.astype(np.complex64))
+        self.failUnless(y.dtype == np.complex64)
+        assert_array_almost_equal(y/1009, numpy.fft.fft(x)/1009, 5)
+        y = rfft(x.real.astype(np.float32))
+        self.failUnless(y.dtype == np.float32)
+        assert_array_almost_equal(y/1009, rfft(x.real)/1009, 5)
+
 if __name__ == "__main__":
     run_module_suite()
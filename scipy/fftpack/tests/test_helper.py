@@ -12,7 +12,7 @@ Run tests if fftpack is not installed:
 """
 
 from numpy.testing import *
-from scipy.fftpack import fftshift,ifftshift,fftfreq,rfftfreq
+from scipy.fftpack import fftshift,ifftshift,fftfreq,rfftfreq,next_fast_len
 
 from numpy import pi
 
@@ -55,6 +55,29 @@ class TestRFFTFreq(TestCase):
         x = [0,1,1,2,2,3,3,4,4,5]
         assert_array_almost_equal(10*rfftfreq(10),x)
         assert_array_almost_equal(10*pi*rfftfreq(10,pi),x)
+class TestNextFastLen(TestCase):
+
+    def test_definition(self):
+        fast = [n for n in range(1, 1100) if all_small(n)]
+        for target in range(1, 1000):
+            n = next_fast_len(target)
+            self.failUnless(n >= target and all_small(n))
+            self.failUnless([m for m in fast if target <= m < n] == [])
+
+    def test_values(self):
+        for target, n in [(1, 1), (7, 8), (11, 12), (97, 100),
+                          (1021, 1024), (2049, 2160), (10007, 10125)]:
+            self.failUnless(next_fast_len(target) == n)
+
+    def test_invalid(self):
+        self.failUnlessRaises(ValueError, next_fast_len, 0)
+        self.failUnlessRaises(ValueError, next_fast_len, -5)
+
+def all_small(n):
+    for p in [2, 3, 5]:
+        while n % p == 0:
+            n //= p
+    return n == 1
 
 if __name__ == "__main__":
     run_module_suite()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+""" Test functions for fftpack.plan module
+"""
+
+from numpy.testing import *
+from scipy.fftpack import fft, ifft, rfft, irfft, plan, Plan, \
+     set_cache_size, cache_info, clear_cache
+
+import numpy as np
+
+class TestPlan(TestCase):
+
+    def test_complex(self):
+        x = np.random.randn(7, 16) + 1j*np.random.randn(7, 16)
+        for axis in [-1, 0]:
+            n = x.shape[axis]
+            p = plan(n, axis=axis)
+            assert_array_almost_equal(p.forward(x), fft(x, axis=axis))
+            assert_array_almost_equal(p.backward(x), ifft(x, axis=axis))
+            assert_array_almost_equal(p.backward(p.forward(x)), x)
+
+    def test_real(self):
+        x = np.random.randn(5, 12)
+        for dtype, decimal in [(np.float64, 6), (np.float32, 4)]:
+            p = plan(12, dtype)
+            y = p.forward(x)
+            self.failUnless(y.dtype == dtype)
+            assert_array_almost_equal(y, rfft(x), decimal)
+            assert_array_almost_equal(p.backward(y), x, decimal)
+            self.failUnlessRaises(TypeError, p.forward, x + 1j)
+
+    def test_single(self):
+        x = np.random.randn(9) + 1j*np.random.randn(9)
+        p = plan(9, np.complex64)
+        y = p.forward(x)
+        self.failUnless(y.dtype == np.complex64)
+        assert_array_almost_equal(y, fft(x), 4)
+
+    def test_real_input_complex_plan(self):
+        x = np.random.randn(10)
+        assert_array_almost_equal(plan(10).forward(x), fft(x))
+
+    def test_pad_truncate(self):
+        x = np.random.randn(10) + 1j*np.random.randn(10)
+        assert_array_almost_equal(plan(16).forward(x), fft(x, 16))
+        assert_array_almost_equal(plan(6).forward(x), fft(x, 6))
+
+    def test_overwrite(self):
+        x = np.random.randn(8) + 1j*np.random.randn(8)
+        x0 = x.copy()
+        p = plan(8)
+        p.forward(x)
+        assert_array_equal(x, x0)
+        y = p.forward(x, overwrite_x=1)
+        assert_array_almost_equal(y, fft(x0))
+
+    def test_reuse_does_not_touch_cache(self):
+        clear_cache()
+        p = plan(37)
+        for i in range(5):
+            p.forward(np.ones(37, complex))
+        info = cache_info()['zfft']
+        self.failUnless(info['hits'] == 0 and info['misses'] == 0)
+
+    def test_n_jobs(self):
+        x = np.random.randn(6, 20)
+        for dtype in [np.complex128, np.float64]:
+            for axis in [0, 1]:
+                p = plan(x.shape[axis], dtype, axis)
+                assert_array_almost_equal(p.forward(x, n_jobs=3),
+                                          p.forward(x))
+                assert_array_almost_equal(p.backward(x, n_jobs=3),
+                                          p.backward(x))
+
+    def test_shared_between_threads(self):
+        import threading
+        p = plan(1024)
+        xs = [np.random.randn(64, 1024) + 1j*np.random.randn(64, 1024)
+              for i in range(4)]
+        results = [[] for x in xs]
+        def run(x, out):
+            for i in range(20):
+                out.append(p.forward(x))
+        threads = [threading.Thread(target=run, args=args)
+                   for args in zip(xs, results)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for x, out in zip(xs, results):
+            self.failUnless(len(out) == 20)
+            for y in out:
+                assert_array_almost_equal(y, fft(x))
+
+    def test_invalid(self):
+        self.failUnlessRaises(ValueError, plan, 0)
+        self.failUnlessRaises(ValueError, plan, 8, np.int32)
+        self.failUnless(isinstance(plan(8), Plan))
+
+class TestCache(TestCase):
+
+    def tearDown(self):
+        set_cache_size(10)
+        clear_cache()
+
+    def test_stats(self):
+        clear_cache()
+        info = cache_info()
+        self.failUnless(info['zfft']['items'] == 0)
+        x = np.ones(17, complex)
+        fft(x)
+        fft(x)
+        ifft(x)
+        info = cache_info()['zfft']
+        self.failUnless(info['misses'] == 1)
+        self.failUnless(info['hits'] == 2)
+        self.failUnless(info['items'] == 1)
+        self.failUnless(info['size'] == 10)
+
+    def test_lru(self):
+        clear_cache()
+        set_cache_size(3)
+        for n in [5, 6, 7]:
+            fft(np.ones(n, complex))
+        # 5 is used again, so 6 is the least recently used
+        fft(np.ones(5, complex))
+        fft(np.ones(8, complex))
+        info = cache_info()['zfft']
+        self.failUnless(info['evictions'] == 1)
+        self.failUnless(info['items'] == 3)
+        fft(np.ones(5, complex))
+        self.failUnless(cache_info()['zfft']['misses'] == 4)
+        fft(np.ones(6, complex))
+        self.failUnless(cache_info()['zfft']['misses'] == 5)
+
+    def test_resize(self):
+        for n in range(1, 15):
+            x = np.random.randn(n)
+            assert_array_almost_equal(irfft(rfft(x)), x)
+        self.failUnless(cache_info()['drfft']['items'] == 10)
+        set_cache_size(4)
+        self.failUnless(cache_info()['drfft']['items'] == 4)
+        set_cache_size(40)
+        for n in range(1, 30):
+            x = np.random.randn(n) + 1j*np.random.randn(n)
+            assert_array_almost_equal(ifft(fft(x)), x)
+        self.failUnless(cache_info()['zfft']['items'] >= 29)
+        self.failUnlessRaises(ValueError, set_cache_size, 0)
+
+if __name__ == "__main__":
+    run_module_suite()
@@ -5,7 +5,8 @@ import numpy as np
 from numpy.fft import fft as numfft
 from numpy.testing import assert_array_almost_equal, TestCase
 
-from scipy.fftpack.realtransforms import dct, idct
+from scipy.fftpack.realtransforms import dct, idct, dst, idst
+from scipy.fftpack import cache_info, clear_cache
 
 # Matlab reference data
 MDATA = np.load(join(dirname(__file__), 'test.npz'))
@@ -183,6 +184,138 @@ class TestIDCTIIIFloat(_TestIDCTBase):
         self.rdt = np.float32
         self.dec = 5
         self.type = 3
+def direct_dst(x, type):
+    """DST of the given type along the last axis, from its definition."""
+    x = np.asarray(x, dtype=np.double)
+    n = x.shape[-1]
+    k = np.arange(n)[:,np.newaxis]
+    j = np.arange(n)[np.newaxis,:]
+    if type == 1:
+        m = 2 * np.sin(np.pi * (j+1) * (k+1) / (n+1.))
+    elif type == 2:
+        m = 2 * np.sin(np.pi * (2*j+1) * (k+1) / (2.*n))
+    else:
+        m = 2 * np.sin(np.pi * (2*k+1) * (j+1) / (2.*n))
+        m[:,-1] /= 2
+    return np.dot(x, m.T)
+
+class _TestDSTBase(TestCase):
+    def setUp(self):
+        self.rdt = None
+        self.dec = 14
+        self.type = None
+
+    def test_definition(self):
+        for i in [1, 2, 3, 7, 8, 15, 16, 31, 64]:
+            x = np.random.randn(i).astype(self.rdt)
+            y = dst(x, type=self.type)
+            self.failUnless(y.dtype == self.rdt,
+                    "Output dtype is %s, expected %s" % (y.dtype, self.rdt))
+            yr = direct_dst(x, self.type)
+            assert_array_almost_equal(y / np.max(abs(yr)), yr / np.max(abs(yr)),
+                    decimal=self.dec, err_msg="Size %d failed" % i)
+
+    def test_axis(self):
+        nt = 2
+        for i in [7, 8, 9, 16, 32, 64]:
+            x = np.random.randn(nt, i)
+            y = dst(x, type=self.type)
+            for j in range(nt):
+                assert_array_almost_equal(y[j], dst(x[j], type=self.type),
+                        decimal=self.dec)
+
+            x = x.T
+            y = dst(x, axis=0, type=self.type)
+            for j in range(nt):
+                assert_array_almost_equal(y[:,j], dst(x[:,j], type=self.type),
+                        decimal=self.dec)
+
+    def test_inverse(self):
+        for i in [1, 5, 8, 17]:
+            x = np.random.randn(3, i).astype(self.rdt)
+            y = idst(dst(x, type=self.type), type=self.type)
+            if self.type == 1:
+                y /= 2 * (i+1)
+            else:
+                y /= 2 * i
+            assert_array_almost_equal(y, x, decimal=self.dec)
+            y = idst(dst(x, type=self.type, norm='ortho'), type=self.type,
+                     norm='ortho')
+            self.failUnless(y.dtype == self.rdt)
+            assert_array_almost_equal(y, x, decimal=self.dec)
+
+    def test_ortho(self):
+        """The orthonormal DST preserves the norm of its input."""
+        x = np.random.randn(10, 12).astype(self.rdt)
+        y = dst(x, type=self.type, norm='ortho')
+        assert_array_almost_equal(np.sum(y**2, axis=-1) / 12,
+                                  np.sum(x**2, axis=-1) / 12,
+                                  decimal=self.dec)
+
+    def test_pad_truncate(self):
+        x = np.random.randn(10).astype(self.rdt)
+        assert_array_almost_equal(dst(x, type=self.type, n=6),
+                                  dst(x[:6], type=self.type), decimal=self.dec)
+        xp = np.zeros(14, dtype=self.rdt)
+        xp[:10] = x
+        assert_array_almost_equal(dst(x, type=self.type, n=14),
+                                  dst(xp, type=self.type), decimal=self.dec)
+
+class TestDSTIDouble(_TestDSTBase):
+    def setUp(self):
+        self.rdt = np.double
+        self.dec = 10
+        self.type = 1
+
+class TestDSTIFloat(_TestDSTBase):
+    def setUp(self):
+        self.rdt = np.float32
+        self.dec = 5
+        self.type = 1
+
+class TestDSTIIDouble(_TestDSTBase):
+    def setUp(self):
+        self.rdt = np.double
+        self.dec = 10
+        self.type = 2
+
+class TestDSTIIFloat(_TestDSTBase):
+    def setUp(self):
+        self.rdt = np.float32
+        self.dec = 5
+        self.type = 2
+
+class TestDSTIIIDouble(_TestDSTBase):
+    def setUp(self):
+        self.rdt = np.double
+        self.dec = 10
+        self.type = 3
+
+class TestDSTIIIFloat(_TestDSTBase):
+    def setUp(self):
+        self.rdt = np.float32
+        self.dec = 5
+        self.type = 3
+
+class TestDSTMisc(TestCase):
+    def test_cache(self):
+        clear_cache()
+        x = np.random.randn(4, 20)
+        dst(x, type=2)
+        dst(x, type=3)
+        dst(x.astype(np.float32), type=1)
+        info = cache_info()
+        self.failUnless(info['ddst2']['misses'] == 1)
+        self.failUnless(info['ddst2']['hits'] == 1)
+        self.failUnless(info['dst1']['items'] == 1)
+
+    def test_invalid(self):
+        x = np.random.randn(8)
+        self.failUnlessRaises(ValueError, dst, x, type=4)
+        self.failUnlessRaises(ValueError, idst, x, type=4)
+        self.failUnlessRaises(ValueError, dst, x, norm='foo')
+        self.failUnlessRaises(ValueError, dst, np.arange(8))
+        self.failUnlessRaises(TypeError, dst, x + 1j)
 
 if __name__ == "__main__":
     np.testing.run_module_suite()
@@ -14,6 +14,9 @@ Data input and output
      mminfo   -- query matrix info from Matrix Market formatted file
      mmread   -- read matrix from Matrix Market formatted file
      mmwrite  -- write matrix to Matrix Market formatted file
+     spinfo   -- query sparse matrix info from a binary sparse matrix file
+     spload   -- load, or memory-map, a binary sparse matrix file
+     spsave   -- write a sparse matrix to a binary sparse matrix file
      wavfile  -- module to read / write wav files using numpy arrays
      arrf     -- read files in Arff format
 
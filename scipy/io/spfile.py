@@ -0,0 +1,231 @@
+"""
+  Binary sparse matrix files that can be memory-mapped.
+
+  A file holds one CSR, CSC, COO or BSR matrix as a fixed size header
+  followed by the raw index and data arrays of the matrix, each aligned
+  to 64 bytes.  The loader maps the arrays with numpy.memmap instead of
+  reading them, so the pages of one file on disk are shared by all the
+  processes that load it.
+
+  Header layout (128 bytes, little-endian):
+
+    magic          - 8 bytes, '\\x93SPMAT' followed by the major and
+                     minor version numbers (1, 0)
+    format         - 4 bytes, 'csr ', 'csc ', 'coo ' or 'bsr '
+    dtype          - 8 bytes, numpy dtype string of the data array,
+                     padded with spaces
+    index dtype    - 8 bytes, numpy dtype string of the index arrays,
+                     padded with spaces
+    rows, cols     - int64, shape of the matrix
+    R, C           - int64, blocksize, (1, 1) except for BSR
+    arrays         - three (offset, count) pairs of int64, the byte
+                     offset and number of items of the index pointer,
+                     indices and data arrays for CSR, CSC and BSR, or of
+                     the row, col and data arrays for COO
+"""
+
+import struct
+
+import numpy as np
+
+__all__ = ['spinfo', 'spload', 'spsave']
+
+
+MAGIC       = '\x93SPMAT\x01\x00'
+HEADER      = struct.Struct('<8s4s8s8s4q6q20x')
+ALIGNMENT   = 64
+FORMATS     = ('csr', 'csc', 'coo', 'bsr')
+MMAP_MODES  = (None, 'r', 'r+', 'c')
+
+
+#-------------------------------------------------------------------------------
+def spinfo(source):
+    """ Queries the header of the sparse matrix file 'source'.
+
+    Inputs:
+
+      source     - filename or open file object
+
+    Outputs:
+
+      rows,cols  - number of matrix rows and columns
+      entries    - number of stored values
+      format     - 'csr' | 'csc' | 'coo' | 'bsr'
+      dtype      - data type of the values
+    """
+    header = _read_header(source)
+    (format, dtype, index_dtype, shape, blocksize, arrays) = header
+    return shape + (arrays[2][1], format, dtype)
+
+#-------------------------------------------------------------------------------
+def spload(source, mmap_mode='r'):
+    """ Loads the sparse matrix from the file 'source'.
+
+    Inputs:
+
+      source    - filename or open file object
+      mmap_mode - 'r' | 'r+' | 'c' | None
+                  The index and data arrays of the matrix are memory-mapped
+                  read-only ('r'), read-write ('r+') or copy-on-write ('c')
+                  with numpy.memmap, or read into memory (None).
+
+    Outputs:
+
+      a         - csr_matrix, csc_matrix, coo_matrix or bsr_matrix
+
+    Notes:
+
+      With mmap_mode='r' the matrix does not copy the arrays into memory,
+      so a large matrix loads at once and the processes that load the same
+      file share its pages.  Operations that modify the arrays in place,
+      such as sort_indices() on a matrix with unsorted indices, fail on a
+      read-only matrix.
+    """
+    if mmap_mode not in MMAP_MODES:
+        raise ValueError('mmap_mode must be one of %s' % (MMAP_MODES,))
+
+    if mmap_mode == 'r+':
+        mode = 'r+b'
+    else:
+        mode = 'rb'
+
+    stream, close_it = _open(source, mode)
+    try:
+        header = _read_header(stream)
+        (format, dtype, index_dtype, shape, blocksize, arrays) = header
+
+        dtypes = [index_dtype, index_dtype, dtype]
+        if format == 'bsr':
+            R,C = blocksize
+            shapes = [(n,) for (offset,n) in arrays[:2]] + \
+                     [(arrays[2][1] // (R*C), R, C)]
+        else:
+            shapes = [(n,) for (offset,n) in arrays]
+
+        loaded = []
+        for (offset,n),t,s in zip(arrays, dtypes, shapes):
+            if n == 0:
+                loaded.append(np.zeros(s, dtype=t))
+            elif mmap_mode is None:
+                stream.seek(offset)
+                loaded.append(np.fromfile(stream, dtype=t, count=n).reshape(s))
+            else:
+                loaded.append(np.memmap(stream, dtype=t, mode=mmap_mode,
+                                        offset=offset, shape=s))
+    finally:
+        if close_it: stream.close()
+
+    from scipy.sparse import csr_matrix, csc_matrix, coo_matrix, bsr_matrix
+
+    if format == 'coo':
+        row, col, data = loaded
+        return coo_matrix((data, (row, col)), shape=shape)
+    else:
+        indptr, indices, data = loaded
+        cls = {'csr' : csr_matrix, 'csc' : csc_matrix, 'bsr' : bsr_matrix}[format]
+        return cls((data, indices, indptr), shape=shape)
+
+#-------------------------------------------------------------------------------
+def spsave(target, a):
+    """ Writes the sparse matrix A to a binary file that spload can
+    memory-map.
+
+    Inputs:
+
+      target    - filename or open file object
+      a         - sparse matrix; CSR, CSC, COO and BSR matrices are stored
+                  in their own format and other formats as CSR
+    """
+    from scipy.sparse import isspmatrix
+
+    if not isspmatrix(a):
+        raise TypeError('expected a sparse matrix')
+
+    if a.format not in FORMATS:
+        a = a.tocsr()
+
+    if a.format == 'coo':
+        arrays = [a.row, a.col, a.data]
+        blocksize = (1,1)
+    else:
+        nnz = a.indptr[-1]
+        arrays = [a.indptr, a.indices[:nnz], a.data[:nnz]]
+        if a.format == 'bsr':
+            blocksize = a.blocksize
+        else:
+            blocksize = (1,1)
+
+    arrays = [np.ascontiguousarray(x) for x in arrays]
+    if arrays[0].dtype != arrays[1].dtype:
+        raise ValueError('index arrays have different types')
+
+    dtype = arrays[2].dtype
+    if dtype.kind not in 'biufc':
+        raise TypeError('unsupported data type %s' % dtype)
+
+    # each array starts at the next aligned offset
+    offsets = []
+    offset = HEADER.size
+    for x in arrays:
+        offset = -(-offset // ALIGNMENT) * ALIGNMENT
+        offsets.append((offset, x.size))
+        offset += x.nbytes
+
+    fields = [MAGIC, a.format.ljust(4), dtype.str.ljust(8),
+              arrays[0].dtype.str.ljust(8)]
+    fields += list(a.shape) + list(blocksize)
+    for offset,n in offsets:
+        fields += [offset, n]
+
+    stream, close_it = _open(target, 'wb')
+    try:
+        stream.write(HEADER.pack(*fields))
+        position = HEADER.size
+        for x,(offset,n) in zip(arrays, offsets):
+            stream.write('\0' * (offset - position))
+            x.tofile(stream)
+            position = offset + x.nbytes
+    finally:
+        if close_it: stream.close()
+
+#-------------------------------------------------------------------------------
+def _open(filespec, mode):
+    """
+    Return an open file stream for filespec.  If filespec is a file name,
+    open it.  Otherwise, just return filespec.
+    """
+    if isinstance(filespec, basestring):
+        return open(filespec, mode), True
+    else:
+        return filespec, False
+
+def _read_header(source):
+    """
+    Return the format, dtype, index dtype, shape, blocksize and array
+    (offset, count) pairs from the header of the file source.
+    """
+    stream, close_it = _open(source, 'rb')
+    try:
+        stream.seek(0)
+        header = stream.read(HEADER.size)
+    finally:
+        if close_it: stream.close()
+
+    if len(header) != HEADER.size or header[:6] != MAGIC[:6]:
+        raise ValueError('not a sparse matrix file')
+    if header[:8] != MAGIC:
+        raise ValueError('unsupported sparse matrix file version %d.%d' % \
+                         (ord(header[6]), ord(header[7])))
+
+    fields = HEADER.unpack(header)
+    format      = fields[1].strip()
+    dtype       = np.dtype(fields[2].strip())
+    index_dtype = np.dtype(fields[3].strip())
+    shape       = tuple([int(x) for x in fields[4:6]])
+    blocksize   = tuple([int(x) for x in fields[6:8]])
+    arrays      = [(int(fields[k]), int(fields[k+1])) for k in (8, 10, 12)]
+
+    if format not in FORMATS:
+        raise ValueError('unknown sparse matrix format %r' % format)
+
+    return (format, dtype, index_dtype, shape, blocksize, arrays)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+
+import os
+from tempfile import mktemp
+
+import numpy as np
+from numpy import array
+from numpy.testing import *
+
+import scipy.sparse
+from scipy.sparse import csr_matrix, csc_matrix, coo_matrix, bsr_matrix, \
+        lil_matrix
+from scipy.io.spfile import spinfo, spload, spsave
+
+class TestSparseFile(TestCase):
+    def setUp(self):
+        self.fn = mktemp()
+        self.A = array([[1, 0, 0, 2, 0, 0],
+                        [0, 0, 0, 0, 0, 0],
+                        [0, 3, 4, 0, 0, 5],
+                        [6, 0, 0, 0, 7, 0]], dtype=np.float64)
+
+    def tearDown(self):
+        if os.path.exists(self.fn):
+            os.remove(self.fn)
+
+    def check(self, b, format, mmap_mode='r'):
+        spsave(self.fn, b)
+        c = spload(self.fn, mmap_mode=mmap_mode)
+        assert_equal(c.format, format)
+        assert_equal(c.shape, b.shape)
+        assert_equal(c.dtype, b.dtype)
+        assert_array_equal(c.todense(), b.todense())
+        return c
+
+    def test_formats(self):
+        for cls in [csr_matrix, csc_matrix, coo_matrix]:
+            b = cls(self.A)
+            c = self.check(b, b.format)
+            assert_equal(spinfo(self.fn), (4, 6, 7, b.format, np.float64))
+
+        b = bsr_matrix(self.A, blocksize=(2,3))
+        c = self.check(b, 'bsr')
+        assert_equal(c.blocksize, (2,3))
+        assert_equal(spinfo(self.fn), (4, 6, b.data.size, 'bsr', np.float64))
+
+        # other formats are stored as CSR
+        self.check(lil_matrix(self.A), 'csr')
+
+    def test_dtypes(self):
+        for t in [np.int8, np.uint16, np.int32, np.int64, np.float32,
+                  np.complex64, np.complex128, np.bool_]:
+            b = csr_matrix(self.A.astype(t))
+            self.check(b, 'csr')
+        b = csr_matrix(self.A * (1 + 2j))
+        assert_array_equal(self.check(b, 'csr').data, b.data)
+
+    def test_mmap_modes(self):
+        b = csr_matrix(self.A)
+
+        c = self.check(b, 'csr', mmap_mode='r')
+        assert(not c.data.flags.writeable)
+        c = None
+
+        c = self.check(b, 'csr', mmap_mode='c')
+        c.data[:] = 0
+        assert_array_equal(spload(self.fn).todense(), self.A)
+        c = None
+
+        c = self.check(b, 'csr', mmap_mode='r+')
+        c.data *= 2
+        c = None
+        assert_array_equal(spload(self.fn).todense(), 2 * self.A)
+
+        c = self.check(b, 'csr', mmap_mode=None)
+        c.data[:] = 0
+        assert_array_equal(spload(self.fn).todense(), self.A)
+
+        assert_raises(ValueError, spload, self.fn, 'w+')
+
+    def test_products(self):
+        b = csr_matrix(self.A)
+        spsave(self.fn, b)
+        c = spload(self.fn)
+        x = np.arange(6, dtype=np.float64)
+        assert_array_equal(c * x, b * x)
+        assert_array_equal((c * c.T).todense(), (b * b.T).todense())
+
+    def test_empty(self):
+        for cls in [csr_matrix, coo_matrix]:
+            b = cls((3,4))
+            c = self.check(b, b.format)
+            assert_equal(c.nnz, 0)
+
+    def test_alignment(self):
+        spsave(self.fn, csr_matrix(self.A))
+        c = spload(self.fn)
+        for x in [c.indptr, c.indices, c.data]:
+            assert_equal(x.ctypes.data % 64, 0)
+
+    def test_file_objects(self):
+        b = csc_matrix(self.A)
+        f = open(self.fn, 'wb')
+        spsave(f, b)
+        f.close()
+        f = open(self.fn, 'rb')
+        c = spload(f)
+        f.close()
+        assert_array_equal(c.todense(), self.A)
+
+    def test_bad_input(self):
+        assert_raises(TypeError, spsave, self.fn, self.A)
+        f = open(self.fn, 'wb')
+        f.write('not a sparse matrix file' * 10)
+        f.close()
+        assert_raises(ValueError, spload, self.fn)
+        assert_raises(ValueError, spinfo, self.fn)
+
+
+if __name__ == "__main__":
+    run_module_suite()
@@ -0,0 +1,79 @@
+"""
+Thread helpers for the n_jobs arguments - _threads.py
+
+The compiled kernels called through these helpers release the GIL, so
+the calls spread over several threads run in parallel.
+"""
+
+__all__ = ['cpu_count', 'check_n_jobs', 'map_threads', 'run_threads']
+
+def cpu_count():
+    """ Number of processors, or 1 if it cannot be determined."""
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except (ImportError, NotImplementedError):
+        return 1
+
+def check_n_jobs(n_jobs):
+    """ Validate a number of threads n_jobs, where -1 means one thread
+    per processor, and return it."""
+    n_jobs = int(n_jobs)
+    if n_jobs == -1:
+        n_jobs = cpu_count()
+    if n_jobs < 1:
+        raise ValueError('n_jobs must be a positive integer or -1 (got %d).'
+                         % n_jobs)
+    return n_jobs
+
+def map_threads(func, args_list, n_jobs):
+    """ Return [func(*args) for args in args_list], spreading the calls
+    over n_jobs threads.
+
+    The calls are handed out in order to the threads as they finish
+    their previous call. The first exception raised by a call stops
+    the remaining calls and is raised again in the calling thread.
+    """
+    args_list = list(args_list)
+    results = [None] * len(args_list)
+    if n_jobs == 1 or len(args_list) <= 1:
+        for i, args in enumerate(args_list):
+            results[i] = func(*args)
+        return results
+    import sys
+    import threading
+    todo = range(len(args_list))
+    todo.reverse()
+    lock = threading.Lock()
+    errors = []
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                if not todo or errors:
+                    return
+                i = todo.pop()
+            finally:
+                lock.release()
+            try:
+                results[i] = func(*args_list[i])
+            except:
+                lock.acquire()
+                errors.append(sys.exc_info())
+                lock.release()
+                return
+    threads = [threading.Thread(target=worker)
+               for j in range(min(n_jobs, len(args_list)))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        t, v, tb = errors[0]
+        raise t, v, tb
+    return results
+
+def run_threads(func, blocks, n_jobs):
+    """ Call func(*args) for each args in blocks, spread over n_jobs
+    threads, discarding the results."""
+    map_threads(func, blocks, n_jobs)
@@ -202,6 +202,94 @@ def zpk2tf(z,p,k):
     a = poly(p)
     return b, a
 
+def _pair_roots(r):
+    """Split the roots r into pairs: complex conjugate pairs, and real
+    roots paired in order of their magnitude. An odd real root is paired
+    with a root at the origin.
+
+    Roots whose imaginary part is within rounding error of zero, such as
+    the real pole -1+6e-17j of an odd order prototype, count as real.
+    Complex roots without a conjugate raise a ValueError."""
+    r = atleast_1d(r)
+    eps = numpy.finfo(float).eps
+    isreal = abs(r.imag) <= 100 * eps * abs(r)
+    real_ = numpy.sort(r[isreal].real)
+    real_ = real_[numpy.argsort(abs(real_))]
+    if len(real_) % 2:
+        real_ = numpy.concatenate([real_, [0.]])
+    upper = list(r[~isreal & (r.imag > 0)])
+    lower = list(r[~isreal & (r.imag < 0)])
+    if len(upper) != len(lower):
+        raise ValueError("complex roots must come in conjugate pairs")
+    pairs = []
+    for c in upper:
+        dist = [abs(c - d.conjugate()) for d in lower]
+        k = int(numpy.argmin(dist))
+        if dist[k] > numpy.sqrt(eps) * abs(c):
+            raise ValueError("complex root %s has no conjugate" % c)
+        lower.pop(k)
+        pairs.append((c, c.conjugate()))
+    pairs += [(real_[i], real_[i+1]) for i in range(0, len(real_), 2)]
+    return pairs
+
+def zpk2sos(z, p, k):
+    """Return second-order sections from zeros, poles and gain of a
+    system.
+
+    Parameters
+    ----------
+    z : ndarray
+        zeros of the transfer function; complex zeros must come in
+        conjugate pairs.
+    p : ndarray
+        poles of the transfer function, likewise.
+    k : float
+        system gain.
+
+    Returns
+    -------
+    sos : ndarray
+        Array of shape (n_sections, 6) for sosfilt, whose rows are the
+        coefficients [b0, b1, b2, a0, a1, a2] of second-order sections
+        with n_sections = ceil(max(len(z), len(p))/2).
+
+    Notes
+    -----
+    The poles closest to the unit circle are put in the last section, and
+    each pair of poles is grouped with the nearest remaining pair of
+    zeros, which keeps the gains of the intermediate sections small.
+    The gain k is applied to the first section.
+    """
+    z = atleast_1d(z)
+    p = atleast_1d(p)
+    if len(z) == 0 and len(p) == 0:
+        return numpy.array([[k, 0., 0., 1., 0., 0.]])
+    zpairs = _pair_roots(z)
+    ppairs = _pair_roots(p)
+    n_sections = max(len(zpairs), len(ppairs))
+    zpairs += [(0., 0.)] * (n_sections - len(zpairs))
+    ppairs += [(0., 0.)] * (n_sections - len(ppairs))
+    # from the poles nearest the unit circle to the ones furthest from it
+    ppairs.sort(key=lambda pair: -max(abs(pair[0]), abs(pair[1])))
+    sos = zeros((n_sections, 6))
+    for i, ppair in enumerate(ppairs):
+        dist = [min(abs(zpair[0] - ppair[0]), abs(zpair[1] - ppair[0]))
+                for zpair in zpairs]
+        zpair = zpairs.pop(int(numpy.argmin(dist)))
+        j = n_sections - 1 - i
+        sos[j,:3] = real(poly(zpair))
+        sos[j,3:] = real(poly(ppair))
+    sos[0,:3] *= k
+    return sos
+
+def tf2sos(b, a):
+    """Return second-order sections from the numerator and denominator
+    polynomials of a system.
+
+    The roots of b and a are grouped into sections as by zpk2sos.
+    """
+    return zpk2sos(*tf2zpk(b, a))
+
 def normalize(b,a):
     """Normalize polynomial representation of a transfer function.
 
@@ -372,6 +460,48 @@ def bilinear(b,a,fs=1.0):
 
     return normalize(bprime, aprime)
 
+def _zpk_bandtype(z, p, k, btype, wo, bw):
+    """Transform the zeros, poles and gain of an analog lowpass prototype
+    to a lowpass, highpass, bandpass or bandstop filter, as lp2lp, lp2hp,
+    lp2bp and lp2bs do for polynomials."""
+    z = atleast_1d(z).astype(complex)
+    p = atleast_1d(p).astype(complex)
+    degree = len(p) - len(z)
+    if btype == 'lowpass':
+        return z * wo, p * wo, k * wo**degree
+    if btype == 'highpass':
+        k = k * real(numpy.prod(-z) / numpy.prod(-p))
+        z = numpy.concatenate([wo / z, zeros(degree)])
+        return z, wo / p, k
+    if btype == 'bandpass':
+        z = z * bw / 2
+        p = p * bw / 2
+        z = numpy.concatenate([z + sqrt(z**2 - wo**2 + 0j),
+                               z - sqrt(z**2 - wo**2 + 0j), zeros(degree)])
+        p = numpy.concatenate([p + sqrt(p**2 - wo**2 + 0j),
+                               p - sqrt(p**2 - wo**2 + 0j)])
+        return z, p, k * bw**degree
+    # bandstop
+    k = k * real(numpy.prod(-z) / numpy.prod(-p))
+    z = (bw / 2) / z
+    p = (bw / 2) / p
+    z = numpy.concatenate([z + sqrt(z**2 - wo**2 + 0j),
+                           z - sqrt(z**2 - wo**2 + 0j),
+                           1j * wo * numpy.ones(degree),
+                           -1j * wo * numpy.ones(degree)])
+    p = numpy.concatenate([p + sqrt(p**2 - wo**2 + 0j),
+                           p - sqrt(p**2 - wo**2 + 0j)])
+    return z, p, k
+
+def _zpk_bilinear(z, p, k, fs):
+    """Bilinear transform of zeros, poles and gain, as bilinear does for
+    polynomials."""
+    fs2 = 2.0 * fs
+    degree = len(p) - len(z)
+    k = k * real(numpy.prod(fs2 - z) / numpy.prod(fs2 - p))
+    z = numpy.concatenate([(fs2 + z) / (fs2 - z), -numpy.ones(degree)])
+    return z, (fs2 + p) / (fs2 - p), k
+
 def iirdesign(wp, ws, gpass, gstop, analog=0, ftype='ellip', output='ba'):
     """Complete IIR digital and analog filter design.
 
@@ -397,7 +527,8 @@ def iirdesign(wp, ws, gpass, gstop, analog=0, ftype='ellip', output='ba'):
                Chebyshev I : 'cheby1',
                Chebyshev II: 'cheby2',
                Bessel :      'bessel'
-    output -- Type of output:  numerator/denominator ('ba') or pole-zero ('zpk')
+    output -- Type of output:  numerator/denominator ('ba'), pole-zero ('zpk')
+              or second-order sections ('sos')
 
     Returns
     -------
@@ -442,7 +573,8 @@ def iirfilter(N, Wn, rp=None, rs=None, btype='band', analog=0, ftype='butter', o
               a digital filter is returned.
     ftype -- the type of IIR filter (Butterworth, Cauer (Elliptic),
              Bessel, Chebyshev1, Chebyshev2)
-    output -- 'ba' for (b,a) output, 'zpk' for (z,p,k) output.
+    output -- 'ba' for (b,a) output, 'zpk' for (z,p,k) output, 'sos' for
+              second-order sections (digital filters only, see sosfilt).
 
     SEE ALSO butterord, cheb1ord, cheb2ord, ellipord
     """
@@ -459,8 +591,10 @@ def iirfilter(N, Wn, rp=None, rs=None, btype='band', analog=0, ftype='butter', o
     except KeyError:
         raise ValueError, "%s is not a valid basic iir filter." % ftype
 
-    if output not in ['ba', 'zpk']:
+    if output not in ['ba', 'zpk', 'sos']:
         raise ValueError, "%s is not a valid output form." % output
+    if output == 'sos' and analog:
+        raise ValueError, "second-order sections are for digital filters."
 
     #pre-warp frequencies for digital filter design
     if not analog:
@@ -472,6 +606,7 @@ def iirfilter(N, Wn, rp=None, rs=None, btype='band', analog=0, ftype='butter', o
     # convert to low-pass prototype
     if btype in ['lowpass', 'highpass']:
         wo = warped
+        bw = None
     else:
         bw = warped[1] - warped[0]
         wo = sqrt(warped[0]*warped[1])
@@ -492,6 +627,12 @@ def iirfilter(N, Wn, rp=None, rs=None, btype='band', analog=0, ftype='butter', o
             raise ValueError, "Both rp and rs must be provided to design an elliptic filter."
         z, p, k = typefunc(N, rp, rs)
 
+    if output == 'sos':
+        # stay with the roots, as the polynomials of high order filters
+        # are too badly conditioned to recover them accurately
+        z, p, k = _zpk_bandtype(z, p, k, btype, wo, bw)
+        return zpk2sos(*_zpk_bilinear(z, p, k, fs))
+
     b, a = zpk2tf(z,p,k)
 
     # transform to lowpass, bandpass, highpass, or bandstop
@@ -512,6 +653,8 @@ def iirfilter(N, Wn, rp=None, rs=None, btype='band', analog=0, ftype='butter', o
     # Transform to proper out type (pole-zero, state-space, numer-denom)
     if output == 'zpk':
         return tf2zpk(b,a)
+    elif output == 'sos':
+        return tf2sos(b,a)
     else:
         return b,a
 
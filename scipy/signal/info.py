@@ -7,6 +7,8 @@ Signal Processing Tools
     convolve      --  N-dimensional convolution.
     correlate     --  N-dimensional correlation.
     fftconvolve   --  N-dimensional convolution using the FFT.
+    oaconvolve    --  Convolution with a 1-D kernel by overlap-add.
+    OAConvolver   --  Overlap-add convolution of a stream of chunks.
     convolve2d    --  2-dimensional convolution (more options).
     correlate2d   --  2-dimensional correlation (more options).
     sepfir2d      --  Convolve with a 2-D separable FIR filter.
@@ -31,6 +33,8 @@ Signal Processing Tools
     symiirorder1  --  2nd-order IIR filter (cascade of first-order systems).
     symiirorder2  --  4th-order IIR filter (cascade of second-order systems).
     lfilter       --  1-dimensional FIR and IIR digital linear filtering.
+    sosfilt       --  1-dimensional IIR filtering with second-order sections.
+    StreamFilter  --  Filtering of a stream of chunks, keeping the state.
 
     deconvolve    --  1-d deconvolution using lfilter.
 
@@ -49,6 +53,9 @@ Signal Processing Tools
     freqs         -- Analog filter frequency response.
     freqz         -- Digital filter frequency response.
 
+    zpk2sos       -- Second-order sections from zeros, poles and gain.
+    tf2sos        -- Second-order sections from numerator and denominator.
+
     unique_roots  -- Unique roots and their multiplicities.
     residue       -- Partial fraction expansion of b(s) / a(s).
     residuez      -- Partial fraction expansion of b(z) / a(z).
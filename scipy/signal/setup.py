@@ -10,6 +10,7 @@ def configuration(parent_package='',top_path=None):
     config.add_extension('sigtools',
                          sources=['sigtoolsmodule.c',
                                   'firfilter.c','medianfilter.c', 'lfilter.c.src',
+                                  'sosfilt.c.src', 'rankfilter.c.src',
                                   'correlate_nd.c.src'],
                          depends = ['sigtools.h'],
                          include_dirs=['.']
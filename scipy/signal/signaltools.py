@@ -7,7 +7,7 @@ import warnings
 import sigtools
 from scipy import special, linalg
 from scipy.fftpack import fft, ifft, ifftshift, fft2, ifft2, fftn, \
-     ifftn, fftfreq
+     ifftn, fftfreq, rfftn, irfftn, next_fast_len
 from numpy import polyadd, polymul, polydiv, polysub, \
      roots, poly, polyval, polyder, cast, asarray, isscalar, atleast_1d, \
      ones, sin, linspace, real, extract, real_if_close, zeros, array, arange, \
@@ -177,6 +177,234 @@ def fftconvolve(in1, in2, mode="full"):
         return _centered(ret,abs(s2-s1)+1)
 
 
+# Smallest FFT length considered for overlap-add, below which the
+# transforms are too short to be efficient
+_OA_MIN_NFFT = 64
+
+def _oa_nfft(m, n=None):
+    """Return the FFT length minimizing the cost per output sample of
+    overlap-add convolution with a kernel of length m.
+
+    Each block of nfft-m+1 input samples costs an FFT and an inverse FFT
+    of length nfft, i.e. O(nfft*log(nfft)). Only lengths with factors 2, 3
+    and 5 are considered, and no more than needed for a signal of length n
+    in a single block.
+    """
+    nfft = next_fast_len(max(2*m - 1, _OA_MIN_NFFT))
+    if n is None:
+        largest = max(64*m, nfft)
+    else:
+        largest = max(next_fast_len(n + m - 1), nfft)
+    best, best_cost = nfft, None
+    while nfft <= largest:
+        cost = nfft * np.log2(nfft) / (nfft - m + 1)
+        if best_cost is None or cost < best_cost:
+            best, best_cost = nfft, cost
+        nfft = next_fast_len(nfft + 1)
+    return best
+
+class OAConvolver(object):
+    """Streaming convolution with a fixed FIR kernel by overlap-add.
+
+    The input is fed in chunks of any length; each call to process
+    returns as many output samples as it was given input samples, so
+    that concatenating the outputs and the result of flush gives the
+    full convolution of the concatenated chunks with the kernel.
+
+    The chunks are cut into blocks of nfft-len(h)+1 samples which are
+    convolved with h by FFTs of length nfft, and the last len(h)-1
+    samples of each block's convolution are carried over to the next,
+    so the memory used does not depend on the length of the stream.
+
+    Parameters
+    ----------
+    h : array_like
+        The 1-D kernel (impulse response of the FIR filter).
+    axis : int
+        The axis of the chunks along which the signal runs; the other
+        axes hold independent channels and must have the same shape in
+        every chunk (*Default* = -1).
+    nfft : int (optional)
+        FFT length, at least 2*len(h)-1. By default the length with the
+        smallest number of operations per output sample is chosen.
+
+    Examples
+    --------
+    >>> conv = OAConvolver(h)
+    >>> for chunk in stream:
+    ...     out = conv.process(chunk)
+    >>> tail = conv.flush()
+    """
+
+    def __init__(self, h, axis=-1, nfft=None):
+        h = asarray(h)
+        if h.ndim != 1 or len(h) == 0:
+            raise ValueError("h must be a non-empty 1-D array")
+        m = len(h)
+        if nfft is None:
+            nfft = _oa_nfft(m)
+        nfft = int(nfft)
+        if nfft < 2*m - 1:
+            raise ValueError("nfft must be at least 2*len(h)-1 = %d" % (2*m - 1))
+        self.h = h
+        self.axis = axis
+        self.nfft = nfft
+        self.block_size = nfft - m + 1
+        self._spectra = {}
+        self.reset()
+
+    def reset(self):
+        """Forget the samples processed so far and start a new stream."""
+        self._tail = None
+
+    def _spectrum(self, complex_input):
+        """Transform of the kernel, computed once for each kind of input."""
+        try:
+            return self._spectra[complex_input]
+        except KeyError:
+            if complex_input:
+                H = fft(self.h, self.nfft)
+            else:
+                H = rfftn(self.h, (self.nfft,))
+            self._spectra[complex_input] = H
+            return H
+
+    def _convolve(self, x):
+        """Overlap-add x, with the signal along its last axis, onto the
+        tail and return the output samples and the new tail."""
+        m = len(self.h)
+        L = self.block_size
+        c = x.shape[-1]
+        channels = x.shape[:-1]
+        nb = max(-(-c // L), 1)
+        complex_input = iscomplexobj(x) or iscomplexobj(self.h)
+        blocks = zeros(channels + (nb*L,), x.dtype)
+        blocks[..., :c] = x
+        blocks = blocks.reshape(channels + (nb, L))
+        H = self._spectrum(complex_input)
+        if complex_input:
+            Y = ifft(fft(blocks, self.nfft, axis=-1) * H, axis=-1)
+        else:
+            Y = irfftn(rfftn(blocks, (self.nfft,), axes=(-1,)) * H,
+                       (self.nfft,), axes=(-1,))
+        del blocks
+        out = zeros(channels + (nb+1, L), Y.dtype)
+        out[..., :nb, :] = Y[..., :L]
+        out[..., 1:, :m-1] += Y[..., L:L+m-1]
+        del Y
+        out = out.reshape(channels + ((nb+1)*L,))
+        if self._tail is not None:
+            out[..., :m-1] += self._tail
+        return out[..., :c], out[..., c:c+m-1].copy()
+
+    def process(self, x):
+        """Convolve the next chunk of the stream.
+
+        Parameters
+        ----------
+        x : array_like
+            The chunk, with the signal along self.axis.
+
+        Returns
+        -------
+        y : array
+            The output samples for the input samples of x, with the
+            same shape as x.
+        """
+        x = np.swapaxes(asarray(x), self.axis, -1)
+        if self._tail is not None and self._tail.shape[:-1] != x.shape[:-1]:
+            raise ValueError("chunk has %s channels but the stream has %s"
+                             % (x.shape[:-1], self._tail.shape[:-1]))
+        # limit the size of the temporaries for long chunks
+        step = 32 * self.block_size
+        if x.shape[-1] <= step:
+            y, self._tail = self._convolve(x)
+        else:
+            pieces = []
+            for start in range(0, x.shape[-1], step):
+                y, self._tail = self._convolve(x[..., start:start+step])
+                pieces.append(y)
+            y = concatenate(pieces, axis=-1)
+        return np.swapaxes(y, self.axis, -1)
+
+    def flush(self):
+        """Return the last len(h)-1 samples of the convolution, due to the
+        end of the stream, and start a new stream.
+
+        Returns
+        -------
+        y : array
+            The remaining output samples, with the signal along
+            self.axis, or an empty array if nothing was processed.
+        """
+        if self._tail is None:
+            return zeros(0)
+        y = np.swapaxes(self._tail, self.axis, -1)
+        self.reset()
+        return y
+
+def oaconvolve(in1, in2, mode="full", axis=-1, nfft=None):
+    """Convolve an array with a 1-D kernel by overlap-add.
+
+    The signal is convolved block by block with FFTs whose length is
+    chosen for the length of the kernel, rather than with a single FFT of
+    the length of the whole signal as in fftconvolve. This is much faster
+    for long signals and short or moderately long kernels, and the
+    temporary arrays do not grow with the length of the signal.
+
+    Parameters
+    ----------
+    in1 : array_like
+        The signal; it is convolved with in2 along axis, each of the
+        other axes holding independent channels.
+    in2 : array_like
+        The 1-D kernel. If in1 is also 1-D, the longer of the two is
+        treated as the signal.
+    mode : {'full', 'valid', 'same'}
+        As for convolve: 'full' returns the complete convolution,
+        'same' the central part with the length of the signal and
+        'valid' only the samples computed without zero-padding.
+    axis : int
+        The axis of in1 along which to convolve (*Default* = -1).
+    nfft : int (optional)
+        FFT length, see OAConvolver.
+
+    Returns
+    -------
+    out : array
+        The convolution of in1 and in2 along axis.
+
+    See Also
+    --------
+    OAConvolver : the same convolution on a stream of chunks
+    """
+    in1 = asarray(in1)
+    in2 = asarray(in2)
+    if in1.ndim == 1 and in2.ndim == 1 and len(in2) > len(in1):
+        in1, in2 = in2, in1
+    if in1.ndim == 0 or in2.ndim == 0:
+        return in1 * in2
+    if in2.ndim != 1:
+        raise ValueError("in2 must be a 1-D kernel")
+    n = in1.shape[axis]
+    m = len(in2)
+    if nfft is None:
+        nfft = _oa_nfft(m, n)
+    conv = OAConvolver(in2, -1, nfft)
+    x = np.swapaxes(in1, axis, -1)
+    out = concatenate([conv.process(x), conv.flush()], axis=-1)
+    if mode == "full":
+        pass
+    elif mode == "same":
+        start = (m - 1) // 2
+        out = out[..., start:start+n]
+    elif mode == "valid":
+        out = out[..., m-1:n]
+    else:
+        raise ValueError("Acceptable mode flags are 'valid', 'same', or 'full'.")
+    return np.swapaxes(out, axis, -1)
+
+
 def convolve(in1, in2, mode='full', old_behavior=True):
     """Convolve two N-dimensional arrays.
 
@@ -266,8 +494,42 @@ def order_filter(a, domain, rank):
         if (size[k] % 2) != 1:
             raise ValueError, "Each dimension of domain argument " \
                   "should have an odd number of elements."
+    a = asarray(a)
+    if a.ndim == domain.ndim and domain.all():
+        out = _rank_filter(a, size, rank, domain.dtype)
+        if out is not None:
+            return out
     return sigtools._order_filterND(a, domain, rank)
 
+# types handled by sigtools._rank_filter2d
+_rank_filter_types = 'bBhHiIlLqQfdg'
+
+def _rank_filter(a, size, rank, domain_type):
+    """Order filter of a with a domain of ones of the given size.
+
+    Arrays of one and two dimensions are filtered by sliding the window
+    along their rows with sigtools._rank_filter2d, and the result has the
+    type that sigtools._order_filterND would give. None is returned for
+    the other arrays.
+    """
+    dtype = np.find_common_type([a.dtype, domain_type], [])
+    if a.ndim not in (1, 2) or len(size) != a.ndim:
+        return None
+    # selecting the rank-th value commutes with the conversion to dtype,
+    # so 8 and 16 bit integers are filtered with a histogram even when
+    # the result is floating point
+    if a.dtype.char not in _rank_filter_types:
+        if dtype.char not in _rank_filter_types:
+            return None
+        a = a.astype(dtype)
+    size = tuple([int(k) for k in size])
+    rank = int(rank)
+    if a.ndim == 1:
+        out = sigtools._rank_filter2d(a[newaxis, :], (1,) + size, rank)[0]
+    else:
+        out = sigtools._rank_filter2d(a, size, rank)
+    return out.astype(dtype)
+
 
 def medfilt(volume,kernel_size=None):
     """Perform a median filter on an N-dimensional array.
@@ -303,10 +565,13 @@ def medfilt(volume,kernel_size=None):
         if (kernel_size[k] % 2) != 1:
             raise ValueError, "Each element of kernel_size should be odd."
 
-    domain = ones(kernel_size)
-
     numels = product(kernel_size,axis=0)
     order = int(numels/2)
+    out = _rank_filter(volume, kernel_size, order, np.dtype(float))
+    if out is not None:
+        return out
+
+    domain = ones(kernel_size)
     return sigtools._order_filterND(volume,domain,order)
 
 
@@ -482,6 +747,10 @@ def medfilt2d(input, kernel_size=3):
         if (size % 2) != 1:
             raise ValueError, "Each element of kernel_size should be odd."
 
+    if image.ndim == 2 and image.dtype.char in _rank_filter_types:
+        kernel_size = tuple([int(k) for k in kernel_size])
+        return sigtools._rank_filter2d(image, kernel_size,
+                                       product(kernel_size) // 2)
     return sigtools._medfilt2d(image, kernel_size)
 
 def remez(numtaps, bands, desired, weight=None, Hz=1, type='bandpass',
@@ -649,6 +918,196 @@ def lfiltic(b,a,y,x=None):
 
     return zi
 
+def _sos_coefficients(sos):
+    """Check the shape of sos and normalize each section by its a0."""
+    sos = np.atleast_2d(asarray(sos))
+    if sos.ndim != 2 or sos.shape[1] != 6:
+        raise ValueError("sos must have shape (n_sections, 6)")
+    if np.any(sos[:,3] == 0):
+        raise ValueError("a[0] of every section must be non-zero")
+    return sos / sos[:,3:4]
+
+def _move_axis_last(x, axis):
+    """Return x with axis moved last, as a contiguous 2-D array of
+    signals, and the shape of the channels (the other axes)."""
+    x = np.rollaxis(x, axis, x.ndim)
+    channels = x.shape[:-1]
+    return x.reshape((int(np.prod(channels)), x.shape[-1])), channels
+
+def sosfilt(sos, x, axis=-1, zi=None):
+    """
+    Filter data along one dimension using cascaded second-order sections.
+
+    Filter a data sequence, x, with the digital IIR filter whose transfer
+    function is the product of the second-order sections in sos. Unlike
+    the single high-order polynomials used by lfilter, the sections keep
+    the filter numerically stable at high orders.
+
+    Parameters
+    ----------
+    sos : array_like
+        Array of second-order filter coefficients, of shape
+        (n_sections, 6). Each row is [b0, b1, b2, a0, a1, a2], the
+        numerator and denominator of one section (see zpk2sos).
+    x : array_like
+        An N-dimensional input array.
+    axis : int
+        The axis of the input data array along which to apply the
+        filter. The filter is applied to each subarray along this axis
+        (*Default* = -1).
+    zi : array_like (optional)
+        Initial conditions for the delays of the sections, of shape
+        (n_sections, ..., 2), where ... is the shape of x without axis.
+        If zi is None or is not given then initial rest is assumed.
+
+    Returns
+    -------
+    y : array
+        The output of the digital filter.
+    zf : array (optional)
+        If zi is None, this is not returned, otherwise, zf holds the
+        final filter delay values.
+
+    See Also
+    --------
+    lfilter, zpk2sos, StreamFilter
+    """
+    sos = _sos_coefficients(sos)
+    x = asarray(x)
+    if x.ndim == 0:
+        raise ValueError("x must be at least 1-D")
+    axis = range(x.ndim)[axis]
+    n_sections = sos.shape[0]
+    if zi is None:
+        dtype = np.common_type(sos, x)
+    else:
+        zi = asarray(zi)
+        dtype = np.common_type(sos, x, zi)
+    y, channels = _move_axis_last(x, axis)
+    y = np.array(y, dtype=dtype, order='C')
+    if zi is None:
+        z = zeros((y.shape[0], n_sections, 2), dtype)
+    else:
+        if zi.shape != (n_sections,) + channels + (2,):
+            raise ValueError("zi must have shape %s"
+                             % ((n_sections,) + channels + (2,),))
+        z = np.rollaxis(zi, 0, zi.ndim-1).reshape((-1, n_sections, 2))
+        z = np.array(z, dtype=dtype, order='C')
+    sigtools._sosfilt(np.array(sos, dtype=dtype, order='C'), y, z)
+    y = np.rollaxis(y.reshape(channels + (y.shape[-1],)), x.ndim-1, axis)
+    if zi is None:
+        return y
+    zf = np.rollaxis(z.reshape(channels + (n_sections, 2)), x.ndim-1, 0)
+    return y, zf
+
+class StreamFilter(object):
+    """Filter a stream of chunks with an IIR or FIR filter.
+
+    The delays of the filter are kept between the calls to process, so
+    that filtering the chunks in turn gives the same output as filtering
+    their concatenation at once. Each chunk may hold many channels, which
+    are all filtered in one call to the compiled filtering code.
+
+    The filter is given either as numerator and denominator polynomials
+    b and a, filtered as by lfilter, or as second-order sections sos,
+    filtered as by sosfilt; the latter is preferable for IIR filters of
+    high order.
+
+    Parameters
+    ----------
+    b, a : array_like (optional)
+        Numerator and denominator of the filter (a defaults to 1).
+    sos : array_like (optional)
+        Second-order sections of the filter, of shape (n_sections, 6).
+    axis : int
+        The axis of the chunks along which the signal runs; the other
+        axes hold independent channels and must have the same shape in
+        every chunk (*Default* = -1).
+
+    Examples
+    --------
+    >>> f = StreamFilter(sos=butter(10, 0.1, output='sos'), axis=0)
+    >>> for chunk in stream:          # chunks of shape (n, 512)
+    ...     out = f.process(chunk)
+    """
+
+    def __init__(self, b=None, a=None, sos=None, axis=-1):
+        if sos is not None:
+            if b is not None or a is not None:
+                raise ValueError("give either b and a, or sos")
+            self.sos = _sos_coefficients(sos)
+            self.b = self.a = None
+        else:
+            if b is None:
+                raise ValueError("give either b and a, or sos")
+            if a is None:
+                a = 1
+            self.b = atleast_1d(b)
+            self.a = atleast_1d(a)
+            self.sos = None
+        self.axis = axis
+        self.reset()
+
+    def reset(self):
+        """Set the delays to zero and start a new stream."""
+        self._state = None
+        self._channels = None
+
+    def process(self, x):
+        """Filter the next chunk of the stream.
+
+        Parameters
+        ----------
+        x : array_like
+            The chunk, with the signal along self.axis.
+
+        Returns
+        -------
+        y : array
+            The filtered chunk, of the same shape as x.
+        """
+        x = asarray(x)
+        if x.ndim == 0:
+            raise ValueError("x must be at least 1-D")
+        axis = range(x.ndim)[self.axis]
+        channels = x.shape[:axis] + x.shape[axis+1:]
+        if self._state is not None and channels != self._channels:
+            raise ValueError("chunk has %s channels but the stream has %s"
+                             % (channels, self._channels))
+        self._channels = channels
+        if self.sos is None:
+            return self._process_ba(x, axis)
+        else:
+            return self._process_sos(x, axis)
+
+    def _process_ba(self, x, axis):
+        nfilt = max(len(self.a), len(self.b))
+        if nfilt == 1 or x.shape[axis] == 0:
+            # no state to keep, or nothing to update it with
+            return lfilter(self.b, self.a, x, axis)
+        if self._state is None:
+            shape = list(x.shape)
+            shape[axis] = nfilt - 1
+            self._state = zeros(shape)
+        y, self._state = lfilter(self.b, self.a, x, axis, self._state)
+        return y
+
+    def _process_sos(self, x, axis):
+        n_sections = self.sos.shape[0]
+        y, channels = _move_axis_last(x, axis)
+        if self._state is None:
+            dtype = np.common_type(self.sos, x)
+            self._state = zeros((y.shape[0], n_sections, 2), dtype)
+        else:
+            dtype = np.common_type(self.sos, x, self._state)
+            if self._state.dtype != dtype:
+                self._state = self._state.astype(dtype)
+        y = np.array(y, dtype=dtype, order='C')
+        sigtools._sosfilt(np.array(self.sos, dtype=dtype, order='C'), y,
+                          self._state)
+        return np.rollaxis(y.reshape(channels + (y.shape[-1],)),
+                           x.ndim-1, axis)
+
 def deconvolve(signal, divisor):
     """Deconvolves divisor out of signal.
 
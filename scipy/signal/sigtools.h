@@ -55,6 +55,12 @@ scipy_signal_sigtools_linear_filter(PyObject * NPY_UNUSED(dummy), PyObject * arg
 PyObject*
 scipy_signal_sigtools_correlateND(PyObject *NPY_UNUSED(dummy), PyObject *args);
 
+PyObject*
+scipy_signal_sigtools_sosfilt(PyObject * NPY_UNUSED(dummy), PyObject * args);
+
+PyObject*
+scipy_signal_sigtools_rank_filter2d(PyObject * NPY_UNUSED(dummy), PyObject * args);
+
 void
 scipy_signal_sigtools_linear_filter_module_init();
 
@@ -1302,13 +1302,25 @@ static char doc_linear_filter[] =
     "implemented using Direct Form II transposed flow " \
     "diagram. If Vi is not given, Vf is not returned.";
 
+static char doc_sosfilt[] =
+    "_sosfilt(sos,X,Zi)  filters the rows of X in place with the " \
+    "second-order sections sos, updating the delays Zi. All arrays " \
+    "must be C contiguous and of the same type.";
+
+static char doc_rank_filter2d[] =
+    "out = _rank_filter2d(a,(kh,kw),rank)  returns the rank-th smallest " \
+    "value of the zero-padded kh by kw window around each element of the " \
+    "2-D array a, sliding the window along the rows.";
+
 static struct PyMethodDef toolbox_module_methods[] = {
 	{"_correlateND", scipy_signal_sigtools_correlateND, METH_VARARGS, doc_correlateND},
 	{"_convolve2d", sigtools_convolve2d, METH_VARARGS, doc_convolve2d},
 	{"_order_filterND", sigtools_order_filterND, METH_VARARGS, doc_order_filterND},
 	{"_linear_filter", scipy_signal_sigtools_linear_filter, METH_VARARGS, doc_linear_filter},
+	{"_sosfilt", scipy_signal_sigtools_sosfilt, METH_VARARGS, doc_sosfilt},
 	{"_remez",sigtools_remez, METH_VARARGS, doc_remez},
 	{"_medfilt2d", sigtools_median2d, METH_VARARGS, doc_median2d},
+	{"_rank_filter2d", scipy_signal_sigtools_rank_filter2d, METH_VARARGS, doc_rank_filter2d},
 	{NULL, NULL, 0, NULL}		/* sentinel */
 };
 
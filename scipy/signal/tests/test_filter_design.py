@@ -3,7 +3,8 @@ import warnings
 import numpy as np
 from numpy.testing import TestCase, assert_array_almost_equal
 
-from scipy.signal import tf2zpk, bessel, BadCoefficients
+from scipy.signal import tf2zpk, bessel, BadCoefficients, zpk2sos, tf2sos, \
+     butter, cheby1, freqz
 
 class TestTf2zpk(TestCase):
     def test_simple(self):
@@ -36,3 +37,71 @@ class TestTf2zpk(TestCase):
         finally:
             warnings.simplefilter("always", BadCoefficients)
 
+class TestZpk2Sos(TestCase):
+    def sos_response(self, sos, w):
+        h = np.ones(len(w), complex)
+        for row in sos:
+            h *= freqz(row[:3], row[3:], w)[1]
+        return h
+
+    def test_simple(self):
+        z = np.array([-1, -1, 1j, -1j])
+        p = np.array([0.9, 0.5, 0.8*np.exp(0.3j), 0.8*np.exp(-0.3j)])
+        sos = zpk2sos(z, p, 2.)
+        self.failUnless(sos.shape == (2, 6))
+        b, a = np.poly(z)*2., np.poly(p)
+        w = np.linspace(0.1, 3, 20)
+        assert_array_almost_equal(self.sos_response(sos, w),
+                                  freqz(b, a, w)[1])
+        # the poles nearest to the unit circle are in the last section
+        assert_array_almost_equal(np.sort(np.roots(sos[-1,3:])), [0.5, 0.9])
+
+    def test_odd_order(self):
+        z = np.array([-1, -1, -1])
+        p = np.array([0.5, 0.3+0.4j, 0.3-0.4j])
+        sos = zpk2sos(z, p, 0.1)
+        self.failUnless(sos.shape == (2, 6))
+        w = np.linspace(0.1, 3, 20)
+        assert_array_almost_equal(self.sos_response(sos, w),
+                        freqz(np.poly(z)*0.1, np.poly(p), w)[1])
+
+    def test_tf2sos(self):
+        b, a = butter(6, 0.2)
+        sos = tf2sos(b, a)
+        self.failUnless(sos.shape == (3, 6))
+        w = np.linspace(0.1, 3, 20)
+        assert_array_almost_equal(self.sos_response(sos, w),
+                                  freqz(b, a, w)[1])
+        # designed from the roots, which tf2sos only recovers approximately
+        sos = butter(6, 0.2, output='sos')
+        assert_array_almost_equal(sos[:,3:], tf2sos(b, a)[:,3:])
+        assert_array_almost_equal(self.sos_response(sos, w),
+                                  freqz(b, a, w)[1])
+        for btype, wn in [('high', 0.3), ('bandpass', [0.2, 0.4]),
+                          ('bandstop', [0.2, 0.4])]:
+            b, a = butter(4, wn, btype)
+            sos = butter(4, wn, btype, output='sos')
+            self.failUnless(sos.shape == (len(a)//2, 6))
+            assert_array_almost_equal(self.sos_response(sos, w),
+                                      freqz(b, a, w)[1])
+        self.failUnlessRaises(ValueError, butter, 6, 0.2, analog=1,
+                              output='sos')
+
+    def test_odd_order_design(self):
+        # the real pole of an odd order prototype has a tiny imaginary part
+        w = np.linspace(0.1, 3, 20)
+        for b, a, sos in [butter(3, 0.2) + (butter(3, 0.2, output='sos'),),
+                          butter(3, 0.3, 'high') +
+                          (butter(3, 0.3, 'high', output='sos'),),
+                          cheby1(5, 1, 0.2) +
+                          (cheby1(5, 1, 0.2, output='sos'),),
+                          cheby1(5, 1, 0.3, 'high') +
+                          (cheby1(5, 1, 0.3, 'high', output='sos'),)]:
+            self.failUnless(sos.shape == ((len(a) + 1)//2, 6))
+            assert_array_almost_equal(self.sos_response(sos, w),
+                                      freqz(b, a, w)[1])
+
+    def test_unpaired_roots(self):
+        self.failUnlessRaises(ValueError, zpk2sos, [], [0.5, 0.3+0.4j], 1.)
+        self.failUnlessRaises(ValueError, zpk2sos, [],
+                              [0.3+0.4j, 0.2-0.4j], 1.)
@@ -253,6 +253,87 @@ class TestFFTConvolve(TestCase):
         d = np.convolve(a, b, 'full')
         assert np.allclose(c, d, rtol=1e-10)
 
+class TestOAConvolve(TestCase):
+    def test_real(self):
+        x = array([1,2,3])
+        assert_array_almost_equal(signal.oaconvolve(x,x), [1,4,10,12,9.])
+
+    def test_modes(self):
+        a = array([1,2,3])
+        b = array([3,3,5,6,8,7,9,0,1])
+        for mode in ['full', 'same', 'valid']:
+            assert_array_almost_equal(signal.oaconvolve(a,b,mode),
+                                      np.convolve(b,a,mode))
+
+    def test_random_data(self):
+        np.random.seed(1234)
+        for n, m in [(1000, 1), (5000, 37), (3000, 300), (400, 400)]:
+            a = np.random.rand(n)
+            b = np.random.rand(m)
+            assert_array_almost_equal(signal.oaconvolve(a, b),
+                                      np.convolve(a, b))
+            a = a + 1j*np.random.rand(n)
+            assert_array_almost_equal(signal.oaconvolve(a, b),
+                                      np.convolve(a, b))
+
+    def test_axis(self):
+        np.random.seed(1234)
+        x = np.random.rand(500, 3)
+        h = np.random.rand(20)
+        y = signal.oaconvolve(x, h, axis=0)
+        self.failUnless(y.shape == (519, 3))
+        for j in range(3):
+            assert_array_almost_equal(y[:,j], np.convolve(x[:,j], h))
+        assert_array_almost_equal(signal.oaconvolve(x.T, h, 'same'),
+                                  y.T[:, 9:509])
+
+    def test_nfft(self):
+        np.random.seed(1234)
+        a = np.random.rand(1000)
+        b = np.random.rand(10)
+        assert_array_almost_equal(signal.oaconvolve(a, b, nfft=19),
+                                  np.convolve(a, b))
+        self.failUnlessRaises(ValueError, signal.oaconvolve, a, b, nfft=18)
+        self.failUnlessRaises(ValueError, signal.oaconvolve, a, [[1, 2]])
+
+class TestOAConvolver(TestCase):
+    def test_stream(self):
+        np.random.seed(1234)
+        x = np.random.rand(2, 3000)
+        h = np.random.rand(50)
+        conv = signal.OAConvolver(h)
+        out = []
+        for start, stop in [(0, 1), (1, 30), (30, 1000), (1000, 1000),
+                            (1000, 3000)]:
+            y = conv.process(x[:, start:stop])
+            self.failUnless(y.shape == (2, stop - start))
+            out.append(y)
+        out.append(conv.flush())
+        y = np.concatenate(out, axis=1)
+        for j in range(2):
+            assert_array_almost_equal(y[j], np.convolve(x[j], h))
+
+    def test_reset(self):
+        np.random.seed(1234)
+        x = np.random.rand(300)
+        h = np.random.rand(7)
+        conv = signal.OAConvolver(h, nfft=16)
+        conv.process(np.random.rand(100))
+        conv.reset()
+        y = np.concatenate([conv.process(x), conv.flush()])
+        assert_array_almost_equal(y, np.convolve(x, h))
+        self.failUnless(conv.flush().shape == (0,))
+
+    def test_block_size(self):
+        conv = signal.OAConvolver(np.ones(100))
+        self.failUnless(conv.nfft >= 199)
+        self.failUnless(conv.block_size == conv.nfft - 99)
+
+    def test_channels_mismatch(self):
+        conv = signal.OAConvolver([1., 2.], axis=0)
+        conv.process(np.ones((10, 2)))
+        self.failUnlessRaises(ValueError, conv.process, np.ones((10, 3)))
+
 class TestMedFilt(TestCase):
     def test_basic(self):
         f = [[50, 50, 50, 50, 50, 92, 18, 27, 65, 46],
@@ -284,6 +365,57 @@ class TestMedFilt(TestCase):
         """Ticket #1124."""
         signal.medfilt(None)
 
+    def test_types(self):
+        np.random.seed(1234)
+        f = np.random.randint(0, 100, (9, 11))
+        e = signal.medfilt(np.array(f, np.float), [5, 3])
+        for dtype in [np.uint8, np.int8, np.uint16, np.int16, np.int32,
+                      np.int64, np.float32, np.float64, np.longdouble]:
+            x = np.array(f, dtype)
+            d = signal.medfilt(x, [5, 3])
+            self.failUnless(d.dtype ==
+                            np.find_common_type([dtype, np.float64], []))
+            assert_array_equal(d, e)
+            d = signal.medfilt2d(x, [5, 3])
+            self.failUnless(d.dtype == dtype)
+            assert_array_equal(d, e)
+
+    def test_16bit(self):
+        np.random.seed(1234)
+        for dtype in [np.uint16, np.int16]:
+            info = np.iinfo(dtype)
+            x = np.random.randint(info.min, info.max + 1, (20, 30))
+            x = x.astype(dtype)
+            domain = np.ones((7, 9), dtype)
+            assert_array_equal(signal.medfilt2d(x, [7, 9]),
+                               signal.sigtools._order_filterND(x, domain, 31))
+
+    def test_1d(self):
+        np.random.seed(1234)
+        x = np.random.randn(500)
+        for k in [1, 3, 51, 999]:
+            d = signal.medfilt(x, k)
+            e = signal.sigtools._order_filterND(x, np.ones(k), k // 2)
+            assert_array_equal(d, e)
+
+class TestOrderFilter(TestCase):
+    def test_rank(self):
+        np.random.seed(1234)
+        x = np.random.randn(15, 12)
+        domain = np.ones((3, 5))
+        for rank in [0, 7, 14]:
+            assert_array_equal(signal.order_filter(x, domain, rank),
+                    signal.sigtools._order_filterND(x, domain, rank))
+        self.failUnlessRaises(ValueError, signal.order_filter, x, domain, 15)
+
+    def test_domain(self):
+        x = np.arange(25.).reshape(5, 5)
+        domain = [[0, 1, 0], [1, 1, 1], [0, 1, 0]]
+        assert_array_equal(signal.order_filter(x, domain, 4),
+                           signal.sigtools._order_filterND(x, domain, 4))
+        y = signal.order_filter(np.arange(10), [1, 1, 1], 2)
+        assert_array_equal(y, [1, 2, 3, 4, 5, 6, 7, 8, 9, 9])
+
 class TestWiener(TestCase):
     def test_basic(self):
         g = array([[5,6,4,3],[3,5,6,2],[2,3,5,6],[1,6,9,7]],'d')
@@ -485,6 +617,101 @@ class TestLinearFilterComplexxxiExtended28(_TestLinearFilter):
 class TestLinearFilterDecimal(_TestLinearFilter):
     dt = np.dtype(Decimal)
 
+class TestSOSFilt(TestCase):
+    def setUp(self):
+        np.random.seed(1234)
+        b, a = signal.butter(4, 0.2)
+        self.b, self.a = b, a
+        self.sos = signal.tf2sos(b, a)
+
+    def test_matches_lfilter(self):
+        x = np.random.randn(3, 200)
+        for axis in [0, 1, -1]:
+            assert_array_almost_equal(signal.sosfilt(self.sos, x, axis),
+                                      lfilter(self.b, self.a, x, axis))
+
+    def test_types(self):
+        x = np.random.randn(100)
+        y = lfilter(self.b, self.a, x)
+        y32 = signal.sosfilt(self.sos.astype(np.float32),
+                             x.astype(np.float32))
+        self.failUnless(y32.dtype == np.float32)
+        assert_array_almost_equal(y32, y, 5)
+        yc = signal.sosfilt(self.sos, x + 1j*x)
+        self.failUnless(yc.dtype == np.complex128)
+        assert_array_almost_equal(yc, y + 1j*y)
+        assert_array_almost_equal(signal.sosfilt(self.sos, list(x)), y)
+
+    def test_zi(self):
+        x = np.random.randn(4, 2, 100)
+        zi = np.zeros((self.sos.shape[0], 4, 2, 2))
+        y1, zf = signal.sosfilt(self.sos, x[..., :30], zi=zi)
+        y2, zf = signal.sosfilt(self.sos, x[..., 30:], zi=zf)
+        assert_array_almost_equal(np.concatenate((y1, y2), axis=-1),
+                                  signal.sosfilt(self.sos, x))
+        self.failUnlessRaises(ValueError, signal.sosfilt, self.sos, x,
+                              zi=zi[:, :2])
+
+    def test_high_order(self):
+        """A 20th order filter is stable as sections."""
+        sos = signal.butter(10, [0.2, 0.25], 'bandpass', output='sos')
+        x = np.zeros(2000)
+        x[0] = 1
+        h = signal.sosfilt(sos, x)
+        self.failUnless(np.all(np.isfinite(h)))
+        self.failUnless(abs(h[-100:]).max() < 1e-3)
+
+    def test_normalize(self):
+        x = np.random.randn(50)
+        assert_array_almost_equal(signal.sosfilt(2 * self.sos, x),
+                                  signal.sosfilt(self.sos, x))
+        self.failUnlessRaises(ValueError, signal.sosfilt, np.ones((2, 5)), x)
+        self.failUnlessRaises(ValueError, signal.sosfilt,
+                              [[1, 0, 0, 0, 1, 0]], x)
+
+class TestStreamFilter(TestCase):
+    def setUp(self):
+        np.random.seed(1234)
+        self.b, self.a = signal.butter(4, 0.1)
+        self.x = np.random.randn(1000, 5)
+
+    def check_stream(self, f, y_ref):
+        out = []
+        for start, stop in [(0, 1), (1, 100), (100, 100), (100, 1000)]:
+            y = f.process(self.x[start:stop])
+            self.failUnless(y.shape == (stop - start, 5))
+            out.append(y)
+        assert_array_almost_equal(np.concatenate(out), y_ref)
+
+    def test_ba(self):
+        y = lfilter(self.b, self.a, self.x, axis=0)
+        self.check_stream(signal.StreamFilter(self.b, self.a, axis=0), y)
+        b = signal.firwin(20, 0.3)
+        self.check_stream(signal.StreamFilter(b, axis=0),
+                          lfilter(b, 1, self.x, axis=0))
+
+    def test_sos(self):
+        y = lfilter(self.b, self.a, self.x, axis=0)
+        sos = signal.tf2sos(self.b, self.a)
+        self.check_stream(signal.StreamFilter(sos=sos, axis=0), y)
+
+    def test_reset(self):
+        f = signal.StreamFilter(sos=signal.tf2sos(self.b, self.a))
+        f.process(np.ones(20))
+        f.reset()
+        assert_array_almost_equal(f.process(self.x[:, 0]),
+                                  lfilter(self.b, self.a, self.x[:, 0]))
+        self.failUnlessRaises(ValueError, f.process, self.x)
+
+    def test_gain(self):
+        f = signal.StreamFilter([2.])
+        assert_array_almost_equal(f.process([1., 2.]), [2., 4.])
+
+    def test_invalid(self):
+        self.failUnlessRaises(ValueError, signal.StreamFilter)
+        self.failUnlessRaises(ValueError, signal.StreamFilter, self.b,
+                              sos=np.ones((1, 6)))
+
 class _TestCorrelateReal(TestCase):
     dt = None
     def _setup_rank1(self):
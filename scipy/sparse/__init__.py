@@ -11,9 +11,12 @@ from coo import *
 from dia import *
 from bsr import *
 
+from builder import *
 from construct import *
 from extract import *
 
+from sputils import set_num_threads, get_num_threads
+
 #from spfuncs import *
 
 __all__ = filter(lambda s:not s.startswith('_'),dir())
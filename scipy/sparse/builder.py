@@ -0,0 +1,174 @@
+"""Incremental construction of sparse matrices from triplets"""
+
+__docformat__ = "restructuredtext en"
+
+__all__ = ['coo_builder']
+
+import numpy as np
+
+from coo import coo_matrix
+from sputils import getdtype, isshape
+
+
+class coo_builder(object):
+    """Incremental builder of sparse matrices from (row, column, value)
+    triplets
+
+    Triplets are appended, one at a time or in blocks, to growable typed
+    arrays whose capacity doubles when full.  Duplicate entries are summed
+    when the matrix is finalized with tocoo(), tocsr() or tocsc(), so the
+    builder suits the assembly of finite-element stiffness and mass
+    matrices.
+
+    This can be instantiated as:
+        coo_builder((M, N), [dtype], [nnz])
+            to build a matrix with shape (M, N), where dtype is optional
+            and defaults to dtype='d', and nnz is an optional estimate of
+            the number of triplets to reserve room for
+
+    Examples
+    --------
+
+    >>> from scipy.sparse import coo_builder
+    >>> B = coo_builder((3, 3))
+    >>> B.append(0, 0, 1.0)
+    >>> B.append([1, 2], [1, 2], [2.0, 3.0])
+    >>> B.add_block([0, 2], [0, 2], [[1.0, 2.0], [3.0, 4.0]])
+    >>> B.tocsr().todense()
+    matrix([[ 2.,  0.,  2.],
+            [ 0.,  2.,  0.],
+            [ 3.,  0.,  7.]])
+
+    """
+
+    def __init__(self, shape, dtype=None, nnz=None):
+        if not isshape(shape):
+            raise TypeError('invalid shape')
+
+        self.shape = tuple(shape)
+        self.dtype = getdtype(dtype, default=float)
+
+        capacity  = max(int(nnz or 0), 16)
+        self.row  = np.empty(capacity, dtype=np.intc)
+        self.col  = np.empty(capacity, dtype=np.intc)
+        self.data = np.empty(capacity, dtype=self.dtype)
+        self.nnz  = 0
+
+    def __len__(self):
+        return self.nnz
+
+    def __repr__(self):
+        return "<%dx%d sparse matrix builder of type '%s'\n" \
+               "\twith %d stored triplets>" % \
+               (self.shape + (self.dtype.type, self.nnz))
+
+    def reserve(self, nnz):
+        """Make room for at least nnz triplets in total
+        """
+        if nnz > len(self.data):
+            for name in ['row', 'col', 'data']:
+                old = getattr(self, name)
+                new = np.empty(nnz, dtype=old.dtype)
+                new[:self.nnz] = old[:self.nnz]
+                setattr(self, name, new)
+
+    def clear(self):
+        """Remove all the triplets, keeping the allocated room
+        """
+        self.nnz = 0
+
+    def append(self, i, j, x):
+        """Append the triplets (i[k], j[k], x[k])
+
+        Parameters
+        ----------
+        i, j : int or array_like
+            Row and column indices, in the range [0, M) and [0, N).
+        x : scalar or array_like
+            Values, broadcast against the indices.
+
+        """
+        try:
+            i, j, x = np.broadcast_arrays(np.asarray(i), np.asarray(j),
+                                          np.asarray(x))
+        except ValueError:
+            raise ValueError('shape mismatch: indices and values '
+                             'cannot be broadcast')
+
+        i = i.ravel()
+        j = j.ravel()
+        x = x.ravel()
+
+        count = len(x)
+        if count == 0:
+            return
+
+        M, N = self.shape
+        if i.min() < 0 or i.max() >= M:
+            raise ValueError('row index exceeds matrix dimensions')
+        if j.min() < 0 or j.max() >= N:
+            raise ValueError('column index exceeds matrix dimensions')
+
+        start, end = self.nnz, self.nnz + count
+        if end > len(self.data):
+            self.reserve(max(end, 2 * len(self.data)))
+
+        self.row[start:end]  = i
+        self.col[start:end]  = j
+        self.data[start:end] = x
+        self.nnz = end
+
+    def add_block(self, rows, cols, block):
+        """Append the dense block of values block[k,l] at position
+        (rows[k], cols[l]), such as the matrix of a finite element
+
+        Parameters
+        ----------
+        rows : array_like
+            Row indices of the block, of length m, or of shape (K, m)
+            for a stack of K blocks.
+        cols : array_like
+            Column indices of the block, of length n, or of shape (K, n)
+            for a stack of K blocks.
+        block : array_like
+            Values, with shape (m, n) or (K, m, n).
+
+        Notes
+        -----
+        Appending the blocks of all the elements of a mesh in one call
+        avoids the overhead of one call per element.
+
+        """
+        rows  = np.asarray(rows)
+        cols  = np.asarray(cols)
+        block = np.asarray(block)
+
+        m, n = rows.shape[-1], cols.shape[-1]
+        if block.shape[-2:] != (m, n):
+            raise ValueError('block shape %s does not match the %d rows '
+                             'and %d columns' % (block.shape, m, n))
+
+        self.append(rows[..., :, np.newaxis], cols[..., np.newaxis, :], block)
+
+    def _coo(self, copy):
+        n = self.nnz
+        return coo_matrix((self.data[:n], (self.row[:n], self.col[:n])),
+                          shape=self.shape, copy=copy)
+
+    def tocoo(self):
+        """Return a copy of the triplets as a coo_matrix, which may have
+        duplicate entries
+        """
+        return self._coo(copy=True)
+
+    def tocsr(self):
+        """Return the matrix in Compressed Sparse Row format, with
+        duplicate entries summed together
+        """
+        return self._coo(copy=False).tocsr()
+
+    def tocsc(self):
+        """Return the matrix in Compressed Sparse Column format, with
+        duplicate entries summed together
+        """
+        return self._coo(copy=False).tocsc()
@@ -11,7 +11,8 @@ from base import spmatrix, isspmatrix, SparseEfficiencyWarning
 from data import _data_matrix
 import sparsetools
 from sputils import upcast, to_native, isdense, isshape, getdtype, \
-        isscalarlike, isintlike
+        isscalarlike, isintlike, _thread_count
+from scipy.lib._threads import run_threads as _run_threads
 
 
 class _cs_matrix(_data_matrix):
@@ -262,6 +263,11 @@ class _cs_matrix(_data_matrix):
         #output array
         result = np.zeros( self.shape[0], dtype=upcast(self.dtype,other.dtype) )
 
+        n_jobs = _thread_count(self.nnz)
+        if n_jobs > 1:
+            self._mul_threaded(other, result, n_jobs)
+            return result
+
         # csr_matvec or csc_matvec
         fn = getattr(sparsetools,self.format + '_matvec')
         fn(M, N, self.indptr, self.indices, self.data, other, result)
@@ -275,34 +281,173 @@ class _cs_matrix(_data_matrix):
 
         result = np.zeros( (M,n_vecs), dtype=upcast(self.dtype,other.dtype) )
 
+        n_jobs = _thread_count(self.nnz)
+        if n_jobs > 1:
+            self._mul_threaded(other, result, n_jobs)
+            return result
+
         # csr_matvecs or csc_matvecs
         fn = getattr(sparsetools,self.format + '_matvecs')
         fn(M, N, n_vecs, self.indptr, self.indices, self.data, other.ravel(), result.ravel())
 
         return result
 
+    def _mul_threaded(self, other, result, n_jobs):
+        """Add self * other to result with n_jobs threads, other and
+        result being dense vectors or 2-D arrays.
+
+        The major axis is split into blocks of about the same number of
+        nonzeros. For CSR, each block computes the rows of result that it
+        holds. For CSC, each block of columns contributes to every row, so
+        that blocks other than the first add their products to copies of
+        result, which are summed at the end.
+        """
+        M,N = self.shape
+        major = self._swap((M,N))[0]
+
+        # convert once, rather than in every call of the kernel
+        data  = np.asarray(self.data, dtype=result.dtype)
+        other = np.ascontiguousarray(other, dtype=result.dtype)
+        if other.ndim == 1:
+            fn = getattr(sparsetools, self.format + '_matvec')
+            n_vecs = ()
+        else:
+            fn = getattr(sparsetools, self.format + '_matvecs')
+            n_vecs = (other.shape[1],)
+
+        splits = np.searchsorted(self.indptr,
+                                 np.arange(1, n_jobs) * (self.nnz // n_jobs))
+        bounds = np.unique(np.concatenate(([0], splits, [major])))
+
+        blocks = []
+        partials = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            start, stop = int(start), int(stop)
+            indptr = self.indptr[start:stop + 1]
+            if self.format == 'csr':
+                blocks.append((stop - start, N) + n_vecs + \
+                              (indptr, self.indices, data, other.ravel(),
+                               result[start:stop].ravel()))
+            else:
+                if blocks:
+                    out = np.zeros_like(result)
+                    partials.append(out)
+                else:
+                    out = result
+                blocks.append((M, stop - start) + n_vecs + \
+                              (indptr, self.indices, data,
+                               other[start:stop].ravel(), out.ravel()))
+
+        _run_threads(fn, blocks, n_jobs)
+
+        for out in partials:
+            result += out
+
 
     def _mul_sparse_matrix(self, other):
+        return self._matmat(other)
+
+    def _matmat(self, other, mask=None, structure_only=False):
+        """Product of self and the sparse matrix other, in the format of
+        self; see scipy.sparse.spmatmul for mask and structure_only.
+
+        The rows of the product (its columns for CSC) are split into
+        blocks of about the same number of nonzeros of self, which are
+        multiplied in separate threads when set_num_threads allows it.
+        """
         M, K1 = self.shape
         K2, N = other.shape
 
-        major_axis = self._swap((M,N))[0]
-        indptr = np.empty(major_axis + 1, dtype=np.intc)
-
         other = self.__class__(other) #convert to this format
-        fn = getattr(sparsetools, self.format + '_matmat_pass1')
-        fn( M, N, self.indptr, self.indices, \
-                  other.indptr, other.indices, \
-                  indptr)
+        if mask is not None:
+            mask = self.__class__(mask)
 
-        nnz = indptr[-1]
+        # a CSC product is the CSR product of the transposes, B.T * A.T
+        if self.format == 'csr':
+            left, right = self, other
+            n_row, n_col = M, N
+        else:
+            left, right = other, self
+            n_row, n_col = N, M
+
+        n_jobs = _thread_count(self.nnz + other.nnz)
+        splits = np.searchsorted(left.indptr,
+                        np.arange(1, n_jobs) * (left.nnz // n_jobs))
+        bounds = np.unique(np.concatenate(([0], splits, [n_row])))
+        bounds = [(int(start), int(stop))
+                  for start, stop in zip(bounds[:-1], bounds[1:])]
+
+        # convert once, rather than in every call of the kernels
+        dtype = upcast(self.dtype, other.dtype)
+        left_data = np.asarray(left.data, dtype=dtype)
+        right_data = np.asarray(right.data, dtype=dtype)
+
+        def rows(start, stop):
+            return (stop - start, n_col, left.indptr[start:stop + 1],
+                    left.indices)
+
+        if mask is not None:
+            data = np.zeros(mask.nnz, dtype=dtype)
+            blocks = [rows(start, stop) + \
+                      (left_data, right.indptr, right.indices, right_data,
+                       mask.indptr[start:stop + 1], mask.indices, data)
+                      for start, stop in bounds]
+            _run_threads(sparsetools.csr_matmat_masked, blocks, n_jobs)
+            result = self.__class__((data, mask.indices.copy(),
+                                     mask.indptr.copy()), shape=(M,N))
+            result.eliminate_zeros()
+            return result
+
+        # Pass 1: number of entries of each block of rows
+        counts = [np.empty(stop - start + 1, dtype=np.intc)
+                  for start, stop in bounds]
+        blocks = [rows(start, stop) + (right.indptr, right.indices, Cp)
+                  for (start, stop), Cp in zip(bounds, counts)]
+        _run_threads(sparsetools.csr_matmat_pass1, blocks, n_jobs)
+
+        offsets = np.cumsum([0] + [int(Cp[-1]) for Cp in counts])
+        if np.any(offsets[1:] < offsets[:-1]) or \
+                offsets[-1] > np.iinfo(np.intc).max:
+            raise ValueError('the product has too many nonzeros for '
+                             '32 bit indices')
+
+        nnz = int(offsets[-1])
+        indptr = np.empty(n_row + 1, dtype=np.intc)
+        indptr[0] = 0
+        for (start, stop), Cp, offset in zip(bounds, counts, offsets):
+            indptr[start + 1:stop + 1] = Cp[1:] + offset
         indices = np.empty(nnz, dtype=np.intc)
-        data    = np.empty(nnz, dtype=upcast(self.dtype,other.dtype))
 
-        fn = getattr(sparsetools, self.format + '_matmat_pass2')
-        fn( M, N, self.indptr, self.indices, self.data, \
-                  other.indptr, other.indices, other.data, \
-                  indptr, indices, data)
+        if structure_only:
+            blocks = [rows(start, stop) + \
+                      (right.indptr, right.indices,
+                       indptr[start:stop + 1], indices)
+                      for start, stop in bounds]
+            _run_threads(sparsetools.csr_matmat_pattern, blocks, n_jobs)
+            data = np.ones(nnz, dtype=dtype)
+            return self.__class__((data,indices,indptr),shape=(M,N))
+
+        # Pass 2: entries of each block, written where Pass 1 put them
+        data = np.empty(nnz, dtype=dtype)
+        blocks = [rows(start, stop) + \
+                  (left_data, right.indptr, right.indices, right_data,
+                   Cp, indices[offset:], data[offset:])
+                  for (start, stop), Cp, offset in zip(bounds, counts,
+                                                       offsets)]
+        _run_threads(sparsetools.csr_matmat_pass2, blocks, n_jobs)
+
+        if len(bounds) == 1:
+            indptr = counts[0]
+        else:
+            # Pass 2 drops the entries summing to zero, so the blocks
+            # are moved next to each other
+            end = 0
+            for (start, stop), Cp, offset in zip(bounds, counts, offsets):
+                n = int(Cp[-1])
+                indices[end:end + n] = indices[offset:offset + n]
+                data[end:end + n] = data[offset:offset + n]
+                indptr[start + 1:stop + 1] = Cp[1:] + end
+                end += n
 
         return self.__class__((data,indices,indptr),shape=(M,N))
 
@@ -469,8 +614,8 @@ class _cs_matrix(_data_matrix):
         if isinstance(key, tuple):
             row,col = key
             if not (isscalarlike(row) and isscalarlike(col)):
-                raise NotImplementedError("Fancy indexing in assignment not "
-                                          "supported for csr matrices.")
+                self._set_many(row, col, val)                 #[[1,2],1:2]
+                return
             M, N = self.shape
             if (row < 0):
                 row += M
@@ -523,8 +668,130 @@ class _cs_matrix(_data_matrix):
 
             self.check_format(full_check=True)
         else:
-            # We should allow slices here!
-            raise IndexError, "invalid index"
+            self[key,:] = val                                 #[i] or [1:2]
+
+    def _set_many(self, row, col, val):
+        """Sets self[row,col] = val for any combination of scalar, slice,
+        integer array and boolean mask indices, with the broadcasting
+        rules of numpy arrays.  Entries that are already stored are
+        overwritten in place and the missing nonzero entries are inserted
+        in a single pass over the arrays of the matrix.
+        """
+        M, N = self.shape
+
+        def asindices(x, num):
+            if isinstance(x, slice):
+                return np.arange(*x.indices(num))
+            try:
+                x = np.asarray(x)
+            except:
+                raise IndexError('invalid index')
+            if x.dtype == np.bool_:
+                if x.shape != (num,):
+                    raise IndexError('boolean index does not match '
+                                     'dimension of size %d' % num)
+                x = x.nonzero()[0]
+            try:
+                x = np.asarray(x, dtype=np.intc)
+            except:
+                raise IndexError('invalid index')
+            if x.size and (x.max() >= num or x.min() < -num):
+                raise IndexError('index out of bounds')
+            return np.where(x < 0, x + num, x).astype(np.intc)
+
+        i = asindices(row, M)
+        j = asindices(col, N)
+
+        # a slice selects a whole axis of the result, as for arrays
+        if isinstance(row, slice) and isinstance(col, slice):
+            i = i.reshape(-1, 1)                              #[1:2,1:2]
+        elif isinstance(row, slice):
+            i = i.reshape((-1,) + (1,) * j.ndim)              #[1:2,[1,2]]
+        elif isinstance(col, slice):
+            i = i.reshape(i.shape + (1,))                     #[[1,2],1:2]
+
+        try:
+            i, j = np.broadcast_arrays(i, j)
+        except ValueError:
+            raise IndexError('shape mismatch: indices cannot be broadcast')
+
+        if isspmatrix(val):
+            val = val.toarray()
+        val = np.asarray(val, dtype=self.dtype)
+        while val.ndim > i.ndim and val.shape[0] == 1:
+            val = val[0]
+        try:
+            val = np.broadcast_arrays(val, i)[0]
+        except ValueError:
+            raise ValueError('shape mismatch in assignment')
+        if val.shape != i.shape:
+            raise ValueError('shape mismatch in assignment')
+
+        major, minor = self._swap((i.ravel(), j.ravel()))
+        val = val.ravel()
+        n_major, n_minor = self._swap((M, N))
+
+        num_samples = len(val)
+        offsets = np.empty(num_samples, dtype=self.indices.dtype)
+        sparsetools.csr_sample_offsets(n_major, n_minor, self.indptr,
+                                       self.indices, num_samples,
+                                       np.ascontiguousarray(major, dtype=np.intc),
+                                       np.ascontiguousarray(minor, dtype=np.intc),
+                                       offsets)
+
+        if (offsets == -2).any():
+            k = (offsets == -2).nonzero()[0][0]
+            row, col = self._swap((major[k], minor[k]))
+            raise ValueError('nonzero entry (%d,%d) occurs more than once' % (row,col))
+
+        # entries already present
+        present = offsets > -1
+        self.data[offsets[present]] = val[present]
+
+        if present.all():
+            return
+
+        # entries not already present, keeping the last assignment to each
+        missing = ~present
+        major = major[missing]
+        minor = minor[missing]
+        val   = val[missing]
+
+        keys  = major.astype(np.int64) * n_minor + minor
+        order = np.argsort(keys, kind='mergesort')
+        keys  = keys[order]
+        last  = np.ones(len(keys), dtype=bool)
+        last[:-1] = keys[:-1] != keys[1:]
+        order = order[last]
+        order = order[val[order] != 0]
+
+        if len(order) == 0:
+            return
+
+        warn('changing the sparsity structure of a %s_matrix is expensive. ' \
+                'lil_matrix is more efficient.' % self.format, \
+                SparseEfficiencyWarning)
+
+        major = major[order]
+        minor = minor[order]
+        val   = val[order]
+
+        was_sorted = self.has_sorted_indices
+
+        # append the new entries to the end of their rows
+        nnz = self.nnz
+        positions = self.indptr[major + 1]
+        self.indices = np.insert(self.indices[:nnz], positions, minor)
+        self.data    = np.insert(self.data[:nnz], positions, val)
+
+        self.indptr = self.indptr.copy()
+        self.indptr[1:] += np.searchsorted(major, np.arange(n_major), side='right')
+
+        if was_sorted:
+            self.has_sorted_indices = False
+            self.sort_indices()
+
+        self.check_format(full_check=False)
 
     ######################
     # Conversion methods #
@@ -3,7 +3,7 @@
 
 __docformat__ = "restructuredtext en"
 
-__all__ = [ 'spdiags', 'eye', 'identity', 'kron', 'kronsum',
+__all__ = [ 'spdiags', 'eye', 'identity', 'kron', 'kronsum', 'spmatmul',
             'hstack', 'vstack', 'bmat', 'rand']
 
 
@@ -233,6 +233,73 @@ def kronsum(A, B, format=None):
     return (L+R).asformat(format) #since L + R is not always same format
 
 
+def spmatmul(A, B, mask=None, structure_only=False, format=None):
+    """Product A * B of sparse matrices, optionally restricted to a mask
+    or to its sparsity structure
+
+    Parameters
+    ----------
+    A : sparse or dense matrix
+        first matrix of the product
+    B : sparse or dense matrix
+        second matrix of the product
+    mask : sparse or dense matrix, optional
+        if given, only the entries of A * B at the nonzeros of mask are
+        computed, and the product has no entries elsewhere
+    structure_only : bool, optional
+        if True, compute the sparsity structure of A * B, with ones as
+        values, which avoids computing the values.  Entries that would
+        cancel out to zero are kept.
+    format : string
+        format of the result, "csr" or "csc" (default "csc" if A is a
+        csc_matrix and "csr" otherwise)
+
+    Returns
+    -------
+    product in a sparse matrix format
+
+    Notes
+    -----
+    The product is computed by blocks of rows (of columns for CSC) in
+    parallel when scipy.sparse.set_num_threads allows several threads.
+    A masked product such as spmatmul(A, A, mask=A) only stores nnz(mask)
+    values, e.g. to count the triangles of a graph without forming A * A.
+
+    Examples
+    --------
+    >>> A = csr_matrix([[0,1,1],[1,0,1],[1,1,0]])
+    >>> spmatmul(A, A, mask=A).sum() / 6
+    1
+    >>> spmatmul(A, A, structure_only=True).todense()
+    matrix([[1, 1, 1],
+            [1, 1, 1],
+            [1, 1, 1]])
+
+    """
+    if format is None:
+        if isinstance(A, csc_matrix):
+            format = 'csc'
+        else:
+            format = 'csr'
+    if format == 'csr':
+        A = csr_matrix(A)
+    elif format == 'csc':
+        A = csc_matrix(A)
+    else:
+        raise ValueError('format must be "csr" or "csc" (got %s)' % format)
+
+    B = A.__class__(B)
+    if A.shape[1] != B.shape[0]:
+        raise ValueError('dimension mismatch')
+    if mask is not None:
+        mask = A.__class__(mask)
+        if mask.shape != (A.shape[0], B.shape[1]):
+            raise ValueError('mask must have the shape of the product')
+        if structure_only:
+            raise ValueError('mask and structure_only can not be combined')
+
+    return A._matmat(B, mask=mask, structure_only=structure_only)
+
 def hstack(blocks, format=None, dtype=None):
     """
     Stack sparse matrices horizontally (column wise)
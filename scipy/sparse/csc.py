@@ -141,8 +141,8 @@ class csc_matrix(_cs_matrix):
                 if isintlike(col) or isinstance(col,slice):
                     return self.T[col,row].T
                 else:
-                    row = np.asarray(row, dtype=np.intc)
-                    col = np.asarray(col, dtype=np.intc)
+                    row = np.asarray(row)
+                    col = np.asarray(col)
                     if len(row.shape) == 1:
                         return self.T[col,row]
                     elif len(row.shape) == 2:
@@ -10,7 +10,8 @@ from warnings import warn
 import numpy as np
 
 from sparsetools import csr_tocsc, csr_tobsr, csr_count_blocks, \
-        get_csr_submatrix, csr_sample_values
+        get_csr_submatrix, csr_sample_values, csr_row_index, \
+        csr_column_index1, csr_column_index2
 from sputils import upcast, isintlike
 
 
@@ -108,14 +109,18 @@ class csr_matrix(_cs_matrix):
 
         self.sort_indices() #lil_matrix needs sorted column indices
 
-        ptr,ind,dat = self.indptr,self.indices,self.data
+        # slicing Python lists is much faster than slicing arrays
+        nnz = self.nnz
+        ptr = self.indptr.tolist()
+        ind = self.indices[:nnz].tolist()
+        dat = self.data[:nnz].tolist()
         rows, data  = lil.rows, lil.data
 
         for n in xrange(self.shape[0]):
             start = ptr[n]
             end   = ptr[n+1]
-            rows[n] = ind[start:end].tolist()
-            data[n] = dat[start:end].tolist()
+            rows[n] = ind[start:end]
+            data[n] = dat[start:end]
 
         return lil
 
@@ -177,7 +182,16 @@ class csr_matrix(_cs_matrix):
 
 
     def __getitem__(self, key):
-        def asindices(x):
+        def asindices(x, N):
+            try:
+                x = np.asarray(x)
+            except:
+                raise IndexError('invalid index')
+            if x.dtype == np.bool_:
+                if x.shape != (N,):
+                    raise IndexError('boolean index does not match '
+                                     'dimension of size %d' % N)
+                x = x.nonzero()[0]
             try:
                 x = np.asarray(x, dtype=np.intc)
             except:
@@ -185,6 +199,9 @@ class csr_matrix(_cs_matrix):
             else:
                 return x
         def check_bounds(indices,N):
+            if indices.size == 0:
+                return (0,0)
+
             max_indx = indices.max()
             if max_indx >= N:
                 raise IndexError('index (%d) out of range' % max_indx)
@@ -195,29 +212,35 @@ class csr_matrix(_cs_matrix):
 
             return (min_indx,max_indx)
 
-        def extractor(indices,N):
-            """Return a sparse matrix P so that P*self implements
-            slicing of the form self[[1,2,3],:]
+        def normalize(indices,N):
+            """Return the 1-D array of valid indices, in the range
+            [0,N), that implements slicing of the form self[[1,2,3],:]
             """
-            indices = asindices(indices)
-    
+            indices = asindices(indices,N).ravel()
+
             (min_indx,max_indx) = check_bounds(indices,N)
 
             if min_indx < 0:
                 indices = indices.copy()
                 indices[indices < 0] += N
 
-            indptr  = np.arange(len(indices) + 1, dtype=np.intc)
-            data    = np.ones(len(indices), dtype=self.dtype)
-            shape   = (len(indices),N)
+            return indices
 
-            return csr_matrix((data,indices,indptr), shape=shape)
+        def stepped(x):
+            return isinstance(x, slice) and x.step not in (None, 1)
 
 
         if isinstance(key, tuple):
             row = key[0]
             col = key[1]
 
+            if stepped(row):
+                rows = np.arange(*row.indices(self.shape[0]))  #[1:5:2,??]
+                return self._row_index(rows)[:,col]
+            elif stepped(col):
+                cols = np.arange(*col.indices(self.shape[1]))  #[??,1:5:2]
+                return self[row,:]._column_index(cols)
+
             if isintlike(row):
                 #[1,??]
                 if isintlike(col):
@@ -225,26 +248,26 @@ class csr_matrix(_cs_matrix):
                 elif isinstance(col, slice):
                     return self._get_row_slice(row, col)      #[i,1:2]
                 else:
-                    P = extractor(col,self.shape[1]).T        #[i,[1,2]]
-                    return self[row,:]*P
+                    cols = normalize(col,self.shape[1])       #[i,[1,2]]
+                    return self[row,:]._column_index(cols)
 
             elif isinstance(row, slice):
                 #[1:2,??]
                 if isintlike(col) or isinstance(col, slice):
                     return self._get_submatrix(row, col)      #[1:2,j]
                 else:
-                    P = extractor(col,self.shape[1]).T        #[1:2,[1,2]]
-                    return self[row,:]*P
+                    cols = normalize(col,self.shape[1])       #[1:2,[1,2]]
+                    return self[row,:]._column_index(cols)
 
             else:
                 #[[1,2],??] or [[[1],[2]],??]
                 if isintlike(col) or isinstance(col,slice):
-                    P = extractor(row, self.shape[0])        #[[1,2],j] or [[1,2],1:2]
-                    return (P*self)[:,col]
+                    rows = normalize(row,self.shape[0])       #[[1,2],j] or [[1,2],1:2]
+                    return self._row_index(rows)[:,col]
 
                 else:
-                    row = asindices(row)
-                    col = asindices(col)
+                    row = asindices(row,self.shape[0])
+                    col = asindices(col,self.shape[1])
                     if len(row.shape) == 1:
                         if len(row) != len(col):             #[[1,2],[1,2]]
                             raise IndexError('number of row and column indices differ')
@@ -263,9 +286,9 @@ class csr_matrix(_cs_matrix):
                         return np.asmatrix(val)
 
                     elif len(row.shape) == 2:
-                        row = np.ravel(row)                   #[[[1],[2]],[1,2]]
-                        P = extractor(row, self.shape[0])
-                        return (P*self)[:,col]
+                        rows = normalize(row,self.shape[0])   #[[[1],[2]],[1,2]]
+                        cols = normalize(col,self.shape[1])
+                        return self._row_index(rows)._column_index(cols)
 
                     else:
                         raise NotImplementedError('unsupported indexing')
@@ -273,8 +296,53 @@ class csr_matrix(_cs_matrix):
         elif isintlike(key) or isinstance(key,slice):
             return self[key,:]                                #[i] or [1:2]
         else:
-            return self[asindices(key),:]                     #[[1,2]]
+            return self[key,:]                                #[[1,2]]
+
+
+    def _row_index(self, rows):
+        """Returns a copy of the rows self[rows,:], for a 1-D array
+        of row indices in the range [0, M)
+        """
+        rows = np.asarray(rows, dtype=np.intc)
+
+        row_nnz = np.diff(self.indptr)[rows]
+
+        indptr = np.empty(len(rows) + 1, dtype=np.intc)
+        indptr[0] = 0
+        np.cumsum(row_nnz, out=indptr[1:])
+
+        nnz     = indptr[-1]
+        indices = np.empty(nnz, dtype=np.intc)
+        data    = np.empty(nnz, dtype=self.dtype)
+        csr_row_index(len(rows), rows, self.indptr, self.indices, self.data,
+                      indices, data)
+
+        shape = (len(rows), self.shape[1])
+        return csr_matrix( (data, indices, indptr), shape=shape )
+
+    def _column_index(self, cols):
+        """Returns a copy of the columns self[:,cols], for a 1-D array
+        of column indices in the range [0, N)
+        """
+        M, N = self.shape
+        cols = np.asarray(cols, dtype=np.intc)
+
+        col_offsets = np.zeros(N, dtype=np.intc)
+        indptr      = np.empty(M + 1, dtype=np.intc)
+        csr_column_index1(len(cols), cols, M, N, self.indptr, self.indices,
+                          col_offsets, indptr)
+
+        # stable, so each row keeps the requested order of repeated columns
+        col_order = np.argsort(cols, kind='mergesort').astype(np.intc)
+
+        nnz     = indptr[-1]
+        indices = np.empty(nnz, dtype=np.intc)
+        data    = np.empty(nnz, dtype=self.dtype)
+        csr_column_index2(col_order, col_offsets, int(self.nnz), self.indices,
+                          self.data, indices, data)
 
+        shape = (M, len(cols))
+        return csr_matrix( (data, indices, indptr), shape=shape )
 
     def _get_single_element(self,row,col):
         """Returns the single element self[row, col]
@@ -363,6 +431,10 @@ class csr_matrix(_cs_matrix):
                 raise TypeError('expected slice or scalar')
 
         def check_bounds( i0, i1, num ):
+            if num == 0 and i0 == i1 == 0:
+                # the whole of an empty dimension, such as that of an
+                # empty fancy index selection
+                return
             if not (0<=i0<num) or not (0<i1<=num) or not (i0<i1):
                 raise IndexError( \
                       "index out of bounds: 0<=%d<%d, 0<=%d<%d, %d<%d" %\
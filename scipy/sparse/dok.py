@@ -5,7 +5,7 @@ __docformat__ = "restructuredtext en"
 __all__ = ['dok_matrix', 'isspmatrix_dok']
 
 import operator
-from itertools import izip
+from itertools import izip, chain
 
 import numpy as np
 
@@ -226,82 +226,105 @@ class dok_matrix(spmatrix, dict):
                 raise ValueError('setting an array element with a sequence')
 
         else:
-            # Either i or j is a slice, sequence, or invalid.  If i is a slice
-            # or sequence, unfold it first and call __setitem__ recursively.
-            if isinstance(i, slice):
-                # Is there an easier way to do this?
-                seq = xrange(i.start or 0, i.stop or self.shape[0], i.step or 1)
-            elif operator.isSequenceType(i):
-                seq = i
-            else:
-                # Make sure i is an integer. (But allow it to be a subclass of int).
-                if not isintlike(i):
-                    raise TypeError, "index must be a pair of integers or slices"
-                seq = None
-            if seq is not None:
-                # First see if 'value' is another dok_matrix of the appropriate
-                # dimensions
-                if isinstance(value, dok_matrix):
-                    if value.shape[1] == 1:
-                        for element in seq:
-                            self[element, j] = value[element, 0]
-                    else:
-                        raise NotImplementedError, "setting a 2-d slice of" \
-                                " a dok_matrix is not yet supported"
-                elif np.isscalar(value):
-                    for element in seq:
-                        self[element, j] = value
-                else:
-                    # See if value is a sequence
-                    try:
-                        if len(seq) != len(value):
-                            raise ValueError, "index and value ranges must" \
-                                              " have the same length"
-                    except TypeError:
-                        # Not a sequence
-                        raise TypeError, "unsupported type for" \
-                                         " dok_matrix.__setitem__"
-
-                    # Value is a sequence
-                    for element, val in izip(seq, value):
-                        self[element, j] = val   # don't use dict.__setitem__
-                            # here, since we still want to be able to delete
-                            # 0-valued keys, do type checking on 'val' (e.g. if
-                            # it's a rank-1 dense array), etc.
+            # Either i or j is a slice, sequence, or invalid.
+            irange = isinstance(i, slice) or operator.isSequenceType(i)
+            jrange = isinstance(j, slice) or operator.isSequenceType(j)
+            # Any other index must be an integer. (But allow it to be a
+            # subclass of int).
+            if not (irange or isintlike(i)) or not (jrange or isintlike(j)):
+                raise TypeError, "index must be a pair of integers or slices"
+
+            rows = self._index_array(i, self.shape[0])
+            cols = self._index_array(j, self.shape[1])
+            if irange:
+                seq = rows
             else:
-                # Process j
-                if isinstance(j, slice):
-                    seq = xrange(j.start or 0, j.stop or self.shape[1], j.step or 1)
-                elif operator.isSequenceType(j):
-                    seq = j
-                else:
-                    # j is not an integer
-                    raise TypeError, "index must be a pair of integers or slices"
-
-                # First see if 'value' is another dok_matrix of the appropriate
-                # dimensions
-                if isinstance(value, dok_matrix):
-                    if value.shape[0] == 1:
-                        for element in seq:
-                            self[i, element] = value[0, element]
-                    else:
-                        raise NotImplementedError, "setting a 2-d slice of" \
-                                " a dok_matrix is not yet supported"
-                elif np.isscalar(value):
-                    for element in seq:
-                        self[i, element] = value
+                seq = cols
+
+            # First see if 'value' is another dok_matrix of the appropriate
+            # dimensions
+            if isinstance(value, dok_matrix):
+                if irange and value.shape[1] == 1 and not jrange:
+                    value = [value[element, 0] for element in seq]
+                elif jrange and value.shape[0] == 1 and not irange:
+                    value = [value[0, element] for element in seq]
                 else:
-                    # See if value is a sequence
-                    try:
-                        if len(seq) != len(value):
-                            raise ValueError, "index and value ranges must have" \
-                                              " the same length"
-                    except TypeError:
-                        # Not a sequence
-                        raise TypeError, "unsupported type for dok_matrix.__setitem__"
-                    else:
-                        for element, val in izip(seq, value):
-                            self[i, element] = val
+                    raise NotImplementedError, "setting a 2-d slice of" \
+                            " a dok_matrix is not yet supported"
+            elif not np.isscalar(value):
+                # See if value is a sequence
+                try:
+                    if len(seq) != len(value):
+                        raise ValueError, "index and value ranges must" \
+                                          " have the same length"
+                except TypeError:
+                    # Not a sequence
+                    raise TypeError, "unsupported type for" \
+                                     " dok_matrix.__setitem__"
+
+            value = np.asarray(value, dtype=self.dtype)
+            if irange and jrange:
+                # each row is set from an item of the value
+                rows = rows.reshape(-1, 1)
+                if value.ndim == 1:
+                    value = value.reshape(-1, 1)
+            elif value.ndim > 1:
+                raise ValueError('setting an array element with a sequence')
+
+            self._setitem_many(rows, cols, value)
+
+    def _index_array(self, i, num):
+        """Return the 1-D array of valid indices selected by an integer,
+        slice or sequence i, for an axis of length num.
+        """
+        if isinstance(i, slice):
+            return np.arange(*i.indices(num))
+
+        i = np.atleast_1d(np.asarray(i))
+        if i.ndim != 1 or (len(i) > 0 and i.dtype.kind not in 'biu'):
+            raise TypeError, "index must be a pair of integers or slices"
+
+        i = i.astype(np.intp)
+        if len(i) > 0 and (i.min() < -num or i.max() >= num):
+            raise IndexError, "index out of bounds"
+
+        return np.where(i < 0, i + num, i)
+
+    def _setitem_many(self, i, j, values):
+        """Set self[i[k],j[k]] = values[k] for arrays of valid indices i
+        and j, broadcast against the values, deleting the entries set to
+        zero.  The values are converted
+        at once and the dictionary updated in bulk instead of one key at a
+        time.
+        """
+        values = np.asarray(values, dtype=self.dtype)
+        try:
+            i, j, values = np.broadcast_arrays(i, j, values)
+        except ValueError:
+            raise ValueError('shape mismatch in assignment')
+        i, j, values = i.ravel(), j.ravel(), values.ravel()
+
+        nonzero = values != 0
+        if nonzero.all():
+            # the last assignment to repeated keys wins
+            dict.update(self, izip(izip(i.tolist(), j.tolist()), values))
+            return
+
+        # keep only the last assignment to each key, as a zero may follow
+        # a nonzero for the same key or vice versa
+        keys  = i.astype(np.int64) * self.shape[1] + j
+        order = np.argsort(keys, kind='mergesort')
+        last  = np.ones(len(keys), dtype=bool)
+        last[:-1] = keys[order][:-1] != keys[order][1:]
+        order = order[last]
+
+        i, j, values, nonzero = i[order], j[order], values[order], nonzero[order]
+
+        dict.update(self, izip(izip(i[nonzero].tolist(), j[nonzero].tolist()),
+                               values[nonzero]))
+        for key in izip(i[~nonzero].tolist(), j[~nonzero].tolist()):
+            if dict.has_key(self, key):
+                dict.__delitem__(self, key)
 
 
     def __add__(self, other):
@@ -501,8 +524,11 @@ class dok_matrix(spmatrix, dict):
         if self.nnz == 0:
             return coo_matrix(self.shape, dtype=self.dtype)
         else:
-            data    = np.asarray(self.values(), dtype=self.dtype)
-            indices = np.asarray(self.keys(), dtype=np.intc).T
+            nnz     = self.nnz
+            data    = np.fromiter(self.itervalues(), dtype=self.dtype, count=nnz)
+            ij      = np.fromiter(chain.from_iterable(self.iterkeys()),
+                                  dtype=np.intc, count=2*nnz)
+            indices = ij.reshape(nnz, 2).T
             return coo_matrix((data,indices), shape=self.shape, dtype=self.dtype)
 
     def todok(self,copy=False):
@@ -84,6 +84,15 @@ Duplicate (i,j) entries are summed when converting to CSR or CSC.
 
 This is useful for constructing finite-element stiffness and mass matrices.
 
+When the triplets are produced piecewise, e.g. one element matrix at a
+time, a coo_builder collects them in growable arrays without keeping
+Python lists of indices:
+
+>>> B = sparse.coo_builder((4,4))
+>>> B.append(I, J, V)
+>>> B.add_block([1,3], [1,3], [[1,2],[3,4]])
+>>> C = B.tocsr()
+
 Further Details
 ---------------
 
@@ -91,6 +100,9 @@ CSR column indices are not necessarily sorted.  Likewise for CSC row
 indices.  Use the .sorted_indices() and .sort_indices() methods when
 sorted indices are required (e.g. when passing data to other libraries).
 
+The products of CSR and CSC matrices with dense vectors and arrays can
+use several threads; see set_num_threads and get_num_threads.
+
 """
 
 __docformat__ = "restructuredtext en"
@@ -6,6 +6,7 @@ __docformat__ = "restructuredtext en"
 __all__ = ['lil_matrix','isspmatrix_lil']
 
 from bisect import bisect_left
+from itertools import chain, imap
 
 import numpy as np
 
@@ -256,36 +257,6 @@ class lil_matrix(spmatrix):
                 del row[pos]
                 del data[pos]
 
-    def _setitem_setrow(self, row, data, j, xrow, xdata, xcols):
-        if isinstance(j, slice):
-            j = self._slicetoseq(j, self.shape[1])
-        if issequence(j):
-            if xcols == len(j):
-                for jj, xi in zip(j, xrange(xcols)):
-                   pos = bisect_left(xrow, xi)
-                   if pos != len(xdata) and xrow[pos] == xi:
-                       self._insertat2(row, data, jj, xdata[pos])
-                   else:
-                       self._insertat2(row, data, jj, 0)
-            elif xcols == 1:           # OK, broadcast across row
-                if len(xdata) > 0 and xrow[0] == 0:
-                    val = xdata[0]
-                else:
-                    val = 0
-                for jj in j:
-                    self._insertat2(row, data, jj,val)
-            else:
-                raise IndexError('invalid index')
-        elif np.isscalar(j):
-            if not xcols == 1:
-                raise ValueError('array dimensions are not compatible for copy')
-            if len(xdata) > 0 and xrow[0] == 0:
-                self._insertat2(row, data, j, xdata[0])
-            else:
-                self._insertat2(row, data, j, 0)
-        else:
-            raise ValueError('invalid column value: %s' % str(j))
-
     def __setitem__(self, index, x):
         try:
             i, j = index
@@ -306,33 +277,131 @@ class lil_matrix(spmatrix):
                self.data = x.data
                return
 
-        if isinstance(i, tuple):       # can't index lists with tuple
-            i = list(i)
+        self._setitem_block(i, j, x)
 
-        if np.isscalar(i):
-            rows = [self.rows[i]]
-            datas = [self.data[i]]
+    def _index_array(self, i, num):
+        """ helper for __setitem__: return the 1-D array of valid indices
+        selected by a scalar, slice, sequence or boolean mask i. """
+
+        if isinstance(i, slice):
+            return np.arange(*i.indices(num))
+
+        try:
+            i = np.asarray(i)
+        except:
+            raise IndexError('invalid index')
+
+        if i.dtype == np.bool_ and i.shape == (num,):
+            return i.nonzero()[0]
+
+        i = i.ravel()
+        if len(i) == 0:
+            return i.astype(np.intc)
+        if i.dtype.kind not in 'biu':
+            raise IndexError('invalid index')
+
+        i = i.astype(np.intc)
+        if i.min() < -num or i.max() >= num:
+            raise IndexError('index out of bounds')
+
+        return np.where(i < 0, i + num, i)
+
+    def _setitem_block(self, i, j, x):
+        """ helper for __setitem__: set the block self[i,j] = x, where x is
+        a scalar, sequence, dense or sparse matrix whose rows (or columns)
+        match the rows selected by i and whose columns match those selected
+        by j, with broadcasting of single rows and columns.
+
+        The block is set one row at a time, using arrays instead of
+        inserting the entries one at a time. """
+
+        rows = self._index_array(i, self.shape[0])
+        cols = self._index_array(j, self.shape[1])
+
+        if isspmatrix(x):
+            xrows, xcols = x.shape
         else:
-            rows = self.rows[i]
-            datas = self.data[i]
-
-        x = lil_matrix(x, copy=False)
-        xrows, xcols = x.shape
-        if xrows == len(rows):    # normal rectangular copy
-            for row, data, xrow, xdata in zip(rows, datas, x.rows, x.data):
-                self._setitem_setrow(row, data, j, xrow, xdata, xcols)
-        elif xrows == 1:          # OK, broadcast down column
-            for row, data in zip(rows, datas):
-                self._setitem_setrow(row, data, j, x.rows[0], x.data[0], xcols)
+            x = np.asarray(x, dtype=self.dtype)
+            if x.ndim > 2:
+                raise ValueError('setting an array element with a sequence')
+            x = np.atleast_2d(x)
+            xrows, xcols = x.shape
+
+        def fits(xrows, xcols):
+            return xrows in (len(rows), 1) and xcols in (len(cols), 1)
 
         # needed to pass 'test_lil_sequence_assignement' unit test:
         # -- set row from column of entries --
-        elif xcols == len(rows):
+        if not fits(xrows, xcols) and fits(xcols, xrows):
             x = x.T
-            for row, data, xrow, xdata in zip(rows, datas, x.rows, x.data):
-                self._setitem_setrow(row, data, j, xrow, xdata, xrows)
-        else:
+            xrows, xcols = x.shape
+
+        if xrows != len(rows) and xrows != 1:
             raise IndexError('invalid index')
+        if xcols != len(cols) and xcols != 1:
+            if np.isscalar(j):
+                raise ValueError('array dimensions are not compatible for copy')
+            raise IndexError('invalid index')
+
+        if len(rows) == 0 or len(cols) == 0:
+            return
+
+        # broadcast single rows and columns
+        shape = (len(rows), len(cols))
+        if (xrows, xcols) != shape:
+            if isspmatrix(x):
+                x = x.toarray()
+            x = np.broadcast_arrays(x, np.empty(shape, dtype=bool))[0]
+
+        # the last assignment to repeated rows and columns wins
+        rows, rowpos = np.unique(rows[::-1], return_index=True)
+        cols, colpos = np.unique(cols[::-1], return_index=True)
+        rowpos = shape[0] - 1 - rowpos
+        colpos = shape[1] - 1 - colpos
+
+        from csr import csr_matrix
+        if isspmatrix(x):
+            x = csr_matrix(x, dtype=self.dtype, copy=True)
+        else:
+            x = csr_matrix(x)
+        if len(rows) < shape[0] or (rowpos != np.arange(shape[0])).any():
+            x = x[rowpos,:]
+        if len(cols) < shape[1] or (colpos != np.arange(shape[1])).any():
+            x = x[:,colpos]
+        x.sum_duplicates()
+
+        ptr = x.indptr
+        xcols = cols[x.indices]
+        xdata = x.data
+        ncols = len(cols)
+
+        for n, i in enumerate(rows):
+            start, end = ptr[n], ptr[n+1]
+            newcols = xcols[start:end]
+            newdata = xdata[start:end]
+            nz = newdata != 0
+            if not nz.all():
+                newcols = newcols[nz]
+                newdata = newdata[nz]
+
+            row  = self.rows[i]
+            data = self.data[i]
+
+            if len(row) > 0:
+                # keep the entries outside of the assigned columns
+                oldcols = np.asarray(row, dtype=np.intc)
+                pos = np.minimum(cols.searchsorted(oldcols), ncols - 1)
+                keep = cols[pos] != oldcols
+                if keep.any():
+                    olddata = np.asarray(data, dtype=self.dtype)
+                    newcols = np.concatenate((oldcols[keep], newcols))
+                    newdata = np.concatenate((olddata[keep], newdata))
+                    order = newcols.argsort(kind='mergesort')
+                    newcols = newcols[order]
+                    newdata = newdata[order]
+
+            row[:]  = newcols.tolist()
+            data[:] = newdata.tolist()
 
     def _mul_scalar(self, other):
         if other == 0:
@@ -424,20 +493,19 @@ class lil_matrix(spmatrix):
         """ Return Compressed Sparse Row format arrays for this matrix.
         """
 
-        indptr = np.asarray([len(x) for x in self.rows], dtype=np.intc)
-        indptr = np.concatenate( (np.array([0], dtype=np.intc), np.cumsum(indptr)) )
+        M = self.shape[0]
 
-        nnz = indptr[-1]
+        indptr = np.empty(M + 1, dtype=np.intc)
+        indptr[0] = 0
+        np.cumsum(np.fromiter(imap(len, self.rows), dtype=np.intc, count=M),
+                  out=indptr[1:])
 
-        indices = []
-        for x in self.rows:
-            indices.extend(x)
-        indices = np.asarray(indices, dtype=np.intc)
+        nnz = indptr[-1]
 
-        data = []
-        for x in self.data:
-            data.extend(x)
-        data = np.asarray(data, dtype=self.dtype)
+        indices = np.fromiter(chain.from_iterable(self.rows),
+                              dtype=np.intc, count=nnz)
+        data    = np.fromiter(chain.from_iterable(self.data),
+                              dtype=self.dtype, count=nnz)
 
         from csr import csr_matrix
         return csr_matrix((data, indices, indptr), shape=self.shape)
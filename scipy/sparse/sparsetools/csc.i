@@ -1,7 +1,12 @@
-%module csc
+%module(threads="1") csc
 
 %include "sparsetools.i"
 
+/* only the products release the GIL, so that they can run in threads */
+%nothread;
+%thread csc_matvec;
+%thread csc_matvecs;
+
 %{
 #include "csc.h"
 %}
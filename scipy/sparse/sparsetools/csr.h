@@ -617,6 +617,139 @@ void csr_matmat_pass2(const I n_row,
     }
 }
 
+/*
+ * Compute the column indices of the matrix product C = A * B, using
+ * the row pointer Cp[] computed in Pass 1, but not its values.
+ *
+ * Input Arguments:
+ *   I  n_row         - number of rows in A
+ *   I  n_col         - number of columns in B (hence C is n_row by n_col)
+ *   I  Ap[n_row+1]   - row pointer
+ *   I  Aj[nnz(A)]    - column indices
+ *   I  Bp[?]         - row pointer
+ *   I  Bj[nnz(B)]    - column indices
+ *   I  Cp[n_row+1]   - row pointer of C
+ *
+ * Output Arguments:
+ *   I  Cj[nnz(C)]    - column indices
+ *
+ * Note:
+ *   Output array Cj must be preallocated
+ *   Cp may start at a nonzero offset into Cj, so that the rows of C
+ *   can be computed in separate calls
+ *   The columns of a row of C appear in the same order as for Pass 2
+ *   Unlike Pass 2, which drops entries that sum to zero, all the
+ *   entries counted by Pass 1 are kept
+ */
+template <class I>
+void csr_matmat_pattern(const I n_row,
+                        const I n_col, 
+                        const I Ap[], 
+                        const I Aj[], 
+                        const I Bp[],
+                        const I Bj[],
+                        const I Cp[],
+                              I Cj[])
+{
+    std::vector<I> next(n_col,-1);
+
+    for(I i = 0; i < n_row; i++){
+        I head   = -2;
+        I length =  0;
+
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            I j = Aj[jj];
+            for(I kk = Bp[j]; kk < Bp[j+1]; kk++){
+                I k = Bj[kk];
+                if(next[k] == -1){
+                    next[k] = head;
+                    head  = k;
+                    length++;
+                }
+            }
+        }
+
+        I nnz = Cp[i];
+        for(I jj = 0; jj < length; jj++){
+            Cj[nnz++] = head;
+
+            I temp = head;
+            head = next[head];
+            next[temp] = -1; //clear array
+        }
+    }
+}
+
+/*
+ * Compute the entries of the matrix product C = A * B that lie in the
+ * sparsity pattern of a matrix M, i.e. the values of C on the structure
+ * of M.
+ *
+ * Input Arguments:
+ *   I  n_row         - number of rows in A
+ *   I  n_col         - number of columns in B (hence C is n_row by n_col)
+ *   I  Ap[n_row+1]   - row pointer
+ *   I  Aj[nnz(A)]    - column indices
+ *   T  Ax[nnz(A)]    - nonzeros
+ *   I  Bp[?]         - row pointer
+ *   I  Bj[nnz(B)]    - column indices
+ *   T  Bx[nnz(B)]    - nonzeros
+ *   I  Cp[n_row+1]   - row pointer of M
+ *   I  Cj[nnz(M)]    - column indices of M
+ *
+ * Output Arguments:
+ *   T  Cx[nnz(M)]    - values of C at the entries of M
+ *
+ * Note:
+ *   Output array Cx must be preallocated and set to zero
+ *   If M has duplicate entries, the product is stored in the last one
+ *   and the others are left unchanged
+ *   Cp is used as is, so that the rows of C can be computed in
+ *   separate calls with the matching parts of Ap and Cp
+ *
+ *   Complexity: O(nnz(M) + the products of the full A * B), but only
+ *   nnz(M) entries are stored
+ */
+template <class I, class T>
+void csr_matmat_masked(const I n_row,
+                       const I n_col, 
+                       const I Ap[], 
+                       const I Aj[], 
+                       const T Ax[],
+                       const I Bp[],
+                       const I Bj[],
+                       const T Bx[],
+                       const I Cp[],
+                       const I Cj[],
+                             T Cx[])
+{
+    std::vector<I> pos(n_col,-1);
+
+    for(I i = 0; i < n_row; i++){
+        if(Cp[i] == Cp[i+1]){
+            continue;
+        }
+        for(I mm = Cp[i]; mm < Cp[i+1]; mm++){
+            pos[Cj[mm]] = mm;
+        }
+
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            I j = Aj[jj];
+            T v = Ax[jj];
+            for(I kk = Bp[j]; kk < Bp[j+1]; kk++){
+                I m = pos[Bj[kk]];
+                if(m != -1){
+                    Cx[m] += v*Bx[kk];
+                }
+            }
+        }
+
+        for(I mm = Cp[i]; mm < Cp[i+1]; mm++){
+            pos[Cj[mm]] = -1;
+        }
+    }
+}
+
 
 /*
  * Compute C = A (binary_op) B for CSR matrices that are not
@@ -1249,4 +1382,222 @@ void csr_sample_values(const I n_row,
     }
 }
 
+
+/*
+ * Find the positions of specific entries in the arrays of a matrix
+ *
+ *    Bp[n] = position of A(Bi[n],Bj[n]) in Aj and Ax
+ *
+ * Input Arguments:
+ *   I  n_row         - number of rows in A
+ *   I  n_col         - number of columns in A
+ *   I  Ap[n_row+1]   - row pointer
+ *   I  Aj[nnz(A)]    - column indices
+ *   I  n_samples     - number of samples
+ *   I  Bi[N]         - sample rows
+ *   I  Bj[N]         - sample columns
+ *
+ * Output Arguments:
+ *   I  Bp[N]         - sample offsets, -1 if the entry is not stored
+ *                      and -2 if it is stored more than once
+ *
+ * Note:
+ *   Output array Bp must be preallocated
+ *   Negative sample rows and columns count from the end, as for
+ *   csr_sample_values()
+ *
+ *   Complexity: O(n_samples * log(K)) when A is canonical and the
+ *   samples are many, where K is the maximum nnz in a row of A, and
+ *   O(n_samples * K) otherwise
+ */
+template <class I>
+void csr_sample_offsets(const I n_row,
+                        const I n_col,
+                        const I Ap[],
+                        const I Aj[],
+                        const I n_samples,
+                        const I Bi[],
+                        const I Bj[],
+                              I Bp[])
+{
+    const I nnz = Ap[n_row];
+
+    const I threshold = nnz / 10; // as in csr_sample_values()
+
+    const bool canonical = n_samples > threshold &&
+                           csr_has_canonical_format(n_row, Ap, Aj);
+
+    for(I n = 0; n < n_samples; n++)
+    {
+        const I i = Bi[n] < 0 ? Bi[n] + n_row : Bi[n]; // sample row
+        const I j = Bj[n] < 0 ? Bj[n] + n_col : Bj[n]; // sample column
+
+        const I row_start = Ap[i];
+        const I row_end   = Ap[i+1];
+
+        I offset = -1;
+
+        if (canonical)
+        {
+            const I jj = std::lower_bound(Aj + row_start, Aj + row_end, j) - Aj;
+            if (jj < row_end && Aj[jj] == j)
+                offset = jj;
+        }
+        else
+        {
+            for(I jj = row_start; jj < row_end; jj++)
+            {
+                if (Aj[jj] == j)
+                {
+                    if (offset != -1)
+                    {
+                        offset = -2;
+                        break;
+                    }
+                    offset = jj;
+                }
+            }
+        }
+
+        Bp[n] = offset;
+    }
+}
+
+
+/*
+ * Select a list of rows of a CSR matrix, B = A[rows,:]
+ *
+ * Input Arguments:
+ *   I  n_row_idx       - number of rows to select
+ *   I  rows[n_row_idx] - rows to select, in the range [0, n_row)
+ *   I  Ap[n_row+1]     - row pointer
+ *   I  Aj[nnz(A)]      - column indices
+ *   T  Ax[nnz(A)]      - nonzeros
+ *
+ * Output Arguments:
+ *   I  Bj[nnz(B)]      - column indices
+ *   T  Bx[nnz(B)]      - nonzeros
+ *
+ * Note:
+ *   Output arrays Bj and Bx must be preallocated, with the sum of
+ *   the lengths of the selected rows, which also give the row pointer
+ *   of B
+ *
+ *   Complexity: O(n_row_idx + nnz(B))
+ */
+template <class I, class T>
+void csr_row_index(const I n_row_idx,
+                   const I rows[],
+                   const I Ap[],
+                   const I Aj[],
+                   const T Ax[],
+                         I Bj[],
+                         T Bx[])
+{
+    for(I i = 0; i < n_row_idx; i++){
+        const I row_start = Ap[rows[i]];
+        const I row_end   = Ap[rows[i]+1];
+        Bj = std::copy(Aj + row_start, Aj + row_end, Bj);
+        Bx = std::copy(Ax + row_start, Ax + row_end, Bx);
+    }
+}
+
+
+/*
+ * Select a list of columns of a CSR matrix, B = A[:,col_idxs], in
+ * two passes.  Columns may be selected more than once.
+ *
+ * Pass 1 counts the selections of each column, and from them the row
+ * pointer of B.
+ *
+ * Input Arguments:
+ *   I  n_idx                - number of columns to select
+ *   I  col_idxs[n_idx]      - columns to select, in the range [0, n_col)
+ *   I  n_row                - number of rows in A
+ *   I  n_col                - number of columns in A
+ *   I  Ap[n_row+1]          - row pointer
+ *   I  Aj[nnz(A)]           - column indices
+ *
+ * Output Arguments:
+ *   I  col_offsets[n_col]   - cumulative number of selections of the
+ *                             columns, for Pass 2
+ *   I  Bp[n_row+1]          - row pointer of B
+ *
+ * Note:
+ *   Output arrays col_offsets and Bp must be preallocated, and
+ *   col_offsets set to zero
+ */
+template <class I>
+void csr_column_index1(const I n_idx,
+                       const I col_idxs[],
+                       const I n_row,
+                       const I n_col,
+                       const I Ap[],
+                       const I Aj[],
+                             I col_offsets[],
+                             I Bp[])
+{
+    for(I jj = 0; jj < n_idx; jj++){
+        col_offsets[col_idxs[jj]]++;
+    }
+
+    I new_nnz = 0;
+    Bp[0] = 0;
+    for(I i = 0; i < n_row; i++){
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            new_nnz += col_offsets[Aj[jj]];
+        }
+        Bp[i+1] = new_nnz;
+    }
+
+    for(I j = 1; j < n_col; j++){
+        col_offsets[j] += col_offsets[j-1];
+    }
+}
+
+/*
+ * Pass 2 fills the column indices and values of B = A[:,col_idxs]
+ *
+ * Input Arguments:
+ *   I  col_order[n_idx]     - argsort(col_idxs), stable
+ *   I  col_offsets[n_col]   - computed by Pass 1
+ *   I  nnz                  - nnz(A)
+ *   I  Aj[nnz(A)]           - column indices
+ *   T  Ax[nnz(A)]           - nonzeros
+ *
+ * Output Arguments:
+ *   I  Bj[nnz(B)]           - column indices
+ *   T  Bx[nnz(B)]           - nonzeros
+ *
+ * Note:
+ *   Output arrays Bj and Bx must be preallocated with the size given
+ *   by the row pointer of Pass 1
+ *
+ *   Complexity: O(nnz(A) + nnz(B))
+ */
+template <class I, class T>
+void csr_column_index2(const I col_order[],
+                       const I col_offsets[],
+                       const I nnz,
+                       const I Aj[],
+                       const T Ax[],
+                             I Bj[],
+                             T Bx[])
+{
+    I n = 0;
+    for(I jj = 0; jj < nnz; jj++){
+        const I j = Aj[jj];
+        const I offset = col_offsets[j];
+        const I prev_offset = j == 0 ? 0 : col_offsets[j-1];
+        if (offset != prev_offset){
+            const T v = Ax[jj];
+            for(I k = prev_offset; k < offset; k++){
+                Bj[n] = col_order[k];
+                Bx[n] = v;
+                n++;
+            }
+        }
+    }
+}
+
 #endif
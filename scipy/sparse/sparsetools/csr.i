@@ -1,7 +1,16 @@
-%module csr
+%module(threads="1") csr
 
 %include "sparsetools.i"
 
+/* only the products release the GIL, so that they can run in threads */
+%nothread;
+%thread csr_matvec;
+%thread csr_matvecs;
+%thread csr_matmat_pass1;
+%thread csr_matmat_pass2;
+%thread csr_matmat_pattern;
+%thread csr_matmat_masked;
+
 %{
 #include "csr.h"
 %}
@@ -11,8 +20,11 @@
 
 INSTANTIATE_INDEX(expandptr)
 INSTANTIATE_INDEX(csr_matmat_pass1)
+INSTANTIATE_INDEX(csr_matmat_pattern)
 INSTANTIATE_INDEX(csr_count_blocks)
 INSTANTIATE_INDEX(csr_has_sorted_indices)
+INSTANTIATE_INDEX(csr_sample_offsets)
+INSTANTIATE_INDEX(csr_column_index1)
 
 INSTANTIATE_ALL(csr_diagonal)
 INSTANTIATE_ALL(csr_scale_rows)
@@ -20,6 +32,7 @@ INSTANTIATE_ALL(csr_scale_columns)
 INSTANTIATE_ALL(csr_tocsc)
 INSTANTIATE_ALL(csr_tobsr)
 INSTANTIATE_ALL(csr_matmat_pass2)
+INSTANTIATE_ALL(csr_matmat_masked)
 INSTANTIATE_ALL(csr_matvec)
 INSTANTIATE_ALL(csr_matvecs)
 INSTANTIATE_ALL(csr_elmul_csr)
@@ -31,4 +44,6 @@ INSTANTIATE_ALL(csr_eliminate_zeros)
 INSTANTIATE_ALL(csr_sum_duplicates)
 INSTANTIATE_ALL(get_csr_submatrix)
 INSTANTIATE_ALL(csr_sample_values)
+INSTANTIATE_ALL(csr_row_index)
+INSTANTIATE_ALL(csr_column_index2)
 
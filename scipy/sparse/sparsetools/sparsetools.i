@@ -36,7 +36,11 @@
     const ctype Cp [ ],
     const ctype Ci [ ],	
     const ctype Cj [ ],
-    const ctype offsets [ ]
+    const ctype offsets [ ],
+    const ctype rows [ ],
+    const ctype col_idxs [ ],
+    const ctype col_order [ ],
+    const ctype col_offsets [ ]
 };
 %enddef
 
@@ -101,7 +105,8 @@
   ctype Bj [ ],
   ctype Cp [ ],
   ctype Ci [ ],
-  ctype Cj [ ]
+  ctype Cj [ ],
+  ctype col_offsets [ ]
 };
 %enddef
 
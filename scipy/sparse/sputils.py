@@ -2,9 +2,11 @@
 """
 
 __all__ = ['upcast','getdtype','isscalarlike','isintlike',
-            'isshape','issequence','isdense']
+            'isshape','issequence','isdense','set_num_threads',
+            'get_num_threads']
 
 import numpy as np
+from scipy.lib._threads import check_n_jobs as _check_n_jobs
 
 # keep this list syncronized with sparsetools
 #supported_dtypes = ['int8', 'uint8', 'int16', 'uint16', 'int32', 'uint32',
@@ -123,3 +125,28 @@ def _isinstance(x, _class):
 
 def isdense(x):
     return _isinstance(x, np.ndarray)
+
+_num_threads = 1
+
+# products of matrices with fewer nonzeros per thread are not split
+_MIN_NNZ_PER_THREAD = 20000
+
+def set_num_threads(n):
+    """Set the number of threads used by sparse matrix products.
+
+    The products of CSR and CSC matrices with dense vectors and arrays
+    split the matrix into blocks of about the same number of nonzeros,
+    which are multiplied in parallel. The default is 1, and -1 means
+    one thread per processor. Matrices too small to gain from it are
+    multiplied in the calling thread.
+    """
+    global _num_threads
+    _num_threads = _check_n_jobs(n)
+
+def get_num_threads():
+    """Return the number of threads used by sparse matrix products."""
+    return _num_threads
+
+def _thread_count(nnz):
+    """Number of threads to use for a product with nnz nonzeros."""
+    return max(1, min(_num_threads, nnz // _MIN_NNZ_PER_THREAD))
@@ -755,7 +755,7 @@ class _TestFancyIndexing:
             A = self.spmatrix((n, m))
             A[i, j] = 1
             assert_almost_equal(A.sum(), nitems)
-            assert_almost_equal(A[i, j], 1)
+            assert_almost_equal(A.toarray()[i, j], 1)
 
         # [i,j]
         for i, j in [(2, 3), (-1, 8), (-1, -2), (array(-1), -2), (-1, array(-2)), 
@@ -763,8 +763,9 @@ class _TestFancyIndexing:
             _test_set(i, j, 1)
 
         # [i,1:2]
-        for i, j in [(2, slice(m)), (2, slice(5, -2)), (array(2), slice(5, -2))]:
-            _test_set(i, j, 3)
+        for i, j, nitems in [(2, slice(m), m), (2, slice(5, -2), 3),
+                             (array(2), slice(5, -2), 3)]:
+            _test_set(i, j, nitems)
 
     def test_fancy_indexing(self):
         B = asmatrix(arange(50).reshape(5,10))
@@ -890,6 +891,106 @@ class _TestFancyIndexing:
         assert_raises(IndexError, S.__getitem__, (I,J_bad))
 
 
+class _TestFancyMasksAndAssignment:
+    """Tests boolean masks, stepped slices and bulk assignment.  The tests
+    for the compressed matrix formats should derive from this class.
+    """
+    def test_fancy_indexing_masks(self):
+        B = asmatrix(arange(50).reshape(5,10))
+        A = self.spmatrix( B )
+
+        rows = array([True, False, True, False, True])
+        cols = B.A[0] % 4 == 1
+
+        assert_equal(A[rows].todense(),       B[rows.nonzero()[0]])
+        assert_equal(A[rows,:].todense(),     B[rows.nonzero()[0],:])
+        assert_equal(A[:,cols].todense(),     B[:,cols.nonzero()[0]])
+        assert_equal(A[2:4,cols].todense(),   B[2:4,cols.nonzero()[0]])
+        assert_equal(A[rows,cols],            B[rows,cols])
+
+        assert_raises(IndexError, A.__getitem__, (rows[:-1],0))
+
+    def test_fancy_indexing_empty(self):
+        B = asmatrix(arange(50).reshape(5,10))
+        A = self.spmatrix( B )
+
+        rows = zeros(5, dtype=bool)
+        cols = zeros(10, dtype=bool)
+        for i,j in [(rows,slice(None)), (slice(None),cols), ([],slice(None)),
+                    (slice(None),[]), ([],2), (2,[]), (slice(1,3),[]),
+                    ([],slice(0,10,3)), ([[1],[3]],[])]:
+            C = A[i,j]
+            assert_equal(C.format, A.format)
+            assert_equal(C.shape, B[i,j].shape)
+            assert_equal(C.nnz, 0)
+        assert_equal(A[rows].shape, (0,10))
+        assert_equal(A[[]].shape, (0,10))
+
+        # assigning to an empty selection changes nothing
+        A[rows,:] = 7
+        A[:,[]] = 7
+        assert_equal(A.todense(), B)
+
+    def test_fancy_indexing_steps(self):
+        B = asmatrix(arange(50).reshape(5,10))
+        A = self.spmatrix( B )
+
+        assert_equal(A[::2].todense(),         B[::2])
+        assert_equal(A[::-1,:].todense(),      B[::-1,:])
+        assert_equal(A[:,1::3].todense(),      B[:,1::3])
+        assert_equal(A[1:4,::-2].todense(),    B[1:4,::-2])
+        assert_equal(A[[3,1],::4].todense(),   B[[3,1],::4])
+        assert_equal(A[2,8:1:-3].todense(),    B[2,8:1:-3])
+
+    def test_fancy_indexing_repeated(self):
+        B = asmatrix(arange(50).reshape(5,10))
+        A = self.spmatrix( B )
+
+        assert_equal(A[[3,1,3,3]].todense(),         B[[3,1,3,3]])
+        assert_equal(A[:,[9,0,9,-1]].todense(),      B[:,[9,0,9,-1]])
+        assert_equal(A[[4,4],:][:,[2,2]].todense(),  B[[4,4],:][:,[2,2]])
+
+    def test_fancy_assignment(self):
+        D = zeros((5,10))
+        A = self.spmatrix((5,10))
+
+        def check(i, j, val):
+            A[i,j] = val
+            D[i,j] = val
+            assert_equal(A.todense(), D)
+            A.check_format(full_check=True)
+
+        check([1,2,4], slice(3,7), arange(12).reshape(3,4))
+        check(slice(None), D[0] == 0, 7)
+        check(slice(None,None,2), 5, [1,2,3])
+        check([0,0,2], [1,1,5], [5,6,0])
+        check([-1,-2], [-1,-2], 3.5)
+        check(array([True,False,True,False,False]), slice(None), arange(10))
+        check(slice(1,3), [8,0], matrix([[1,2],[3,4]]))
+        check(2, slice(None), zeros(10))
+
+        A[3] = 9
+        D[3] = 9
+        assert_equal(A.todense(), D)
+
+        A[1:3,1:3] = csr_matrix([[0,1],[2,0]])
+        D[1:3,1:3] = [[0,1],[2,0]]
+        assert_equal(A.todense(), D)
+
+        # the new entries keep the indices sorted
+        assert_equal(A.has_sorted_indices, True)
+
+        assert_raises(IndexError, A.__setitem__, ([1,5],[2,3]), 1)
+        assert_raises(ValueError, A.__setitem__, ([1,2],[2,3]), [1,2,3])
+
+    def test_fancy_assignment_duplicates(self):
+        # the first row (CSR) or column (CSC) stores entry 1 twice
+        A = self.spmatrix( (array([1.,2.]), array([1,1]), array([0,2,2,2])),
+                           shape=(3,3) )
+        assert_raises(ValueError, A.__setitem__, ([0,1],[1,0]), 4)
+        assert_equal(A.data, [1,2])
+
+
 class _TestArithmetic:
     """
     Test real/complex arithmetic
@@ -974,14 +1075,9 @@ class _TestArithmetic:
 class TestCSR(_TestCommon, _TestGetSet, _TestSolve,
         _TestInplaceArithmetic, _TestArithmetic,
         _TestHorizSlicing, _TestVertSlicing, _TestBothSlicing,
-        _TestFancyIndexing, TestCase):
+        _TestFancyIndexing, _TestFancyMasksAndAssignment, TestCase):
     spmatrix = csr_matrix
 
-    @dec.knownfailureif(True, "Fancy indexing is known to be broken for CSR" \
-                              " matrices")
-    def test_fancy_indexing_set(self):
-        _TestFancyIndexing.test_fancy_indexing_set(self)
-
     def test_constructor1(self):
         b = matrix([[0,4,0],
                    [3,0,0],
@@ -1087,14 +1183,9 @@ class TestCSR(_TestCommon, _TestGetSet, _TestSolve,
 class TestCSC(_TestCommon, _TestGetSet, _TestSolve,
         _TestInplaceArithmetic, _TestArithmetic,
         _TestHorizSlicing, _TestVertSlicing, _TestBothSlicing,
-        _TestFancyIndexing, TestCase):
+        _TestFancyIndexing, _TestFancyMasksAndAssignment, TestCase):
     spmatrix = csc_matrix
 
-    @dec.knownfailureif(True, "Fancy indexing is known to be broken for CSC" \
-                              " matrices")
-    def test_fancy_indexing_set(self):
-        _TestFancyIndexing.test_fancy_indexing_set(self)
-
     def test_constructor1(self):
         b = matrix([[1,0,0,0],[0,0,1,0],[0,2,0,3]],'d')
         bsp = csc_matrix(b)
@@ -1277,6 +1368,45 @@ class TestDOK(_TestCommon, _TestGetSet, _TestSolve, TestCase):
             caught += 1
         assert_equal(caught,5)
 
+    def test_set_sequence(self):
+        A = dok_matrix((5,10))
+        B = zeros((5,10), float)
+
+        A[[4,0,-2],3] = [1,2,3]
+        B[[4,0,-2],3] = [1,2,3]
+        assert_array_equal(A.todense(), B)
+
+        A[2,array([9,0,9])] = [5,6,7]
+        B[2,array([9,0,9])] = [5,6,7]
+        assert_array_equal(A.todense(), B)
+
+        # zeros delete entries, and the last assignment wins
+        A[[4,4,0],3] = [8,0,0]
+        B[[4,4,0],3] = [8,0,0]
+        assert_array_equal(A.todense(), B)
+        assert_equal(A.nnz, 3)
+
+        A[1:4,::3] = 2
+        B[1:4,::3] = 2
+        assert_array_equal(A.todense(), B)
+
+        A[1:3,-2:] = [[1,0],[0,4]]
+        B[1:3,-2:] = [[1,0],[0,4]]
+        assert_array_equal(A.todense(), B)
+        assert_equal(A.nnz, (B != 0).sum())
+
+        assert_raises(IndexError, A.__setitem__, ([1,5],3), 1)
+        assert_raises(ValueError, A.__setitem__, (1,[2,3]), [1,2,3])
+
+    def test_tocoo(self):
+        A = dok_matrix((3,4), dtype=complex)
+        A[0,1] = 1j
+        A[2,3] = 2
+        A[1,0] = -1
+        B = A.tocoo()
+        assert_equal(B.dtype, complex)
+        assert_equal(B.todense(), [[0,1j,0,0],[-1,0,0,0],[0,0,0,2]])
+
     def test_ctor(self):
         caught = 0
         # Empty ctor
@@ -1418,6 +1548,47 @@ class TestLIL( _TestCommon, _TestHorizSlicing, _TestVertSlicing,
         A[1:3,1] = [[10],[20]]
         assert_array_equal(A.todense(), [[0,0],[0,10],[0,20]])
 
+    def test_lil_block_assignment(self):
+        A = lil_matrix((5,6))
+        B = zeros((5,6))
+
+        def check(i, j, x):
+            A[i,j] = x
+            B[i,j] = x
+            assert_array_equal(A.todense(), B)
+            for row in A.rows:
+                assert_equal(row, sorted(row))
+            assert_equal(A.nnz, (B != 0).sum())
+
+        check(slice(1,4), slice(0,6,2), [[1,2,3],[4,5,6],[7,8,9]])
+        check(slice(None), 5, 3)
+        check(slice(None), 1, [1,0,2,0,3])
+        check(slice(1,3), slice(None), 0)
+        check(array([4,0]), slice(None,None,-1), arange(6))
+        check(3, [0,-1], [8,9])
+        check(array([True,False,True,False,True]), 2, 4)
+
+        A[0:2,3:5] = csr_matrix([[0,1],[2,0]])
+        B[0:2,3:5] = [[0,1],[2,0]]
+        assert_array_equal(A.todense(), B)
+
+        # the last assignment to repeated rows and columns wins
+        A[[1,1],[2,3,2]] = [[1,2,3],[4,5,0]]
+        B[1,[2,3]] = [0,5]
+        assert_array_equal(A.todense(), B)
+
+        assert_raises(IndexError, A.__setitem__, ([0,5],1), 1)
+        assert_raises(IndexError, A.__setitem__, ([0,1],[1,2]), [1,2,3])
+
+    def test_lil_tocsr(self):
+        B = array([[0,1,0,2],[0,0,0,0],[3,0,4,0]], dtype=complex)
+        B[0,1] = 1j
+        A = lil_matrix(B)
+        C = A.tocsr()
+        assert_equal(C.dtype, complex)
+        assert_equal(C.todense(), B)
+        assert_array_equal(lil_matrix(C).rows, A.rows)
+
     def test_lil_iteration(self):
         row_data = [[1,2,3],[4,5,6]]
         B = lil_matrix(array(row_data))
@@ -1603,5 +1774,64 @@ class TestBSR(_TestCommon, _TestArithmetic, _TestInplaceArithmetic, TestCase):
         assert_equal(A*x, A.todense()*x)
 
 
+class TestThreadedProducts(TestCase):
+    def setUp(self):
+        self.min_nnz = sparse.sputils._MIN_NNZ_PER_THREAD
+        sparse.sputils._MIN_NNZ_PER_THREAD = 10
+        sparse.set_num_threads(3)
+
+    def tearDown(self):
+        sparse.sputils._MIN_NNZ_PER_THREAD = self.min_nnz
+        sparse.set_num_threads(1)
+
+    def test_products(self):
+        np.random.seed(1234)
+        D = np.random.rand(40, 30)
+        D[D < 0.7] = 0
+        x = np.random.rand(30)
+        X = np.random.rand(30, 4)
+        for spmatrix in [csr_matrix, csc_matrix]:
+            A = spmatrix(D)
+            assert_array_almost_equal(A * x, dot(D, x))
+            assert_array_almost_equal(A * X, dot(D, X))
+            assert_array_almost_equal(A * matrix(x).T, dot(D, x)[:,None])
+            assert_array_almost_equal(A * (X + 1j), dot(D, X + 1j))
+            assert_array_almost_equal(A.T * np.ones(40), D.sum(axis=0))
+            A = spmatrix(D * 10, dtype=np.int32)
+            xi = np.arange(30, dtype=np.int32)
+            assert_equal(A * xi, dot(A.toarray(), xi))
+            assert_equal((A * xi).dtype, np.int32)
+
+    def test_sparse_products(self):
+        np.random.seed(1234)
+        D = np.random.rand(40, 30)
+        D[D < 0.8] = 0
+        E = np.random.rand(30, 35)
+        E[E < 0.8] = 0
+        for spmatrix in [csr_matrix, csc_matrix]:
+            A = spmatrix(D)
+            B = spmatrix(E)
+            assert_array_almost_equal((A * B).todense(), dot(D, E))
+            assert_array_almost_equal((B.T * A.T).todense(), dot(D, E).T)
+            assert_array_almost_equal(
+                    sparse.spmatmul(A, B, mask=A * B).todense(), dot(D, E))
+            C = sparse.spmatmul(A, B, structure_only=True)
+            assert_array_equal(C.todense(), dot(D != 0, E != 0))
+
+    def test_empty_rows(self):
+        D = np.zeros((50, 20))
+        D[45:, :] = 1
+        for spmatrix in [csr_matrix, csc_matrix]:
+            A = spmatrix(D)
+            assert_array_almost_equal(A * np.ones(20), D.sum(axis=1))
+            assert_array_almost_equal(A.T * np.ones(50), D.sum(axis=0))
+
+    def test_num_threads(self):
+        self.failUnless(sparse.get_num_threads() == 3)
+        sparse.set_num_threads(-1)
+        self.failUnless(sparse.get_num_threads() >= 1)
+        self.failUnlessRaises(ValueError, sparse.set_num_threads, 0)
+
+
 if __name__ == "__main__":
     run_module_suite()
@@ -0,0 +1,109 @@
+"""test incremental construction of sparse matrices"""
+
+import numpy as np
+from numpy import array, zeros
+from numpy.testing import *
+
+from scipy.sparse import coo_builder, isspmatrix_csr, isspmatrix_csc, \
+        isspmatrix_coo
+
+
+class TestCooBuilder(TestCase):
+    def test_append(self):
+        B = coo_builder((4,5))
+        assert_equal(len(B), 0)
+        assert_equal(B.tocsr().todense(), zeros((4,5)))
+
+        B.append(0, 1, 2.0)
+        B.append([3,2,0], [4,0,1], [1.0,5.0,3.0])
+        B.append([1,2], 3, 7)
+        assert_equal(len(B), 6)
+
+        expected = array([[0,5,0,0,0],
+                          [0,0,0,7,0],
+                          [5,0,0,7,0],
+                          [0,0,0,0,1]])
+
+        A = B.tocsr()
+        assert(isspmatrix_csr(A))
+        assert_equal(A.todense(), expected)
+        assert_equal(A.nnz, 5)
+
+        A = B.tocsc()
+        assert(isspmatrix_csc(A))
+        assert_equal(A.todense(), expected)
+
+        # duplicates are kept until the matrix is finalized
+        A = B.tocoo()
+        assert(isspmatrix_coo(A))
+        assert_equal(A.nnz, 6)
+        assert_equal(A.todense(), expected)
+
+    def test_growth(self):
+        B = coo_builder((100,100), nnz=3)
+        for k in range(100):
+            B.append(k, (7 * k) % 100, k)
+        B.append(np.arange(100), np.arange(100), 1)
+        assert_equal(len(B), 200)
+
+        expected = np.eye(100)
+        expected[np.arange(100), (7 * np.arange(100)) % 100] += np.arange(100)
+        assert_equal(B.tocsr().todense(), expected)
+
+        B.clear()
+        assert_equal(len(B), 0)
+        assert_equal(B.tocsr().nnz, 0)
+
+    def test_add_block(self):
+        elements = array([[0,1,2],[2,3,4],[4,5,0]])
+        Ke = array([[ 2,-1,-1],
+                    [-1, 2,-1],
+                    [-1,-1, 2]], dtype=float)
+
+        expected = zeros((6,6))
+        for e in elements:
+            expected[np.ix_(e,e)] += Ke
+
+        B = coo_builder((6,6))
+        for e in elements:
+            B.add_block(e, e, Ke)
+        assert_equal(B.tocsr().todense(), expected)
+
+        # a stack of blocks in one call
+        B = coo_builder((6,6))
+        B.add_block(elements, elements, [Ke] * len(elements))
+        assert_equal(B.tocsr().todense(), expected)
+
+        # rectangular blocks
+        B = coo_builder((6,6))
+        B.add_block([1,4], [0,2,5], [[1,2,3],[4,5,6]])
+        expected = zeros((6,6))
+        expected[np.ix_([1,4],[0,2,5])] = [[1,2,3],[4,5,6]]
+        assert_equal(B.tocsr().todense(), expected)
+
+        assert_raises(ValueError, B.add_block, [0,1], [0,1], Ke)
+
+    def test_dtype(self):
+        B = coo_builder((3,3), dtype=np.complex128)
+        B.append([0,1], [1,2], [1j,2])
+        A = B.tocsr()
+        assert_equal(A.dtype, np.complex128)
+        assert_equal(A.todense(), [[0,1j,0],[0,0,2],[0,0,0]])
+
+        B = coo_builder((3,3), dtype=np.int32)
+        B.append(0, 0, 3)
+        assert_equal(B.tocsr().dtype, np.int32)
+
+    def test_bad_input(self):
+        assert_raises(TypeError, coo_builder, (3,))
+
+        B = coo_builder((3,4))
+        assert_raises(ValueError, B.append, 3, 0, 1)
+        assert_raises(ValueError, B.append, 0, 4, 1)
+        assert_raises(ValueError, B.append, -1, 0, 1)
+        assert_raises(ValueError, B.append, [0,1], [0,1,2], 1)
+        assert_equal(len(B), 0)
+
+
+if __name__ == "__main__":
+    run_module_suite()
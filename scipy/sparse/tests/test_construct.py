@@ -131,6 +131,34 @@ class TestConstructUtils(TestCase):
                         np.kron(b, np.eye(len(a)))
                 assert_array_equal(result,expected)
 
+    def test_spmatmul(self):
+        a = array([[0,2,-6],[8,0,14],[0,3,0]])
+        b = array([[1,0,0],[0,5,-1],[4,-2,8]])
+        m = array([[1,0,1],[0,0,0],[1,1,0]])
+        for format in ['csr', 'csc']:
+            result = spmatmul(csr_matrix(a), b, format=format)
+            self.failUnless(result.format == format)
+            assert_array_equal(result.todense(), np.dot(a, b))
+
+            result = spmatmul(csr_matrix(a), b, mask=m, format=format)
+            assert_array_equal(result.todense(), np.dot(a, b) * m)
+
+            result = spmatmul(csr_matrix(a), b, structure_only=True,
+                              format=format)
+            expected = np.dot(a != 0, b != 0)
+            assert_array_equal(result.todense(), expected)
+
+        # the structure keeps the entries that cancel out
+        a = array([[1,-1]])
+        b = array([[1],[1]])
+        assert_array_equal(spmatmul(csr_matrix(a), b).nnz, 0)
+        assert_array_equal(spmatmul(csr_matrix(a), b,
+                                    structure_only=True).todense(), [[1]])
+
+        self.failUnlessRaises(ValueError, spmatmul, csr_matrix(a), a)
+        self.failUnlessRaises(ValueError, spmatmul, csr_matrix(a), b,
+                              mask=[[1,1]])
+
     def test_vstack(self):
 
         A = coo_matrix([[1,2],[3,4]])
@@ -5,6 +5,7 @@
 from info import __doc__
 from kdtree import *
 from ckdtree import *
+from dynamic import *
 
 __all__ = filter(lambda s:not s.startswith('_'),dir())
 __all__ += ['distance']
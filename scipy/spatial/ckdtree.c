@@ -1,4 +1,4 @@
-/* Generated by Cython 0.10.3 on Thu Mar 12 23:38:09 2009 */
+/* Generated by Cython 0.10.3 on Sun Oct 18 04:34:31 2026 */
 
 #define PY_SSIZE_T_CLEAN
 #include "Python.h"
@@ -230,6 +230,13 @@ static const char* __Pyx_CheckTypestring_int(const char* ts); /*proto*/
 static int __Pyx_GetBuffer_int(PyObject* obj, Py_buffer* buf, int flags, int nd, int cast); /*proto*/
 static void __Pyx_RaiseBufferIndexError(int axis); /*proto*/
 #define __Pyx_BufPtrStrided2d(type, buf, i0, s0, i1, s1) (type)((char*)buf + i0 * s0 + i1 * s1)
+static const char* __Pyx_CheckTypestring_nn___pyx_t_5numpy_int_t(const char* ts); /*proto*/
+
+static int __Pyx_GetBuffer_nn___pyx_t_5numpy_int_t(PyObject* obj, Py_buffer* buf, int flags, int nd, int cast); /*proto*/
+#define __Pyx_BufPtrStrided1d(type, buf, i0, s0) (type)((char*)buf + i0 * s0)
+
+static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
+    const char *name, int exact); /*proto*/
 #if PY_MAJOR_VERSION < 3
 static int __Pyx_GetBuffer(PyObject *obj, Py_buffer *view, int flags);
 static void __Pyx_ReleaseBuffer(Py_buffer *view);
@@ -245,20 +252,123 @@ static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list); /*proto*/
 
 static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
 
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-
 static PyObject *__Pyx_UnpackItem(PyObject *, Py_ssize_t index); /*proto*/
 static int __Pyx_EndUnpack(PyObject *); /*proto*/
 
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+
 static int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
 
+static INLINE PyObject* __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
+    if (likely(PyList_CheckExact(L))) {
+        if (PyList_Append(L, x) < 0) return NULL;
+        Py_INCREF(Py_None);
+        return Py_None; // this is just to have an accurate signature
+    }
+    else {
+        return PyObject_CallMethod(L, "append", "(O)", x);
+    }
+}
+
+#if PY_VERSION_HEX < 0x02050000
+#ifndef PyAnySet_CheckExact
+
+#define PyAnySet_CheckExact(ob) \
+    ((ob)->ob_type == &PySet_Type || \
+     (ob)->ob_type == &PyFrozenSet_Type)
+
+#define PySet_New(iterable) \
+    PyObject_CallFunctionObjArgs((PyObject *)&PySet_Type, (iterable), NULL)
+
+#define Pyx_PyFrozenSet_New(iterable) \
+    PyObject_CallFunctionObjArgs((PyObject *)&PyFrozenSet_Type, (iterable), NULL)
+
+#define PySet_Size(anyset) \
+    PyObject_Size((anyset))
+
+#define PySet_Contains(anyset, key) \
+    PySequence_Contains((anyset), (key))
+
+#define PySet_Pop(set) \
+    PyObject_CallMethod(set, "pop", NULL)
+
+static INLINE int PySet_Clear(PyObject *set) {
+    PyObject *ret = PyObject_CallMethod(set, "clear", NULL);
+    if (!ret) return -1;
+    Py_DECREF(ret); return 0;
+}
+
+static INLINE int PySet_Discard(PyObject *set, PyObject *key) {
+    PyObject *ret = PyObject_CallMethod(set, "discard", "O", key);
+    if (!ret) return -1;
+    Py_DECREF(ret); return 0;
+}
+
+static INLINE int PySet_Add(PyObject *set, PyObject *key) {
+    PyObject *ret = PyObject_CallMethod(set, "add", "O", key);
+    if (!ret) return -1;
+    Py_DECREF(ret); return 0;
+}
+
+#endif /* PyAnySet_CheckExact (<= Py2.4) */
+
+#if PY_VERSION_HEX < 0x02040000
+#ifndef Py_SETOBJECT_H
+#define Py_SETOBJECT_H
+
+static PyTypeObject *__Pyx_PySet_Type = NULL;
+static PyTypeObject *__Pyx_PyFrozenSet_Type = NULL;
+
+#define PySet_Type (*__Pyx_PySet_Type)
+#define PyFrozenSet_Type (*__Pyx_PyFrozenSet_Type)
+
+#define PyAnySet_Check(ob) \
+    (PyAnySet_CheckExact(ob) || \
+     PyType_IsSubtype((ob)->ob_type, &PySet_Type) || \
+     PyType_IsSubtype((ob)->ob_type, &PyFrozenSet_Type))
+
+#define PyFrozenSet_CheckExact(ob) ((ob)->ob_type == &PyFrozenSet_Type)
+
+static int __Pyx_Py23SetsImport(void) {
+    PyObject *sets=0, *Set=0, *ImmutableSet=0;
+
+    sets = PyImport_ImportModule("sets");
+    if (!sets) goto bad;
+    Set = PyObject_GetAttrString(sets, "Set");
+    if (!Set) goto bad;
+    ImmutableSet = PyObject_GetAttrString(sets, "ImmutableSet");
+    if (!ImmutableSet) goto bad;
+    Py_DECREF(sets);
+  
+    __Pyx_PySet_Type       = (PyTypeObject*) Set;
+    __Pyx_PyFrozenSet_Type = (PyTypeObject*) ImmutableSet;
+
+    /* FIXME: this should be done in dedicated module cleanup code */
+    /*
+    Py_DECREF(Set);
+    Py_DECREF(ImmutableSet);
+    */
+
+    return 0;
+
+ bad:
+    Py_XDECREF(sets);
+    Py_XDECREF(Set);
+    Py_XDECREF(ImmutableSet);
+    return -1;
+}
+
+#else
+static int __Pyx_Py23SetsImport(void) { return 0; }
+#endif /* !Py_SETOBJECT_H */
+#endif /* < Py2.4  */
+#endif /* < Py2.5  */
+
 static INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
 static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
 
 static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
 
-static void __Pyx_WriteUnraisable(const char *name); /*proto*/
-
 static int __Pyx_SetVtable(PyObject *dict, void *vtable); /*proto*/
 
 static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name, long size);  /*proto*/
@@ -311,7 +421,7 @@ typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
 
 typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":15
+/* "/root/package/scipy/spatial/ckdtree.pyx":24
  * 
  * # priority queue
  * cdef union heapcontents:             # <<<<<<<<<<<<<<
@@ -324,7 +434,7 @@ union __pyx_t_5scipy_7spatial_7ckdtree_heapcontents {
   char *ptrdata;
 };
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":19
+/* "/root/package/scipy/spatial/ckdtree.pyx":28
  *     char* ptrdata
  * 
  * cdef struct heapitem:             # <<<<<<<<<<<<<<
@@ -337,7 +447,7 @@ struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem {
   union __pyx_t_5scipy_7spatial_7ckdtree_heapcontents contents;
 };
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":23
+/* "/root/package/scipy/spatial/ckdtree.pyx":32
  *     heapcontents contents
  * 
  * cdef struct heap:             # <<<<<<<<<<<<<<
@@ -351,7 +461,7 @@ struct __pyx_t_5scipy_7spatial_7ckdtree_heap {
   int space;
 };
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":139
+/* "/root/package/scipy/spatial/ckdtree.pyx":223
  * 
  * # Tree structure
  * cdef struct innernode:             # <<<<<<<<<<<<<<
@@ -362,12 +472,14 @@ struct __pyx_t_5scipy_7spatial_7ckdtree_heap {
 struct __pyx_t_5scipy_7spatial_7ckdtree_innernode {
   int split_dim;
   int n_points;
+  int start_idx;
+  int end_idx;
   double split;
   struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *less;
   struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *greater;
 };
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":145
+/* "/root/package/scipy/spatial/ckdtree.pyx":231
  *     innernode* less
  *     innernode* greater
  * cdef struct leafnode:             # <<<<<<<<<<<<<<
@@ -382,7 +494,24 @@ struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode {
   int end_idx;
 };
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":153
+/* "/root/package/scipy/spatial/ckdtree.pyx":239
+ * # flat representation of the tree, one entry per node in depth-first
+ * # order, used for pickling and saving
+ * cdef struct flatnodes:             # <<<<<<<<<<<<<<
+ *     np.int32_t* split_dim
+ *     double* split
+ */
+
+struct __pyx_t_5scipy_7spatial_7ckdtree_flatnodes {
+  __pyx_t_5numpy_int32_t *split_dim;
+  double *split;
+  __pyx_t_5numpy_int32_t *start_idx;
+  __pyx_t_5numpy_int32_t *end_idx;
+  __pyx_t_5numpy_int32_t *less;
+  __pyx_t_5numpy_int32_t *greater;
+};
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":249
  * # this is the standard trick for variable-size arrays:
  * # malloc sizeof(nodeinfo)+self.m*sizeof(double) bytes.
  * cdef struct nodeinfo:             # <<<<<<<<<<<<<<
@@ -395,7 +524,7 @@ struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo {
   double side_distances[0];
 };
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":157
+/* "/root/package/scipy/spatial/ckdtree.pyx":253
  *     double side_distances[0]
  * 
  * cdef class cKDTree:             # <<<<<<<<<<<<<<
@@ -424,7 +553,21 @@ struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree {
 struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree {
   struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *(*__build)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, int, int, double *, double *);
   PyObject *(*__free_tree)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *);
+  int (*__count_nodes)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *);
+  int (*__flatten)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *, int, struct __pyx_t_5scipy_7spatial_7ckdtree_flatnodes *);
+  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *(*__unflatten)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, int, struct __pyx_t_5scipy_7spatial_7ckdtree_flatnodes *);
   void (*__query)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, double *, int *, double *, int, double, double, double);
+  void (*__query_range)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, double *, int *, double *, int, int, int, double, double, double);
+  PyObject *(*__query_ball_point_traverse_no_checking)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, PyObject *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *);
+  PyObject *(*__query_ball_point_traverse_checking)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, PyObject *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *, double *, double *, double *, double, double, double, double);
+  PyObject *(*__query_ball_point)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, double *, double, double, double);
+  PyObject *(*__query_ball_tree_traverse_no_checking)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, PyObject *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *);
+  PyObject *(*__query_ball_tree_traverse_checking)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, PyObject *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *, double *, double *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *, double *, double *, double, double, double, double);
+  PyObject *(*__query_pairs_traverse_no_checking)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, PyObject *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *);
+  PyObject *(*__query_pairs_add)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, PyObject *, int, int);
+  PyObject *(*__query_pairs_traverse_checking)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, PyObject *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *, double *, double *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *, double *, double *, double, double, double, double);
+  PyObject *(*__count_neighbors_traverse)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, __pyx_t_5numpy_int_t *, double *, int *, int, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *, double *, double *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *, double *, double *, double);
+  PyObject *(*__sparse_distance_matrix_traverse)(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *, PyObject *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *, double *, double *, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *, double *, double *, double, double);
 };
 static struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *__pyx_vtabptr_5scipy_7spatial_7ckdtree_cKDTree;
 /* Module declarations from python_buffer */
@@ -441,51 +584,115 @@ static PyTypeObject *__pyx_ptype_5numpy_ndarray = 0;
 
 static PyTypeObject *__pyx_ptype_5scipy_7spatial_7ckdtree_cKDTree = 0;
 static double __pyx_v_5scipy_7spatial_7ckdtree_infinity;
-static double __pyx_k_24;
-static PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapcreate(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *, int); /*proto*/
-static PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapdestroy(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *); /*proto*/
-static PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapresize(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *, int); /*proto*/
-static PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heappush(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *, struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem); /*proto*/
+static double __pyx_k_27;
+static void __pyx_f_5scipy_7spatial_7ckdtree_heapcreate(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *, int); /*proto*/
+static void __pyx_f_5scipy_7spatial_7ckdtree_heapdestroy(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *); /*proto*/
+static int __pyx_f_5scipy_7spatial_7ckdtree_heapresize(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *, int); /*proto*/
+static void __pyx_f_5scipy_7spatial_7ckdtree_heappush(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *, struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem); /*proto*/
 static struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_f_5scipy_7spatial_7ckdtree_heappeek(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *); /*proto*/
-static PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *); /*proto*/
+static void __pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *); /*proto*/
 static struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_f_5scipy_7spatial_7ckdtree_heappop(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *); /*proto*/
 static double __pyx_f_5scipy_7spatial_7ckdtree_dmax(double, double); /*proto*/
 static double __pyx_f_5scipy_7spatial_7ckdtree_dabs(double); /*proto*/
 static double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *, double *, double, int, double); /*proto*/
+static double __pyx_f_5scipy_7spatial_7ckdtree__distance_power(double, double); /*proto*/
+static double __pyx_f_5scipy_7spatial_7ckdtree__combine(double, double, double); /*proto*/
+static double __pyx_f_5scipy_7spatial_7ckdtree__min_distance_point(double *, double *, double *, double, int); /*proto*/
+static double __pyx_f_5scipy_7spatial_7ckdtree__max_distance_point(double *, double *, double *, double, int); /*proto*/
+static double __pyx_f_5scipy_7spatial_7ckdtree__min_distance_rectangle(double *, double *, double *, double *, double, int); /*proto*/
+static double __pyx_f_5scipy_7spatial_7ckdtree__max_distance_rectangle(double *, double *, double *, double *, double, int); /*proto*/
+static double *__pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(double *, double *, int, double, int, int); /*proto*/
 
 
 /* Implementation of scipy.spatial.ckdtree */
 static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_1;
 static char __pyx_k___init__[] = "__init__";
 static PyObject *__pyx_kp___init__;
+static char __pyx_k___getstate__[] = "__getstate__";
+static PyObject *__pyx_kp___getstate__;
+static char __pyx_k___setstate__[] = "__setstate__";
+static PyObject *__pyx_kp___setstate__;
+static char __pyx_k___reduce__[] = "__reduce__";
+static PyObject *__pyx_kp___reduce__;
+static char __pyx_k_save[] = "save";
+static PyObject *__pyx_kp_save;
 static char __pyx_k___dealloc__[] = "__dealloc__";
 static PyObject *__pyx_kp___dealloc__;
+static char __pyx_k__query_block[] = "_query_block";
+static PyObject *__pyx_kp__query_block;
 static char __pyx_k_query[] = "query";
 static PyObject *__pyx_kp_query;
+static char __pyx_k_query_ball_point[] = "query_ball_point";
+static PyObject *__pyx_kp_query_ball_point;
+static char __pyx_k_query_ball_tree[] = "query_ball_tree";
+static PyObject *__pyx_kp_query_ball_tree;
+static char __pyx_k_query_pairs[] = "query_pairs";
+static PyObject *__pyx_kp_query_pairs;
+static char __pyx_k_count_neighbors[] = "count_neighbors";
+static PyObject *__pyx_kp_count_neighbors;
+static char __pyx_k_23[] = "sparse_distance_matrix";
+static PyObject *__pyx_kp_23;
 static char __pyx_k_data[] = "data";
 static PyObject *__pyx_kp_data;
 static char __pyx_k_leafsize[] = "leafsize";
 static PyObject *__pyx_kp_leafsize;
-static char __pyx_k_x[] = "x";
-static PyObject *__pyx_kp_x;
+static char __pyx_k_state[] = "state";
+static PyObject *__pyx_kp_state;
+static char __pyx_k_dirname[] = "dirname";
+static PyObject *__pyx_kp_dirname;
+static char __pyx_k_dd[] = "dd";
+static PyObject *__pyx_kp_dd;
+static char __pyx_k_ii[] = "ii";
+static PyObject *__pyx_kp_ii;
+static char __pyx_k_xx[] = "xx";
+static PyObject *__pyx_kp_xx;
+static char __pyx_k_start[] = "start";
+static PyObject *__pyx_kp_start;
+static char __pyx_k_stop[] = "stop";
+static PyObject *__pyx_kp_stop;
 static char __pyx_k_k[] = "k";
 static PyObject *__pyx_kp_k;
 static char __pyx_k_eps[] = "eps";
 static PyObject *__pyx_kp_eps;
 static char __pyx_k_p[] = "p";
 static PyObject *__pyx_kp_p;
-static char __pyx_k_23[] = "distance_upper_bound";
-static PyObject *__pyx_kp_23;
+static char __pyx_k_24[] = "distance_upper_bound";
+static PyObject *__pyx_kp_24;
+static char __pyx_k_x[] = "x";
+static PyObject *__pyx_kp_x;
+static char __pyx_k_n_jobs[] = "n_jobs";
+static PyObject *__pyx_kp_n_jobs;
+static char __pyx_k_r[] = "r";
+static PyObject *__pyx_kp_r;
+static char __pyx_k_other[] = "other";
+static PyObject *__pyx_kp_other;
+static char __pyx_k_max_distance[] = "max_distance";
+static PyObject *__pyx_kp_max_distance;
 static char __pyx_k_numpy[] = "numpy";
 static PyObject *__pyx_kp_numpy;
 static char __pyx_k_np[] = "np";
 static PyObject *__pyx_kp_np;
+static char __pyx_k_copy_reg[] = "copy_reg";
+static PyObject *__pyx_kp_copy_reg;
 static char __pyx_k_kdtree[] = "kdtree";
 static PyObject *__pyx_kp_kdtree;
+static char __pyx_k_25[] = "scipy.sparse";
+static PyObject *__pyx_kp_25;
+static char __pyx_k_scipy[] = "scipy";
+static PyObject *__pyx_kp_scipy;
+static char __pyx_k_26[] = "scipy.lib._threads";
+static PyObject *__pyx_kp_26;
+static char __pyx_k_check_n_jobs[] = "check_n_jobs";
+static PyObject *__pyx_kp_check_n_jobs;
+static char __pyx_k_run_threads[] = "run_threads";
+static PyObject *__pyx_kp_run_threads;
+static char __pyx_k__check_n_jobs[] = "_check_n_jobs";
+static PyObject *__pyx_kp__check_n_jobs;
+static char __pyx_k__run_threads[] = "_run_threads";
+static PyObject *__pyx_kp__run_threads;
 static char __pyx_k_inf[] = "inf";
 static PyObject *__pyx_kp_inf;
-static char __pyx_k_ValueError[] = "ValueError";
-static PyObject *__pyx_kp_ValueError;
 static char __pyx_k_ascontiguousarray[] = "ascontiguousarray";
 static PyObject *__pyx_kp_ascontiguousarray;
 static char __pyx_k_dtype[] = "dtype";
@@ -494,6 +701,8 @@ static char __pyx_k_float[] = "float";
 static PyObject *__pyx_kp_float;
 static char __pyx_k_shape[] = "shape";
 static PyObject *__pyx_kp_shape;
+static char __pyx_k_ValueError[] = "ValueError";
+static PyObject *__pyx_kp_ValueError;
 static char __pyx_k_amax[] = "amax";
 static PyObject *__pyx_kp_amax;
 static char __pyx_k_axis[] = "axis";
@@ -502,8 +711,56 @@ static char __pyx_k_amin[] = "amin";
 static PyObject *__pyx_kp_amin;
 static char __pyx_k_arange[] = "arange";
 static PyObject *__pyx_kp_arange;
-static char __pyx_k_27[] = "int32";
-static PyObject *__pyx_kp_27;
+static char __pyx_k_29[] = "int32";
+static PyObject *__pyx_kp_29;
+static char __pyx_k_empty[] = "empty";
+static PyObject *__pyx_kp_empty;
+static char __pyx_k_array[] = "array";
+static PyObject *__pyx_kp_array;
+static char __pyx_k_maxes[] = "maxes";
+static PyObject *__pyx_kp_maxes;
+static char __pyx_k_mins[] = "mins";
+static PyObject *__pyx_kp_mins;
+static char __pyx_k_indices[] = "indices";
+static PyObject *__pyx_kp_indices;
+static char __pyx_k_split_dim[] = "split_dim";
+static PyObject *__pyx_kp_split_dim;
+static char __pyx_k_split[] = "split";
+static PyObject *__pyx_kp_split;
+static char __pyx_k_start_idx[] = "start_idx";
+static PyObject *__pyx_kp_start_idx;
+static char __pyx_k_end_idx[] = "end_idx";
+static PyObject *__pyx_kp_end_idx;
+static char __pyx_k_less[] = "less";
+static PyObject *__pyx_kp_less;
+static char __pyx_k_greater[] = "greater";
+static PyObject *__pyx_kp_greater;
+static char __pyx_k_30[] = "data";
+static PyObject *__pyx_kp_30;
+static char __pyx_k_31[] = "leafsize";
+static PyObject *__pyx_kp_31;
+static char __pyx_k_32[] = "maxes";
+static PyObject *__pyx_kp_32;
+static char __pyx_k_33[] = "mins";
+static PyObject *__pyx_kp_33;
+static char __pyx_k_34[] = "indices";
+static PyObject *__pyx_kp_34;
+static char __pyx_k_35[] = "split_dim";
+static PyObject *__pyx_kp_35;
+static char __pyx_k_36[] = "split";
+static PyObject *__pyx_kp_36;
+static char __pyx_k_37[] = "start_idx";
+static PyObject *__pyx_kp_37;
+static char __pyx_k_38[] = "end_idx";
+static PyObject *__pyx_kp_38;
+static char __pyx_k_39[] = "less";
+static PyObject *__pyx_kp_39;
+static char __pyx_k_40[] = "greater";
+static PyObject *__pyx_kp_40;
+static char __pyx_k___newobj__[] = "__newobj__";
+static PyObject *__pyx_kp___newobj__;
+static char __pyx_k__save_tree[] = "_save_tree";
+static PyObject *__pyx_kp__save_tree;
 static char __pyx_k_asarray[] = "asarray";
 static PyObject *__pyx_kp_asarray;
 static char __pyx_k_astype[] = "astype";
@@ -514,21 +771,59 @@ static char __pyx_k_prod[] = "prod";
 static PyObject *__pyx_kp_prod;
 static char __pyx_k_reshape[] = "reshape";
 static PyObject *__pyx_kp_reshape;
-static char __pyx_k_empty[] = "empty";
-static PyObject *__pyx_kp_empty;
 static char __pyx_k_fill[] = "fill";
 static PyObject *__pyx_kp_fill;
-static char __pyx_k_30[] = "i";
-static PyObject *__pyx_kp_30;
+static char __pyx_k_43[] = "i";
+static PyObject *__pyx_kp_43;
+static char __pyx_k_min[] = "min";
+static PyObject *__pyx_kp_min;
+static char __pyx_k_range[] = "range";
+static PyObject *__pyx_kp_range;
+static char __pyx_k_append[] = "append";
+static PyObject *__pyx_kp_append;
+static char __pyx_k_object[] = "object";
+static PyObject *__pyx_kp_object;
+static char __pyx_k_ndindex[] = "ndindex";
+static PyObject *__pyx_kp_ndindex;
+static char __pyx_k_add[] = "add";
+static PyObject *__pyx_kp_add;
+static char __pyx_k_zeros[] = "zeros";
+static PyObject *__pyx_kp_zeros;
+static char __pyx_k_52[] = "i";
+static PyObject *__pyx_kp_52;
+static char __pyx_k_sparse[] = "sparse";
+static PyObject *__pyx_kp_sparse;
+static char __pyx_k_dok_matrix[] = "dok_matrix";
+static PyObject *__pyx_kp_dok_matrix;
 static PyObject *__pyx_builtin_ValueError;
-static PyObject *__pyx_kp_25;
-static char __pyx_k_25[] = "Heap containing %d items cannot be resized to %d";
-static PyObject *__pyx_kp_26;
-static char __pyx_k_26[] = "leafsize must be at least 1";
+static PyObject *__pyx_builtin_min;
+static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_kp_28;
-static PyObject *__pyx_kp_29;
-static char __pyx_k_28[] = "x must consist of vectors of length %d but has shape %s";
-static char __pyx_k_29[] = "Only p-norms with 1<=p<=infinity permitted";
+static char __pyx_k_28[] = "leafsize must be at least 1";
+static PyObject *__pyx_kp_41;
+static PyObject *__pyx_kp_42;
+static char __pyx_k_41[] = "x must consist of vectors of length %d but has shape %s";
+static char __pyx_k_42[] = "Only p-norms with 1<=p<=infinity permitted";
+static PyObject *__pyx_kp_44;
+static PyObject *__pyx_kp_45;
+static char __pyx_k_44[] = "Searching for a %d-dimensional point in a %d-dimensional KDTree";
+static char __pyx_k_45[] = "Only p-norms with 1<=p<=infinity permitted";
+static PyObject *__pyx_kp_46;
+static PyObject *__pyx_kp_47;
+static char __pyx_k_46[] = "Trees have different dimensionality";
+static char __pyx_k_47[] = "Only p-norms with 1<=p<=infinity permitted";
+static PyObject *__pyx_kp_48;
+static char __pyx_k_48[] = "Only p-norms with 1<=p<=infinity permitted";
+static PyObject *__pyx_kp_49;
+static PyObject *__pyx_kp_50;
+static PyObject *__pyx_kp_51;
+static char __pyx_k_49[] = "Trees have different dimensionality";
+static char __pyx_k_50[] = "Only p-norms with 1<=p<=infinity permitted";
+static char __pyx_k_51[] = "r must be either a single value or a one-dimensional array of values";
+static PyObject *__pyx_kp_53;
+static PyObject *__pyx_kp_54;
+static char __pyx_k_53[] = "Trees have different dimensionality";
+static char __pyx_k_54[] = "Only p-norms with 1<=p<=infinity permitted";
 static char __pyx_k___getbuffer__[] = "__getbuffer__";
 static PyObject *__pyx_kp___getbuffer__;
 static char __pyx_k___releasebuffer__[] = "__releasebuffer__";
@@ -577,172 +872,148 @@ static char __pyx_k_20[] = "unknown dtype code in numpy.pxd (%d)";
 static char __pyx_k_21[] = "Format string allocated too short.";
 static char __pyx_k_22[] = "unknown dtype code in numpy.pxd (%d)";
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":28
+/* "/root/package/scipy/spatial/ckdtree.pyx":37
  *     int space
  * 
- * cdef inline heapcreate(heap* self,int initial_size):             # <<<<<<<<<<<<<<
+ * cdef inline void heapcreate(heap* self,int initial_size) nogil:             # <<<<<<<<<<<<<<
  *     self.space = initial_size
- *     self.heap = <heapitem*>stdlib.malloc(sizeof(heapitem)*self.space)
+ *     self.heap = <heapitem*>malloc(sizeof(heapitem)*self.space)
  */
 
-static INLINE PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapcreate(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *__pyx_v_self, int __pyx_v_initial_size) {
-  PyObject *__pyx_r;
+static INLINE void __pyx_f_5scipy_7spatial_7ckdtree_heapcreate(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *__pyx_v_self, int __pyx_v_initial_size) {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":29
+  /* "/root/package/scipy/spatial/ckdtree.pyx":38
  * 
- * cdef inline heapcreate(heap* self,int initial_size):
+ * cdef inline void heapcreate(heap* self,int initial_size) nogil:
  *     self.space = initial_size             # <<<<<<<<<<<<<<
- *     self.heap = <heapitem*>stdlib.malloc(sizeof(heapitem)*self.space)
+ *     self.heap = <heapitem*>malloc(sizeof(heapitem)*self.space)
  *     self.n=0
  */
   __pyx_v_self->space = __pyx_v_initial_size;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":30
- * cdef inline heapcreate(heap* self,int initial_size):
+  /* "/root/package/scipy/spatial/ckdtree.pyx":39
+ * cdef inline void heapcreate(heap* self,int initial_size) nogil:
  *     self.space = initial_size
- *     self.heap = <heapitem*>stdlib.malloc(sizeof(heapitem)*self.space)             # <<<<<<<<<<<<<<
+ *     self.heap = <heapitem*>malloc(sizeof(heapitem)*self.space)             # <<<<<<<<<<<<<<
  *     self.n=0
  * 
  */
   __pyx_v_self->heap = ((struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem *)malloc(((sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem)) * __pyx_v_self->space)));
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":31
+  /* "/root/package/scipy/spatial/ckdtree.pyx":40
  *     self.space = initial_size
- *     self.heap = <heapitem*>stdlib.malloc(sizeof(heapitem)*self.space)
+ *     self.heap = <heapitem*>malloc(sizeof(heapitem)*self.space)
  *     self.n=0             # <<<<<<<<<<<<<<
  * 
- * cdef inline heapdestroy(heap* self):
+ * cdef inline void heapdestroy(heap* self) nogil:
  */
   __pyx_v_self->n = 0;
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":33
+/* "/root/package/scipy/spatial/ckdtree.pyx":42
  *     self.n=0
  * 
- * cdef inline heapdestroy(heap* self):             # <<<<<<<<<<<<<<
- *     stdlib.free(self.heap)
+ * cdef inline void heapdestroy(heap* self) nogil:             # <<<<<<<<<<<<<<
+ *     free(self.heap)
  * 
  */
 
-static INLINE PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapdestroy(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *__pyx_v_self) {
-  PyObject *__pyx_r;
+static INLINE void __pyx_f_5scipy_7spatial_7ckdtree_heapdestroy(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *__pyx_v_self) {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":34
+  /* "/root/package/scipy/spatial/ckdtree.pyx":43
  * 
- * cdef inline heapdestroy(heap* self):
- *     stdlib.free(self.heap)             # <<<<<<<<<<<<<<
+ * cdef inline void heapdestroy(heap* self) nogil:
+ *     free(self.heap)             # <<<<<<<<<<<<<<
  * 
- * cdef inline heapresize(heap* self, int new_space):
+ * cdef inline int heapresize(heap* self, int new_space) nogil:
  */
   free(__pyx_v_self->heap);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":36
- *     stdlib.free(self.heap)
+/* "/root/package/scipy/spatial/ckdtree.pyx":45
+ *     free(self.heap)
  * 
- * cdef inline heapresize(heap* self, int new_space):             # <<<<<<<<<<<<<<
+ * cdef inline int heapresize(heap* self, int new_space) nogil:             # <<<<<<<<<<<<<<
+ *     # a heap cannot be resized below the number of items it contains
  *     if new_space<self.n:
- *         raise ValueError("Heap containing %d items cannot be resized to %d" % (self.n, new_space))
  */
 
-static INLINE PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapresize(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *__pyx_v_self, int __pyx_v_new_space) {
-  PyObject *__pyx_r;
+static INLINE int __pyx_f_5scipy_7spatial_7ckdtree_heapresize(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *__pyx_v_self, int __pyx_v_new_space) {
+  int __pyx_r;
   int __pyx_1;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-  PyObject *__pyx_t_1 = NULL;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":37
- * 
- * cdef inline heapresize(heap* self, int new_space):
+  /* "/root/package/scipy/spatial/ckdtree.pyx":47
+ * cdef inline int heapresize(heap* self, int new_space) nogil:
+ *     # a heap cannot be resized below the number of items it contains
  *     if new_space<self.n:             # <<<<<<<<<<<<<<
- *         raise ValueError("Heap containing %d items cannot be resized to %d" % (self.n, new_space))
+ *         return -1
  *     self.space = new_space
  */
   __pyx_1 = (__pyx_v_new_space < __pyx_v_self->n);
   if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":38
- * cdef inline heapresize(heap* self, int new_space):
+    /* "/root/package/scipy/spatial/ckdtree.pyx":48
+ *     # a heap cannot be resized below the number of items it contains
  *     if new_space<self.n:
- *         raise ValueError("Heap containing %d items cannot be resized to %d" % (self.n, new_space))             # <<<<<<<<<<<<<<
+ *         return -1             # <<<<<<<<<<<<<<
  *     self.space = new_space
- *     self.heap = <heapitem*>stdlib.realloc(<void*>self.heap,new_space*sizeof(heapitem))
+ *     self.heap = <heapitem*>realloc(<void*>self.heap,new_space*sizeof(heapitem))
  */
-    __pyx_2 = PyInt_FromLong(__pyx_v_self->n); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyInt_FromLong(__pyx_v_new_space); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_4 = PyTuple_New(2); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_4, 0, __pyx_2);
-    PyTuple_SET_ITEM(__pyx_4, 1, __pyx_3);
-    __pyx_2 = 0;
-    __pyx_3 = 0;
-    __pyx_t_1 = PyNumber_Remainder(__pyx_kp_25, ((PyObject *)__pyx_4)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
-    __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_t_1);
-    __pyx_t_1 = 0;
-    __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-    __Pyx_Raise(__pyx_3, 0, 0);
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = -1;
+    goto __pyx_L0;
     goto __pyx_L3;
   }
   __pyx_L3:;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":39
+  /* "/root/package/scipy/spatial/ckdtree.pyx":49
  *     if new_space<self.n:
- *         raise ValueError("Heap containing %d items cannot be resized to %d" % (self.n, new_space))
+ *         return -1
  *     self.space = new_space             # <<<<<<<<<<<<<<
- *     self.heap = <heapitem*>stdlib.realloc(<void*>self.heap,new_space*sizeof(heapitem))
- * 
+ *     self.heap = <heapitem*>realloc(<void*>self.heap,new_space*sizeof(heapitem))
+ *     return 0
  */
   __pyx_v_self->space = __pyx_v_new_space;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":40
- *         raise ValueError("Heap containing %d items cannot be resized to %d" % (self.n, new_space))
+  /* "/root/package/scipy/spatial/ckdtree.pyx":50
+ *         return -1
  *     self.space = new_space
- *     self.heap = <heapitem*>stdlib.realloc(<void*>self.heap,new_space*sizeof(heapitem))             # <<<<<<<<<<<<<<
+ *     self.heap = <heapitem*>realloc(<void*>self.heap,new_space*sizeof(heapitem))             # <<<<<<<<<<<<<<
+ *     return 0
  * 
- * cdef inline heappush(heap* self, heapitem item):
  */
   __pyx_v_self->heap = ((struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem *)realloc(((void *)__pyx_v_self->heap), (__pyx_v_new_space * (sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem)))));
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
+  /* "/root/package/scipy/spatial/ckdtree.pyx":51
+ *     self.space = new_space
+ *     self.heap = <heapitem*>realloc(<void*>self.heap,new_space*sizeof(heapitem))
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void heappush(heap* self, heapitem item) nogil:
+ */
+  __pyx_r = 0;
   goto __pyx_L0;
-  __pyx_L1_error:;
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  __Pyx_AddTraceback("scipy.spatial.ckdtree.heapresize");
+
   __pyx_r = 0;
   __pyx_L0:;
   return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":42
- *     self.heap = <heapitem*>stdlib.realloc(<void*>self.heap,new_space*sizeof(heapitem))
+/* "/root/package/scipy/spatial/ckdtree.pyx":53
+ *     return 0
  * 
- * cdef inline heappush(heap* self, heapitem item):             # <<<<<<<<<<<<<<
+ * cdef inline void heappush(heap* self, heapitem item) nogil:             # <<<<<<<<<<<<<<
  *     cdef int i
  *     cdef heapitem t
  */
 
-static INLINE PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heappush(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *__pyx_v_self, struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_v_item) {
+static INLINE void __pyx_f_5scipy_7spatial_7ckdtree_heappush(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *__pyx_v_self, struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_v_item) {
   int __pyx_v_i;
   struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_v_t;
-  PyObject *__pyx_r;
   int __pyx_1;
-  PyObject *__pyx_2 = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":46
+  /* "/root/package/scipy/spatial/ckdtree.pyx":57
  *     cdef heapitem t
  * 
  *     self.n += 1             # <<<<<<<<<<<<<<
@@ -751,7 +1022,7 @@ static INLINE PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heappush(struct __pyx_t
  */
   __pyx_v_self->n += 1;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":47
+  /* "/root/package/scipy/spatial/ckdtree.pyx":58
  * 
  *     self.n += 1
  *     if self.n>self.space:             # <<<<<<<<<<<<<<
@@ -761,20 +1032,19 @@ static INLINE PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heappush(struct __pyx_t
   __pyx_1 = (__pyx_v_self->n > __pyx_v_self->space);
   if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":48
+    /* "/root/package/scipy/spatial/ckdtree.pyx":59
  *     self.n += 1
  *     if self.n>self.space:
  *         heapresize(self,2*self.space+1)             # <<<<<<<<<<<<<<
  * 
  *     i = self.n-1
  */
-    __pyx_2 = __pyx_f_5scipy_7spatial_7ckdtree_heapresize(__pyx_v_self, ((2 * __pyx_v_self->space) + 1)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    __pyx_f_5scipy_7spatial_7ckdtree_heapresize(__pyx_v_self, ((2 * __pyx_v_self->space) + 1));
     goto __pyx_L3;
   }
   __pyx_L3:;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":50
+  /* "/root/package/scipy/spatial/ckdtree.pyx":61
  *         heapresize(self,2*self.space+1)
  * 
  *     i = self.n-1             # <<<<<<<<<<<<<<
@@ -783,7 +1053,7 @@ static INLINE PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heappush(struct __pyx_t
  */
   __pyx_v_i = (__pyx_v_self->n - 1);
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":51
+  /* "/root/package/scipy/spatial/ckdtree.pyx":62
  * 
  *     i = self.n-1
  *     self.heap[i] = item             # <<<<<<<<<<<<<<
@@ -792,7 +1062,7 @@ static INLINE PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heappush(struct __pyx_t
  */
   (__pyx_v_self->heap[__pyx_v_i]) = __pyx_v_item;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":52
+  /* "/root/package/scipy/spatial/ckdtree.pyx":63
  *     i = self.n-1
  *     self.heap[i] = item
  *     while i>0 and self.heap[i].priority<self.heap[(i-1)//2].priority:             # <<<<<<<<<<<<<<
@@ -806,7 +1076,7 @@ static INLINE PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heappush(struct __pyx_t
     }
     if (!__pyx_1) break;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":53
+    /* "/root/package/scipy/spatial/ckdtree.pyx":64
  *     self.heap[i] = item
  *     while i>0 and self.heap[i].priority<self.heap[(i-1)//2].priority:
  *         t = self.heap[(i-1)//2]             # <<<<<<<<<<<<<<
@@ -815,7 +1085,7 @@ static INLINE PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heappush(struct __pyx_t
  */
     __pyx_v_t = (__pyx_v_self->heap[((__pyx_v_i - 1) / 2)]);
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":54
+    /* "/root/package/scipy/spatial/ckdtree.pyx":65
  *     while i>0 and self.heap[i].priority<self.heap[(i-1)//2].priority:
  *         t = self.heap[(i-1)//2]
  *         self.heap[(i-1)//2] = self.heap[i]             # <<<<<<<<<<<<<<
@@ -824,7 +1094,7 @@ static INLINE PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heappush(struct __pyx_t
  */
     (__pyx_v_self->heap[((__pyx_v_i - 1) / 2)]) = (__pyx_v_self->heap[__pyx_v_i]);
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":55
+    /* "/root/package/scipy/spatial/ckdtree.pyx":66
  *         t = self.heap[(i-1)//2]
  *         self.heap[(i-1)//2] = self.heap[i]
  *         self.heap[i] = t             # <<<<<<<<<<<<<<
@@ -833,30 +1103,22 @@ static INLINE PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heappush(struct __pyx_t
  */
     (__pyx_v_self->heap[__pyx_v_i]) = __pyx_v_t;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":56
+    /* "/root/package/scipy/spatial/ckdtree.pyx":67
  *         self.heap[(i-1)//2] = self.heap[i]
  *         self.heap[i] = t
  *         i = (i-1)//2             # <<<<<<<<<<<<<<
  * 
- * cdef heapitem heappeek(heap* self):
+ * cdef heapitem heappeek(heap* self) nogil:
  */
     __pyx_v_i = ((__pyx_v_i - 1) / 2);
   }
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  Py_XDECREF(__pyx_2);
-  __Pyx_AddTraceback("scipy.spatial.ckdtree.heappush");
-  __pyx_r = 0;
-  __pyx_L0:;
-  return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":58
+/* "/root/package/scipy/spatial/ckdtree.pyx":69
  *         i = (i-1)//2
  * 
- * cdef heapitem heappeek(heap* self):             # <<<<<<<<<<<<<<
+ * cdef heapitem heappeek(heap* self) nogil:             # <<<<<<<<<<<<<<
  *     return self.heap[0]
  * 
  */
@@ -864,12 +1126,12 @@ static INLINE PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heappush(struct __pyx_t
 static  struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_f_5scipy_7spatial_7ckdtree_heappeek(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *__pyx_v_self) {
   struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_r;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":59
+  /* "/root/package/scipy/spatial/ckdtree.pyx":70
  * 
- * cdef heapitem heappeek(heap* self):
+ * cdef heapitem heappeek(heap* self) nogil:
  *     return self.heap[0]             # <<<<<<<<<<<<<<
  * 
- * cdef heapremove(heap* self):
+ * cdef void heapremove(heap* self) nogil:
  */
   __pyx_r = (__pyx_v_self->heap[0]);
   goto __pyx_L0;
@@ -878,25 +1140,23 @@ static  struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_f_5scipy_7spatial
   return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":61
+/* "/root/package/scipy/spatial/ckdtree.pyx":72
  *     return self.heap[0]
  * 
- * cdef heapremove(heap* self):             # <<<<<<<<<<<<<<
+ * cdef void heapremove(heap* self) nogil:             # <<<<<<<<<<<<<<
  *     cdef heapitem t
  *     cdef int i, j, k, l
  */
 
-static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *__pyx_v_self) {
+static  void __pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *__pyx_v_self) {
   struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_v_t;
   int __pyx_v_i;
   int __pyx_v_j;
   int __pyx_v_k;
   int __pyx_v_l;
-  PyObject *__pyx_r;
   int __pyx_1;
-  PyObject *__pyx_2 = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":65
+  /* "/root/package/scipy/spatial/ckdtree.pyx":76
  *     cdef int i, j, k, l
  * 
  *     self.heap[0] = self.heap[self.n-1]             # <<<<<<<<<<<<<<
@@ -905,7 +1165,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
  */
   (__pyx_v_self->heap[0]) = (__pyx_v_self->heap[(__pyx_v_self->n - 1)]);
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":66
+  /* "/root/package/scipy/spatial/ckdtree.pyx":77
  * 
  *     self.heap[0] = self.heap[self.n-1]
  *     self.n -= 1             # <<<<<<<<<<<<<<
@@ -914,7 +1174,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
  */
   __pyx_v_self->n -= 1;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":67
+  /* "/root/package/scipy/spatial/ckdtree.pyx":78
  *     self.heap[0] = self.heap[self.n-1]
  *     self.n -= 1
  *     if self.n < self.space//4 and self.space>40: #FIXME: magic number             # <<<<<<<<<<<<<<
@@ -927,20 +1187,19 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
   }
   if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":68
+    /* "/root/package/scipy/spatial/ckdtree.pyx":79
  *     self.n -= 1
  *     if self.n < self.space//4 and self.space>40: #FIXME: magic number
  *         heapresize(self,self.space//2+1)             # <<<<<<<<<<<<<<
  * 
  *     i=0
  */
-    __pyx_2 = __pyx_f_5scipy_7spatial_7ckdtree_heapresize(__pyx_v_self, ((__pyx_v_self->space / 2) + 1)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    __pyx_f_5scipy_7spatial_7ckdtree_heapresize(__pyx_v_self, ((__pyx_v_self->space / 2) + 1));
     goto __pyx_L3;
   }
   __pyx_L3:;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":70
+  /* "/root/package/scipy/spatial/ckdtree.pyx":81
  *         heapresize(self,self.space//2+1)
  * 
  *     i=0             # <<<<<<<<<<<<<<
@@ -949,7 +1208,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
  */
   __pyx_v_i = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":71
+  /* "/root/package/scipy/spatial/ckdtree.pyx":82
  * 
  *     i=0
  *     j=1             # <<<<<<<<<<<<<<
@@ -958,7 +1217,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
  */
   __pyx_v_j = 1;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":72
+  /* "/root/package/scipy/spatial/ckdtree.pyx":83
  *     i=0
  *     j=1
  *     k=2             # <<<<<<<<<<<<<<
@@ -967,7 +1226,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
  */
   __pyx_v_k = 2;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":73
+  /* "/root/package/scipy/spatial/ckdtree.pyx":84
  *     j=1
  *     k=2
  *     while ((j<self.n and             # <<<<<<<<<<<<<<
@@ -978,7 +1237,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
     __pyx_1 = (__pyx_v_j < __pyx_v_self->n);
     if (__pyx_1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":74
+      /* "/root/package/scipy/spatial/ckdtree.pyx":85
  *     k=2
  *     while ((j<self.n and
  *                 self.heap[i].priority > self.heap[j].priority or             # <<<<<<<<<<<<<<
@@ -989,7 +1248,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
     }
     if (!__pyx_1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":75
+      /* "/root/package/scipy/spatial/ckdtree.pyx":86
  *     while ((j<self.n and
  *                 self.heap[i].priority > self.heap[j].priority or
  *             k<self.n and             # <<<<<<<<<<<<<<
@@ -999,7 +1258,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
       __pyx_1 = (__pyx_v_k < __pyx_v_self->n);
       if (__pyx_1) {
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":76
+        /* "/root/package/scipy/spatial/ckdtree.pyx":87
  *                 self.heap[i].priority > self.heap[j].priority or
  *             k<self.n and
  *                 self.heap[i].priority > self.heap[k].priority)):             # <<<<<<<<<<<<<<
@@ -1011,7 +1270,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
     }
     if (!__pyx_1) break;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":77
+    /* "/root/package/scipy/spatial/ckdtree.pyx":88
  *             k<self.n and
  *                 self.heap[i].priority > self.heap[k].priority)):
  *         if k<self.n and self.heap[j].priority>self.heap[k].priority:             # <<<<<<<<<<<<<<
@@ -1024,7 +1283,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
     }
     if (__pyx_1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":78
+      /* "/root/package/scipy/spatial/ckdtree.pyx":89
  *                 self.heap[i].priority > self.heap[k].priority)):
  *         if k<self.n and self.heap[j].priority>self.heap[k].priority:
  *             l = k             # <<<<<<<<<<<<<<
@@ -1036,7 +1295,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
     }
     /*else*/ {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":80
+      /* "/root/package/scipy/spatial/ckdtree.pyx":91
  *             l = k
  *         else:
  *             l = j             # <<<<<<<<<<<<<<
@@ -1047,7 +1306,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
     }
     __pyx_L6:;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":81
+    /* "/root/package/scipy/spatial/ckdtree.pyx":92
  *         else:
  *             l = j
  *         t = self.heap[l]             # <<<<<<<<<<<<<<
@@ -1056,7 +1315,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
  */
     __pyx_v_t = (__pyx_v_self->heap[__pyx_v_l]);
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":82
+    /* "/root/package/scipy/spatial/ckdtree.pyx":93
  *             l = j
  *         t = self.heap[l]
  *         self.heap[l] = self.heap[i]             # <<<<<<<<<<<<<<
@@ -1065,7 +1324,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
  */
     (__pyx_v_self->heap[__pyx_v_l]) = (__pyx_v_self->heap[__pyx_v_i]);
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":83
+    /* "/root/package/scipy/spatial/ckdtree.pyx":94
  *         t = self.heap[l]
  *         self.heap[l] = self.heap[i]
  *         self.heap[i] = t             # <<<<<<<<<<<<<<
@@ -1074,7 +1333,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
  */
     (__pyx_v_self->heap[__pyx_v_i]) = __pyx_v_t;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":84
+    /* "/root/package/scipy/spatial/ckdtree.pyx":95
  *         self.heap[l] = self.heap[i]
  *         self.heap[i] = t
  *         i = l             # <<<<<<<<<<<<<<
@@ -1083,7 +1342,7 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
  */
     __pyx_v_i = __pyx_v_l;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":85
+    /* "/root/package/scipy/spatial/ckdtree.pyx":96
  *         self.heap[i] = t
  *         i = l
  *         j = 2*i+1             # <<<<<<<<<<<<<<
@@ -1092,30 +1351,22 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
  */
     __pyx_v_j = ((2 * __pyx_v_i) + 1);
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":86
+    /* "/root/package/scipy/spatial/ckdtree.pyx":97
  *         i = l
  *         j = 2*i+1
  *         k = 2*i+2             # <<<<<<<<<<<<<<
  * 
- * cdef heapitem heappop(heap* self):
+ * cdef heapitem heappop(heap* self) nogil:
  */
     __pyx_v_k = ((2 * __pyx_v_i) + 2);
   }
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  Py_XDECREF(__pyx_2);
-  __Pyx_AddTraceback("scipy.spatial.ckdtree.heapremove");
-  __pyx_r = 0;
-  __pyx_L0:;
-  return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":88
+/* "/root/package/scipy/spatial/ckdtree.pyx":99
  *         k = 2*i+2
  * 
- * cdef heapitem heappop(heap* self):             # <<<<<<<<<<<<<<
+ * cdef heapitem heappop(heap* self) nogil:             # <<<<<<<<<<<<<<
  *     cdef heapitem it
  *     it = heappeek(self)
  */
@@ -1123,10 +1374,9 @@ static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_heapremove(struct __pyx_t_5sc
 static  struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_f_5scipy_7spatial_7ckdtree_heappop(struct __pyx_t_5scipy_7spatial_7ckdtree_heap *__pyx_v_self) {
   struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_v_it;
   struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_r;
-  PyObject *__pyx_1 = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":90
- * cdef heapitem heappop(heap* self):
+  /* "/root/package/scipy/spatial/ckdtree.pyx":101
+ * cdef heapitem heappop(heap* self) nogil:
  *     cdef heapitem it
  *     it = heappeek(self)             # <<<<<<<<<<<<<<
  *     heapremove(self)
@@ -1134,17 +1384,16 @@ static  struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_f_5scipy_7spatial
  */
   __pyx_v_it = __pyx_f_5scipy_7spatial_7ckdtree_heappeek(__pyx_v_self);
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":91
+  /* "/root/package/scipy/spatial/ckdtree.pyx":102
  *     cdef heapitem it
  *     it = heappeek(self)
  *     heapremove(self)             # <<<<<<<<<<<<<<
  *     return it
  * 
  */
-  __pyx_1 = __pyx_f_5scipy_7spatial_7ckdtree_heapremove(__pyx_v_self); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_f_5scipy_7spatial_7ckdtree_heapremove(__pyx_v_self);
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":92
+  /* "/root/package/scipy/spatial/ckdtree.pyx":103
  *     it = heappeek(self)
  *     heapremove(self)
  *     return it             # <<<<<<<<<<<<<<
@@ -1154,18 +1403,14 @@ static  struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_f_5scipy_7spatial
   __pyx_r = __pyx_v_it;
   goto __pyx_L0;
 
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_WriteUnraisable("scipy.spatial.ckdtree.heappop");
   __pyx_L0:;
   return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":99
+/* "/root/package/scipy/spatial/ckdtree.pyx":110
  * 
  * # utility functions
- * cdef inline double dmax(double x, double y):             # <<<<<<<<<<<<<<
+ * cdef inline double dmax(double x, double y) nogil:             # <<<<<<<<<<<<<<
  *     if x>y:
  *         return x
  */
@@ -1174,9 +1419,9 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree_dmax(double __pyx_v_x, dou
   double __pyx_r;
   int __pyx_1;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":100
+  /* "/root/package/scipy/spatial/ckdtree.pyx":111
  * # utility functions
- * cdef inline double dmax(double x, double y):
+ * cdef inline double dmax(double x, double y) nogil:
  *     if x>y:             # <<<<<<<<<<<<<<
  *         return x
  *     else:
@@ -1184,8 +1429,8 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree_dmax(double __pyx_v_x, dou
   __pyx_1 = (__pyx_v_x > __pyx_v_y);
   if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":101
- * cdef inline double dmax(double x, double y):
+    /* "/root/package/scipy/spatial/ckdtree.pyx":112
+ * cdef inline double dmax(double x, double y) nogil:
  *     if x>y:
  *         return x             # <<<<<<<<<<<<<<
  *     else:
@@ -1197,11 +1442,11 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree_dmax(double __pyx_v_x, dou
   }
   /*else*/ {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":103
+    /* "/root/package/scipy/spatial/ckdtree.pyx":114
  *         return x
  *     else:
  *         return y             # <<<<<<<<<<<<<<
- * cdef inline double dabs(double x):
+ * cdef inline double dabs(double x) nogil:
  *     if x>0:
  */
     __pyx_r = __pyx_v_y;
@@ -1214,10 +1459,10 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree_dmax(double __pyx_v_x, dou
   return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":104
+/* "/root/package/scipy/spatial/ckdtree.pyx":115
  *     else:
  *         return y
- * cdef inline double dabs(double x):             # <<<<<<<<<<<<<<
+ * cdef inline double dabs(double x) nogil:             # <<<<<<<<<<<<<<
  *     if x>0:
  *         return x
  */
@@ -1226,9 +1471,9 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree_dabs(double __pyx_v_x) {
   double __pyx_r;
   int __pyx_1;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":105
+  /* "/root/package/scipy/spatial/ckdtree.pyx":116
  *         return y
- * cdef inline double dabs(double x):
+ * cdef inline double dabs(double x) nogil:
  *     if x>0:             # <<<<<<<<<<<<<<
  *         return x
  *     else:
@@ -1236,8 +1481,8 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree_dabs(double __pyx_v_x) {
   __pyx_1 = (__pyx_v_x > 0);
   if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":106
- * cdef inline double dabs(double x):
+    /* "/root/package/scipy/spatial/ckdtree.pyx":117
+ * cdef inline double dabs(double x) nogil:
  *     if x>0:
  *         return x             # <<<<<<<<<<<<<<
  *     else:
@@ -1249,11 +1494,11 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree_dabs(double __pyx_v_x) {
   }
   /*else*/ {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":108
+    /* "/root/package/scipy/spatial/ckdtree.pyx":119
  *         return x
  *     else:
  *         return -x             # <<<<<<<<<<<<<<
- * cdef inline double _distance_p(double*x,double*y,double p,int k,double upperbound):
+ * cdef inline double _distance_p(double*x,double*y,double p,int k,double upperbound) nogil:
  *     """Compute the distance between x and y
  */
     __pyx_r = (-__pyx_v_x);
@@ -1266,10 +1511,10 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree_dabs(double __pyx_v_x) {
   return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":109
+/* "/root/package/scipy/spatial/ckdtree.pyx":120
  *     else:
  *         return -x
- * cdef inline double _distance_p(double*x,double*y,double p,int k,double upperbound):             # <<<<<<<<<<<<<<
+ * cdef inline double _distance_p(double*x,double*y,double p,int k,double upperbound) nogil:             # <<<<<<<<<<<<<<
  *     """Compute the distance between x and y
  * 
  */
@@ -1280,7 +1525,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
   double __pyx_r;
   int __pyx_1;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":118
+  /* "/root/package/scipy/spatial/ckdtree.pyx":129
  *     cdef int i
  *     cdef double r
  *     r = 0             # <<<<<<<<<<<<<<
@@ -1289,7 +1534,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
  */
   __pyx_v_r = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":119
+  /* "/root/package/scipy/spatial/ckdtree.pyx":130
  *     cdef double r
  *     r = 0
  *     if p==infinity:             # <<<<<<<<<<<<<<
@@ -1299,7 +1544,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
   __pyx_1 = (__pyx_v_p == __pyx_v_5scipy_7spatial_7ckdtree_infinity);
   if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":120
+    /* "/root/package/scipy/spatial/ckdtree.pyx":131
  *     r = 0
  *     if p==infinity:
  *         for i in range(k):             # <<<<<<<<<<<<<<
@@ -1308,7 +1553,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
  */
     for (__pyx_v_i = 0; __pyx_v_i < __pyx_v_k; __pyx_v_i+=1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":121
+      /* "/root/package/scipy/spatial/ckdtree.pyx":132
  *     if p==infinity:
  *         for i in range(k):
  *             r = dmax(r,dabs(x[i]-y[i]))             # <<<<<<<<<<<<<<
@@ -1317,7 +1562,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
  */
       __pyx_v_r = __pyx_f_5scipy_7spatial_7ckdtree_dmax(__pyx_v_r, __pyx_f_5scipy_7spatial_7ckdtree_dabs(((__pyx_v_x[__pyx_v_i]) - (__pyx_v_y[__pyx_v_i]))));
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":122
+      /* "/root/package/scipy/spatial/ckdtree.pyx":133
  *         for i in range(k):
  *             r = dmax(r,dabs(x[i]-y[i]))
  *             if r>upperbound:             # <<<<<<<<<<<<<<
@@ -1327,7 +1572,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
       __pyx_1 = (__pyx_v_r > __pyx_v_upperbound);
       if (__pyx_1) {
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":123
+        /* "/root/package/scipy/spatial/ckdtree.pyx":134
  *             r = dmax(r,dabs(x[i]-y[i]))
  *             if r>upperbound:
  *                 return r             # <<<<<<<<<<<<<<
@@ -1343,7 +1588,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
     goto __pyx_L3;
   }
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":124
+  /* "/root/package/scipy/spatial/ckdtree.pyx":135
  *             if r>upperbound:
  *                 return r
  *     elif p==1:             # <<<<<<<<<<<<<<
@@ -1353,7 +1598,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
   __pyx_1 = (__pyx_v_p == 1);
   if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":125
+    /* "/root/package/scipy/spatial/ckdtree.pyx":136
  *                 return r
  *     elif p==1:
  *         for i in range(k):             # <<<<<<<<<<<<<<
@@ -1362,7 +1607,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
  */
     for (__pyx_v_i = 0; __pyx_v_i < __pyx_v_k; __pyx_v_i+=1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":126
+      /* "/root/package/scipy/spatial/ckdtree.pyx":137
  *     elif p==1:
  *         for i in range(k):
  *             r += dabs(x[i]-y[i])             # <<<<<<<<<<<<<<
@@ -1371,7 +1616,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
  */
       __pyx_v_r += __pyx_f_5scipy_7spatial_7ckdtree_dabs(((__pyx_v_x[__pyx_v_i]) - (__pyx_v_y[__pyx_v_i])));
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":127
+      /* "/root/package/scipy/spatial/ckdtree.pyx":138
  *         for i in range(k):
  *             r += dabs(x[i]-y[i])
  *             if r>upperbound:             # <<<<<<<<<<<<<<
@@ -1381,7 +1626,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
       __pyx_1 = (__pyx_v_r > __pyx_v_upperbound);
       if (__pyx_1) {
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":128
+        /* "/root/package/scipy/spatial/ckdtree.pyx":139
  *             r += dabs(x[i]-y[i])
  *             if r>upperbound:
  *                 return r             # <<<<<<<<<<<<<<
@@ -1398,7 +1643,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
   }
   /*else*/ {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":130
+    /* "/root/package/scipy/spatial/ckdtree.pyx":141
  *                 return r
  *     else:
  *         for i in range(k):             # <<<<<<<<<<<<<<
@@ -1407,7 +1652,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
  */
     for (__pyx_v_i = 0; __pyx_v_i < __pyx_v_k; __pyx_v_i+=1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":131
+      /* "/root/package/scipy/spatial/ckdtree.pyx":142
  *     else:
  *         for i in range(k):
  *             r += dabs(x[i]-y[i])**p             # <<<<<<<<<<<<<<
@@ -1416,7 +1661,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
  */
       __pyx_v_r += pow(__pyx_f_5scipy_7spatial_7ckdtree_dabs(((__pyx_v_x[__pyx_v_i]) - (__pyx_v_y[__pyx_v_i]))), __pyx_v_p);
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":132
+      /* "/root/package/scipy/spatial/ckdtree.pyx":143
  *         for i in range(k):
  *             r += dabs(x[i]-y[i])**p
  *             if r>upperbound:             # <<<<<<<<<<<<<<
@@ -1426,7 +1671,7 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
       __pyx_1 = (__pyx_v_r > __pyx_v_upperbound);
       if (__pyx_1) {
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":133
+        /* "/root/package/scipy/spatial/ckdtree.pyx":144
  *             r += dabs(x[i]-y[i])**p
  *             if r>upperbound:
  *                 return r             # <<<<<<<<<<<<<<
@@ -1442,12 +1687,12 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
   }
   __pyx_L3:;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":134
+  /* "/root/package/scipy/spatial/ckdtree.pyx":145
  *             if r>upperbound:
  *                 return r
  *     return r             # <<<<<<<<<<<<<<
  * 
- * 
+ * cdef inline double _distance_power(double r, double p):
  */
   __pyx_r = __pyx_v_r;
   goto __pyx_L0;
@@ -1457,2310 +1702,8405 @@ static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_p(double *__pyx_
   return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":195
- *     cdef object indices
- *     cdef np.int32_t* raw_indices
- *     def __init__(cKDTree self, data, int leafsize=10):             # <<<<<<<<<<<<<<
- *         """Construct a kd-tree.
+/* "/root/package/scipy/spatial/ckdtree.pyx":147
+ *     return r
  * 
+ * cdef inline double _distance_power(double r, double p):             # <<<<<<<<<<<<<<
+ *     """Convert a distance to the internal distance**p representation"""
+ *     if p==1 or p==infinity:
  */
 
-static int __pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree___init__[] = "Construct a kd-tree.\n\n        Parameters:\n        ===========\n\n        data : array-like, shape (n,m)\n            The n data points of dimension mto be indexed. This array is \n            not copied unless this is necessary to produce a contiguous \n            array of doubles, and so modifying this data will result in \n            bogus results.\n        leafsize : positive integer\n            The number of points at which the algorithm switches over to\n            brute-force.\n        ";
-static int __pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_data = 0;
-  int __pyx_v_leafsize;
-  PyArrayObject *__pyx_v_inner_data;
-  PyArrayObject *__pyx_v_inner_maxes;
-  PyArrayObject *__pyx_v_inner_mins;
-  PyArrayObject *__pyx_v_inner_indices;
-  Py_buffer __pyx_bstruct_inner_indices;
-  Py_ssize_t __pyx_bstride_0_inner_indices = 0;
-  Py_ssize_t __pyx_bshape_0_inner_indices = 0;
-  Py_buffer __pyx_bstruct_inner_maxes;
-  Py_ssize_t __pyx_bstride_0_inner_maxes = 0;
-  Py_ssize_t __pyx_bshape_0_inner_maxes = 0;
-  Py_buffer __pyx_bstruct_inner_data;
-  Py_ssize_t __pyx_bstride_0_inner_data = 0;
-  Py_ssize_t __pyx_bstride_1_inner_data = 0;
-  Py_ssize_t __pyx_bshape_0_inner_data = 0;
-  Py_ssize_t __pyx_bshape_1_inner_data = 0;
-  Py_buffer __pyx_bstruct_inner_mins;
-  Py_ssize_t __pyx_bstride_0_inner_mins = 0;
-  Py_ssize_t __pyx_bshape_0_inner_mins = 0;
-  int __pyx_r;
-  PyObject *__pyx_1 = 0;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-  PyObject *__pyx_5 = 0;
-  int __pyx_6;
-  int __pyx_7;
-  PyObject *__pyx_8 = 0;
-  PyArrayObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyArrayObject *__pyx_t_6 = NULL;
-  PyArrayObject *__pyx_t_7 = NULL;
-  PyArrayObject *__pyx_t_8 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_data,&__pyx_kp_leafsize,0};
-  __pyx_v_leafsize = 10;
-  if (unlikely(__pyx_kwds)) {
-    PyObject* values[2] = {0,0};
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_data);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_data = values[0];
-    if (values[1]) {
-      __pyx_v_leafsize = __pyx_PyInt_int(values[1]); if (unlikely((__pyx_v_leafsize == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-  } else {
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: __pyx_v_leafsize = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_leafsize == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  1: __pyx_v_data = PyTuple_GET_ITEM(__pyx_args, 0);
-      break;
-      default: goto __pyx_L5_argtuple_error;
-    }
+static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__distance_power(double __pyx_v_r, double __pyx_v_p) {
+  double __pyx_r;
+  int __pyx_1;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":149
+ * cdef inline double _distance_power(double r, double p):
+ *     """Convert a distance to the internal distance**p representation"""
+ *     if p==1 or p==infinity:             # <<<<<<<<<<<<<<
+ *         return r
+ *     else:
+ */
+  __pyx_1 = (__pyx_v_p == 1);
+  if (!__pyx_1) {
+    __pyx_1 = (__pyx_v_p == __pyx_v_5scipy_7spatial_7ckdtree_infinity);
   }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__init__");
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_v_inner_data = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  __pyx_v_inner_maxes = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  __pyx_v_inner_mins = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  __pyx_v_inner_indices = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  __pyx_bstruct_inner_data.buf = NULL;
-  __pyx_bstruct_inner_maxes.buf = NULL;
-  __pyx_bstruct_inner_mins.buf = NULL;
-  __pyx_bstruct_inner_indices.buf = NULL;
+  if (__pyx_1) {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":214
- *         cdef np.ndarray[double, ndim=1] inner_mins
- *         cdef np.ndarray[np.int32_t, ndim=1] inner_indices
- *         self.data = np.ascontiguousarray(data,dtype=np.float)             # <<<<<<<<<<<<<<
- *         self.n, self.m = np.shape(self.data)
- *         self.leafsize = leafsize
+    /* "/root/package/scipy/spatial/ckdtree.pyx":150
+ *     """Convert a distance to the internal distance**p representation"""
+ *     if p==1 or p==infinity:
+ *         return r             # <<<<<<<<<<<<<<
+ *     else:
+ *         return r**p
  */
-  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_2 = PyObject_GetAttr(__pyx_1, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(__pyx_v_data);
-  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_v_data);
-  __pyx_3 = PyDict_New(); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_5 = PyObject_GetAttr(__pyx_4, __pyx_kp_float); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_4); __pyx_4 = 0;
-  if (PyDict_SetItem(__pyx_3, __pyx_kp_dtype, __pyx_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_5); __pyx_5 = 0;
-  __pyx_4 = PyEval_CallObjectWithKeywords(__pyx_2, ((PyObject *)__pyx_1), ((PyObject *)__pyx_3)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-  Py_DECREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
-  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data = __pyx_4;
-  __pyx_4 = 0;
+    __pyx_r = __pyx_v_r;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  /*else*/ {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":215
- *         cdef np.ndarray[np.int32_t, ndim=1] inner_indices
- *         self.data = np.ascontiguousarray(data,dtype=np.float)
- *         self.n, self.m = np.shape(self.data)             # <<<<<<<<<<<<<<
- *         self.leafsize = leafsize
- *         if self.leafsize<1:
+    /* "/root/package/scipy/spatial/ckdtree.pyx":152
+ *         return r
+ *     else:
+ *         return r**p             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline double _combine(double r, double t, double p):
  */
-  __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_2 = PyObject_GetAttr(__pyx_5, __pyx_kp_shape); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_5); __pyx_5 = 0;
-  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
-  PyTuple_SET_ITEM(__pyx_1, 0, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
-  __pyx_3 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-  if (PyTuple_CheckExact(__pyx_3) && PyTuple_GET_SIZE(__pyx_3) == 2) {
-    PyObject* tuple = __pyx_3;
-    __pyx_5 = PyTuple_GET_ITEM(tuple, 0);
-    Py_INCREF(__pyx_5);
-    __pyx_6 = __pyx_PyInt_int(__pyx_5); if (unlikely((__pyx_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n = __pyx_6;
-    __pyx_2 = PyTuple_GET_ITEM(tuple, 1);
-    Py_INCREF(__pyx_2);
-    __pyx_6 = __pyx_PyInt_int(__pyx_2); if (unlikely((__pyx_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m = __pyx_6;
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-  }
-  else {
-    __pyx_4 = PyObject_GetIter(__pyx_3); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_5 = __Pyx_UnpackItem(__pyx_4, 0); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = __pyx_PyInt_int(__pyx_5); if (unlikely((__pyx_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n = __pyx_6;
-    __pyx_2 = __Pyx_UnpackItem(__pyx_4, 1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = __pyx_PyInt_int(__pyx_2); if (unlikely((__pyx_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m = __pyx_6;
-    if (__Pyx_EndUnpack(__pyx_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
+    __pyx_r = pow(__pyx_v_r, __pyx_v_p);
+    goto __pyx_L0;
   }
+  __pyx_L3:;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":216
- *         self.data = np.ascontiguousarray(data,dtype=np.float)
- *         self.n, self.m = np.shape(self.data)
- *         self.leafsize = leafsize             # <<<<<<<<<<<<<<
- *         if self.leafsize<1:
- *             raise ValueError("leafsize must be at least 1")
- */
-  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->leafsize = __pyx_v_leafsize;
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":217
- *         self.n, self.m = np.shape(self.data)
- *         self.leafsize = leafsize
- *         if self.leafsize<1:             # <<<<<<<<<<<<<<
- *             raise ValueError("leafsize must be at least 1")
- *         self.maxes = np.ascontiguousarray(np.amax(self.data,axis=0))
+/* "/root/package/scipy/spatial/ckdtree.pyx":154
+ *         return r**p
+ * 
+ * cdef inline double _combine(double r, double t, double p):             # <<<<<<<<<<<<<<
+ *     """Add one coordinate difference t to a partial distance**p"""
+ *     if p==infinity:
  */
-  __pyx_7 = (((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->leafsize < 1);
-  if (__pyx_7) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":218
- *         self.leafsize = leafsize
- *         if self.leafsize<1:
- *             raise ValueError("leafsize must be at least 1")             # <<<<<<<<<<<<<<
- *         self.maxes = np.ascontiguousarray(np.amax(self.data,axis=0))
- *         self.mins = np.ascontiguousarray(np.amin(self.data,axis=0))
+static INLINE double __pyx_f_5scipy_7spatial_7ckdtree__combine(double __pyx_v_r, double __pyx_v_t, double __pyx_v_p) {
+  double __pyx_r;
+  int __pyx_1;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":156
+ * cdef inline double _combine(double r, double t, double p):
+ *     """Add one coordinate difference t to a partial distance**p"""
+ *     if p==infinity:             # <<<<<<<<<<<<<<
+ *         return dmax(r,t)
+ *     elif p==1:
  */
-    __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(__pyx_kp_26);
-    PyTuple_SET_ITEM(__pyx_1, 0, __pyx_kp_26);
-    __pyx_5 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-    __Pyx_Raise(__pyx_5, 0, 0);
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
+  __pyx_1 = (__pyx_v_p == __pyx_v_5scipy_7spatial_7ckdtree_infinity);
+  if (__pyx_1) {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":219
- *         if self.leafsize<1:
- *             raise ValueError("leafsize must be at least 1")
- *         self.maxes = np.ascontiguousarray(np.amax(self.data,axis=0))             # <<<<<<<<<<<<<<
- *         self.mins = np.ascontiguousarray(np.amin(self.data,axis=0))
- *         self.indices = np.ascontiguousarray(np.arange(self.n,dtype=np.int32))
+    /* "/root/package/scipy/spatial/ckdtree.pyx":157
+ *     """Add one coordinate difference t to a partial distance**p"""
+ *     if p==infinity:
+ *         return dmax(r,t)             # <<<<<<<<<<<<<<
+ *     elif p==1:
+ *         return r+t
  */
-  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_3 = PyObject_GetAttr(__pyx_2, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_1 = PyObject_GetAttr(__pyx_4, __pyx_kp_amax); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_4); __pyx_4 = 0;
-  __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
-  PyTuple_SET_ITEM(__pyx_5, 0, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
-  __pyx_2 = PyDict_New(); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyDict_SetItem(__pyx_2, __pyx_kp_axis, __pyx_int_0) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_4 = PyEval_CallObjectWithKeywords(__pyx_1, ((PyObject *)__pyx_5), ((PyObject *)__pyx_2)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_4);
-  __pyx_4 = 0;
-  __pyx_5 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-  Py_DECREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes);
-  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes = __pyx_5;
-  __pyx_5 = 0;
+    __pyx_r = __pyx_f_5scipy_7spatial_7ckdtree_dmax(__pyx_v_r, __pyx_v_t);
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":220
- *             raise ValueError("leafsize must be at least 1")
- *         self.maxes = np.ascontiguousarray(np.amax(self.data,axis=0))
- *         self.mins = np.ascontiguousarray(np.amin(self.data,axis=0))             # <<<<<<<<<<<<<<
- *         self.indices = np.ascontiguousarray(np.arange(self.n,dtype=np.int32))
- * 
+  /* "/root/package/scipy/spatial/ckdtree.pyx":158
+ *     if p==infinity:
+ *         return dmax(r,t)
+ *     elif p==1:             # <<<<<<<<<<<<<<
+ *         return r+t
+ *     else:
  */
-  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_4 = PyObject_GetAttr(__pyx_2, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_1 = PyObject_GetAttr(__pyx_3, __pyx_kp_amin); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
-  PyTuple_SET_ITEM(__pyx_5, 0, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
-  __pyx_2 = PyDict_New(); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyDict_SetItem(__pyx_2, __pyx_kp_axis, __pyx_int_0) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_3 = PyEval_CallObjectWithKeywords(__pyx_1, ((PyObject *)__pyx_5), ((PyObject *)__pyx_2)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_3);
-  __pyx_3 = 0;
-  __pyx_5 = PyObject_Call(__pyx_4, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_4); __pyx_4 = 0;
-  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-  Py_DECREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins);
-  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins = __pyx_5;
-  __pyx_5 = 0;
+  __pyx_1 = (__pyx_v_p == 1);
+  if (__pyx_1) {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":221
- *         self.maxes = np.ascontiguousarray(np.amax(self.data,axis=0))
- *         self.mins = np.ascontiguousarray(np.amin(self.data,axis=0))
- *         self.indices = np.ascontiguousarray(np.arange(self.n,dtype=np.int32))             # <<<<<<<<<<<<<<
- * 
- *         inner_data = self.data
+    /* "/root/package/scipy/spatial/ckdtree.pyx":159
+ *         return dmax(r,t)
+ *     elif p==1:
+ *         return r+t             # <<<<<<<<<<<<<<
+ *     else:
+ *         return r+t**p
  */
-  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_3 = PyObject_GetAttr(__pyx_2, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_1 = PyObject_GetAttr(__pyx_4, __pyx_kp_arange); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_4); __pyx_4 = 0;
-  __pyx_5 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  PyTuple_SET_ITEM(__pyx_2, 0, __pyx_5);
-  __pyx_5 = 0;
-  __pyx_4 = PyDict_New(); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_8 = PyObject_GetAttr(__pyx_5, __pyx_kp_27); if (unlikely(!__pyx_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_5); __pyx_5 = 0;
-  if (PyDict_SetItem(__pyx_4, __pyx_kp_dtype, __pyx_8) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_8); __pyx_8 = 0;
-  __pyx_5 = PyEval_CallObjectWithKeywords(__pyx_1, ((PyObject *)__pyx_2), ((PyObject *)__pyx_4)); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
-  __pyx_8 = PyTuple_New(1); if (unlikely(!__pyx_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  PyTuple_SET_ITEM(__pyx_8, 0, __pyx_5);
-  __pyx_5 = 0;
-  __pyx_1 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_8), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  Py_DECREF(((PyObject *)__pyx_8)); __pyx_8 = 0;
-  Py_DECREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices);
-  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices = __pyx_1;
-  __pyx_1 = 0;
+    __pyx_r = (__pyx_v_r + __pyx_v_t);
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  /*else*/ {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":223
- *         self.indices = np.ascontiguousarray(np.arange(self.n,dtype=np.int32))
+    /* "/root/package/scipy/spatial/ckdtree.pyx":161
+ *         return r+t
+ *     else:
+ *         return r+t**p             # <<<<<<<<<<<<<<
  * 
- *         inner_data = self.data             # <<<<<<<<<<<<<<
- *         self.raw_data = <double*>inner_data.data
- *         inner_maxes = self.maxes
+ * cdef double _min_distance_point(double*x, double*maxes, double*mins,
  */
-  if (!(__Pyx_TypeTest(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 223; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_1 = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_data);
-  __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_1, &__pyx_bstruct_inner_data, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0);
-  if (unlikely(__pyx_t_2 < 0)) 
-  {
-      PyErr_Fetch(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
-      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_inner_data, &__pyx_bstruct_inner_data, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
-          Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
-          __Pyx_RaiseBufferFallbackError();
-        } else {
-          PyErr_Restore(__pyx_t_3, __pyx_t_4, __pyx_t_5);
-      }
+    __pyx_r = (__pyx_v_r + pow(__pyx_v_t, __pyx_v_p));
+    goto __pyx_L0;
   }
-  __pyx_bstride_0_inner_data = __pyx_bstruct_inner_data.strides[0]; __pyx_bstride_1_inner_data = __pyx_bstruct_inner_data.strides[1];
-  __pyx_bshape_0_inner_data = __pyx_bstruct_inner_data.shape[0]; __pyx_bshape_1_inner_data = __pyx_bstruct_inner_data.shape[1];
-  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 223; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_1 = 0;
-  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
-  Py_DECREF(((PyObject *)__pyx_v_inner_data));
-  __pyx_v_inner_data = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  __pyx_L3:;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":224
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":163
+ *         return r+t**p
  * 
- *         inner_data = self.data
- *         self.raw_data = <double*>inner_data.data             # <<<<<<<<<<<<<<
- *         inner_maxes = self.maxes
- *         self.raw_maxes = <double*>inner_maxes.data
+ * cdef double _min_distance_point(double*x, double*maxes, double*mins,             # <<<<<<<<<<<<<<
+ *         double p, int k):
+ *     """Compute the minimum distance**p between x and a hyperrectangle"""
  */
-  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_data = ((double *)__pyx_v_inner_data->data);
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":225
- *         inner_data = self.data
- *         self.raw_data = <double*>inner_data.data
- *         inner_maxes = self.maxes             # <<<<<<<<<<<<<<
- *         self.raw_maxes = <double*>inner_maxes.data
- *         inner_mins = self.mins
- */
-  if (!(__Pyx_TypeTest(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_6 = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_maxes);
-  __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_6, &__pyx_bstruct_inner_maxes, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
-  if (unlikely(__pyx_t_2 < 0)) 
-  {
-      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_3);
-      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_inner_maxes, &__pyx_bstruct_inner_maxes, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
-          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_3);
-          __Pyx_RaiseBufferFallbackError();
-        } else {
-          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_3);
-      }
-  }
-  __pyx_bstride_0_inner_maxes = __pyx_bstruct_inner_maxes.strides[0];
-  __pyx_bshape_0_inner_maxes = __pyx_bstruct_inner_maxes.shape[0];
-  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_6 = 0;
-  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes);
-  Py_DECREF(((PyObject *)__pyx_v_inner_maxes));
-  __pyx_v_inner_maxes = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes);
+static  double __pyx_f_5scipy_7spatial_7ckdtree__min_distance_point(double *__pyx_v_x, double *__pyx_v_maxes, double *__pyx_v_mins, double __pyx_v_p, int __pyx_v_k) {
+  int __pyx_v_i;
+  double __pyx_v_r;
+  double __pyx_r;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":226
- *         self.raw_data = <double*>inner_data.data
- *         inner_maxes = self.maxes
- *         self.raw_maxes = <double*>inner_maxes.data             # <<<<<<<<<<<<<<
- *         inner_mins = self.mins
- *         self.raw_mins = <double*>inner_mins.data
+  /* "/root/package/scipy/spatial/ckdtree.pyx":168
+ *     cdef int i
+ *     cdef double r
+ *     r = 0             # <<<<<<<<<<<<<<
+ *     for i in range(k):
+ *         r = _combine(r,dmax(0,dmax(mins[i]-x[i],x[i]-maxes[i])),p)
  */
-  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_maxes = ((double *)__pyx_v_inner_maxes->data);
+  __pyx_v_r = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":227
- *         inner_maxes = self.maxes
- *         self.raw_maxes = <double*>inner_maxes.data
- *         inner_mins = self.mins             # <<<<<<<<<<<<<<
- *         self.raw_mins = <double*>inner_mins.data
- *         inner_indices = self.indices
+  /* "/root/package/scipy/spatial/ckdtree.pyx":169
+ *     cdef double r
+ *     r = 0
+ *     for i in range(k):             # <<<<<<<<<<<<<<
+ *         r = _combine(r,dmax(0,dmax(mins[i]-x[i],x[i]-maxes[i])),p)
+ *     return r
  */
-  if (!(__Pyx_TypeTest(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_mins);
-  __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_7, &__pyx_bstruct_inner_mins, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
-  if (unlikely(__pyx_t_2 < 0)) 
-  {
-      PyErr_Fetch(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
-      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_inner_mins, &__pyx_bstruct_inner_mins, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
-          Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
-          __Pyx_RaiseBufferFallbackError();
-        } else {
-          PyErr_Restore(__pyx_t_3, __pyx_t_4, __pyx_t_5);
-      }
-  }
-  __pyx_bstride_0_inner_mins = __pyx_bstruct_inner_mins.strides[0];
-  __pyx_bshape_0_inner_mins = __pyx_bstruct_inner_mins.shape[0];
-  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = 0;
-  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins);
-  Py_DECREF(((PyObject *)__pyx_v_inner_mins));
-  __pyx_v_inner_mins = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins);
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_v_k; __pyx_v_i+=1) {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":228
- *         self.raw_maxes = <double*>inner_maxes.data
- *         inner_mins = self.mins
- *         self.raw_mins = <double*>inner_mins.data             # <<<<<<<<<<<<<<
- *         inner_indices = self.indices
- *         self.raw_indices = <np.int32_t*>inner_indices.data
+    /* "/root/package/scipy/spatial/ckdtree.pyx":170
+ *     r = 0
+ *     for i in range(k):
+ *         r = _combine(r,dmax(0,dmax(mins[i]-x[i],x[i]-maxes[i])),p)             # <<<<<<<<<<<<<<
+ *     return r
+ * 
  */
-  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_mins = ((double *)__pyx_v_inner_mins->data);
+    __pyx_v_r = __pyx_f_5scipy_7spatial_7ckdtree__combine(__pyx_v_r, __pyx_f_5scipy_7spatial_7ckdtree_dmax(0, __pyx_f_5scipy_7spatial_7ckdtree_dmax(((__pyx_v_mins[__pyx_v_i]) - (__pyx_v_x[__pyx_v_i])), ((__pyx_v_x[__pyx_v_i]) - (__pyx_v_maxes[__pyx_v_i])))), __pyx_v_p);
+  }
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":229
- *         inner_mins = self.mins
- *         self.raw_mins = <double*>inner_mins.data
- *         inner_indices = self.indices             # <<<<<<<<<<<<<<
- *         self.raw_indices = <np.int32_t*>inner_indices.data
+  /* "/root/package/scipy/spatial/ckdtree.pyx":171
+ *     for i in range(k):
+ *         r = _combine(r,dmax(0,dmax(mins[i]-x[i],x[i]-maxes[i])),p)
+ *     return r             # <<<<<<<<<<<<<<
  * 
+ * cdef double _max_distance_point(double*x, double*maxes, double*mins,
  */
-  if (!(__Pyx_TypeTest(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_8 = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_indices);
-  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_t_8, &__pyx_bstruct_inner_indices, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
-  if (unlikely(__pyx_t_2 < 0)) 
-  {
-      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_3);
-      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_inner_indices, &__pyx_bstruct_inner_indices, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
-          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_3);
-          __Pyx_RaiseBufferFallbackError();
-        } else {
-          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_3);
-      }
-  }
-  __pyx_bstride_0_inner_indices = __pyx_bstruct_inner_indices.strides[0];
-  __pyx_bshape_0_inner_indices = __pyx_bstruct_inner_indices.shape[0];
-  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_8 = 0;
-  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices);
-  Py_DECREF(((PyObject *)__pyx_v_inner_indices));
-  __pyx_v_inner_indices = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices);
+  __pyx_r = __pyx_v_r;
+  goto __pyx_L0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":230
- *         self.raw_mins = <double*>inner_mins.data
- *         inner_indices = self.indices
- *         self.raw_indices = <np.int32_t*>inner_indices.data             # <<<<<<<<<<<<<<
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":173
+ *     return r
  * 
- *         self.tree = self.__build(0, self.n, self.raw_maxes, self.raw_mins)
+ * cdef double _max_distance_point(double*x, double*maxes, double*mins,             # <<<<<<<<<<<<<<
+ *         double p, int k):
+ *     """Compute the maximum distance**p between x and a hyperrectangle"""
  */
-  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_indices = ((__pyx_t_5numpy_int32_t *)__pyx_v_inner_indices->data);
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":232
- *         self.raw_indices = <np.int32_t*>inner_indices.data
+static  double __pyx_f_5scipy_7spatial_7ckdtree__max_distance_point(double *__pyx_v_x, double *__pyx_v_maxes, double *__pyx_v_mins, double __pyx_v_p, int __pyx_v_k) {
+  int __pyx_v_i;
+  double __pyx_v_r;
+  double __pyx_r;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":178
+ *     cdef int i
+ *     cdef double r
+ *     r = 0             # <<<<<<<<<<<<<<
+ *     for i in range(k):
+ *         r = _combine(r,dmax(maxes[i]-x[i],x[i]-mins[i]),p)
+ */
+  __pyx_v_r = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":179
+ *     cdef double r
+ *     r = 0
+ *     for i in range(k):             # <<<<<<<<<<<<<<
+ *         r = _combine(r,dmax(maxes[i]-x[i],x[i]-mins[i]),p)
+ *     return r
+ */
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_v_k; __pyx_v_i+=1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":180
+ *     r = 0
+ *     for i in range(k):
+ *         r = _combine(r,dmax(maxes[i]-x[i],x[i]-mins[i]),p)             # <<<<<<<<<<<<<<
+ *     return r
  * 
- *         self.tree = self.__build(0, self.n, self.raw_maxes, self.raw_mins)             # <<<<<<<<<<<<<<
+ */
+    __pyx_v_r = __pyx_f_5scipy_7spatial_7ckdtree__combine(__pyx_v_r, __pyx_f_5scipy_7spatial_7ckdtree_dmax(((__pyx_v_maxes[__pyx_v_i]) - (__pyx_v_x[__pyx_v_i])), ((__pyx_v_x[__pyx_v_i]) - (__pyx_v_mins[__pyx_v_i]))), __pyx_v_p);
+  }
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":181
+ *     for i in range(k):
+ *         r = _combine(r,dmax(maxes[i]-x[i],x[i]-mins[i]),p)
+ *     return r             # <<<<<<<<<<<<<<
  * 
- *     cdef innernode* __build(cKDTree self, int start_idx, int end_idx, double* maxes, double* mins):
+ * cdef double _min_distance_rectangle(double*maxes1, double*mins1,
  */
-  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__build(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), 0, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_maxes, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_mins);
+  __pyx_r = __pyx_v_r;
+  goto __pyx_L0;
 
   __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  Py_XDECREF(__pyx_1);
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  Py_XDECREF(__pyx_5);
-  Py_XDECREF(__pyx_8);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_indices);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_maxes);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_data);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_mins);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__init__");
-  __pyx_r = -1;
-  goto __pyx_L2;
   __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_indices);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_maxes);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_data);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_mins);
-  __pyx_L2:;
-  Py_DECREF(__pyx_v_inner_data);
-  Py_DECREF(__pyx_v_inner_maxes);
-  Py_DECREF(__pyx_v_inner_mins);
-  Py_DECREF(__pyx_v_inner_indices);
   return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":234
- *         self.tree = self.__build(0, self.n, self.raw_maxes, self.raw_mins)
+/* "/root/package/scipy/spatial/ckdtree.pyx":183
+ *     return r
  * 
- *     cdef innernode* __build(cKDTree self, int start_idx, int end_idx, double* maxes, double* mins):             # <<<<<<<<<<<<<<
- *         cdef leafnode* n
- *         cdef innernode* ni
+ * cdef double _min_distance_rectangle(double*maxes1, double*mins1,             # <<<<<<<<<<<<<<
+ *         double*maxes2, double*mins2, double p, int k):
+ *     """Compute the minimum distance**p between two hyperrectangles"""
  */
 
-static  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___build(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, int __pyx_v_start_idx, int __pyx_v_end_idx, double *__pyx_v_maxes, double *__pyx_v_mins) {
-  struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *__pyx_v_n;
-  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_ni;
+static  double __pyx_f_5scipy_7spatial_7ckdtree__min_distance_rectangle(double *__pyx_v_maxes1, double *__pyx_v_mins1, double *__pyx_v_maxes2, double *__pyx_v_mins2, double __pyx_v_p, int __pyx_v_k) {
   int __pyx_v_i;
-  int __pyx_v_j;
-  int __pyx_v_t;
-  int __pyx_v_p;
-  int __pyx_v_q;
-  int __pyx_v_d;
-  double __pyx_v_size;
-  double __pyx_v_split;
-  double __pyx_v_minval;
-  double __pyx_v_maxval;
-  double *__pyx_v_mids;
-  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_r;
-  int __pyx_1;
-  int __pyx_2;
-  long __pyx_3;
+  double __pyx_v_r;
+  double __pyx_r;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":240
- *         cdef double size, split, minval, maxval
- *         cdef double*mids
- *         if end_idx-start_idx<=self.leafsize:             # <<<<<<<<<<<<<<
- *             n = <leafnode*>stdlib.malloc(sizeof(leafnode))
- *             n.split_dim = -1
+  /* "/root/package/scipy/spatial/ckdtree.pyx":188
+ *     cdef int i
+ *     cdef double r
+ *     r = 0             # <<<<<<<<<<<<<<
+ *     for i in range(k):
+ *         r = _combine(r,dmax(0,dmax(mins1[i]-maxes2[i],mins2[i]-maxes1[i])),p)
  */
-  __pyx_1 = ((__pyx_v_end_idx - __pyx_v_start_idx) <= __pyx_v_self->leafsize);
-  if (__pyx_1) {
+  __pyx_v_r = 0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":241
- *         cdef double*mids
- *         if end_idx-start_idx<=self.leafsize:
- *             n = <leafnode*>stdlib.malloc(sizeof(leafnode))             # <<<<<<<<<<<<<<
- *             n.split_dim = -1
- *             n.start_idx = start_idx
+  /* "/root/package/scipy/spatial/ckdtree.pyx":189
+ *     cdef double r
+ *     r = 0
+ *     for i in range(k):             # <<<<<<<<<<<<<<
+ *         r = _combine(r,dmax(0,dmax(mins1[i]-maxes2[i],mins2[i]-maxes1[i])),p)
+ *     return r
  */
-    __pyx_v_n = ((struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *)malloc((sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode))));
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_v_k; __pyx_v_i+=1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":242
- *         if end_idx-start_idx<=self.leafsize:
- *             n = <leafnode*>stdlib.malloc(sizeof(leafnode))
- *             n.split_dim = -1             # <<<<<<<<<<<<<<
- *             n.start_idx = start_idx
- *             n.end_idx = end_idx
+    /* "/root/package/scipy/spatial/ckdtree.pyx":190
+ *     r = 0
+ *     for i in range(k):
+ *         r = _combine(r,dmax(0,dmax(mins1[i]-maxes2[i],mins2[i]-maxes1[i])),p)             # <<<<<<<<<<<<<<
+ *     return r
+ * 
  */
-    __pyx_v_n->split_dim = -1;
+    __pyx_v_r = __pyx_f_5scipy_7spatial_7ckdtree__combine(__pyx_v_r, __pyx_f_5scipy_7spatial_7ckdtree_dmax(0, __pyx_f_5scipy_7spatial_7ckdtree_dmax(((__pyx_v_mins1[__pyx_v_i]) - (__pyx_v_maxes2[__pyx_v_i])), ((__pyx_v_mins2[__pyx_v_i]) - (__pyx_v_maxes1[__pyx_v_i])))), __pyx_v_p);
+  }
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":243
- *             n = <leafnode*>stdlib.malloc(sizeof(leafnode))
- *             n.split_dim = -1
- *             n.start_idx = start_idx             # <<<<<<<<<<<<<<
- *             n.end_idx = end_idx
- *             return <innernode*>n
+  /* "/root/package/scipy/spatial/ckdtree.pyx":191
+ *     for i in range(k):
+ *         r = _combine(r,dmax(0,dmax(mins1[i]-maxes2[i],mins2[i]-maxes1[i])),p)
+ *     return r             # <<<<<<<<<<<<<<
+ * 
+ * cdef double _max_distance_rectangle(double*maxes1, double*mins1,
  */
-    __pyx_v_n->start_idx = __pyx_v_start_idx;
+  __pyx_r = __pyx_v_r;
+  goto __pyx_L0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":244
- *             n.split_dim = -1
- *             n.start_idx = start_idx
- *             n.end_idx = end_idx             # <<<<<<<<<<<<<<
- *             return <innernode*>n
- *         else:
- */
-    __pyx_v_n->end_idx = __pyx_v_end_idx;
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":245
- *             n.start_idx = start_idx
- *             n.end_idx = end_idx
- *             return <innernode*>n             # <<<<<<<<<<<<<<
- *         else:
- *             d = 0
+/* "/root/package/scipy/spatial/ckdtree.pyx":193
+ *     return r
+ * 
+ * cdef double _max_distance_rectangle(double*maxes1, double*mins1,             # <<<<<<<<<<<<<<
+ *         double*maxes2, double*mins2, double p, int k):
+ *     """Compute the maximum distance**p between two hyperrectangles"""
  */
-    __pyx_r = ((struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *)__pyx_v_n);
-    goto __pyx_L0;
-    goto __pyx_L3;
-  }
-  /*else*/ {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":247
- *             return <innernode*>n
- *         else:
- *             d = 0             # <<<<<<<<<<<<<<
- *             size = 0
- *             for i in range(self.m):
- */
-    __pyx_v_d = 0;
+static  double __pyx_f_5scipy_7spatial_7ckdtree__max_distance_rectangle(double *__pyx_v_maxes1, double *__pyx_v_mins1, double *__pyx_v_maxes2, double *__pyx_v_mins2, double __pyx_v_p, int __pyx_v_k) {
+  int __pyx_v_i;
+  double __pyx_v_r;
+  double __pyx_r;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":248
- *         else:
- *             d = 0
- *             size = 0             # <<<<<<<<<<<<<<
- *             for i in range(self.m):
- *                 if maxes[i]-mins[i] > size:
+  /* "/root/package/scipy/spatial/ckdtree.pyx":198
+ *     cdef int i
+ *     cdef double r
+ *     r = 0             # <<<<<<<<<<<<<<
+ *     for i in range(k):
+ *         r = _combine(r,dmax(maxes1[i]-mins2[i],maxes2[i]-mins1[i]),p)
  */
-    __pyx_v_size = 0;
+  __pyx_v_r = 0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":249
- *             d = 0
- *             size = 0
- *             for i in range(self.m):             # <<<<<<<<<<<<<<
- *                 if maxes[i]-mins[i] > size:
- *                     d = i
+  /* "/root/package/scipy/spatial/ckdtree.pyx":199
+ *     cdef double r
+ *     r = 0
+ *     for i in range(k):             # <<<<<<<<<<<<<<
+ *         r = _combine(r,dmax(maxes1[i]-mins2[i],maxes2[i]-mins1[i]),p)
+ *     return r
  */
-    __pyx_2 = __pyx_v_self->m;
-    for (__pyx_v_i = 0; __pyx_v_i < __pyx_2; __pyx_v_i+=1) {
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_v_k; __pyx_v_i+=1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":250
- *             size = 0
- *             for i in range(self.m):
- *                 if maxes[i]-mins[i] > size:             # <<<<<<<<<<<<<<
- *                     d = i
- *                     size =  maxes[i]-mins[i]
+    /* "/root/package/scipy/spatial/ckdtree.pyx":200
+ *     r = 0
+ *     for i in range(k):
+ *         r = _combine(r,dmax(maxes1[i]-mins2[i],maxes2[i]-mins1[i]),p)             # <<<<<<<<<<<<<<
+ *     return r
+ * 
  */
-      __pyx_1 = (((__pyx_v_maxes[__pyx_v_i]) - (__pyx_v_mins[__pyx_v_i])) > __pyx_v_size);
-      if (__pyx_1) {
+    __pyx_v_r = __pyx_f_5scipy_7spatial_7ckdtree__combine(__pyx_v_r, __pyx_f_5scipy_7spatial_7ckdtree_dmax(((__pyx_v_maxes1[__pyx_v_i]) - (__pyx_v_mins2[__pyx_v_i])), ((__pyx_v_maxes2[__pyx_v_i]) - (__pyx_v_mins1[__pyx_v_i]))), __pyx_v_p);
+  }
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":251
- *             for i in range(self.m):
- *                 if maxes[i]-mins[i] > size:
- *                     d = i             # <<<<<<<<<<<<<<
- *                     size =  maxes[i]-mins[i]
- *             maxval = maxes[d]
+  /* "/root/package/scipy/spatial/ckdtree.pyx":201
+ *     for i in range(k):
+ *         r = _combine(r,dmax(maxes1[i]-mins2[i],maxes2[i]-mins1[i]),p)
+ *     return r             # <<<<<<<<<<<<<<
+ * 
+ * # hyperrectangles are stored as a single block of 2*k doubles,
  */
-        __pyx_v_d = __pyx_v_i;
+  __pyx_r = __pyx_v_r;
+  goto __pyx_L0;
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":252
- *                 if maxes[i]-mins[i] > size:
- *                     d = i
- *                     size =  maxes[i]-mins[i]             # <<<<<<<<<<<<<<
- *             maxval = maxes[d]
- *             minval = mins[d]
- */
-        __pyx_v_size = ((__pyx_v_maxes[__pyx_v_i]) - (__pyx_v_mins[__pyx_v_i]));
-        goto __pyx_L6;
-      }
-      __pyx_L6:;
-    }
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":253
- *                     d = i
- *                     size =  maxes[i]-mins[i]
- *             maxval = maxes[d]             # <<<<<<<<<<<<<<
- *             minval = mins[d]
- *             if maxval==minval:
+/* "/root/package/scipy/spatial/ckdtree.pyx":205
+ * # hyperrectangles are stored as a single block of 2*k doubles,
+ * # the maxes followed by the mins
+ * cdef double* _split_rectangle(double*maxes, double*mins, int d,             # <<<<<<<<<<<<<<
+ *         double split, int k, int less):
+ *     """Allocate the hyperrectangle of the less or greater half of a split"""
  */
-    __pyx_v_maxval = (__pyx_v_maxes[__pyx_v_d]);
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":254
- *                     size =  maxes[i]-mins[i]
- *             maxval = maxes[d]
- *             minval = mins[d]             # <<<<<<<<<<<<<<
- *             if maxval==minval:
- *                 # all points are identical; warn user?
- */
-    __pyx_v_minval = (__pyx_v_mins[__pyx_v_d]);
+static  double *__pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(double *__pyx_v_maxes, double *__pyx_v_mins, int __pyx_v_d, double __pyx_v_split, int __pyx_v_k, int __pyx_v_less) {
+  int __pyx_v_i;
+  double *__pyx_v_rect;
+  double *__pyx_r;
+  int __pyx_1;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":255
- *             maxval = maxes[d]
- *             minval = mins[d]
- *             if maxval==minval:             # <<<<<<<<<<<<<<
- *                 # all points are identical; warn user?
- *                 n = <leafnode*>stdlib.malloc(sizeof(leafnode))
+  /* "/root/package/scipy/spatial/ckdtree.pyx":210
+ *     cdef int i
+ *     cdef double* rect
+ *     rect = <double*>malloc(2*k*sizeof(double))             # <<<<<<<<<<<<<<
+ *     for i in range(k):
+ *         rect[i] = maxes[i]
+ */
+  __pyx_v_rect = ((double *)malloc(((2 * __pyx_v_k) * (sizeof(double)))));
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":211
+ *     cdef double* rect
+ *     rect = <double*>malloc(2*k*sizeof(double))
+ *     for i in range(k):             # <<<<<<<<<<<<<<
+ *         rect[i] = maxes[i]
+ *         rect[k+i] = mins[i]
+ */
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_v_k; __pyx_v_i+=1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":212
+ *     rect = <double*>malloc(2*k*sizeof(double))
+ *     for i in range(k):
+ *         rect[i] = maxes[i]             # <<<<<<<<<<<<<<
+ *         rect[k+i] = mins[i]
+ *     if less:
+ */
+    (__pyx_v_rect[__pyx_v_i]) = (__pyx_v_maxes[__pyx_v_i]);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":213
+ *     for i in range(k):
+ *         rect[i] = maxes[i]
+ *         rect[k+i] = mins[i]             # <<<<<<<<<<<<<<
+ *     if less:
+ *         rect[d] = split
+ */
+    (__pyx_v_rect[(__pyx_v_k + __pyx_v_i)]) = (__pyx_v_mins[__pyx_v_i]);
+  }
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":214
+ *         rect[i] = maxes[i]
+ *         rect[k+i] = mins[i]
+ *     if less:             # <<<<<<<<<<<<<<
+ *         rect[d] = split
+ *     else:
  */
-    __pyx_1 = (__pyx_v_maxval == __pyx_v_minval);
-    if (__pyx_1) {
+  __pyx_1 = __pyx_v_less;
+  if (__pyx_1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":257
- *             if maxval==minval:
+    /* "/root/package/scipy/spatial/ckdtree.pyx":215
+ *         rect[k+i] = mins[i]
+ *     if less:
+ *         rect[d] = split             # <<<<<<<<<<<<<<
+ *     else:
+ *         rect[k+d] = split
+ */
+    (__pyx_v_rect[__pyx_v_d]) = __pyx_v_split;
+    goto __pyx_L5;
+  }
+  /*else*/ {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":217
+ *         rect[d] = split
+ *     else:
+ *         rect[k+d] = split             # <<<<<<<<<<<<<<
+ *     return rect
+ * 
+ */
+    (__pyx_v_rect[(__pyx_v_k + __pyx_v_d)]) = __pyx_v_split;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":218
+ *     else:
+ *         rect[k+d] = split
+ *     return rect             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_rect;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":295
+ *     cdef object indices
+ *     cdef np.int32_t* raw_indices
+ *     def __init__(cKDTree self, data, int leafsize=10):             # <<<<<<<<<<<<<<
+ *         """Construct a kd-tree.
+ * 
+ */
+
+static int __pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree___init__[] = "Construct a kd-tree.\n\n        Parameters:\n        ===========\n\n        data : array-like, shape (n,m)\n            The n data points of dimension mto be indexed. This array is \n            not copied unless this is necessary to produce a contiguous \n            array of doubles, and so modifying this data will result in \n            bogus results.\n        leafsize : positive integer\n            The number of points at which the algorithm switches over to\n            brute-force.\n        ";
+static int __pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_data = 0;
+  int __pyx_v_leafsize;
+  PyArrayObject *__pyx_v_inner_data;
+  PyArrayObject *__pyx_v_inner_maxes;
+  PyArrayObject *__pyx_v_inner_mins;
+  PyArrayObject *__pyx_v_inner_indices;
+  Py_buffer __pyx_bstruct_inner_indices;
+  Py_ssize_t __pyx_bstride_0_inner_indices = 0;
+  Py_ssize_t __pyx_bshape_0_inner_indices = 0;
+  Py_buffer __pyx_bstruct_inner_maxes;
+  Py_ssize_t __pyx_bstride_0_inner_maxes = 0;
+  Py_ssize_t __pyx_bshape_0_inner_maxes = 0;
+  Py_buffer __pyx_bstruct_inner_data;
+  Py_ssize_t __pyx_bstride_0_inner_data = 0;
+  Py_ssize_t __pyx_bstride_1_inner_data = 0;
+  Py_ssize_t __pyx_bshape_0_inner_data = 0;
+  Py_ssize_t __pyx_bshape_1_inner_data = 0;
+  Py_buffer __pyx_bstruct_inner_mins;
+  Py_ssize_t __pyx_bstride_0_inner_mins = 0;
+  Py_ssize_t __pyx_bshape_0_inner_mins = 0;
+  int __pyx_r;
+  PyObject *__pyx_1 = 0;
+  PyObject *__pyx_2 = 0;
+  PyObject *__pyx_3 = 0;
+  PyObject *__pyx_4 = 0;
+  PyObject *__pyx_5 = 0;
+  int __pyx_6;
+  int __pyx_7;
+  PyObject *__pyx_8 = 0;
+  PyArrayObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyArrayObject *__pyx_t_6 = NULL;
+  PyArrayObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_data,&__pyx_kp_leafsize,0};
+  __pyx_v_leafsize = 10;
+  if (unlikely(__pyx_kwds)) {
+    PyObject* values[2] = {0,0};
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_data);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_data = values[0];
+    if (values[1]) {
+      __pyx_v_leafsize = __pyx_PyInt_int(values[1]); if (unlikely((__pyx_v_leafsize == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+  } else {
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  2: __pyx_v_leafsize = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_leafsize == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  1: __pyx_v_data = PyTuple_GET_ITEM(__pyx_args, 0);
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__init__");
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_v_inner_data = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_inner_maxes = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_inner_mins = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_inner_indices = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_bstruct_inner_data.buf = NULL;
+  __pyx_bstruct_inner_maxes.buf = NULL;
+  __pyx_bstruct_inner_mins.buf = NULL;
+  __pyx_bstruct_inner_indices.buf = NULL;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":314
+ *         cdef np.ndarray[double, ndim=1] inner_mins
+ *         cdef np.ndarray[np.int32_t, ndim=1] inner_indices
+ *         self.data = np.ascontiguousarray(data,dtype=np.float)             # <<<<<<<<<<<<<<
+ *         self.n, self.m = np.shape(self.data)
+ *         self.leafsize = leafsize
+ */
+  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_1, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_v_data);
+  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_v_data);
+  __pyx_3 = PyDict_New(); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_4, __pyx_kp_float); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_dtype, __pyx_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  __pyx_4 = PyEval_CallObjectWithKeywords(__pyx_2, ((PyObject *)__pyx_1), ((PyObject *)__pyx_3)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  Py_DECREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data = __pyx_4;
+  __pyx_4 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":315
+ *         cdef np.ndarray[np.int32_t, ndim=1] inner_indices
+ *         self.data = np.ascontiguousarray(data,dtype=np.float)
+ *         self.n, self.m = np.shape(self.data)             # <<<<<<<<<<<<<<
+ *         self.leafsize = leafsize
+ *         if self.leafsize<1:
+ */
+  __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_5, __pyx_kp_shape); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  PyTuple_SET_ITEM(__pyx_1, 0, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  __pyx_3 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  if (PyTuple_CheckExact(__pyx_3) && PyTuple_GET_SIZE(__pyx_3) == 2) {
+    PyObject* tuple = __pyx_3;
+    __pyx_5 = PyTuple_GET_ITEM(tuple, 0);
+    Py_INCREF(__pyx_5);
+    __pyx_6 = __pyx_PyInt_int(__pyx_5); if (unlikely((__pyx_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_5); __pyx_5 = 0;
+    ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n = __pyx_6;
+    __pyx_2 = PyTuple_GET_ITEM(tuple, 1);
+    Py_INCREF(__pyx_2);
+    __pyx_6 = __pyx_PyInt_int(__pyx_2); if (unlikely((__pyx_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m = __pyx_6;
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+  }
+  else {
+    __pyx_4 = PyObject_GetIter(__pyx_3); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    __pyx_5 = __Pyx_UnpackItem(__pyx_4, 0); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_6 = __pyx_PyInt_int(__pyx_5); if (unlikely((__pyx_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_5); __pyx_5 = 0;
+    ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n = __pyx_6;
+    __pyx_2 = __Pyx_UnpackItem(__pyx_4, 1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_6 = __pyx_PyInt_int(__pyx_2); if (unlikely((__pyx_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m = __pyx_6;
+    if (__Pyx_EndUnpack(__pyx_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_4); __pyx_4 = 0;
+  }
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":316
+ *         self.data = np.ascontiguousarray(data,dtype=np.float)
+ *         self.n, self.m = np.shape(self.data)
+ *         self.leafsize = leafsize             # <<<<<<<<<<<<<<
+ *         if self.leafsize<1:
+ *             raise ValueError("leafsize must be at least 1")
+ */
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->leafsize = __pyx_v_leafsize;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":317
+ *         self.n, self.m = np.shape(self.data)
+ *         self.leafsize = leafsize
+ *         if self.leafsize<1:             # <<<<<<<<<<<<<<
+ *             raise ValueError("leafsize must be at least 1")
+ *         self.maxes = np.ascontiguousarray(np.amax(self.data,axis=0))
+ */
+  __pyx_7 = (((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->leafsize < 1);
+  if (__pyx_7) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":318
+ *         self.leafsize = leafsize
+ *         if self.leafsize<1:
+ *             raise ValueError("leafsize must be at least 1")             # <<<<<<<<<<<<<<
+ *         self.maxes = np.ascontiguousarray(np.amax(self.data,axis=0))
+ *         self.mins = np.ascontiguousarray(np.amin(self.data,axis=0))
+ */
+    __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 318; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_kp_28);
+    PyTuple_SET_ITEM(__pyx_1, 0, __pyx_kp_28);
+    __pyx_5 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 318; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+    __Pyx_Raise(__pyx_5, 0, 0);
+    Py_DECREF(__pyx_5); __pyx_5 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 318; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":319
+ *         if self.leafsize<1:
+ *             raise ValueError("leafsize must be at least 1")
+ *         self.maxes = np.ascontiguousarray(np.amax(self.data,axis=0))             # <<<<<<<<<<<<<<
+ *         self.mins = np.ascontiguousarray(np.amin(self.data,axis=0))
+ *         self.indices = np.ascontiguousarray(np.arange(self.n,dtype=np.int32))
+ */
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyObject_GetAttr(__pyx_2, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = PyObject_GetAttr(__pyx_4, __pyx_kp_amax); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  PyTuple_SET_ITEM(__pyx_5, 0, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  __pyx_2 = PyDict_New(); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_2, __pyx_kp_axis, __pyx_int_0) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyEval_CallObjectWithKeywords(__pyx_1, ((PyObject *)__pyx_5), ((PyObject *)__pyx_2)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_4);
+  __pyx_4 = 0;
+  __pyx_5 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  Py_DECREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes);
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes = __pyx_5;
+  __pyx_5 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":320
+ *             raise ValueError("leafsize must be at least 1")
+ *         self.maxes = np.ascontiguousarray(np.amax(self.data,axis=0))
+ *         self.mins = np.ascontiguousarray(np.amin(self.data,axis=0))             # <<<<<<<<<<<<<<
+ *         self.indices = np.ascontiguousarray(np.arange(self.n,dtype=np.int32))
+ * 
+ */
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyObject_GetAttr(__pyx_2, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = PyObject_GetAttr(__pyx_3, __pyx_kp_amin); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  PyTuple_SET_ITEM(__pyx_5, 0, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  __pyx_2 = PyDict_New(); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_2, __pyx_kp_axis, __pyx_int_0) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyEval_CallObjectWithKeywords(__pyx_1, ((PyObject *)__pyx_5), ((PyObject *)__pyx_2)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_3);
+  __pyx_3 = 0;
+  __pyx_5 = PyObject_Call(__pyx_4, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  Py_DECREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins);
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins = __pyx_5;
+  __pyx_5 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":321
+ *         self.maxes = np.ascontiguousarray(np.amax(self.data,axis=0))
+ *         self.mins = np.ascontiguousarray(np.amin(self.data,axis=0))
+ *         self.indices = np.ascontiguousarray(np.arange(self.n,dtype=np.int32))             # <<<<<<<<<<<<<<
+ * 
+ *         inner_data = self.data
+ */
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyObject_GetAttr(__pyx_2, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = PyObject_GetAttr(__pyx_4, __pyx_kp_arange); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  __pyx_5 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_2, 0, __pyx_5);
+  __pyx_5 = 0;
+  __pyx_4 = PyDict_New(); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_8 = PyObject_GetAttr(__pyx_5, __pyx_kp_29); if (unlikely(!__pyx_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  if (PyDict_SetItem(__pyx_4, __pyx_kp_dtype, __pyx_8) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_8); __pyx_8 = 0;
+  __pyx_5 = PyEval_CallObjectWithKeywords(__pyx_1, ((PyObject *)__pyx_2), ((PyObject *)__pyx_4)); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+  __pyx_8 = PyTuple_New(1); if (unlikely(!__pyx_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_8, 0, __pyx_5);
+  __pyx_5 = 0;
+  __pyx_1 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_8), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  Py_DECREF(((PyObject *)__pyx_8)); __pyx_8 = 0;
+  Py_DECREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices);
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices = __pyx_1;
+  __pyx_1 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":323
+ *         self.indices = np.ascontiguousarray(np.arange(self.n,dtype=np.int32))
+ * 
+ *         inner_data = self.data             # <<<<<<<<<<<<<<
+ *         self.raw_data = <double*>inner_data.data
+ *         inner_maxes = self.maxes
+ */
+  if (!(__Pyx_TypeTest(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_data);
+  __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_1, &__pyx_bstruct_inner_data, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
+      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_inner_data, &__pyx_bstruct_inner_data, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
+          Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+      }
+  }
+  __pyx_bstride_0_inner_data = __pyx_bstruct_inner_data.strides[0]; __pyx_bstride_1_inner_data = __pyx_bstruct_inner_data.strides[1];
+  __pyx_bshape_0_inner_data = __pyx_bstruct_inner_data.shape[0]; __pyx_bshape_1_inner_data = __pyx_bstruct_inner_data.shape[1];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = 0;
+  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  Py_DECREF(((PyObject *)__pyx_v_inner_data));
+  __pyx_v_inner_data = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":324
+ * 
+ *         inner_data = self.data
+ *         self.raw_data = <double*>inner_data.data             # <<<<<<<<<<<<<<
+ *         inner_maxes = self.maxes
+ *         self.raw_maxes = <double*>inner_maxes.data
+ */
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_data = ((double *)__pyx_v_inner_data->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":325
+ *         inner_data = self.data
+ *         self.raw_data = <double*>inner_data.data
+ *         inner_maxes = self.maxes             # <<<<<<<<<<<<<<
+ *         self.raw_maxes = <double*>inner_maxes.data
+ *         inner_mins = self.mins
+ */
+  if (!(__Pyx_TypeTest(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_maxes);
+  __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_6, &__pyx_bstruct_inner_maxes, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_3);
+      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_inner_maxes, &__pyx_bstruct_inner_maxes, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_3);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_3);
+      }
+  }
+  __pyx_bstride_0_inner_maxes = __pyx_bstruct_inner_maxes.strides[0];
+  __pyx_bshape_0_inner_maxes = __pyx_bstruct_inner_maxes.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = 0;
+  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes);
+  Py_DECREF(((PyObject *)__pyx_v_inner_maxes));
+  __pyx_v_inner_maxes = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":326
+ *         self.raw_data = <double*>inner_data.data
+ *         inner_maxes = self.maxes
+ *         self.raw_maxes = <double*>inner_maxes.data             # <<<<<<<<<<<<<<
+ *         inner_mins = self.mins
+ *         self.raw_mins = <double*>inner_mins.data
+ */
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_maxes = ((double *)__pyx_v_inner_maxes->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":327
+ *         inner_maxes = self.maxes
+ *         self.raw_maxes = <double*>inner_maxes.data
+ *         inner_mins = self.mins             # <<<<<<<<<<<<<<
+ *         self.raw_mins = <double*>inner_mins.data
+ *         inner_indices = self.indices
+ */
+  if (!(__Pyx_TypeTest(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_mins);
+  __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_7, &__pyx_bstruct_inner_mins, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
+      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_inner_mins, &__pyx_bstruct_inner_mins, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+      }
+  }
+  __pyx_bstride_0_inner_mins = __pyx_bstruct_inner_mins.strides[0];
+  __pyx_bshape_0_inner_mins = __pyx_bstruct_inner_mins.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = 0;
+  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins);
+  Py_DECREF(((PyObject *)__pyx_v_inner_mins));
+  __pyx_v_inner_mins = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":328
+ *         self.raw_maxes = <double*>inner_maxes.data
+ *         inner_mins = self.mins
+ *         self.raw_mins = <double*>inner_mins.data             # <<<<<<<<<<<<<<
+ *         inner_indices = self.indices
+ *         self.raw_indices = <np.int32_t*>inner_indices.data
+ */
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_mins = ((double *)__pyx_v_inner_mins->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":329
+ *         inner_mins = self.mins
+ *         self.raw_mins = <double*>inner_mins.data
+ *         inner_indices = self.indices             # <<<<<<<<<<<<<<
+ *         self.raw_indices = <np.int32_t*>inner_indices.data
+ * 
+ */
+  if (!(__Pyx_TypeTest(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_indices);
+  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_t_8, &__pyx_bstruct_inner_indices, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_3);
+      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_inner_indices, &__pyx_bstruct_inner_indices, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_3);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_3);
+      }
+  }
+  __pyx_bstride_0_inner_indices = __pyx_bstruct_inner_indices.strides[0];
+  __pyx_bshape_0_inner_indices = __pyx_bstruct_inner_indices.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = 0;
+  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices);
+  Py_DECREF(((PyObject *)__pyx_v_inner_indices));
+  __pyx_v_inner_indices = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":330
+ *         self.raw_mins = <double*>inner_mins.data
+ *         inner_indices = self.indices
+ *         self.raw_indices = <np.int32_t*>inner_indices.data             # <<<<<<<<<<<<<<
+ * 
+ *         self.tree = self.__build(0, self.n, self.raw_maxes, self.raw_mins)
+ */
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_indices = ((__pyx_t_5numpy_int32_t *)__pyx_v_inner_indices->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":332
+ *         self.raw_indices = <np.int32_t*>inner_indices.data
+ * 
+ *         self.tree = self.__build(0, self.n, self.raw_maxes, self.raw_mins)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef innernode* __build(cKDTree self, int start_idx, int end_idx, double* maxes, double* mins):
+ */
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__build(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), 0, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_maxes, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_mins);
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_1);
+  Py_XDECREF(__pyx_2);
+  Py_XDECREF(__pyx_3);
+  Py_XDECREF(__pyx_4);
+  Py_XDECREF(__pyx_5);
+  Py_XDECREF(__pyx_8);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_indices);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_maxes);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_data);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_mins);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__init__");
+  __pyx_r = -1;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_indices);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_maxes);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_data);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_mins);
+  __pyx_L2:;
+  Py_DECREF(__pyx_v_inner_data);
+  Py_DECREF(__pyx_v_inner_maxes);
+  Py_DECREF(__pyx_v_inner_mins);
+  Py_DECREF(__pyx_v_inner_indices);
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":334
+ *         self.tree = self.__build(0, self.n, self.raw_maxes, self.raw_mins)
+ * 
+ *     cdef innernode* __build(cKDTree self, int start_idx, int end_idx, double* maxes, double* mins):             # <<<<<<<<<<<<<<
+ *         cdef leafnode* n
+ *         cdef innernode* ni
+ */
+
+static  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___build(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, int __pyx_v_start_idx, int __pyx_v_end_idx, double *__pyx_v_maxes, double *__pyx_v_mins) {
+  struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *__pyx_v_n;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_ni;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_t;
+  int __pyx_v_p;
+  int __pyx_v_q;
+  int __pyx_v_d;
+  double __pyx_v_size;
+  double __pyx_v_split;
+  double __pyx_v_minval;
+  double __pyx_v_maxval;
+  double *__pyx_v_mids;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_r;
+  int __pyx_1;
+  int __pyx_2;
+  long __pyx_3;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":340
+ *         cdef double size, split, minval, maxval
+ *         cdef double*mids
+ *         if end_idx-start_idx<=self.leafsize:             # <<<<<<<<<<<<<<
+ *             n = <leafnode*>malloc(sizeof(leafnode))
+ *             n.split_dim = -1
+ */
+  __pyx_1 = ((__pyx_v_end_idx - __pyx_v_start_idx) <= __pyx_v_self->leafsize);
+  if (__pyx_1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":341
+ *         cdef double*mids
+ *         if end_idx-start_idx<=self.leafsize:
+ *             n = <leafnode*>malloc(sizeof(leafnode))             # <<<<<<<<<<<<<<
+ *             n.split_dim = -1
+ *             n.n_points = end_idx-start_idx
+ */
+    __pyx_v_n = ((struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *)malloc((sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode))));
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":342
+ *         if end_idx-start_idx<=self.leafsize:
+ *             n = <leafnode*>malloc(sizeof(leafnode))
+ *             n.split_dim = -1             # <<<<<<<<<<<<<<
+ *             n.n_points = end_idx-start_idx
+ *             n.start_idx = start_idx
+ */
+    __pyx_v_n->split_dim = -1;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":343
+ *             n = <leafnode*>malloc(sizeof(leafnode))
+ *             n.split_dim = -1
+ *             n.n_points = end_idx-start_idx             # <<<<<<<<<<<<<<
+ *             n.start_idx = start_idx
+ *             n.end_idx = end_idx
+ */
+    __pyx_v_n->n_points = (__pyx_v_end_idx - __pyx_v_start_idx);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":344
+ *             n.split_dim = -1
+ *             n.n_points = end_idx-start_idx
+ *             n.start_idx = start_idx             # <<<<<<<<<<<<<<
+ *             n.end_idx = end_idx
+ *             return <innernode*>n
+ */
+    __pyx_v_n->start_idx = __pyx_v_start_idx;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":345
+ *             n.n_points = end_idx-start_idx
+ *             n.start_idx = start_idx
+ *             n.end_idx = end_idx             # <<<<<<<<<<<<<<
+ *             return <innernode*>n
+ *         else:
+ */
+    __pyx_v_n->end_idx = __pyx_v_end_idx;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":346
+ *             n.start_idx = start_idx
+ *             n.end_idx = end_idx
+ *             return <innernode*>n             # <<<<<<<<<<<<<<
+ *         else:
+ *             d = 0
+ */
+    __pyx_r = ((struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *)__pyx_v_n);
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  /*else*/ {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":348
+ *             return <innernode*>n
+ *         else:
+ *             d = 0             # <<<<<<<<<<<<<<
+ *             size = 0
+ *             for i in range(self.m):
+ */
+    __pyx_v_d = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":349
+ *         else:
+ *             d = 0
+ *             size = 0             # <<<<<<<<<<<<<<
+ *             for i in range(self.m):
+ *                 if maxes[i]-mins[i] > size:
+ */
+    __pyx_v_size = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":350
+ *             d = 0
+ *             size = 0
+ *             for i in range(self.m):             # <<<<<<<<<<<<<<
+ *                 if maxes[i]-mins[i] > size:
+ *                     d = i
+ */
+    __pyx_2 = __pyx_v_self->m;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_2; __pyx_v_i+=1) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":351
+ *             size = 0
+ *             for i in range(self.m):
+ *                 if maxes[i]-mins[i] > size:             # <<<<<<<<<<<<<<
+ *                     d = i
+ *                     size =  maxes[i]-mins[i]
+ */
+      __pyx_1 = (((__pyx_v_maxes[__pyx_v_i]) - (__pyx_v_mins[__pyx_v_i])) > __pyx_v_size);
+      if (__pyx_1) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":352
+ *             for i in range(self.m):
+ *                 if maxes[i]-mins[i] > size:
+ *                     d = i             # <<<<<<<<<<<<<<
+ *                     size =  maxes[i]-mins[i]
+ *             maxval = maxes[d]
+ */
+        __pyx_v_d = __pyx_v_i;
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":353
+ *                 if maxes[i]-mins[i] > size:
+ *                     d = i
+ *                     size =  maxes[i]-mins[i]             # <<<<<<<<<<<<<<
+ *             maxval = maxes[d]
+ *             minval = mins[d]
+ */
+        __pyx_v_size = ((__pyx_v_maxes[__pyx_v_i]) - (__pyx_v_mins[__pyx_v_i]));
+        goto __pyx_L6;
+      }
+      __pyx_L6:;
+    }
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":354
+ *                     d = i
+ *                     size =  maxes[i]-mins[i]
+ *             maxval = maxes[d]             # <<<<<<<<<<<<<<
+ *             minval = mins[d]
+ *             if maxval==minval:
+ */
+    __pyx_v_maxval = (__pyx_v_maxes[__pyx_v_d]);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":355
+ *                     size =  maxes[i]-mins[i]
+ *             maxval = maxes[d]
+ *             minval = mins[d]             # <<<<<<<<<<<<<<
+ *             if maxval==minval:
+ *                 # all points are identical; warn user?
+ */
+    __pyx_v_minval = (__pyx_v_mins[__pyx_v_d]);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":356
+ *             maxval = maxes[d]
+ *             minval = mins[d]
+ *             if maxval==minval:             # <<<<<<<<<<<<<<
+ *                 # all points are identical; warn user?
+ *                 n = <leafnode*>malloc(sizeof(leafnode))
+ */
+    __pyx_1 = (__pyx_v_maxval == __pyx_v_minval);
+    if (__pyx_1) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":358
+ *             if maxval==minval:
+ *                 # all points are identical; warn user?
+ *                 n = <leafnode*>malloc(sizeof(leafnode))             # <<<<<<<<<<<<<<
+ *                 n.split_dim = -1
+ *                 n.n_points = end_idx-start_idx
+ */
+      __pyx_v_n = ((struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *)malloc((sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode))));
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":359
  *                 # all points are identical; warn user?
- *                 n = <leafnode*>stdlib.malloc(sizeof(leafnode))             # <<<<<<<<<<<<<<
+ *                 n = <leafnode*>malloc(sizeof(leafnode))
+ *                 n.split_dim = -1             # <<<<<<<<<<<<<<
+ *                 n.n_points = end_idx-start_idx
+ *                 n.start_idx = start_idx
+ */
+      __pyx_v_n->split_dim = -1;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":360
+ *                 n = <leafnode*>malloc(sizeof(leafnode))
+ *                 n.split_dim = -1
+ *                 n.n_points = end_idx-start_idx             # <<<<<<<<<<<<<<
+ *                 n.start_idx = start_idx
+ *                 n.end_idx = end_idx
+ */
+      __pyx_v_n->n_points = (__pyx_v_end_idx - __pyx_v_start_idx);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":361
  *                 n.split_dim = -1
+ *                 n.n_points = end_idx-start_idx
+ *                 n.start_idx = start_idx             # <<<<<<<<<<<<<<
+ *                 n.end_idx = end_idx
+ *                 return <innernode*>n
+ */
+      __pyx_v_n->start_idx = __pyx_v_start_idx;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":362
+ *                 n.n_points = end_idx-start_idx
+ *                 n.start_idx = start_idx
+ *                 n.end_idx = end_idx             # <<<<<<<<<<<<<<
+ *                 return <innernode*>n
+ * 
+ */
+      __pyx_v_n->end_idx = __pyx_v_end_idx;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":363
  *                 n.start_idx = start_idx
+ *                 n.end_idx = end_idx
+ *                 return <innernode*>n             # <<<<<<<<<<<<<<
+ * 
+ *             split = (maxval+minval)/2
+ */
+      __pyx_r = ((struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *)__pyx_v_n);
+      goto __pyx_L0;
+      goto __pyx_L7;
+    }
+    __pyx_L7:;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":365
+ *                 return <innernode*>n
+ * 
+ *             split = (maxval+minval)/2             # <<<<<<<<<<<<<<
+ * 
+ *             p = start_idx
+ */
+    __pyx_v_split = ((__pyx_v_maxval + __pyx_v_minval) / 2);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":367
+ *             split = (maxval+minval)/2
+ * 
+ *             p = start_idx             # <<<<<<<<<<<<<<
+ *             q = end_idx-1
+ *             while p<=q:
+ */
+    __pyx_v_p = __pyx_v_start_idx;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":368
+ * 
+ *             p = start_idx
+ *             q = end_idx-1             # <<<<<<<<<<<<<<
+ *             while p<=q:
+ *                 if self.raw_data[self.raw_indices[p]*self.m+d]<split:
+ */
+    __pyx_v_q = (__pyx_v_end_idx - 1);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":369
+ *             p = start_idx
+ *             q = end_idx-1
+ *             while p<=q:             # <<<<<<<<<<<<<<
+ *                 if self.raw_data[self.raw_indices[p]*self.m+d]<split:
+ *                     p+=1
+ */
+    while (1) {
+      __pyx_1 = (__pyx_v_p <= __pyx_v_q);
+      if (!__pyx_1) break;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":370
+ *             q = end_idx-1
+ *             while p<=q:
+ *                 if self.raw_data[self.raw_indices[p]*self.m+d]<split:             # <<<<<<<<<<<<<<
+ *                     p+=1
+ *                 elif self.raw_data[self.raw_indices[q]*self.m+d]>=split:
+ */
+      __pyx_1 = ((__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_p]) * __pyx_v_self->m) + __pyx_v_d)]) < __pyx_v_split);
+      if (__pyx_1) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":371
+ *             while p<=q:
+ *                 if self.raw_data[self.raw_indices[p]*self.m+d]<split:
+ *                     p+=1             # <<<<<<<<<<<<<<
+ *                 elif self.raw_data[self.raw_indices[q]*self.m+d]>=split:
+ *                     q-=1
+ */
+        __pyx_v_p += 1;
+        goto __pyx_L10;
+      }
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":372
+ *                 if self.raw_data[self.raw_indices[p]*self.m+d]<split:
+ *                     p+=1
+ *                 elif self.raw_data[self.raw_indices[q]*self.m+d]>=split:             # <<<<<<<<<<<<<<
+ *                     q-=1
+ *                 else:
+ */
+      __pyx_1 = ((__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_q]) * __pyx_v_self->m) + __pyx_v_d)]) >= __pyx_v_split);
+      if (__pyx_1) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":373
+ *                     p+=1
+ *                 elif self.raw_data[self.raw_indices[q]*self.m+d]>=split:
+ *                     q-=1             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     t = self.raw_indices[p]
+ */
+        __pyx_v_q -= 1;
+        goto __pyx_L10;
+      }
+      /*else*/ {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":375
+ *                     q-=1
+ *                 else:
+ *                     t = self.raw_indices[p]             # <<<<<<<<<<<<<<
+ *                     self.raw_indices[p] = self.raw_indices[q]
+ *                     self.raw_indices[q] = t
+ */
+        __pyx_v_t = (__pyx_v_self->raw_indices[__pyx_v_p]);
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":376
+ *                 else:
+ *                     t = self.raw_indices[p]
+ *                     self.raw_indices[p] = self.raw_indices[q]             # <<<<<<<<<<<<<<
+ *                     self.raw_indices[q] = t
+ *                     p+=1
+ */
+        (__pyx_v_self->raw_indices[__pyx_v_p]) = (__pyx_v_self->raw_indices[__pyx_v_q]);
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":377
+ *                     t = self.raw_indices[p]
+ *                     self.raw_indices[p] = self.raw_indices[q]
+ *                     self.raw_indices[q] = t             # <<<<<<<<<<<<<<
+ *                     p+=1
+ *                     q-=1
+ */
+        (__pyx_v_self->raw_indices[__pyx_v_q]) = __pyx_v_t;
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":378
+ *                     self.raw_indices[p] = self.raw_indices[q]
+ *                     self.raw_indices[q] = t
+ *                     p+=1             # <<<<<<<<<<<<<<
+ *                     q-=1
+ * 
+ */
+        __pyx_v_p += 1;
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":379
+ *                     self.raw_indices[q] = t
+ *                     p+=1
+ *                     q-=1             # <<<<<<<<<<<<<<
+ * 
+ *             # slide midpoint if necessary
+ */
+        __pyx_v_q -= 1;
+      }
+      __pyx_L10:;
+    }
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":382
+ * 
+ *             # slide midpoint if necessary
+ *             if p==start_idx:             # <<<<<<<<<<<<<<
+ *                 # no points less than split
+ *                 j = start_idx
+ */
+    __pyx_1 = (__pyx_v_p == __pyx_v_start_idx);
+    if (__pyx_1) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":384
+ *             if p==start_idx:
+ *                 # no points less than split
+ *                 j = start_idx             # <<<<<<<<<<<<<<
+ *                 split = self.raw_data[self.raw_indices[j]*self.m+d]
+ *                 for i in range(start_idx+1, end_idx):
+ */
+      __pyx_v_j = __pyx_v_start_idx;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":385
+ *                 # no points less than split
+ *                 j = start_idx
+ *                 split = self.raw_data[self.raw_indices[j]*self.m+d]             # <<<<<<<<<<<<<<
+ *                 for i in range(start_idx+1, end_idx):
+ *                     if self.raw_data[self.raw_indices[i]*self.m+d]<split:
+ */
+      __pyx_v_split = (__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_j]) * __pyx_v_self->m) + __pyx_v_d)]);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":386
+ *                 j = start_idx
+ *                 split = self.raw_data[self.raw_indices[j]*self.m+d]
+ *                 for i in range(start_idx+1, end_idx):             # <<<<<<<<<<<<<<
+ *                     if self.raw_data[self.raw_indices[i]*self.m+d]<split:
+ *                         j = i
+ */
+      for (__pyx_v_i = (__pyx_v_start_idx + 1); __pyx_v_i < __pyx_v_end_idx; __pyx_v_i+=1) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":387
+ *                 split = self.raw_data[self.raw_indices[j]*self.m+d]
+ *                 for i in range(start_idx+1, end_idx):
+ *                     if self.raw_data[self.raw_indices[i]*self.m+d]<split:             # <<<<<<<<<<<<<<
+ *                         j = i
+ *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
+ */
+        __pyx_1 = ((__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_i]) * __pyx_v_self->m) + __pyx_v_d)]) < __pyx_v_split);
+        if (__pyx_1) {
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":388
+ *                 for i in range(start_idx+1, end_idx):
+ *                     if self.raw_data[self.raw_indices[i]*self.m+d]<split:
+ *                         j = i             # <<<<<<<<<<<<<<
+ *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
+ *                 t = self.raw_indices[start_idx]
+ */
+          __pyx_v_j = __pyx_v_i;
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":389
+ *                     if self.raw_data[self.raw_indices[i]*self.m+d]<split:
+ *                         j = i
+ *                         split = self.raw_data[self.raw_indices[j]*self.m+d]             # <<<<<<<<<<<<<<
+ *                 t = self.raw_indices[start_idx]
+ *                 self.raw_indices[start_idx] = self.raw_indices[j]
+ */
+          __pyx_v_split = (__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_j]) * __pyx_v_self->m) + __pyx_v_d)]);
+          goto __pyx_L14;
+        }
+        __pyx_L14:;
+      }
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":390
+ *                         j = i
+ *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
+ *                 t = self.raw_indices[start_idx]             # <<<<<<<<<<<<<<
+ *                 self.raw_indices[start_idx] = self.raw_indices[j]
+ *                 self.raw_indices[j] = t
+ */
+      __pyx_v_t = (__pyx_v_self->raw_indices[__pyx_v_start_idx]);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":391
+ *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
+ *                 t = self.raw_indices[start_idx]
+ *                 self.raw_indices[start_idx] = self.raw_indices[j]             # <<<<<<<<<<<<<<
+ *                 self.raw_indices[j] = t
+ *                 p = start_idx+1
+ */
+      (__pyx_v_self->raw_indices[__pyx_v_start_idx]) = (__pyx_v_self->raw_indices[__pyx_v_j]);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":392
+ *                 t = self.raw_indices[start_idx]
+ *                 self.raw_indices[start_idx] = self.raw_indices[j]
+ *                 self.raw_indices[j] = t             # <<<<<<<<<<<<<<
+ *                 p = start_idx+1
+ *                 q = start_idx
+ */
+      (__pyx_v_self->raw_indices[__pyx_v_j]) = __pyx_v_t;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":393
+ *                 self.raw_indices[start_idx] = self.raw_indices[j]
+ *                 self.raw_indices[j] = t
+ *                 p = start_idx+1             # <<<<<<<<<<<<<<
+ *                 q = start_idx
+ *             elif p==end_idx:
+ */
+      __pyx_v_p = (__pyx_v_start_idx + 1);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":394
+ *                 self.raw_indices[j] = t
+ *                 p = start_idx+1
+ *                 q = start_idx             # <<<<<<<<<<<<<<
+ *             elif p==end_idx:
+ *                 # no points greater than split
+ */
+      __pyx_v_q = __pyx_v_start_idx;
+      goto __pyx_L11;
+    }
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":395
+ *                 p = start_idx+1
+ *                 q = start_idx
+ *             elif p==end_idx:             # <<<<<<<<<<<<<<
+ *                 # no points greater than split
+ *                 j = end_idx-1
+ */
+    __pyx_1 = (__pyx_v_p == __pyx_v_end_idx);
+    if (__pyx_1) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":397
+ *             elif p==end_idx:
+ *                 # no points greater than split
+ *                 j = end_idx-1             # <<<<<<<<<<<<<<
+ *                 split = self.raw_data[self.raw_indices[j]*self.m+d]
+ *                 for i in range(start_idx, end_idx-1):
+ */
+      __pyx_v_j = (__pyx_v_end_idx - 1);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":398
+ *                 # no points greater than split
+ *                 j = end_idx-1
+ *                 split = self.raw_data[self.raw_indices[j]*self.m+d]             # <<<<<<<<<<<<<<
+ *                 for i in range(start_idx, end_idx-1):
+ *                     if self.raw_data[self.raw_indices[i]*self.m+d]>split:
+ */
+      __pyx_v_split = (__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_j]) * __pyx_v_self->m) + __pyx_v_d)]);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":399
+ *                 j = end_idx-1
+ *                 split = self.raw_data[self.raw_indices[j]*self.m+d]
+ *                 for i in range(start_idx, end_idx-1):             # <<<<<<<<<<<<<<
+ *                     if self.raw_data[self.raw_indices[i]*self.m+d]>split:
+ *                         j = i
+ */
+      __pyx_3 = (__pyx_v_end_idx - 1);
+      for (__pyx_v_i = __pyx_v_start_idx; __pyx_v_i < __pyx_3; __pyx_v_i+=1) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":400
+ *                 split = self.raw_data[self.raw_indices[j]*self.m+d]
+ *                 for i in range(start_idx, end_idx-1):
+ *                     if self.raw_data[self.raw_indices[i]*self.m+d]>split:             # <<<<<<<<<<<<<<
+ *                         j = i
+ *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
+ */
+        __pyx_1 = ((__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_i]) * __pyx_v_self->m) + __pyx_v_d)]) > __pyx_v_split);
+        if (__pyx_1) {
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":401
+ *                 for i in range(start_idx, end_idx-1):
+ *                     if self.raw_data[self.raw_indices[i]*self.m+d]>split:
+ *                         j = i             # <<<<<<<<<<<<<<
+ *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
+ *                 t = self.raw_indices[end_idx-1]
+ */
+          __pyx_v_j = __pyx_v_i;
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":402
+ *                     if self.raw_data[self.raw_indices[i]*self.m+d]>split:
+ *                         j = i
+ *                         split = self.raw_data[self.raw_indices[j]*self.m+d]             # <<<<<<<<<<<<<<
+ *                 t = self.raw_indices[end_idx-1]
+ *                 self.raw_indices[end_idx-1] = self.raw_indices[j]
+ */
+          __pyx_v_split = (__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_j]) * __pyx_v_self->m) + __pyx_v_d)]);
+          goto __pyx_L17;
+        }
+        __pyx_L17:;
+      }
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":403
+ *                         j = i
+ *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
+ *                 t = self.raw_indices[end_idx-1]             # <<<<<<<<<<<<<<
+ *                 self.raw_indices[end_idx-1] = self.raw_indices[j]
+ *                 self.raw_indices[j] = t
+ */
+      __pyx_v_t = (__pyx_v_self->raw_indices[(__pyx_v_end_idx - 1)]);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":404
+ *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
+ *                 t = self.raw_indices[end_idx-1]
+ *                 self.raw_indices[end_idx-1] = self.raw_indices[j]             # <<<<<<<<<<<<<<
+ *                 self.raw_indices[j] = t
+ *                 p = end_idx-1
+ */
+      (__pyx_v_self->raw_indices[(__pyx_v_end_idx - 1)]) = (__pyx_v_self->raw_indices[__pyx_v_j]);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":405
+ *                 t = self.raw_indices[end_idx-1]
+ *                 self.raw_indices[end_idx-1] = self.raw_indices[j]
+ *                 self.raw_indices[j] = t             # <<<<<<<<<<<<<<
+ *                 p = end_idx-1
+ *                 q = end_idx-2
+ */
+      (__pyx_v_self->raw_indices[__pyx_v_j]) = __pyx_v_t;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":406
+ *                 self.raw_indices[end_idx-1] = self.raw_indices[j]
+ *                 self.raw_indices[j] = t
+ *                 p = end_idx-1             # <<<<<<<<<<<<<<
+ *                 q = end_idx-2
+ * 
+ */
+      __pyx_v_p = (__pyx_v_end_idx - 1);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":407
+ *                 self.raw_indices[j] = t
+ *                 p = end_idx-1
+ *                 q = end_idx-2             # <<<<<<<<<<<<<<
+ * 
+ *             # construct new node representation
+ */
+      __pyx_v_q = (__pyx_v_end_idx - 2);
+      goto __pyx_L11;
+    }
+    __pyx_L11:;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":410
+ * 
+ *             # construct new node representation
+ *             ni = <innernode*>malloc(sizeof(innernode))             # <<<<<<<<<<<<<<
+ * 
+ *             mids = <double*>malloc(sizeof(double)*self.m)
+ */
+    __pyx_v_ni = ((struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *)malloc((sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_innernode))));
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":412
+ *             ni = <innernode*>malloc(sizeof(innernode))
+ * 
+ *             mids = <double*>malloc(sizeof(double)*self.m)             # <<<<<<<<<<<<<<
+ *             for i in range(self.m):
+ *                 mids[i] = maxes[i]
+ */
+    __pyx_v_mids = ((double *)malloc(((sizeof(double)) * __pyx_v_self->m)));
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":413
+ * 
+ *             mids = <double*>malloc(sizeof(double)*self.m)
+ *             for i in range(self.m):             # <<<<<<<<<<<<<<
+ *                 mids[i] = maxes[i]
+ *             mids[d] = split
+ */
+    __pyx_2 = __pyx_v_self->m;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_2; __pyx_v_i+=1) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":414
+ *             mids = <double*>malloc(sizeof(double)*self.m)
+ *             for i in range(self.m):
+ *                 mids[i] = maxes[i]             # <<<<<<<<<<<<<<
+ *             mids[d] = split
+ *             ni.less = self.__build(start_idx,p,mids,mins)
+ */
+      (__pyx_v_mids[__pyx_v_i]) = (__pyx_v_maxes[__pyx_v_i]);
+    }
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":415
+ *             for i in range(self.m):
+ *                 mids[i] = maxes[i]
+ *             mids[d] = split             # <<<<<<<<<<<<<<
+ *             ni.less = self.__build(start_idx,p,mids,mins)
+ * 
+ */
+    (__pyx_v_mids[__pyx_v_d]) = __pyx_v_split;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":416
+ *                 mids[i] = maxes[i]
+ *             mids[d] = split
+ *             ni.less = self.__build(start_idx,p,mids,mins)             # <<<<<<<<<<<<<<
+ * 
+ *             for i in range(self.m):
+ */
+    __pyx_v_ni->less = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__build(__pyx_v_self, __pyx_v_start_idx, __pyx_v_p, __pyx_v_mids, __pyx_v_mins);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":418
+ *             ni.less = self.__build(start_idx,p,mids,mins)
+ * 
+ *             for i in range(self.m):             # <<<<<<<<<<<<<<
+ *                 mids[i] = mins[i]
+ *             mids[d] = split
+ */
+    __pyx_2 = __pyx_v_self->m;
+    for (__pyx_v_i = 0; __pyx_v_i < __pyx_2; __pyx_v_i+=1) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":419
+ * 
+ *             for i in range(self.m):
+ *                 mids[i] = mins[i]             # <<<<<<<<<<<<<<
+ *             mids[d] = split
+ *             ni.greater = self.__build(p,end_idx,maxes,mids)
+ */
+      (__pyx_v_mids[__pyx_v_i]) = (__pyx_v_mins[__pyx_v_i]);
+    }
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":420
+ *             for i in range(self.m):
+ *                 mids[i] = mins[i]
+ *             mids[d] = split             # <<<<<<<<<<<<<<
+ *             ni.greater = self.__build(p,end_idx,maxes,mids)
+ * 
+ */
+    (__pyx_v_mids[__pyx_v_d]) = __pyx_v_split;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":421
+ *                 mids[i] = mins[i]
+ *             mids[d] = split
+ *             ni.greater = self.__build(p,end_idx,maxes,mids)             # <<<<<<<<<<<<<<
+ * 
+ *             free(mids)
+ */
+    __pyx_v_ni->greater = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__build(__pyx_v_self, __pyx_v_p, __pyx_v_end_idx, __pyx_v_maxes, __pyx_v_mids);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":423
+ *             ni.greater = self.__build(p,end_idx,maxes,mids)
+ * 
+ *             free(mids)             # <<<<<<<<<<<<<<
+ * 
+ *             ni.split_dim = d
+ */
+    free(__pyx_v_mids);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":425
+ *             free(mids)
+ * 
+ *             ni.split_dim = d             # <<<<<<<<<<<<<<
+ *             ni.split = split
+ *             ni.n_points = end_idx-start_idx
+ */
+    __pyx_v_ni->split_dim = __pyx_v_d;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":426
+ * 
+ *             ni.split_dim = d
+ *             ni.split = split             # <<<<<<<<<<<<<<
+ *             ni.n_points = end_idx-start_idx
+ *             ni.start_idx = start_idx
+ */
+    __pyx_v_ni->split = __pyx_v_split;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":427
+ *             ni.split_dim = d
+ *             ni.split = split
+ *             ni.n_points = end_idx-start_idx             # <<<<<<<<<<<<<<
+ *             ni.start_idx = start_idx
+ *             ni.end_idx = end_idx
+ */
+    __pyx_v_ni->n_points = (__pyx_v_end_idx - __pyx_v_start_idx);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":428
+ *             ni.split = split
+ *             ni.n_points = end_idx-start_idx
+ *             ni.start_idx = start_idx             # <<<<<<<<<<<<<<
+ *             ni.end_idx = end_idx
+ * 
+ */
+    __pyx_v_ni->start_idx = __pyx_v_start_idx;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":429
+ *             ni.n_points = end_idx-start_idx
+ *             ni.start_idx = start_idx
+ *             ni.end_idx = end_idx             # <<<<<<<<<<<<<<
+ * 
+ *             return ni
+ */
+    __pyx_v_ni->end_idx = __pyx_v_end_idx;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":431
+ *             ni.end_idx = end_idx
+ * 
+ *             return ni             # <<<<<<<<<<<<<<
+ * 
+ *     cdef __free_tree(cKDTree self, innernode* node):
+ */
+    __pyx_r = __pyx_v_ni;
+    goto __pyx_L0;
+  }
+  __pyx_L3:;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":433
+ *             return ni
+ * 
+ *     cdef __free_tree(cKDTree self, innernode* node):             # <<<<<<<<<<<<<<
+ *         if node.split_dim!=-1:
+ *             self.__free_tree(node.less)
+ */
+
+static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___free_tree(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node) {
+  PyObject *__pyx_r;
+  int __pyx_1;
+  PyObject *__pyx_2 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":434
+ * 
+ *     cdef __free_tree(cKDTree self, innernode* node):
+ *         if node.split_dim!=-1:             # <<<<<<<<<<<<<<
+ *             self.__free_tree(node.less)
+ *             self.__free_tree(node.greater)
+ */
+  __pyx_1 = (__pyx_v_node->split_dim != -1);
+  if (__pyx_1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":435
+ *     cdef __free_tree(cKDTree self, innernode* node):
+ *         if node.split_dim!=-1:
+ *             self.__free_tree(node.less)             # <<<<<<<<<<<<<<
+ *             self.__free_tree(node.greater)
+ *         free(node)
+ */
+    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__free_tree(__pyx_v_self, __pyx_v_node->less); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":436
+ *         if node.split_dim!=-1:
+ *             self.__free_tree(node.less)
+ *             self.__free_tree(node.greater)             # <<<<<<<<<<<<<<
+ *         free(node)
+ * 
+ */
+    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__free_tree(__pyx_v_self, __pyx_v_node->greater); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":437
+ *             self.__free_tree(node.less)
+ *             self.__free_tree(node.greater)
+ *         free(node)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int __count_nodes(cKDTree self, innernode* node):
+ */
+  free(__pyx_v_node);
+
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_2);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__free_tree");
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":439
+ *         free(node)
+ * 
+ *     cdef int __count_nodes(cKDTree self, innernode* node):             # <<<<<<<<<<<<<<
+ *         if node.split_dim==-1:
+ *             return 1
+ */
+
+static  int __pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___count_nodes(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node) {
+  int __pyx_r;
+  int __pyx_1;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":440
+ * 
+ *     cdef int __count_nodes(cKDTree self, innernode* node):
+ *         if node.split_dim==-1:             # <<<<<<<<<<<<<<
+ *             return 1
+ *         else:
+ */
+  __pyx_1 = (__pyx_v_node->split_dim == -1);
+  if (__pyx_1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":441
+ *     cdef int __count_nodes(cKDTree self, innernode* node):
+ *         if node.split_dim==-1:
+ *             return 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             return 1+self.__count_nodes(node.less)+self.__count_nodes(node.greater)
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  /*else*/ {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":443
+ *             return 1
+ *         else:
+ *             return 1+self.__count_nodes(node.less)+self.__count_nodes(node.greater)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int __flatten(cKDTree self, innernode* node, int i, flatnodes* f):
+ */
+    __pyx_r = ((1 + ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__count_nodes(__pyx_v_self, __pyx_v_node->less)) + ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__count_nodes(__pyx_v_self, __pyx_v_node->greater));
+    goto __pyx_L0;
+  }
+  __pyx_L3:;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":445
+ *             return 1+self.__count_nodes(node.less)+self.__count_nodes(node.greater)
+ * 
+ *     cdef int __flatten(cKDTree self, innernode* node, int i, flatnodes* f):             # <<<<<<<<<<<<<<
+ *         # store node as entry i and its subtrees after it;
+ *         # returns the first entry after the subtrees
+ */
+
+static  int __pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___flatten(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node, int __pyx_v_i, struct __pyx_t_5scipy_7spatial_7ckdtree_flatnodes *__pyx_v_f) {
+  int __pyx_v_j;
+  int __pyx_r;
+  int __pyx_1;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":449
+ *         # returns the first entry after the subtrees
+ *         cdef int j
+ *         f.split_dim[i] = node.split_dim             # <<<<<<<<<<<<<<
+ *         f.start_idx[i] = node.start_idx
+ *         f.end_idx[i] = node.end_idx
+ */
+  (__pyx_v_f->split_dim[__pyx_v_i]) = __pyx_v_node->split_dim;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":450
+ *         cdef int j
+ *         f.split_dim[i] = node.split_dim
+ *         f.start_idx[i] = node.start_idx             # <<<<<<<<<<<<<<
+ *         f.end_idx[i] = node.end_idx
+ *         if node.split_dim==-1:
+ */
+  (__pyx_v_f->start_idx[__pyx_v_i]) = __pyx_v_node->start_idx;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":451
+ *         f.split_dim[i] = node.split_dim
+ *         f.start_idx[i] = node.start_idx
+ *         f.end_idx[i] = node.end_idx             # <<<<<<<<<<<<<<
+ *         if node.split_dim==-1:
+ *             f.split[i] = 0
+ */
+  (__pyx_v_f->end_idx[__pyx_v_i]) = __pyx_v_node->end_idx;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":452
+ *         f.start_idx[i] = node.start_idx
+ *         f.end_idx[i] = node.end_idx
+ *         if node.split_dim==-1:             # <<<<<<<<<<<<<<
+ *             f.split[i] = 0
+ *             f.less[i] = -1
+ */
+  __pyx_1 = (__pyx_v_node->split_dim == -1);
+  if (__pyx_1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":453
+ *         f.end_idx[i] = node.end_idx
+ *         if node.split_dim==-1:
+ *             f.split[i] = 0             # <<<<<<<<<<<<<<
+ *             f.less[i] = -1
+ *             f.greater[i] = -1
+ */
+    (__pyx_v_f->split[__pyx_v_i]) = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":454
+ *         if node.split_dim==-1:
+ *             f.split[i] = 0
+ *             f.less[i] = -1             # <<<<<<<<<<<<<<
+ *             f.greater[i] = -1
+ *             return i+1
+ */
+    (__pyx_v_f->less[__pyx_v_i]) = -1;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":455
+ *             f.split[i] = 0
+ *             f.less[i] = -1
+ *             f.greater[i] = -1             # <<<<<<<<<<<<<<
+ *             return i+1
+ *         f.split[i] = node.split
+ */
+    (__pyx_v_f->greater[__pyx_v_i]) = -1;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":456
+ *             f.less[i] = -1
+ *             f.greater[i] = -1
+ *             return i+1             # <<<<<<<<<<<<<<
+ *         f.split[i] = node.split
+ *         f.less[i] = i+1
+ */
+    __pyx_r = (__pyx_v_i + 1);
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":457
+ *             f.greater[i] = -1
+ *             return i+1
+ *         f.split[i] = node.split             # <<<<<<<<<<<<<<
+ *         f.less[i] = i+1
+ *         j = self.__flatten(node.less, i+1, f)
+ */
+  (__pyx_v_f->split[__pyx_v_i]) = __pyx_v_node->split;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":458
+ *             return i+1
+ *         f.split[i] = node.split
+ *         f.less[i] = i+1             # <<<<<<<<<<<<<<
+ *         j = self.__flatten(node.less, i+1, f)
+ *         f.greater[i] = j
+ */
+  (__pyx_v_f->less[__pyx_v_i]) = (__pyx_v_i + 1);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":459
+ *         f.split[i] = node.split
+ *         f.less[i] = i+1
+ *         j = self.__flatten(node.less, i+1, f)             # <<<<<<<<<<<<<<
+ *         f.greater[i] = j
+ *         return self.__flatten(node.greater, j, f)
+ */
+  __pyx_v_j = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__flatten(__pyx_v_self, __pyx_v_node->less, (__pyx_v_i + 1), __pyx_v_f);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":460
+ *         f.less[i] = i+1
+ *         j = self.__flatten(node.less, i+1, f)
+ *         f.greater[i] = j             # <<<<<<<<<<<<<<
+ *         return self.__flatten(node.greater, j, f)
+ * 
+ */
+  (__pyx_v_f->greater[__pyx_v_i]) = __pyx_v_j;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":461
+ *         j = self.__flatten(node.less, i+1, f)
+ *         f.greater[i] = j
+ *         return self.__flatten(node.greater, j, f)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef innernode* __unflatten(cKDTree self, int i, flatnodes* f):
+ */
+  __pyx_r = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__flatten(__pyx_v_self, __pyx_v_node->greater, __pyx_v_j, __pyx_v_f);
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":463
+ *         return self.__flatten(node.greater, j, f)
+ * 
+ *     cdef innernode* __unflatten(cKDTree self, int i, flatnodes* f):             # <<<<<<<<<<<<<<
+ *         cdef leafnode* n
+ *         cdef innernode* ni
+ */
+
+static  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___unflatten(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, int __pyx_v_i, struct __pyx_t_5scipy_7spatial_7ckdtree_flatnodes *__pyx_v_f) {
+  struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *__pyx_v_n;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_ni;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_r;
+  int __pyx_1;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":466
+ *         cdef leafnode* n
+ *         cdef innernode* ni
+ *         if f.split_dim[i]==-1:             # <<<<<<<<<<<<<<
+ *             n = <leafnode*>malloc(sizeof(leafnode))
+ *             n.split_dim = -1
+ */
+  __pyx_1 = ((__pyx_v_f->split_dim[__pyx_v_i]) == -1);
+  if (__pyx_1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":467
+ *         cdef innernode* ni
+ *         if f.split_dim[i]==-1:
+ *             n = <leafnode*>malloc(sizeof(leafnode))             # <<<<<<<<<<<<<<
+ *             n.split_dim = -1
+ *             n.n_points = f.end_idx[i]-f.start_idx[i]
+ */
+    __pyx_v_n = ((struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *)malloc((sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode))));
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":468
+ *         if f.split_dim[i]==-1:
+ *             n = <leafnode*>malloc(sizeof(leafnode))
+ *             n.split_dim = -1             # <<<<<<<<<<<<<<
+ *             n.n_points = f.end_idx[i]-f.start_idx[i]
+ *             n.start_idx = f.start_idx[i]
+ */
+    __pyx_v_n->split_dim = -1;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":469
+ *             n = <leafnode*>malloc(sizeof(leafnode))
+ *             n.split_dim = -1
+ *             n.n_points = f.end_idx[i]-f.start_idx[i]             # <<<<<<<<<<<<<<
+ *             n.start_idx = f.start_idx[i]
+ *             n.end_idx = f.end_idx[i]
+ */
+    __pyx_v_n->n_points = ((__pyx_v_f->end_idx[__pyx_v_i]) - (__pyx_v_f->start_idx[__pyx_v_i]));
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":470
+ *             n.split_dim = -1
+ *             n.n_points = f.end_idx[i]-f.start_idx[i]
+ *             n.start_idx = f.start_idx[i]             # <<<<<<<<<<<<<<
+ *             n.end_idx = f.end_idx[i]
+ *             return <innernode*>n
+ */
+    __pyx_v_n->start_idx = (__pyx_v_f->start_idx[__pyx_v_i]);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":471
+ *             n.n_points = f.end_idx[i]-f.start_idx[i]
+ *             n.start_idx = f.start_idx[i]
+ *             n.end_idx = f.end_idx[i]             # <<<<<<<<<<<<<<
+ *             return <innernode*>n
+ *         ni = <innernode*>malloc(sizeof(innernode))
+ */
+    __pyx_v_n->end_idx = (__pyx_v_f->end_idx[__pyx_v_i]);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":472
+ *             n.start_idx = f.start_idx[i]
+ *             n.end_idx = f.end_idx[i]
+ *             return <innernode*>n             # <<<<<<<<<<<<<<
+ *         ni = <innernode*>malloc(sizeof(innernode))
+ *         ni.split_dim = f.split_dim[i]
+ */
+    __pyx_r = ((struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *)__pyx_v_n);
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":473
+ *             n.end_idx = f.end_idx[i]
+ *             return <innernode*>n
+ *         ni = <innernode*>malloc(sizeof(innernode))             # <<<<<<<<<<<<<<
+ *         ni.split_dim = f.split_dim[i]
+ *         ni.split = f.split[i]
+ */
+  __pyx_v_ni = ((struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *)malloc((sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_innernode))));
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":474
+ *             return <innernode*>n
+ *         ni = <innernode*>malloc(sizeof(innernode))
+ *         ni.split_dim = f.split_dim[i]             # <<<<<<<<<<<<<<
+ *         ni.split = f.split[i]
+ *         ni.n_points = f.end_idx[i]-f.start_idx[i]
+ */
+  __pyx_v_ni->split_dim = (__pyx_v_f->split_dim[__pyx_v_i]);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":475
+ *         ni = <innernode*>malloc(sizeof(innernode))
+ *         ni.split_dim = f.split_dim[i]
+ *         ni.split = f.split[i]             # <<<<<<<<<<<<<<
+ *         ni.n_points = f.end_idx[i]-f.start_idx[i]
+ *         ni.start_idx = f.start_idx[i]
+ */
+  __pyx_v_ni->split = (__pyx_v_f->split[__pyx_v_i]);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":476
+ *         ni.split_dim = f.split_dim[i]
+ *         ni.split = f.split[i]
+ *         ni.n_points = f.end_idx[i]-f.start_idx[i]             # <<<<<<<<<<<<<<
+ *         ni.start_idx = f.start_idx[i]
+ *         ni.end_idx = f.end_idx[i]
+ */
+  __pyx_v_ni->n_points = ((__pyx_v_f->end_idx[__pyx_v_i]) - (__pyx_v_f->start_idx[__pyx_v_i]));
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":477
+ *         ni.split = f.split[i]
+ *         ni.n_points = f.end_idx[i]-f.start_idx[i]
+ *         ni.start_idx = f.start_idx[i]             # <<<<<<<<<<<<<<
+ *         ni.end_idx = f.end_idx[i]
+ *         ni.less = self.__unflatten(f.less[i], f)
+ */
+  __pyx_v_ni->start_idx = (__pyx_v_f->start_idx[__pyx_v_i]);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":478
+ *         ni.n_points = f.end_idx[i]-f.start_idx[i]
+ *         ni.start_idx = f.start_idx[i]
+ *         ni.end_idx = f.end_idx[i]             # <<<<<<<<<<<<<<
+ *         ni.less = self.__unflatten(f.less[i], f)
+ *         ni.greater = self.__unflatten(f.greater[i], f)
+ */
+  __pyx_v_ni->end_idx = (__pyx_v_f->end_idx[__pyx_v_i]);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":479
+ *         ni.start_idx = f.start_idx[i]
+ *         ni.end_idx = f.end_idx[i]
+ *         ni.less = self.__unflatten(f.less[i], f)             # <<<<<<<<<<<<<<
+ *         ni.greater = self.__unflatten(f.greater[i], f)
+ *         return ni
+ */
+  __pyx_v_ni->less = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__unflatten(__pyx_v_self, (__pyx_v_f->less[__pyx_v_i]), __pyx_v_f);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":480
+ *         ni.end_idx = f.end_idx[i]
+ *         ni.less = self.__unflatten(f.less[i], f)
+ *         ni.greater = self.__unflatten(f.greater[i], f)             # <<<<<<<<<<<<<<
+ *         return ni
+ * 
+ */
+  __pyx_v_ni->greater = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__unflatten(__pyx_v_self, (__pyx_v_f->greater[__pyx_v_i]), __pyx_v_f);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":481
+ *         ni.less = self.__unflatten(f.less[i], f)
+ *         ni.greater = self.__unflatten(f.greater[i], f)
+ *         return ni             # <<<<<<<<<<<<<<
+ * 
+ *     def __getstate__(cKDTree self):
+ */
+  __pyx_r = __pyx_v_ni;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":483
+ *         return ni
+ * 
+ *     def __getstate__(cKDTree self):             # <<<<<<<<<<<<<<
+ *         cdef np.ndarray[np.int32_t, ndim=1] split_dim
+ *         cdef np.ndarray[double, ndim=1] split
+ */
+
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___getstate__(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___getstate__(PyObject *__pyx_v_self, PyObject *unused) {
+  PyArrayObject *__pyx_v_split_dim;
+  PyArrayObject *__pyx_v_split;
+  PyArrayObject *__pyx_v_start_idx;
+  PyArrayObject *__pyx_v_end_idx;
+  PyArrayObject *__pyx_v_less;
+  PyArrayObject *__pyx_v_greater;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_flatnodes __pyx_v_f;
+  int __pyx_v_n_nodes;
+  Py_buffer __pyx_bstruct_greater;
+  Py_ssize_t __pyx_bstride_0_greater = 0;
+  Py_ssize_t __pyx_bshape_0_greater = 0;
+  Py_buffer __pyx_bstruct_less;
+  Py_ssize_t __pyx_bstride_0_less = 0;
+  Py_ssize_t __pyx_bshape_0_less = 0;
+  Py_buffer __pyx_bstruct_split_dim;
+  Py_ssize_t __pyx_bstride_0_split_dim = 0;
+  Py_ssize_t __pyx_bshape_0_split_dim = 0;
+  Py_buffer __pyx_bstruct_split;
+  Py_ssize_t __pyx_bstride_0_split = 0;
+  Py_ssize_t __pyx_bshape_0_split = 0;
+  Py_buffer __pyx_bstruct_end_idx;
+  Py_ssize_t __pyx_bstride_0_end_idx = 0;
+  Py_ssize_t __pyx_bshape_0_end_idx = 0;
+  Py_buffer __pyx_bstruct_start_idx;
+  Py_ssize_t __pyx_bstride_0_start_idx = 0;
+  Py_ssize_t __pyx_bshape_0_start_idx = 0;
+  PyObject *__pyx_r;
+  PyObject *__pyx_1 = 0;
+  PyObject *__pyx_2 = 0;
+  PyObject *__pyx_3 = 0;
+  PyObject *__pyx_4 = 0;
+  PyObject *__pyx_5 = 0;
+  PyArrayObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyArrayObject *__pyx_t_6 = NULL;
+  PyArrayObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  PyArrayObject *__pyx_t_9 = NULL;
+  PyArrayObject *__pyx_t_10 = NULL;
+  __pyx_v_split_dim = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_split = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_start_idx = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_end_idx = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_less = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_greater = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_bstruct_split_dim.buf = NULL;
+  __pyx_bstruct_split.buf = NULL;
+  __pyx_bstruct_start_idx.buf = NULL;
+  __pyx_bstruct_end_idx.buf = NULL;
+  __pyx_bstruct_less.buf = NULL;
+  __pyx_bstruct_greater.buf = NULL;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":492
+ *         cdef flatnodes f
+ *         cdef int n_nodes
+ *         n_nodes = self.__count_nodes(self.tree)             # <<<<<<<<<<<<<<
+ *         split_dim = np.empty(n_nodes,dtype=np.int32)
+ *         split = np.empty(n_nodes,dtype=np.float)
+ */
+  __pyx_v_n_nodes = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__count_nodes(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":493
+ *         cdef int n_nodes
+ *         n_nodes = self.__count_nodes(self.tree)
+ *         split_dim = np.empty(n_nodes,dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         split = np.empty(n_nodes,dtype=np.float)
+ *         start_idx = np.empty(n_nodes,dtype=np.int32)
+ */
+  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_1, __pyx_kp_empty); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_1 = PyInt_FromLong(__pyx_v_n_nodes); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_1);
+  __pyx_1 = 0;
+  __pyx_1 = PyDict_New(); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_4, __pyx_kp_29); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  if (PyDict_SetItem(__pyx_1, __pyx_kp_dtype, __pyx_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  __pyx_4 = PyEval_CallObjectWithKeywords(__pyx_2, ((PyObject *)__pyx_3), ((PyObject *)__pyx_1)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  if (!(__Pyx_TypeTest(__pyx_4, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyArrayObject *)__pyx_4);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_split_dim);
+  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_t_1, &__pyx_bstruct_split_dim, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
+      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_split_dim, &__pyx_bstruct_split_dim, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+      }
+  }
+  __pyx_bstride_0_split_dim = __pyx_bstruct_split_dim.strides[0];
+  __pyx_bshape_0_split_dim = __pyx_bstruct_split_dim.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_split_dim));
+  __pyx_v_split_dim = ((PyArrayObject *)__pyx_4);
+  __pyx_4 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":494
+ *         n_nodes = self.__count_nodes(self.tree)
+ *         split_dim = np.empty(n_nodes,dtype=np.int32)
+ *         split = np.empty(n_nodes,dtype=np.float)             # <<<<<<<<<<<<<<
+ *         start_idx = np.empty(n_nodes,dtype=np.int32)
+ *         end_idx = np.empty(n_nodes,dtype=np.int32)
+ */
+  __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_5, __pyx_kp_empty); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  __pyx_3 = PyInt_FromLong(__pyx_v_n_nodes); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_3);
+  __pyx_3 = 0;
+  __pyx_4 = PyDict_New(); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyObject_GetAttr(__pyx_5, __pyx_kp_float); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  if (PyDict_SetItem(__pyx_4, __pyx_kp_dtype, __pyx_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_5 = PyEval_CallObjectWithKeywords(__pyx_2, ((PyObject *)__pyx_1), ((PyObject *)__pyx_4)); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+  if (!(__Pyx_TypeTest(__pyx_5, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = ((PyArrayObject *)__pyx_5);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_split);
+  __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_6, &__pyx_bstruct_split, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_3);
+      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_split, &__pyx_bstruct_split, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_3);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_3);
+      }
+  }
+  __pyx_bstride_0_split = __pyx_bstruct_split.strides[0];
+  __pyx_bshape_0_split = __pyx_bstruct_split.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 494; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_split));
+  __pyx_v_split = ((PyArrayObject *)__pyx_5);
+  __pyx_5 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":495
+ *         split_dim = np.empty(n_nodes,dtype=np.int32)
+ *         split = np.empty(n_nodes,dtype=np.float)
+ *         start_idx = np.empty(n_nodes,dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         end_idx = np.empty(n_nodes,dtype=np.int32)
+ *         less = np.empty(n_nodes,dtype=np.int32)
+ */
+  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_3, __pyx_kp_empty); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_1 = PyInt_FromLong(__pyx_v_n_nodes); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyTuple_New(1); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_4, 0, __pyx_1);
+  __pyx_1 = 0;
+  __pyx_5 = PyDict_New(); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = PyObject_GetAttr(__pyx_3, __pyx_kp_29); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  if (PyDict_SetItem(__pyx_5, __pyx_kp_dtype, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_3 = PyEval_CallObjectWithKeywords(__pyx_2, ((PyObject *)__pyx_4), ((PyObject *)__pyx_5)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+  Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
+  if (!(__Pyx_TypeTest(__pyx_3, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = ((PyArrayObject *)__pyx_3);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_start_idx);
+  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_t_7, &__pyx_bstruct_start_idx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
+      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_start_idx, &__pyx_bstruct_start_idx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+      }
+  }
+  __pyx_bstride_0_start_idx = __pyx_bstruct_start_idx.strides[0];
+  __pyx_bshape_0_start_idx = __pyx_bstruct_start_idx.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_start_idx));
+  __pyx_v_start_idx = ((PyArrayObject *)__pyx_3);
+  __pyx_3 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":496
+ *         split = np.empty(n_nodes,dtype=np.float)
+ *         start_idx = np.empty(n_nodes,dtype=np.int32)
+ *         end_idx = np.empty(n_nodes,dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         less = np.empty(n_nodes,dtype=np.int32)
+ *         greater = np.empty(n_nodes,dtype=np.int32)
+ */
+  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_1, __pyx_kp_empty); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_4 = PyInt_FromLong(__pyx_v_n_nodes); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_5, 0, __pyx_4);
+  __pyx_4 = 0;
+  __pyx_3 = PyDict_New(); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyObject_GetAttr(__pyx_1, __pyx_kp_29); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_dtype, __pyx_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  __pyx_1 = PyEval_CallObjectWithKeywords(__pyx_2, ((PyObject *)__pyx_5), ((PyObject *)__pyx_3)); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  if (!(__Pyx_TypeTest(__pyx_1, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = ((PyArrayObject *)__pyx_1);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_end_idx);
+  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_t_8, &__pyx_bstruct_end_idx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_3);
+      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_end_idx, &__pyx_bstruct_end_idx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_3);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_3);
+      }
+  }
+  __pyx_bstride_0_end_idx = __pyx_bstruct_end_idx.strides[0];
+  __pyx_bshape_0_end_idx = __pyx_bstruct_end_idx.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_end_idx));
+  __pyx_v_end_idx = ((PyArrayObject *)__pyx_1);
+  __pyx_1 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":497
+ *         start_idx = np.empty(n_nodes,dtype=np.int32)
+ *         end_idx = np.empty(n_nodes,dtype=np.int32)
+ *         less = np.empty(n_nodes,dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         greater = np.empty(n_nodes,dtype=np.int32)
+ *         f.split_dim = <np.int32_t*>split_dim.data
+ */
+  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 497; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_4, __pyx_kp_empty); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 497; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  __pyx_5 = PyInt_FromLong(__pyx_v_n_nodes); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 497; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 497; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_5);
+  __pyx_5 = 0;
+  __pyx_1 = PyDict_New(); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 497; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 497; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_4, __pyx_kp_29); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 497; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  if (PyDict_SetItem(__pyx_1, __pyx_kp_dtype, __pyx_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 497; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  __pyx_4 = PyEval_CallObjectWithKeywords(__pyx_2, ((PyObject *)__pyx_3), ((PyObject *)__pyx_1)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 497; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  if (!(__Pyx_TypeTest(__pyx_4, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 497; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_9 = ((PyArrayObject *)__pyx_4);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_less);
+  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_t_9, &__pyx_bstruct_less, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
+      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_less, &__pyx_bstruct_less, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+      }
+  }
+  __pyx_bstride_0_less = __pyx_bstruct_less.strides[0];
+  __pyx_bshape_0_less = __pyx_bstruct_less.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 497; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_9 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_less));
+  __pyx_v_less = ((PyArrayObject *)__pyx_4);
+  __pyx_4 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":498
+ *         end_idx = np.empty(n_nodes,dtype=np.int32)
+ *         less = np.empty(n_nodes,dtype=np.int32)
+ *         greater = np.empty(n_nodes,dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         f.split_dim = <np.int32_t*>split_dim.data
+ *         f.split = <double*>split.data
+ */
+  __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_5, __pyx_kp_empty); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  __pyx_3 = PyInt_FromLong(__pyx_v_n_nodes); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_3);
+  __pyx_3 = 0;
+  __pyx_4 = PyDict_New(); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyObject_GetAttr(__pyx_5, __pyx_kp_29); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  if (PyDict_SetItem(__pyx_4, __pyx_kp_dtype, __pyx_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_5 = PyEval_CallObjectWithKeywords(__pyx_2, ((PyObject *)__pyx_1), ((PyObject *)__pyx_4)); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+  if (!(__Pyx_TypeTest(__pyx_5, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_10 = ((PyArrayObject *)__pyx_5);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_greater);
+  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_t_10, &__pyx_bstruct_greater, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_3);
+      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_greater, &__pyx_bstruct_greater, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_3);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_3);
+      }
+  }
+  __pyx_bstride_0_greater = __pyx_bstruct_greater.strides[0];
+  __pyx_bshape_0_greater = __pyx_bstruct_greater.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_10 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_greater));
+  __pyx_v_greater = ((PyArrayObject *)__pyx_5);
+  __pyx_5 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":499
+ *         less = np.empty(n_nodes,dtype=np.int32)
+ *         greater = np.empty(n_nodes,dtype=np.int32)
+ *         f.split_dim = <np.int32_t*>split_dim.data             # <<<<<<<<<<<<<<
+ *         f.split = <double*>split.data
+ *         f.start_idx = <np.int32_t*>start_idx.data
+ */
+  __pyx_v_f.split_dim = ((__pyx_t_5numpy_int32_t *)__pyx_v_split_dim->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":500
+ *         greater = np.empty(n_nodes,dtype=np.int32)
+ *         f.split_dim = <np.int32_t*>split_dim.data
+ *         f.split = <double*>split.data             # <<<<<<<<<<<<<<
+ *         f.start_idx = <np.int32_t*>start_idx.data
+ *         f.end_idx = <np.int32_t*>end_idx.data
+ */
+  __pyx_v_f.split = ((double *)__pyx_v_split->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":501
+ *         f.split_dim = <np.int32_t*>split_dim.data
+ *         f.split = <double*>split.data
+ *         f.start_idx = <np.int32_t*>start_idx.data             # <<<<<<<<<<<<<<
+ *         f.end_idx = <np.int32_t*>end_idx.data
+ *         f.less = <np.int32_t*>less.data
+ */
+  __pyx_v_f.start_idx = ((__pyx_t_5numpy_int32_t *)__pyx_v_start_idx->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":502
+ *         f.split = <double*>split.data
+ *         f.start_idx = <np.int32_t*>start_idx.data
+ *         f.end_idx = <np.int32_t*>end_idx.data             # <<<<<<<<<<<<<<
+ *         f.less = <np.int32_t*>less.data
+ *         f.greater = <np.int32_t*>greater.data
+ */
+  __pyx_v_f.end_idx = ((__pyx_t_5numpy_int32_t *)__pyx_v_end_idx->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":503
+ *         f.start_idx = <np.int32_t*>start_idx.data
+ *         f.end_idx = <np.int32_t*>end_idx.data
+ *         f.less = <np.int32_t*>less.data             # <<<<<<<<<<<<<<
+ *         f.greater = <np.int32_t*>greater.data
+ *         self.__flatten(self.tree, 0, &f)
+ */
+  __pyx_v_f.less = ((__pyx_t_5numpy_int32_t *)__pyx_v_less->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":504
+ *         f.end_idx = <np.int32_t*>end_idx.data
+ *         f.less = <np.int32_t*>less.data
+ *         f.greater = <np.int32_t*>greater.data             # <<<<<<<<<<<<<<
+ *         self.__flatten(self.tree, 0, &f)
+ *         return dict(data=self.data,
+ */
+  __pyx_v_f.greater = ((__pyx_t_5numpy_int32_t *)__pyx_v_greater->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":505
+ *         f.less = <np.int32_t*>less.data
+ *         f.greater = <np.int32_t*>greater.data
+ *         self.__flatten(self.tree, 0, &f)             # <<<<<<<<<<<<<<
+ *         return dict(data=self.data,
+ *                     leafsize=np.array(self.leafsize),
+ */
+  ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__flatten(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree, 0, (&__pyx_v_f));
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":506
+ *         f.greater = <np.int32_t*>greater.data
+ *         self.__flatten(self.tree, 0, &f)
+ *         return dict(data=self.data,             # <<<<<<<<<<<<<<
+ *                     leafsize=np.array(self.leafsize),
+ *                     maxes=self.maxes,
+ */
+  __pyx_3 = PyDict_New(); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_data, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":507
+ *         self.__flatten(self.tree, 0, &f)
+ *         return dict(data=self.data,
+ *                     leafsize=np.array(self.leafsize),             # <<<<<<<<<<<<<<
+ *                     maxes=self.maxes,
+ *                     mins=self.mins,
+ */
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 507; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = PyObject_GetAttr(__pyx_2, __pyx_kp_array); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 507; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_4 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->leafsize); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 507; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 507; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_5, 0, __pyx_4);
+  __pyx_4 = 0;
+  __pyx_2 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 507; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_leafsize, __pyx_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":508
+ *         return dict(data=self.data,
+ *                     leafsize=np.array(self.leafsize),
+ *                     maxes=self.maxes,             # <<<<<<<<<<<<<<
+ *                     mins=self.mins,
+ *                     indices=self.indices,
+ */
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_maxes, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":509
+ *                     leafsize=np.array(self.leafsize),
+ *                     maxes=self.maxes,
+ *                     mins=self.mins,             # <<<<<<<<<<<<<<
+ *                     indices=self.indices,
+ *                     split_dim=split_dim,
+ */
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_mins, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":510
+ *                     maxes=self.maxes,
+ *                     mins=self.mins,
+ *                     indices=self.indices,             # <<<<<<<<<<<<<<
+ *                     split_dim=split_dim,
+ *                     split=split,
+ */
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_indices, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":511
+ *                     mins=self.mins,
+ *                     indices=self.indices,
+ *                     split_dim=split_dim,             # <<<<<<<<<<<<<<
+ *                     split=split,
+ *                     start_idx=start_idx,
+ */
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_split_dim, ((PyObject *)__pyx_v_split_dim)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":512
+ *                     indices=self.indices,
+ *                     split_dim=split_dim,
+ *                     split=split,             # <<<<<<<<<<<<<<
+ *                     start_idx=start_idx,
+ *                     end_idx=end_idx,
+ */
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_split, ((PyObject *)__pyx_v_split)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":513
+ *                     split_dim=split_dim,
+ *                     split=split,
+ *                     start_idx=start_idx,             # <<<<<<<<<<<<<<
+ *                     end_idx=end_idx,
+ *                     less=less,
+ */
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_start_idx, ((PyObject *)__pyx_v_start_idx)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":514
+ *                     split=split,
+ *                     start_idx=start_idx,
+ *                     end_idx=end_idx,             # <<<<<<<<<<<<<<
+ *                     less=less,
+ *                     greater=greater)
+ */
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_end_idx, ((PyObject *)__pyx_v_end_idx)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":515
+ *                     start_idx=start_idx,
+ *                     end_idx=end_idx,
+ *                     less=less,             # <<<<<<<<<<<<<<
+ *                     greater=greater)
+ * 
+ */
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_less, ((PyObject *)__pyx_v_less)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":516
+ *                     end_idx=end_idx,
+ *                     less=less,
+ *                     greater=greater)             # <<<<<<<<<<<<<<
+ * 
+ *     def __setstate__(cKDTree self, state):
+ */
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_greater, ((PyObject *)__pyx_v_greater)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyEval_CallObjectWithKeywords(((PyObject *)((PyObject*)&PyDict_Type)), ((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_3)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  __pyx_r = __pyx_4;
+  __pyx_4 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_1);
+  Py_XDECREF(__pyx_2);
+  Py_XDECREF(__pyx_3);
+  Py_XDECREF(__pyx_4);
+  Py_XDECREF(__pyx_5);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_greater);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_less);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_split_dim);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_split);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_end_idx);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_start_idx);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__getstate__");
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_greater);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_less);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_split_dim);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_split);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_end_idx);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_start_idx);
+  __pyx_L2:;
+  Py_DECREF(__pyx_v_split_dim);
+  Py_DECREF(__pyx_v_split);
+  Py_DECREF(__pyx_v_start_idx);
+  Py_DECREF(__pyx_v_end_idx);
+  Py_DECREF(__pyx_v_less);
+  Py_DECREF(__pyx_v_greater);
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":518
+ *                     greater=greater)
+ * 
+ *     def __setstate__(cKDTree self, state):             # <<<<<<<<<<<<<<
+ *         cdef np.ndarray[double, ndim=2] inner_data
+ *         cdef np.ndarray[double, ndim=1] inner_maxes
+ */
+
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___setstate__(PyObject *__pyx_v_self, PyObject *__pyx_v_state); /*proto*/
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___setstate__(PyObject *__pyx_v_self, PyObject *__pyx_v_state) {
+  PyArrayObject *__pyx_v_inner_data;
+  PyArrayObject *__pyx_v_inner_maxes;
+  PyArrayObject *__pyx_v_inner_mins;
+  PyArrayObject *__pyx_v_inner_indices;
+  PyArrayObject *__pyx_v_split_dim;
+  PyArrayObject *__pyx_v_split;
+  PyArrayObject *__pyx_v_start_idx;
+  PyArrayObject *__pyx_v_end_idx;
+  PyArrayObject *__pyx_v_less;
+  PyArrayObject *__pyx_v_greater;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_flatnodes __pyx_v_f;
+  Py_buffer __pyx_bstruct_inner_maxes;
+  Py_ssize_t __pyx_bstride_0_inner_maxes = 0;
+  Py_ssize_t __pyx_bshape_0_inner_maxes = 0;
+  Py_buffer __pyx_bstruct_inner_data;
+  Py_ssize_t __pyx_bstride_0_inner_data = 0;
+  Py_ssize_t __pyx_bstride_1_inner_data = 0;
+  Py_ssize_t __pyx_bshape_0_inner_data = 0;
+  Py_ssize_t __pyx_bshape_1_inner_data = 0;
+  Py_buffer __pyx_bstruct_inner_mins;
+  Py_ssize_t __pyx_bstride_0_inner_mins = 0;
+  Py_ssize_t __pyx_bshape_0_inner_mins = 0;
+  Py_buffer __pyx_bstruct_less;
+  Py_ssize_t __pyx_bstride_0_less = 0;
+  Py_ssize_t __pyx_bshape_0_less = 0;
+  Py_buffer __pyx_bstruct_split_dim;
+  Py_ssize_t __pyx_bstride_0_split_dim = 0;
+  Py_ssize_t __pyx_bshape_0_split_dim = 0;
+  Py_buffer __pyx_bstruct_inner_indices;
+  Py_ssize_t __pyx_bstride_0_inner_indices = 0;
+  Py_ssize_t __pyx_bshape_0_inner_indices = 0;
+  Py_buffer __pyx_bstruct_split;
+  Py_ssize_t __pyx_bstride_0_split = 0;
+  Py_ssize_t __pyx_bshape_0_split = 0;
+  Py_buffer __pyx_bstruct_end_idx;
+  Py_ssize_t __pyx_bstride_0_end_idx = 0;
+  Py_ssize_t __pyx_bshape_0_end_idx = 0;
+  Py_buffer __pyx_bstruct_start_idx;
+  Py_ssize_t __pyx_bstride_0_start_idx = 0;
+  Py_ssize_t __pyx_bshape_0_start_idx = 0;
+  Py_buffer __pyx_bstruct_greater;
+  Py_ssize_t __pyx_bstride_0_greater = 0;
+  Py_ssize_t __pyx_bshape_0_greater = 0;
+  PyObject *__pyx_r;
+  int __pyx_1;
+  PyObject *__pyx_2 = 0;
+  PyObject *__pyx_3 = 0;
+  PyObject *__pyx_4 = 0;
+  PyObject *__pyx_5 = 0;
+  PyObject *__pyx_6 = 0;
+  int __pyx_7;
+  PyArrayObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyArrayObject *__pyx_t_6 = NULL;
+  PyArrayObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  PyArrayObject *__pyx_t_9 = NULL;
+  PyArrayObject *__pyx_t_10 = NULL;
+  PyArrayObject *__pyx_t_11 = NULL;
+  PyArrayObject *__pyx_t_12 = NULL;
+  PyArrayObject *__pyx_t_13 = NULL;
+  PyArrayObject *__pyx_t_14 = NULL;
+  __pyx_v_inner_data = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_inner_maxes = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_inner_mins = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_inner_indices = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_split_dim = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_split = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_start_idx = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_end_idx = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_less = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_greater = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_bstruct_inner_data.buf = NULL;
+  __pyx_bstruct_inner_maxes.buf = NULL;
+  __pyx_bstruct_inner_mins.buf = NULL;
+  __pyx_bstruct_inner_indices.buf = NULL;
+  __pyx_bstruct_split_dim.buf = NULL;
+  __pyx_bstruct_split.buf = NULL;
+  __pyx_bstruct_start_idx.buf = NULL;
+  __pyx_bstruct_end_idx.buf = NULL;
+  __pyx_bstruct_less.buf = NULL;
+  __pyx_bstruct_greater.buf = NULL;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":530
+ *         cdef np.ndarray[np.int32_t, ndim=1] greater
+ *         cdef flatnodes f
+ *         if <int>(self.tree) != 0:             # <<<<<<<<<<<<<<
+ *             self.__free_tree(self.tree)
+ *             self.tree = NULL
+ */
+  __pyx_1 = (((int)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree) != 0);
+  if (__pyx_1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":531
+ *         cdef flatnodes f
+ *         if <int>(self.tree) != 0:
+ *             self.__free_tree(self.tree)             # <<<<<<<<<<<<<<
+ *             self.tree = NULL
+ * 
+ */
+    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__free_tree(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":532
+ *         if <int>(self.tree) != 0:
+ *             self.__free_tree(self.tree)
+ *             self.tree = NULL             # <<<<<<<<<<<<<<
+ * 
+ *         # the arrays are used in place, so memory-mapped arrays stay
+ */
+    ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree = NULL;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":536
+ *         # the arrays are used in place, so memory-mapped arrays stay
+ *         # shared rather than being copied
+ *         self.data = np.ascontiguousarray(state['data'],dtype=np.float)             # <<<<<<<<<<<<<<
+ *         self.n, self.m = np.shape(self.data)
+ *         self.leafsize = int(state['leafsize'])
+ */
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyObject_GetAttr(__pyx_2, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_2 = PyObject_GetItem(__pyx_v_state, __pyx_kp_30); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyTuple_New(1); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_4, 0, __pyx_2);
+  __pyx_2 = 0;
+  __pyx_2 = PyDict_New(); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_6 = PyObject_GetAttr(__pyx_5, __pyx_kp_float); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  if (PyDict_SetItem(__pyx_2, __pyx_kp_dtype, __pyx_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_6); __pyx_6 = 0;
+  __pyx_5 = PyEval_CallObjectWithKeywords(__pyx_3, ((PyObject *)__pyx_4), ((PyObject *)__pyx_2)); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+  Py_DECREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data = __pyx_5;
+  __pyx_5 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":537
+ *         # shared rather than being copied
+ *         self.data = np.ascontiguousarray(state['data'],dtype=np.float)
+ *         self.n, self.m = np.shape(self.data)             # <<<<<<<<<<<<<<
+ *         self.leafsize = int(state['leafsize'])
+ *         self.maxes = np.ascontiguousarray(state['maxes'],dtype=np.float)
+ */
+  __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyObject_GetAttr(__pyx_6, __pyx_kp_shape); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_6); __pyx_6 = 0;
+  __pyx_4 = PyTuple_New(1); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  PyTuple_SET_ITEM(__pyx_4, 0, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  __pyx_2 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_4), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+  if (PyTuple_CheckExact(__pyx_2) && PyTuple_GET_SIZE(__pyx_2) == 2) {
+    PyObject* tuple = __pyx_2;
+    __pyx_6 = PyTuple_GET_ITEM(tuple, 0);
+    Py_INCREF(__pyx_6);
+    __pyx_7 = __pyx_PyInt_int(__pyx_6); if (unlikely((__pyx_7 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_6); __pyx_6 = 0;
+    ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n = __pyx_7;
+    __pyx_3 = PyTuple_GET_ITEM(tuple, 1);
+    Py_INCREF(__pyx_3);
+    __pyx_7 = __pyx_PyInt_int(__pyx_3); if (unlikely((__pyx_7 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m = __pyx_7;
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+  }
+  else {
+    __pyx_5 = PyObject_GetIter(__pyx_2); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    __pyx_6 = __Pyx_UnpackItem(__pyx_5, 0); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_7 = __pyx_PyInt_int(__pyx_6); if (unlikely((__pyx_7 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_6); __pyx_6 = 0;
+    ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n = __pyx_7;
+    __pyx_3 = __Pyx_UnpackItem(__pyx_5, 1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_7 = __pyx_PyInt_int(__pyx_3); if (unlikely((__pyx_7 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m = __pyx_7;
+    if (__Pyx_EndUnpack(__pyx_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_5); __pyx_5 = 0;
+  }
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":538
+ *         self.data = np.ascontiguousarray(state['data'],dtype=np.float)
+ *         self.n, self.m = np.shape(self.data)
+ *         self.leafsize = int(state['leafsize'])             # <<<<<<<<<<<<<<
+ *         self.maxes = np.ascontiguousarray(state['maxes'],dtype=np.float)
+ *         self.mins = np.ascontiguousarray(state['mins'],dtype=np.float)
+ */
+  __pyx_4 = PyObject_GetItem(__pyx_v_state, __pyx_kp_31); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 538; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_6 = PyTuple_New(1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 538; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_6, 0, __pyx_4);
+  __pyx_4 = 0;
+  __pyx_3 = PyObject_Call(((PyObject *)((PyObject*)&PyInt_Type)), ((PyObject *)__pyx_6), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 538; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
+  __pyx_7 = __pyx_PyInt_int(__pyx_3); if (unlikely((__pyx_7 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 538; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->leafsize = __pyx_7;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":539
+ *         self.n, self.m = np.shape(self.data)
+ *         self.leafsize = int(state['leafsize'])
+ *         self.maxes = np.ascontiguousarray(state['maxes'],dtype=np.float)             # <<<<<<<<<<<<<<
+ *         self.mins = np.ascontiguousarray(state['mins'],dtype=np.float)
+ *         self.indices = np.ascontiguousarray(state['indices'],dtype=np.int32)
+ */
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 539; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_2, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 539; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_4 = PyObject_GetItem(__pyx_v_state, __pyx_kp_32); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 539; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_6 = PyTuple_New(1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 539; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_6, 0, __pyx_4);
+  __pyx_4 = 0;
+  __pyx_3 = PyDict_New(); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 539; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 539; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyObject_GetAttr(__pyx_2, __pyx_kp_float); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 539; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_dtype, __pyx_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 539; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  __pyx_2 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_6), ((PyObject *)__pyx_3)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 539; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  Py_DECREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes);
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes = __pyx_2;
+  __pyx_2 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":540
+ *         self.leafsize = int(state['leafsize'])
+ *         self.maxes = np.ascontiguousarray(state['maxes'],dtype=np.float)
+ *         self.mins = np.ascontiguousarray(state['mins'],dtype=np.float)             # <<<<<<<<<<<<<<
+ *         self.indices = np.ascontiguousarray(state['indices'],dtype=np.int32)
+ * 
+ */
+  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_4, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  __pyx_6 = PyObject_GetItem(__pyx_v_state, __pyx_kp_33); if (!__pyx_6) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_6);
+  __pyx_6 = 0;
+  __pyx_2 = PyDict_New(); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_6 = PyObject_GetAttr(__pyx_4, __pyx_kp_float); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  if (PyDict_SetItem(__pyx_2, __pyx_kp_dtype, __pyx_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_6); __pyx_6 = 0;
+  __pyx_4 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_3), ((PyObject *)__pyx_2)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+  Py_DECREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins);
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins = __pyx_4;
+  __pyx_4 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":541
+ *         self.maxes = np.ascontiguousarray(state['maxes'],dtype=np.float)
+ *         self.mins = np.ascontiguousarray(state['mins'],dtype=np.float)
+ *         self.indices = np.ascontiguousarray(state['indices'],dtype=np.int32)             # <<<<<<<<<<<<<<
+ * 
+ *         inner_data = self.data
+ */
+  __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_6, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_6); __pyx_6 = 0;
+  __pyx_3 = PyObject_GetItem(__pyx_v_state, __pyx_kp_34); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_2, 0, __pyx_3);
+  __pyx_3 = 0;
+  __pyx_4 = PyDict_New(); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyObject_GetAttr(__pyx_6, __pyx_kp_29); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_6); __pyx_6 = 0;
+  if (PyDict_SetItem(__pyx_4, __pyx_kp_dtype, __pyx_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_6 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_2), ((PyObject *)__pyx_4)); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 541; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+  Py_DECREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices);
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices = __pyx_6;
+  __pyx_6 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":543
+ *         self.indices = np.ascontiguousarray(state['indices'],dtype=np.int32)
+ * 
+ *         inner_data = self.data             # <<<<<<<<<<<<<<
+ *         self.raw_data = <double*>inner_data.data
+ *         inner_maxes = self.maxes
+ */
+  if (!(__Pyx_TypeTest(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 543; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_data);
+  __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_1, &__pyx_bstruct_inner_data, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
+      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_inner_data, &__pyx_bstruct_inner_data, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
+          Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+      }
+  }
+  __pyx_bstride_0_inner_data = __pyx_bstruct_inner_data.strides[0]; __pyx_bstride_1_inner_data = __pyx_bstruct_inner_data.strides[1];
+  __pyx_bshape_0_inner_data = __pyx_bstruct_inner_data.shape[0]; __pyx_bshape_1_inner_data = __pyx_bstruct_inner_data.shape[1];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 543; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = 0;
+  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+  Py_DECREF(((PyObject *)__pyx_v_inner_data));
+  __pyx_v_inner_data = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":544
+ * 
+ *         inner_data = self.data
+ *         self.raw_data = <double*>inner_data.data             # <<<<<<<<<<<<<<
+ *         inner_maxes = self.maxes
+ *         self.raw_maxes = <double*>inner_maxes.data
+ */
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_data = ((double *)__pyx_v_inner_data->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":545
+ *         inner_data = self.data
+ *         self.raw_data = <double*>inner_data.data
+ *         inner_maxes = self.maxes             # <<<<<<<<<<<<<<
+ *         self.raw_maxes = <double*>inner_maxes.data
+ *         inner_mins = self.mins
+ */
+  if (!(__Pyx_TypeTest(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 545; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_maxes);
+  __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_6, &__pyx_bstruct_inner_maxes, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_3);
+      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_inner_maxes, &__pyx_bstruct_inner_maxes, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_3);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_3);
+      }
+  }
+  __pyx_bstride_0_inner_maxes = __pyx_bstruct_inner_maxes.strides[0];
+  __pyx_bshape_0_inner_maxes = __pyx_bstruct_inner_maxes.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 545; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = 0;
+  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes);
+  Py_DECREF(((PyObject *)__pyx_v_inner_maxes));
+  __pyx_v_inner_maxes = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->maxes);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":546
+ *         self.raw_data = <double*>inner_data.data
+ *         inner_maxes = self.maxes
+ *         self.raw_maxes = <double*>inner_maxes.data             # <<<<<<<<<<<<<<
+ *         inner_mins = self.mins
+ *         self.raw_mins = <double*>inner_mins.data
+ */
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_maxes = ((double *)__pyx_v_inner_maxes->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":547
+ *         inner_maxes = self.maxes
+ *         self.raw_maxes = <double*>inner_maxes.data
+ *         inner_mins = self.mins             # <<<<<<<<<<<<<<
+ *         self.raw_mins = <double*>inner_mins.data
+ *         inner_indices = self.indices
+ */
+  if (!(__Pyx_TypeTest(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 547; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_mins);
+  __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_7, &__pyx_bstruct_inner_mins, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
+      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_inner_mins, &__pyx_bstruct_inner_mins, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+      }
+  }
+  __pyx_bstride_0_inner_mins = __pyx_bstruct_inner_mins.strides[0];
+  __pyx_bshape_0_inner_mins = __pyx_bstruct_inner_mins.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 547; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = 0;
+  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins);
+  Py_DECREF(((PyObject *)__pyx_v_inner_mins));
+  __pyx_v_inner_mins = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->mins);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":548
+ *         self.raw_maxes = <double*>inner_maxes.data
+ *         inner_mins = self.mins
+ *         self.raw_mins = <double*>inner_mins.data             # <<<<<<<<<<<<<<
+ *         inner_indices = self.indices
+ *         self.raw_indices = <np.int32_t*>inner_indices.data
+ */
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_mins = ((double *)__pyx_v_inner_mins->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":549
+ *         inner_mins = self.mins
+ *         self.raw_mins = <double*>inner_mins.data
+ *         inner_indices = self.indices             # <<<<<<<<<<<<<<
+ *         self.raw_indices = <np.int32_t*>inner_indices.data
+ * 
+ */
+  if (!(__Pyx_TypeTest(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_indices);
+  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_t_8, &__pyx_bstruct_inner_indices, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_3);
+      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_inner_indices, &__pyx_bstruct_inner_indices, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_3);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_3);
+      }
+  }
+  __pyx_bstride_0_inner_indices = __pyx_bstruct_inner_indices.strides[0];
+  __pyx_bshape_0_inner_indices = __pyx_bstruct_inner_indices.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = 0;
+  Py_INCREF(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices);
+  Py_DECREF(((PyObject *)__pyx_v_inner_indices));
+  __pyx_v_inner_indices = ((PyArrayObject *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->indices);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":550
+ *         self.raw_mins = <double*>inner_mins.data
+ *         inner_indices = self.indices
+ *         self.raw_indices = <np.int32_t*>inner_indices.data             # <<<<<<<<<<<<<<
+ * 
+ *         split_dim = np.ascontiguousarray(state['split_dim'],dtype=np.int32)
+ */
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_indices = ((__pyx_t_5numpy_int32_t *)__pyx_v_inner_indices->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":552
+ *         self.raw_indices = <np.int32_t*>inner_indices.data
+ * 
+ *         split_dim = np.ascontiguousarray(state['split_dim'],dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         split = np.ascontiguousarray(state['split'],dtype=np.float)
+ *         start_idx = np.ascontiguousarray(state['start_idx'],dtype=np.int32)
+ */
+  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_3, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_2 = PyObject_GetItem(__pyx_v_state, __pyx_kp_35); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyTuple_New(1); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_4, 0, __pyx_2);
+  __pyx_2 = 0;
+  __pyx_6 = PyDict_New(); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_3, __pyx_kp_29); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  if (PyDict_SetItem(__pyx_6, __pyx_kp_dtype, __pyx_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_3 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_4), ((PyObject *)__pyx_6)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+  Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
+  if (!(__Pyx_TypeTest(__pyx_3, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_9 = ((PyArrayObject *)__pyx_3);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_split_dim);
+  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_t_9, &__pyx_bstruct_split_dim, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
+      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_split_dim, &__pyx_bstruct_split_dim, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+      }
+  }
+  __pyx_bstride_0_split_dim = __pyx_bstruct_split_dim.strides[0];
+  __pyx_bshape_0_split_dim = __pyx_bstruct_split_dim.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_9 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_split_dim));
+  __pyx_v_split_dim = ((PyArrayObject *)__pyx_3);
+  __pyx_3 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":553
+ * 
+ *         split_dim = np.ascontiguousarray(state['split_dim'],dtype=np.int32)
+ *         split = np.ascontiguousarray(state['split'],dtype=np.float)             # <<<<<<<<<<<<<<
+ *         start_idx = np.ascontiguousarray(state['start_idx'],dtype=np.int32)
+ *         end_idx = np.ascontiguousarray(state['end_idx'],dtype=np.int32)
+ */
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_2, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_4 = PyObject_GetItem(__pyx_v_state, __pyx_kp_36); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_6 = PyTuple_New(1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_6, 0, __pyx_4);
+  __pyx_4 = 0;
+  __pyx_3 = PyDict_New(); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyObject_GetAttr(__pyx_2, __pyx_kp_float); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_dtype, __pyx_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  __pyx_2 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_6), ((PyObject *)__pyx_3)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  if (!(__Pyx_TypeTest(__pyx_2, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_10 = ((PyArrayObject *)__pyx_2);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_split);
+  __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_10, &__pyx_bstruct_split, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_3);
+      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_split, &__pyx_bstruct_split, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_3);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_3);
+      }
+  }
+  __pyx_bstride_0_split = __pyx_bstruct_split.strides[0];
+  __pyx_bshape_0_split = __pyx_bstruct_split.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_10 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_split));
+  __pyx_v_split = ((PyArrayObject *)__pyx_2);
+  __pyx_2 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":554
+ *         split_dim = np.ascontiguousarray(state['split_dim'],dtype=np.int32)
+ *         split = np.ascontiguousarray(state['split'],dtype=np.float)
+ *         start_idx = np.ascontiguousarray(state['start_idx'],dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         end_idx = np.ascontiguousarray(state['end_idx'],dtype=np.int32)
+ *         less = np.ascontiguousarray(state['less'],dtype=np.int32)
+ */
+  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_4, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  __pyx_6 = PyObject_GetItem(__pyx_v_state, __pyx_kp_37); if (!__pyx_6) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_6);
+  __pyx_6 = 0;
+  __pyx_2 = PyDict_New(); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_6 = PyObject_GetAttr(__pyx_4, __pyx_kp_29); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  if (PyDict_SetItem(__pyx_2, __pyx_kp_dtype, __pyx_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_6); __pyx_6 = 0;
+  __pyx_4 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_3), ((PyObject *)__pyx_2)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+  if (!(__Pyx_TypeTest(__pyx_4, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_11 = ((PyArrayObject *)__pyx_4);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_start_idx);
+  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_t_11, &__pyx_bstruct_start_idx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
+      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_start_idx, &__pyx_bstruct_start_idx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+      }
+  }
+  __pyx_bstride_0_start_idx = __pyx_bstruct_start_idx.strides[0];
+  __pyx_bshape_0_start_idx = __pyx_bstruct_start_idx.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 554; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_11 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_start_idx));
+  __pyx_v_start_idx = ((PyArrayObject *)__pyx_4);
+  __pyx_4 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":555
+ *         split = np.ascontiguousarray(state['split'],dtype=np.float)
+ *         start_idx = np.ascontiguousarray(state['start_idx'],dtype=np.int32)
+ *         end_idx = np.ascontiguousarray(state['end_idx'],dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         less = np.ascontiguousarray(state['less'],dtype=np.int32)
+ *         greater = np.ascontiguousarray(state['greater'],dtype=np.int32)
+ */
+  __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_6, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_6); __pyx_6 = 0;
+  __pyx_3 = PyObject_GetItem(__pyx_v_state, __pyx_kp_38); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_2, 0, __pyx_3);
+  __pyx_3 = 0;
+  __pyx_4 = PyDict_New(); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyObject_GetAttr(__pyx_6, __pyx_kp_29); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_6); __pyx_6 = 0;
+  if (PyDict_SetItem(__pyx_4, __pyx_kp_dtype, __pyx_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_6 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_2), ((PyObject *)__pyx_4)); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+  if (!(__Pyx_TypeTest(__pyx_6, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_12 = ((PyArrayObject *)__pyx_6);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_end_idx);
+  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_t_12, &__pyx_bstruct_end_idx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_3);
+      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_end_idx, &__pyx_bstruct_end_idx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_3);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_3);
+      }
+  }
+  __pyx_bstride_0_end_idx = __pyx_bstruct_end_idx.strides[0];
+  __pyx_bshape_0_end_idx = __pyx_bstruct_end_idx.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_12 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_end_idx));
+  __pyx_v_end_idx = ((PyArrayObject *)__pyx_6);
+  __pyx_6 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":556
+ *         start_idx = np.ascontiguousarray(state['start_idx'],dtype=np.int32)
+ *         end_idx = np.ascontiguousarray(state['end_idx'],dtype=np.int32)
+ *         less = np.ascontiguousarray(state['less'],dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         greater = np.ascontiguousarray(state['greater'],dtype=np.int32)
+ *         f.split_dim = <np.int32_t*>split_dim.data
+ */
+  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_3, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_2 = PyObject_GetItem(__pyx_v_state, __pyx_kp_39); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyTuple_New(1); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_4, 0, __pyx_2);
+  __pyx_2 = 0;
+  __pyx_6 = PyDict_New(); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_3, __pyx_kp_29); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  if (PyDict_SetItem(__pyx_6, __pyx_kp_dtype, __pyx_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_3 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_4), ((PyObject *)__pyx_6)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+  Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
+  if (!(__Pyx_TypeTest(__pyx_3, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_13 = ((PyArrayObject *)__pyx_3);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_less);
+  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_t_13, &__pyx_bstruct_less, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
+      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_less, &__pyx_bstruct_less, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+      }
+  }
+  __pyx_bstride_0_less = __pyx_bstruct_less.strides[0];
+  __pyx_bshape_0_less = __pyx_bstruct_less.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_13 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_less));
+  __pyx_v_less = ((PyArrayObject *)__pyx_3);
+  __pyx_3 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":557
+ *         end_idx = np.ascontiguousarray(state['end_idx'],dtype=np.int32)
+ *         less = np.ascontiguousarray(state['less'],dtype=np.int32)
+ *         greater = np.ascontiguousarray(state['greater'],dtype=np.int32)             # <<<<<<<<<<<<<<
+ *         f.split_dim = <np.int32_t*>split_dim.data
+ *         f.split = <double*>split.data
+ */
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_2, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_4 = PyObject_GetItem(__pyx_v_state, __pyx_kp_40); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_6 = PyTuple_New(1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_6, 0, __pyx_4);
+  __pyx_4 = 0;
+  __pyx_3 = PyDict_New(); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyObject_GetAttr(__pyx_2, __pyx_kp_29); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  if (PyDict_SetItem(__pyx_3, __pyx_kp_dtype, __pyx_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  __pyx_2 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_6), ((PyObject *)__pyx_3)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  if (!(__Pyx_TypeTest(__pyx_2, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_14 = ((PyArrayObject *)__pyx_2);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_greater);
+  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_t_14, &__pyx_bstruct_greater, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_3);
+      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_greater, &__pyx_bstruct_greater, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_3);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_3);
+      }
+  }
+  __pyx_bstride_0_greater = __pyx_bstruct_greater.strides[0];
+  __pyx_bshape_0_greater = __pyx_bstruct_greater.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_14 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_greater));
+  __pyx_v_greater = ((PyArrayObject *)__pyx_2);
+  __pyx_2 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":558
+ *         less = np.ascontiguousarray(state['less'],dtype=np.int32)
+ *         greater = np.ascontiguousarray(state['greater'],dtype=np.int32)
+ *         f.split_dim = <np.int32_t*>split_dim.data             # <<<<<<<<<<<<<<
+ *         f.split = <double*>split.data
+ *         f.start_idx = <np.int32_t*>start_idx.data
+ */
+  __pyx_v_f.split_dim = ((__pyx_t_5numpy_int32_t *)__pyx_v_split_dim->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":559
+ *         greater = np.ascontiguousarray(state['greater'],dtype=np.int32)
+ *         f.split_dim = <np.int32_t*>split_dim.data
+ *         f.split = <double*>split.data             # <<<<<<<<<<<<<<
+ *         f.start_idx = <np.int32_t*>start_idx.data
+ *         f.end_idx = <np.int32_t*>end_idx.data
+ */
+  __pyx_v_f.split = ((double *)__pyx_v_split->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":560
+ *         f.split_dim = <np.int32_t*>split_dim.data
+ *         f.split = <double*>split.data
+ *         f.start_idx = <np.int32_t*>start_idx.data             # <<<<<<<<<<<<<<
+ *         f.end_idx = <np.int32_t*>end_idx.data
+ *         f.less = <np.int32_t*>less.data
+ */
+  __pyx_v_f.start_idx = ((__pyx_t_5numpy_int32_t *)__pyx_v_start_idx->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":561
+ *         f.split = <double*>split.data
+ *         f.start_idx = <np.int32_t*>start_idx.data
+ *         f.end_idx = <np.int32_t*>end_idx.data             # <<<<<<<<<<<<<<
+ *         f.less = <np.int32_t*>less.data
+ *         f.greater = <np.int32_t*>greater.data
+ */
+  __pyx_v_f.end_idx = ((__pyx_t_5numpy_int32_t *)__pyx_v_end_idx->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":562
+ *         f.start_idx = <np.int32_t*>start_idx.data
+ *         f.end_idx = <np.int32_t*>end_idx.data
+ *         f.less = <np.int32_t*>less.data             # <<<<<<<<<<<<<<
+ *         f.greater = <np.int32_t*>greater.data
+ *         self.tree = self.__unflatten(0, &f)
+ */
+  __pyx_v_f.less = ((__pyx_t_5numpy_int32_t *)__pyx_v_less->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":563
+ *         f.end_idx = <np.int32_t*>end_idx.data
+ *         f.less = <np.int32_t*>less.data
+ *         f.greater = <np.int32_t*>greater.data             # <<<<<<<<<<<<<<
+ *         self.tree = self.__unflatten(0, &f)
+ * 
+ */
+  __pyx_v_f.greater = ((__pyx_t_5numpy_int32_t *)__pyx_v_greater->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":564
+ *         f.less = <np.int32_t*>less.data
+ *         f.greater = <np.int32_t*>greater.data
+ *         self.tree = self.__unflatten(0, &f)             # <<<<<<<<<<<<<<
+ * 
+ *     def __reduce__(cKDTree self):
+ */
+  ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__unflatten(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), 0, (&__pyx_v_f));
+
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_2);
+  Py_XDECREF(__pyx_3);
+  Py_XDECREF(__pyx_4);
+  Py_XDECREF(__pyx_5);
+  Py_XDECREF(__pyx_6);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_maxes);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_data);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_mins);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_less);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_split_dim);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_indices);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_split);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_end_idx);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_start_idx);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_greater);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__setstate__");
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_maxes);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_data);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_mins);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_less);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_split_dim);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_inner_indices);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_split);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_end_idx);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_start_idx);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_greater);
+  __pyx_L2:;
+  Py_DECREF(__pyx_v_inner_data);
+  Py_DECREF(__pyx_v_inner_maxes);
+  Py_DECREF(__pyx_v_inner_mins);
+  Py_DECREF(__pyx_v_inner_indices);
+  Py_DECREF(__pyx_v_split_dim);
+  Py_DECREF(__pyx_v_split);
+  Py_DECREF(__pyx_v_start_idx);
+  Py_DECREF(__pyx_v_end_idx);
+  Py_DECREF(__pyx_v_less);
+  Py_DECREF(__pyx_v_greater);
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":566
+ *         self.tree = self.__unflatten(0, &f)
+ * 
+ *     def __reduce__(cKDTree self):             # <<<<<<<<<<<<<<
+ *         return (copy_reg.__newobj__, (cKDTree,), self.__getstate__())
+ * 
+ */
+
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___reduce__(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___reduce__(PyObject *__pyx_v_self, PyObject *unused) {
+  PyObject *__pyx_r;
+  PyObject *__pyx_1 = 0;
+  PyObject *__pyx_2 = 0;
+  PyObject *__pyx_3 = 0;
+  PyObject *__pyx_4 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":567
+ * 
+ *     def __reduce__(cKDTree self):
+ *         return (copy_reg.__newobj__, (cKDTree,), self.__getstate__())             # <<<<<<<<<<<<<<
+ * 
+ *     def save(cKDTree self, dirname):
+ */
+  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_copy_reg); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 567; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_1, __pyx_kp___newobj__); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 567; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 567; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(((PyObject *)((PyObject*)__pyx_ptype_5scipy_7spatial_7ckdtree_cKDTree)));
+  PyTuple_SET_ITEM(__pyx_1, 0, ((PyObject *)((PyObject*)__pyx_ptype_5scipy_7spatial_7ckdtree_cKDTree)));
+  __pyx_3 = PyObject_GetAttr(__pyx_v_self, __pyx_kp___getstate__); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 567; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 567; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_3 = PyTuple_New(3); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 567; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_2);
+  PyTuple_SET_ITEM(__pyx_3, 1, ((PyObject *)__pyx_1));
+  PyTuple_SET_ITEM(__pyx_3, 2, __pyx_4);
+  __pyx_2 = 0;
+  __pyx_1 = 0;
+  __pyx_4 = 0;
+  __pyx_r = ((PyObject *)__pyx_3);
+  __pyx_3 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_1);
+  Py_XDECREF(__pyx_2);
+  Py_XDECREF(__pyx_3);
+  Py_XDECREF(__pyx_4);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__reduce__");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":569
+ *         return (copy_reg.__newobj__, (cKDTree,), self.__getstate__())
+ * 
+ *     def save(cKDTree self, dirname):             # <<<<<<<<<<<<<<
+ *         """Save the tree to a directory of .npy files.
+ * 
+ */
+
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_save(PyObject *__pyx_v_self, PyObject *__pyx_v_dirname); /*proto*/
+static char __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_save[] = "Save the tree to a directory of .npy files.\n\n        The tree is written as flat arrays (the data, the permutation of\n        the points into leaf order, and per-node split dimensions, split\n        values, index ranges and children) so that load_tree can map\n        them into memory without rebuilding the tree.\n\n        Parameters\n        ==========\n\n        dirname : string\n            The directory to write to; it is created if necessary.\n        ";
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_save(PyObject *__pyx_v_self, PyObject *__pyx_v_dirname) {
+  PyObject *__pyx_r;
+  PyObject *__pyx_1 = 0;
+  PyObject *__pyx_2 = 0;
+  PyObject *__pyx_3 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":583
+ *             The directory to write to; it is created if necessary.
+ *         """
+ *         kdtree._save_tree(dirname, self)             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(cKDTree self):
+ */
+  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_kdtree); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_1, __pyx_kp__save_tree); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_1 = PyTuple_New(2); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_v_dirname);
+  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_v_dirname);
+  Py_INCREF(__pyx_v_self);
+  PyTuple_SET_ITEM(__pyx_1, 1, __pyx_v_self);
+  __pyx_3 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_1);
+  Py_XDECREF(__pyx_2);
+  Py_XDECREF(__pyx_3);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.save");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":585
+ *         kdtree._save_tree(dirname, self)
+ * 
+ *     def __dealloc__(cKDTree self):             # <<<<<<<<<<<<<<
+ *         if <int>(self.tree) == 0:
+ *             # should happen only if __init__ was never called
+ */
+
+static void __pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___dealloc__(PyObject *__pyx_v_self) {
+  int __pyx_1;
+  PyObject *__pyx_2 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":586
+ * 
+ *     def __dealloc__(cKDTree self):
+ *         if <int>(self.tree) == 0:             # <<<<<<<<<<<<<<
+ *             # should happen only if __init__ was never called
+ *             return
+ */
+  __pyx_1 = (((int)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree) == 0);
+  if (__pyx_1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":588
+ *         if <int>(self.tree) == 0:
+ *             # should happen only if __init__ was never called
+ *             return             # <<<<<<<<<<<<<<
+ *         self.__free_tree(self.tree)
+ * 
+ */
+    goto __pyx_L0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":589
+ *             # should happen only if __init__ was never called
+ *             return
+ *         self.__free_tree(self.tree)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void __query(cKDTree self,
+ */
+  __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__free_tree(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_2);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__dealloc__");
+  __pyx_L0:;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":591
+ *         self.__free_tree(self.tree)
+ * 
+ *     cdef void __query(cKDTree self,             # <<<<<<<<<<<<<<
+ *             double*result_distances,
+ *             int*result_indices,
+ */
+
+static  void __pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, double *__pyx_v_result_distances, int *__pyx_v_result_indices, double *__pyx_v_x, int __pyx_v_k, double __pyx_v_eps, double __pyx_v_p, double __pyx_v_distance_upper_bound) {
+  struct __pyx_t_5scipy_7spatial_7ckdtree_heap __pyx_v_q;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_heap __pyx_v_neighbors;
+  int __pyx_v_i;
+  double __pyx_v_t;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo *__pyx_v_inf;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo *__pyx_v_inf2;
+  double __pyx_v_d;
+  double __pyx_v_epsfac;
+  double __pyx_v_min_distance;
+  double __pyx_v_far_min_distance;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_v_it;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_v_it2;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_v_neighbor;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *__pyx_v_node;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_inode;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_near;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_far;
+  int __pyx_1;
+  int __pyx_2;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":622
+ *         #  distances between the nearest side of the cell and the target
+ *         #  the head node of the cell
+ *         heapcreate(&q,12)             # <<<<<<<<<<<<<<
+ * 
+ *         # priority queue for the nearest neighbors
+ */
+  __pyx_f_5scipy_7spatial_7ckdtree_heapcreate((&__pyx_v_q), 12);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":627
+ *         # furthest known neighbor first
+ *         # entries are (-distance**p, i)
+ *         heapcreate(&neighbors,k)             # <<<<<<<<<<<<<<
+ * 
+ *         # set up first nodeinfo
+ */
+  __pyx_f_5scipy_7spatial_7ckdtree_heapcreate((&__pyx_v_neighbors), __pyx_v_k);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":630
+ * 
+ *         # set up first nodeinfo
+ *         inf = <nodeinfo*>malloc(sizeof(nodeinfo)+self.m*sizeof(double))             # <<<<<<<<<<<<<<
+ *         inf.node = self.tree
+ *         for i in range(self.m):
+ */
+  __pyx_v_inf = ((struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo *)malloc(((sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo)) + (__pyx_v_self->m * (sizeof(double))))));
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":631
+ *         # set up first nodeinfo
+ *         inf = <nodeinfo*>malloc(sizeof(nodeinfo)+self.m*sizeof(double))
+ *         inf.node = self.tree             # <<<<<<<<<<<<<<
+ *         for i in range(self.m):
+ *             inf.side_distances[i] = 0
+ */
+  __pyx_v_inf->node = __pyx_v_self->tree;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":632
+ *         inf = <nodeinfo*>malloc(sizeof(nodeinfo)+self.m*sizeof(double))
+ *         inf.node = self.tree
+ *         for i in range(self.m):             # <<<<<<<<<<<<<<
+ *             inf.side_distances[i] = 0
+ *             t = x[i]-self.raw_maxes[i]
+ */
+  __pyx_1 = __pyx_v_self->m;
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_1; __pyx_v_i+=1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":633
+ *         inf.node = self.tree
+ *         for i in range(self.m):
+ *             inf.side_distances[i] = 0             # <<<<<<<<<<<<<<
+ *             t = x[i]-self.raw_maxes[i]
+ *             if t>inf.side_distances[i]:
+ */
+    (__pyx_v_inf->side_distances[__pyx_v_i]) = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":634
+ *         for i in range(self.m):
+ *             inf.side_distances[i] = 0
+ *             t = x[i]-self.raw_maxes[i]             # <<<<<<<<<<<<<<
+ *             if t>inf.side_distances[i]:
+ *                 inf.side_distances[i] = t
+ */
+    __pyx_v_t = ((__pyx_v_x[__pyx_v_i]) - (__pyx_v_self->raw_maxes[__pyx_v_i]));
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":635
+ *             inf.side_distances[i] = 0
+ *             t = x[i]-self.raw_maxes[i]
+ *             if t>inf.side_distances[i]:             # <<<<<<<<<<<<<<
+ *                 inf.side_distances[i] = t
+ *             else:
+ */
+    __pyx_2 = (__pyx_v_t > (__pyx_v_inf->side_distances[__pyx_v_i]));
+    if (__pyx_2) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":636
+ *             t = x[i]-self.raw_maxes[i]
+ *             if t>inf.side_distances[i]:
+ *                 inf.side_distances[i] = t             # <<<<<<<<<<<<<<
+ *             else:
+ *                 t = self.raw_mins[i]-x[i]
+ */
+      (__pyx_v_inf->side_distances[__pyx_v_i]) = __pyx_v_t;
+      goto __pyx_L5;
+    }
+    /*else*/ {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":638
+ *                 inf.side_distances[i] = t
+ *             else:
+ *                 t = self.raw_mins[i]-x[i]             # <<<<<<<<<<<<<<
+ *                 if t>inf.side_distances[i]:
+ *                     inf.side_distances[i] = t
+ */
+      __pyx_v_t = ((__pyx_v_self->raw_mins[__pyx_v_i]) - (__pyx_v_x[__pyx_v_i]));
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":639
+ *             else:
+ *                 t = self.raw_mins[i]-x[i]
+ *                 if t>inf.side_distances[i]:             # <<<<<<<<<<<<<<
+ *                     inf.side_distances[i] = t
+ *             if p!=1 and p!=infinity:
+ */
+      __pyx_2 = (__pyx_v_t > (__pyx_v_inf->side_distances[__pyx_v_i]));
+      if (__pyx_2) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":640
+ *                 t = self.raw_mins[i]-x[i]
+ *                 if t>inf.side_distances[i]:
+ *                     inf.side_distances[i] = t             # <<<<<<<<<<<<<<
+ *             if p!=1 and p!=infinity:
+ *                 inf.side_distances[i]=inf.side_distances[i]**p
+ */
+        (__pyx_v_inf->side_distances[__pyx_v_i]) = __pyx_v_t;
+        goto __pyx_L6;
+      }
+      __pyx_L6:;
+    }
+    __pyx_L5:;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":641
+ *                 if t>inf.side_distances[i]:
+ *                     inf.side_distances[i] = t
+ *             if p!=1 and p!=infinity:             # <<<<<<<<<<<<<<
+ *                 inf.side_distances[i]=inf.side_distances[i]**p
+ * 
+ */
+    __pyx_2 = (__pyx_v_p != 1);
+    if (__pyx_2) {
+      __pyx_2 = (__pyx_v_p != __pyx_v_5scipy_7spatial_7ckdtree_infinity);
+    }
+    if (__pyx_2) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":642
+ *                     inf.side_distances[i] = t
+ *             if p!=1 and p!=infinity:
+ *                 inf.side_distances[i]=inf.side_distances[i]**p             # <<<<<<<<<<<<<<
+ * 
+ *         # compute first distance
+ */
+      (__pyx_v_inf->side_distances[__pyx_v_i]) = pow((__pyx_v_inf->side_distances[__pyx_v_i]), __pyx_v_p);
+      goto __pyx_L7;
+    }
+    __pyx_L7:;
+  }
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":645
+ * 
+ *         # compute first distance
+ *         min_distance = 0.             # <<<<<<<<<<<<<<
+ *         for i in range(self.m):
+ *             if p==infinity:
+ */
+  __pyx_v_min_distance = 0.;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":646
+ *         # compute first distance
+ *         min_distance = 0.
+ *         for i in range(self.m):             # <<<<<<<<<<<<<<
+ *             if p==infinity:
+ *                 min_distance = dmax(min_distance,inf.side_distances[i])
+ */
+  __pyx_1 = __pyx_v_self->m;
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_1; __pyx_v_i+=1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":647
+ *         min_distance = 0.
+ *         for i in range(self.m):
+ *             if p==infinity:             # <<<<<<<<<<<<<<
+ *                 min_distance = dmax(min_distance,inf.side_distances[i])
+ *             else:
+ */
+    __pyx_2 = (__pyx_v_p == __pyx_v_5scipy_7spatial_7ckdtree_infinity);
+    if (__pyx_2) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":648
+ *         for i in range(self.m):
+ *             if p==infinity:
+ *                 min_distance = dmax(min_distance,inf.side_distances[i])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 min_distance += inf.side_distances[i]
+ */
+      __pyx_v_min_distance = __pyx_f_5scipy_7spatial_7ckdtree_dmax(__pyx_v_min_distance, (__pyx_v_inf->side_distances[__pyx_v_i]));
+      goto __pyx_L10;
+    }
+    /*else*/ {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":650
+ *                 min_distance = dmax(min_distance,inf.side_distances[i])
+ *             else:
+ *                 min_distance += inf.side_distances[i]             # <<<<<<<<<<<<<<
+ * 
+ *         # fiddle approximation factor
+ */
+      __pyx_v_min_distance += (__pyx_v_inf->side_distances[__pyx_v_i]);
+    }
+    __pyx_L10:;
+  }
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":653
+ * 
+ *         # fiddle approximation factor
+ *         if eps==0:             # <<<<<<<<<<<<<<
+ *             epsfac=1
+ *         elif p==infinity:
+ */
+  __pyx_2 = (__pyx_v_eps == 0);
+  if (__pyx_2) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":654
+ *         # fiddle approximation factor
+ *         if eps==0:
+ *             epsfac=1             # <<<<<<<<<<<<<<
+ *         elif p==infinity:
+ *             epsfac = 1/(1+eps)
+ */
+    __pyx_v_epsfac = 1;
+    goto __pyx_L11;
+  }
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":655
+ *         if eps==0:
+ *             epsfac=1
+ *         elif p==infinity:             # <<<<<<<<<<<<<<
+ *             epsfac = 1/(1+eps)
+ *         else:
+ */
+  __pyx_2 = (__pyx_v_p == __pyx_v_5scipy_7spatial_7ckdtree_infinity);
+  if (__pyx_2) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":656
+ *             epsfac=1
+ *         elif p==infinity:
+ *             epsfac = 1/(1+eps)             # <<<<<<<<<<<<<<
+ *         else:
+ *             epsfac = 1/(1+eps)**p
+ */
+    __pyx_v_epsfac = (1 / (1 + __pyx_v_eps));
+    goto __pyx_L11;
+  }
+  /*else*/ {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":658
+ *             epsfac = 1/(1+eps)
+ *         else:
+ *             epsfac = 1/(1+eps)**p             # <<<<<<<<<<<<<<
+ * 
+ *         # internally we represent all distances as distance**p
+ */
+    __pyx_v_epsfac = (1 / pow((1 + __pyx_v_eps), __pyx_v_p));
+  }
+  __pyx_L11:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":661
+ * 
+ *         # internally we represent all distances as distance**p
+ *         if p!=infinity and distance_upper_bound!=infinity:             # <<<<<<<<<<<<<<
+ *             distance_upper_bound = distance_upper_bound**p
+ * 
+ */
+  __pyx_2 = (__pyx_v_p != __pyx_v_5scipy_7spatial_7ckdtree_infinity);
+  if (__pyx_2) {
+    __pyx_2 = (__pyx_v_distance_upper_bound != __pyx_v_5scipy_7spatial_7ckdtree_infinity);
+  }
+  if (__pyx_2) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":662
+ *         # internally we represent all distances as distance**p
+ *         if p!=infinity and distance_upper_bound!=infinity:
+ *             distance_upper_bound = distance_upper_bound**p             # <<<<<<<<<<<<<<
+ * 
+ *         while True:
+ */
+    __pyx_v_distance_upper_bound = pow(__pyx_v_distance_upper_bound, __pyx_v_p);
+    goto __pyx_L12;
+  }
+  __pyx_L12:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":664
+ *             distance_upper_bound = distance_upper_bound**p
+ * 
+ *         while True:             # <<<<<<<<<<<<<<
+ *             if inf.node.split_dim==-1:
+ *                 node = <leafnode*>inf.node
+ */
+  while (1) {
+    __pyx_2 = 1;
+    if (!__pyx_2) break;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":665
+ * 
+ *         while True:
+ *             if inf.node.split_dim==-1:             # <<<<<<<<<<<<<<
+ *                 node = <leafnode*>inf.node
+ * 
+ */
+    __pyx_2 = (__pyx_v_inf->node->split_dim == -1);
+    if (__pyx_2) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":666
+ *         while True:
+ *             if inf.node.split_dim==-1:
+ *                 node = <leafnode*>inf.node             # <<<<<<<<<<<<<<
+ * 
+ *                 # brute-force
+ */
+      __pyx_v_node = ((struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *)__pyx_v_inf->node);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":669
+ * 
+ *                 # brute-force
+ *                 for i in range(node.start_idx,node.end_idx):             # <<<<<<<<<<<<<<
+ *                     d = _distance_p(
+ *                             self.raw_data+self.raw_indices[i]*self.m,
+ */
+      __pyx_1 = __pyx_v_node->end_idx;
+      for (__pyx_v_i = __pyx_v_node->start_idx; __pyx_v_i < __pyx_1; __pyx_v_i+=1) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":672
+ *                     d = _distance_p(
+ *                             self.raw_data+self.raw_indices[i]*self.m,
+ *                             x,p,self.m,distance_upper_bound)             # <<<<<<<<<<<<<<
+ * 
+ *                     if d<distance_upper_bound:
+ */
+        __pyx_v_d = __pyx_f_5scipy_7spatial_7ckdtree__distance_p((__pyx_v_self->raw_data + ((__pyx_v_self->raw_indices[__pyx_v_i]) * __pyx_v_self->m)), __pyx_v_x, __pyx_v_p, __pyx_v_self->m, __pyx_v_distance_upper_bound);
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":674
+ *                             x,p,self.m,distance_upper_bound)
+ * 
+ *                     if d<distance_upper_bound:             # <<<<<<<<<<<<<<
+ *                         # replace furthest neighbor
+ *                         if neighbors.n==k:
+ */
+        __pyx_2 = (__pyx_v_d < __pyx_v_distance_upper_bound);
+        if (__pyx_2) {
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":676
+ *                     if d<distance_upper_bound:
+ *                         # replace furthest neighbor
+ *                         if neighbors.n==k:             # <<<<<<<<<<<<<<
+ *                             heapremove(&neighbors)
+ *                         neighbor.priority = -d
+ */
+          __pyx_2 = (__pyx_v_neighbors.n == __pyx_v_k);
+          if (__pyx_2) {
+
+            /* "/root/package/scipy/spatial/ckdtree.pyx":677
+ *                         # replace furthest neighbor
+ *                         if neighbors.n==k:
+ *                             heapremove(&neighbors)             # <<<<<<<<<<<<<<
+ *                         neighbor.priority = -d
+ *                         neighbor.contents.intdata = self.raw_indices[i]
+ */
+            __pyx_f_5scipy_7spatial_7ckdtree_heapremove((&__pyx_v_neighbors));
+            goto __pyx_L19;
+          }
+          __pyx_L19:;
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":678
+ *                         if neighbors.n==k:
+ *                             heapremove(&neighbors)
+ *                         neighbor.priority = -d             # <<<<<<<<<<<<<<
+ *                         neighbor.contents.intdata = self.raw_indices[i]
+ *                         heappush(&neighbors,neighbor)
+ */
+          __pyx_v_neighbor.priority = (-__pyx_v_d);
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":679
+ *                             heapremove(&neighbors)
+ *                         neighbor.priority = -d
+ *                         neighbor.contents.intdata = self.raw_indices[i]             # <<<<<<<<<<<<<<
+ *                         heappush(&neighbors,neighbor)
+ * 
+ */
+          __pyx_v_neighbor.contents.intdata = (__pyx_v_self->raw_indices[__pyx_v_i]);
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":680
+ *                         neighbor.priority = -d
+ *                         neighbor.contents.intdata = self.raw_indices[i]
+ *                         heappush(&neighbors,neighbor)             # <<<<<<<<<<<<<<
+ * 
+ *                         # adjust upper bound for efficiency
+ */
+          __pyx_f_5scipy_7spatial_7ckdtree_heappush((&__pyx_v_neighbors), __pyx_v_neighbor);
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":683
+ * 
+ *                         # adjust upper bound for efficiency
+ *                         if neighbors.n==k:             # <<<<<<<<<<<<<<
+ *                             distance_upper_bound = -heappeek(&neighbors).priority
+ *                 # done with this node, get another
+ */
+          __pyx_2 = (__pyx_v_neighbors.n == __pyx_v_k);
+          if (__pyx_2) {
+
+            /* "/root/package/scipy/spatial/ckdtree.pyx":684
+ *                         # adjust upper bound for efficiency
+ *                         if neighbors.n==k:
+ *                             distance_upper_bound = -heappeek(&neighbors).priority             # <<<<<<<<<<<<<<
+ *                 # done with this node, get another
+ *                 free(inf)
+ */
+            __pyx_v_distance_upper_bound = (-__pyx_f_5scipy_7spatial_7ckdtree_heappeek((&__pyx_v_neighbors)).priority);
+            goto __pyx_L20;
+          }
+          __pyx_L20:;
+          goto __pyx_L18;
+        }
+        __pyx_L18:;
+      }
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":686
+ *                             distance_upper_bound = -heappeek(&neighbors).priority
+ *                 # done with this node, get another
+ *                 free(inf)             # <<<<<<<<<<<<<<
+ *                 if q.n==0:
+ *                     # no more nodes to visit
+ */
+      free(__pyx_v_inf);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":687
+ *                 # done with this node, get another
+ *                 free(inf)
+ *                 if q.n==0:             # <<<<<<<<<<<<<<
+ *                     # no more nodes to visit
+ *                     break
+ */
+      __pyx_2 = (__pyx_v_q.n == 0);
+      if (__pyx_2) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":689
+ *                 if q.n==0:
+ *                     # no more nodes to visit
+ *                     break             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     it = heappop(&q)
+ */
+        goto __pyx_L14;
+        goto __pyx_L21;
+      }
+      /*else*/ {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":691
+ *                     break
+ *                 else:
+ *                     it = heappop(&q)             # <<<<<<<<<<<<<<
+ *                     inf = <nodeinfo*>it.contents.ptrdata
+ *                     min_distance = it.priority
+ */
+        __pyx_v_it = __pyx_f_5scipy_7spatial_7ckdtree_heappop((&__pyx_v_q));
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":692
+ *                 else:
+ *                     it = heappop(&q)
+ *                     inf = <nodeinfo*>it.contents.ptrdata             # <<<<<<<<<<<<<<
+ *                     min_distance = it.priority
+ *             else:
+ */
+        __pyx_v_inf = ((struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo *)__pyx_v_it.contents.ptrdata);
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":693
+ *                     it = heappop(&q)
+ *                     inf = <nodeinfo*>it.contents.ptrdata
+ *                     min_distance = it.priority             # <<<<<<<<<<<<<<
+ *             else:
+ *                 inode = <innernode*>inf.node
+ */
+        __pyx_v_min_distance = __pyx_v_it.priority;
+      }
+      __pyx_L21:;
+      goto __pyx_L15;
+    }
+    /*else*/ {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":695
+ *                     min_distance = it.priority
+ *             else:
+ *                 inode = <innernode*>inf.node             # <<<<<<<<<<<<<<
+ * 
+ *                 # we don't push cells that are too far onto the queue at all,
+ */
+      __pyx_v_inode = ((struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *)__pyx_v_inf->node);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":700
+ *                 # but since the distance_upper_bound decreases, we might get
+ *                 # here even if the cell's too far
+ *                 if min_distance>distance_upper_bound*epsfac:             # <<<<<<<<<<<<<<
+ *                     # since this is the nearest cell, we're done, bail out
+ *                     free(inf)
+ */
+      __pyx_2 = (__pyx_v_min_distance > (__pyx_v_distance_upper_bound * __pyx_v_epsfac));
+      if (__pyx_2) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":702
+ *                 if min_distance>distance_upper_bound*epsfac:
+ *                     # since this is the nearest cell, we're done, bail out
+ *                     free(inf)             # <<<<<<<<<<<<<<
+ *                     # free all the nodes still on the heap
+ *                     for i in range(q.n):
+ */
+        free(__pyx_v_inf);
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":704
+ *                     free(inf)
+ *                     # free all the nodes still on the heap
+ *                     for i in range(q.n):             # <<<<<<<<<<<<<<
+ *                         free(q.heap[i].contents.ptrdata)
+ *                     break
+ */
+        __pyx_1 = __pyx_v_q.n;
+        for (__pyx_v_i = 0; __pyx_v_i < __pyx_1; __pyx_v_i+=1) {
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":705
+ *                     # free all the nodes still on the heap
+ *                     for i in range(q.n):
+ *                         free(q.heap[i].contents.ptrdata)             # <<<<<<<<<<<<<<
+ *                     break
+ * 
+ */
+          free((__pyx_v_q.heap[__pyx_v_i]).contents.ptrdata);
+        }
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":706
+ *                     for i in range(q.n):
+ *                         free(q.heap[i].contents.ptrdata)
+ *                     break             # <<<<<<<<<<<<<<
+ * 
+ *                 # set up children for searching
+ */
+        goto __pyx_L14;
+        goto __pyx_L22;
+      }
+      __pyx_L22:;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":709
+ * 
+ *                 # set up children for searching
+ *                 if x[inode.split_dim]<inode.split:             # <<<<<<<<<<<<<<
+ *                     near = inode.less
+ *                     far = inode.greater
+ */
+      __pyx_2 = ((__pyx_v_x[__pyx_v_inode->split_dim]) < __pyx_v_inode->split);
+      if (__pyx_2) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":710
+ *                 # set up children for searching
+ *                 if x[inode.split_dim]<inode.split:
+ *                     near = inode.less             # <<<<<<<<<<<<<<
+ *                     far = inode.greater
+ *                 else:
+ */
+        __pyx_v_near = __pyx_v_inode->less;
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":711
+ *                 if x[inode.split_dim]<inode.split:
+ *                     near = inode.less
+ *                     far = inode.greater             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     near = inode.greater
+ */
+        __pyx_v_far = __pyx_v_inode->greater;
+        goto __pyx_L25;
+      }
+      /*else*/ {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":713
+ *                     far = inode.greater
+ *                 else:
+ *                     near = inode.greater             # <<<<<<<<<<<<<<
+ *                     far = inode.less
+ * 
+ */
+        __pyx_v_near = __pyx_v_inode->greater;
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":714
+ *                 else:
+ *                     near = inode.greater
+ *                     far = inode.less             # <<<<<<<<<<<<<<
+ * 
+ *                 # near child is at the same distance as the current node
+ */
+        __pyx_v_far = __pyx_v_inode->less;
+      }
+      __pyx_L25:;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":719
+ *                 # we're going here next, so no point pushing it on the queue
+ *                 # no need to recompute the distance or the side_distances
+ *                 inf.node = near             # <<<<<<<<<<<<<<
+ * 
+ *                 # far child is further by an amount depending only
+ */
+      __pyx_v_inf->node = __pyx_v_near;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":724
+ *                 # on the split value; compute its distance and side_distances
+ *                 # and push it on the queue if it's near enough
+ *                 inf2 = <nodeinfo*>malloc(sizeof(nodeinfo)+self.m*sizeof(double))             # <<<<<<<<<<<<<<
+ *                 it2.contents.ptrdata = <char*> inf2
+ *                 inf2.node = far
+ */
+      __pyx_v_inf2 = ((struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo *)malloc(((sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo)) + (__pyx_v_self->m * (sizeof(double))))));
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":725
+ *                 # and push it on the queue if it's near enough
+ *                 inf2 = <nodeinfo*>malloc(sizeof(nodeinfo)+self.m*sizeof(double))
+ *                 it2.contents.ptrdata = <char*> inf2             # <<<<<<<<<<<<<<
+ *                 inf2.node = far
+ *                 # most side distances unchanged
+ */
+      __pyx_v_it2.contents.ptrdata = ((char *)__pyx_v_inf2);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":726
+ *                 inf2 = <nodeinfo*>malloc(sizeof(nodeinfo)+self.m*sizeof(double))
+ *                 it2.contents.ptrdata = <char*> inf2
+ *                 inf2.node = far             # <<<<<<<<<<<<<<
+ *                 # most side distances unchanged
+ *                 for i in range(self.m):
+ */
+      __pyx_v_inf2->node = __pyx_v_far;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":728
+ *                 inf2.node = far
+ *                 # most side distances unchanged
+ *                 for i in range(self.m):             # <<<<<<<<<<<<<<
+ *                     inf2.side_distances[i] = inf.side_distances[i]
+ * 
+ */
+      __pyx_1 = __pyx_v_self->m;
+      for (__pyx_v_i = 0; __pyx_v_i < __pyx_1; __pyx_v_i+=1) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":729
+ *                 # most side distances unchanged
+ *                 for i in range(self.m):
+ *                     inf2.side_distances[i] = inf.side_distances[i]             # <<<<<<<<<<<<<<
+ * 
+ *                 # one side distance changes
+ */
+        (__pyx_v_inf2->side_distances[__pyx_v_i]) = (__pyx_v_inf->side_distances[__pyx_v_i]);
+      }
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":733
+ *                 # one side distance changes
+ *                 # we can adjust the minimum distance without recomputing
+ *                 if p == infinity:             # <<<<<<<<<<<<<<
+ *                     # we never use side_distances in the l_infinity case
+ *                     # inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
+ */
+      __pyx_2 = (__pyx_v_p == __pyx_v_5scipy_7spatial_7ckdtree_infinity);
+      if (__pyx_2) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":736
+ *                     # we never use side_distances in the l_infinity case
+ *                     # inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
+ *                     far_min_distance = dmax(min_distance, dabs(inode.split-x[inode.split_dim]))             # <<<<<<<<<<<<<<
+ *                 elif p == 1:
+ *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
+ */
+        __pyx_v_far_min_distance = __pyx_f_5scipy_7spatial_7ckdtree_dmax(__pyx_v_min_distance, __pyx_f_5scipy_7spatial_7ckdtree_dabs((__pyx_v_inode->split - (__pyx_v_x[__pyx_v_inode->split_dim]))));
+        goto __pyx_L28;
+      }
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":737
+ *                     # inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
+ *                     far_min_distance = dmax(min_distance, dabs(inode.split-x[inode.split_dim]))
+ *                 elif p == 1:             # <<<<<<<<<<<<<<
+ *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
+ *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]
+ */
+      __pyx_2 = (__pyx_v_p == 1);
+      if (__pyx_2) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":738
+ *                     far_min_distance = dmax(min_distance, dabs(inode.split-x[inode.split_dim]))
+ *                 elif p == 1:
+ *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])             # <<<<<<<<<<<<<<
+ *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]
+ *                 else:
+ */
+        (__pyx_v_inf2->side_distances[__pyx_v_inode->split_dim]) = __pyx_f_5scipy_7spatial_7ckdtree_dabs((__pyx_v_inode->split - (__pyx_v_x[__pyx_v_inode->split_dim])));
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":739
+ *                 elif p == 1:
+ *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
+ *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])**p
+ */
+        __pyx_v_far_min_distance = ((__pyx_v_min_distance - (__pyx_v_inf->side_distances[__pyx_v_inode->split_dim])) + (__pyx_v_inf2->side_distances[__pyx_v_inode->split_dim]));
+        goto __pyx_L28;
+      }
+      /*else*/ {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":741
+ *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]
+ *                 else:
+ *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])**p             # <<<<<<<<<<<<<<
+ *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]
+ * 
+ */
+        (__pyx_v_inf2->side_distances[__pyx_v_inode->split_dim]) = pow(__pyx_f_5scipy_7spatial_7ckdtree_dabs((__pyx_v_inode->split - (__pyx_v_x[__pyx_v_inode->split_dim]))), __pyx_v_p);
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":742
+ *                 else:
+ *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])**p
+ *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]             # <<<<<<<<<<<<<<
+ * 
+ *                 it2.priority = far_min_distance
+ */
+        __pyx_v_far_min_distance = ((__pyx_v_min_distance - (__pyx_v_inf->side_distances[__pyx_v_inode->split_dim])) + (__pyx_v_inf2->side_distances[__pyx_v_inode->split_dim]));
+      }
+      __pyx_L28:;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":744
+ *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]
+ * 
+ *                 it2.priority = far_min_distance             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      __pyx_v_it2.priority = __pyx_v_far_min_distance;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":748
+ * 
+ *                 # far child might be too far, if so, don't bother pushing it
+ *                 if far_min_distance<=distance_upper_bound*epsfac:             # <<<<<<<<<<<<<<
+ *                     heappush(&q,it2)
+ *                 else:
+ */
+      __pyx_2 = (__pyx_v_far_min_distance <= (__pyx_v_distance_upper_bound * __pyx_v_epsfac));
+      if (__pyx_2) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":749
+ *                 # far child might be too far, if so, don't bother pushing it
+ *                 if far_min_distance<=distance_upper_bound*epsfac:
+ *                     heappush(&q,it2)             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     free(inf2)
+ */
+        __pyx_f_5scipy_7spatial_7ckdtree_heappush((&__pyx_v_q), __pyx_v_it2);
+        goto __pyx_L29;
+      }
+      /*else*/ {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":751
+ *                     heappush(&q,it2)
+ *                 else:
+ *                     free(inf2)             # <<<<<<<<<<<<<<
+ *                     # just in case
+ *                     it2.contents.ptrdata = <char*> 0
+ */
+        free(__pyx_v_inf2);
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":753
+ *                     free(inf2)
+ *                     # just in case
+ *                     it2.contents.ptrdata = <char*> 0             # <<<<<<<<<<<<<<
+ * 
+ *         # fill output arrays with sorted neighbors
+ */
+        __pyx_v_it2.contents.ptrdata = ((char *)0);
+      }
+      __pyx_L29:;
+    }
+    __pyx_L15:;
+  }
+  __pyx_L14:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":756
+ * 
+ *         # fill output arrays with sorted neighbors
+ *         for i in range(neighbors.n-1,-1,-1):             # <<<<<<<<<<<<<<
+ *             neighbor = heappop(&neighbors) # FIXME: neighbors may be realloced
+ *             result_indices[i] = neighbor.contents.intdata
+ */
+  for (__pyx_v_i = (__pyx_v_neighbors.n - 1); __pyx_v_i > -1; __pyx_v_i-=1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":757
+ *         # fill output arrays with sorted neighbors
+ *         for i in range(neighbors.n-1,-1,-1):
+ *             neighbor = heappop(&neighbors) # FIXME: neighbors may be realloced             # <<<<<<<<<<<<<<
+ *             result_indices[i] = neighbor.contents.intdata
+ *             if p==1 or p==infinity:
+ */
+    __pyx_v_neighbor = __pyx_f_5scipy_7spatial_7ckdtree_heappop((&__pyx_v_neighbors));
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":758
+ *         for i in range(neighbors.n-1,-1,-1):
+ *             neighbor = heappop(&neighbors) # FIXME: neighbors may be realloced
+ *             result_indices[i] = neighbor.contents.intdata             # <<<<<<<<<<<<<<
+ *             if p==1 or p==infinity:
+ *                 result_distances[i] = -neighbor.priority
+ */
+    (__pyx_v_result_indices[__pyx_v_i]) = __pyx_v_neighbor.contents.intdata;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":759
+ *             neighbor = heappop(&neighbors) # FIXME: neighbors may be realloced
+ *             result_indices[i] = neighbor.contents.intdata
+ *             if p==1 or p==infinity:             # <<<<<<<<<<<<<<
+ *                 result_distances[i] = -neighbor.priority
+ *             else:
+ */
+    __pyx_2 = (__pyx_v_p == 1);
+    if (!__pyx_2) {
+      __pyx_2 = (__pyx_v_p == __pyx_v_5scipy_7spatial_7ckdtree_infinity);
+    }
+    if (__pyx_2) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":760
+ *             result_indices[i] = neighbor.contents.intdata
+ *             if p==1 or p==infinity:
+ *                 result_distances[i] = -neighbor.priority             # <<<<<<<<<<<<<<
+ *             else:
+ *                 result_distances[i] = (-neighbor.priority)**(1./p)
+ */
+      (__pyx_v_result_distances[__pyx_v_i]) = (-__pyx_v_neighbor.priority);
+      goto __pyx_L32;
+    }
+    /*else*/ {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":762
+ *                 result_distances[i] = -neighbor.priority
+ *             else:
+ *                 result_distances[i] = (-neighbor.priority)**(1./p)             # <<<<<<<<<<<<<<
+ * 
+ *         heapdestroy(&q)
+ */
+      (__pyx_v_result_distances[__pyx_v_i]) = pow((-__pyx_v_neighbor.priority), (1. / __pyx_v_p));
+    }
+    __pyx_L32:;
+  }
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":764
+ *                 result_distances[i] = (-neighbor.priority)**(1./p)
+ * 
+ *         heapdestroy(&q)             # <<<<<<<<<<<<<<
+ *         heapdestroy(&neighbors)
+ * 
+ */
+  __pyx_f_5scipy_7spatial_7ckdtree_heapdestroy((&__pyx_v_q));
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":765
+ * 
+ *         heapdestroy(&q)
+ *         heapdestroy(&neighbors)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void __query_range(cKDTree self,
+ */
+  __pyx_f_5scipy_7spatial_7ckdtree_heapdestroy((&__pyx_v_neighbors));
+
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":767
+ *         heapdestroy(&neighbors)
+ * 
+ *     cdef void __query_range(cKDTree self,             # <<<<<<<<<<<<<<
+ *             double*result_distances,
+ *             int*result_indices,
+ */
+
+static  void __pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_range(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, double *__pyx_v_result_distances, int *__pyx_v_result_indices, double *__pyx_v_x, int __pyx_v_start, int __pyx_v_stop, int __pyx_v_k, double __pyx_v_eps, double __pyx_v_p, double __pyx_v_distance_upper_bound) {
+  int __pyx_v_c;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":778
+ *             double distance_upper_bound) nogil:
+ *         cdef int c
+ *         for c in range(start,stop):             # <<<<<<<<<<<<<<
+ *             self.__query(
+ *                     result_distances+c*k,
+ */
+  for (__pyx_v_c = __pyx_v_start; __pyx_v_c < __pyx_v_stop; __pyx_v_c+=1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":786
+ *                     eps,
+ *                     p,
+ *                     distance_upper_bound)             # <<<<<<<<<<<<<<
+ * 
+ *     def _query_block(cKDTree self, np.ndarray dd, np.ndarray ii,
+ */
+    ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query(__pyx_v_self, (__pyx_v_result_distances + (__pyx_v_c * __pyx_v_k)), (__pyx_v_result_indices + (__pyx_v_c * __pyx_v_k)), (__pyx_v_x + (__pyx_v_c * __pyx_v_self->m)), __pyx_v_k, __pyx_v_eps, __pyx_v_p, __pyx_v_distance_upper_bound);
+  }
+
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":788
+ *                     distance_upper_bound)
+ * 
+ *     def _query_block(cKDTree self, np.ndarray dd, np.ndarray ii,             # <<<<<<<<<<<<<<
+ *             np.ndarray xx, int start, int stop, int k, double eps,
+ *             double p, double distance_upper_bound):
+ */
+
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree__query_block(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree__query_block[] = "Answer the queries xx[start:stop] without holding the GIL\n\n        dd, ii and xx must be the contiguous result and query arrays\n        allocated by query; each worker thread fills its own rows.\n        ";
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree__query_block(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_dd = 0;
+  PyArrayObject *__pyx_v_ii = 0;
+  PyArrayObject *__pyx_v_xx = 0;
+  int __pyx_v_start;
+  int __pyx_v_stop;
+  int __pyx_v_k;
+  double __pyx_v_eps;
+  double __pyx_v_p;
+  double __pyx_v_distance_upper_bound;
+  double *__pyx_v_raw_dd;
+  int *__pyx_v_raw_ii;
+  double *__pyx_v_raw_xx;
+  PyObject *__pyx_r;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_dd,&__pyx_kp_ii,&__pyx_kp_xx,&__pyx_kp_start,&__pyx_kp_stop,&__pyx_kp_k,&__pyx_kp_eps,&__pyx_kp_p,&__pyx_kp_24,0};
+  if (unlikely(__pyx_kwds)) {
+    PyObject* values[9] = {0,0,0,0,0,0,0,0,0};
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_dd);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_kp_ii);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_query_block", 1, 9, 9, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 788; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  2:
+      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_kp_xx);
+      if (likely(values[2])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_query_block", 1, 9, 9, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 788; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  3:
+      values[3] = PyDict_GetItem(__pyx_kwds, __pyx_kp_start);
+      if (likely(values[3])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_query_block", 1, 9, 9, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 788; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  4:
+      values[4] = PyDict_GetItem(__pyx_kwds, __pyx_kp_stop);
+      if (likely(values[4])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_query_block", 1, 9, 9, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 788; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  5:
+      values[5] = PyDict_GetItem(__pyx_kwds, __pyx_kp_k);
+      if (likely(values[5])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_query_block", 1, 9, 9, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 788; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  6:
+      values[6] = PyDict_GetItem(__pyx_kwds, __pyx_kp_eps);
+      if (likely(values[6])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_query_block", 1, 9, 9, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 788; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  7:
+      values[7] = PyDict_GetItem(__pyx_kwds, __pyx_kp_p);
+      if (likely(values[7])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_query_block", 1, 9, 9, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 788; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  8:
+      values[8] = PyDict_GetItem(__pyx_kwds, __pyx_kp_24);
+      if (likely(values[8])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("_query_block", 1, 9, 9, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 788; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "_query_block") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 788; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_dd = ((PyArrayObject *)values[0]);
+    __pyx_v_ii = ((PyArrayObject *)values[1]);
+    __pyx_v_xx = ((PyArrayObject *)values[2]);
+    __pyx_v_start = __pyx_PyInt_int(values[3]); if (unlikely((__pyx_v_start == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 789; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stop = __pyx_PyInt_int(values[4]); if (unlikely((__pyx_v_stop == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 789; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_k = __pyx_PyInt_int(values[5]); if (unlikely((__pyx_v_k == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 789; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_eps = __pyx_PyFloat_AsDouble(values[6]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 789; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_p = __pyx_PyFloat_AsDouble(values[7]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 790; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_distance_upper_bound = __pyx_PyFloat_AsDouble(values[8]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 790; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 9) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_dd = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
+    __pyx_v_ii = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
+    __pyx_v_xx = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 2));
+    __pyx_v_start = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_start == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 789; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stop = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_stop == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 789; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_k = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely((__pyx_v_k == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 789; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_eps = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 6)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 789; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_p = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 7)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 790; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_distance_upper_bound = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 8)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 790; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_query_block", 1, 9, 9, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 788; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree._query_block");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_dd), __pyx_ptype_5numpy_ndarray, 1, "dd", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 788; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ii), __pyx_ptype_5numpy_ndarray, 1, "ii", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 788; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_xx), __pyx_ptype_5numpy_ndarray, 1, "xx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 789; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":799
+ *         cdef int* raw_ii
+ *         cdef double* raw_xx
+ *         raw_dd = <double*>dd.data             # <<<<<<<<<<<<<<
+ *         raw_ii = <int*>ii.data
+ *         raw_xx = <double*>xx.data
+ */
+  __pyx_v_raw_dd = ((double *)__pyx_v_dd->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":800
+ *         cdef double* raw_xx
+ *         raw_dd = <double*>dd.data
+ *         raw_ii = <int*>ii.data             # <<<<<<<<<<<<<<
+ *         raw_xx = <double*>xx.data
+ *         with nogil:
+ */
+  __pyx_v_raw_ii = ((int *)__pyx_v_ii->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":801
+ *         raw_dd = <double*>dd.data
+ *         raw_ii = <int*>ii.data
+ *         raw_xx = <double*>xx.data             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             self.__query_range(raw_dd, raw_ii, raw_xx, start, stop,
+ */
+  __pyx_v_raw_xx = ((double *)__pyx_v_xx->data);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":802
+ *         raw_ii = <int*>ii.data
+ *         raw_xx = <double*>xx.data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             self.__query_range(raw_dd, raw_ii, raw_xx, start, stop,
+ *                     k, eps, p, distance_upper_bound)
+ */
+  /*with nogil:*/ {
+    PyThreadState *_save;
+    Py_UNBLOCK_THREADS
+    /*try:*/ {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":804
+ *         with nogil:
+ *             self.__query_range(raw_dd, raw_ii, raw_xx, start, stop,
+ *                     k, eps, p, distance_upper_bound)             # <<<<<<<<<<<<<<
+ * 
+ *     def query(cKDTree self, object x, int k=1, double eps=0, double p=2,
+ */
+      ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__query_range(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), __pyx_v_raw_dd, __pyx_v_raw_ii, __pyx_v_raw_xx, __pyx_v_start, __pyx_v_stop, __pyx_v_k, __pyx_v_eps, __pyx_v_p, __pyx_v_distance_upper_bound);
+    }
+    /*finally:*/ {
+      Py_BLOCK_THREADS
+    }
+  }
+
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree._query_block");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":806
+ *                     k, eps, p, distance_upper_bound)
+ * 
+ *     def query(cKDTree self, object x, int k=1, double eps=0, double p=2,             # <<<<<<<<<<<<<<
+ *             double distance_upper_bound=infinity, int n_jobs=1):
+ *         """query the kd-tree for nearest neighbors
+ */
+
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_query[] = "query the kd-tree for nearest neighbors\n\n        Parameters:\n        ===========\n\n        x : array-like, last dimension self.m\n            An array of points to query.\n        k : integer\n            The number of nearest neighbors to return.\n        eps : nonnegative float\n            Return approximate nearest neighbors; the kth returned value \n            is guaranteed to be no further than (1+eps) times the \n            distance to the real kth nearest neighbor.\n        p : float, 1<=p<=infinity\n            Which Minkowski p-norm to use. \n            1 is the sum-of-absolute-values \"Manhattan\" distance\n            2 is the usual Euclidean distance\n            infinity is the maximum-coordinate-difference distance\n        distance_upper_bound : nonnegative float\n            Return only neighbors within this distance. This is used to prune\n            tree searches, so if you are doing a series of nearest-neighbor\n            queries, it may help to supply the distance to the nearest neighbor\n            of the most recent point.\n        n_jobs : integer\n            The number of threads to split the query points across. The\n            GIL is released while searching, so the threads run\n            concurrently. If -1, one thread per processor is used.\n\n        Returns:\n        ========\n        \n        d : array of floats\n            The distances to the nearest neighbors. \n            If x has shape tuple+(self.m,), then d has shape tuple+(k,).\n            Missing neighbors are indicated with infinite distances.\n        i : array of integers\n            The locations of the neighbors in self.data.\n            If x has shape tuple+(self.m,), then i has shape tuple+(k,).\n            Missing neighbors are indicated with self.n.\n        ";
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_x = 0;
+  int __pyx_v_k;
+  double __pyx_v_eps;
+  double __pyx_v_p;
+  double __pyx_v_distance_upper_bound;
+  int __pyx_v_n_jobs;
+  PyArrayObject *__pyx_v_ii;
+  PyArrayObject *__pyx_v_dd;
+  PyArrayObject *__pyx_v_xx;
+  int __pyx_v_c;
+  PyObject *__pyx_v_single;
+  PyObject *__pyx_v_retshape;
+  PyObject *__pyx_v_n;
+  PyObject *__pyx_v_chunk;
+  PyObject *__pyx_v_blocks;
+  Py_buffer __pyx_bstruct_ii;
+  Py_ssize_t __pyx_bstride_0_ii = 0;
+  Py_ssize_t __pyx_bstride_1_ii = 0;
+  Py_ssize_t __pyx_bshape_0_ii = 0;
+  Py_ssize_t __pyx_bshape_1_ii = 0;
+  Py_buffer __pyx_bstruct_xx;
+  Py_ssize_t __pyx_bstride_0_xx = 0;
+  Py_ssize_t __pyx_bstride_1_xx = 0;
+  Py_ssize_t __pyx_bshape_0_xx = 0;
+  Py_ssize_t __pyx_bshape_1_xx = 0;
+  Py_buffer __pyx_bstruct_dd;
+  Py_ssize_t __pyx_bstride_0_dd = 0;
+  Py_ssize_t __pyx_bstride_1_dd = 0;
+  Py_ssize_t __pyx_bshape_0_dd = 0;
+  Py_ssize_t __pyx_bshape_1_dd = 0;
+  PyObject *__pyx_r;
+  PyObject *__pyx_1 = 0;
+  PyObject *__pyx_2 = 0;
+  PyObject *__pyx_3 = 0;
+  int __pyx_4;
+  PyObject *__pyx_5 = 0;
+  Py_ssize_t __pyx_6 = 0;
+  PyObject *__pyx_7 = 0;
+  int __pyx_8;
+  PyObject *__pyx_9 = 0;
+  PyObject *__pyx_10 = 0;
+  PyObject *__pyx_11 = 0;
+  PyObject *__pyx_12 = 0;
+  PyObject *__pyx_t_1 = NULL;
+  PyArrayObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyArrayObject *__pyx_t_6 = NULL;
+  PyArrayObject *__pyx_t_7 = NULL;
+  long __pyx_t_8;
+  long __pyx_t_9;
+  long __pyx_t_10;
+  long __pyx_t_11;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_x,&__pyx_kp_k,&__pyx_kp_eps,&__pyx_kp_p,&__pyx_kp_24,&__pyx_kp_n_jobs,0};
+  __pyx_v_k = 1;
+  __pyx_v_eps = ((double)0);
+  __pyx_v_p = ((double)2);
+  __pyx_v_distance_upper_bound = __pyx_k_27;
+  __pyx_v_n_jobs = 1;
+  if (unlikely(__pyx_kwds)) {
+    PyObject* values[6] = {0,0,0,0,0,0};
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_x);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "query") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_x = values[0];
+    if (values[1]) {
+      __pyx_v_k = __pyx_PyInt_int(values[1]); if (unlikely((__pyx_v_k == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    if (values[2]) {
+      __pyx_v_eps = __pyx_PyFloat_AsDouble(values[2]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    if (values[3]) {
+      __pyx_v_p = __pyx_PyFloat_AsDouble(values[3]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    if (values[4]) {
+      __pyx_v_distance_upper_bound = __pyx_PyFloat_AsDouble(values[4]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 807; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    if (values[5]) {
+      __pyx_v_n_jobs = __pyx_PyInt_int(values[5]); if (unlikely((__pyx_v_n_jobs == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 807; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+  } else {
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  6: __pyx_v_n_jobs = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely((__pyx_v_n_jobs == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 807; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  5: __pyx_v_distance_upper_bound = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 807; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  4: __pyx_v_p = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  3: __pyx_v_eps = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  2: __pyx_v_k = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_k == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  1: __pyx_v_x = PyTuple_GET_ITEM(__pyx_args, 0);
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("query", 0, 1, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.query");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  Py_INCREF(__pyx_v_x);
+  __pyx_v_ii = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_dd = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_xx = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_single = Py_None; Py_INCREF(Py_None);
+  __pyx_v_retshape = Py_None; Py_INCREF(Py_None);
+  __pyx_v_n = Py_None; Py_INCREF(Py_None);
+  __pyx_v_chunk = Py_None; Py_INCREF(Py_None);
+  __pyx_v_blocks = Py_None; Py_INCREF(Py_None);
+  __pyx_bstruct_ii.buf = NULL;
+  __pyx_bstruct_dd.buf = NULL;
+  __pyx_bstruct_xx.buf = NULL;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":852
+ *         cdef np.ndarray[double, ndim=2] xx
+ *         cdef int c
+ *         x = np.asarray(x).astype(np.float)             # <<<<<<<<<<<<<<
+ *         if np.shape(x)[-1] != self.m:
+ *             raise ValueError("x must consist of vectors of length %d but has shape %s" % (self.m, np.shape(x)))
  */
-      __pyx_v_n = ((struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *)malloc((sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode))));
+  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 852; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_1, __pyx_kp_asarray); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 852; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 852; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_v_x);
+  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_v_x);
+  __pyx_3 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 852; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  __pyx_2 = PyObject_GetAttr(__pyx_3, __pyx_kp_astype); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 852; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 852; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyObject_GetAttr(__pyx_1, __pyx_kp_float); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 852; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 852; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_3);
+  __pyx_3 = 0;
+  __pyx_3 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 852; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  Py_DECREF(__pyx_v_x);
+  __pyx_v_x = __pyx_3;
+  __pyx_3 = 0;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":258
- *                 # all points are identical; warn user?
- *                 n = <leafnode*>stdlib.malloc(sizeof(leafnode))
- *                 n.split_dim = -1             # <<<<<<<<<<<<<<
- *                 n.start_idx = start_idx
- *                 n.end_idx = end_idx
+  /* "/root/package/scipy/spatial/ckdtree.pyx":853
+ *         cdef int c
+ *         x = np.asarray(x).astype(np.float)
+ *         if np.shape(x)[-1] != self.m:             # <<<<<<<<<<<<<<
+ *             raise ValueError("x must consist of vectors of length %d but has shape %s" % (self.m, np.shape(x)))
+ *         if p<1:
  */
-      __pyx_v_n->split_dim = -1;
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 853; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = PyObject_GetAttr(__pyx_2, __pyx_kp_shape); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 853; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 853; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_v_x);
+  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_x);
+  __pyx_2 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 853; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  __pyx_1 = __Pyx_GetItemInt(__pyx_2, -1, 0); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 853; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_3 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 853; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_RichCompare(__pyx_1, __pyx_3, Py_NE); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 853; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_4 = __Pyx_PyObject_IsTrue(__pyx_2); if (unlikely(__pyx_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 853; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  if (__pyx_4) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":259
- *                 n = <leafnode*>stdlib.malloc(sizeof(leafnode))
- *                 n.split_dim = -1
- *                 n.start_idx = start_idx             # <<<<<<<<<<<<<<
- *                 n.end_idx = end_idx
- *                 return <innernode*>n
+    /* "/root/package/scipy/spatial/ckdtree.pyx":854
+ *         x = np.asarray(x).astype(np.float)
+ *         if np.shape(x)[-1] != self.m:
+ *             raise ValueError("x must consist of vectors of length %d but has shape %s" % (self.m, np.shape(x)))             # <<<<<<<<<<<<<<
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
  */
-      __pyx_v_n->start_idx = __pyx_v_start_idx;
+    __pyx_1 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 854; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 854; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_2 = PyObject_GetAttr(__pyx_3, __pyx_kp_shape); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 854; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 854; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_v_x);
+    PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_x);
+    __pyx_5 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 854; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+    __pyx_2 = PyTuple_New(2); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 854; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_1);
+    PyTuple_SET_ITEM(__pyx_2, 1, __pyx_5);
+    __pyx_1 = 0;
+    __pyx_5 = 0;
+    __pyx_t_1 = PyNumber_Remainder(__pyx_kp_41, ((PyObject *)__pyx_2)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 854; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+    __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 854; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyTuple_SET_ITEM(__pyx_3, 0, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_1 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 854; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+    __Pyx_Raise(__pyx_1, 0, 0);
+    Py_DECREF(__pyx_1); __pyx_1 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 854; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":855
+ *         if np.shape(x)[-1] != self.m:
+ *             raise ValueError("x must consist of vectors of length %d but has shape %s" % (self.m, np.shape(x)))
+ *         if p<1:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ *         if len(x.shape)==1:
+ */
+  __pyx_4 = (__pyx_v_p < 1);
+  if (__pyx_4) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":856
+ *             raise ValueError("x must consist of vectors of length %d but has shape %s" % (self.m, np.shape(x)))
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")             # <<<<<<<<<<<<<<
+ *         if len(x.shape)==1:
+ *             single = True
+ */
+    __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 856; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_kp_42);
+    PyTuple_SET_ITEM(__pyx_5, 0, __pyx_kp_42);
+    __pyx_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 856; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
+    __Pyx_Raise(__pyx_2, 0, 0);
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 856; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":857
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ *         if len(x.shape)==1:             # <<<<<<<<<<<<<<
+ *             single = True
+ *             x = x[np.newaxis,:]
+ */
+  __pyx_3 = PyObject_GetAttr(__pyx_v_x, __pyx_kp_shape); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 857; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_6 = PyObject_Length(__pyx_3); if (unlikely(__pyx_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 857; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_4 = (__pyx_6 == 1);
+  if (__pyx_4) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":858
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ *         if len(x.shape)==1:
+ *             single = True             # <<<<<<<<<<<<<<
+ *             x = x[np.newaxis,:]
+ *         else:
+ */
+    __pyx_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 858; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_v_single);
+    __pyx_v_single = __pyx_1;
+    __pyx_1 = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":859
+ *         if len(x.shape)==1:
+ *             single = True
+ *             x = x[np.newaxis,:]             # <<<<<<<<<<<<<<
+ *         else:
+ *             single = False
+ */
+    __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_2 = PyObject_GetAttr(__pyx_5, __pyx_kp_newaxis); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_5); __pyx_5 = 0;
+    __pyx_3 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_1 = PyTuple_New(2); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyTuple_SET_ITEM(__pyx_1, 0, __pyx_2);
+    PyTuple_SET_ITEM(__pyx_1, 1, __pyx_3);
+    __pyx_2 = 0;
+    __pyx_3 = 0;
+    __pyx_5 = PyObject_GetItem(__pyx_v_x, ((PyObject *)__pyx_1)); if (!__pyx_5) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 859; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+    Py_DECREF(__pyx_v_x);
+    __pyx_v_x = __pyx_5;
+    __pyx_5 = 0;
+    goto __pyx_L8;
+  }
+  /*else*/ {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":861
+ *             x = x[np.newaxis,:]
+ *         else:
+ *             single = False             # <<<<<<<<<<<<<<
+ *         retshape = np.shape(x)[:-1]
+ *         n = np.prod(retshape)
+ */
+    __pyx_2 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 861; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_v_single);
+    __pyx_v_single = __pyx_2;
+    __pyx_2 = 0;
+  }
+  __pyx_L8:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":862
+ *         else:
+ *             single = False
+ *         retshape = np.shape(x)[:-1]             # <<<<<<<<<<<<<<
+ *         n = np.prod(retshape)
+ *         xx = np.reshape(x,(n,self.m))
+ */
+  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 862; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = PyObject_GetAttr(__pyx_3, __pyx_kp_shape); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 862; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 862; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_v_x);
+  PyTuple_SET_ITEM(__pyx_5, 0, __pyx_v_x);
+  __pyx_2 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 862; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
+  __pyx_3 = PySequence_GetSlice(__pyx_2, 0, -1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 862; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(__pyx_v_retshape);
+  __pyx_v_retshape = __pyx_3;
+  __pyx_3 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":863
+ *             single = False
+ *         retshape = np.shape(x)[:-1]
+ *         n = np.prod(retshape)             # <<<<<<<<<<<<<<
+ *         xx = np.reshape(x,(n,self.m))
+ *         xx = np.ascontiguousarray(xx)
+ */
+  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 863; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_1, __pyx_kp_prod); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 863; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 863; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_v_retshape);
+  PyTuple_SET_ITEM(__pyx_2, 0, __pyx_v_retshape);
+  __pyx_3 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 863; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+  Py_DECREF(__pyx_v_n);
+  __pyx_v_n = __pyx_3;
+  __pyx_3 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":864
+ *         retshape = np.shape(x)[:-1]
+ *         n = np.prod(retshape)
+ *         xx = np.reshape(x,(n,self.m))             # <<<<<<<<<<<<<<
+ *         xx = np.ascontiguousarray(xx)
+ *         dd = np.empty((n,k),dtype=np.float)
+ */
+  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 864; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_1, __pyx_kp_reshape); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 864; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_2 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 864; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyTuple_New(2); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 864; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_v_n);
+  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_n);
+  PyTuple_SET_ITEM(__pyx_3, 1, __pyx_2);
+  __pyx_2 = 0;
+  __pyx_1 = PyTuple_New(2); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 864; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_v_x);
+  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_v_x);
+  PyTuple_SET_ITEM(__pyx_1, 1, ((PyObject *)__pyx_3));
+  __pyx_3 = 0;
+  __pyx_2 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 864; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  if (!(__Pyx_TypeTest(__pyx_2, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 864; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = ((PyArrayObject *)__pyx_2);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_xx);
+  __pyx_t_3 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_2, &__pyx_bstruct_xx, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0);
+  if (unlikely(__pyx_t_3 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_1, &__pyx_t_4, &__pyx_t_5);
+      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_xx, &__pyx_bstruct_xx, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
+          Py_XDECREF(__pyx_t_1); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_1, __pyx_t_4, __pyx_t_5);
+      }
+  }
+  __pyx_bstride_0_xx = __pyx_bstruct_xx.strides[0]; __pyx_bstride_1_xx = __pyx_bstruct_xx.strides[1];
+  __pyx_bshape_0_xx = __pyx_bstruct_xx.shape[0]; __pyx_bshape_1_xx = __pyx_bstruct_xx.shape[1];
+  if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 864; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_xx));
+  __pyx_v_xx = ((PyArrayObject *)__pyx_2);
+  __pyx_2 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":865
+ *         n = np.prod(retshape)
+ *         xx = np.reshape(x,(n,self.m))
+ *         xx = np.ascontiguousarray(xx)             # <<<<<<<<<<<<<<
+ *         dd = np.empty((n,k),dtype=np.float)
+ *         dd.fill(infinity)
+ */
+  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 865; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_3, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 865; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 865; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(((PyObject *)__pyx_v_xx));
+  PyTuple_SET_ITEM(__pyx_1, 0, ((PyObject *)__pyx_v_xx));
+  __pyx_2 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 865; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  if (!(__Pyx_TypeTest(__pyx_2, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 865; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = ((PyArrayObject *)__pyx_2);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_xx);
+  __pyx_t_3 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_2, &__pyx_bstruct_xx, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0);
+  if (unlikely(__pyx_t_3 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_1);
+      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_xx, &__pyx_bstruct_xx, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
+          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_1);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_1);
+      }
+  }
+  __pyx_bstride_0_xx = __pyx_bstruct_xx.strides[0]; __pyx_bstride_1_xx = __pyx_bstruct_xx.strides[1];
+  __pyx_bshape_0_xx = __pyx_bstruct_xx.shape[0]; __pyx_bshape_1_xx = __pyx_bstruct_xx.shape[1];
+  if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 865; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_xx));
+  __pyx_v_xx = ((PyArrayObject *)__pyx_2);
+  __pyx_2 = 0;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":260
- *                 n.split_dim = -1
- *                 n.start_idx = start_idx
- *                 n.end_idx = end_idx             # <<<<<<<<<<<<<<
- *                 return <innernode*>n
- * 
+  /* "/root/package/scipy/spatial/ckdtree.pyx":866
+ *         xx = np.reshape(x,(n,self.m))
+ *         xx = np.ascontiguousarray(xx)
+ *         dd = np.empty((n,k),dtype=np.float)             # <<<<<<<<<<<<<<
+ *         dd.fill(infinity)
+ *         ii = np.empty((n,k),dtype='i')
  */
-      __pyx_v_n->end_idx = __pyx_v_end_idx;
+  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 866; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_3, __pyx_kp_empty); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 866; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_1 = PyInt_FromLong(__pyx_v_k); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 866; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyTuple_New(2); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 866; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_v_n);
+  PyTuple_SET_ITEM(__pyx_2, 0, __pyx_v_n);
+  PyTuple_SET_ITEM(__pyx_2, 1, __pyx_1);
+  __pyx_1 = 0;
+  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 866; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_3, 0, ((PyObject *)__pyx_2));
+  __pyx_2 = 0;
+  __pyx_1 = PyDict_New(); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 866; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 866; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_7 = PyObject_GetAttr(__pyx_2, __pyx_kp_float); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 866; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  if (PyDict_SetItem(__pyx_1, __pyx_kp_dtype, __pyx_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 866; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_7); __pyx_7 = 0;
+  __pyx_2 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_3), ((PyObject *)__pyx_1)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 866; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  if (!(__Pyx_TypeTest(__pyx_2, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 866; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = ((PyArrayObject *)__pyx_2);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_dd);
+  __pyx_t_3 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_6, &__pyx_bstruct_dd, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0);
+  if (unlikely(__pyx_t_3 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_1, &__pyx_t_4, &__pyx_t_5);
+      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_dd, &__pyx_bstruct_dd, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
+          Py_XDECREF(__pyx_t_1); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_1, __pyx_t_4, __pyx_t_5);
+      }
+  }
+  __pyx_bstride_0_dd = __pyx_bstruct_dd.strides[0]; __pyx_bstride_1_dd = __pyx_bstruct_dd.strides[1];
+  __pyx_bshape_0_dd = __pyx_bstruct_dd.shape[0]; __pyx_bshape_1_dd = __pyx_bstruct_dd.shape[1];
+  if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 866; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_dd));
+  __pyx_v_dd = ((PyArrayObject *)__pyx_2);
+  __pyx_2 = 0;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":261
- *                 n.start_idx = start_idx
- *                 n.end_idx = end_idx
- *                 return <innernode*>n             # <<<<<<<<<<<<<<
- * 
- *             split = (maxval+minval)/2
+  /* "/root/package/scipy/spatial/ckdtree.pyx":867
+ *         xx = np.ascontiguousarray(xx)
+ *         dd = np.empty((n,k),dtype=np.float)
+ *         dd.fill(infinity)             # <<<<<<<<<<<<<<
+ *         ii = np.empty((n,k),dtype='i')
+ *         ii.fill(self.n)
  */
-      __pyx_r = ((struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *)__pyx_v_n);
-      goto __pyx_L0;
-      goto __pyx_L7;
-    }
-    __pyx_L7:;
+  __pyx_7 = PyObject_GetAttr(((PyObject *)__pyx_v_dd), __pyx_kp_fill); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 867; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyFloat_FromDouble(__pyx_v_5scipy_7spatial_7ckdtree_infinity); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 867; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 867; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_5);
+  __pyx_5 = 0;
+  __pyx_1 = PyObject_Call(__pyx_7, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 867; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_7); __pyx_7 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":263
- *                 return <innernode*>n
- * 
- *             split = (maxval+minval)/2             # <<<<<<<<<<<<<<
- * 
- *             p = start_idx
+  /* "/root/package/scipy/spatial/ckdtree.pyx":868
+ *         dd = np.empty((n,k),dtype=np.float)
+ *         dd.fill(infinity)
+ *         ii = np.empty((n,k),dtype='i')             # <<<<<<<<<<<<<<
+ *         ii.fill(self.n)
+ *         n_jobs = min(_check_n_jobs(n_jobs),n)
  */
-    __pyx_v_split = ((__pyx_v_maxval + __pyx_v_minval) / 2);
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 868; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_2, __pyx_kp_empty); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 868; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_7 = PyInt_FromLong(__pyx_v_k); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 868; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyTuple_New(2); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 868; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_v_n);
+  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_n);
+  PyTuple_SET_ITEM(__pyx_3, 1, __pyx_7);
+  __pyx_7 = 0;
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 868; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_1, 0, ((PyObject *)__pyx_3));
+  __pyx_3 = 0;
+  __pyx_2 = PyDict_New(); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 868; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_2, __pyx_kp_dtype, __pyx_kp_43) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 868; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_7 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_1), ((PyObject *)__pyx_2)); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 868; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+  if (!(__Pyx_TypeTest(__pyx_7, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 868; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = ((PyArrayObject *)__pyx_7);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_ii);
+  __pyx_t_3 = __Pyx_GetBuffer_int((PyObject*)__pyx_t_7, &__pyx_bstruct_ii, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0);
+  if (unlikely(__pyx_t_3 < 0)) 
+  {
+      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_1);
+      if (unlikely(__Pyx_GetBuffer_int((PyObject*)__pyx_v_ii, &__pyx_bstruct_ii, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
+          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_1);
+          __Pyx_RaiseBufferFallbackError();
+        } else {
+          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_1);
+      }
+  }
+  __pyx_bstride_0_ii = __pyx_bstruct_ii.strides[0]; __pyx_bstride_1_ii = __pyx_bstruct_ii.strides[1];
+  __pyx_bshape_0_ii = __pyx_bstruct_ii.shape[0]; __pyx_bshape_1_ii = __pyx_bstruct_ii.shape[1];
+  if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 868; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_ii));
+  __pyx_v_ii = ((PyArrayObject *)__pyx_7);
+  __pyx_7 = 0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":265
- *             split = (maxval+minval)/2
- * 
- *             p = start_idx             # <<<<<<<<<<<<<<
- *             q = end_idx-1
- *             while p<=q:
+  /* "/root/package/scipy/spatial/ckdtree.pyx":869
+ *         dd.fill(infinity)
+ *         ii = np.empty((n,k),dtype='i')
+ *         ii.fill(self.n)             # <<<<<<<<<<<<<<
+ *         n_jobs = min(_check_n_jobs(n_jobs),n)
+ *         if n_jobs<=1:
  */
-    __pyx_v_p = __pyx_v_start_idx;
+  __pyx_3 = PyObject_GetAttr(((PyObject *)__pyx_v_ii), __pyx_kp_fill); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 869; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 869; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 869; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_5);
+  __pyx_5 = 0;
+  __pyx_2 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 869; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":266
- * 
- *             p = start_idx
- *             q = end_idx-1             # <<<<<<<<<<<<<<
- *             while p<=q:
- *                 if self.raw_data[self.raw_indices[p]*self.m+d]<split:
+  /* "/root/package/scipy/spatial/ckdtree.pyx":870
+ *         ii = np.empty((n,k),dtype='i')
+ *         ii.fill(self.n)
+ *         n_jobs = min(_check_n_jobs(n_jobs),n)             # <<<<<<<<<<<<<<
+ *         if n_jobs<=1:
+ *             self._query_block(dd, ii, xx, 0, n, k, eps, p,
  */
-    __pyx_v_q = (__pyx_v_end_idx - 1);
+  __pyx_7 = __Pyx_GetName(__pyx_m, __pyx_kp__check_n_jobs); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 870; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyInt_FromLong(__pyx_v_n_jobs); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 870; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 870; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_5);
+  __pyx_5 = 0;
+  __pyx_1 = PyObject_Call(__pyx_7, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 870; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_7); __pyx_7 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  __pyx_2 = PyTuple_New(2); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 870; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_2, 0, __pyx_1);
+  Py_INCREF(__pyx_v_n);
+  PyTuple_SET_ITEM(__pyx_2, 1, __pyx_v_n);
+  __pyx_1 = 0;
+  __pyx_5 = PyObject_Call(__pyx_builtin_min, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 870; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+  __pyx_8 = __pyx_PyInt_int(__pyx_5); if (unlikely((__pyx_8 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 870; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  __pyx_v_n_jobs = __pyx_8;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":267
- *             p = start_idx
- *             q = end_idx-1
- *             while p<=q:             # <<<<<<<<<<<<<<
- *                 if self.raw_data[self.raw_indices[p]*self.m+d]<split:
- *                     p+=1
+  /* "/root/package/scipy/spatial/ckdtree.pyx":871
+ *         ii.fill(self.n)
+ *         n_jobs = min(_check_n_jobs(n_jobs),n)
+ *         if n_jobs<=1:             # <<<<<<<<<<<<<<
+ *             self._query_block(dd, ii, xx, 0, n, k, eps, p,
+ *                     distance_upper_bound)
  */
-    while (1) {
-      __pyx_1 = (__pyx_v_p <= __pyx_v_q);
-      if (!__pyx_1) break;
+  __pyx_4 = (__pyx_v_n_jobs <= 1);
+  if (__pyx_4) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":268
- *             q = end_idx-1
- *             while p<=q:
- *                 if self.raw_data[self.raw_indices[p]*self.m+d]<split:             # <<<<<<<<<<<<<<
- *                     p+=1
- *                 elif self.raw_data[self.raw_indices[q]*self.m+d]>=split:
+    /* "/root/package/scipy/spatial/ckdtree.pyx":872
+ *         n_jobs = min(_check_n_jobs(n_jobs),n)
+ *         if n_jobs<=1:
+ *             self._query_block(dd, ii, xx, 0, n, k, eps, p,             # <<<<<<<<<<<<<<
+ *                     distance_upper_bound)
+ *         else:
  */
-      __pyx_1 = ((__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_p]) * __pyx_v_self->m) + __pyx_v_d)]) < __pyx_v_split);
-      if (__pyx_1) {
+    __pyx_7 = PyObject_GetAttr(__pyx_v_self, __pyx_kp__query_block); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 872; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_3 = PyInt_FromLong(__pyx_v_k); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 872; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_1 = PyFloat_FromDouble(__pyx_v_eps); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 872; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_2 = PyFloat_FromDouble(__pyx_v_p); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 872; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":269
- *             while p<=q:
- *                 if self.raw_data[self.raw_indices[p]*self.m+d]<split:
- *                     p+=1             # <<<<<<<<<<<<<<
- *                 elif self.raw_data[self.raw_indices[q]*self.m+d]>=split:
- *                     q-=1
- */
-        __pyx_v_p += 1;
-        goto __pyx_L10;
-      }
+    /* "/root/package/scipy/spatial/ckdtree.pyx":873
+ *         if n_jobs<=1:
+ *             self._query_block(dd, ii, xx, 0, n, k, eps, p,
+ *                     distance_upper_bound)             # <<<<<<<<<<<<<<
+ *         else:
+ *             chunk = (n+n_jobs-1)//n_jobs
+ */
+    __pyx_5 = PyFloat_FromDouble(__pyx_v_distance_upper_bound); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 873; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_9 = PyTuple_New(9); if (unlikely(!__pyx_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 872; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(((PyObject *)__pyx_v_dd));
+    PyTuple_SET_ITEM(__pyx_9, 0, ((PyObject *)__pyx_v_dd));
+    Py_INCREF(((PyObject *)__pyx_v_ii));
+    PyTuple_SET_ITEM(__pyx_9, 1, ((PyObject *)__pyx_v_ii));
+    Py_INCREF(((PyObject *)__pyx_v_xx));
+    PyTuple_SET_ITEM(__pyx_9, 2, ((PyObject *)__pyx_v_xx));
+    Py_INCREF(__pyx_int_0);
+    PyTuple_SET_ITEM(__pyx_9, 3, __pyx_int_0);
+    Py_INCREF(__pyx_v_n);
+    PyTuple_SET_ITEM(__pyx_9, 4, __pyx_v_n);
+    PyTuple_SET_ITEM(__pyx_9, 5, __pyx_3);
+    PyTuple_SET_ITEM(__pyx_9, 6, __pyx_1);
+    PyTuple_SET_ITEM(__pyx_9, 7, __pyx_2);
+    PyTuple_SET_ITEM(__pyx_9, 8, __pyx_5);
+    __pyx_3 = 0;
+    __pyx_1 = 0;
+    __pyx_2 = 0;
+    __pyx_5 = 0;
+    __pyx_3 = PyObject_Call(__pyx_7, ((PyObject *)__pyx_9), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 872; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_7); __pyx_7 = 0;
+    Py_DECREF(((PyObject *)__pyx_9)); __pyx_9 = 0;
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    goto __pyx_L9;
+  }
+  /*else*/ {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":270
- *                 if self.raw_data[self.raw_indices[p]*self.m+d]<split:
- *                     p+=1
- *                 elif self.raw_data[self.raw_indices[q]*self.m+d]>=split:             # <<<<<<<<<<<<<<
- *                     q-=1
- *                 else:
+    /* "/root/package/scipy/spatial/ckdtree.pyx":875
+ *                     distance_upper_bound)
+ *         else:
+ *             chunk = (n+n_jobs-1)//n_jobs             # <<<<<<<<<<<<<<
+ *             blocks = [(dd, ii, xx, c, min(c+chunk,n), k, eps, p,
+ *                        distance_upper_bound) for c in range(0,n,chunk)]
  */
-      __pyx_1 = ((__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_q]) * __pyx_v_self->m) + __pyx_v_d)]) >= __pyx_v_split);
-      if (__pyx_1) {
+    __pyx_1 = PyInt_FromLong(__pyx_v_n_jobs); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 875; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyNumber_Add(__pyx_v_n, __pyx_1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 875; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_1); __pyx_1 = 0;
+    __pyx_t_4 = PyNumber_Subtract(__pyx_t_1, __pyx_int_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 875; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_2 = PyInt_FromLong(__pyx_v_n_jobs); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 875; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PyNumber_FloorDivide(__pyx_t_4, __pyx_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 875; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    Py_DECREF(__pyx_v_chunk);
+    __pyx_v_chunk = __pyx_t_1;
+    __pyx_t_1 = 0;
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":271
- *                     p+=1
- *                 elif self.raw_data[self.raw_indices[q]*self.m+d]>=split:
- *                     q-=1             # <<<<<<<<<<<<<<
- *                 else:
- *                     t = self.raw_indices[p]
+    /* "/root/package/scipy/spatial/ckdtree.pyx":876
+ *         else:
+ *             chunk = (n+n_jobs-1)//n_jobs
+ *             blocks = [(dd, ii, xx, c, min(c+chunk,n), k, eps, p,             # <<<<<<<<<<<<<<
+ *                        distance_upper_bound) for c in range(0,n,chunk)]
+ *             _run_threads(self._query_block, blocks, n_jobs)
+ */
+    __pyx_5 = PyList_New(0); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":877
+ *             chunk = (n+n_jobs-1)//n_jobs
+ *             blocks = [(dd, ii, xx, c, min(c+chunk,n), k, eps, p,
+ *                        distance_upper_bound) for c in range(0,n,chunk)]             # <<<<<<<<<<<<<<
+ *             _run_threads(self._query_block, blocks, n_jobs)
+ *         if single:
  */
-        __pyx_v_q -= 1;
-        goto __pyx_L10;
+    __pyx_7 = PyTuple_New(3); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_int_0);
+    PyTuple_SET_ITEM(__pyx_7, 0, __pyx_int_0);
+    Py_INCREF(__pyx_v_n);
+    PyTuple_SET_ITEM(__pyx_7, 1, __pyx_v_n);
+    Py_INCREF(__pyx_v_chunk);
+    PyTuple_SET_ITEM(__pyx_7, 2, __pyx_v_chunk);
+    __pyx_9 = PyObject_Call(__pyx_builtin_range, ((PyObject *)__pyx_7), NULL); if (unlikely(!__pyx_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_7)); __pyx_7 = 0;
+    if (PyList_CheckExact(__pyx_9) || PyTuple_CheckExact(__pyx_9)) {
+      __pyx_6 = 0; __pyx_3 = __pyx_9; Py_INCREF(__pyx_3);
+    } else {
+      __pyx_6 = -1; __pyx_3 = PyObject_GetIter(__pyx_9); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    Py_DECREF(__pyx_9); __pyx_9 = 0;
+    for (;;) {
+      if (likely(PyList_CheckExact(__pyx_3))) {
+        if (__pyx_6 >= PyList_GET_SIZE(__pyx_3)) break;
+        __pyx_1 = PyList_GET_ITEM(__pyx_3, __pyx_6); Py_INCREF(__pyx_1); __pyx_6++;
+      } else if (likely(PyTuple_CheckExact(__pyx_3))) {
+        if (__pyx_6 >= PyTuple_GET_SIZE(__pyx_3)) break;
+        __pyx_1 = PyTuple_GET_ITEM(__pyx_3, __pyx_6); Py_INCREF(__pyx_1); __pyx_6++;
+      } else {
+        __pyx_1 = PyIter_Next(__pyx_3);
+        if (!__pyx_1) {
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          break;
+        }
       }
-      /*else*/ {
+      __pyx_8 = __pyx_PyInt_int(__pyx_1); if (unlikely((__pyx_8 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_1); __pyx_1 = 0;
+      __pyx_v_c = __pyx_8;
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":273
- *                     q-=1
- *                 else:
- *                     t = self.raw_indices[p]             # <<<<<<<<<<<<<<
- *                     self.raw_indices[p] = self.raw_indices[q]
- *                     self.raw_indices[q] = t
+      /* "/root/package/scipy/spatial/ckdtree.pyx":876
+ *         else:
+ *             chunk = (n+n_jobs-1)//n_jobs
+ *             blocks = [(dd, ii, xx, c, min(c+chunk,n), k, eps, p,             # <<<<<<<<<<<<<<
+ *                        distance_upper_bound) for c in range(0,n,chunk)]
+ *             _run_threads(self._query_block, blocks, n_jobs)
+ */
+      __pyx_2 = PyInt_FromLong(__pyx_v_c); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_7 = PyInt_FromLong(__pyx_v_c); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_1 = PyNumber_Add(__pyx_7, __pyx_v_chunk); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_7); __pyx_7 = 0;
+      __pyx_9 = PyTuple_New(2); if (unlikely(!__pyx_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      PyTuple_SET_ITEM(__pyx_9, 0, __pyx_t_1);
+      Py_INCREF(__pyx_v_n);
+      PyTuple_SET_ITEM(__pyx_9, 1, __pyx_v_n);
+      __pyx_t_1 = 0;
+      __pyx_1 = PyObject_Call(__pyx_builtin_min, ((PyObject *)__pyx_9), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(((PyObject *)__pyx_9)); __pyx_9 = 0;
+      __pyx_7 = PyInt_FromLong(__pyx_v_k); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_9 = PyFloat_FromDouble(__pyx_v_eps); if (unlikely(!__pyx_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_10 = PyFloat_FromDouble(__pyx_v_p); if (unlikely(!__pyx_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":877
+ *             chunk = (n+n_jobs-1)//n_jobs
+ *             blocks = [(dd, ii, xx, c, min(c+chunk,n), k, eps, p,
+ *                        distance_upper_bound) for c in range(0,n,chunk)]             # <<<<<<<<<<<<<<
+ *             _run_threads(self._query_block, blocks, n_jobs)
+ *         if single:
  */
-        __pyx_v_t = (__pyx_v_self->raw_indices[__pyx_v_p]);
+      __pyx_11 = PyFloat_FromDouble(__pyx_v_distance_upper_bound); if (unlikely(!__pyx_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_12 = PyTuple_New(9); if (unlikely(!__pyx_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_INCREF(((PyObject *)__pyx_v_dd));
+      PyTuple_SET_ITEM(__pyx_12, 0, ((PyObject *)__pyx_v_dd));
+      Py_INCREF(((PyObject *)__pyx_v_ii));
+      PyTuple_SET_ITEM(__pyx_12, 1, ((PyObject *)__pyx_v_ii));
+      Py_INCREF(((PyObject *)__pyx_v_xx));
+      PyTuple_SET_ITEM(__pyx_12, 2, ((PyObject *)__pyx_v_xx));
+      PyTuple_SET_ITEM(__pyx_12, 3, __pyx_2);
+      PyTuple_SET_ITEM(__pyx_12, 4, __pyx_1);
+      PyTuple_SET_ITEM(__pyx_12, 5, __pyx_7);
+      PyTuple_SET_ITEM(__pyx_12, 6, __pyx_9);
+      PyTuple_SET_ITEM(__pyx_12, 7, __pyx_10);
+      PyTuple_SET_ITEM(__pyx_12, 8, __pyx_11);
+      __pyx_2 = 0;
+      __pyx_1 = 0;
+      __pyx_7 = 0;
+      __pyx_9 = 0;
+      __pyx_10 = 0;
+      __pyx_11 = 0;
+      __pyx_8 = PyList_Append(__pyx_5, (PyObject*)__pyx_12); if (unlikely(__pyx_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 876; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(((PyObject *)__pyx_12)); __pyx_12 = 0;
+    }
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    Py_DECREF(__pyx_v_blocks);
+    __pyx_v_blocks = ((PyObject *)__pyx_5);
+    __pyx_5 = 0;
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":274
- *                 else:
- *                     t = self.raw_indices[p]
- *                     self.raw_indices[p] = self.raw_indices[q]             # <<<<<<<<<<<<<<
- *                     self.raw_indices[q] = t
- *                     p+=1
+    /* "/root/package/scipy/spatial/ckdtree.pyx":878
+ *             blocks = [(dd, ii, xx, c, min(c+chunk,n), k, eps, p,
+ *                        distance_upper_bound) for c in range(0,n,chunk)]
+ *             _run_threads(self._query_block, blocks, n_jobs)             # <<<<<<<<<<<<<<
+ *         if single:
+ *             if k==1:
  */
-        (__pyx_v_self->raw_indices[__pyx_v_p]) = (__pyx_v_self->raw_indices[__pyx_v_q]);
+    __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp__run_threads); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 878; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_1 = PyObject_GetAttr(__pyx_v_self, __pyx_kp__query_block); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 878; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_7 = PyInt_FromLong(__pyx_v_n_jobs); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 878; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_9 = PyTuple_New(3); if (unlikely(!__pyx_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 878; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyTuple_SET_ITEM(__pyx_9, 0, __pyx_1);
+    Py_INCREF(__pyx_v_blocks);
+    PyTuple_SET_ITEM(__pyx_9, 1, __pyx_v_blocks);
+    PyTuple_SET_ITEM(__pyx_9, 2, __pyx_7);
+    __pyx_1 = 0;
+    __pyx_7 = 0;
+    __pyx_10 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_9), NULL); if (unlikely(!__pyx_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 878; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    Py_DECREF(((PyObject *)__pyx_9)); __pyx_9 = 0;
+    Py_DECREF(__pyx_10); __pyx_10 = 0;
+  }
+  __pyx_L9:;
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":275
- *                     t = self.raw_indices[p]
- *                     self.raw_indices[p] = self.raw_indices[q]
- *                     self.raw_indices[q] = t             # <<<<<<<<<<<<<<
- *                     p+=1
- *                     q-=1
+  /* "/root/package/scipy/spatial/ckdtree.pyx":879
+ *                        distance_upper_bound) for c in range(0,n,chunk)]
+ *             _run_threads(self._query_block, blocks, n_jobs)
+ *         if single:             # <<<<<<<<<<<<<<
+ *             if k==1:
+ *                 return dd[0,0], ii[0,0]
  */
-        (__pyx_v_self->raw_indices[__pyx_v_q]) = __pyx_v_t;
+  __pyx_4 = __Pyx_PyObject_IsTrue(__pyx_v_single); if (unlikely(__pyx_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 879; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_4) {
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":276
- *                     self.raw_indices[p] = self.raw_indices[q]
- *                     self.raw_indices[q] = t
- *                     p+=1             # <<<<<<<<<<<<<<
- *                     q-=1
- * 
+    /* "/root/package/scipy/spatial/ckdtree.pyx":880
+ *             _run_threads(self._query_block, blocks, n_jobs)
+ *         if single:
+ *             if k==1:             # <<<<<<<<<<<<<<
+ *                 return dd[0,0], ii[0,0]
+ *             else:
  */
-        __pyx_v_p += 1;
-
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":277
- *                     self.raw_indices[q] = t
- *                     p+=1
- *                     q-=1             # <<<<<<<<<<<<<<
- * 
- *             # slide midpoint if necessary
+    __pyx_4 = (__pyx_v_k == 1);
+    if (__pyx_4) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":881
+ *         if single:
+ *             if k==1:
+ *                 return dd[0,0], ii[0,0]             # <<<<<<<<<<<<<<
+ *             else:
+ *                 return dd[0], ii[0]
  */
-        __pyx_v_q -= 1;
+      __pyx_t_8 = 0;
+      __pyx_t_9 = 0;
+      __pyx_t_3 = -1;
+      if (__pyx_t_8 < 0) {
+        __pyx_t_8 += __pyx_bshape_0_dd;
+        if (unlikely(__pyx_t_8 < 0)) __pyx_t_3 = 0;
+      } else if (unlikely(__pyx_t_8 >= __pyx_bshape_0_dd)) __pyx_t_3 = 0;
+      if (__pyx_t_9 < 0) {
+        __pyx_t_9 += __pyx_bshape_1_dd;
+        if (unlikely(__pyx_t_9 < 0)) __pyx_t_3 = 1;
+      } else if (unlikely(__pyx_t_9 >= __pyx_bshape_1_dd)) __pyx_t_3 = 1;
+      if (unlikely(__pyx_t_3 != -1)) {
+          __Pyx_RaiseBufferIndexError(__pyx_t_3);
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 881; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       }
-      __pyx_L10:;
+      __pyx_11 = PyFloat_FromDouble((*__Pyx_BufPtrStrided2d(double *, __pyx_bstruct_dd.buf, __pyx_t_8, __pyx_bstride_0_dd, __pyx_t_9, __pyx_bstride_1_dd))); if (unlikely(!__pyx_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 881; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_10 = 0;
+      __pyx_t_11 = 0;
+      __pyx_t_3 = -1;
+      if (__pyx_t_10 < 0) {
+        __pyx_t_10 += __pyx_bshape_0_ii;
+        if (unlikely(__pyx_t_10 < 0)) __pyx_t_3 = 0;
+      } else if (unlikely(__pyx_t_10 >= __pyx_bshape_0_ii)) __pyx_t_3 = 0;
+      if (__pyx_t_11 < 0) {
+        __pyx_t_11 += __pyx_bshape_1_ii;
+        if (unlikely(__pyx_t_11 < 0)) __pyx_t_3 = 1;
+      } else if (unlikely(__pyx_t_11 >= __pyx_bshape_1_ii)) __pyx_t_3 = 1;
+      if (unlikely(__pyx_t_3 != -1)) {
+          __Pyx_RaiseBufferIndexError(__pyx_t_3);
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 881; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      }
+      __pyx_12 = PyInt_FromLong((*__Pyx_BufPtrStrided2d(int *, __pyx_bstruct_ii.buf, __pyx_t_10, __pyx_bstride_0_ii, __pyx_t_11, __pyx_bstride_1_ii))); if (unlikely(!__pyx_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 881; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_3 = PyTuple_New(2); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 881; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      PyTuple_SET_ITEM(__pyx_3, 0, __pyx_11);
+      PyTuple_SET_ITEM(__pyx_3, 1, __pyx_12);
+      __pyx_11 = 0;
+      __pyx_12 = 0;
+      __pyx_r = ((PyObject *)__pyx_3);
+      __pyx_3 = 0;
+      goto __pyx_L0;
+      goto __pyx_L13;
     }
+    /*else*/ {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":280
- * 
- *             # slide midpoint if necessary
- *             if p==start_idx:             # <<<<<<<<<<<<<<
- *                 # no points less than split
- *                 j = start_idx
+      /* "/root/package/scipy/spatial/ckdtree.pyx":883
+ *                 return dd[0,0], ii[0,0]
+ *             else:
+ *                 return dd[0], ii[0]             # <<<<<<<<<<<<<<
+ *         else:
+ *             if k==1:
  */
-    __pyx_1 = (__pyx_v_p == __pyx_v_start_idx);
-    if (__pyx_1) {
+      __pyx_5 = __Pyx_GetItemInt(((PyObject *)__pyx_v_dd), 0, 0); if (!__pyx_5) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 883; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_1 = __Pyx_GetItemInt(((PyObject *)__pyx_v_ii), 0, 0); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 883; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_7 = PyTuple_New(2); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 883; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      PyTuple_SET_ITEM(__pyx_7, 0, __pyx_5);
+      PyTuple_SET_ITEM(__pyx_7, 1, __pyx_1);
+      __pyx_5 = 0;
+      __pyx_1 = 0;
+      __pyx_r = ((PyObject *)__pyx_7);
+      __pyx_7 = 0;
+      goto __pyx_L0;
+    }
+    __pyx_L13:;
+    goto __pyx_L12;
+  }
+  /*else*/ {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":282
- *             if p==start_idx:
- *                 # no points less than split
- *                 j = start_idx             # <<<<<<<<<<<<<<
- *                 split = self.raw_data[self.raw_indices[j]*self.m+d]
- *                 for i in range(start_idx+1, end_idx):
+    /* "/root/package/scipy/spatial/ckdtree.pyx":885
+ *                 return dd[0], ii[0]
+ *         else:
+ *             if k==1:             # <<<<<<<<<<<<<<
+ *                 return np.reshape(dd[...,0],retshape), np.reshape(ii[...,0],retshape)
+ *             else:
  */
-      __pyx_v_j = __pyx_v_start_idx;
+    __pyx_4 = (__pyx_v_k == 1);
+    if (__pyx_4) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":283
- *                 # no points less than split
- *                 j = start_idx
- *                 split = self.raw_data[self.raw_indices[j]*self.m+d]             # <<<<<<<<<<<<<<
- *                 for i in range(start_idx+1, end_idx):
- *                     if self.raw_data[self.raw_indices[i]*self.m+d]<split:
+      /* "/root/package/scipy/spatial/ckdtree.pyx":886
+ *         else:
+ *             if k==1:
+ *                 return np.reshape(dd[...,0],retshape), np.reshape(ii[...,0],retshape)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 return np.reshape(dd,retshape+(k,)), np.reshape(ii,retshape+(k,))
  */
-      __pyx_v_split = (__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_j]) * __pyx_v_self->m) + __pyx_v_d)]);
+      __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_9 = PyObject_GetAttr(__pyx_2, __pyx_kp_reshape); if (unlikely(!__pyx_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_2); __pyx_2 = 0;
+      __pyx_10 = PyTuple_New(2); if (unlikely(!__pyx_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_INCREF(Py_Ellipsis);
+      PyTuple_SET_ITEM(__pyx_10, 0, Py_Ellipsis);
+      Py_INCREF(__pyx_int_0);
+      PyTuple_SET_ITEM(__pyx_10, 1, __pyx_int_0);
+      __pyx_11 = PyObject_GetItem(((PyObject *)__pyx_v_dd), ((PyObject *)__pyx_10)); if (!__pyx_11) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(((PyObject *)__pyx_10)); __pyx_10 = 0;
+      __pyx_12 = PyTuple_New(2); if (unlikely(!__pyx_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      PyTuple_SET_ITEM(__pyx_12, 0, __pyx_11);
+      Py_INCREF(__pyx_v_retshape);
+      PyTuple_SET_ITEM(__pyx_12, 1, __pyx_v_retshape);
+      __pyx_11 = 0;
+      __pyx_3 = PyObject_Call(__pyx_9, ((PyObject *)__pyx_12), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_9); __pyx_9 = 0;
+      Py_DECREF(((PyObject *)__pyx_12)); __pyx_12 = 0;
+      __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_1 = PyObject_GetAttr(__pyx_5, __pyx_kp_reshape); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_5); __pyx_5 = 0;
+      __pyx_7 = PyTuple_New(2); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_INCREF(Py_Ellipsis);
+      PyTuple_SET_ITEM(__pyx_7, 0, Py_Ellipsis);
+      Py_INCREF(__pyx_int_0);
+      PyTuple_SET_ITEM(__pyx_7, 1, __pyx_int_0);
+      __pyx_2 = PyObject_GetItem(((PyObject *)__pyx_v_ii), ((PyObject *)__pyx_7)); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(((PyObject *)__pyx_7)); __pyx_7 = 0;
+      __pyx_10 = PyTuple_New(2); if (unlikely(!__pyx_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      PyTuple_SET_ITEM(__pyx_10, 0, __pyx_2);
+      Py_INCREF(__pyx_v_retshape);
+      PyTuple_SET_ITEM(__pyx_10, 1, __pyx_v_retshape);
+      __pyx_2 = 0;
+      __pyx_11 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_10), NULL); if (unlikely(!__pyx_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_1); __pyx_1 = 0;
+      Py_DECREF(((PyObject *)__pyx_10)); __pyx_10 = 0;
+      __pyx_9 = PyTuple_New(2); if (unlikely(!__pyx_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 886; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      PyTuple_SET_ITEM(__pyx_9, 0, __pyx_3);
+      PyTuple_SET_ITEM(__pyx_9, 1, __pyx_11);
+      __pyx_3 = 0;
+      __pyx_11 = 0;
+      __pyx_r = ((PyObject *)__pyx_9);
+      __pyx_9 = 0;
+      goto __pyx_L0;
+      goto __pyx_L14;
+    }
+    /*else*/ {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":284
- *                 j = start_idx
- *                 split = self.raw_data[self.raw_indices[j]*self.m+d]
- *                 for i in range(start_idx+1, end_idx):             # <<<<<<<<<<<<<<
- *                     if self.raw_data[self.raw_indices[i]*self.m+d]<split:
- *                         j = i
+      /* "/root/package/scipy/spatial/ckdtree.pyx":888
+ *                 return np.reshape(dd[...,0],retshape), np.reshape(ii[...,0],retshape)
+ *             else:
+ *                 return np.reshape(dd,retshape+(k,)), np.reshape(ii,retshape+(k,))             # <<<<<<<<<<<<<<
+ * 
+ * 
  */
-      for (__pyx_v_i = (__pyx_v_start_idx + 1); __pyx_v_i < __pyx_v_end_idx; __pyx_v_i+=1) {
+      __pyx_12 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_5 = PyObject_GetAttr(__pyx_12, __pyx_kp_reshape); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_12); __pyx_12 = 0;
+      __pyx_7 = PyInt_FromLong(__pyx_v_k); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      PyTuple_SET_ITEM(__pyx_2, 0, __pyx_7);
+      __pyx_7 = 0;
+      __pyx_t_1 = PyNumber_Add(__pyx_v_retshape, ((PyObject *)__pyx_2)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+      __pyx_1 = PyTuple_New(2); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_INCREF(((PyObject *)__pyx_v_dd));
+      PyTuple_SET_ITEM(__pyx_1, 0, ((PyObject *)__pyx_v_dd));
+      PyTuple_SET_ITEM(__pyx_1, 1, __pyx_t_1);
+      __pyx_t_1 = 0;
+      __pyx_10 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_5); __pyx_5 = 0;
+      Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+      __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_11 = PyObject_GetAttr(__pyx_3, __pyx_kp_reshape); if (unlikely(!__pyx_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_3); __pyx_3 = 0;
+      __pyx_9 = PyInt_FromLong(__pyx_v_k); if (unlikely(!__pyx_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_12 = PyTuple_New(1); if (unlikely(!__pyx_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      PyTuple_SET_ITEM(__pyx_12, 0, __pyx_9);
+      __pyx_9 = 0;
+      __pyx_t_1 = PyNumber_Add(__pyx_v_retshape, ((PyObject *)__pyx_12)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(((PyObject *)__pyx_12)); __pyx_12 = 0;
+      __pyx_7 = PyTuple_New(2); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_INCREF(((PyObject *)__pyx_v_ii));
+      PyTuple_SET_ITEM(__pyx_7, 0, ((PyObject *)__pyx_v_ii));
+      PyTuple_SET_ITEM(__pyx_7, 1, __pyx_t_1);
+      __pyx_t_1 = 0;
+      __pyx_2 = PyObject_Call(__pyx_11, ((PyObject *)__pyx_7), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_11); __pyx_11 = 0;
+      Py_DECREF(((PyObject *)__pyx_7)); __pyx_7 = 0;
+      __pyx_5 = PyTuple_New(2); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      PyTuple_SET_ITEM(__pyx_5, 0, __pyx_10);
+      PyTuple_SET_ITEM(__pyx_5, 1, __pyx_2);
+      __pyx_10 = 0;
+      __pyx_2 = 0;
+      __pyx_r = ((PyObject *)__pyx_5);
+      __pyx_5 = 0;
+      goto __pyx_L0;
+    }
+    __pyx_L14:;
+  }
+  __pyx_L12:;
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":285
- *                 split = self.raw_data[self.raw_indices[j]*self.m+d]
- *                 for i in range(start_idx+1, end_idx):
- *                     if self.raw_data[self.raw_indices[i]*self.m+d]<split:             # <<<<<<<<<<<<<<
- *                         j = i
- *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
- */
-        __pyx_1 = ((__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_i]) * __pyx_v_self->m) + __pyx_v_d)]) < __pyx_v_split);
-        if (__pyx_1) {
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_1);
+  Py_XDECREF(__pyx_2);
+  Py_XDECREF(__pyx_3);
+  Py_XDECREF(__pyx_5);
+  Py_XDECREF(__pyx_7);
+  Py_XDECREF(__pyx_9);
+  Py_XDECREF(__pyx_10);
+  Py_XDECREF(__pyx_11);
+  Py_XDECREF(__pyx_12);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_ii);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_xx);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_dd);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.query");
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_ii);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_xx);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_dd);
+  __pyx_L2:;
+  Py_DECREF(__pyx_v_ii);
+  Py_DECREF(__pyx_v_dd);
+  Py_DECREF(__pyx_v_xx);
+  Py_DECREF(__pyx_v_single);
+  Py_DECREF(__pyx_v_retshape);
+  Py_DECREF(__pyx_v_n);
+  Py_DECREF(__pyx_v_chunk);
+  Py_DECREF(__pyx_v_blocks);
+  Py_DECREF(__pyx_v_x);
+  return __pyx_r;
+}
 
-          /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":286
- *                 for i in range(start_idx+1, end_idx):
- *                     if self.raw_data[self.raw_indices[i]*self.m+d]<split:
- *                         j = i             # <<<<<<<<<<<<<<
- *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
- *                 t = self.raw_indices[start_idx]
+/* "/root/package/scipy/spatial/ckdtree.pyx":892
+ * 
+ * 
+ *     cdef __query_ball_point_traverse_no_checking(cKDTree self,             # <<<<<<<<<<<<<<
+ *             object results, innernode* node):
+ *         cdef int i
  */
-          __pyx_v_j = __pyx_v_i;
 
-          /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":287
- *                     if self.raw_data[self.raw_indices[i]*self.m+d]<split:
- *                         j = i
- *                         split = self.raw_data[self.raw_indices[j]*self.m+d]             # <<<<<<<<<<<<<<
- *                 t = self.raw_indices[start_idx]
- *                 self.raw_indices[start_idx] = self.raw_indices[j]
- */
-          __pyx_v_split = (__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_j]) * __pyx_v_self->m) + __pyx_v_d)]);
-          goto __pyx_L14;
-        }
-        __pyx_L14:;
-      }
+static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_ball_point_traverse_no_checking(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, PyObject *__pyx_v_results, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node) {
+  int __pyx_v_i;
+  PyObject *__pyx_r;
+  int __pyx_1;
+  PyObject *__pyx_2 = 0;
+  PyObject *__pyx_3 = 0;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":288
- *                         j = i
- *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
- *                 t = self.raw_indices[start_idx]             # <<<<<<<<<<<<<<
- *                 self.raw_indices[start_idx] = self.raw_indices[j]
- *                 self.raw_indices[j] = t
+  /* "/root/package/scipy/spatial/ckdtree.pyx":895
+ *             object results, innernode* node):
+ *         cdef int i
+ *         for i in range(node.start_idx,node.end_idx):             # <<<<<<<<<<<<<<
+ *             results.append(self.raw_indices[i])
+ * 
  */
-      __pyx_v_t = (__pyx_v_self->raw_indices[__pyx_v_start_idx]);
+  __pyx_1 = __pyx_v_node->end_idx;
+  for (__pyx_v_i = __pyx_v_node->start_idx; __pyx_v_i < __pyx_1; __pyx_v_i+=1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":289
- *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
- *                 t = self.raw_indices[start_idx]
- *                 self.raw_indices[start_idx] = self.raw_indices[j]             # <<<<<<<<<<<<<<
- *                 self.raw_indices[j] = t
- *                 p = start_idx+1
+    /* "/root/package/scipy/spatial/ckdtree.pyx":896
+ *         cdef int i
+ *         for i in range(node.start_idx,node.end_idx):
+ *             results.append(self.raw_indices[i])             # <<<<<<<<<<<<<<
+ * 
+ *     cdef __query_ball_point_traverse_checking(cKDTree self,
  */
-      (__pyx_v_self->raw_indices[__pyx_v_start_idx]) = (__pyx_v_self->raw_indices[__pyx_v_j]);
+    __pyx_2 = PyInt_FromLong((__pyx_v_self->raw_indices[__pyx_v_i])); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 896; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_3 = __Pyx_PyObject_Append(__pyx_v_results, __pyx_2); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 896; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+  }
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":290
- *                 t = self.raw_indices[start_idx]
- *                 self.raw_indices[start_idx] = self.raw_indices[j]
- *                 self.raw_indices[j] = t             # <<<<<<<<<<<<<<
- *                 p = start_idx+1
- *                 q = start_idx
- */
-      (__pyx_v_self->raw_indices[__pyx_v_j]) = __pyx_v_t;
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_2);
+  Py_XDECREF(__pyx_3);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__query_ball_point_traverse_no_checking");
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":291
- *                 self.raw_indices[start_idx] = self.raw_indices[j]
- *                 self.raw_indices[j] = t
- *                 p = start_idx+1             # <<<<<<<<<<<<<<
- *                 q = start_idx
- *             elif p==end_idx:
+/* "/root/package/scipy/spatial/ckdtree.pyx":898
+ *             results.append(self.raw_indices[i])
+ * 
+ *     cdef __query_ball_point_traverse_checking(cKDTree self,             # <<<<<<<<<<<<<<
+ *             object results, innernode* node, double* maxes, double* mins,
+ *             double* x, double r_lo, double r_hi, double r, double p):
  */
-      __pyx_v_p = (__pyx_v_start_idx + 1);
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":292
- *                 self.raw_indices[j] = t
- *                 p = start_idx+1
- *                 q = start_idx             # <<<<<<<<<<<<<<
- *             elif p==end_idx:
- *                 # no points greater than split
- */
-      __pyx_v_q = __pyx_v_start_idx;
-      goto __pyx_L11;
-    }
+static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_ball_point_traverse_checking(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, PyObject *__pyx_v_results, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node, double *__pyx_v_maxes, double *__pyx_v_mins, double *__pyx_v_x, double __pyx_v_r_lo, double __pyx_v_r_hi, double __pyx_v_r, double __pyx_v_p) {
+  int __pyx_v_i;
+  struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *__pyx_v_lnode;
+  double *__pyx_v_rect;
+  PyObject *__pyx_r;
+  int __pyx_1;
+  PyObject *__pyx_2 = 0;
+  int __pyx_3;
+  PyObject *__pyx_4 = 0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":293
- *                 p = start_idx+1
- *                 q = start_idx
- *             elif p==end_idx:             # <<<<<<<<<<<<<<
- *                 # no points greater than split
- *                 j = end_idx-1
+  /* "/root/package/scipy/spatial/ckdtree.pyx":904
+ *         cdef leafnode* lnode
+ *         cdef double* rect
+ *         if _min_distance_point(x,maxes,mins,p,self.m)>=r_lo:             # <<<<<<<<<<<<<<
+ *             return
+ *         elif _max_distance_point(x,maxes,mins,p,self.m)<r_hi:
  */
-    __pyx_1 = (__pyx_v_p == __pyx_v_end_idx);
-    if (__pyx_1) {
+  __pyx_1 = (__pyx_f_5scipy_7spatial_7ckdtree__min_distance_point(__pyx_v_x, __pyx_v_maxes, __pyx_v_mins, __pyx_v_p, __pyx_v_self->m) >= __pyx_v_r_lo);
+  if (__pyx_1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":295
- *             elif p==end_idx:
- *                 # no points greater than split
- *                 j = end_idx-1             # <<<<<<<<<<<<<<
- *                 split = self.raw_data[self.raw_indices[j]*self.m+d]
- *                 for i in range(start_idx, end_idx-1):
+    /* "/root/package/scipy/spatial/ckdtree.pyx":905
+ *         cdef double* rect
+ *         if _min_distance_point(x,maxes,mins,p,self.m)>=r_lo:
+ *             return             # <<<<<<<<<<<<<<
+ *         elif _max_distance_point(x,maxes,mins,p,self.m)<r_hi:
+ *             self.__query_ball_point_traverse_no_checking(results, node)
  */
-      __pyx_v_j = (__pyx_v_end_idx - 1);
+    __pyx_r = Py_None; Py_INCREF(Py_None);
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":296
- *                 # no points greater than split
- *                 j = end_idx-1
- *                 split = self.raw_data[self.raw_indices[j]*self.m+d]             # <<<<<<<<<<<<<<
- *                 for i in range(start_idx, end_idx-1):
- *                     if self.raw_data[self.raw_indices[i]*self.m+d]>split:
+  /* "/root/package/scipy/spatial/ckdtree.pyx":906
+ *         if _min_distance_point(x,maxes,mins,p,self.m)>=r_lo:
+ *             return
+ *         elif _max_distance_point(x,maxes,mins,p,self.m)<r_hi:             # <<<<<<<<<<<<<<
+ *             self.__query_ball_point_traverse_no_checking(results, node)
+ *         elif node.split_dim==-1:
  */
-      __pyx_v_split = (__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_j]) * __pyx_v_self->m) + __pyx_v_d)]);
+  __pyx_1 = (__pyx_f_5scipy_7spatial_7ckdtree__max_distance_point(__pyx_v_x, __pyx_v_maxes, __pyx_v_mins, __pyx_v_p, __pyx_v_self->m) < __pyx_v_r_hi);
+  if (__pyx_1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":297
- *                 j = end_idx-1
- *                 split = self.raw_data[self.raw_indices[j]*self.m+d]
- *                 for i in range(start_idx, end_idx-1):             # <<<<<<<<<<<<<<
- *                     if self.raw_data[self.raw_indices[i]*self.m+d]>split:
- *                         j = i
+    /* "/root/package/scipy/spatial/ckdtree.pyx":907
+ *             return
+ *         elif _max_distance_point(x,maxes,mins,p,self.m)<r_hi:
+ *             self.__query_ball_point_traverse_no_checking(results, node)             # <<<<<<<<<<<<<<
+ *         elif node.split_dim==-1:
+ *             lnode = <leafnode*>node
  */
-      __pyx_3 = (__pyx_v_end_idx - 1);
-      for (__pyx_v_i = __pyx_v_start_idx; __pyx_v_i < __pyx_3; __pyx_v_i+=1) {
+    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_ball_point_traverse_no_checking(__pyx_v_self, __pyx_v_results, __pyx_v_node); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 907; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    goto __pyx_L3;
+  }
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":298
- *                 split = self.raw_data[self.raw_indices[j]*self.m+d]
- *                 for i in range(start_idx, end_idx-1):
- *                     if self.raw_data[self.raw_indices[i]*self.m+d]>split:             # <<<<<<<<<<<<<<
- *                         j = i
- *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
+  /* "/root/package/scipy/spatial/ckdtree.pyx":908
+ *         elif _max_distance_point(x,maxes,mins,p,self.m)<r_hi:
+ *             self.__query_ball_point_traverse_no_checking(results, node)
+ *         elif node.split_dim==-1:             # <<<<<<<<<<<<<<
+ *             lnode = <leafnode*>node
+ *             for i in range(lnode.start_idx,lnode.end_idx):
  */
-        __pyx_1 = ((__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_i]) * __pyx_v_self->m) + __pyx_v_d)]) > __pyx_v_split);
-        if (__pyx_1) {
+  __pyx_1 = (__pyx_v_node->split_dim == -1);
+  if (__pyx_1) {
 
-          /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":299
- *                 for i in range(start_idx, end_idx-1):
- *                     if self.raw_data[self.raw_indices[i]*self.m+d]>split:
- *                         j = i             # <<<<<<<<<<<<<<
- *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
- *                 t = self.raw_indices[end_idx-1]
+    /* "/root/package/scipy/spatial/ckdtree.pyx":909
+ *             self.__query_ball_point_traverse_no_checking(results, node)
+ *         elif node.split_dim==-1:
+ *             lnode = <leafnode*>node             # <<<<<<<<<<<<<<
+ *             for i in range(lnode.start_idx,lnode.end_idx):
+ *                 if _distance_p(self.raw_data+self.raw_indices[i]*self.m,
+ */
+    __pyx_v_lnode = ((struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *)__pyx_v_node);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":910
+ *         elif node.split_dim==-1:
+ *             lnode = <leafnode*>node
+ *             for i in range(lnode.start_idx,lnode.end_idx):             # <<<<<<<<<<<<<<
+ *                 if _distance_p(self.raw_data+self.raw_indices[i]*self.m,
+ *                         x,p,self.m,r)<=r:
+ */
+    __pyx_3 = __pyx_v_lnode->end_idx;
+    for (__pyx_v_i = __pyx_v_lnode->start_idx; __pyx_v_i < __pyx_3; __pyx_v_i+=1) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":912
+ *             for i in range(lnode.start_idx,lnode.end_idx):
+ *                 if _distance_p(self.raw_data+self.raw_indices[i]*self.m,
+ *                         x,p,self.m,r)<=r:             # <<<<<<<<<<<<<<
+ *                     results.append(self.raw_indices[i])
+ *         else:
  */
-          __pyx_v_j = __pyx_v_i;
+      __pyx_1 = (__pyx_f_5scipy_7spatial_7ckdtree__distance_p((__pyx_v_self->raw_data + ((__pyx_v_self->raw_indices[__pyx_v_i]) * __pyx_v_self->m)), __pyx_v_x, __pyx_v_p, __pyx_v_self->m, __pyx_v_r) <= __pyx_v_r);
+      if (__pyx_1) {
 
-          /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":300
- *                     if self.raw_data[self.raw_indices[i]*self.m+d]>split:
- *                         j = i
- *                         split = self.raw_data[self.raw_indices[j]*self.m+d]             # <<<<<<<<<<<<<<
- *                 t = self.raw_indices[end_idx-1]
- *                 self.raw_indices[end_idx-1] = self.raw_indices[j]
+        /* "/root/package/scipy/spatial/ckdtree.pyx":913
+ *                 if _distance_p(self.raw_data+self.raw_indices[i]*self.m,
+ *                         x,p,self.m,r)<=r:
+ *                     results.append(self.raw_indices[i])             # <<<<<<<<<<<<<<
+ *         else:
+ *             rect = _split_rectangle(maxes,mins,node.split_dim,node.split,self.m,1)
  */
-          __pyx_v_split = (__pyx_v_self->raw_data[(((__pyx_v_self->raw_indices[__pyx_v_j]) * __pyx_v_self->m) + __pyx_v_d)]);
-          goto __pyx_L17;
-        }
-        __pyx_L17:;
+        __pyx_2 = PyInt_FromLong((__pyx_v_self->raw_indices[__pyx_v_i])); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 913; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_4 = __Pyx_PyObject_Append(__pyx_v_results, __pyx_2); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 913; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        Py_DECREF(__pyx_2); __pyx_2 = 0;
+        Py_DECREF(__pyx_4); __pyx_4 = 0;
+        goto __pyx_L6;
       }
+      __pyx_L6:;
+    }
+    goto __pyx_L3;
+  }
+  /*else*/ {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":301
- *                         j = i
- *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
- *                 t = self.raw_indices[end_idx-1]             # <<<<<<<<<<<<<<
- *                 self.raw_indices[end_idx-1] = self.raw_indices[j]
- *                 self.raw_indices[j] = t
+    /* "/root/package/scipy/spatial/ckdtree.pyx":915
+ *                     results.append(self.raw_indices[i])
+ *         else:
+ *             rect = _split_rectangle(maxes,mins,node.split_dim,node.split,self.m,1)             # <<<<<<<<<<<<<<
+ *             self.__query_ball_point_traverse_checking(results,
+ *                     node.less, rect, rect+self.m, x, r_lo, r_hi, r, p)
  */
-      __pyx_v_t = (__pyx_v_self->raw_indices[(__pyx_v_end_idx - 1)]);
+    __pyx_v_rect = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes, __pyx_v_mins, __pyx_v_node->split_dim, __pyx_v_node->split, __pyx_v_self->m, 1);
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":302
- *                         split = self.raw_data[self.raw_indices[j]*self.m+d]
- *                 t = self.raw_indices[end_idx-1]
- *                 self.raw_indices[end_idx-1] = self.raw_indices[j]             # <<<<<<<<<<<<<<
- *                 self.raw_indices[j] = t
- *                 p = end_idx-1
+    /* "/root/package/scipy/spatial/ckdtree.pyx":917
+ *             rect = _split_rectangle(maxes,mins,node.split_dim,node.split,self.m,1)
+ *             self.__query_ball_point_traverse_checking(results,
+ *                     node.less, rect, rect+self.m, x, r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *             free(rect)
+ *             rect = _split_rectangle(maxes,mins,node.split_dim,node.split,self.m,0)
  */
-      (__pyx_v_self->raw_indices[(__pyx_v_end_idx - 1)]) = (__pyx_v_self->raw_indices[__pyx_v_j]);
+    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_ball_point_traverse_checking(__pyx_v_self, __pyx_v_results, __pyx_v_node->less, __pyx_v_rect, (__pyx_v_rect + __pyx_v_self->m), __pyx_v_x, __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 916; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":303
- *                 t = self.raw_indices[end_idx-1]
- *                 self.raw_indices[end_idx-1] = self.raw_indices[j]
- *                 self.raw_indices[j] = t             # <<<<<<<<<<<<<<
- *                 p = end_idx-1
- *                 q = end_idx-2
+    /* "/root/package/scipy/spatial/ckdtree.pyx":918
+ *             self.__query_ball_point_traverse_checking(results,
+ *                     node.less, rect, rect+self.m, x, r_lo, r_hi, r, p)
+ *             free(rect)             # <<<<<<<<<<<<<<
+ *             rect = _split_rectangle(maxes,mins,node.split_dim,node.split,self.m,0)
+ *             self.__query_ball_point_traverse_checking(results,
  */
-      (__pyx_v_self->raw_indices[__pyx_v_j]) = __pyx_v_t;
+    free(__pyx_v_rect);
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":304
- *                 self.raw_indices[end_idx-1] = self.raw_indices[j]
- *                 self.raw_indices[j] = t
- *                 p = end_idx-1             # <<<<<<<<<<<<<<
- *                 q = end_idx-2
- * 
+    /* "/root/package/scipy/spatial/ckdtree.pyx":919
+ *                     node.less, rect, rect+self.m, x, r_lo, r_hi, r, p)
+ *             free(rect)
+ *             rect = _split_rectangle(maxes,mins,node.split_dim,node.split,self.m,0)             # <<<<<<<<<<<<<<
+ *             self.__query_ball_point_traverse_checking(results,
+ *                     node.greater, rect, rect+self.m, x, r_lo, r_hi, r, p)
  */
-      __pyx_v_p = (__pyx_v_end_idx - 1);
+    __pyx_v_rect = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes, __pyx_v_mins, __pyx_v_node->split_dim, __pyx_v_node->split, __pyx_v_self->m, 0);
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":305
- *                 self.raw_indices[j] = t
- *                 p = end_idx-1
- *                 q = end_idx-2             # <<<<<<<<<<<<<<
+    /* "/root/package/scipy/spatial/ckdtree.pyx":921
+ *             rect = _split_rectangle(maxes,mins,node.split_dim,node.split,self.m,0)
+ *             self.__query_ball_point_traverse_checking(results,
+ *                     node.greater, rect, rect+self.m, x, r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *             free(rect)
  * 
- *             # construct new node representation
  */
-      __pyx_v_q = (__pyx_v_end_idx - 2);
-      goto __pyx_L11;
-    }
-    __pyx_L11:;
+    __pyx_4 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_ball_point_traverse_checking(__pyx_v_self, __pyx_v_results, __pyx_v_node->greater, __pyx_v_rect, (__pyx_v_rect + __pyx_v_self->m), __pyx_v_x, __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 920; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_4); __pyx_4 = 0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":308
+    /* "/root/package/scipy/spatial/ckdtree.pyx":922
+ *             self.__query_ball_point_traverse_checking(results,
+ *                     node.greater, rect, rect+self.m, x, r_lo, r_hi, r, p)
+ *             free(rect)             # <<<<<<<<<<<<<<
  * 
- *             # construct new node representation
- *             ni = <innernode*>stdlib.malloc(sizeof(innernode))             # <<<<<<<<<<<<<<
- * 
- *             mids = <double*>stdlib.malloc(sizeof(double)*self.m)
+ *     cdef object __query_ball_point(cKDTree self, double* x, double r,
  */
-    __pyx_v_ni = ((struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *)malloc((sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_innernode))));
+    free(__pyx_v_rect);
+  }
+  __pyx_L3:;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":310
- *             ni = <innernode*>stdlib.malloc(sizeof(innernode))
- * 
- *             mids = <double*>stdlib.malloc(sizeof(double)*self.m)             # <<<<<<<<<<<<<<
- *             for i in range(self.m):
- *                 mids[i] = maxes[i]
- */
-    __pyx_v_mids = ((double *)malloc(((sizeof(double)) * __pyx_v_self->m)));
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_2);
+  Py_XDECREF(__pyx_4);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__query_ball_point_traverse_checking");
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":311
+/* "/root/package/scipy/spatial/ckdtree.pyx":924
+ *             free(rect)
  * 
- *             mids = <double*>stdlib.malloc(sizeof(double)*self.m)
- *             for i in range(self.m):             # <<<<<<<<<<<<<<
- *                 mids[i] = maxes[i]
- *             mids[d] = split
+ *     cdef object __query_ball_point(cKDTree self, double* x, double r,             # <<<<<<<<<<<<<<
+ *             double p, double eps):
+ *         results = []
  */
-    __pyx_2 = __pyx_v_self->m;
-    for (__pyx_v_i = 0; __pyx_v_i < __pyx_2; __pyx_v_i+=1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":312
- *             mids = <double*>stdlib.malloc(sizeof(double)*self.m)
- *             for i in range(self.m):
- *                 mids[i] = maxes[i]             # <<<<<<<<<<<<<<
- *             mids[d] = split
- *             ni.less = self.__build(start_idx,p,mids,mins)
- */
-      (__pyx_v_mids[__pyx_v_i]) = (__pyx_v_maxes[__pyx_v_i]);
-    }
+static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_ball_point(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, double *__pyx_v_x, double __pyx_v_r, double __pyx_v_p, double __pyx_v_eps) {
+  PyObject *__pyx_v_results;
+  PyObject *__pyx_r;
+  PyObject *__pyx_1 = 0;
+  __pyx_v_results = Py_None; Py_INCREF(Py_None);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":926
+ *     cdef object __query_ball_point(cKDTree self, double* x, double r,
+ *             double p, double eps):
+ *         results = []             # <<<<<<<<<<<<<<
+ *         self.__query_ball_point_traverse_checking(results, self.tree,
+ *                 self.raw_maxes, self.raw_mins, x,
+ */
+  __pyx_1 = PyList_New(0); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 926; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_v_results);
+  __pyx_v_results = ((PyObject *)__pyx_1);
+  __pyx_1 = 0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":313
- *             for i in range(self.m):
- *                 mids[i] = maxes[i]
- *             mids[d] = split             # <<<<<<<<<<<<<<
- *             ni.less = self.__build(start_idx,p,mids,mins)
+  /* "/root/package/scipy/spatial/ckdtree.pyx":930
+ *                 self.raw_maxes, self.raw_mins, x,
+ *                 _distance_power(r/(1.+eps),p), _distance_power(r*(1.+eps),p),
+ *                 _distance_power(r,p), p)             # <<<<<<<<<<<<<<
+ *         return results
  * 
  */
-    (__pyx_v_mids[__pyx_v_d]) = __pyx_v_split;
+  __pyx_1 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_ball_point_traverse_checking(__pyx_v_self, __pyx_v_results, __pyx_v_self->tree, __pyx_v_self->raw_maxes, __pyx_v_self->raw_mins, __pyx_v_x, __pyx_f_5scipy_7spatial_7ckdtree__distance_power((__pyx_v_r / (1. + __pyx_v_eps)), __pyx_v_p), __pyx_f_5scipy_7spatial_7ckdtree__distance_power((__pyx_v_r * (1. + __pyx_v_eps)), __pyx_v_p), __pyx_f_5scipy_7spatial_7ckdtree__distance_power(__pyx_v_r, __pyx_v_p), __pyx_v_p); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 927; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":314
- *                 mids[i] = maxes[i]
- *             mids[d] = split
- *             ni.less = self.__build(start_idx,p,mids,mins)             # <<<<<<<<<<<<<<
+  /* "/root/package/scipy/spatial/ckdtree.pyx":931
+ *                 _distance_power(r/(1.+eps),p), _distance_power(r*(1.+eps),p),
+ *                 _distance_power(r,p), p)
+ *         return results             # <<<<<<<<<<<<<<
  * 
- *             for i in range(self.m):
+ *     def query_ball_point(cKDTree self, object x, double r, double p=2.,
  */
-    __pyx_v_ni->less = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__build(__pyx_v_self, __pyx_v_start_idx, __pyx_v_p, __pyx_v_mids, __pyx_v_mins);
+  Py_INCREF(__pyx_v_results);
+  __pyx_r = __pyx_v_results;
+  goto __pyx_L0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":316
- *             ni.less = self.__build(start_idx,p,mids,mins)
- * 
- *             for i in range(self.m):             # <<<<<<<<<<<<<<
- *                 mids[i] = mins[i]
- *             mids[d] = split
- */
-    __pyx_2 = __pyx_v_self->m;
-    for (__pyx_v_i = 0; __pyx_v_i < __pyx_2; __pyx_v_i+=1) {
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_1);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__query_ball_point");
+  __pyx_r = 0;
+  __pyx_L0:;
+  Py_DECREF(__pyx_v_results);
+  return __pyx_r;
+}
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":317
+/* "/root/package/scipy/spatial/ckdtree.pyx":933
+ *         return results
  * 
- *             for i in range(self.m):
- *                 mids[i] = mins[i]             # <<<<<<<<<<<<<<
- *             mids[d] = split
- *             ni.greater = self.__build(p,end_idx,maxes,mids)
+ *     def query_ball_point(cKDTree self, object x, double r, double p=2.,             # <<<<<<<<<<<<<<
+ *             double eps=0):
+ *         """Find all points within r of x
  */
-      (__pyx_v_mids[__pyx_v_i]) = (__pyx_v_mins[__pyx_v_i]);
+
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query_ball_point(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_query_ball_point[] = "Find all points within r of x\n\n        Parameters\n        ==========\n\n        x : array_like, shape tuple + (self.m,)\n            The point or points to search for neighbors of\n        r : positive float\n            The radius of points to return\n        p : float 1<=p<=infinity\n            Which Minkowski p-norm to use\n        eps : nonnegative float\n            Approximate search. Branches of the tree are not explored\n            if their nearest points are further than r/(1+eps), and branches\n            are added in bulk if their furthest points are nearer than r*(1+eps).\n\n        Returns\n        =======\n\n        results : list or array of lists\n            If x is a single point, returns a list of the indices of the neighbors\n            of x. If x is an array of points, returns an object array of shape tuple\n            containing lists of neighbors.\n        ";
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query_ball_point(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_x = 0;
+  double __pyx_v_r;
+  double __pyx_v_p;
+  double __pyx_v_eps;
+  PyArrayObject *__pyx_v_xx;
+  PyObject *__pyx_v_retshape;
+  PyObject *__pyx_v_result;
+  PyObject *__pyx_v_c;
+  Py_buffer __pyx_bstruct_xx;
+  Py_ssize_t __pyx_bstride_0_xx = 0;
+  Py_ssize_t __pyx_bshape_0_xx = 0;
+  PyObject *__pyx_r;
+  PyObject *__pyx_1 = 0;
+  PyObject *__pyx_2 = 0;
+  PyObject *__pyx_3 = 0;
+  int __pyx_4;
+  Py_ssize_t __pyx_5 = 0;
+  PyObject *__pyx_6 = 0;
+  PyObject *__pyx_7 = 0;
+  PyObject *__pyx_t_1 = NULL;
+  PyArrayObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_x,&__pyx_kp_r,&__pyx_kp_p,&__pyx_kp_eps,0};
+  __pyx_v_p = 2.;
+  __pyx_v_eps = ((double)0);
+  if (unlikely(__pyx_kwds)) {
+    PyObject* values[4] = {0,0,0,0};
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_x);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_kp_r);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("query_ball_point", 0, 2, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 933; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "query_ball_point") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 933; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
+    __pyx_v_x = values[0];
+    __pyx_v_r = __pyx_PyFloat_AsDouble(values[1]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 933; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    if (values[2]) {
+      __pyx_v_p = __pyx_PyFloat_AsDouble(values[2]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 933; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    if (values[3]) {
+      __pyx_v_eps = __pyx_PyFloat_AsDouble(values[3]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 934; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+  } else {
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  4:
+      __pyx_v_eps = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 934; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  3:
+      __pyx_v_p = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 933; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  2:
+      __pyx_v_r = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 933; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_x = PyTuple_GET_ITEM(__pyx_args, 0);
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("query_ball_point", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 933; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.query_ball_point");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  Py_INCREF(__pyx_v_x);
+  __pyx_v_xx = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_retshape = Py_None; Py_INCREF(Py_None);
+  __pyx_v_result = Py_None; Py_INCREF(Py_None);
+  __pyx_v_c = Py_None; Py_INCREF(Py_None);
+  __pyx_bstruct_xx.buf = NULL;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":318
- *             for i in range(self.m):
- *                 mids[i] = mins[i]
- *             mids[d] = split             # <<<<<<<<<<<<<<
- *             ni.greater = self.__build(p,end_idx,maxes,mids)
- * 
+  /* "/root/package/scipy/spatial/ckdtree.pyx":960
+ *         """
+ *         cdef np.ndarray[double, ndim=1] xx
+ *         x = np.asarray(x).astype(np.float)             # <<<<<<<<<<<<<<
+ *         if x.shape[-1]!=self.m:
+ *             raise ValueError("Searching for a %d-dimensional point in a %d-dimensional KDTree" % (x.shape[-1],self.m))
+ */
+  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 960; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_GetAttr(__pyx_1, __pyx_kp_asarray); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 960; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 960; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_v_x);
+  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_v_x);
+  __pyx_3 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 960; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  __pyx_2 = PyObject_GetAttr(__pyx_3, __pyx_kp_astype); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 960; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 960; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyObject_GetAttr(__pyx_1, __pyx_kp_float); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 960; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 960; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_3);
+  __pyx_3 = 0;
+  __pyx_3 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 960; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  Py_DECREF(__pyx_v_x);
+  __pyx_v_x = __pyx_3;
+  __pyx_3 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":961
+ *         cdef np.ndarray[double, ndim=1] xx
+ *         x = np.asarray(x).astype(np.float)
+ *         if x.shape[-1]!=self.m:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Searching for a %d-dimensional point in a %d-dimensional KDTree" % (x.shape[-1],self.m))
+ *         if p<1:
+ */
+  __pyx_2 = PyObject_GetAttr(__pyx_v_x, __pyx_kp_shape); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 961; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = __Pyx_GetItemInt(__pyx_2, -1, 0); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 961; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_3 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 961; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyObject_RichCompare(__pyx_1, __pyx_3, Py_NE); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 961; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_4 = __Pyx_PyObject_IsTrue(__pyx_2); if (unlikely(__pyx_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 961; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  if (__pyx_4) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":962
+ *         x = np.asarray(x).astype(np.float)
+ *         if x.shape[-1]!=self.m:
+ *             raise ValueError("Searching for a %d-dimensional point in a %d-dimensional KDTree" % (x.shape[-1],self.m))             # <<<<<<<<<<<<<<
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
  */
-    (__pyx_v_mids[__pyx_v_d]) = __pyx_v_split;
+    __pyx_1 = PyObject_GetAttr(__pyx_v_x, __pyx_kp_shape); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 962; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_3 = __Pyx_GetItemInt(__pyx_1, -1, 0); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 962; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_1); __pyx_1 = 0;
+    __pyx_2 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 962; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_1 = PyTuple_New(2); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 962; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyTuple_SET_ITEM(__pyx_1, 0, __pyx_3);
+    PyTuple_SET_ITEM(__pyx_1, 1, __pyx_2);
+    __pyx_3 = 0;
+    __pyx_2 = 0;
+    __pyx_t_1 = PyNumber_Remainder(__pyx_kp_44, ((PyObject *)__pyx_1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 962; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+    __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 962; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyTuple_SET_ITEM(__pyx_3, 0, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 962; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+    __Pyx_Raise(__pyx_2, 0, 0);
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 962; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":319
- *                 mids[i] = mins[i]
- *             mids[d] = split
- *             ni.greater = self.__build(p,end_idx,maxes,mids)             # <<<<<<<<<<<<<<
- * 
- *             stdlib.free(mids)
+  /* "/root/package/scipy/spatial/ckdtree.pyx":963
+ *         if x.shape[-1]!=self.m:
+ *             raise ValueError("Searching for a %d-dimensional point in a %d-dimensional KDTree" % (x.shape[-1],self.m))
+ *         if p<1:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ *         if len(x.shape)==1:
  */
-    __pyx_v_ni->greater = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__build(__pyx_v_self, __pyx_v_p, __pyx_v_end_idx, __pyx_v_maxes, __pyx_v_mids);
+  __pyx_4 = (__pyx_v_p < 1);
+  if (__pyx_4) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":321
- *             ni.greater = self.__build(p,end_idx,maxes,mids)
- * 
- *             stdlib.free(mids)             # <<<<<<<<<<<<<<
- * 
- *             ni.split_dim = d
+    /* "/root/package/scipy/spatial/ckdtree.pyx":964
+ *             raise ValueError("Searching for a %d-dimensional point in a %d-dimensional KDTree" % (x.shape[-1],self.m))
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")             # <<<<<<<<<<<<<<
+ *         if len(x.shape)==1:
+ *             xx = np.ascontiguousarray(x)
  */
-    free(__pyx_v_mids);
+    __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 964; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_kp_45);
+    PyTuple_SET_ITEM(__pyx_1, 0, __pyx_kp_45);
+    __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 964; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+    __Pyx_Raise(__pyx_3, 0, 0);
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 964; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":323
- *             stdlib.free(mids)
- * 
- *             ni.split_dim = d             # <<<<<<<<<<<<<<
- *             ni.split = split
- * 
+  /* "/root/package/scipy/spatial/ckdtree.pyx":965
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ *         if len(x.shape)==1:             # <<<<<<<<<<<<<<
+ *             xx = np.ascontiguousarray(x)
+ *             return self.__query_ball_point(<double*>xx.data, r, p, eps)
  */
-    __pyx_v_ni->split_dim = __pyx_v_d;
+  __pyx_2 = PyObject_GetAttr(__pyx_v_x, __pyx_kp_shape); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 965; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_Length(__pyx_2); if (unlikely(__pyx_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 965; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_4 = (__pyx_5 == 1);
+  if (__pyx_4) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":324
- * 
- *             ni.split_dim = d
- *             ni.split = split             # <<<<<<<<<<<<<<
- * 
- *             return ni
+    /* "/root/package/scipy/spatial/ckdtree.pyx":966
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ *         if len(x.shape)==1:
+ *             xx = np.ascontiguousarray(x)             # <<<<<<<<<<<<<<
+ *             return self.__query_ball_point(<double*>xx.data, r, p, eps)
+ *         else:
  */
-    __pyx_v_ni->split = __pyx_v_split;
+    __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_3 = PyObject_GetAttr(__pyx_1, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_1); __pyx_1 = 0;
+    __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_v_x);
+    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_v_x);
+    __pyx_1 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+    if (!(__Pyx_TypeTest(__pyx_1, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = ((PyArrayObject *)__pyx_1);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_xx);
+    __pyx_t_3 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_2, &__pyx_bstruct_xx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+    if (unlikely(__pyx_t_3 < 0)) 
+    {
+        PyErr_Fetch(&__pyx_t_1, &__pyx_t_4, &__pyx_t_5);
+        if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_xx, &__pyx_bstruct_xx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+            Py_XDECREF(__pyx_t_1); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+            __Pyx_RaiseBufferFallbackError();
+          } else {
+            PyErr_Restore(__pyx_t_1, __pyx_t_4, __pyx_t_5);
+        }
+    }
+    __pyx_bstride_0_xx = __pyx_bstruct_xx.strides[0];
+    __pyx_bshape_0_xx = __pyx_bstruct_xx.shape[0];
+    if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = 0;
+    Py_DECREF(((PyObject *)__pyx_v_xx));
+    __pyx_v_xx = ((PyArrayObject *)__pyx_1);
+    __pyx_1 = 0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":326
- *             ni.split = split
- * 
- *             return ni             # <<<<<<<<<<<<<<
- * 
- *     cdef __free_tree(cKDTree self, innernode* node):
+    /* "/root/package/scipy/spatial/ckdtree.pyx":967
+ *         if len(x.shape)==1:
+ *             xx = np.ascontiguousarray(x)
+ *             return self.__query_ball_point(<double*>xx.data, r, p, eps)             # <<<<<<<<<<<<<<
+ *         else:
+ *             retshape = x.shape[:-1]
  */
-    __pyx_r = __pyx_v_ni;
+    __pyx_3 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__query_ball_point(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), ((double *)__pyx_v_xx->data), __pyx_v_r, __pyx_v_p, __pyx_v_eps); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 967; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_3;
+    __pyx_3 = 0;
     goto __pyx_L0;
+    goto __pyx_L8;
   }
-  __pyx_L3:;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  return __pyx_r;
-}
+  /*else*/ {
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":328
- *             return ni
- * 
- *     cdef __free_tree(cKDTree self, innernode* node):             # <<<<<<<<<<<<<<
- *         if node.split_dim!=-1:
- *             self.__free_tree(node.less)
+    /* "/root/package/scipy/spatial/ckdtree.pyx":969
+ *             return self.__query_ball_point(<double*>xx.data, r, p, eps)
+ *         else:
+ *             retshape = x.shape[:-1]             # <<<<<<<<<<<<<<
+ *             result = np.empty(retshape,dtype=np.object)
+ *             for c in np.ndindex(retshape):
  */
+    __pyx_2 = PyObject_GetAttr(__pyx_v_x, __pyx_kp_shape); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 969; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_1 = PySequence_GetSlice(__pyx_2, 0, -1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 969; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    Py_DECREF(__pyx_v_retshape);
+    __pyx_v_retshape = __pyx_1;
+    __pyx_1 = 0;
 
-static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___free_tree(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node) {
-  PyObject *__pyx_r;
-  int __pyx_1;
-  PyObject *__pyx_2 = 0;
-
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":329
- * 
- *     cdef __free_tree(cKDTree self, innernode* node):
- *         if node.split_dim!=-1:             # <<<<<<<<<<<<<<
- *             self.__free_tree(node.less)
- *             self.__free_tree(node.greater)
+    /* "/root/package/scipy/spatial/ckdtree.pyx":970
+ *         else:
+ *             retshape = x.shape[:-1]
+ *             result = np.empty(retshape,dtype=np.object)             # <<<<<<<<<<<<<<
+ *             for c in np.ndindex(retshape):
+ *                 xx = np.ascontiguousarray(x[c])
  */
-  __pyx_1 = (__pyx_v_node->split_dim != -1);
-  if (__pyx_1) {
+    __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 970; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_2 = PyObject_GetAttr(__pyx_3, __pyx_kp_empty); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 970; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 970; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_v_retshape);
+    PyTuple_SET_ITEM(__pyx_1, 0, __pyx_v_retshape);
+    __pyx_3 = PyDict_New(); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 970; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 970; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_7 = PyObject_GetAttr(__pyx_6, __pyx_kp_object); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 970; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_6); __pyx_6 = 0;
+    if (PyDict_SetItem(__pyx_3, __pyx_kp_dtype, __pyx_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 970; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_7); __pyx_7 = 0;
+    __pyx_6 = PyEval_CallObjectWithKeywords(__pyx_2, ((PyObject *)__pyx_1), ((PyObject *)__pyx_3)); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 970; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+    Py_DECREF(__pyx_v_result);
+    __pyx_v_result = __pyx_6;
+    __pyx_6 = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":971
+ *             retshape = x.shape[:-1]
+ *             result = np.empty(retshape,dtype=np.object)
+ *             for c in np.ndindex(retshape):             # <<<<<<<<<<<<<<
+ *                 xx = np.ascontiguousarray(x[c])
+ *                 result[c] = self.__query_ball_point(<double*>xx.data, r, p, eps)
+ */
+    __pyx_7 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 971; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_2 = PyObject_GetAttr(__pyx_7, __pyx_kp_ndindex); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 971; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_7); __pyx_7 = 0;
+    __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 971; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_v_retshape);
+    PyTuple_SET_ITEM(__pyx_1, 0, __pyx_v_retshape);
+    __pyx_3 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 971; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+    if (PyList_CheckExact(__pyx_3) || PyTuple_CheckExact(__pyx_3)) {
+      __pyx_5 = 0; __pyx_6 = __pyx_3; Py_INCREF(__pyx_6);
+    } else {
+      __pyx_5 = -1; __pyx_6 = PyObject_GetIter(__pyx_3); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 971; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    for (;;) {
+      if (likely(PyList_CheckExact(__pyx_6))) {
+        if (__pyx_5 >= PyList_GET_SIZE(__pyx_6)) break;
+        __pyx_7 = PyList_GET_ITEM(__pyx_6, __pyx_5); Py_INCREF(__pyx_7); __pyx_5++;
+      } else if (likely(PyTuple_CheckExact(__pyx_6))) {
+        if (__pyx_5 >= PyTuple_GET_SIZE(__pyx_6)) break;
+        __pyx_7 = PyTuple_GET_ITEM(__pyx_6, __pyx_5); Py_INCREF(__pyx_7); __pyx_5++;
+      } else {
+        __pyx_7 = PyIter_Next(__pyx_6);
+        if (!__pyx_7) {
+          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 971; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          break;
+        }
+      }
+      Py_DECREF(__pyx_v_c);
+      __pyx_v_c = __pyx_7;
+      __pyx_7 = 0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":330
- *     cdef __free_tree(cKDTree self, innernode* node):
- *         if node.split_dim!=-1:
- *             self.__free_tree(node.less)             # <<<<<<<<<<<<<<
- *             self.__free_tree(node.greater)
- *         stdlib.free(node)
+      /* "/root/package/scipy/spatial/ckdtree.pyx":972
+ *             result = np.empty(retshape,dtype=np.object)
+ *             for c in np.ndindex(retshape):
+ *                 xx = np.ascontiguousarray(x[c])             # <<<<<<<<<<<<<<
+ *                 result[c] = self.__query_ball_point(<double*>xx.data, r, p, eps)
+ *             return result
  */
-    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__free_tree(__pyx_v_self, __pyx_v_node->less); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
+      __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 972; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_1 = PyObject_GetAttr(__pyx_2, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 972; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_2); __pyx_2 = 0;
+      __pyx_3 = PyObject_GetItem(__pyx_v_x, __pyx_v_c); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 972; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_7 = PyTuple_New(1); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 972; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      PyTuple_SET_ITEM(__pyx_7, 0, __pyx_3);
+      __pyx_3 = 0;
+      __pyx_2 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_7), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 972; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_1); __pyx_1 = 0;
+      Py_DECREF(((PyObject *)__pyx_7)); __pyx_7 = 0;
+      if (!(__Pyx_TypeTest(__pyx_2, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 972; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = ((PyArrayObject *)__pyx_2);
+      __Pyx_SafeReleaseBuffer(&__pyx_bstruct_xx);
+      __pyx_t_3 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_2, &__pyx_bstruct_xx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+      if (unlikely(__pyx_t_3 < 0)) 
+      {
+          PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_1);
+          if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_xx, &__pyx_bstruct_xx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+              Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_1);
+              __Pyx_RaiseBufferFallbackError();
+            } else {
+              PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_1);
+          }
+      }
+      __pyx_bstride_0_xx = __pyx_bstruct_xx.strides[0];
+      __pyx_bshape_0_xx = __pyx_bstruct_xx.shape[0];
+      if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 972; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = 0;
+      Py_DECREF(((PyObject *)__pyx_v_xx));
+      __pyx_v_xx = ((PyArrayObject *)__pyx_2);
+      __pyx_2 = 0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":331
- *         if node.split_dim!=-1:
- *             self.__free_tree(node.less)
- *             self.__free_tree(node.greater)             # <<<<<<<<<<<<<<
- *         stdlib.free(node)
+      /* "/root/package/scipy/spatial/ckdtree.pyx":973
+ *             for c in np.ndindex(retshape):
+ *                 xx = np.ascontiguousarray(x[c])
+ *                 result[c] = self.__query_ball_point(<double*>xx.data, r, p, eps)             # <<<<<<<<<<<<<<
+ *             return result
  * 
  */
-    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__free_tree(__pyx_v_self, __pyx_v_node->greater); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
+      __pyx_3 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__query_ball_point(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), ((double *)__pyx_v_xx->data), __pyx_v_r, __pyx_v_p, __pyx_v_eps); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 973; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (PyObject_SetItem(__pyx_v_result, __pyx_v_c, __pyx_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 973; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_3); __pyx_3 = 0;
+    }
+    Py_DECREF(__pyx_6); __pyx_6 = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":332
- *             self.__free_tree(node.less)
- *             self.__free_tree(node.greater)
- *         stdlib.free(node)             # <<<<<<<<<<<<<<
+    /* "/root/package/scipy/spatial/ckdtree.pyx":974
+ *                 xx = np.ascontiguousarray(x[c])
+ *                 result[c] = self.__query_ball_point(<double*>xx.data, r, p, eps)
+ *             return result             # <<<<<<<<<<<<<<
+ * 
  * 
- *     def __dealloc__(cKDTree self):
  */
-  free(__pyx_v_node);
+    Py_INCREF(__pyx_v_result);
+    __pyx_r = __pyx_v_result;
+    goto __pyx_L0;
+  }
+  __pyx_L8:;
 
   __pyx_r = Py_None; Py_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
+  Py_XDECREF(__pyx_1);
   Py_XDECREF(__pyx_2);
-  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__free_tree");
-  __pyx_r = 0;
+  Py_XDECREF(__pyx_3);
+  Py_XDECREF(__pyx_6);
+  Py_XDECREF(__pyx_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_xx);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.query_ball_point");
+  __pyx_r = NULL;
+  goto __pyx_L2;
   __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_xx);
+  __pyx_L2:;
+  Py_DECREF(__pyx_v_xx);
+  Py_DECREF(__pyx_v_retshape);
+  Py_DECREF(__pyx_v_result);
+  Py_DECREF(__pyx_v_c);
+  Py_DECREF(__pyx_v_x);
   return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":334
- *         stdlib.free(node)
+/* "/root/package/scipy/spatial/ckdtree.pyx":977
  * 
- *     def __dealloc__(cKDTree self):             # <<<<<<<<<<<<<<
- *         if <int>(self.tree) == 0:
- *             # should happen only if __init__ was never called
+ * 
+ *     cdef __query_ball_tree_traverse_no_checking(cKDTree self, cKDTree other,             # <<<<<<<<<<<<<<
+ *             object results, innernode* node1, innernode* node2):
+ *         cdef int i, j
  */
 
-static void __pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___dealloc__(PyObject *__pyx_v_self) {
+static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_ball_tree_traverse_no_checking(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_other, PyObject *__pyx_v_results, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node1, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node2) {
+  int __pyx_v_i;
+  int __pyx_v_j;
+  PyObject *__pyx_v_l;
+  PyObject *__pyx_r;
   int __pyx_1;
-  PyObject *__pyx_2 = 0;
+  __pyx_t_5numpy_int32_t __pyx_2;
+  PyObject *__pyx_3 = 0;
+  int __pyx_4;
+  PyObject *__pyx_5 = 0;
+  __pyx_v_l = Py_None; Py_INCREF(Py_None);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":980
+ *             object results, innernode* node1, innernode* node2):
+ *         cdef int i, j
+ *         for i in range(node1.start_idx,node1.end_idx):             # <<<<<<<<<<<<<<
+ *             l = results[self.raw_indices[i]]
+ *             for j in range(node2.start_idx,node2.end_idx):
+ */
+  __pyx_1 = __pyx_v_node1->end_idx;
+  for (__pyx_v_i = __pyx_v_node1->start_idx; __pyx_v_i < __pyx_1; __pyx_v_i+=1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":981
+ *         cdef int i, j
+ *         for i in range(node1.start_idx,node1.end_idx):
+ *             l = results[self.raw_indices[i]]             # <<<<<<<<<<<<<<
+ *             for j in range(node2.start_idx,node2.end_idx):
+ *                 l.append(other.raw_indices[j])
+ */
+    __pyx_2 = (__pyx_v_self->raw_indices[__pyx_v_i]);
+    __pyx_3 = __Pyx_GetItemInt(__pyx_v_results, __pyx_2, 0); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 981; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_v_l);
+    __pyx_v_l = __pyx_3;
+    __pyx_3 = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":335
+    /* "/root/package/scipy/spatial/ckdtree.pyx":982
+ *         for i in range(node1.start_idx,node1.end_idx):
+ *             l = results[self.raw_indices[i]]
+ *             for j in range(node2.start_idx,node2.end_idx):             # <<<<<<<<<<<<<<
+ *                 l.append(other.raw_indices[j])
  * 
- *     def __dealloc__(cKDTree self):
- *         if <int>(self.tree) == 0:             # <<<<<<<<<<<<<<
- *             # should happen only if __init__ was never called
- *             return
  */
-  __pyx_1 = (((int)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree) == 0);
-  if (__pyx_1) {
+    __pyx_4 = __pyx_v_node2->end_idx;
+    for (__pyx_v_j = __pyx_v_node2->start_idx; __pyx_v_j < __pyx_4; __pyx_v_j+=1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":337
- *         if <int>(self.tree) == 0:
- *             # should happen only if __init__ was never called
- *             return             # <<<<<<<<<<<<<<
- *         self.__free_tree(self.tree)
+      /* "/root/package/scipy/spatial/ckdtree.pyx":983
+ *             l = results[self.raw_indices[i]]
+ *             for j in range(node2.start_idx,node2.end_idx):
+ *                 l.append(other.raw_indices[j])             # <<<<<<<<<<<<<<
  * 
+ *     cdef __query_ball_tree_traverse_checking(cKDTree self, cKDTree other,
  */
-    goto __pyx_L0;
-    goto __pyx_L5;
+      __pyx_3 = PyInt_FromLong((__pyx_v_other->raw_indices[__pyx_v_j])); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 983; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_5 = __Pyx_PyObject_Append(__pyx_v_l, __pyx_3); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 983; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_3); __pyx_3 = 0;
+      Py_DECREF(__pyx_5); __pyx_5 = 0;
+    }
   }
-  __pyx_L5:;
-
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":338
- *             # should happen only if __init__ was never called
- *             return
- *         self.__free_tree(self.tree)             # <<<<<<<<<<<<<<
- * 
- *     cdef void __query(cKDTree self,
- */
-  __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__free_tree(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
 
+  __pyx_r = Py_None; Py_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  Py_XDECREF(__pyx_2);
-  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__dealloc__");
+  Py_XDECREF(__pyx_3);
+  Py_XDECREF(__pyx_5);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__query_ball_tree_traverse_no_checking");
+  __pyx_r = 0;
   __pyx_L0:;
+  Py_DECREF(__pyx_v_l);
+  return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":340
- *         self.__free_tree(self.tree)
+/* "/root/package/scipy/spatial/ckdtree.pyx":985
+ *                 l.append(other.raw_indices[j])
  * 
- *     cdef void __query(cKDTree self,             # <<<<<<<<<<<<<<
- *             double*result_distances,
- *             int*result_indices,
+ *     cdef __query_ball_tree_traverse_checking(cKDTree self, cKDTree other,             # <<<<<<<<<<<<<<
+ *             object results,
+ *             innernode* node1, double* maxes1, double* mins1,
  */
 
-static  void __pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, double *__pyx_v_result_distances, int *__pyx_v_result_indices, double *__pyx_v_x, int __pyx_v_k, double __pyx_v_eps, double __pyx_v_p, double __pyx_v_distance_upper_bound) {
-  struct __pyx_t_5scipy_7spatial_7ckdtree_heap __pyx_v_q;
-  struct __pyx_t_5scipy_7spatial_7ckdtree_heap __pyx_v_neighbors;
+static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_ball_tree_traverse_checking(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_other, PyObject *__pyx_v_results, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node1, double *__pyx_v_maxes1, double *__pyx_v_mins1, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node2, double *__pyx_v_maxes2, double *__pyx_v_mins2, double __pyx_v_r_lo, double __pyx_v_r_hi, double __pyx_v_r, double __pyx_v_p) {
   int __pyx_v_i;
-  double __pyx_v_t;
-  struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo *__pyx_v_inf;
-  struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo *__pyx_v_inf2;
-  double __pyx_v_d;
-  double __pyx_v_epsfac;
-  double __pyx_v_min_distance;
-  double __pyx_v_far_min_distance;
-  struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_v_it;
-  struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_v_it2;
-  struct __pyx_t_5scipy_7spatial_7ckdtree_heapitem __pyx_v_neighbor;
-  struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *__pyx_v_node;
-  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_inode;
-  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_near;
-  struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_far;
-  PyObject *__pyx_1 = 0;
-  int __pyx_2;
+  int __pyx_v_j;
+  double *__pyx_v_rect1;
+  double *__pyx_v_rect2;
+  PyObject *__pyx_v_l;
+  PyObject *__pyx_r;
+  int __pyx_1;
+  PyObject *__pyx_2 = 0;
   int __pyx_3;
+  __pyx_t_5numpy_int32_t __pyx_4;
+  int __pyx_5;
+  PyObject *__pyx_6 = 0;
+  __pyx_v_l = Py_None; Py_INCREF(Py_None);
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":371
- *         #  distances between the nearest side of the cell and the target
- *         #  the head node of the cell
- *         heapcreate(&q,12)             # <<<<<<<<<<<<<<
- * 
- *         # priority queue for the nearest neighbors
- */
-  __pyx_1 = __pyx_f_5scipy_7spatial_7ckdtree_heapcreate((&__pyx_v_q), 12); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":376
- *         # furthest known neighbor first
- *         # entries are (-distance**p, i)
- *         heapcreate(&neighbors,k)             # <<<<<<<<<<<<<<
- * 
- *         # set up first nodeinfo
+  /* "/root/package/scipy/spatial/ckdtree.pyx":993
+ *         cdef double* rect1
+ *         cdef double* rect2
+ *         if _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)>r_lo:             # <<<<<<<<<<<<<<
+ *             return
+ *         elif _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)<r_hi:
  */
-  __pyx_1 = __pyx_f_5scipy_7spatial_7ckdtree_heapcreate((&__pyx_v_neighbors), __pyx_v_k); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_1 = (__pyx_f_5scipy_7spatial_7ckdtree__min_distance_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_p, __pyx_v_self->m) > __pyx_v_r_lo);
+  if (__pyx_1) {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":379
- * 
- *         # set up first nodeinfo
- *         inf = <nodeinfo*>stdlib.malloc(sizeof(nodeinfo)+self.m*sizeof(double))             # <<<<<<<<<<<<<<
- *         inf.node = self.tree
- *         for i in range(self.m):
+    /* "/root/package/scipy/spatial/ckdtree.pyx":994
+ *         cdef double* rect2
+ *         if _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)>r_lo:
+ *             return             # <<<<<<<<<<<<<<
+ *         elif _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)<r_hi:
+ *             self.__query_ball_tree_traverse_no_checking(other, results,
  */
-  __pyx_v_inf = ((struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo *)malloc(((sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo)) + (__pyx_v_self->m * (sizeof(double))))));
+    __pyx_r = Py_None; Py_INCREF(Py_None);
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":380
- *         # set up first nodeinfo
- *         inf = <nodeinfo*>stdlib.malloc(sizeof(nodeinfo)+self.m*sizeof(double))
- *         inf.node = self.tree             # <<<<<<<<<<<<<<
- *         for i in range(self.m):
- *             inf.side_distances[i] = 0
+  /* "/root/package/scipy/spatial/ckdtree.pyx":995
+ *         if _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)>r_lo:
+ *             return
+ *         elif _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)<r_hi:             # <<<<<<<<<<<<<<
+ *             self.__query_ball_tree_traverse_no_checking(other, results,
+ *                     node1, node2)
  */
-  __pyx_v_inf->node = __pyx_v_self->tree;
+  __pyx_1 = (__pyx_f_5scipy_7spatial_7ckdtree__max_distance_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_p, __pyx_v_self->m) < __pyx_v_r_hi);
+  if (__pyx_1) {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":381
- *         inf = <nodeinfo*>stdlib.malloc(sizeof(nodeinfo)+self.m*sizeof(double))
- *         inf.node = self.tree
- *         for i in range(self.m):             # <<<<<<<<<<<<<<
- *             inf.side_distances[i] = 0
- *             t = x[i]-self.raw_maxes[i]
+    /* "/root/package/scipy/spatial/ckdtree.pyx":997
+ *         elif _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)<r_hi:
+ *             self.__query_ball_tree_traverse_no_checking(other, results,
+ *                     node1, node2)             # <<<<<<<<<<<<<<
+ *         elif node1.split_dim==-1:
+ *             if node2.split_dim==-1:
  */
-  __pyx_2 = __pyx_v_self->m;
-  for (__pyx_v_i = 0; __pyx_v_i < __pyx_2; __pyx_v_i+=1) {
+    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_ball_tree_traverse_no_checking(__pyx_v_self, __pyx_v_other, __pyx_v_results, __pyx_v_node1, __pyx_v_node2); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 996; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    goto __pyx_L3;
+  }
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":382
- *         inf.node = self.tree
- *         for i in range(self.m):
- *             inf.side_distances[i] = 0             # <<<<<<<<<<<<<<
- *             t = x[i]-self.raw_maxes[i]
- *             if t>inf.side_distances[i]:
+  /* "/root/package/scipy/spatial/ckdtree.pyx":998
+ *             self.__query_ball_tree_traverse_no_checking(other, results,
+ *                     node1, node2)
+ *         elif node1.split_dim==-1:             # <<<<<<<<<<<<<<
+ *             if node2.split_dim==-1:
+ *                 for i in range(node1.start_idx,node1.end_idx):
  */
-    (__pyx_v_inf->side_distances[__pyx_v_i]) = 0;
+  __pyx_1 = (__pyx_v_node1->split_dim == -1);
+  if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":383
- *         for i in range(self.m):
- *             inf.side_distances[i] = 0
- *             t = x[i]-self.raw_maxes[i]             # <<<<<<<<<<<<<<
- *             if t>inf.side_distances[i]:
- *                 inf.side_distances[i] = t
+    /* "/root/package/scipy/spatial/ckdtree.pyx":999
+ *                     node1, node2)
+ *         elif node1.split_dim==-1:
+ *             if node2.split_dim==-1:             # <<<<<<<<<<<<<<
+ *                 for i in range(node1.start_idx,node1.end_idx):
+ *                     l = results[self.raw_indices[i]]
  */
-    __pyx_v_t = ((__pyx_v_x[__pyx_v_i]) - (__pyx_v_self->raw_maxes[__pyx_v_i]));
+    __pyx_1 = (__pyx_v_node2->split_dim == -1);
+    if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":384
- *             inf.side_distances[i] = 0
- *             t = x[i]-self.raw_maxes[i]
- *             if t>inf.side_distances[i]:             # <<<<<<<<<<<<<<
- *                 inf.side_distances[i] = t
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1000
+ *         elif node1.split_dim==-1:
+ *             if node2.split_dim==-1:
+ *                 for i in range(node1.start_idx,node1.end_idx):             # <<<<<<<<<<<<<<
+ *                     l = results[self.raw_indices[i]]
+ *                     for j in range(node2.start_idx,node2.end_idx):
+ */
+      __pyx_3 = __pyx_v_node1->end_idx;
+      for (__pyx_v_i = __pyx_v_node1->start_idx; __pyx_v_i < __pyx_3; __pyx_v_i+=1) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":1001
+ *             if node2.split_dim==-1:
+ *                 for i in range(node1.start_idx,node1.end_idx):
+ *                     l = results[self.raw_indices[i]]             # <<<<<<<<<<<<<<
+ *                     for j in range(node2.start_idx,node2.end_idx):
+ *                         if _distance_p(
+ */
+        __pyx_4 = (__pyx_v_self->raw_indices[__pyx_v_i]);
+        __pyx_2 = __Pyx_GetItemInt(__pyx_v_results, __pyx_4, 0); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1001; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        Py_DECREF(__pyx_v_l);
+        __pyx_v_l = __pyx_2;
+        __pyx_2 = 0;
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":1002
+ *                 for i in range(node1.start_idx,node1.end_idx):
+ *                     l = results[self.raw_indices[i]]
+ *                     for j in range(node2.start_idx,node2.end_idx):             # <<<<<<<<<<<<<<
+ *                         if _distance_p(
+ *                                 self.raw_data+self.raw_indices[i]*self.m,
+ */
+        __pyx_5 = __pyx_v_node2->end_idx;
+        for (__pyx_v_j = __pyx_v_node2->start_idx; __pyx_v_j < __pyx_5; __pyx_v_j+=1) {
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":1006
+ *                                 self.raw_data+self.raw_indices[i]*self.m,
+ *                                 other.raw_data+other.raw_indices[j]*self.m,
+ *                                 p,self.m,r)<=r:             # <<<<<<<<<<<<<<
+ *                             l.append(other.raw_indices[j])
  *             else:
  */
-    __pyx_3 = (__pyx_v_t > (__pyx_v_inf->side_distances[__pyx_v_i]));
-    if (__pyx_3) {
+          __pyx_1 = (__pyx_f_5scipy_7spatial_7ckdtree__distance_p((__pyx_v_self->raw_data + ((__pyx_v_self->raw_indices[__pyx_v_i]) * __pyx_v_self->m)), (__pyx_v_other->raw_data + ((__pyx_v_other->raw_indices[__pyx_v_j]) * __pyx_v_self->m)), __pyx_v_p, __pyx_v_self->m, __pyx_v_r) <= __pyx_v_r);
+          if (__pyx_1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":385
- *             t = x[i]-self.raw_maxes[i]
- *             if t>inf.side_distances[i]:
- *                 inf.side_distances[i] = t             # <<<<<<<<<<<<<<
+            /* "/root/package/scipy/spatial/ckdtree.pyx":1007
+ *                                 other.raw_data+other.raw_indices[j]*self.m,
+ *                                 p,self.m,r)<=r:
+ *                             l.append(other.raw_indices[j])             # <<<<<<<<<<<<<<
  *             else:
- *                 t = self.raw_mins[i]-x[i]
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)
  */
-      (__pyx_v_inf->side_distances[__pyx_v_i]) = __pyx_v_t;
-      goto __pyx_L5;
+            __pyx_2 = PyInt_FromLong((__pyx_v_other->raw_indices[__pyx_v_j])); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1007; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            __pyx_6 = __Pyx_PyObject_Append(__pyx_v_l, __pyx_2); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1007; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            Py_DECREF(__pyx_2); __pyx_2 = 0;
+            Py_DECREF(__pyx_6); __pyx_6 = 0;
+            goto __pyx_L9;
+          }
+          __pyx_L9:;
+        }
+      }
+      goto __pyx_L4;
     }
     /*else*/ {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":387
- *                 inf.side_distances[i] = t
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1009
+ *                             l.append(other.raw_indices[j])
  *             else:
- *                 t = self.raw_mins[i]-x[i]             # <<<<<<<<<<<<<<
- *                 if t>inf.side_distances[i]:
- *                     inf.side_distances[i] = t
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)             # <<<<<<<<<<<<<<
+ *                 self.__query_ball_tree_traverse_checking(other, results,
+ *                         node1, maxes1, mins1, node2.less, rect2, rect2+self.m,
  */
-      __pyx_v_t = ((__pyx_v_self->raw_mins[__pyx_v_i]) - (__pyx_v_x[__pyx_v_i]));
+      __pyx_v_rect2 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes2, __pyx_v_mins2, __pyx_v_node2->split_dim, __pyx_v_node2->split, __pyx_v_self->m, 1);
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":388
- *             else:
- *                 t = self.raw_mins[i]-x[i]
- *                 if t>inf.side_distances[i]:             # <<<<<<<<<<<<<<
- *                     inf.side_distances[i] = t
- *             if p!=1 and p!=infinity:
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1012
+ *                 self.__query_ball_tree_traverse_checking(other, results,
+ *                         node1, maxes1, mins1, node2.less, rect2, rect2+self.m,
+ *                         r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *                 free(rect2)
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
  */
-      __pyx_3 = (__pyx_v_t > (__pyx_v_inf->side_distances[__pyx_v_i]));
-      if (__pyx_3) {
+      __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_ball_tree_traverse_checking(__pyx_v_self, __pyx_v_other, __pyx_v_results, __pyx_v_node1, __pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node2->less, __pyx_v_rect2, (__pyx_v_rect2 + __pyx_v_self->m), __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1010; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_2); __pyx_2 = 0;
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":389
- *                 t = self.raw_mins[i]-x[i]
- *                 if t>inf.side_distances[i]:
- *                     inf.side_distances[i] = t             # <<<<<<<<<<<<<<
- *             if p!=1 and p!=infinity:
- *                 inf.side_distances[i]=inf.side_distances[i]**p
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1013
+ *                         node1, maxes1, mins1, node2.less, rect2, rect2+self.m,
+ *                         r_lo, r_hi, r, p)
+ *                 free(rect2)             # <<<<<<<<<<<<<<
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
+ *                 self.__query_ball_tree_traverse_checking(other, results,
+ */
+      free(__pyx_v_rect2);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1014
+ *                         r_lo, r_hi, r, p)
+ *                 free(rect2)
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)             # <<<<<<<<<<<<<<
+ *                 self.__query_ball_tree_traverse_checking(other, results,
+ *                         node1, maxes1, mins1, node2.greater, rect2, rect2+self.m,
+ */
+      __pyx_v_rect2 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes2, __pyx_v_mins2, __pyx_v_node2->split_dim, __pyx_v_node2->split, __pyx_v_self->m, 0);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1017
+ *                 self.__query_ball_tree_traverse_checking(other, results,
+ *                         node1, maxes1, mins1, node2.greater, rect2, rect2+self.m,
+ *                         r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *                 free(rect2)
+ *         else:
  */
-        (__pyx_v_inf->side_distances[__pyx_v_i]) = __pyx_v_t;
-        goto __pyx_L6;
-      }
-      __pyx_L6:;
+      __pyx_6 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_ball_tree_traverse_checking(__pyx_v_self, __pyx_v_other, __pyx_v_results, __pyx_v_node1, __pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node2->greater, __pyx_v_rect2, (__pyx_v_rect2 + __pyx_v_self->m), __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1015; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_6); __pyx_6 = 0;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1018
+ *                         node1, maxes1, mins1, node2.greater, rect2, rect2+self.m,
+ *                         r_lo, r_hi, r, p)
+ *                 free(rect2)             # <<<<<<<<<<<<<<
+ *         else:
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)
+ */
+      free(__pyx_v_rect2);
     }
-    __pyx_L5:;
+    __pyx_L4:;
+    goto __pyx_L3;
+  }
+  /*else*/ {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":390
- *                 if t>inf.side_distances[i]:
- *                     inf.side_distances[i] = t
- *             if p!=1 and p!=infinity:             # <<<<<<<<<<<<<<
- *                 inf.side_distances[i]=inf.side_distances[i]**p
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1020
+ *                 free(rect2)
+ *         else:
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)             # <<<<<<<<<<<<<<
+ *             self.__query_ball_tree_traverse_checking(other, results,
+ *                     node1.less, rect1, rect1+self.m, node2, maxes2, mins2,
+ */
+    __pyx_v_rect1 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node1->split_dim, __pyx_v_node1->split, __pyx_v_self->m, 1);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1023
+ *             self.__query_ball_tree_traverse_checking(other, results,
+ *                     node1.less, rect1, rect1+self.m, node2, maxes2, mins2,
+ *                     r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *             free(rect1)
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+ */
+    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_ball_tree_traverse_checking(__pyx_v_self, __pyx_v_other, __pyx_v_results, __pyx_v_node1->less, __pyx_v_rect1, (__pyx_v_rect1 + __pyx_v_self->m), __pyx_v_node2, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1021; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1024
+ *                     node1.less, rect1, rect1+self.m, node2, maxes2, mins2,
+ *                     r_lo, r_hi, r, p)
+ *             free(rect1)             # <<<<<<<<<<<<<<
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+ *             self.__query_ball_tree_traverse_checking(other, results,
+ */
+    free(__pyx_v_rect1);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1025
+ *                     r_lo, r_hi, r, p)
+ *             free(rect1)
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)             # <<<<<<<<<<<<<<
+ *             self.__query_ball_tree_traverse_checking(other, results,
+ *                     node1.greater, rect1, rect1+self.m, node2, maxes2, mins2,
+ */
+    __pyx_v_rect1 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node1->split_dim, __pyx_v_node1->split, __pyx_v_self->m, 0);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1028
+ *             self.__query_ball_tree_traverse_checking(other, results,
+ *                     node1.greater, rect1, rect1+self.m, node2, maxes2, mins2,
+ *                     r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *             free(rect1)
  * 
  */
-    __pyx_3 = (__pyx_v_p != 1);
-    if (__pyx_3) {
-      __pyx_3 = (__pyx_v_p != __pyx_v_5scipy_7spatial_7ckdtree_infinity);
-    }
-    if (__pyx_3) {
+    __pyx_6 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_ball_tree_traverse_checking(__pyx_v_self, __pyx_v_other, __pyx_v_results, __pyx_v_node1->greater, __pyx_v_rect1, (__pyx_v_rect1 + __pyx_v_self->m), __pyx_v_node2, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1026; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_6); __pyx_6 = 0;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":391
- *                     inf.side_distances[i] = t
- *             if p!=1 and p!=infinity:
- *                 inf.side_distances[i]=inf.side_distances[i]**p             # <<<<<<<<<<<<<<
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1029
+ *                     node1.greater, rect1, rect1+self.m, node2, maxes2, mins2,
+ *                     r_lo, r_hi, r, p)
+ *             free(rect1)             # <<<<<<<<<<<<<<
  * 
- *         # compute first distance
+ *     def query_ball_tree(cKDTree self, cKDTree other, double r, double p=2.,
  */
-      (__pyx_v_inf->side_distances[__pyx_v_i]) = pow((__pyx_v_inf->side_distances[__pyx_v_i]), __pyx_v_p);
-      goto __pyx_L7;
+    free(__pyx_v_rect1);
+  }
+  __pyx_L3:;
+
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_2);
+  Py_XDECREF(__pyx_6);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__query_ball_tree_traverse_checking");
+  __pyx_r = 0;
+  __pyx_L0:;
+  Py_DECREF(__pyx_v_l);
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":1031
+ *             free(rect1)
+ * 
+ *     def query_ball_tree(cKDTree self, cKDTree other, double r, double p=2.,             # <<<<<<<<<<<<<<
+ *             double eps=0):
+ *         """Find all pairs of points whose distance is at most r
+ */
+
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query_ball_tree(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_query_ball_tree[] = "Find all pairs of points whose distance is at most r\n\n        Parameters\n        ==========\n\n        other : cKDTree\n            The tree containing points to search against\n        r : positive float\n            The maximum distance\n        p : float 1<=p<=infinity\n            Which Minkowski norm to use\n        eps : nonnegative float\n            Approximate search. Branches of the tree are not explored\n            if their nearest points are further than r/(1+eps), and branches\n            are added in bulk if their furthest points are nearer than r*(1+eps).\n\n        Returns\n        =======\n\n        results : list of lists\n            For each element self.data[i] of this tree, results[i] is a list of the\n            indices of its neighbors in other.data.\n        ";
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query_ball_tree(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_other = 0;
+  double __pyx_v_r;
+  double __pyx_v_p;
+  double __pyx_v_eps;
+  PyObject *__pyx_v_results;
+  PyObject *__pyx_v_i;
+  PyObject *__pyx_r;
+  int __pyx_1;
+  PyObject *__pyx_2 = 0;
+  PyObject *__pyx_3 = 0;
+  Py_ssize_t __pyx_4 = 0;
+  PyObject *__pyx_5 = 0;
+  int __pyx_6;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_other,&__pyx_kp_r,&__pyx_kp_p,&__pyx_kp_eps,0};
+  __pyx_v_p = 2.;
+  __pyx_v_eps = ((double)0);
+  if (unlikely(__pyx_kwds)) {
+    PyObject* values[4] = {0,0,0,0};
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
     }
-    __pyx_L7:;
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_other);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_kp_r);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("query_ball_tree", 0, 2, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1031; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "query_ball_tree") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1031; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_other = ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)values[0]);
+    __pyx_v_r = __pyx_PyFloat_AsDouble(values[1]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1031; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    if (values[2]) {
+      __pyx_v_p = __pyx_PyFloat_AsDouble(values[2]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1031; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    if (values[3]) {
+      __pyx_v_eps = __pyx_PyFloat_AsDouble(values[3]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1032; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+  } else {
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  4:
+      __pyx_v_eps = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1032; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  3:
+      __pyx_v_p = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1031; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  2:
+      __pyx_v_r = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1031; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_other = ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)PyTuple_GET_ITEM(__pyx_args, 0));
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("query_ball_tree", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1031; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.query_ball_tree");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_v_results = Py_None; Py_INCREF(Py_None);
+  __pyx_v_i = Py_None; Py_INCREF(Py_None);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_other), __pyx_ptype_5scipy_7spatial_7ckdtree_cKDTree, 1, "other", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1031; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1056
+ *             indices of its neighbors in other.data.
+ *         """
+ *         if other.m!=self.m:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Trees have different dimensionality")
+ *         if p<1:
+ */
+  __pyx_1 = (__pyx_v_other->m != ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m);
+  if (__pyx_1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1057
+ *         """
+ *         if other.m!=self.m:
+ *             raise ValueError("Trees have different dimensionality")             # <<<<<<<<<<<<<<
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ */
+    __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1057; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_kp_46);
+    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_kp_46);
+    __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1057; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+    __Pyx_Raise(__pyx_3, 0, 0);
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1057; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1058
+ *         if other.m!=self.m:
+ *             raise ValueError("Trees have different dimensionality")
+ *         if p<1:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ *         results = [[] for i in range(self.n)]
+ */
+  __pyx_1 = (__pyx_v_p < 1);
+  if (__pyx_1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1059
+ *             raise ValueError("Trees have different dimensionality")
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")             # <<<<<<<<<<<<<<
+ *         results = [[] for i in range(self.n)]
+ *         self.__query_ball_tree_traverse_checking(other, results,
+ */
+    __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1059; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_kp_47);
+    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_kp_47);
+    __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1059; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+    __Pyx_Raise(__pyx_3, 0, 0);
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1059; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1060
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ *         results = [[] for i in range(self.n)]             # <<<<<<<<<<<<<<
+ *         self.__query_ball_tree_traverse_checking(other, results,
+ *                 self.tree, self.raw_maxes, self.raw_mins,
+ */
+  __pyx_2 = PyList_New(0); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1060; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1060; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1060; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_5, 0, __pyx_3);
+  __pyx_3 = 0;
+  __pyx_3 = PyObject_Call(__pyx_builtin_range, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1060; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
+  if (PyList_CheckExact(__pyx_3) || PyTuple_CheckExact(__pyx_3)) {
+    __pyx_4 = 0; __pyx_5 = __pyx_3; Py_INCREF(__pyx_5);
+  } else {
+    __pyx_4 = -1; __pyx_5 = PyObject_GetIter(__pyx_3); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1060; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_5))) {
+      if (__pyx_4 >= PyList_GET_SIZE(__pyx_5)) break;
+      __pyx_3 = PyList_GET_ITEM(__pyx_5, __pyx_4); Py_INCREF(__pyx_3); __pyx_4++;
+    } else if (likely(PyTuple_CheckExact(__pyx_5))) {
+      if (__pyx_4 >= PyTuple_GET_SIZE(__pyx_5)) break;
+      __pyx_3 = PyTuple_GET_ITEM(__pyx_5, __pyx_4); Py_INCREF(__pyx_3); __pyx_4++;
+    } else {
+      __pyx_3 = PyIter_Next(__pyx_5);
+      if (!__pyx_3) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1060; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+    }
+    Py_DECREF(__pyx_v_i);
+    __pyx_v_i = __pyx_3;
+    __pyx_3 = 0;
+    __pyx_3 = PyList_New(0); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1060; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_6 = PyList_Append(__pyx_2, (PyObject*)__pyx_3); if (unlikely(__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1060; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
   }
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
+  Py_DECREF(__pyx_v_results);
+  __pyx_v_results = ((PyObject *)__pyx_2);
+  __pyx_2 = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":394
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1065
+ *                 other.tree, other.raw_maxes, other.raw_mins,
+ *                 _distance_power(r/(1.+eps),p), _distance_power(r*(1.+eps),p),
+ *                 _distance_power(r,p), p)             # <<<<<<<<<<<<<<
+ *         return results
  * 
- *         # compute first distance
- *         min_distance = 0.             # <<<<<<<<<<<<<<
- *         for i in range(self.m):
- *             if p==infinity:
  */
-  __pyx_v_min_distance = 0.;
+  __pyx_3 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__query_ball_tree_traverse_checking(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), __pyx_v_other, __pyx_v_results, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_maxes, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_mins, __pyx_v_other->tree, __pyx_v_other->raw_maxes, __pyx_v_other->raw_mins, __pyx_f_5scipy_7spatial_7ckdtree__distance_power((__pyx_v_r / (1. + __pyx_v_eps)), __pyx_v_p), __pyx_f_5scipy_7spatial_7ckdtree__distance_power((__pyx_v_r * (1. + __pyx_v_eps)), __pyx_v_p), __pyx_f_5scipy_7spatial_7ckdtree__distance_power(__pyx_v_r, __pyx_v_p), __pyx_v_p); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1061; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":395
- *         # compute first distance
- *         min_distance = 0.
- *         for i in range(self.m):             # <<<<<<<<<<<<<<
- *             if p==infinity:
- *                 min_distance = dmax(min_distance,inf.side_distances[i])
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1066
+ *                 _distance_power(r/(1.+eps),p), _distance_power(r*(1.+eps),p),
+ *                 _distance_power(r,p), p)
+ *         return results             # <<<<<<<<<<<<<<
+ * 
+ * 
  */
-  __pyx_2 = __pyx_v_self->m;
-  for (__pyx_v_i = 0; __pyx_v_i < __pyx_2; __pyx_v_i+=1) {
+  Py_INCREF(__pyx_v_results);
+  __pyx_r = __pyx_v_results;
+  goto __pyx_L0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":396
- *         min_distance = 0.
- *         for i in range(self.m):
- *             if p==infinity:             # <<<<<<<<<<<<<<
- *                 min_distance = dmax(min_distance,inf.side_distances[i])
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_2);
+  Py_XDECREF(__pyx_3);
+  Py_XDECREF(__pyx_5);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.query_ball_tree");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  Py_DECREF(__pyx_v_results);
+  Py_DECREF(__pyx_v_i);
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":1069
+ * 
+ * 
+ *     cdef __query_pairs_traverse_no_checking(cKDTree self, object results,             # <<<<<<<<<<<<<<
+ *             innernode* node1, innernode* node2):
+ *         cdef int i, j, min_j
+ */
+
+static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_pairs_traverse_no_checking(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, PyObject *__pyx_v_results, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node1, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node2) {
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_min_j;
+  PyObject *__pyx_r;
+  int __pyx_1;
+  int __pyx_2;
+  int __pyx_3;
+  PyObject *__pyx_4 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1072
+ *             innernode* node1, innernode* node2):
+ *         cdef int i, j, min_j
+ *         for i in range(node1.start_idx,node1.end_idx):             # <<<<<<<<<<<<<<
+ *             # a node paired with itself only yields each pair once
+ *             if node1==node2:
+ */
+  __pyx_1 = __pyx_v_node1->end_idx;
+  for (__pyx_v_i = __pyx_v_node1->start_idx; __pyx_v_i < __pyx_1; __pyx_v_i+=1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1074
+ *         for i in range(node1.start_idx,node1.end_idx):
+ *             # a node paired with itself only yields each pair once
+ *             if node1==node2:             # <<<<<<<<<<<<<<
+ *                 min_j = i+1
  *             else:
  */
-    __pyx_3 = (__pyx_v_p == __pyx_v_5scipy_7spatial_7ckdtree_infinity);
-    if (__pyx_3) {
+    __pyx_2 = (__pyx_v_node1 == __pyx_v_node2);
+    if (__pyx_2) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":397
- *         for i in range(self.m):
- *             if p==infinity:
- *                 min_distance = dmax(min_distance,inf.side_distances[i])             # <<<<<<<<<<<<<<
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1075
+ *             # a node paired with itself only yields each pair once
+ *             if node1==node2:
+ *                 min_j = i+1             # <<<<<<<<<<<<<<
+ *             else:
+ *                 min_j = node2.start_idx
+ */
+      __pyx_v_min_j = (__pyx_v_i + 1);
+      goto __pyx_L5;
+    }
+    /*else*/ {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1077
+ *                 min_j = i+1
  *             else:
- *                 min_distance += inf.side_distances[i]
+ *                 min_j = node2.start_idx             # <<<<<<<<<<<<<<
+ *             for j in range(min_j,node2.end_idx):
+ *                 self.__query_pairs_add(results,
  */
-      __pyx_v_min_distance = __pyx_f_5scipy_7spatial_7ckdtree_dmax(__pyx_v_min_distance, (__pyx_v_inf->side_distances[__pyx_v_i]));
-      goto __pyx_L10;
+      __pyx_v_min_j = __pyx_v_node2->start_idx;
     }
-    /*else*/ {
+    __pyx_L5:;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":399
- *                 min_distance = dmax(min_distance,inf.side_distances[i])
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1078
  *             else:
- *                 min_distance += inf.side_distances[i]             # <<<<<<<<<<<<<<
+ *                 min_j = node2.start_idx
+ *             for j in range(min_j,node2.end_idx):             # <<<<<<<<<<<<<<
+ *                 self.__query_pairs_add(results,
+ *                         self.raw_indices[i], self.raw_indices[j])
+ */
+    __pyx_3 = __pyx_v_node2->end_idx;
+    for (__pyx_v_j = __pyx_v_min_j; __pyx_v_j < __pyx_3; __pyx_v_j+=1) {
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1080
+ *             for j in range(min_j,node2.end_idx):
+ *                 self.__query_pairs_add(results,
+ *                         self.raw_indices[i], self.raw_indices[j])             # <<<<<<<<<<<<<<
  * 
- *         # fiddle approximation factor
+ *     cdef __query_pairs_add(cKDTree self, object results, int i, int j):
  */
-      __pyx_v_min_distance += (__pyx_v_inf->side_distances[__pyx_v_i]);
+      __pyx_4 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_pairs_add(__pyx_v_self, __pyx_v_results, (__pyx_v_self->raw_indices[__pyx_v_i]), (__pyx_v_self->raw_indices[__pyx_v_j])); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1079; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_4); __pyx_4 = 0;
     }
-    __pyx_L10:;
   }
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":402
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_4);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__query_pairs_traverse_no_checking");
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":1082
+ *                         self.raw_indices[i], self.raw_indices[j])
  * 
- *         # fiddle approximation factor
- *         if eps==0:             # <<<<<<<<<<<<<<
- *             epsfac=1
- *         elif p==infinity:
+ *     cdef __query_pairs_add(cKDTree self, object results, int i, int j):             # <<<<<<<<<<<<<<
+ *         if i<j:
+ *             results.add((i,j))
  */
-  __pyx_3 = (__pyx_v_eps == 0);
-  if (__pyx_3) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":403
- *         # fiddle approximation factor
- *         if eps==0:
- *             epsfac=1             # <<<<<<<<<<<<<<
- *         elif p==infinity:
- *             epsfac = 1/(1+eps)
- */
-    __pyx_v_epsfac = 1;
-    goto __pyx_L11;
-  }
+static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_pairs_add(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, PyObject *__pyx_v_results, int __pyx_v_i, int __pyx_v_j) {
+  PyObject *__pyx_r;
+  int __pyx_1;
+  PyObject *__pyx_2 = 0;
+  PyObject *__pyx_3 = 0;
+  PyObject *__pyx_4 = 0;
+  PyObject *__pyx_5 = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":404
- *         if eps==0:
- *             epsfac=1
- *         elif p==infinity:             # <<<<<<<<<<<<<<
- *             epsfac = 1/(1+eps)
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1083
+ * 
+ *     cdef __query_pairs_add(cKDTree self, object results, int i, int j):
+ *         if i<j:             # <<<<<<<<<<<<<<
+ *             results.add((i,j))
  *         else:
  */
-  __pyx_3 = (__pyx_v_p == __pyx_v_5scipy_7spatial_7ckdtree_infinity);
-  if (__pyx_3) {
+  __pyx_1 = (__pyx_v_i < __pyx_v_j);
+  if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":405
- *             epsfac=1
- *         elif p==infinity:
- *             epsfac = 1/(1+eps)             # <<<<<<<<<<<<<<
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1084
+ *     cdef __query_pairs_add(cKDTree self, object results, int i, int j):
+ *         if i<j:
+ *             results.add((i,j))             # <<<<<<<<<<<<<<
  *         else:
- *             epsfac = 1/(1+eps)**p
- */
-    __pyx_v_epsfac = (1 / (1 + __pyx_v_eps));
-    goto __pyx_L11;
+ *             results.add((j,i))
+ */
+    __pyx_2 = PyObject_GetAttr(__pyx_v_results, __pyx_kp_add); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1084; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_3 = PyInt_FromLong(__pyx_v_i); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1084; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_4 = PyInt_FromLong(__pyx_v_j); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1084; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_5 = PyTuple_New(2); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1084; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyTuple_SET_ITEM(__pyx_5, 0, __pyx_3);
+    PyTuple_SET_ITEM(__pyx_5, 1, __pyx_4);
+    __pyx_3 = 0;
+    __pyx_4 = 0;
+    __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1084; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyTuple_SET_ITEM(__pyx_3, 0, ((PyObject *)__pyx_5));
+    __pyx_5 = 0;
+    __pyx_4 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1084; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+    Py_DECREF(__pyx_4); __pyx_4 = 0;
+    goto __pyx_L3;
   }
   /*else*/ {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":407
- *             epsfac = 1/(1+eps)
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1086
+ *             results.add((i,j))
  *         else:
- *             epsfac = 1/(1+eps)**p             # <<<<<<<<<<<<<<
+ *             results.add((j,i))             # <<<<<<<<<<<<<<
  * 
- *         # internally we represent all distances as distance**p
+ *     cdef __query_pairs_traverse_checking(cKDTree self, object results,
  */
-    __pyx_v_epsfac = (1 / pow((1 + __pyx_v_eps), __pyx_v_p));
+    __pyx_5 = PyObject_GetAttr(__pyx_v_results, __pyx_kp_add); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1086; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_2 = PyInt_FromLong(__pyx_v_j); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1086; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_3 = PyInt_FromLong(__pyx_v_i); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1086; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_4 = PyTuple_New(2); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1086; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyTuple_SET_ITEM(__pyx_4, 0, __pyx_2);
+    PyTuple_SET_ITEM(__pyx_4, 1, __pyx_3);
+    __pyx_2 = 0;
+    __pyx_3 = 0;
+    __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1086; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyTuple_SET_ITEM(__pyx_2, 0, ((PyObject *)__pyx_4));
+    __pyx_4 = 0;
+    __pyx_3 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1086; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_5); __pyx_5 = 0;
+    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
   }
-  __pyx_L11:;
+  __pyx_L3:;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":410
- * 
- *         # internally we represent all distances as distance**p
- *         if p!=infinity and distance_upper_bound!=infinity:             # <<<<<<<<<<<<<<
- *             distance_upper_bound = distance_upper_bound**p
- * 
- */
-  __pyx_3 = (__pyx_v_p != __pyx_v_5scipy_7spatial_7ckdtree_infinity);
-  if (__pyx_3) {
-    __pyx_3 = (__pyx_v_distance_upper_bound != __pyx_v_5scipy_7spatial_7ckdtree_infinity);
-  }
-  if (__pyx_3) {
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_2);
+  Py_XDECREF(__pyx_3);
+  Py_XDECREF(__pyx_4);
+  Py_XDECREF(__pyx_5);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__query_pairs_add");
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":411
- *         # internally we represent all distances as distance**p
- *         if p!=infinity and distance_upper_bound!=infinity:
- *             distance_upper_bound = distance_upper_bound**p             # <<<<<<<<<<<<<<
+/* "/root/package/scipy/spatial/ckdtree.pyx":1088
+ *             results.add((j,i))
  * 
- *         while True:
+ *     cdef __query_pairs_traverse_checking(cKDTree self, object results,             # <<<<<<<<<<<<<<
+ *             innernode* node1, double* maxes1, double* mins1,
+ *             innernode* node2, double* maxes2, double* mins2,
  */
-    __pyx_v_distance_upper_bound = pow(__pyx_v_distance_upper_bound, __pyx_v_p);
-    goto __pyx_L12;
-  }
-  __pyx_L12:;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":413
- *             distance_upper_bound = distance_upper_bound**p
- * 
- *         while True:             # <<<<<<<<<<<<<<
- *             if inf.node.split_dim==-1:
- *                 node = <leafnode*>inf.node
- */
-  while (1) {
-    __pyx_3 = 1;
-    if (!__pyx_3) break;
+static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_pairs_traverse_checking(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, PyObject *__pyx_v_results, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node1, double *__pyx_v_maxes1, double *__pyx_v_mins1, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node2, double *__pyx_v_maxes2, double *__pyx_v_mins2, double __pyx_v_r_lo, double __pyx_v_r_hi, double __pyx_v_r, double __pyx_v_p) {
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_min_j;
+  double *__pyx_v_rect1;
+  double *__pyx_v_rect2;
+  double *__pyx_v_less1;
+  double *__pyx_v_greater1;
+  double *__pyx_v_less2;
+  double *__pyx_v_greater2;
+  PyObject *__pyx_r;
+  int __pyx_1;
+  PyObject *__pyx_2 = 0;
+  int __pyx_3;
+  int __pyx_4;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":414
- * 
- *         while True:
- *             if inf.node.split_dim==-1:             # <<<<<<<<<<<<<<
- *                 node = <leafnode*>inf.node
- * 
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1099
+ *         cdef double* less2
+ *         cdef double* greater2
+ *         if _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)>r_lo:             # <<<<<<<<<<<<<<
+ *             return
+ *         elif _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)<r_hi:
  */
-    __pyx_3 = (__pyx_v_inf->node->split_dim == -1);
-    if (__pyx_3) {
+  __pyx_1 = (__pyx_f_5scipy_7spatial_7ckdtree__min_distance_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_p, __pyx_v_self->m) > __pyx_v_r_lo);
+  if (__pyx_1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":415
- *         while True:
- *             if inf.node.split_dim==-1:
- *                 node = <leafnode*>inf.node             # <<<<<<<<<<<<<<
- * 
- *                 # brute-force
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1100
+ *         cdef double* greater2
+ *         if _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)>r_lo:
+ *             return             # <<<<<<<<<<<<<<
+ *         elif _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)<r_hi:
+ *             self.__query_pairs_traverse_no_checking(results, node1, node2)
  */
-      __pyx_v_node = ((struct __pyx_t_5scipy_7spatial_7ckdtree_leafnode *)__pyx_v_inf->node);
+    __pyx_r = Py_None; Py_INCREF(Py_None);
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":418
- * 
- *                 # brute-force
- *                 for i in range(node.start_idx,node.end_idx):             # <<<<<<<<<<<<<<
- *                     d = _distance_p(
- *                             self.raw_data+self.raw_indices[i]*self.m,
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1101
+ *         if _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)>r_lo:
+ *             return
+ *         elif _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)<r_hi:             # <<<<<<<<<<<<<<
+ *             self.__query_pairs_traverse_no_checking(results, node1, node2)
+ *         elif node1.split_dim==-1:
  */
-      __pyx_2 = __pyx_v_node->end_idx;
-      for (__pyx_v_i = __pyx_v_node->start_idx; __pyx_v_i < __pyx_2; __pyx_v_i+=1) {
+  __pyx_1 = (__pyx_f_5scipy_7spatial_7ckdtree__max_distance_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_p, __pyx_v_self->m) < __pyx_v_r_hi);
+  if (__pyx_1) {
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":421
- *                     d = _distance_p(
- *                             self.raw_data+self.raw_indices[i]*self.m,
- *                             x,p,self.m,distance_upper_bound)             # <<<<<<<<<<<<<<
- * 
- *                     if d<distance_upper_bound:
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1102
+ *             return
+ *         elif _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)<r_hi:
+ *             self.__query_pairs_traverse_no_checking(results, node1, node2)             # <<<<<<<<<<<<<<
+ *         elif node1.split_dim==-1:
+ *             if node2.split_dim==-1:
  */
-        __pyx_v_d = __pyx_f_5scipy_7spatial_7ckdtree__distance_p((__pyx_v_self->raw_data + ((__pyx_v_self->raw_indices[__pyx_v_i]) * __pyx_v_self->m)), __pyx_v_x, __pyx_v_p, __pyx_v_self->m, __pyx_v_distance_upper_bound);
+    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_pairs_traverse_no_checking(__pyx_v_self, __pyx_v_results, __pyx_v_node1, __pyx_v_node2); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+    goto __pyx_L3;
+  }
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":423
- *                             x,p,self.m,distance_upper_bound)
- * 
- *                     if d<distance_upper_bound:             # <<<<<<<<<<<<<<
- *                         # replace furthest neighbor
- *                         if neighbors.n==k:
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1103
+ *         elif _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)<r_hi:
+ *             self.__query_pairs_traverse_no_checking(results, node1, node2)
+ *         elif node1.split_dim==-1:             # <<<<<<<<<<<<<<
+ *             if node2.split_dim==-1:
+ *                 for i in range(node1.start_idx,node1.end_idx):
  */
-        __pyx_3 = (__pyx_v_d < __pyx_v_distance_upper_bound);
-        if (__pyx_3) {
+  __pyx_1 = (__pyx_v_node1->split_dim == -1);
+  if (__pyx_1) {
 
-          /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":425
- *                     if d<distance_upper_bound:
- *                         # replace furthest neighbor
- *                         if neighbors.n==k:             # <<<<<<<<<<<<<<
- *                             heapremove(&neighbors)
- *                         neighbor.priority = -d
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1104
+ *             self.__query_pairs_traverse_no_checking(results, node1, node2)
+ *         elif node1.split_dim==-1:
+ *             if node2.split_dim==-1:             # <<<<<<<<<<<<<<
+ *                 for i in range(node1.start_idx,node1.end_idx):
+ *                     if node1==node2:
  */
-          __pyx_3 = (__pyx_v_neighbors.n == __pyx_v_k);
-          if (__pyx_3) {
+    __pyx_1 = (__pyx_v_node2->split_dim == -1);
+    if (__pyx_1) {
 
-            /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":426
- *                         # replace furthest neighbor
- *                         if neighbors.n==k:
- *                             heapremove(&neighbors)             # <<<<<<<<<<<<<<
- *                         neighbor.priority = -d
- *                         neighbor.contents.intdata = self.raw_indices[i]
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1105
+ *         elif node1.split_dim==-1:
+ *             if node2.split_dim==-1:
+ *                 for i in range(node1.start_idx,node1.end_idx):             # <<<<<<<<<<<<<<
+ *                     if node1==node2:
+ *                         min_j = i+1
+ */
+      __pyx_3 = __pyx_v_node1->end_idx;
+      for (__pyx_v_i = __pyx_v_node1->start_idx; __pyx_v_i < __pyx_3; __pyx_v_i+=1) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":1106
+ *             if node2.split_dim==-1:
+ *                 for i in range(node1.start_idx,node1.end_idx):
+ *                     if node1==node2:             # <<<<<<<<<<<<<<
+ *                         min_j = i+1
+ *                     else:
  */
-            __pyx_1 = __pyx_f_5scipy_7spatial_7ckdtree_heapremove((&__pyx_v_neighbors)); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-            Py_DECREF(__pyx_1); __pyx_1 = 0;
-            goto __pyx_L19;
-          }
-          __pyx_L19:;
+        __pyx_1 = (__pyx_v_node1 == __pyx_v_node2);
+        if (__pyx_1) {
 
-          /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":427
- *                         if neighbors.n==k:
- *                             heapremove(&neighbors)
- *                         neighbor.priority = -d             # <<<<<<<<<<<<<<
- *                         neighbor.contents.intdata = self.raw_indices[i]
- *                         heappush(&neighbors,neighbor)
+          /* "/root/package/scipy/spatial/ckdtree.pyx":1107
+ *                 for i in range(node1.start_idx,node1.end_idx):
+ *                     if node1==node2:
+ *                         min_j = i+1             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         min_j = node2.start_idx
  */
-          __pyx_v_neighbor.priority = (-__pyx_v_d);
+          __pyx_v_min_j = (__pyx_v_i + 1);
+          goto __pyx_L7;
+        }
+        /*else*/ {
 
-          /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":428
- *                             heapremove(&neighbors)
- *                         neighbor.priority = -d
- *                         neighbor.contents.intdata = self.raw_indices[i]             # <<<<<<<<<<<<<<
- *                         heappush(&neighbors,neighbor)
- * 
+          /* "/root/package/scipy/spatial/ckdtree.pyx":1109
+ *                         min_j = i+1
+ *                     else:
+ *                         min_j = node2.start_idx             # <<<<<<<<<<<<<<
+ *                     for j in range(min_j,node2.end_idx):
+ *                         if _distance_p(
  */
-          __pyx_v_neighbor.contents.intdata = (__pyx_v_self->raw_indices[__pyx_v_i]);
+          __pyx_v_min_j = __pyx_v_node2->start_idx;
+        }
+        __pyx_L7:;
 
-          /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":429
- *                         neighbor.priority = -d
- *                         neighbor.contents.intdata = self.raw_indices[i]
- *                         heappush(&neighbors,neighbor)             # <<<<<<<<<<<<<<
- * 
- *                         # adjust upper bound for efficiency
+        /* "/root/package/scipy/spatial/ckdtree.pyx":1110
+ *                     else:
+ *                         min_j = node2.start_idx
+ *                     for j in range(min_j,node2.end_idx):             # <<<<<<<<<<<<<<
+ *                         if _distance_p(
+ *                                 self.raw_data+self.raw_indices[i]*self.m,
+ */
+        __pyx_4 = __pyx_v_node2->end_idx;
+        for (__pyx_v_j = __pyx_v_min_j; __pyx_v_j < __pyx_4; __pyx_v_j+=1) {
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":1114
+ *                                 self.raw_data+self.raw_indices[i]*self.m,
+ *                                 self.raw_data+self.raw_indices[j]*self.m,
+ *                                 p,self.m,r)<=r:             # <<<<<<<<<<<<<<
+ *                             self.__query_pairs_add(results,
+ *                                     self.raw_indices[i], self.raw_indices[j])
+ */
+          __pyx_1 = (__pyx_f_5scipy_7spatial_7ckdtree__distance_p((__pyx_v_self->raw_data + ((__pyx_v_self->raw_indices[__pyx_v_i]) * __pyx_v_self->m)), (__pyx_v_self->raw_data + ((__pyx_v_self->raw_indices[__pyx_v_j]) * __pyx_v_self->m)), __pyx_v_p, __pyx_v_self->m, __pyx_v_r) <= __pyx_v_r);
+          if (__pyx_1) {
+
+            /* "/root/package/scipy/spatial/ckdtree.pyx":1116
+ *                                 p,self.m,r)<=r:
+ *                             self.__query_pairs_add(results,
+ *                                     self.raw_indices[i], self.raw_indices[j])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)
  */
-          __pyx_1 = __pyx_f_5scipy_7spatial_7ckdtree_heappush((&__pyx_v_neighbors), __pyx_v_neighbor); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 429; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          Py_DECREF(__pyx_1); __pyx_1 = 0;
+            __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_pairs_add(__pyx_v_self, __pyx_v_results, (__pyx_v_self->raw_indices[__pyx_v_i]), (__pyx_v_self->raw_indices[__pyx_v_j])); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            Py_DECREF(__pyx_2); __pyx_2 = 0;
+            goto __pyx_L10;
+          }
+          __pyx_L10:;
+        }
+      }
+      goto __pyx_L4;
+    }
+    /*else*/ {
 
-          /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":432
- * 
- *                         # adjust upper bound for efficiency
- *                         if neighbors.n==k:             # <<<<<<<<<<<<<<
- *                             distance_upper_bound = -heappeek(&neighbors).priority
- *                 # done with this node, get another
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1118
+ *                                     self.raw_indices[i], self.raw_indices[j])
+ *             else:
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)             # <<<<<<<<<<<<<<
+ *                 self.__query_pairs_traverse_checking(results,
+ *                         node1, maxes1, mins1, node2.less, rect2, rect2+self.m,
  */
-          __pyx_3 = (__pyx_v_neighbors.n == __pyx_v_k);
-          if (__pyx_3) {
+      __pyx_v_rect2 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes2, __pyx_v_mins2, __pyx_v_node2->split_dim, __pyx_v_node2->split, __pyx_v_self->m, 1);
 
-            /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":433
- *                         # adjust upper bound for efficiency
- *                         if neighbors.n==k:
- *                             distance_upper_bound = -heappeek(&neighbors).priority             # <<<<<<<<<<<<<<
- *                 # done with this node, get another
- *                 stdlib.free(inf)
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1121
+ *                 self.__query_pairs_traverse_checking(results,
+ *                         node1, maxes1, mins1, node2.less, rect2, rect2+self.m,
+ *                         r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *                 free(rect2)
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
  */
-            __pyx_v_distance_upper_bound = (-__pyx_f_5scipy_7spatial_7ckdtree_heappeek((&__pyx_v_neighbors)).priority);
-            goto __pyx_L20;
-          }
-          __pyx_L20:;
-          goto __pyx_L18;
-        }
-        __pyx_L18:;
-      }
+      __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_pairs_traverse_checking(__pyx_v_self, __pyx_v_results, __pyx_v_node1, __pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node2->less, __pyx_v_rect2, (__pyx_v_rect2 + __pyx_v_self->m), __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_2); __pyx_2 = 0;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":435
- *                             distance_upper_bound = -heappeek(&neighbors).priority
- *                 # done with this node, get another
- *                 stdlib.free(inf)             # <<<<<<<<<<<<<<
- *                 if q.n==0:
- *                     # no more nodes to visit
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1122
+ *                         node1, maxes1, mins1, node2.less, rect2, rect2+self.m,
+ *                         r_lo, r_hi, r, p)
+ *                 free(rect2)             # <<<<<<<<<<<<<<
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
+ *                 self.__query_pairs_traverse_checking(results,
  */
-      free(__pyx_v_inf);
+      free(__pyx_v_rect2);
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":436
- *                 # done with this node, get another
- *                 stdlib.free(inf)
- *                 if q.n==0:             # <<<<<<<<<<<<<<
- *                     # no more nodes to visit
- *                     break
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1123
+ *                         r_lo, r_hi, r, p)
+ *                 free(rect2)
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)             # <<<<<<<<<<<<<<
+ *                 self.__query_pairs_traverse_checking(results,
+ *                         node1, maxes1, mins1, node2.greater, rect2, rect2+self.m,
  */
-      __pyx_3 = (__pyx_v_q.n == 0);
-      if (__pyx_3) {
+      __pyx_v_rect2 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes2, __pyx_v_mins2, __pyx_v_node2->split_dim, __pyx_v_node2->split, __pyx_v_self->m, 0);
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":438
- *                 if q.n==0:
- *                     # no more nodes to visit
- *                     break             # <<<<<<<<<<<<<<
- *                 else:
- *                     it = heappop(&q)
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1126
+ *                 self.__query_pairs_traverse_checking(results,
+ *                         node1, maxes1, mins1, node2.greater, rect2, rect2+self.m,
+ *                         r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *                 free(rect2)
+ *         elif node2.split_dim==-1:
  */
-        goto __pyx_L14;
-        goto __pyx_L21;
-      }
-      /*else*/ {
+      __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_pairs_traverse_checking(__pyx_v_self, __pyx_v_results, __pyx_v_node1, __pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node2->greater, __pyx_v_rect2, (__pyx_v_rect2 + __pyx_v_self->m), __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_2); __pyx_2 = 0;
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":440
- *                     break
- *                 else:
- *                     it = heappop(&q)             # <<<<<<<<<<<<<<
- *                     inf = <nodeinfo*>it.contents.ptrdata
- *                     min_distance = it.priority
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1127
+ *                         node1, maxes1, mins1, node2.greater, rect2, rect2+self.m,
+ *                         r_lo, r_hi, r, p)
+ *                 free(rect2)             # <<<<<<<<<<<<<<
+ *         elif node2.split_dim==-1:
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)
  */
-        __pyx_v_it = __pyx_f_5scipy_7spatial_7ckdtree_heappop((&__pyx_v_q));
+      free(__pyx_v_rect2);
+    }
+    __pyx_L4:;
+    goto __pyx_L3;
+  }
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":441
- *                 else:
- *                     it = heappop(&q)
- *                     inf = <nodeinfo*>it.contents.ptrdata             # <<<<<<<<<<<<<<
- *                     min_distance = it.priority
- *             else:
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1128
+ *                         r_lo, r_hi, r, p)
+ *                 free(rect2)
+ *         elif node2.split_dim==-1:             # <<<<<<<<<<<<<<
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)
+ *             self.__query_pairs_traverse_checking(results,
  */
-        __pyx_v_inf = ((struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo *)__pyx_v_it.contents.ptrdata);
+  __pyx_1 = (__pyx_v_node2->split_dim == -1);
+  if (__pyx_1) {
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":442
- *                     it = heappop(&q)
- *                     inf = <nodeinfo*>it.contents.ptrdata
- *                     min_distance = it.priority             # <<<<<<<<<<<<<<
- *             else:
- *                 inode = <innernode*>inf.node
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1129
+ *                 free(rect2)
+ *         elif node2.split_dim==-1:
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)             # <<<<<<<<<<<<<<
+ *             self.__query_pairs_traverse_checking(results,
+ *                     node1.less, rect1, rect1+self.m, node2, maxes2, mins2,
  */
-        __pyx_v_min_distance = __pyx_v_it.priority;
-      }
-      __pyx_L21:;
-      goto __pyx_L15;
-    }
-    /*else*/ {
+    __pyx_v_rect1 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node1->split_dim, __pyx_v_node1->split, __pyx_v_self->m, 1);
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":444
- *                     min_distance = it.priority
- *             else:
- *                 inode = <innernode*>inf.node             # <<<<<<<<<<<<<<
- * 
- *                 # we don't push cells that are too far onto the queue at all,
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1132
+ *             self.__query_pairs_traverse_checking(results,
+ *                     node1.less, rect1, rect1+self.m, node2, maxes2, mins2,
+ *                     r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *             free(rect1)
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
  */
-      __pyx_v_inode = ((struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *)__pyx_v_inf->node);
+    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_pairs_traverse_checking(__pyx_v_self, __pyx_v_results, __pyx_v_node1->less, __pyx_v_rect1, (__pyx_v_rect1 + __pyx_v_self->m), __pyx_v_node2, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":449
- *                 # but since the distance_upper_bound decreases, we might get
- *                 # here even if the cell's too far
- *                 if min_distance>distance_upper_bound*epsfac:             # <<<<<<<<<<<<<<
- *                     # since this is the nearest cell, we're done, bail out
- *                     stdlib.free(inf)
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1133
+ *                     node1.less, rect1, rect1+self.m, node2, maxes2, mins2,
+ *                     r_lo, r_hi, r, p)
+ *             free(rect1)             # <<<<<<<<<<<<<<
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+ *             self.__query_pairs_traverse_checking(results,
+ */
+    free(__pyx_v_rect1);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1134
+ *                     r_lo, r_hi, r, p)
+ *             free(rect1)
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)             # <<<<<<<<<<<<<<
+ *             self.__query_pairs_traverse_checking(results,
+ *                     node1.greater, rect1, rect1+self.m, node2, maxes2, mins2,
+ */
+    __pyx_v_rect1 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node1->split_dim, __pyx_v_node1->split, __pyx_v_self->m, 0);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1137
+ *             self.__query_pairs_traverse_checking(results,
+ *                     node1.greater, rect1, rect1+self.m, node2, maxes2, mins2,
+ *                     r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *             free(rect1)
+ *         else:
  */
-      __pyx_3 = (__pyx_v_min_distance > (__pyx_v_distance_upper_bound * __pyx_v_epsfac));
-      if (__pyx_3) {
+    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_pairs_traverse_checking(__pyx_v_self, __pyx_v_results, __pyx_v_node1->greater, __pyx_v_rect1, (__pyx_v_rect1 + __pyx_v_self->m), __pyx_v_node2, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":451
- *                 if min_distance>distance_upper_bound*epsfac:
- *                     # since this is the nearest cell, we're done, bail out
- *                     stdlib.free(inf)             # <<<<<<<<<<<<<<
- *                     # free all the nodes still on the heap
- *                     for i in range(q.n):
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1138
+ *                     node1.greater, rect1, rect1+self.m, node2, maxes2, mins2,
+ *                     r_lo, r_hi, r, p)
+ *             free(rect1)             # <<<<<<<<<<<<<<
+ *         else:
+ *             # both subtrees are split; when a node is paired with itself
  */
-        free(__pyx_v_inf);
+    free(__pyx_v_rect1);
+    goto __pyx_L3;
+  }
+  /*else*/ {
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":453
- *                     stdlib.free(inf)
- *                     # free all the nodes still on the heap
- *                     for i in range(q.n):             # <<<<<<<<<<<<<<
- *                         stdlib.free(q.heap[i].contents.ptrdata)
- *                     break
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1142
+ *             # both subtrees are split; when a node is paired with itself
+ *             # the (greater, less) combination duplicates (less, greater)
+ *             less1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)             # <<<<<<<<<<<<<<
+ *             greater1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+ *             less2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)
+ */
+    __pyx_v_less1 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node1->split_dim, __pyx_v_node1->split, __pyx_v_self->m, 1);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1143
+ *             # the (greater, less) combination duplicates (less, greater)
+ *             less1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)
+ *             greater1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)             # <<<<<<<<<<<<<<
+ *             less2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)
+ *             greater2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
+ */
+    __pyx_v_greater1 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node1->split_dim, __pyx_v_node1->split, __pyx_v_self->m, 0);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1144
+ *             less1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)
+ *             greater1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+ *             less2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)             # <<<<<<<<<<<<<<
+ *             greater2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
+ *             self.__query_pairs_traverse_checking(results,
+ */
+    __pyx_v_less2 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes2, __pyx_v_mins2, __pyx_v_node2->split_dim, __pyx_v_node2->split, __pyx_v_self->m, 1);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1145
+ *             greater1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+ *             less2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)
+ *             greater2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)             # <<<<<<<<<<<<<<
+ *             self.__query_pairs_traverse_checking(results,
+ *                     node1.less, less1, less1+self.m,
+ */
+    __pyx_v_greater2 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes2, __pyx_v_mins2, __pyx_v_node2->split_dim, __pyx_v_node2->split, __pyx_v_self->m, 0);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1149
+ *                     node1.less, less1, less1+self.m,
+ *                     node2.less, less2, less2+self.m,
+ *                     r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *             self.__query_pairs_traverse_checking(results,
+ *                     node1.less, less1, less1+self.m,
+ */
+    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_pairs_traverse_checking(__pyx_v_self, __pyx_v_results, __pyx_v_node1->less, __pyx_v_less1, (__pyx_v_less1 + __pyx_v_self->m), __pyx_v_node2->less, __pyx_v_less2, (__pyx_v_less2 + __pyx_v_self->m), __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1146; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1153
+ *                     node1.less, less1, less1+self.m,
+ *                     node2.greater, greater2, greater2+self.m,
+ *                     r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *             if node1!=node2:
+ *                 self.__query_pairs_traverse_checking(results,
  */
-        __pyx_2 = __pyx_v_q.n;
-        for (__pyx_v_i = 0; __pyx_v_i < __pyx_2; __pyx_v_i+=1) {
+    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_pairs_traverse_checking(__pyx_v_self, __pyx_v_results, __pyx_v_node1->less, __pyx_v_less1, (__pyx_v_less1 + __pyx_v_self->m), __pyx_v_node2->greater, __pyx_v_greater2, (__pyx_v_greater2 + __pyx_v_self->m), __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
 
-          /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":454
- *                     # free all the nodes still on the heap
- *                     for i in range(q.n):
- *                         stdlib.free(q.heap[i].contents.ptrdata)             # <<<<<<<<<<<<<<
- *                     break
- * 
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1154
+ *                     node2.greater, greater2, greater2+self.m,
+ *                     r_lo, r_hi, r, p)
+ *             if node1!=node2:             # <<<<<<<<<<<<<<
+ *                 self.__query_pairs_traverse_checking(results,
+ *                         node1.greater, greater1, greater1+self.m,
  */
-          free((__pyx_v_q.heap[__pyx_v_i]).contents.ptrdata);
-        }
+    __pyx_1 = (__pyx_v_node1 != __pyx_v_node2);
+    if (__pyx_1) {
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":455
- *                     for i in range(q.n):
- *                         stdlib.free(q.heap[i].contents.ptrdata)
- *                     break             # <<<<<<<<<<<<<<
- * 
- *                 # set up children for searching
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1158
+ *                         node1.greater, greater1, greater1+self.m,
+ *                         node2.less, less2, less2+self.m,
+ *                         r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *             self.__query_pairs_traverse_checking(results,
+ *                     node1.greater, greater1, greater1+self.m,
  */
-        goto __pyx_L14;
-        goto __pyx_L22;
-      }
-      __pyx_L22:;
+      __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_pairs_traverse_checking(__pyx_v_self, __pyx_v_results, __pyx_v_node1->greater, __pyx_v_greater1, (__pyx_v_greater1 + __pyx_v_self->m), __pyx_v_node2->less, __pyx_v_less2, (__pyx_v_less2 + __pyx_v_self->m), __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_2); __pyx_2 = 0;
+      goto __pyx_L11;
+    }
+    __pyx_L11:;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":458
- * 
- *                 # set up children for searching
- *                 if x[inode.split_dim]<inode.split:             # <<<<<<<<<<<<<<
- *                     near = inode.less
- *                     far = inode.greater
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1162
+ *                     node1.greater, greater1, greater1+self.m,
+ *                     node2.greater, greater2, greater2+self.m,
+ *                     r_lo, r_hi, r, p)             # <<<<<<<<<<<<<<
+ *             free(less1)
+ *             free(greater1)
  */
-      __pyx_3 = ((__pyx_v_x[__pyx_v_inode->split_dim]) < __pyx_v_inode->split);
-      if (__pyx_3) {
+    __pyx_2 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__query_pairs_traverse_checking(__pyx_v_self, __pyx_v_results, __pyx_v_node1->greater, __pyx_v_greater1, (__pyx_v_greater1 + __pyx_v_self->m), __pyx_v_node2->greater, __pyx_v_greater2, (__pyx_v_greater2 + __pyx_v_self->m), __pyx_v_r_lo, __pyx_v_r_hi, __pyx_v_r, __pyx_v_p); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_2); __pyx_2 = 0;
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":459
- *                 # set up children for searching
- *                 if x[inode.split_dim]<inode.split:
- *                     near = inode.less             # <<<<<<<<<<<<<<
- *                     far = inode.greater
- *                 else:
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1163
+ *                     node2.greater, greater2, greater2+self.m,
+ *                     r_lo, r_hi, r, p)
+ *             free(less1)             # <<<<<<<<<<<<<<
+ *             free(greater1)
+ *             free(less2)
  */
-        __pyx_v_near = __pyx_v_inode->less;
+    free(__pyx_v_less1);
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":460
- *                 if x[inode.split_dim]<inode.split:
- *                     near = inode.less
- *                     far = inode.greater             # <<<<<<<<<<<<<<
- *                 else:
- *                     near = inode.greater
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1164
+ *                     r_lo, r_hi, r, p)
+ *             free(less1)
+ *             free(greater1)             # <<<<<<<<<<<<<<
+ *             free(less2)
+ *             free(greater2)
  */
-        __pyx_v_far = __pyx_v_inode->greater;
-        goto __pyx_L25;
-      }
-      /*else*/ {
+    free(__pyx_v_greater1);
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":462
- *                     far = inode.greater
- *                 else:
- *                     near = inode.greater             # <<<<<<<<<<<<<<
- *                     far = inode.less
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1165
+ *             free(less1)
+ *             free(greater1)
+ *             free(less2)             # <<<<<<<<<<<<<<
+ *             free(greater2)
  * 
  */
-        __pyx_v_near = __pyx_v_inode->greater;
+    free(__pyx_v_less2);
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":463
- *                 else:
- *                     near = inode.greater
- *                     far = inode.less             # <<<<<<<<<<<<<<
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1166
+ *             free(greater1)
+ *             free(less2)
+ *             free(greater2)             # <<<<<<<<<<<<<<
  * 
- *                 # near child is at the same distance as the current node
+ *     def query_pairs(cKDTree self, double r, double p=2., double eps=0):
  */
-        __pyx_v_far = __pyx_v_inode->less;
-      }
-      __pyx_L25:;
+    free(__pyx_v_greater2);
+  }
+  __pyx_L3:;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":468
- *                 # we're going here next, so no point pushing it on the queue
- *                 # no need to recompute the distance or the side_distances
- *                 inf.node = near             # <<<<<<<<<<<<<<
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_2);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__query_pairs_traverse_checking");
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":1168
+ *             free(greater2)
+ * 
+ *     def query_pairs(cKDTree self, double r, double p=2., double eps=0):             # <<<<<<<<<<<<<<
+ *         """Find all pairs of points whose distance is at most r
  * 
- *                 # far child is further by an amount depending only
  */
-      __pyx_v_inf->node = __pyx_v_near;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":473
- *                 # on the split value; compute its distance and side_distances
- *                 # and push it on the queue if it's near enough
- *                 inf2 = <nodeinfo*>stdlib.malloc(sizeof(nodeinfo)+self.m*sizeof(double))             # <<<<<<<<<<<<<<
- *                 it2.contents.ptrdata = <char*> inf2
- *                 inf2.node = far
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query_pairs(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_query_pairs[] = "Find all pairs of points whose distance is at most r\n\n        Parameters\n        ==========\n\n        r : positive float\n            The maximum distance\n        p : float 1<=p<=infinity\n            Which Minkowski norm to use\n        eps : nonnegative float\n            Approximate search. Branches of the tree are not explored\n            if their nearest points are further than r/(1+eps), and branches\n            are added in bulk if their furthest points are nearer than r*(1+eps).\n\n        Returns\n        =======\n\n        results : set\n            set of pairs (i,j), i<j, for which the corresponing positions are\n            close.\n        ";
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query_pairs(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  double __pyx_v_r;
+  double __pyx_v_p;
+  double __pyx_v_eps;
+  PyObject *__pyx_v_results;
+  PyObject *__pyx_r;
+  int __pyx_1;
+  PyObject *__pyx_2 = 0;
+  PyObject *__pyx_3 = 0;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_r,&__pyx_kp_p,&__pyx_kp_eps,0};
+  __pyx_v_p = 2.;
+  __pyx_v_eps = ((double)0);
+  if (unlikely(__pyx_kwds)) {
+    PyObject* values[3] = {0,0,0};
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_r);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "query_pairs") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1168; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_r = __pyx_PyFloat_AsDouble(values[0]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1168; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    if (values[1]) {
+      __pyx_v_p = __pyx_PyFloat_AsDouble(values[1]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1168; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    if (values[2]) {
+      __pyx_v_eps = __pyx_PyFloat_AsDouble(values[2]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1168; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+  } else {
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  3: __pyx_v_eps = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1168; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  2: __pyx_v_p = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1168; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  1: __pyx_v_r = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1168; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("query_pairs", 0, 1, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1168; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.query_pairs");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_v_results = Py_None; Py_INCREF(Py_None);
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1190
+ *             close.
+ *         """
+ *         if p<1:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ *         results = set()
  */
-      __pyx_v_inf2 = ((struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo *)malloc(((sizeof(struct __pyx_t_5scipy_7spatial_7ckdtree_nodeinfo)) + (__pyx_v_self->m * (sizeof(double))))));
+  __pyx_1 = (__pyx_v_p < 1);
+  if (__pyx_1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":474
- *                 # and push it on the queue if it's near enough
- *                 inf2 = <nodeinfo*>stdlib.malloc(sizeof(nodeinfo)+self.m*sizeof(double))
- *                 it2.contents.ptrdata = <char*> inf2             # <<<<<<<<<<<<<<
- *                 inf2.node = far
- *                 # most side distances unchanged
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1191
+ *         """
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")             # <<<<<<<<<<<<<<
+ *         results = set()
+ *         self.__query_pairs_traverse_checking(results,
  */
-      __pyx_v_it2.contents.ptrdata = ((char *)__pyx_v_inf2);
+    __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_kp_48);
+    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_kp_48);
+    __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+    __Pyx_Raise(__pyx_3, 0, 0);
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":475
- *                 inf2 = <nodeinfo*>stdlib.malloc(sizeof(nodeinfo)+self.m*sizeof(double))
- *                 it2.contents.ptrdata = <char*> inf2
- *                 inf2.node = far             # <<<<<<<<<<<<<<
- *                 # most side distances unchanged
- *                 for i in range(self.m):
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1192
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ *         results = set()             # <<<<<<<<<<<<<<
+ *         self.__query_pairs_traverse_checking(results,
+ *                 self.tree, self.raw_maxes, self.raw_mins,
  */
-      __pyx_v_inf2->node = __pyx_v_far;
+  __pyx_2 = PyObject_Call(((PyObject *)((PyObject*)&PySet_Type)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1192; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_v_results);
+  __pyx_v_results = __pyx_2;
+  __pyx_2 = 0;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":477
- *                 inf2.node = far
- *                 # most side distances unchanged
- *                 for i in range(self.m):             # <<<<<<<<<<<<<<
- *                     inf2.side_distances[i] = inf.side_distances[i]
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1197
+ *                 self.tree, self.raw_maxes, self.raw_mins,
+ *                 _distance_power(r/(1.+eps),p), _distance_power(r*(1.+eps),p),
+ *                 _distance_power(r,p), p)             # <<<<<<<<<<<<<<
+ *         return results
  * 
  */
-      __pyx_2 = __pyx_v_self->m;
-      for (__pyx_v_i = 0; __pyx_v_i < __pyx_2; __pyx_v_i+=1) {
+  __pyx_3 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__query_pairs_traverse_checking(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), __pyx_v_results, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_maxes, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_mins, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_maxes, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_mins, __pyx_f_5scipy_7spatial_7ckdtree__distance_power((__pyx_v_r / (1. + __pyx_v_eps)), __pyx_v_p), __pyx_f_5scipy_7spatial_7ckdtree__distance_power((__pyx_v_r * (1. + __pyx_v_eps)), __pyx_v_p), __pyx_f_5scipy_7spatial_7ckdtree__distance_power(__pyx_v_r, __pyx_v_p), __pyx_v_p); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1193; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":478
- *                 # most side distances unchanged
- *                 for i in range(self.m):
- *                     inf2.side_distances[i] = inf.side_distances[i]             # <<<<<<<<<<<<<<
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1198
+ *                 _distance_power(r/(1.+eps),p), _distance_power(r*(1.+eps),p),
+ *                 _distance_power(r,p), p)
+ *         return results             # <<<<<<<<<<<<<<
+ * 
  * 
- *                 # one side distance changes
  */
-        (__pyx_v_inf2->side_distances[__pyx_v_i]) = (__pyx_v_inf->side_distances[__pyx_v_i]);
-      }
+  Py_INCREF(__pyx_v_results);
+  __pyx_r = __pyx_v_results;
+  goto __pyx_L0;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":482
- *                 # one side distance changes
- *                 # we can adjust the minimum distance without recomputing
- *                 if p == infinity:             # <<<<<<<<<<<<<<
- *                     # we never use side_distances in the l_infinity case
- *                     # inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_2);
+  Py_XDECREF(__pyx_3);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.query_pairs");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  Py_DECREF(__pyx_v_results);
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":1201
+ * 
+ * 
+ *     cdef __count_neighbors_traverse(cKDTree self, cKDTree other,             # <<<<<<<<<<<<<<
+ *             np.int_t* results, double* r, int* idx, int n_idx,
+ *             innernode* node1, double* maxes1, double* mins1,
  */
-      __pyx_3 = (__pyx_v_p == __pyx_v_5scipy_7spatial_7ckdtree_infinity);
-      if (__pyx_3) {
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":485
- *                     # we never use side_distances in the l_infinity case
- *                     # inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
- *                     far_min_distance = dmax(min_distance, dabs(inode.split-x[inode.split_dim]))             # <<<<<<<<<<<<<<
- *                 elif p == 1:
- *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
+static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___count_neighbors_traverse(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_other, __pyx_t_5numpy_int_t *__pyx_v_results, double *__pyx_v_r, int *__pyx_v_idx, int __pyx_v_n_idx, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node1, double *__pyx_v_maxes1, double *__pyx_v_mins1, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node2, double *__pyx_v_maxes2, double *__pyx_v_mins2, double __pyx_v_p) {
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_c;
+  int __pyx_v_n_inner;
+  int *__pyx_v_inner_idx;
+  double __pyx_v_min_r;
+  double __pyx_v_max_r;
+  double __pyx_v_d;
+  double __pyx_v_r_max;
+  double *__pyx_v_rect1;
+  double *__pyx_v_rect2;
+  PyObject *__pyx_r;
+  int __pyx_1;
+  int __pyx_2;
+  int __pyx_3;
+  PyObject *__pyx_4 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1210
+ *         cdef double* rect1
+ *         cdef double* rect2
+ *         min_r = _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)             # <<<<<<<<<<<<<<
+ *         max_r = _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)
+ * 
  */
-        __pyx_v_far_min_distance = __pyx_f_5scipy_7spatial_7ckdtree_dmax(__pyx_v_min_distance, __pyx_f_5scipy_7spatial_7ckdtree_dabs((__pyx_v_inode->split - (__pyx_v_x[__pyx_v_inode->split_dim]))));
-        goto __pyx_L28;
-      }
+  __pyx_v_min_r = __pyx_f_5scipy_7spatial_7ckdtree__min_distance_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_p, __pyx_v_self->m);
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":486
- *                     # inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
- *                     far_min_distance = dmax(min_distance, dabs(inode.split-x[inode.split_dim]))
- *                 elif p == 1:             # <<<<<<<<<<<<<<
- *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
- *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1211
+ *         cdef double* rect2
+ *         min_r = _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)
+ *         max_r = _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)             # <<<<<<<<<<<<<<
+ * 
+ *         # radii beyond max_r count every pair at once, radii below min_r
  */
-      __pyx_3 = (__pyx_v_p == 1);
-      if (__pyx_3) {
+  __pyx_v_max_r = __pyx_f_5scipy_7spatial_7ckdtree__max_distance_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_p, __pyx_v_self->m);
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":487
- *                     far_min_distance = dmax(min_distance, dabs(inode.split-x[inode.split_dim]))
- *                 elif p == 1:
- *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])             # <<<<<<<<<<<<<<
- *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]
- *                 else:
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1215
+ *         # radii beyond max_r count every pair at once, radii below min_r
+ *         # count nothing; only the rest need a closer look
+ *         inner_idx = <int*>malloc(n_idx*sizeof(int))             # <<<<<<<<<<<<<<
+ *         n_inner = 0
+ *         r_max = 0
  */
-        (__pyx_v_inf2->side_distances[__pyx_v_inode->split_dim]) = __pyx_f_5scipy_7spatial_7ckdtree_dabs((__pyx_v_inode->split - (__pyx_v_x[__pyx_v_inode->split_dim])));
+  __pyx_v_inner_idx = ((int *)malloc((__pyx_v_n_idx * (sizeof(int)))));
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":488
- *                 elif p == 1:
- *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])
- *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]             # <<<<<<<<<<<<<<
- *                 else:
- *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])**p
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1216
+ *         # count nothing; only the rest need a closer look
+ *         inner_idx = <int*>malloc(n_idx*sizeof(int))
+ *         n_inner = 0             # <<<<<<<<<<<<<<
+ *         r_max = 0
+ *         for c in range(n_idx):
  */
-        __pyx_v_far_min_distance = ((__pyx_v_min_distance - (__pyx_v_inf->side_distances[__pyx_v_inode->split_dim])) + (__pyx_v_inf2->side_distances[__pyx_v_inode->split_dim]));
-        goto __pyx_L28;
-      }
-      /*else*/ {
+  __pyx_v_n_inner = 0;
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":490
- *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]
- *                 else:
- *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])**p             # <<<<<<<<<<<<<<
- *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]
- * 
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1217
+ *         inner_idx = <int*>malloc(n_idx*sizeof(int))
+ *         n_inner = 0
+ *         r_max = 0             # <<<<<<<<<<<<<<
+ *         for c in range(n_idx):
+ *             if r[idx[c]]>max_r:
  */
-        (__pyx_v_inf2->side_distances[__pyx_v_inode->split_dim]) = pow(__pyx_f_5scipy_7spatial_7ckdtree_dabs((__pyx_v_inode->split - (__pyx_v_x[__pyx_v_inode->split_dim]))), __pyx_v_p);
+  __pyx_v_r_max = 0;
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":491
- *                 else:
- *                     inf2.side_distances[inode.split_dim] = dabs(inode.split-x[inode.split_dim])**p
- *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]             # <<<<<<<<<<<<<<
- * 
- *                 it2.priority = far_min_distance
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1218
+ *         n_inner = 0
+ *         r_max = 0
+ *         for c in range(n_idx):             # <<<<<<<<<<<<<<
+ *             if r[idx[c]]>max_r:
+ *                 results[idx[c]] += node1.n_points*node2.n_points
  */
-        __pyx_v_far_min_distance = ((__pyx_v_min_distance - (__pyx_v_inf->side_distances[__pyx_v_inode->split_dim])) + (__pyx_v_inf2->side_distances[__pyx_v_inode->split_dim]));
-      }
-      __pyx_L28:;
+  for (__pyx_v_c = 0; __pyx_v_c < __pyx_v_n_idx; __pyx_v_c+=1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":493
- *                     far_min_distance = min_distance - inf.side_distances[inode.split_dim] + inf2.side_distances[inode.split_dim]
- * 
- *                 it2.priority = far_min_distance             # <<<<<<<<<<<<<<
- * 
- * 
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1219
+ *         r_max = 0
+ *         for c in range(n_idx):
+ *             if r[idx[c]]>max_r:             # <<<<<<<<<<<<<<
+ *                 results[idx[c]] += node1.n_points*node2.n_points
+ *             elif r[idx[c]]>=min_r:
  */
-      __pyx_v_it2.priority = __pyx_v_far_min_distance;
+    __pyx_1 = ((__pyx_v_r[(__pyx_v_idx[__pyx_v_c])]) > __pyx_v_max_r);
+    if (__pyx_1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":497
- * 
- *                 # far child might be too far, if so, don't bother pushing it
- *                 if far_min_distance<=distance_upper_bound*epsfac:             # <<<<<<<<<<<<<<
- *                     heappush(&q,it2)
- *                 else:
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1220
+ *         for c in range(n_idx):
+ *             if r[idx[c]]>max_r:
+ *                 results[idx[c]] += node1.n_points*node2.n_points             # <<<<<<<<<<<<<<
+ *             elif r[idx[c]]>=min_r:
+ *                 inner_idx[n_inner] = idx[c]
  */
-      __pyx_3 = (__pyx_v_far_min_distance <= (__pyx_v_distance_upper_bound * __pyx_v_epsfac));
-      if (__pyx_3) {
+      (__pyx_v_results[(__pyx_v_idx[__pyx_v_c])]) += (__pyx_v_node1->n_points * __pyx_v_node2->n_points);
+      goto __pyx_L5;
+    }
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":498
- *                 # far child might be too far, if so, don't bother pushing it
- *                 if far_min_distance<=distance_upper_bound*epsfac:
- *                     heappush(&q,it2)             # <<<<<<<<<<<<<<
- *                 else:
- *                     stdlib.free(inf2)
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1221
+ *             if r[idx[c]]>max_r:
+ *                 results[idx[c]] += node1.n_points*node2.n_points
+ *             elif r[idx[c]]>=min_r:             # <<<<<<<<<<<<<<
+ *                 inner_idx[n_inner] = idx[c]
+ *                 n_inner += 1
  */
-        __pyx_1 = __pyx_f_5scipy_7spatial_7ckdtree_heappush((&__pyx_v_q), __pyx_v_it2); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 498; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_1); __pyx_1 = 0;
-        goto __pyx_L29;
-      }
-      /*else*/ {
+    __pyx_1 = ((__pyx_v_r[(__pyx_v_idx[__pyx_v_c])]) >= __pyx_v_min_r);
+    if (__pyx_1) {
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":500
- *                     heappush(&q,it2)
- *                 else:
- *                     stdlib.free(inf2)             # <<<<<<<<<<<<<<
- *                     # just in case
- *                     it2.contents.ptrdata = <char*> 0
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1222
+ *                 results[idx[c]] += node1.n_points*node2.n_points
+ *             elif r[idx[c]]>=min_r:
+ *                 inner_idx[n_inner] = idx[c]             # <<<<<<<<<<<<<<
+ *                 n_inner += 1
+ *                 r_max = dmax(r_max,r[idx[c]])
  */
-        free(__pyx_v_inf2);
+      (__pyx_v_inner_idx[__pyx_v_n_inner]) = (__pyx_v_idx[__pyx_v_c]);
 
-        /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":502
- *                     stdlib.free(inf2)
- *                     # just in case
- *                     it2.contents.ptrdata = <char*> 0             # <<<<<<<<<<<<<<
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1223
+ *             elif r[idx[c]]>=min_r:
+ *                 inner_idx[n_inner] = idx[c]
+ *                 n_inner += 1             # <<<<<<<<<<<<<<
+ *                 r_max = dmax(r_max,r[idx[c]])
  * 
- *         # fill output arrays with sorted neighbors
  */
-        __pyx_v_it2.contents.ptrdata = ((char *)0);
-      }
-      __pyx_L29:;
+      __pyx_v_n_inner += 1;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1224
+ *                 inner_idx[n_inner] = idx[c]
+ *                 n_inner += 1
+ *                 r_max = dmax(r_max,r[idx[c]])             # <<<<<<<<<<<<<<
+ * 
+ *         if n_inner==0:
+ */
+      __pyx_v_r_max = __pyx_f_5scipy_7spatial_7ckdtree_dmax(__pyx_v_r_max, (__pyx_v_r[(__pyx_v_idx[__pyx_v_c])]));
+      goto __pyx_L5;
     }
-    __pyx_L15:;
+    __pyx_L5:;
   }
-  __pyx_L14:;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":505
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1226
+ *                 r_max = dmax(r_max,r[idx[c]])
  * 
- *         # fill output arrays with sorted neighbors
- *         for i in range(neighbors.n-1,-1,-1):             # <<<<<<<<<<<<<<
- *             neighbor = heappop(&neighbors) # FIXME: neighbors may be realloced
- *             result_indices[i] = neighbor.contents.intdata
+ *         if n_inner==0:             # <<<<<<<<<<<<<<
+ *             pass
+ *         elif node1.split_dim==-1:
  */
-  for (__pyx_v_i = (__pyx_v_neighbors.n - 1); __pyx_v_i > -1; __pyx_v_i-=1) {
+  __pyx_1 = (__pyx_v_n_inner == 0);
+  if (__pyx_1) {
+    goto __pyx_L6;
+  }
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":506
- *         # fill output arrays with sorted neighbors
- *         for i in range(neighbors.n-1,-1,-1):
- *             neighbor = heappop(&neighbors) # FIXME: neighbors may be realloced             # <<<<<<<<<<<<<<
- *             result_indices[i] = neighbor.contents.intdata
- *             if p==1 or p==infinity:
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1228
+ *         if n_inner==0:
+ *             pass
+ *         elif node1.split_dim==-1:             # <<<<<<<<<<<<<<
+ *             if node2.split_dim==-1:
+ *                 for i in range(node1.start_idx,node1.end_idx):
  */
-    __pyx_v_neighbor = __pyx_f_5scipy_7spatial_7ckdtree_heappop((&__pyx_v_neighbors));
+  __pyx_1 = (__pyx_v_node1->split_dim == -1);
+  if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":507
- *         for i in range(neighbors.n-1,-1,-1):
- *             neighbor = heappop(&neighbors) # FIXME: neighbors may be realloced
- *             result_indices[i] = neighbor.contents.intdata             # <<<<<<<<<<<<<<
- *             if p==1 or p==infinity:
- *                 result_distances[i] = -neighbor.priority
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1229
+ *             pass
+ *         elif node1.split_dim==-1:
+ *             if node2.split_dim==-1:             # <<<<<<<<<<<<<<
+ *                 for i in range(node1.start_idx,node1.end_idx):
+ *                     for j in range(node2.start_idx,node2.end_idx):
  */
-    (__pyx_v_result_indices[__pyx_v_i]) = __pyx_v_neighbor.contents.intdata;
+    __pyx_1 = (__pyx_v_node2->split_dim == -1);
+    if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":508
- *             neighbor = heappop(&neighbors) # FIXME: neighbors may be realloced
- *             result_indices[i] = neighbor.contents.intdata
- *             if p==1 or p==infinity:             # <<<<<<<<<<<<<<
- *                 result_distances[i] = -neighbor.priority
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1230
+ *         elif node1.split_dim==-1:
+ *             if node2.split_dim==-1:
+ *                 for i in range(node1.start_idx,node1.end_idx):             # <<<<<<<<<<<<<<
+ *                     for j in range(node2.start_idx,node2.end_idx):
+ *                         d = _distance_p(
+ */
+      __pyx_2 = __pyx_v_node1->end_idx;
+      for (__pyx_v_i = __pyx_v_node1->start_idx; __pyx_v_i < __pyx_2; __pyx_v_i+=1) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":1231
+ *             if node2.split_dim==-1:
+ *                 for i in range(node1.start_idx,node1.end_idx):
+ *                     for j in range(node2.start_idx,node2.end_idx):             # <<<<<<<<<<<<<<
+ *                         d = _distance_p(
+ *                                 self.raw_data+self.raw_indices[i]*self.m,
+ */
+        __pyx_3 = __pyx_v_node2->end_idx;
+        for (__pyx_v_j = __pyx_v_node2->start_idx; __pyx_v_j < __pyx_3; __pyx_v_j+=1) {
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":1235
+ *                                 self.raw_data+self.raw_indices[i]*self.m,
+ *                                 other.raw_data+other.raw_indices[j]*self.m,
+ *                                 p,self.m,r_max)             # <<<<<<<<<<<<<<
+ *                         for c in range(n_inner):
+ *                             if d<=r[inner_idx[c]]:
+ */
+          __pyx_v_d = __pyx_f_5scipy_7spatial_7ckdtree__distance_p((__pyx_v_self->raw_data + ((__pyx_v_self->raw_indices[__pyx_v_i]) * __pyx_v_self->m)), (__pyx_v_other->raw_data + ((__pyx_v_other->raw_indices[__pyx_v_j]) * __pyx_v_self->m)), __pyx_v_p, __pyx_v_self->m, __pyx_v_r_max);
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":1236
+ *                                 other.raw_data+other.raw_indices[j]*self.m,
+ *                                 p,self.m,r_max)
+ *                         for c in range(n_inner):             # <<<<<<<<<<<<<<
+ *                             if d<=r[inner_idx[c]]:
+ *                                 results[inner_idx[c]] += 1
+ */
+          for (__pyx_v_c = 0; __pyx_v_c < __pyx_v_n_inner; __pyx_v_c+=1) {
+
+            /* "/root/package/scipy/spatial/ckdtree.pyx":1237
+ *                                 p,self.m,r_max)
+ *                         for c in range(n_inner):
+ *                             if d<=r[inner_idx[c]]:             # <<<<<<<<<<<<<<
+ *                                 results[inner_idx[c]] += 1
  *             else:
  */
-    __pyx_3 = (__pyx_v_p == 1);
-    if (!__pyx_3) {
-      __pyx_3 = (__pyx_v_p == __pyx_v_5scipy_7spatial_7ckdtree_infinity);
-    }
-    if (__pyx_3) {
+            __pyx_1 = (__pyx_v_d <= (__pyx_v_r[(__pyx_v_inner_idx[__pyx_v_c])]));
+            if (__pyx_1) {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":509
- *             result_indices[i] = neighbor.contents.intdata
- *             if p==1 or p==infinity:
- *                 result_distances[i] = -neighbor.priority             # <<<<<<<<<<<<<<
+              /* "/root/package/scipy/spatial/ckdtree.pyx":1238
+ *                         for c in range(n_inner):
+ *                             if d<=r[inner_idx[c]]:
+ *                                 results[inner_idx[c]] += 1             # <<<<<<<<<<<<<<
  *             else:
- *                 result_distances[i] = (-neighbor.priority)**(1./p)
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)
  */
-      (__pyx_v_result_distances[__pyx_v_i]) = (-__pyx_v_neighbor.priority);
-      goto __pyx_L32;
+              (__pyx_v_results[(__pyx_v_inner_idx[__pyx_v_c])]) += 1;
+              goto __pyx_L14;
+            }
+            __pyx_L14:;
+          }
+        }
+      }
+      goto __pyx_L7;
     }
     /*else*/ {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":511
- *                 result_distances[i] = -neighbor.priority
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1240
+ *                                 results[inner_idx[c]] += 1
  *             else:
- *                 result_distances[i] = (-neighbor.priority)**(1./p)             # <<<<<<<<<<<<<<
- * 
- *         heapdestroy(&q)
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)             # <<<<<<<<<<<<<<
+ *                 self.__count_neighbors_traverse(other, results, r,
+ *                         inner_idx, n_inner,
+ */
+      __pyx_v_rect2 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes2, __pyx_v_mins2, __pyx_v_node2->split_dim, __pyx_v_node2->split, __pyx_v_self->m, 1);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1243
+ *                 self.__count_neighbors_traverse(other, results, r,
+ *                         inner_idx, n_inner,
+ *                         node1, maxes1, mins1, node2.less, rect2, rect2+self.m, p)             # <<<<<<<<<<<<<<
+ *                 free(rect2)
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
+ */
+      __pyx_4 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__count_neighbors_traverse(__pyx_v_self, __pyx_v_other, __pyx_v_results, __pyx_v_r, __pyx_v_inner_idx, __pyx_v_n_inner, __pyx_v_node1, __pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node2->less, __pyx_v_rect2, (__pyx_v_rect2 + __pyx_v_self->m), __pyx_v_p); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_4); __pyx_4 = 0;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1244
+ *                         inner_idx, n_inner,
+ *                         node1, maxes1, mins1, node2.less, rect2, rect2+self.m, p)
+ *                 free(rect2)             # <<<<<<<<<<<<<<
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
+ *                 self.__count_neighbors_traverse(other, results, r,
+ */
+      free(__pyx_v_rect2);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1245
+ *                         node1, maxes1, mins1, node2.less, rect2, rect2+self.m, p)
+ *                 free(rect2)
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)             # <<<<<<<<<<<<<<
+ *                 self.__count_neighbors_traverse(other, results, r,
+ *                         inner_idx, n_inner,
+ */
+      __pyx_v_rect2 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes2, __pyx_v_mins2, __pyx_v_node2->split_dim, __pyx_v_node2->split, __pyx_v_self->m, 0);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1248
+ *                 self.__count_neighbors_traverse(other, results, r,
+ *                         inner_idx, n_inner,
+ *                         node1, maxes1, mins1, node2.greater, rect2, rect2+self.m, p)             # <<<<<<<<<<<<<<
+ *                 free(rect2)
+ *         else:
  */
-      (__pyx_v_result_distances[__pyx_v_i]) = pow((-__pyx_v_neighbor.priority), (1. / __pyx_v_p));
+      __pyx_4 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__count_neighbors_traverse(__pyx_v_self, __pyx_v_other, __pyx_v_results, __pyx_v_r, __pyx_v_inner_idx, __pyx_v_n_inner, __pyx_v_node1, __pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node2->greater, __pyx_v_rect2, (__pyx_v_rect2 + __pyx_v_self->m), __pyx_v_p); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1246; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_4); __pyx_4 = 0;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1249
+ *                         inner_idx, n_inner,
+ *                         node1, maxes1, mins1, node2.greater, rect2, rect2+self.m, p)
+ *                 free(rect2)             # <<<<<<<<<<<<<<
+ *         else:
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)
+ */
+      free(__pyx_v_rect2);
     }
-    __pyx_L32:;
+    __pyx_L7:;
+    goto __pyx_L6;
   }
+  /*else*/ {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":513
- *                 result_distances[i] = (-neighbor.priority)**(1./p)
- * 
- *         heapdestroy(&q)             # <<<<<<<<<<<<<<
- *         heapdestroy(&neighbors)
- * 
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1251
+ *                 free(rect2)
+ *         else:
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)             # <<<<<<<<<<<<<<
+ *             self.__count_neighbors_traverse(other, results, r,
+ *                     inner_idx, n_inner,
  */
-  __pyx_1 = __pyx_f_5scipy_7spatial_7ckdtree_heapdestroy((&__pyx_v_q)); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+    __pyx_v_rect1 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node1->split_dim, __pyx_v_node1->split, __pyx_v_self->m, 1);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1254
+ *             self.__count_neighbors_traverse(other, results, r,
+ *                     inner_idx, n_inner,
+ *                     node1.less, rect1, rect1+self.m, node2, maxes2, mins2, p)             # <<<<<<<<<<<<<<
+ *             free(rect1)
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+ */
+    __pyx_4 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__count_neighbors_traverse(__pyx_v_self, __pyx_v_other, __pyx_v_results, __pyx_v_r, __pyx_v_inner_idx, __pyx_v_n_inner, __pyx_v_node1->less, __pyx_v_rect1, (__pyx_v_rect1 + __pyx_v_self->m), __pyx_v_node2, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_p); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1252; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_4); __pyx_4 = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1255
+ *                     inner_idx, n_inner,
+ *                     node1.less, rect1, rect1+self.m, node2, maxes2, mins2, p)
+ *             free(rect1)             # <<<<<<<<<<<<<<
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+ *             self.__count_neighbors_traverse(other, results, r,
+ */
+    free(__pyx_v_rect1);
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":514
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1256
+ *                     node1.less, rect1, rect1+self.m, node2, maxes2, mins2, p)
+ *             free(rect1)
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)             # <<<<<<<<<<<<<<
+ *             self.__count_neighbors_traverse(other, results, r,
+ *                     inner_idx, n_inner,
+ */
+    __pyx_v_rect1 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node1->split_dim, __pyx_v_node1->split, __pyx_v_self->m, 0);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1259
+ *             self.__count_neighbors_traverse(other, results, r,
+ *                     inner_idx, n_inner,
+ *                     node1.greater, rect1, rect1+self.m, node2, maxes2, mins2, p)             # <<<<<<<<<<<<<<
+ *             free(rect1)
+ *         free(inner_idx)
+ */
+    __pyx_4 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__count_neighbors_traverse(__pyx_v_self, __pyx_v_other, __pyx_v_results, __pyx_v_r, __pyx_v_inner_idx, __pyx_v_n_inner, __pyx_v_node1->greater, __pyx_v_rect1, (__pyx_v_rect1 + __pyx_v_self->m), __pyx_v_node2, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_p); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1257; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_4); __pyx_4 = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1260
+ *                     inner_idx, n_inner,
+ *                     node1.greater, rect1, rect1+self.m, node2, maxes2, mins2, p)
+ *             free(rect1)             # <<<<<<<<<<<<<<
+ *         free(inner_idx)
  * 
- *         heapdestroy(&q)
- *         heapdestroy(&neighbors)             # <<<<<<<<<<<<<<
+ */
+    free(__pyx_v_rect1);
+  }
+  __pyx_L6:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1261
+ *                     node1.greater, rect1, rect1+self.m, node2, maxes2, mins2, p)
+ *             free(rect1)
+ *         free(inner_idx)             # <<<<<<<<<<<<<<
  * 
- *     def query(cKDTree self, object x, int k=1, double eps=0, double p=2,
+ *     def count_neighbors(cKDTree self, cKDTree other, object r, double p=2.):
  */
-  __pyx_1 = __pyx_f_5scipy_7spatial_7ckdtree_heapdestroy((&__pyx_v_neighbors)); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 514; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  free(__pyx_v_inner_idx);
 
+  __pyx_r = Py_None; Py_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_WriteUnraisable("scipy.spatial.ckdtree.cKDTree.__query");
+  Py_XDECREF(__pyx_4);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__count_neighbors_traverse");
+  __pyx_r = 0;
   __pyx_L0:;
+  return __pyx_r;
 }
 
-/* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":516
- *         heapdestroy(&neighbors)
+/* "/root/package/scipy/spatial/ckdtree.pyx":1263
+ *         free(inner_idx)
+ * 
+ *     def count_neighbors(cKDTree self, cKDTree other, object r, double p=2.):             # <<<<<<<<<<<<<<
+ *         """Count how many nearby pairs can be formed.
  * 
- *     def query(cKDTree self, object x, int k=1, double eps=0, double p=2,             # <<<<<<<<<<<<<<
- *             double distance_upper_bound=infinity):
- *         """query the kd-tree for nearest neighbors
  */
 
-static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_query[] = "query the kd-tree for nearest neighbors\n\n        Parameters:\n        ===========\n\n        x : array-like, last dimension self.m\n            An array of points to query.\n        k : integer\n            The number of nearest neighbors to return.\n        eps : nonnegative float\n            Return approximate nearest neighbors; the kth returned value \n            is guaranteed to be no further than (1+eps) times the \n            distance to the real kth nearest neighbor.\n        p : float, 1<=p<=infinity\n            Which Minkowski p-norm to use. \n            1 is the sum-of-absolute-values \"Manhattan\" distance\n            2 is the usual Euclidean distance\n            infinity is the maximum-coordinate-difference distance\n        distance_upper_bound : nonnegative float\n            Return only neighbors within this distance. This is used to prune\n            tree searches, so if you are doing a series of nearest-neighbor\n            queries, it may help to supply the distance to the nearest neighbor\n            of the most recent point.\n\n        Returns:\n        ========\n        \n        d : array of floats\n            The distances to the nearest neighbors. \n            If x has shape tuple+(self.m,), then d has shape tuple+(k,).\n            Missing neighbors are indicated with infinite distances.\n        i : array of integers\n            The locations of the neighbors in self.data.\n            If x has shape tuple+(self.m,), then i has shape tuple+(k,).\n            Missing neighbors are indicated with self.n.\n        ";
-static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_x = 0;
-  int __pyx_v_k;
-  double __pyx_v_eps;
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_count_neighbors(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_count_neighbors[] = "Count how many nearby pairs can be formed.\n\n        Count the number of pairs (x1,x2) can be formed, with x1 drawn\n        from self and x2 drawn from other, and where distance(x1,x2,p)<=r.\n        This is the \"two-point correlation\" described in Gray and Moore 2000,\n        \"N-body problems in statistical learning\", and the code here is based\n        on their algorithm.\n\n        Parameters\n        ==========\n\n        other : cKDTree\n\n        r : float or one-dimensional array of floats\n            The radius to produce a count for. Multiple radii are searched with a single\n            tree traversal.\n        p : float, 1<=p<=infinity\n            Which Minkowski p-norm to use\n\n        Returns\n        =======\n\n        result : integer or one-dimensional array of integers\n            The number of pairs. Note that this is internally stored in a numpy int,\n            and so may overflow if very large (two billion).\n        ";
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_count_neighbors(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_other = 0;
+  PyObject *__pyx_v_r = 0;
   double __pyx_v_p;
-  double __pyx_v_distance_upper_bound;
-  PyArrayObject *__pyx_v_ii;
-  PyArrayObject *__pyx_v_dd;
-  PyArrayObject *__pyx_v_xx;
-  int __pyx_v_c;
+  PyArrayObject *__pyx_v_rr;
+  PyArrayObject *__pyx_v_results;
+  PyArrayObject *__pyx_v_idx;
+  int __pyx_v_n;
   PyObject *__pyx_v_single;
-  PyObject *__pyx_v_retshape;
-  PyObject *__pyx_v_n;
-  Py_buffer __pyx_bstruct_ii;
-  Py_ssize_t __pyx_bstride_0_ii = 0;
-  Py_ssize_t __pyx_bstride_1_ii = 0;
-  Py_ssize_t __pyx_bshape_0_ii = 0;
-  Py_ssize_t __pyx_bshape_1_ii = 0;
-  Py_buffer __pyx_bstruct_xx;
-  Py_ssize_t __pyx_bstride_0_xx = 0;
-  Py_ssize_t __pyx_bstride_1_xx = 0;
-  Py_ssize_t __pyx_bshape_0_xx = 0;
-  Py_ssize_t __pyx_bshape_1_xx = 0;
-  Py_buffer __pyx_bstruct_dd;
-  Py_ssize_t __pyx_bstride_0_dd = 0;
-  Py_ssize_t __pyx_bstride_1_dd = 0;
-  Py_ssize_t __pyx_bshape_0_dd = 0;
-  Py_ssize_t __pyx_bshape_1_dd = 0;
+  Py_buffer __pyx_bstruct_idx;
+  Py_ssize_t __pyx_bstride_0_idx = 0;
+  Py_ssize_t __pyx_bshape_0_idx = 0;
+  Py_buffer __pyx_bstruct_rr;
+  Py_ssize_t __pyx_bstride_0_rr = 0;
+  Py_ssize_t __pyx_bshape_0_rr = 0;
+  Py_buffer __pyx_bstruct_results;
+  Py_ssize_t __pyx_bstride_0_results = 0;
+  Py_ssize_t __pyx_bshape_0_results = 0;
   PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
+  int __pyx_1;
   PyObject *__pyx_2 = 0;
   PyObject *__pyx_3 = 0;
-  int __pyx_4;
+  PyObject *__pyx_4 = 0;
   PyObject *__pyx_5 = 0;
-  Py_ssize_t __pyx_6 = 0;
-  PyObject *__pyx_7 = 0;
-  int __pyx_8;
-  PyObject *__pyx_t_1 = NULL;
-  PyArrayObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
+  PyObject *__pyx_6 = 0;
+  Py_ssize_t __pyx_7 = 0;
+  PyArrayObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  PyArrayObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_6 = NULL;
   PyArrayObject *__pyx_t_7 = NULL;
-  long __pyx_t_8;
+  PyArrayObject *__pyx_t_8 = NULL;
   long __pyx_t_9;
-  long __pyx_t_10;
-  long __pyx_t_11;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_x,&__pyx_kp_k,&__pyx_kp_eps,&__pyx_kp_p,&__pyx_kp_23,0};
-  __pyx_v_k = 1;
-  __pyx_v_eps = ((double)0);
-  __pyx_v_p = ((double)2);
-  __pyx_v_distance_upper_bound = __pyx_k_24;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_other,&__pyx_kp_r,&__pyx_kp_p,0};
+  __pyx_v_p = 2.;
   if (unlikely(__pyx_kwds)) {
-    PyObject* values[5] = {0,0,0,0,0};
+    PyObject* values[3] = {0,0,0};
     Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
     switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
       case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -3769,764 +10109,1002 @@ static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query(PyObject *__py
     }
     switch (PyTuple_GET_SIZE(__pyx_args)) {
       case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_x);
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_other);
       if (likely(values[0])) kw_args--;
       else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_kp_r);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("count_neighbors", 0, 2, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1263; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "query") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 516; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_x = values[0];
-    if (values[1]) {
-      __pyx_v_k = __pyx_PyInt_int(values[1]); if (unlikely((__pyx_v_k == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 516; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "count_neighbors") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1263; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
+    __pyx_v_other = ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)values[0]);
+    __pyx_v_r = values[1];
     if (values[2]) {
-      __pyx_v_eps = __pyx_PyFloat_AsDouble(values[2]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 516; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[3]) {
-      __pyx_v_p = __pyx_PyFloat_AsDouble(values[3]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 516; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[4]) {
-      __pyx_v_distance_upper_bound = __pyx_PyFloat_AsDouble(values[4]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_p = __pyx_PyFloat_AsDouble(values[2]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1263; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
   } else {
     switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  5: __pyx_v_distance_upper_bound = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  4: __pyx_v_p = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 516; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  3: __pyx_v_eps = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 516; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  2: __pyx_v_k = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_k == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 516; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  1: __pyx_v_x = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  3:
+      __pyx_v_p = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1263; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  2:
+      __pyx_v_r = PyTuple_GET_ITEM(__pyx_args, 1);
+      __pyx_v_other = ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)PyTuple_GET_ITEM(__pyx_args, 0));
       break;
       default: goto __pyx_L5_argtuple_error;
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("query", 0, 1, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 516; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("count_neighbors", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1263; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.query");
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.count_neighbors");
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  Py_INCREF(__pyx_v_x);
-  __pyx_v_ii = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  __pyx_v_dd = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  __pyx_v_xx = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_rr = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_results = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
+  __pyx_v_idx = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
   __pyx_v_single = Py_None; Py_INCREF(Py_None);
-  __pyx_v_retshape = Py_None; Py_INCREF(Py_None);
-  __pyx_v_n = Py_None; Py_INCREF(Py_None);
-  __pyx_bstruct_ii.buf = NULL;
-  __pyx_bstruct_dd.buf = NULL;
-  __pyx_bstruct_xx.buf = NULL;
-
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":558
- *         cdef np.ndarray[double, ndim=2] xx
- *         cdef int c
- *         x = np.asarray(x).astype(np.float)             # <<<<<<<<<<<<<<
- *         if np.shape(x)[-1] != self.m:
- *             raise ValueError("x must consist of vectors of length %d but has shape %s" % (self.m, np.shape(x)))
- */
-  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_2 = PyObject_GetAttr(__pyx_1, __pyx_kp_asarray); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(__pyx_v_x);
-  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_v_x);
-  __pyx_3 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-  __pyx_2 = PyObject_GetAttr(__pyx_3, __pyx_kp_astype); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_3 = PyObject_GetAttr(__pyx_1, __pyx_kp_float); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_3);
-  __pyx_3 = 0;
-  __pyx_3 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-  Py_DECREF(__pyx_v_x);
-  __pyx_v_x = __pyx_3;
-  __pyx_3 = 0;
-
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":559
- *         cdef int c
- *         x = np.asarray(x).astype(np.float)
- *         if np.shape(x)[-1] != self.m:             # <<<<<<<<<<<<<<
- *             raise ValueError("x must consist of vectors of length %d but has shape %s" % (self.m, np.shape(x)))
+  __pyx_bstruct_rr.buf = NULL;
+  __pyx_bstruct_results.buf = NULL;
+  __pyx_bstruct_idx.buf = NULL;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_other), __pyx_ptype_5scipy_7spatial_7ckdtree_cKDTree, 1, "other", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1263; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1294
+ *         cdef np.ndarray[int, ndim=1] idx
+ *         cdef int n
+ *         if other.m!=self.m:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Trees have different dimensionality")
  *         if p<1:
  */
-  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 559; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_1 = PyObject_GetAttr(__pyx_2, __pyx_kp_shape); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 559; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 559; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(__pyx_v_x);
-  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_x);
-  __pyx_2 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 559; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-  __pyx_1 = __Pyx_GetItemInt(__pyx_2, -1, 0); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 559; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  __pyx_3 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 559; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_2 = PyObject_RichCompare(__pyx_1, __pyx_3, Py_NE); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 559; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  __pyx_4 = __Pyx_PyObject_IsTrue(__pyx_2); if (unlikely(__pyx_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 559; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  if (__pyx_4) {
+  __pyx_1 = (__pyx_v_other->m != ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m);
+  if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":560
- *         x = np.asarray(x).astype(np.float)
- *         if np.shape(x)[-1] != self.m:
- *             raise ValueError("x must consist of vectors of length %d but has shape %s" % (self.m, np.shape(x)))             # <<<<<<<<<<<<<<
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1295
+ *         cdef int n
+ *         if other.m!=self.m:
+ *             raise ValueError("Trees have different dimensionality")             # <<<<<<<<<<<<<<
  *         if p<1:
  *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
  */
-    __pyx_1 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyObject_GetAttr(__pyx_3, __pyx_kp_shape); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(__pyx_v_x);
-    PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_x);
-    __pyx_5 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-    __pyx_2 = PyTuple_New(2); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_1);
-    PyTuple_SET_ITEM(__pyx_2, 1, __pyx_5);
-    __pyx_1 = 0;
-    __pyx_5 = 0;
-    __pyx_t_1 = PyNumber_Remainder(__pyx_kp_28, ((PyObject *)__pyx_2)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_kp_49);
+    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_kp_49);
+    __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-    __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_3, 0, __pyx_t_1);
-    __pyx_t_1 = 0;
-    __pyx_1 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-    __Pyx_Raise(__pyx_1, 0, 0);
-    Py_DECREF(__pyx_1); __pyx_1 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_Raise(__pyx_3, 0, 0);
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L6;
   }
   __pyx_L6:;
-
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":561
- *         if np.shape(x)[-1] != self.m:
- *             raise ValueError("x must consist of vectors of length %d but has shape %s" % (self.m, np.shape(x)))
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1296
+ *         if other.m!=self.m:
+ *             raise ValueError("Trees have different dimensionality")
  *         if p<1:             # <<<<<<<<<<<<<<
  *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
- *         if len(x.shape)==1:
+ *         if np.shape(r)==():
  */
-  __pyx_4 = (__pyx_v_p < 1);
-  if (__pyx_4) {
+  __pyx_1 = (__pyx_v_p < 1);
+  if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":562
- *             raise ValueError("x must consist of vectors of length %d but has shape %s" % (self.m, np.shape(x)))
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1297
+ *             raise ValueError("Trees have different dimensionality")
  *         if p<1:
  *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")             # <<<<<<<<<<<<<<
- *         if len(x.shape)==1:
+ *         if np.shape(r)==():
  *             single = True
  */
-    __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(__pyx_kp_29);
-    PyTuple_SET_ITEM(__pyx_5, 0, __pyx_kp_29);
-    __pyx_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-    __Pyx_Raise(__pyx_2, 0, 0);
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1297; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_kp_50);
+    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_kp_50);
+    __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1297; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+    __Pyx_Raise(__pyx_3, 0, 0);
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1297; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     goto __pyx_L7;
   }
   __pyx_L7:;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":563
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1298
  *         if p<1:
  *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
- *         if len(x.shape)==1:             # <<<<<<<<<<<<<<
+ *         if np.shape(r)==():             # <<<<<<<<<<<<<<
  *             single = True
- *             x = x[np.newaxis,:]
+ *             rr = np.array([r],dtype=np.float)
  */
-  __pyx_3 = PyObject_GetAttr(__pyx_v_x, __pyx_kp_shape); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_6 = PyObject_Length(__pyx_3); if (unlikely(__pyx_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyObject_GetAttr(__pyx_2, __pyx_kp_shape); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_v_r);
+  PyTuple_SET_ITEM(__pyx_2, 0, __pyx_v_r);
+  __pyx_4 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   Py_DECREF(__pyx_3); __pyx_3 = 0;
-  __pyx_4 = (__pyx_6 == 1);
-  if (__pyx_4) {
+  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+  __pyx_3 = PyObject_RichCompare(__pyx_4, ((PyObject *)__pyx_empty_tuple), Py_EQ); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_4); __pyx_4 = 0;
+  __pyx_1 = __Pyx_PyObject_IsTrue(__pyx_3); if (unlikely(__pyx_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":564
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1299
  *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
- *         if len(x.shape)==1:
+ *         if np.shape(r)==():
  *             single = True             # <<<<<<<<<<<<<<
- *             x = x[np.newaxis,:]
- *         else:
+ *             rr = np.array([r],dtype=np.float)
+ *         elif len(np.shape(r))==1:
  */
-    __pyx_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_2 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     Py_DECREF(__pyx_v_single);
-    __pyx_v_single = __pyx_1;
-    __pyx_1 = 0;
+    __pyx_v_single = __pyx_2;
+    __pyx_2 = 0;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":565
- *         if len(x.shape)==1:
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1300
+ *         if np.shape(r)==():
  *             single = True
- *             x = x[np.newaxis,:]             # <<<<<<<<<<<<<<
- *         else:
+ *             rr = np.array([r],dtype=np.float)             # <<<<<<<<<<<<<<
+ *         elif len(np.shape(r))==1:
  *             single = False
  */
-    __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 565; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyObject_GetAttr(__pyx_5, __pyx_kp_newaxis); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 565; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    __pyx_3 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 565; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_1 = PyTuple_New(2); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 565; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_1, 0, __pyx_2);
-    PyTuple_SET_ITEM(__pyx_1, 1, __pyx_3);
+    __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_3 = PyObject_GetAttr(__pyx_4, __pyx_kp_array); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_4); __pyx_4 = 0;
+    __pyx_2 = PyList_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_v_r);
+    PyList_SET_ITEM(__pyx_2, 0, __pyx_v_r);
+    __pyx_4 = PyTuple_New(1); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyTuple_SET_ITEM(__pyx_4, 0, ((PyObject *)__pyx_2));
     __pyx_2 = 0;
-    __pyx_3 = 0;
-    __pyx_5 = PyObject_GetItem(__pyx_v_x, ((PyObject *)__pyx_1)); if (!__pyx_5) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 565; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-    Py_DECREF(__pyx_v_x);
-    __pyx_v_x = __pyx_5;
+    __pyx_2 = PyDict_New(); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_6 = PyObject_GetAttr(__pyx_5, __pyx_kp_float); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_5); __pyx_5 = 0;
+    if (PyDict_SetItem(__pyx_2, __pyx_kp_dtype, __pyx_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_6); __pyx_6 = 0;
+    __pyx_5 = PyEval_CallObjectWithKeywords(__pyx_3, ((PyObject *)__pyx_4), ((PyObject *)__pyx_2)); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+    if (!(__Pyx_TypeTest(__pyx_5, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = ((PyArrayObject *)__pyx_5);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_rr);
+    __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_1, &__pyx_bstruct_rr, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+    if (unlikely(__pyx_t_2 < 0)) 
+    {
+        PyErr_Fetch(&__pyx_t_3, &__pyx_t_4, &__pyx_t_5);
+        if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_rr, &__pyx_bstruct_rr, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+            Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+            __Pyx_RaiseBufferFallbackError();
+          } else {
+            PyErr_Restore(__pyx_t_3, __pyx_t_4, __pyx_t_5);
+        }
+    }
+    __pyx_bstride_0_rr = __pyx_bstruct_rr.strides[0];
+    __pyx_bshape_0_rr = __pyx_bstruct_rr.shape[0];
+    if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = 0;
+    Py_DECREF(((PyObject *)__pyx_v_rr));
+    __pyx_v_rr = ((PyArrayObject *)__pyx_5);
     __pyx_5 = 0;
     goto __pyx_L8;
   }
-  /*else*/ {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":567
- *             x = x[np.newaxis,:]
- *         else:
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1301
+ *             single = True
+ *             rr = np.array([r],dtype=np.float)
+ *         elif len(np.shape(r))==1:             # <<<<<<<<<<<<<<
+ *             single = False
+ *             rr = np.array(r,dtype=np.float)
+ */
+  __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyObject_GetAttr(__pyx_6, __pyx_kp_shape); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_6); __pyx_6 = 0;
+  __pyx_4 = PyTuple_New(1); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_v_r);
+  PyTuple_SET_ITEM(__pyx_4, 0, __pyx_v_r);
+  __pyx_2 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_4), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+  __pyx_7 = PyObject_Length(__pyx_2); if (unlikely(__pyx_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_1 = (__pyx_7 == 1);
+  if (__pyx_1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1302
+ *             rr = np.array([r],dtype=np.float)
+ *         elif len(np.shape(r))==1:
  *             single = False             # <<<<<<<<<<<<<<
- *         retshape = np.shape(x)[:-1]
- *         n = np.prod(retshape)
+ *             rr = np.array(r,dtype=np.float)
+ *         else:
  */
-    __pyx_2 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 567; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_5 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     Py_DECREF(__pyx_v_single);
-    __pyx_v_single = __pyx_2;
-    __pyx_2 = 0;
+    __pyx_v_single = __pyx_5;
+    __pyx_5 = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1303
+ *         elif len(np.shape(r))==1:
+ *             single = False
+ *             rr = np.array(r,dtype=np.float)             # <<<<<<<<<<<<<<
+ *         else:
+ *             raise ValueError("r must be either a single value or a one-dimensional array of values")
+ */
+    __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_3 = PyObject_GetAttr(__pyx_6, __pyx_kp_array); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_6); __pyx_6 = 0;
+    __pyx_4 = PyTuple_New(1); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_v_r);
+    PyTuple_SET_ITEM(__pyx_4, 0, __pyx_v_r);
+    __pyx_2 = PyDict_New(); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_6 = PyObject_GetAttr(__pyx_5, __pyx_kp_float); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_5); __pyx_5 = 0;
+    if (PyDict_SetItem(__pyx_2, __pyx_kp_dtype, __pyx_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_6); __pyx_6 = 0;
+    __pyx_5 = PyEval_CallObjectWithKeywords(__pyx_3, ((PyObject *)__pyx_4), ((PyObject *)__pyx_2)); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+    if (!(__Pyx_TypeTest(__pyx_5, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = ((PyArrayObject *)__pyx_5);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_rr);
+    __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_1, &__pyx_bstruct_rr, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+    if (unlikely(__pyx_t_2 < 0)) 
+    {
+        PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_3);
+        if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_rr, &__pyx_bstruct_rr, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+            Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_3);
+            __Pyx_RaiseBufferFallbackError();
+          } else {
+            PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_3);
+        }
+    }
+    __pyx_bstride_0_rr = __pyx_bstruct_rr.strides[0];
+    __pyx_bshape_0_rr = __pyx_bstruct_rr.shape[0];
+    if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = 0;
+    Py_DECREF(((PyObject *)__pyx_v_rr));
+    __pyx_v_rr = ((PyArrayObject *)__pyx_5);
+    __pyx_5 = 0;
+    goto __pyx_L8;
+  }
+  /*else*/ {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1305
+ *             rr = np.array(r,dtype=np.float)
+ *         else:
+ *             raise ValueError("r must be either a single value or a one-dimensional array of values")             # <<<<<<<<<<<<<<
+ *         n = rr.shape[0]
+ *         if p!=1 and p!=infinity:
+ */
+    __pyx_6 = PyTuple_New(1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_kp_51);
+    PyTuple_SET_ITEM(__pyx_6, 0, __pyx_kp_51);
+    __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_6), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
+    __Pyx_Raise(__pyx_3, 0, 0);
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_L8:;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":568
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1306
  *         else:
- *             single = False
- *         retshape = np.shape(x)[:-1]             # <<<<<<<<<<<<<<
- *         n = np.prod(retshape)
- *         xx = np.reshape(x,(n,self.m))
+ *             raise ValueError("r must be either a single value or a one-dimensional array of values")
+ *         n = rr.shape[0]             # <<<<<<<<<<<<<<
+ *         if p!=1 and p!=infinity:
+ *             rr = rr**p
  */
-  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_1 = PyObject_GetAttr(__pyx_3, __pyx_kp_shape); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(__pyx_v_x);
-  PyTuple_SET_ITEM(__pyx_5, 0, __pyx_v_x);
-  __pyx_2 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-  __pyx_3 = PySequence_GetSlice(__pyx_2, 0, -1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 568; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  Py_DECREF(__pyx_v_retshape);
-  __pyx_v_retshape = __pyx_3;
-  __pyx_3 = 0;
+  __pyx_v_n = (__pyx_v_rr->dimensions[0]);
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":569
- *             single = False
- *         retshape = np.shape(x)[:-1]
- *         n = np.prod(retshape)             # <<<<<<<<<<<<<<
- *         xx = np.reshape(x,(n,self.m))
- *         xx = np.ascontiguousarray(xx)
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1307
+ *             raise ValueError("r must be either a single value or a one-dimensional array of values")
+ *         n = rr.shape[0]
+ *         if p!=1 and p!=infinity:             # <<<<<<<<<<<<<<
+ *             rr = rr**p
+ *         results = np.zeros(n,dtype=int)
  */
-  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 569; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_5 = PyObject_GetAttr(__pyx_1, __pyx_kp_prod); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 569; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 569; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(__pyx_v_retshape);
-  PyTuple_SET_ITEM(__pyx_2, 0, __pyx_v_retshape);
-  __pyx_3 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 569; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_5); __pyx_5 = 0;
-  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-  Py_DECREF(__pyx_v_n);
-  __pyx_v_n = __pyx_3;
-  __pyx_3 = 0;
+  __pyx_1 = (__pyx_v_p != 1);
+  if (__pyx_1) {
+    __pyx_1 = (__pyx_v_p != __pyx_v_5scipy_7spatial_7ckdtree_infinity);
+  }
+  if (__pyx_1) {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":570
- *         retshape = np.shape(x)[:-1]
- *         n = np.prod(retshape)
- *         xx = np.reshape(x,(n,self.m))             # <<<<<<<<<<<<<<
- *         xx = np.ascontiguousarray(xx)
- *         dd = np.empty((n,k),dtype=np.float)
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1308
+ *         n = rr.shape[0]
+ *         if p!=1 and p!=infinity:
+ *             rr = rr**p             # <<<<<<<<<<<<<<
+ *         results = np.zeros(n,dtype=int)
+ *         idx = np.arange(n,dtype='i')
  */
-  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_5 = PyObject_GetAttr(__pyx_1, __pyx_kp_reshape); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  __pyx_2 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_3 = PyTuple_New(2); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(__pyx_v_n);
-  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_n);
-  PyTuple_SET_ITEM(__pyx_3, 1, __pyx_2);
-  __pyx_2 = 0;
-  __pyx_1 = PyTuple_New(2); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(__pyx_v_x);
-  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_v_x);
-  PyTuple_SET_ITEM(__pyx_1, 1, ((PyObject *)__pyx_3));
-  __pyx_3 = 0;
-  __pyx_2 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_5); __pyx_5 = 0;
-  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-  if (!(__Pyx_TypeTest(__pyx_2, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = ((PyArrayObject *)__pyx_2);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_xx);
-  __pyx_t_3 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_2, &__pyx_bstruct_xx, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0);
-  if (unlikely(__pyx_t_3 < 0)) 
-  {
-      PyErr_Fetch(&__pyx_t_1, &__pyx_t_4, &__pyx_t_5);
-      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_xx, &__pyx_bstruct_xx, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
-          Py_XDECREF(__pyx_t_1); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
-          __Pyx_RaiseBufferFallbackError();
-        } else {
-          PyErr_Restore(__pyx_t_1, __pyx_t_4, __pyx_t_5);
-      }
+    __pyx_4 = PyFloat_FromDouble(__pyx_v_p); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyNumber_Power(((PyObject *)__pyx_v_rr), __pyx_4, Py_None); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_4); __pyx_4 = 0;
+    if (!(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = ((PyArrayObject *)__pyx_t_3);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_rr);
+    __pyx_t_2 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_1, &__pyx_bstruct_rr, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+    if (unlikely(__pyx_t_2 < 0)) 
+    {
+        PyErr_Fetch(&__pyx_t_4, &__pyx_t_5, &__pyx_t_6);
+        if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_rr, &__pyx_bstruct_rr, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+            Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_6);
+            __Pyx_RaiseBufferFallbackError();
+          } else {
+            PyErr_Restore(__pyx_t_4, __pyx_t_5, __pyx_t_6);
+        }
+    }
+    __pyx_bstride_0_rr = __pyx_bstruct_rr.strides[0];
+    __pyx_bshape_0_rr = __pyx_bstruct_rr.shape[0];
+    if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = 0;
+    Py_DECREF(((PyObject *)__pyx_v_rr));
+    __pyx_v_rr = ((PyArrayObject *)__pyx_t_3);
+    __pyx_t_3 = 0;
+    goto __pyx_L9;
   }
-  __pyx_bstride_0_xx = __pyx_bstruct_xx.strides[0]; __pyx_bstride_1_xx = __pyx_bstruct_xx.strides[1];
-  __pyx_bshape_0_xx = __pyx_bstruct_xx.shape[0]; __pyx_bshape_1_xx = __pyx_bstruct_xx.shape[1];
-  if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 570; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = 0;
-  Py_DECREF(((PyObject *)__pyx_v_xx));
-  __pyx_v_xx = ((PyArrayObject *)__pyx_2);
-  __pyx_2 = 0;
+  __pyx_L9:;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":571
- *         n = np.prod(retshape)
- *         xx = np.reshape(x,(n,self.m))
- *         xx = np.ascontiguousarray(xx)             # <<<<<<<<<<<<<<
- *         dd = np.empty((n,k),dtype=np.float)
- *         dd.fill(infinity)
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1309
+ *         if p!=1 and p!=infinity:
+ *             rr = rr**p
+ *         results = np.zeros(n,dtype=int)             # <<<<<<<<<<<<<<
+ *         idx = np.arange(n,dtype='i')
+ *         self.__count_neighbors_traverse(other, <np.int_t*>results.data,
  */
-  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_5 = PyObject_GetAttr(__pyx_3, __pyx_kp_ascontiguousarray); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(((PyObject *)__pyx_v_xx));
-  PyTuple_SET_ITEM(__pyx_1, 0, ((PyObject *)__pyx_v_xx));
-  __pyx_2 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_2, __pyx_kp_zeros); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_6 = PyInt_FromLong(__pyx_v_n); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_6);
+  __pyx_6 = 0;
+  __pyx_4 = PyDict_New(); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_4, __pyx_kp_dtype, ((PyObject *)((PyObject*)&PyInt_Type))) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_3), ((PyObject *)__pyx_4)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   Py_DECREF(__pyx_5); __pyx_5 = 0;
-  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-  if (!(__Pyx_TypeTest(__pyx_2, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = ((PyArrayObject *)__pyx_2);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_xx);
-  __pyx_t_3 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_2, &__pyx_bstruct_xx, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0);
-  if (unlikely(__pyx_t_3 < 0)) 
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+  if (!(__Pyx_TypeTest(__pyx_2, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = ((PyArrayObject *)__pyx_2);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_results);
+  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_int_t((PyObject*)__pyx_t_7, &__pyx_bstruct_results, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
   {
-      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_1);
-      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_xx, &__pyx_bstruct_xx, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
-          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_1);
+      PyErr_Fetch(&__pyx_t_3, &__pyx_t_6, &__pyx_t_5);
+      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int_t((PyObject*)__pyx_v_results, &__pyx_bstruct_results, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_3); Py_XDECREF(__pyx_t_6); Py_XDECREF(__pyx_t_5);
           __Pyx_RaiseBufferFallbackError();
         } else {
-          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_1);
+          PyErr_Restore(__pyx_t_3, __pyx_t_6, __pyx_t_5);
       }
   }
-  __pyx_bstride_0_xx = __pyx_bstruct_xx.strides[0]; __pyx_bstride_1_xx = __pyx_bstruct_xx.strides[1];
-  __pyx_bshape_0_xx = __pyx_bstruct_xx.shape[0]; __pyx_bshape_1_xx = __pyx_bstruct_xx.shape[1];
-  if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 571; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = 0;
-  Py_DECREF(((PyObject *)__pyx_v_xx));
-  __pyx_v_xx = ((PyArrayObject *)__pyx_2);
+  __pyx_bstride_0_results = __pyx_bstruct_results.strides[0];
+  __pyx_bshape_0_results = __pyx_bstruct_results.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_results));
+  __pyx_v_results = ((PyArrayObject *)__pyx_2);
   __pyx_2 = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":572
- *         xx = np.reshape(x,(n,self.m))
- *         xx = np.ascontiguousarray(xx)
- *         dd = np.empty((n,k),dtype=np.float)             # <<<<<<<<<<<<<<
- *         dd.fill(infinity)
- *         ii = np.empty((n,k),dtype='i')
- */
-  __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_5 = PyObject_GetAttr(__pyx_3, __pyx_kp_empty); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  __pyx_1 = PyInt_FromLong(__pyx_v_k); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_2 = PyTuple_New(2); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(__pyx_v_n);
-  PyTuple_SET_ITEM(__pyx_2, 0, __pyx_v_n);
-  PyTuple_SET_ITEM(__pyx_2, 1, __pyx_1);
-  __pyx_1 = 0;
-  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  PyTuple_SET_ITEM(__pyx_3, 0, ((PyObject *)__pyx_2));
-  __pyx_2 = 0;
-  __pyx_1 = PyDict_New(); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_7 = PyObject_GetAttr(__pyx_2, __pyx_kp_float); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  if (PyDict_SetItem(__pyx_1, __pyx_kp_dtype, __pyx_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_7); __pyx_7 = 0;
-  __pyx_2 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_3), ((PyObject *)__pyx_1)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1310
+ *             rr = rr**p
+ *         results = np.zeros(n,dtype=int)
+ *         idx = np.arange(n,dtype='i')             # <<<<<<<<<<<<<<
+ *         self.__count_neighbors_traverse(other, <np.int_t*>results.data,
+ *                 <double*>rr.data, <int*>idx.data, n,
+ */
+  __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyObject_GetAttr(__pyx_6, __pyx_kp_arange); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_6); __pyx_6 = 0;
+  __pyx_3 = PyInt_FromLong(__pyx_v_n); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyTuple_New(1); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_4, 0, __pyx_3);
+  __pyx_3 = 0;
+  __pyx_2 = PyDict_New(); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_2, __pyx_kp_dtype, __pyx_kp_52) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_6 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_4), ((PyObject *)__pyx_2)); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   Py_DECREF(__pyx_5); __pyx_5 = 0;
-  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-  if (!(__Pyx_TypeTest(__pyx_2, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_6 = ((PyArrayObject *)__pyx_2);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_dd);
-  __pyx_t_3 = __Pyx_GetBuffer_double((PyObject*)__pyx_t_6, &__pyx_bstruct_dd, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0);
-  if (unlikely(__pyx_t_3 < 0)) 
+  Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
+  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+  if (!(__Pyx_TypeTest(__pyx_6, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = ((PyArrayObject *)__pyx_6);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_idx);
+  __pyx_t_2 = __Pyx_GetBuffer_int((PyObject*)__pyx_t_8, &__pyx_bstruct_idx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0);
+  if (unlikely(__pyx_t_2 < 0)) 
   {
-      PyErr_Fetch(&__pyx_t_1, &__pyx_t_4, &__pyx_t_5);
-      if (unlikely(__Pyx_GetBuffer_double((PyObject*)__pyx_v_dd, &__pyx_bstruct_dd, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
-          Py_XDECREF(__pyx_t_1); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5);
+      PyErr_Fetch(&__pyx_t_5, &__pyx_t_6, &__pyx_t_3);
+      if (unlikely(__Pyx_GetBuffer_int((PyObject*)__pyx_v_idx, &__pyx_bstruct_idx, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {
+          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_6); Py_XDECREF(__pyx_t_3);
           __Pyx_RaiseBufferFallbackError();
         } else {
-          PyErr_Restore(__pyx_t_1, __pyx_t_4, __pyx_t_5);
+          PyErr_Restore(__pyx_t_5, __pyx_t_6, __pyx_t_3);
       }
   }
-  __pyx_bstride_0_dd = __pyx_bstruct_dd.strides[0]; __pyx_bstride_1_dd = __pyx_bstruct_dd.strides[1];
-  __pyx_bshape_0_dd = __pyx_bstruct_dd.shape[0]; __pyx_bshape_1_dd = __pyx_bstruct_dd.shape[1];
-  if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_6 = 0;
-  Py_DECREF(((PyObject *)__pyx_v_dd));
-  __pyx_v_dd = ((PyArrayObject *)__pyx_2);
-  __pyx_2 = 0;
+  __pyx_bstride_0_idx = __pyx_bstruct_idx.strides[0];
+  __pyx_bshape_0_idx = __pyx_bstruct_idx.shape[0];
+  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = 0;
+  Py_DECREF(((PyObject *)__pyx_v_idx));
+  __pyx_v_idx = ((PyArrayObject *)__pyx_6);
+  __pyx_6 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1314
+ *                 <double*>rr.data, <int*>idx.data, n,
+ *                 self.tree, self.raw_maxes, self.raw_mins,
+ *                 other.tree, other.raw_maxes, other.raw_mins, p)             # <<<<<<<<<<<<<<
+ *         if single:
+ *             return results[0]
+ */
+  __pyx_3 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__count_neighbors_traverse(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), __pyx_v_other, ((__pyx_t_5numpy_int_t *)__pyx_v_results->data), ((double *)__pyx_v_rr->data), ((int *)__pyx_v_idx->data), __pyx_v_n, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_maxes, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_mins, __pyx_v_other->tree, __pyx_v_other->raw_maxes, __pyx_v_other->raw_mins, __pyx_v_p); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1311; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1315
+ *                 self.tree, self.raw_maxes, self.raw_mins,
+ *                 other.tree, other.raw_maxes, other.raw_mins, p)
+ *         if single:             # <<<<<<<<<<<<<<
+ *             return results[0]
+ *         else:
+ */
+  __pyx_1 = __Pyx_PyObject_IsTrue(__pyx_v_single); if (unlikely(__pyx_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1315; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1316
+ *                 other.tree, other.raw_maxes, other.raw_mins, p)
+ *         if single:
+ *             return results[0]             # <<<<<<<<<<<<<<
+ *         else:
+ *             return results
+ */
+    __pyx_t_9 = 0;
+    __pyx_t_2 = -1;
+    if (__pyx_t_9 < 0) {
+      __pyx_t_9 += __pyx_bshape_0_results;
+      if (unlikely(__pyx_t_9 < 0)) __pyx_t_2 = 0;
+    } else if (unlikely(__pyx_t_9 >= __pyx_bshape_0_results)) __pyx_t_2 = 0;
+    if (unlikely(__pyx_t_2 != -1)) {
+        __Pyx_RaiseBufferIndexError(__pyx_t_2);
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __pyx_5 = PyInt_FromLong((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int_t *, __pyx_bstruct_results.buf, __pyx_t_9, __pyx_bstride_0_results))); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_r = __pyx_5;
+    __pyx_5 = 0;
+    goto __pyx_L0;
+    goto __pyx_L10;
+  }
+  /*else*/ {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1318
+ *             return results[0]
+ *         else:
+ *             return results             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    Py_INCREF(((PyObject *)__pyx_v_results));
+    __pyx_r = ((PyObject *)__pyx_v_results);
+    goto __pyx_L0;
+  }
+  __pyx_L10:;
+
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_2);
+  Py_XDECREF(__pyx_3);
+  Py_XDECREF(__pyx_4);
+  Py_XDECREF(__pyx_5);
+  Py_XDECREF(__pyx_6);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_idx);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_rr);
+    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_results);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.count_neighbors");
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_idx);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_rr);
+  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_results);
+  __pyx_L2:;
+  Py_DECREF(__pyx_v_rr);
+  Py_DECREF(__pyx_v_results);
+  Py_DECREF(__pyx_v_idx);
+  Py_DECREF(__pyx_v_single);
+  return __pyx_r;
+}
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":573
- *         xx = np.ascontiguousarray(xx)
- *         dd = np.empty((n,k),dtype=np.float)
- *         dd.fill(infinity)             # <<<<<<<<<<<<<<
- *         ii = np.empty((n,k),dtype='i')
- *         ii.fill(self.n)
+/* "/root/package/scipy/spatial/ckdtree.pyx":1321
+ * 
+ * 
+ *     cdef __sparse_distance_matrix_traverse(cKDTree self, cKDTree other,             # <<<<<<<<<<<<<<
+ *             object result,
+ *             innernode* node1, double* maxes1, double* mins1,
  */
-  __pyx_7 = PyObject_GetAttr(((PyObject *)__pyx_v_dd), __pyx_kp_fill); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_5 = PyFloat_FromDouble(__pyx_v_5scipy_7spatial_7ckdtree_infinity); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_5);
-  __pyx_5 = 0;
-  __pyx_1 = PyObject_Call(__pyx_7, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 573; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_7); __pyx_7 = 0;
-  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":574
- *         dd = np.empty((n,k),dtype=np.float)
- *         dd.fill(infinity)
- *         ii = np.empty((n,k),dtype='i')             # <<<<<<<<<<<<<<
- *         ii.fill(self.n)
- *         for c in range(n):
- */
-  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_5 = PyObject_GetAttr(__pyx_2, __pyx_kp_empty); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  __pyx_7 = PyInt_FromLong(__pyx_v_k); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_3 = PyTuple_New(2); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(__pyx_v_n);
-  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_n);
-  PyTuple_SET_ITEM(__pyx_3, 1, __pyx_7);
-  __pyx_7 = 0;
-  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  PyTuple_SET_ITEM(__pyx_1, 0, ((PyObject *)__pyx_3));
-  __pyx_3 = 0;
-  __pyx_2 = PyDict_New(); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyDict_SetItem(__pyx_2, __pyx_kp_dtype, __pyx_kp_30) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_7 = PyEval_CallObjectWithKeywords(__pyx_5, ((PyObject *)__pyx_1), ((PyObject *)__pyx_2)); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_5); __pyx_5 = 0;
-  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-  if (!(__Pyx_TypeTest(__pyx_7, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = ((PyArrayObject *)__pyx_7);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_ii);
-  __pyx_t_3 = __Pyx_GetBuffer_int((PyObject*)__pyx_t_7, &__pyx_bstruct_ii, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0);
-  if (unlikely(__pyx_t_3 < 0)) 
-  {
-      PyErr_Fetch(&__pyx_t_5, &__pyx_t_4, &__pyx_t_1);
-      if (unlikely(__Pyx_GetBuffer_int((PyObject*)__pyx_v_ii, &__pyx_bstruct_ii, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
-          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_1);
-          __Pyx_RaiseBufferFallbackError();
-        } else {
-          PyErr_Restore(__pyx_t_5, __pyx_t_4, __pyx_t_1);
-      }
-  }
-  __pyx_bstride_0_ii = __pyx_bstruct_ii.strides[0]; __pyx_bstride_1_ii = __pyx_bstruct_ii.strides[1];
-  __pyx_bshape_0_ii = __pyx_bstruct_ii.shape[0]; __pyx_bshape_1_ii = __pyx_bstruct_ii.shape[1];
-  if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = 0;
-  Py_DECREF(((PyObject *)__pyx_v_ii));
-  __pyx_v_ii = ((PyArrayObject *)__pyx_7);
-  __pyx_7 = 0;
+static  PyObject *__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___sparse_distance_matrix_traverse(struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_self, struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_other, PyObject *__pyx_v_result, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node1, double *__pyx_v_maxes1, double *__pyx_v_mins1, struct __pyx_t_5scipy_7spatial_7ckdtree_innernode *__pyx_v_node2, double *__pyx_v_maxes2, double *__pyx_v_mins2, double __pyx_v_max_distance, double __pyx_v_p) {
+  int __pyx_v_i;
+  int __pyx_v_j;
+  double __pyx_v_d;
+  double *__pyx_v_rect1;
+  double *__pyx_v_rect2;
+  PyObject *__pyx_r;
+  int __pyx_1;
+  int __pyx_2;
+  int __pyx_3;
+  PyObject *__pyx_4 = 0;
+  PyObject *__pyx_5 = 0;
+  PyObject *__pyx_6 = 0;
+  PyObject *__pyx_7 = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":575
- *         dd.fill(infinity)
- *         ii = np.empty((n,k),dtype='i')
- *         ii.fill(self.n)             # <<<<<<<<<<<<<<
- *         for c in range(n):
- *             self.__query(
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1330
+ *         cdef double* rect1
+ *         cdef double* rect2
+ *         if _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)>max_distance:             # <<<<<<<<<<<<<<
+ *             return
+ *         elif node1.split_dim==-1:
  */
-  __pyx_3 = PyObject_GetAttr(((PyObject *)__pyx_v_ii), __pyx_kp_fill); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 575; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_5 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 575; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_1 = PyTuple_New(1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 575; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  PyTuple_SET_ITEM(__pyx_1, 0, __pyx_5);
-  __pyx_5 = 0;
-  __pyx_2 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 575; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_1 = (__pyx_f_5scipy_7spatial_7ckdtree__min_distance_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_p, __pyx_v_self->m) > __pyx_v_max_distance);
+  if (__pyx_1) {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":576
- *         ii = np.empty((n,k),dtype='i')
- *         ii.fill(self.n)
- *         for c in range(n):             # <<<<<<<<<<<<<<
- *             self.__query(
- *                     (<double*>dd.data)+c*k,
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1331
+ *         cdef double* rect2
+ *         if _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)>max_distance:
+ *             return             # <<<<<<<<<<<<<<
+ *         elif node1.split_dim==-1:
+ *             if node2.split_dim==-1:
  */
-  __pyx_8 = __pyx_PyInt_int(__pyx_v_n); if (unlikely((__pyx_8 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 576; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  for (__pyx_v_c = 0; __pyx_v_c < __pyx_8; __pyx_v_c+=1) {
+    __pyx_r = Py_None; Py_INCREF(Py_None);
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":584
- *                     eps,
- *                     p,
- *                     distance_upper_bound)             # <<<<<<<<<<<<<<
- *         if single:
- *             if k==1:
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1332
+ *         if _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)>max_distance:
+ *             return
+ *         elif node1.split_dim==-1:             # <<<<<<<<<<<<<<
+ *             if node2.split_dim==-1:
+ *                 for i in range(node1.start_idx,node1.end_idx):
  */
-    ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__query(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), (((double *)__pyx_v_dd->data) + (__pyx_v_c * __pyx_v_k)), (((int *)__pyx_v_ii->data) + (__pyx_v_c * __pyx_v_k)), (((double *)__pyx_v_xx->data) + (__pyx_v_c * ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m)), __pyx_v_k, __pyx_v_eps, __pyx_v_p, __pyx_v_distance_upper_bound);
-  }
+  __pyx_1 = (__pyx_v_node1->split_dim == -1);
+  if (__pyx_1) {
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":585
- *                     p,
- *                     distance_upper_bound)
- *         if single:             # <<<<<<<<<<<<<<
- *             if k==1:
- *                 return dd[0,0], ii[0,0]
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1333
+ *             return
+ *         elif node1.split_dim==-1:
+ *             if node2.split_dim==-1:             # <<<<<<<<<<<<<<
+ *                 for i in range(node1.start_idx,node1.end_idx):
+ *                     for j in range(node2.start_idx,node2.end_idx):
  */
-  __pyx_4 = __Pyx_PyObject_IsTrue(__pyx_v_single); if (unlikely(__pyx_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 585; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__pyx_4) {
+    __pyx_1 = (__pyx_v_node2->split_dim == -1);
+    if (__pyx_1) {
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":586
- *                     distance_upper_bound)
- *         if single:
- *             if k==1:             # <<<<<<<<<<<<<<
- *                 return dd[0,0], ii[0,0]
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1334
+ *         elif node1.split_dim==-1:
+ *             if node2.split_dim==-1:
+ *                 for i in range(node1.start_idx,node1.end_idx):             # <<<<<<<<<<<<<<
+ *                     for j in range(node2.start_idx,node2.end_idx):
+ *                         d = _distance_p(
+ */
+      __pyx_2 = __pyx_v_node1->end_idx;
+      for (__pyx_v_i = __pyx_v_node1->start_idx; __pyx_v_i < __pyx_2; __pyx_v_i+=1) {
+
+        /* "/root/package/scipy/spatial/ckdtree.pyx":1335
+ *             if node2.split_dim==-1:
+ *                 for i in range(node1.start_idx,node1.end_idx):
+ *                     for j in range(node2.start_idx,node2.end_idx):             # <<<<<<<<<<<<<<
+ *                         d = _distance_p(
+ *                                 self.raw_data+self.raw_indices[i]*self.m,
+ */
+        __pyx_3 = __pyx_v_node2->end_idx;
+        for (__pyx_v_j = __pyx_v_node2->start_idx; __pyx_v_j < __pyx_3; __pyx_v_j+=1) {
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":1339
+ *                                 self.raw_data+self.raw_indices[i]*self.m,
+ *                                 other.raw_data+other.raw_indices[j]*self.m,
+ *                                 p,self.m,max_distance)             # <<<<<<<<<<<<<<
+ *                         if d<=max_distance:
+ *                             if p!=1 and p!=infinity:
+ */
+          __pyx_v_d = __pyx_f_5scipy_7spatial_7ckdtree__distance_p((__pyx_v_self->raw_data + ((__pyx_v_self->raw_indices[__pyx_v_i]) * __pyx_v_self->m)), (__pyx_v_other->raw_data + ((__pyx_v_other->raw_indices[__pyx_v_j]) * __pyx_v_self->m)), __pyx_v_p, __pyx_v_self->m, __pyx_v_max_distance);
+
+          /* "/root/package/scipy/spatial/ckdtree.pyx":1340
+ *                                 other.raw_data+other.raw_indices[j]*self.m,
+ *                                 p,self.m,max_distance)
+ *                         if d<=max_distance:             # <<<<<<<<<<<<<<
+ *                             if p!=1 and p!=infinity:
+ *                                 d = d**(1./p)
+ */
+          __pyx_1 = (__pyx_v_d <= __pyx_v_max_distance);
+          if (__pyx_1) {
+
+            /* "/root/package/scipy/spatial/ckdtree.pyx":1341
+ *                                 p,self.m,max_distance)
+ *                         if d<=max_distance:
+ *                             if p!=1 and p!=infinity:             # <<<<<<<<<<<<<<
+ *                                 d = d**(1./p)
+ *                             result[self.raw_indices[i],other.raw_indices[j]] = d
+ */
+            __pyx_1 = (__pyx_v_p != 1);
+            if (__pyx_1) {
+              __pyx_1 = (__pyx_v_p != __pyx_v_5scipy_7spatial_7ckdtree_infinity);
+            }
+            if (__pyx_1) {
+
+              /* "/root/package/scipy/spatial/ckdtree.pyx":1342
+ *                         if d<=max_distance:
+ *                             if p!=1 and p!=infinity:
+ *                                 d = d**(1./p)             # <<<<<<<<<<<<<<
+ *                             result[self.raw_indices[i],other.raw_indices[j]] = d
  *             else:
  */
-    __pyx_4 = (__pyx_v_k == 1);
-    if (__pyx_4) {
+              __pyx_v_d = pow(__pyx_v_d, (1. / __pyx_v_p));
+              goto __pyx_L10;
+            }
+            __pyx_L10:;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":587
- *         if single:
- *             if k==1:
- *                 return dd[0,0], ii[0,0]             # <<<<<<<<<<<<<<
+            /* "/root/package/scipy/spatial/ckdtree.pyx":1343
+ *                             if p!=1 and p!=infinity:
+ *                                 d = d**(1./p)
+ *                             result[self.raw_indices[i],other.raw_indices[j]] = d             # <<<<<<<<<<<<<<
  *             else:
- *                 return dd[0], ii[0]
- */
-      __pyx_t_8 = 0;
-      __pyx_t_9 = 0;
-      __pyx_t_3 = -1;
-      if (__pyx_t_8 < 0) {
-        __pyx_t_8 += __pyx_bshape_0_dd;
-        if (unlikely(__pyx_t_8 < 0)) __pyx_t_3 = 0;
-      } else if (unlikely(__pyx_t_8 >= __pyx_bshape_0_dd)) __pyx_t_3 = 0;
-      if (__pyx_t_9 < 0) {
-        __pyx_t_9 += __pyx_bshape_1_dd;
-        if (unlikely(__pyx_t_9 < 0)) __pyx_t_3 = 1;
-      } else if (unlikely(__pyx_t_9 >= __pyx_bshape_1_dd)) __pyx_t_3 = 1;
-      if (unlikely(__pyx_t_3 != -1)) {
-          __Pyx_RaiseBufferIndexError(__pyx_t_3);
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 587; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __pyx_7 = PyFloat_FromDouble((*__Pyx_BufPtrStrided2d(double *, __pyx_bstruct_dd.buf, __pyx_t_8, __pyx_bstride_0_dd, __pyx_t_9, __pyx_bstride_1_dd))); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 587; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_10 = 0;
-      __pyx_t_11 = 0;
-      __pyx_t_3 = -1;
-      if (__pyx_t_10 < 0) {
-        __pyx_t_10 += __pyx_bshape_0_ii;
-        if (unlikely(__pyx_t_10 < 0)) __pyx_t_3 = 0;
-      } else if (unlikely(__pyx_t_10 >= __pyx_bshape_0_ii)) __pyx_t_3 = 0;
-      if (__pyx_t_11 < 0) {
-        __pyx_t_11 += __pyx_bshape_1_ii;
-        if (unlikely(__pyx_t_11 < 0)) __pyx_t_3 = 1;
-      } else if (unlikely(__pyx_t_11 >= __pyx_bshape_1_ii)) __pyx_t_3 = 1;
-      if (unlikely(__pyx_t_3 != -1)) {
-          __Pyx_RaiseBufferIndexError(__pyx_t_3);
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 587; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)
+ */
+            __pyx_4 = PyFloat_FromDouble(__pyx_v_d); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            __pyx_5 = PyInt_FromLong((__pyx_v_self->raw_indices[__pyx_v_i])); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            __pyx_6 = PyInt_FromLong((__pyx_v_other->raw_indices[__pyx_v_j])); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            __pyx_7 = PyTuple_New(2); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            PyTuple_SET_ITEM(__pyx_7, 0, __pyx_5);
+            PyTuple_SET_ITEM(__pyx_7, 1, __pyx_6);
+            __pyx_5 = 0;
+            __pyx_6 = 0;
+            if (PyObject_SetItem(__pyx_v_result, ((PyObject *)__pyx_7), __pyx_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+            Py_DECREF(((PyObject *)__pyx_7)); __pyx_7 = 0;
+            Py_DECREF(__pyx_4); __pyx_4 = 0;
+            goto __pyx_L9;
+          }
+          __pyx_L9:;
+        }
       }
-      __pyx_5 = PyInt_FromLong((*__Pyx_BufPtrStrided2d(int *, __pyx_bstruct_ii.buf, __pyx_t_10, __pyx_bstride_0_ii, __pyx_t_11, __pyx_bstride_1_ii))); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 587; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_3 = PyTuple_New(2); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 587; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      PyTuple_SET_ITEM(__pyx_3, 0, __pyx_7);
-      PyTuple_SET_ITEM(__pyx_3, 1, __pyx_5);
-      __pyx_7 = 0;
-      __pyx_5 = 0;
-      __pyx_r = ((PyObject *)__pyx_3);
-      __pyx_3 = 0;
-      goto __pyx_L0;
-      goto __pyx_L12;
+      goto __pyx_L4;
     }
     /*else*/ {
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":589
- *                 return dd[0,0], ii[0,0]
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1345
+ *                             result[self.raw_indices[i],other.raw_indices[j]] = d
  *             else:
- *                 return dd[0], ii[0]             # <<<<<<<<<<<<<<
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)             # <<<<<<<<<<<<<<
+ *                 self.__sparse_distance_matrix_traverse(other, result,
+ *                         node1, maxes1, mins1, node2.less, rect2, rect2+self.m,
+ */
+      __pyx_v_rect2 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes2, __pyx_v_mins2, __pyx_v_node2->split_dim, __pyx_v_node2->split, __pyx_v_self->m, 1);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1348
+ *                 self.__sparse_distance_matrix_traverse(other, result,
+ *                         node1, maxes1, mins1, node2.less, rect2, rect2+self.m,
+ *                         max_distance, p)             # <<<<<<<<<<<<<<
+ *                 free(rect2)
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
+ */
+      __pyx_5 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__sparse_distance_matrix_traverse(__pyx_v_self, __pyx_v_other, __pyx_v_result, __pyx_v_node1, __pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node2->less, __pyx_v_rect2, (__pyx_v_rect2 + __pyx_v_self->m), __pyx_v_max_distance, __pyx_v_p); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1346; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_5); __pyx_5 = 0;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1349
+ *                         node1, maxes1, mins1, node2.less, rect2, rect2+self.m,
+ *                         max_distance, p)
+ *                 free(rect2)             # <<<<<<<<<<<<<<
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
+ *                 self.__sparse_distance_matrix_traverse(other, result,
+ */
+      free(__pyx_v_rect2);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1350
+ *                         max_distance, p)
+ *                 free(rect2)
+ *                 rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)             # <<<<<<<<<<<<<<
+ *                 self.__sparse_distance_matrix_traverse(other, result,
+ *                         node1, maxes1, mins1, node2.greater, rect2, rect2+self.m,
+ */
+      __pyx_v_rect2 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes2, __pyx_v_mins2, __pyx_v_node2->split_dim, __pyx_v_node2->split, __pyx_v_self->m, 0);
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1353
+ *                 self.__sparse_distance_matrix_traverse(other, result,
+ *                         node1, maxes1, mins1, node2.greater, rect2, rect2+self.m,
+ *                         max_distance, p)             # <<<<<<<<<<<<<<
+ *                 free(rect2)
  *         else:
- *             if k==1:
  */
-      __pyx_1 = __Pyx_GetItemInt(((PyObject *)__pyx_v_dd), 0, 0); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_2 = __Pyx_GetItemInt(((PyObject *)__pyx_v_ii), 0, 0); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_7 = PyTuple_New(2); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      PyTuple_SET_ITEM(__pyx_7, 0, __pyx_1);
-      PyTuple_SET_ITEM(__pyx_7, 1, __pyx_2);
-      __pyx_1 = 0;
-      __pyx_2 = 0;
-      __pyx_r = ((PyObject *)__pyx_7);
-      __pyx_7 = 0;
-      goto __pyx_L0;
+      __pyx_6 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__sparse_distance_matrix_traverse(__pyx_v_self, __pyx_v_other, __pyx_v_result, __pyx_v_node1, __pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node2->greater, __pyx_v_rect2, (__pyx_v_rect2 + __pyx_v_self->m), __pyx_v_max_distance, __pyx_v_p); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1351; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      Py_DECREF(__pyx_6); __pyx_6 = 0;
+
+      /* "/root/package/scipy/spatial/ckdtree.pyx":1354
+ *                         node1, maxes1, mins1, node2.greater, rect2, rect2+self.m,
+ *                         max_distance, p)
+ *                 free(rect2)             # <<<<<<<<<<<<<<
+ *         else:
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)
+ */
+      free(__pyx_v_rect2);
     }
-    __pyx_L12:;
-    goto __pyx_L11;
+    __pyx_L4:;
+    goto __pyx_L3;
+  }
+  /*else*/ {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1356
+ *                 free(rect2)
+ *         else:
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)             # <<<<<<<<<<<<<<
+ *             self.__sparse_distance_matrix_traverse(other, result,
+ *                     node1.less, rect1, rect1+self.m, node2, maxes2, mins2,
+ */
+    __pyx_v_rect1 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node1->split_dim, __pyx_v_node1->split, __pyx_v_self->m, 1);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1359
+ *             self.__sparse_distance_matrix_traverse(other, result,
+ *                     node1.less, rect1, rect1+self.m, node2, maxes2, mins2,
+ *                     max_distance, p)             # <<<<<<<<<<<<<<
+ *             free(rect1)
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+ */
+    __pyx_4 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__sparse_distance_matrix_traverse(__pyx_v_self, __pyx_v_other, __pyx_v_result, __pyx_v_node1->less, __pyx_v_rect1, (__pyx_v_rect1 + __pyx_v_self->m), __pyx_v_node2, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_max_distance, __pyx_v_p); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_4); __pyx_4 = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1360
+ *                     node1.less, rect1, rect1+self.m, node2, maxes2, mins2,
+ *                     max_distance, p)
+ *             free(rect1)             # <<<<<<<<<<<<<<
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+ *             self.__sparse_distance_matrix_traverse(other, result,
+ */
+    free(__pyx_v_rect1);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1361
+ *                     max_distance, p)
+ *             free(rect1)
+ *             rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)             # <<<<<<<<<<<<<<
+ *             self.__sparse_distance_matrix_traverse(other, result,
+ *                     node1.greater, rect1, rect1+self.m, node2, maxes2, mins2,
+ */
+    __pyx_v_rect1 = __pyx_f_5scipy_7spatial_7ckdtree__split_rectangle(__pyx_v_maxes1, __pyx_v_mins1, __pyx_v_node1->split_dim, __pyx_v_node1->split, __pyx_v_self->m, 0);
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1364
+ *             self.__sparse_distance_matrix_traverse(other, result,
+ *                     node1.greater, rect1, rect1+self.m, node2, maxes2, mins2,
+ *                     max_distance, p)             # <<<<<<<<<<<<<<
+ *             free(rect1)
+ * 
+ */
+    __pyx_7 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self->__pyx_vtab)->__sparse_distance_matrix_traverse(__pyx_v_self, __pyx_v_other, __pyx_v_result, __pyx_v_node1->greater, __pyx_v_rect1, (__pyx_v_rect1 + __pyx_v_self->m), __pyx_v_node2, __pyx_v_maxes2, __pyx_v_mins2, __pyx_v_max_distance, __pyx_v_p); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1362; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(__pyx_7); __pyx_7 = 0;
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1365
+ *                     node1.greater, rect1, rect1+self.m, node2, maxes2, mins2,
+ *                     max_distance, p)
+ *             free(rect1)             # <<<<<<<<<<<<<<
+ * 
+ *     def sparse_distance_matrix(cKDTree self, cKDTree other,
+ */
+    free(__pyx_v_rect1);
+  }
+  __pyx_L3:;
+
+  __pyx_r = Py_None; Py_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  Py_XDECREF(__pyx_4);
+  Py_XDECREF(__pyx_5);
+  Py_XDECREF(__pyx_6);
+  Py_XDECREF(__pyx_7);
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.__sparse_distance_matrix_traverse");
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "/root/package/scipy/spatial/ckdtree.pyx":1367
+ *             free(rect1)
+ * 
+ *     def sparse_distance_matrix(cKDTree self, cKDTree other,             # <<<<<<<<<<<<<<
+ *             double max_distance, double p=2.):
+ *         """Compute a sparse distance matrix
+ */
+
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_sparse_distance_matrix(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_sparse_distance_matrix[] = "Compute a sparse distance matrix\n\n        Computes a distance matrix between two cKDTrees, leaving as zero\n        any distance greater than max_distance.\n\n        Parameters\n        ==========\n\n        other : cKDTree\n\n        max_distance : positive float\n\n        p : float, 1<=p<=infinity\n            Which Minkowski p-norm to use\n\n        Returns\n        =======\n\n        result : dok_matrix\n            Sparse matrix representing the results in \"dictionary of keys\" format.\n        ";
+static PyObject *__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_sparse_distance_matrix(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *__pyx_v_other = 0;
+  double __pyx_v_max_distance;
+  double __pyx_v_p;
+  PyObject *__pyx_v_result;
+  PyObject *__pyx_r;
+  int __pyx_1;
+  PyObject *__pyx_2 = 0;
+  PyObject *__pyx_3 = 0;
+  PyObject *__pyx_4 = 0;
+  PyObject *__pyx_5 = 0;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_other,&__pyx_kp_max_distance,&__pyx_kp_p,0};
+  __pyx_v_p = 2.;
+  if (unlikely(__pyx_kwds)) {
+    PyObject* values[3] = {0,0,0};
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_other);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_kp_max_distance);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("sparse_distance_matrix", 0, 2, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1367; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "sparse_distance_matrix") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1367; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_other = ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)values[0]);
+    __pyx_v_max_distance = __pyx_PyFloat_AsDouble(values[1]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1368; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    if (values[2]) {
+      __pyx_v_p = __pyx_PyFloat_AsDouble(values[2]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1368; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+  } else {
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  3:
+      __pyx_v_p = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1368; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      case  2:
+      __pyx_v_max_distance = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1368; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_other = ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)PyTuple_GET_ITEM(__pyx_args, 0));
+      break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sparse_distance_matrix", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1367; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.sparse_distance_matrix");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_v_result = Py_None; Py_INCREF(Py_None);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_other), __pyx_ptype_5scipy_7spatial_7ckdtree_cKDTree, 1, "other", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1390
+ *             Sparse matrix representing the results in "dictionary of keys" format.
+ *         """
+ *         if other.m!=self.m:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Trees have different dimensionality")
+ *         if p<1:
+ */
+  __pyx_1 = (__pyx_v_other->m != ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->m);
+  if (__pyx_1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1391
+ *         """
+ *         if other.m!=self.m:
+ *             raise ValueError("Trees have different dimensionality")             # <<<<<<<<<<<<<<
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ */
+    __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_kp_53);
+    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_kp_53);
+    __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+    __Pyx_Raise(__pyx_3, 0, 0);
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1392
+ *         if other.m!=self.m:
+ *             raise ValueError("Trees have different dimensionality")
+ *         if p<1:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ *         result = scipy.sparse.dok_matrix((self.n,other.n))
+ */
+  __pyx_1 = (__pyx_v_p < 1);
+  if (__pyx_1) {
+
+    /* "/root/package/scipy/spatial/ckdtree.pyx":1393
+ *             raise ValueError("Trees have different dimensionality")
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")             # <<<<<<<<<<<<<<
+ *         result = scipy.sparse.dok_matrix((self.n,other.n))
+ *         self.__sparse_distance_matrix_traverse(other, result,
+ */
+    __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1393; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_INCREF(__pyx_kp_54);
+    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_kp_54);
+    __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1393; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
+    __Pyx_Raise(__pyx_3, 0, 0);
+    Py_DECREF(__pyx_3); __pyx_3 = 0;
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1393; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L7;
   }
-  /*else*/ {
+  __pyx_L7:;
 
-    /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":591
- *                 return dd[0], ii[0]
- *         else:
- *             if k==1:             # <<<<<<<<<<<<<<
- *                 return np.reshape(dd[...,0],retshape), np.reshape(ii[...,0],retshape)
- *             else:
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1394
+ *         if p<1:
+ *             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+ *         result = scipy.sparse.dok_matrix((self.n,other.n))             # <<<<<<<<<<<<<<
+ *         self.__sparse_distance_matrix_traverse(other, result,
+ *                 self.tree, self.raw_maxes, self.raw_mins,
  */
-    __pyx_4 = (__pyx_v_k == 1);
-    if (__pyx_4) {
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_scipy); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_3 = PyObject_GetAttr(__pyx_2, __pyx_kp_sparse); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_2 = PyObject_GetAttr(__pyx_3, __pyx_kp_dok_matrix); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_3); __pyx_3 = 0;
+  __pyx_3 = PyInt_FromLong(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->n); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_4 = PyInt_FromLong(__pyx_v_other->n); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_5 = PyTuple_New(2); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_5, 0, __pyx_3);
+  PyTuple_SET_ITEM(__pyx_5, 1, __pyx_4);
+  __pyx_3 = 0;
+  __pyx_4 = 0;
+  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  PyTuple_SET_ITEM(__pyx_3, 0, ((PyObject *)__pyx_5));
+  __pyx_5 = 0;
+  __pyx_4 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
+  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
+  Py_DECREF(__pyx_v_result);
+  __pyx_v_result = __pyx_4;
+  __pyx_4 = 0;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":592
- *         else:
- *             if k==1:
- *                 return np.reshape(dd[...,0],retshape), np.reshape(ii[...,0],retshape)             # <<<<<<<<<<<<<<
- *             else:
- *                 return np.reshape(dd,retshape+(k,)), np.reshape(ii,retshape+(k,))
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1398
+ *                 self.tree, self.raw_maxes, self.raw_mins,
+ *                 other.tree, other.raw_maxes, other.raw_mins,
+ *                 _distance_power(max_distance,p), p)             # <<<<<<<<<<<<<<
+ *         return result
  */
-      __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_3 = PyObject_GetAttr(__pyx_5, __pyx_kp_reshape); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_5); __pyx_5 = 0;
-      __pyx_1 = PyTuple_New(2); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(Py_Ellipsis);
-      PyTuple_SET_ITEM(__pyx_1, 0, Py_Ellipsis);
-      Py_INCREF(__pyx_int_0);
-      PyTuple_SET_ITEM(__pyx_1, 1, __pyx_int_0);
-      __pyx_2 = PyObject_GetItem(((PyObject *)__pyx_v_dd), ((PyObject *)__pyx_1)); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-      __pyx_7 = PyTuple_New(2); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      PyTuple_SET_ITEM(__pyx_7, 0, __pyx_2);
-      Py_INCREF(__pyx_v_retshape);
-      PyTuple_SET_ITEM(__pyx_7, 1, __pyx_v_retshape);
-      __pyx_2 = 0;
-      __pyx_5 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_7), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      Py_DECREF(((PyObject *)__pyx_7)); __pyx_7 = 0;
-      __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_2 = PyObject_GetAttr(__pyx_1, __pyx_kp_reshape); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_1); __pyx_1 = 0;
-      __pyx_3 = PyTuple_New(2); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(Py_Ellipsis);
-      PyTuple_SET_ITEM(__pyx_3, 0, Py_Ellipsis);
-      Py_INCREF(__pyx_int_0);
-      PyTuple_SET_ITEM(__pyx_3, 1, __pyx_int_0);
-      __pyx_7 = PyObject_GetItem(((PyObject *)__pyx_v_ii), ((PyObject *)__pyx_3)); if (!__pyx_7) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-      __pyx_1 = PyTuple_New(2); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      PyTuple_SET_ITEM(__pyx_1, 0, __pyx_7);
-      Py_INCREF(__pyx_v_retshape);
-      PyTuple_SET_ITEM(__pyx_1, 1, __pyx_v_retshape);
-      __pyx_7 = 0;
-      __pyx_3 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-      __pyx_7 = PyTuple_New(2); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      PyTuple_SET_ITEM(__pyx_7, 0, __pyx_5);
-      PyTuple_SET_ITEM(__pyx_7, 1, __pyx_3);
-      __pyx_5 = 0;
-      __pyx_3 = 0;
-      __pyx_r = ((PyObject *)__pyx_7);
-      __pyx_7 = 0;
-      goto __pyx_L0;
-      goto __pyx_L13;
-    }
-    /*else*/ {
+  __pyx_5 = ((struct __pyx_vtabstruct_5scipy_7spatial_7ckdtree_cKDTree *)((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->__pyx_vtab)->__sparse_distance_matrix_traverse(((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self), __pyx_v_other, __pyx_v_result, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->tree, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_maxes, ((struct __pyx_obj_5scipy_7spatial_7ckdtree_cKDTree *)__pyx_v_self)->raw_mins, __pyx_v_other->tree, __pyx_v_other->raw_maxes, __pyx_v_other->raw_mins, __pyx_f_5scipy_7spatial_7ckdtree__distance_power(__pyx_v_max_distance, __pyx_v_p), __pyx_v_p); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_5); __pyx_5 = 0;
 
-      /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":594
- *                 return np.reshape(dd[...,0],retshape), np.reshape(ii[...,0],retshape)
- *             else:
- *                 return np.reshape(dd,retshape+(k,)), np.reshape(ii,retshape+(k,))             # <<<<<<<<<<<<<<
- * 
+  /* "/root/package/scipy/spatial/ckdtree.pyx":1399
+ *                 other.tree, other.raw_maxes, other.raw_mins,
+ *                 _distance_power(max_distance,p), p)
+ *         return result             # <<<<<<<<<<<<<<
  */
-      __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_1 = PyObject_GetAttr(__pyx_2, __pyx_kp_reshape); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      __pyx_5 = PyInt_FromLong(__pyx_v_k); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      PyTuple_SET_ITEM(__pyx_3, 0, __pyx_5);
-      __pyx_5 = 0;
-      __pyx_t_1 = PyNumber_Add(__pyx_v_retshape, ((PyObject *)__pyx_3)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-      __pyx_7 = PyTuple_New(2); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(((PyObject *)__pyx_v_dd));
-      PyTuple_SET_ITEM(__pyx_7, 0, ((PyObject *)__pyx_v_dd));
-      PyTuple_SET_ITEM(__pyx_7, 1, __pyx_t_1);
-      __pyx_t_1 = 0;
-      __pyx_2 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_7), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_1); __pyx_1 = 0;
-      Py_DECREF(((PyObject *)__pyx_7)); __pyx_7 = 0;
-      __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_3 = PyObject_GetAttr(__pyx_5, __pyx_kp_reshape); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_5); __pyx_5 = 0;
-      __pyx_1 = PyInt_FromLong(__pyx_v_k); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_7 = PyTuple_New(1); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      PyTuple_SET_ITEM(__pyx_7, 0, __pyx_1);
-      __pyx_1 = 0;
-      __pyx_t_1 = PyNumber_Add(__pyx_v_retshape, ((PyObject *)__pyx_7)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(((PyObject *)__pyx_7)); __pyx_7 = 0;
-      __pyx_5 = PyTuple_New(2); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(((PyObject *)__pyx_v_ii));
-      PyTuple_SET_ITEM(__pyx_5, 0, ((PyObject *)__pyx_v_ii));
-      PyTuple_SET_ITEM(__pyx_5, 1, __pyx_t_1);
-      __pyx_t_1 = 0;
-      __pyx_1 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-      __pyx_7 = PyTuple_New(2); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      PyTuple_SET_ITEM(__pyx_7, 0, __pyx_2);
-      PyTuple_SET_ITEM(__pyx_7, 1, __pyx_1);
-      __pyx_2 = 0;
-      __pyx_1 = 0;
-      __pyx_r = ((PyObject *)__pyx_7);
-      __pyx_7 = 0;
-      goto __pyx_L0;
-    }
-    __pyx_L13:;
-  }
-  __pyx_L11:;
+  Py_INCREF(__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
 
   __pyx_r = Py_None; Py_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  Py_XDECREF(__pyx_1);
   Py_XDECREF(__pyx_2);
   Py_XDECREF(__pyx_3);
+  Py_XDECREF(__pyx_4);
   Py_XDECREF(__pyx_5);
-  Py_XDECREF(__pyx_7);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_ii);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_xx);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_dd);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.query");
+  __Pyx_AddTraceback("scipy.spatial.ckdtree.cKDTree.sparse_distance_matrix");
   __pyx_r = NULL;
-  goto __pyx_L2;
   __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_ii);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_xx);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_dd);
-  __pyx_L2:;
-  Py_DECREF(__pyx_v_ii);
-  Py_DECREF(__pyx_v_dd);
-  Py_DECREF(__pyx_v_xx);
-  Py_DECREF(__pyx_v_single);
-  Py_DECREF(__pyx_v_retshape);
-  Py_DECREF(__pyx_v_n);
-  Py_DECREF(__pyx_v_x);
+  Py_DECREF(__pyx_v_result);
   return __pyx_r;
 }
 
-/* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":50
+/* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":50
  *         # experimental exception made for __getbuffer__ and __releasebuffer__
  *         # -- the details of this may change.
  *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
@@ -4560,7 +11138,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_v_stack = ((PyObject *)Py_None); Py_INCREF(Py_None);
   __pyx_v_iterator = Py_None; Py_INCREF(Py_None);
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":56
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":56
  *             # of flags
  *             cdef int copy_shape, i, ndim
  *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
@@ -4569,7 +11147,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_ndim = PyArray_NDIM(((PyArrayObject *)__pyx_v_self));
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":58
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":58
  *             ndim = PyArray_NDIM(self)
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -4579,7 +11157,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_1 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
   if (__pyx_1) {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":59
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":59
  * 
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 copy_shape = 1             # <<<<<<<<<<<<<<
@@ -4591,7 +11169,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":61
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":61
  *                 copy_shape = 1
  *             else:
  *                 copy_shape = 0             # <<<<<<<<<<<<<<
@@ -4602,7 +11180,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L5:;
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":63
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":63
  *                 copy_shape = 0
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -4612,7 +11190,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_1 = ((__pyx_v_flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS);
   if (__pyx_1) {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":64
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":64
  * 
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -4623,7 +11201,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_1) {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":65
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":65
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
  *                 raise ValueError("ndarray is not C contiguous")             # <<<<<<<<<<<<<<
@@ -4642,7 +11220,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L6:;
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":67
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":67
  *                 raise ValueError("ndarray is not C contiguous")
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
@@ -4652,7 +11230,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_1 = ((__pyx_v_flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS);
   if (__pyx_1) {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":68
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":68
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
@@ -4663,7 +11241,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_1) {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":69
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":69
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
  *                 raise ValueError("ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
@@ -4682,7 +11260,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L7:;
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":71
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":71
  *                 raise ValueError("ndarray is not Fortran contiguous")
  * 
  *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
@@ -4691,7 +11269,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->buf = PyArray_DATA(((PyArrayObject *)__pyx_v_self));
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":72
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":72
  * 
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim             # <<<<<<<<<<<<<<
@@ -4700,7 +11278,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->ndim = __pyx_v_ndim;
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":73
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":73
  *             info.buf = PyArray_DATA(self)
  *             info.ndim = ndim
  *             if copy_shape:             # <<<<<<<<<<<<<<
@@ -4710,7 +11288,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_4 = __pyx_v_copy_shape;
   if (__pyx_4) {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":76
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":76
  *                 # Allocate new buffer for strides and shape info. This is allocated
  *                 # as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)             # <<<<<<<<<<<<<<
@@ -4719,7 +11297,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->strides = ((Py_ssize_t *)malloc((((sizeof(Py_ssize_t)) * __pyx_v_ndim) * 2)));
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":77
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":77
  *                 # as one block, strides first.
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)
  *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
@@ -4728,7 +11306,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":78
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":78
  *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):             # <<<<<<<<<<<<<<
@@ -4737,7 +11315,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     for (__pyx_v_i = 0; __pyx_v_i < __pyx_v_ndim; __pyx_v_i+=1) {
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":79
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":79
  *                 info.shape = info.strides + ndim
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
@@ -4746,7 +11324,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
       (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(((PyArrayObject *)__pyx_v_self))[__pyx_v_i]);
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":80
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":80
  *                 for i in range(ndim):
  *                     info.strides[i] = PyArray_STRIDES(self)[i]
  *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
@@ -4759,7 +11337,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":82
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":82
  *                     info.shape[i] = PyArray_DIMS(self)[i]
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
@@ -4768,7 +11346,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(((PyArrayObject *)__pyx_v_self)));
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":83
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":83
  *             else:
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
@@ -4779,7 +11357,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L8:;
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":84
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":84
  *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
@@ -4788,7 +11366,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->suboffsets = NULL;
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":85
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":85
  *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
@@ -4797,7 +11375,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->itemsize = PyArray_ITEMSIZE(((PyArrayObject *)__pyx_v_self));
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":86
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":86
  *             info.suboffsets = NULL
  *             info.itemsize = PyArray_ITEMSIZE(self)
  *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
@@ -4806,7 +11384,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_info->readonly = (!PyArray_ISWRITEABLE(((PyArrayObject *)__pyx_v_self)));
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":89
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":89
  * 
  *             cdef int t
  *             cdef char* f = NULL             # <<<<<<<<<<<<<<
@@ -4815,7 +11393,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_f = NULL;
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":90
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":90
  *             cdef int t
  *             cdef char* f = NULL
  *             cdef dtype descr = self.descr             # <<<<<<<<<<<<<<
@@ -4825,7 +11403,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   Py_INCREF(((PyObject *)((PyArrayObject *)__pyx_v_self)->descr));
   __pyx_v_descr = ((PyArrayObject *)__pyx_v_self)->descr;
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":93
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":93
  *             cdef list stack
  * 
  *             cdef bint hasfields = PyDataType_HASFIELDS(descr)             # <<<<<<<<<<<<<<
@@ -4834,7 +11412,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
   __pyx_v_hasfields = PyDataType_HASFIELDS(__pyx_v_descr);
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":103
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":103
  *             # functions).
  * 
  *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
@@ -4847,7 +11425,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   if (__pyx_1) {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":105
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":105
  *             if not hasfields and not copy_shape:
  *                 # do not call releasebuffer
  *                 info.obj = None             # <<<<<<<<<<<<<<
@@ -4861,7 +11439,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":108
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":108
  *             else:
  *                 # need to call releasebuffer
  *                 info.obj = self             # <<<<<<<<<<<<<<
@@ -4874,7 +11452,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   __pyx_L11:;
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":110
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":110
  *                 info.obj = self
  * 
  *             if not hasfields:             # <<<<<<<<<<<<<<
@@ -4884,7 +11462,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   __pyx_1 = (!__pyx_v_hasfields);
   if (__pyx_1) {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":111
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":111
  * 
  *             if not hasfields:
  *                 t = descr.type_num             # <<<<<<<<<<<<<<
@@ -4893,7 +11471,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_t = __pyx_v_descr->type_num;
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":112
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":112
  *             if not hasfields:
  *                 t = descr.type_num
  *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
@@ -4906,7 +11484,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_UBYTE:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":113
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":113
  *                 t = descr.type_num
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
@@ -4917,7 +11495,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_SHORT:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":114
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":114
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
@@ -4928,7 +11506,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_USHORT:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":115
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":115
  *                 elif t == NPY_UBYTE:       f = "B"
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
@@ -4939,7 +11517,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_INT:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":116
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":116
  *                 elif t == NPY_SHORT:       f = "h"
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
@@ -4950,7 +11528,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_UINT:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":117
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":117
  *                 elif t == NPY_USHORT:      f = "H"
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
@@ -4961,7 +11539,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_LONG:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":118
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":118
  *                 elif t == NPY_INT:         f = "i"
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
@@ -4972,7 +11550,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_ULONG:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":119
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":119
  *                 elif t == NPY_UINT:        f = "I"
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
@@ -4983,7 +11561,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_LONGLONG:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":120
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":120
  *                 elif t == NPY_LONG:        f = "l"
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
@@ -4994,7 +11572,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_ULONGLONG:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":121
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":121
  *                 elif t == NPY_ULONG:       f = "L"
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
@@ -5005,7 +11583,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_FLOAT:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":122
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":122
  *                 elif t == NPY_LONGLONG:    f = "q"
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
@@ -5016,7 +11594,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_DOUBLE:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":123
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":123
  *                 elif t == NPY_ULONGLONG:   f = "Q"
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
@@ -5027,7 +11605,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_LONGDOUBLE:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":124
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":124
  *                 elif t == NPY_FLOAT:       f = "f"
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
@@ -5038,7 +11616,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_CFLOAT:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":125
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":125
  *                 elif t == NPY_DOUBLE:      f = "d"
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
@@ -5049,7 +11627,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_CDOUBLE:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":126
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":126
  *                 elif t == NPY_LONGDOUBLE:  f = "g"
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
@@ -5060,7 +11638,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_CLONGDOUBLE:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":127
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":127
  *                 elif t == NPY_CFLOAT:      f = "Zf"
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
@@ -5071,7 +11649,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       case NPY_OBJECT:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":128
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":128
  *                 elif t == NPY_CDOUBLE:     f = "Zd"
  *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
  *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
@@ -5082,7 +11660,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
       default:
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":130
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":130
  *                 elif t == NPY_OBJECT:      f = "O"
  *                 else:
  *                     raise ValueError("unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
@@ -5103,7 +11681,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       break;
     }
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":131
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":131
  *                 else:
  *                     raise ValueError("unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f             # <<<<<<<<<<<<<<
@@ -5112,7 +11690,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->format = __pyx_v_f;
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":132
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":132
  *                     raise ValueError("unknown dtype code in numpy.pxd (%d)" % t)
  *                 info.format = f
  *                 return             # <<<<<<<<<<<<<<
@@ -5125,7 +11703,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   }
   /*else*/ {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":134
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":134
  *                 return
  *             else:
  *                 info.format = <char*>stdlib.malloc(255) # static size             # <<<<<<<<<<<<<<
@@ -5134,7 +11712,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_info->format = ((char *)malloc(255));
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":135
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":135
  *             else:
  *                 info.format = <char*>stdlib.malloc(255) # static size
  *                 f = info.format             # <<<<<<<<<<<<<<
@@ -5143,7 +11721,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
     __pyx_v_f = __pyx_v_info->format;
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":136
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":136
  *                 info.format = <char*>stdlib.malloc(255) # static size
  *                 f = info.format
  *                 stack = [iter(descr.fields.iteritems())]             # <<<<<<<<<<<<<<
@@ -5162,7 +11740,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
     __pyx_v_stack = __pyx_2;
     __pyx_2 = 0;
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":138
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":138
  *                 stack = [iter(descr.fields.iteritems())]
  * 
  *                 while True:             # <<<<<<<<<<<<<<
@@ -5173,7 +11751,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       __pyx_1 = 1;
       if (!__pyx_1) break;
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":139
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":139
  * 
  *                 while True:
  *                     iterator = stack[-1]             # <<<<<<<<<<<<<<
@@ -5185,7 +11763,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       __pyx_v_iterator = __pyx_3;
       __pyx_3 = 0;
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":140
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":140
  *                 while True:
  *                     iterator = stack[-1]
  *                     descr = None             # <<<<<<<<<<<<<<
@@ -5196,7 +11774,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       Py_DECREF(((PyObject *)__pyx_v_descr));
       __pyx_v_descr = ((PyArray_Descr *)Py_None);
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":141
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":141
  *                     iterator = stack[-1]
  *                     descr = None
  *                     while descr is None:             # <<<<<<<<<<<<<<
@@ -5207,7 +11785,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
         __pyx_1 = (((PyObject *)__pyx_v_descr) == Py_None);
         if (!__pyx_1) break;
 
-        /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":142
+        /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":142
  *                     descr = None
  *                     while descr is None:
  *                         try:             # <<<<<<<<<<<<<<
@@ -5219,7 +11797,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
           /*try:*/ {
 
-            /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":143
+            /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":143
  *                     while descr is None:
  *                         try:
  *                             descr = iterator.next()[1][0]             # <<<<<<<<<<<<<<
@@ -5246,7 +11824,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           Py_XDECREF(__pyx_2); __pyx_2 = 0;
           Py_XDECREF(__pyx_3); __pyx_3 = 0;
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":144
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":144
  *                         try:
  *                             descr = iterator.next()[1][0]
  *                         except StopIteration:             # <<<<<<<<<<<<<<
@@ -5258,7 +11836,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
             __Pyx_AddTraceback("numpy.__getbuffer__");
             if (__Pyx_GetException(&__pyx_2, &__pyx_3, &__pyx_5) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
 
-            /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":145
+            /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":145
  *                             descr = iterator.next()[1][0]
  *                         except StopIteration:
  *                             stack.pop()             # <<<<<<<<<<<<<<
@@ -5270,7 +11848,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
             Py_DECREF(__pyx_6); __pyx_6 = 0;
             Py_DECREF(__pyx_7); __pyx_7 = 0;
 
-            /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":146
+            /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":146
  *                         except StopIteration:
  *                             stack.pop()
  *                             if len(stack) > 0:             # <<<<<<<<<<<<<<
@@ -5281,7 +11859,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
             __pyx_1 = (__pyx_8 > 0);
             if (__pyx_1) {
 
-              /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":147
+              /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":147
  *                             stack.pop()
  *                             if len(stack) > 0:
  *                                 f[0] = 125 #"}"             # <<<<<<<<<<<<<<
@@ -5290,7 +11868,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
               (__pyx_v_f[0]) = 125;
 
-              /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":148
+              /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":148
  *                             if len(stack) > 0:
  *                                 f[0] = 125 #"}"
  *                                 f += 1             # <<<<<<<<<<<<<<
@@ -5299,7 +11877,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
               __pyx_v_f += 1;
 
-              /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":149
+              /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":149
  *                                 f[0] = 125 #"}"
  *                                 f += 1
  *                                 iterator = stack[-1]             # <<<<<<<<<<<<<<
@@ -5314,7 +11892,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
             }
             /*else*/ {
 
-              /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":151
+              /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":151
  *                                 iterator = stack[-1]
  *                             else:
  *                                 f[0] = 0 # Terminate string!             # <<<<<<<<<<<<<<
@@ -5323,7 +11901,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
               (__pyx_v_f[0]) = 0;
 
-              /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":152
+              /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":152
  *                             else:
  *                                 f[0] = 0 # Terminate string!
  *                                 return             # <<<<<<<<<<<<<<
@@ -5356,7 +11934,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
         }
       }
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":154
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":154
  *                                 return
  * 
  *                     hasfields = PyDataType_HASFIELDS(descr)             # <<<<<<<<<<<<<<
@@ -5365,7 +11943,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
       __pyx_v_hasfields = PyDataType_HASFIELDS(__pyx_v_descr);
 
-      /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":155
+      /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":155
  * 
  *                     hasfields = PyDataType_HASFIELDS(descr)
  *                     if not hasfields:             # <<<<<<<<<<<<<<
@@ -5375,7 +11953,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       __pyx_1 = (!__pyx_v_hasfields);
       if (__pyx_1) {
 
-        /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":156
+        /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":156
  *                     hasfields = PyDataType_HASFIELDS(descr)
  *                     if not hasfields:
  *                         t = descr.type_num             # <<<<<<<<<<<<<<
@@ -5384,7 +11962,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
         __pyx_v_t = __pyx_v_descr->type_num;
 
-        /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":157
+        /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":157
  *                     if not hasfields:
  *                         t = descr.type_num
  *                         if f - info.format > 240: # this should leave room for "T{" and "}" as well             # <<<<<<<<<<<<<<
@@ -5394,7 +11972,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
         __pyx_1 = ((__pyx_v_f - __pyx_v_info->format) > 240);
         if (__pyx_1) {
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":158
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":158
  *                         t = descr.type_num
  *                         if f - info.format > 240: # this should leave room for "T{" and "}" as well
  *                             raise RuntimeError("Format string allocated too short.")             # <<<<<<<<<<<<<<
@@ -5413,7 +11991,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
         }
         __pyx_L25:;
 
-        /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":161
+        /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":161
  * 
  *                         # Until ticket #99 is fixed, use integers to avoid warnings
  *                         if   t == NPY_BYTE:        f[0] =  98 #"b"             # <<<<<<<<<<<<<<
@@ -5426,7 +12004,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_UBYTE:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":162
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":162
  *                         # Until ticket #99 is fixed, use integers to avoid warnings
  *                         if   t == NPY_BYTE:        f[0] =  98 #"b"
  *                         elif t == NPY_UBYTE:       f[0] =  66 #"B"             # <<<<<<<<<<<<<<
@@ -5437,7 +12015,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_SHORT:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":163
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":163
  *                         if   t == NPY_BYTE:        f[0] =  98 #"b"
  *                         elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *                         elif t == NPY_SHORT:       f[0] = 104 #"h"             # <<<<<<<<<<<<<<
@@ -5448,7 +12026,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_USHORT:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":164
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":164
  *                         elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *                         elif t == NPY_SHORT:       f[0] = 104 #"h"
  *                         elif t == NPY_USHORT:      f[0] =  72 #"H"             # <<<<<<<<<<<<<<
@@ -5459,7 +12037,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_INT:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":165
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":165
  *                         elif t == NPY_SHORT:       f[0] = 104 #"h"
  *                         elif t == NPY_USHORT:      f[0] =  72 #"H"
  *                         elif t == NPY_INT:         f[0] = 105 #"i"             # <<<<<<<<<<<<<<
@@ -5470,7 +12048,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_UINT:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":166
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":166
  *                         elif t == NPY_USHORT:      f[0] =  72 #"H"
  *                         elif t == NPY_INT:         f[0] = 105 #"i"
  *                         elif t == NPY_UINT:        f[0] =  73 #"I"             # <<<<<<<<<<<<<<
@@ -5481,7 +12059,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_LONG:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":167
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":167
  *                         elif t == NPY_INT:         f[0] = 105 #"i"
  *                         elif t == NPY_UINT:        f[0] =  73 #"I"
  *                         elif t == NPY_LONG:        f[0] = 108 #"l"             # <<<<<<<<<<<<<<
@@ -5492,7 +12070,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_ULONG:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":168
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":168
  *                         elif t == NPY_UINT:        f[0] =  73 #"I"
  *                         elif t == NPY_LONG:        f[0] = 108 #"l"
  *                         elif t == NPY_ULONG:       f[0] = 76  #"L"             # <<<<<<<<<<<<<<
@@ -5503,7 +12081,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_LONGLONG:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":169
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":169
  *                         elif t == NPY_LONG:        f[0] = 108 #"l"
  *                         elif t == NPY_ULONG:       f[0] = 76  #"L"
  *                         elif t == NPY_LONGLONG:    f[0] = 113 #"q"             # <<<<<<<<<<<<<<
@@ -5514,7 +12092,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_ULONGLONG:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":170
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":170
  *                         elif t == NPY_ULONG:       f[0] = 76  #"L"
  *                         elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *                         elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"             # <<<<<<<<<<<<<<
@@ -5525,7 +12103,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_FLOAT:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":171
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":171
  *                         elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *                         elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *                         elif t == NPY_FLOAT:       f[0] = 102 #"f"             # <<<<<<<<<<<<<<
@@ -5536,7 +12114,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_DOUBLE:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":172
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":172
  *                         elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *                         elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *                         elif t == NPY_DOUBLE:      f[0] = 100 #"d"             # <<<<<<<<<<<<<<
@@ -5547,7 +12125,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_LONGDOUBLE:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":173
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":173
  *                         elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *                         elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *                         elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"             # <<<<<<<<<<<<<<
@@ -5558,7 +12136,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_CFLOAT:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":174
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":174
  *                         elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *                         elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *                         elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1             # <<<<<<<<<<<<<<
@@ -5571,7 +12149,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_CDOUBLE:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":175
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":175
  *                         elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *                         elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1
  *                         elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1             # <<<<<<<<<<<<<<
@@ -5584,7 +12162,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_CLONGDOUBLE:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":176
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":176
  *                         elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1
  *                         elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1
  *                         elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1             # <<<<<<<<<<<<<<
@@ -5597,7 +12175,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           case NPY_OBJECT:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":177
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":177
  *                         elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1
  *                         elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1
  *                         elif t == NPY_OBJECT:      f[0] = 79 #"O"             # <<<<<<<<<<<<<<
@@ -5608,7 +12186,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
           default:
 
-          /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":179
+          /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":179
  *                         elif t == NPY_OBJECT:      f[0] = 79 #"O"
  *                         else:
  *                             raise ValueError("unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
@@ -5629,7 +12207,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
           break;
         }
 
-        /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":180
+        /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":180
  *                         else:
  *                             raise ValueError("unknown dtype code in numpy.pxd (%d)" % t)
  *                         f += 1             # <<<<<<<<<<<<<<
@@ -5641,7 +12219,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
       }
       /*else*/ {
 
-        /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":182
+        /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":182
  *                         f += 1
  *                     else:
  *                         f[0] = 84 #"T"             # <<<<<<<<<<<<<<
@@ -5650,7 +12228,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
         (__pyx_v_f[0]) = 84;
 
-        /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":183
+        /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":183
  *                     else:
  *                         f[0] = 84 #"T"
  *                         f[1] = 123 #"{"             # <<<<<<<<<<<<<<
@@ -5659,7 +12237,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
         (__pyx_v_f[1]) = 123;
 
-        /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":184
+        /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":184
  *                         f[0] = 84 #"T"
  *                         f[1] = 123 #"{"
  *                         f += 2             # <<<<<<<<<<<<<<
@@ -5668,7 +12246,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
  */
         __pyx_v_f += 2;
 
-        /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":185
+        /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":185
  *                         f[1] = 123 #"{"
  *                         f += 2
  *                         stack.append(iter(descr.fields.iteritems()))             # <<<<<<<<<<<<<<
@@ -5709,7 +12287,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buf
   return __pyx_r;
 }
 
-/* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":187
+/* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":187
  *                         stack.append(iter(descr.fields.iteritems()))
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
@@ -5722,7 +12300,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   int __pyx_1;
   int __pyx_2;
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":188
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":188
  * 
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
@@ -5732,7 +12310,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __pyx_1 = PyArray_HASFIELDS(((PyArrayObject *)__pyx_v_self));
   if (__pyx_1) {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":189
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":189
  *         def __releasebuffer__(ndarray self, Py_buffer* info):
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)             # <<<<<<<<<<<<<<
@@ -5744,7 +12322,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   }
   __pyx_L5:;
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":190
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":190
  *             if PyArray_HASFIELDS(self):
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
@@ -5754,7 +12332,7 @@ static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, P
   __pyx_2 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
   if (__pyx_2) {
 
-    /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/numpy.pxd":191
+    /* "/tmp/cy/Cython-0.10.3/Cython/Includes/numpy.pxd":191
  *                 stdlib.free(info.format)
  *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
  *                 stdlib.free(info.strides)             # <<<<<<<<<<<<<<
@@ -5837,7 +12415,17 @@ static int __pyx_tp_clear_5scipy_7spatial_7ckdtree_cKDTree(PyObject *o) {
 }
 
 static struct PyMethodDef __pyx_methods_5scipy_7spatial_7ckdtree_cKDTree[] = {
+  {"__getstate__", (PyCFunction)__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___getstate__, METH_NOARGS, 0},
+  {"__setstate__", (PyCFunction)__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___setstate__, METH_O, 0},
+  {"__reduce__", (PyCFunction)__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree___reduce__, METH_NOARGS, 0},
+  {"save", (PyCFunction)__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_save, METH_O, __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_save},
+  {"_query_block", (PyCFunction)__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree__query_block, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree__query_block},
   {"query", (PyCFunction)__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_query},
+  {"query_ball_point", (PyCFunction)__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query_ball_point, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_query_ball_point},
+  {"query_ball_tree", (PyCFunction)__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query_ball_tree, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_query_ball_tree},
+  {"query_pairs", (PyCFunction)__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_query_pairs, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_query_pairs},
+  {"count_neighbors", (PyCFunction)__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_count_neighbors, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_count_neighbors},
+  {"sparse_distance_matrix", (PyCFunction)__pyx_pf_5scipy_7spatial_7ckdtree_7cKDTree_sparse_distance_matrix, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5scipy_7spatial_7ckdtree_7cKDTree_sparse_distance_matrix},
   {0, 0, 0, 0}
 };
 
@@ -5966,7 +12554,7 @@ PyTypeObject __pyx_type_5scipy_7spatial_7ckdtree_cKDTree = {
   0, /*tp_setattro*/
   &__pyx_tp_as_buffer_cKDTree, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  "kd-tree for quick nearest-neighbor lookup\n\n    This class provides an index into a set of k-dimensional points\n    which can be used to rapidly look up the nearest neighbors of any\n    point. \n\n    The algorithm used is described in Maneewongvatana and Mount 1999. \n    The general idea is that the kd-tree is a binary trie, each of whose\n    nodes represents an axis-aligned hyperrectangle. Each node specifies\n    an axis and splits the set of points based on whether their coordinate\n    along that axis is greater than or less than a particular value. \n\n    During construction, the axis and splitting point are chosen by the \n    \"sliding midpoint\" rule, which ensures that the cells do not all\n    become long and thin. \n\n    The tree can be queried for the r closest neighbors of any given point \n    (optionally returning only those within some maximum distance of the \n    point). It can also be queried, with a substantial gain in efficiency, \n    for the r approximate closest neighbors.\n\n    For large dimensions (20 is already large) do not expect this to run \n    significantly faster than brute force. High-dimensional nearest-neighbor\n    queries are a substantial open problem in computer science.\n    ", /*tp_doc*/
+  "kd-tree for quick nearest-neighbor lookup\n\n    This class provides an index into a set of k-dimensional points\n    which can be used to rapidly look up the nearest neighbors of any\n    point. \n\n    The algorithm used is described in Maneewongvatana and Mount 1999. \n    The general idea is that the kd-tree is a binary trie, each of whose\n    nodes represents an axis-aligned hyperrectangle. Each node specifies\n    an axis and splits the set of points based on whether their coordinate\n    along that axis is greater than or less than a particular value. \n\n    During construction, the axis and splitting point are chosen by the \n    \"sliding midpoint\" rule, which ensures that the cells do not all\n    become long and thin. \n\n    The tree can be queried for the r closest neighbors of any given point \n    (optionally returning only those within some maximum distance of the \n    point). It can also be queried, with a substantial gain in efficiency, \n    for the r approximate closest neighbors.\n\n    For large dimensions (20 is already large) do not expect this to run \n    significantly faster than brute force. High-dimensional nearest-neighbor\n    queries are a substantial open problem in computer science.\n\n    The tree also supports all-neighbors queries, both with arrays of points\n    and with other kd-trees. These are implemented as compiled tree\n    traversals with the same signatures and results as those of KDTree.\n    ", /*tp_doc*/
   __pyx_tp_traverse_5scipy_7spatial_7ckdtree_cKDTree, /*tp_traverse*/
   __pyx_tp_clear_5scipy_7spatial_7ckdtree_cKDTree, /*tp_clear*/
   0, /*tp_richcompare*/
@@ -6015,41 +12603,112 @@ static struct PyModuleDef __pyx_moduledef = {
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp___init__, __pyx_k___init__, sizeof(__pyx_k___init__), 1, 1, 1},
+  {&__pyx_kp___getstate__, __pyx_k___getstate__, sizeof(__pyx_k___getstate__), 1, 1, 1},
+  {&__pyx_kp___setstate__, __pyx_k___setstate__, sizeof(__pyx_k___setstate__), 1, 1, 1},
+  {&__pyx_kp___reduce__, __pyx_k___reduce__, sizeof(__pyx_k___reduce__), 1, 1, 1},
+  {&__pyx_kp_save, __pyx_k_save, sizeof(__pyx_k_save), 1, 1, 1},
   {&__pyx_kp___dealloc__, __pyx_k___dealloc__, sizeof(__pyx_k___dealloc__), 1, 1, 1},
+  {&__pyx_kp__query_block, __pyx_k__query_block, sizeof(__pyx_k__query_block), 1, 1, 1},
   {&__pyx_kp_query, __pyx_k_query, sizeof(__pyx_k_query), 1, 1, 1},
+  {&__pyx_kp_query_ball_point, __pyx_k_query_ball_point, sizeof(__pyx_k_query_ball_point), 1, 1, 1},
+  {&__pyx_kp_query_ball_tree, __pyx_k_query_ball_tree, sizeof(__pyx_k_query_ball_tree), 1, 1, 1},
+  {&__pyx_kp_query_pairs, __pyx_k_query_pairs, sizeof(__pyx_k_query_pairs), 1, 1, 1},
+  {&__pyx_kp_count_neighbors, __pyx_k_count_neighbors, sizeof(__pyx_k_count_neighbors), 1, 1, 1},
+  {&__pyx_kp_23, __pyx_k_23, sizeof(__pyx_k_23), 1, 1, 1},
   {&__pyx_kp_data, __pyx_k_data, sizeof(__pyx_k_data), 1, 1, 1},
   {&__pyx_kp_leafsize, __pyx_k_leafsize, sizeof(__pyx_k_leafsize), 1, 1, 1},
-  {&__pyx_kp_x, __pyx_k_x, sizeof(__pyx_k_x), 1, 1, 1},
+  {&__pyx_kp_state, __pyx_k_state, sizeof(__pyx_k_state), 1, 1, 1},
+  {&__pyx_kp_dirname, __pyx_k_dirname, sizeof(__pyx_k_dirname), 1, 1, 1},
+  {&__pyx_kp_dd, __pyx_k_dd, sizeof(__pyx_k_dd), 1, 1, 1},
+  {&__pyx_kp_ii, __pyx_k_ii, sizeof(__pyx_k_ii), 1, 1, 1},
+  {&__pyx_kp_xx, __pyx_k_xx, sizeof(__pyx_k_xx), 1, 1, 1},
+  {&__pyx_kp_start, __pyx_k_start, sizeof(__pyx_k_start), 1, 1, 1},
+  {&__pyx_kp_stop, __pyx_k_stop, sizeof(__pyx_k_stop), 1, 1, 1},
   {&__pyx_kp_k, __pyx_k_k, sizeof(__pyx_k_k), 1, 1, 1},
   {&__pyx_kp_eps, __pyx_k_eps, sizeof(__pyx_k_eps), 1, 1, 1},
   {&__pyx_kp_p, __pyx_k_p, sizeof(__pyx_k_p), 1, 1, 1},
-  {&__pyx_kp_23, __pyx_k_23, sizeof(__pyx_k_23), 1, 1, 1},
+  {&__pyx_kp_24, __pyx_k_24, sizeof(__pyx_k_24), 1, 1, 1},
+  {&__pyx_kp_x, __pyx_k_x, sizeof(__pyx_k_x), 1, 1, 1},
+  {&__pyx_kp_n_jobs, __pyx_k_n_jobs, sizeof(__pyx_k_n_jobs), 1, 1, 1},
+  {&__pyx_kp_r, __pyx_k_r, sizeof(__pyx_k_r), 1, 1, 1},
+  {&__pyx_kp_other, __pyx_k_other, sizeof(__pyx_k_other), 1, 1, 1},
+  {&__pyx_kp_max_distance, __pyx_k_max_distance, sizeof(__pyx_k_max_distance), 1, 1, 1},
   {&__pyx_kp_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 1, 1, 1},
   {&__pyx_kp_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 1, 1},
+  {&__pyx_kp_copy_reg, __pyx_k_copy_reg, sizeof(__pyx_k_copy_reg), 1, 1, 1},
   {&__pyx_kp_kdtree, __pyx_k_kdtree, sizeof(__pyx_k_kdtree), 1, 1, 1},
+  {&__pyx_kp_25, __pyx_k_25, sizeof(__pyx_k_25), 1, 1, 1},
+  {&__pyx_kp_scipy, __pyx_k_scipy, sizeof(__pyx_k_scipy), 0, 1, 1},
+  {&__pyx_kp_26, __pyx_k_26, sizeof(__pyx_k_26), 1, 1, 1},
+  {&__pyx_kp_check_n_jobs, __pyx_k_check_n_jobs, sizeof(__pyx_k_check_n_jobs), 1, 1, 1},
+  {&__pyx_kp_run_threads, __pyx_k_run_threads, sizeof(__pyx_k_run_threads), 1, 1, 1},
+  {&__pyx_kp__check_n_jobs, __pyx_k__check_n_jobs, sizeof(__pyx_k__check_n_jobs), 0, 1, 1},
+  {&__pyx_kp__run_threads, __pyx_k__run_threads, sizeof(__pyx_k__run_threads), 0, 1, 1},
   {&__pyx_kp_inf, __pyx_k_inf, sizeof(__pyx_k_inf), 1, 1, 1},
-  {&__pyx_kp_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 1, 1, 1},
   {&__pyx_kp_ascontiguousarray, __pyx_k_ascontiguousarray, sizeof(__pyx_k_ascontiguousarray), 1, 1, 1},
   {&__pyx_kp_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 1, 1, 1},
   {&__pyx_kp_float, __pyx_k_float, sizeof(__pyx_k_float), 1, 1, 1},
   {&__pyx_kp_shape, __pyx_k_shape, sizeof(__pyx_k_shape), 1, 1, 1},
+  {&__pyx_kp_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 1, 1, 1},
   {&__pyx_kp_amax, __pyx_k_amax, sizeof(__pyx_k_amax), 1, 1, 1},
   {&__pyx_kp_axis, __pyx_k_axis, sizeof(__pyx_k_axis), 1, 1, 1},
   {&__pyx_kp_amin, __pyx_k_amin, sizeof(__pyx_k_amin), 1, 1, 1},
   {&__pyx_kp_arange, __pyx_k_arange, sizeof(__pyx_k_arange), 1, 1, 1},
-  {&__pyx_kp_27, __pyx_k_27, sizeof(__pyx_k_27), 1, 1, 1},
+  {&__pyx_kp_29, __pyx_k_29, sizeof(__pyx_k_29), 1, 1, 1},
+  {&__pyx_kp_empty, __pyx_k_empty, sizeof(__pyx_k_empty), 1, 1, 1},
+  {&__pyx_kp_array, __pyx_k_array, sizeof(__pyx_k_array), 1, 1, 1},
+  {&__pyx_kp_maxes, __pyx_k_maxes, sizeof(__pyx_k_maxes), 1, 1, 1},
+  {&__pyx_kp_mins, __pyx_k_mins, sizeof(__pyx_k_mins), 1, 1, 1},
+  {&__pyx_kp_indices, __pyx_k_indices, sizeof(__pyx_k_indices), 1, 1, 1},
+  {&__pyx_kp_split_dim, __pyx_k_split_dim, sizeof(__pyx_k_split_dim), 1, 1, 1},
+  {&__pyx_kp_split, __pyx_k_split, sizeof(__pyx_k_split), 1, 1, 1},
+  {&__pyx_kp_start_idx, __pyx_k_start_idx, sizeof(__pyx_k_start_idx), 1, 1, 1},
+  {&__pyx_kp_end_idx, __pyx_k_end_idx, sizeof(__pyx_k_end_idx), 1, 1, 1},
+  {&__pyx_kp_less, __pyx_k_less, sizeof(__pyx_k_less), 1, 1, 1},
+  {&__pyx_kp_greater, __pyx_k_greater, sizeof(__pyx_k_greater), 1, 1, 1},
+  {&__pyx_kp_30, __pyx_k_30, sizeof(__pyx_k_30), 0, 1, 0},
+  {&__pyx_kp_31, __pyx_k_31, sizeof(__pyx_k_31), 0, 1, 0},
+  {&__pyx_kp_32, __pyx_k_32, sizeof(__pyx_k_32), 0, 1, 0},
+  {&__pyx_kp_33, __pyx_k_33, sizeof(__pyx_k_33), 0, 1, 0},
+  {&__pyx_kp_34, __pyx_k_34, sizeof(__pyx_k_34), 0, 1, 0},
+  {&__pyx_kp_35, __pyx_k_35, sizeof(__pyx_k_35), 0, 1, 0},
+  {&__pyx_kp_36, __pyx_k_36, sizeof(__pyx_k_36), 0, 1, 0},
+  {&__pyx_kp_37, __pyx_k_37, sizeof(__pyx_k_37), 0, 1, 0},
+  {&__pyx_kp_38, __pyx_k_38, sizeof(__pyx_k_38), 0, 1, 0},
+  {&__pyx_kp_39, __pyx_k_39, sizeof(__pyx_k_39), 0, 1, 0},
+  {&__pyx_kp_40, __pyx_k_40, sizeof(__pyx_k_40), 0, 1, 0},
+  {&__pyx_kp___newobj__, __pyx_k___newobj__, sizeof(__pyx_k___newobj__), 1, 1, 1},
+  {&__pyx_kp__save_tree, __pyx_k__save_tree, sizeof(__pyx_k__save_tree), 1, 1, 1},
   {&__pyx_kp_asarray, __pyx_k_asarray, sizeof(__pyx_k_asarray), 1, 1, 1},
   {&__pyx_kp_astype, __pyx_k_astype, sizeof(__pyx_k_astype), 1, 1, 1},
   {&__pyx_kp_newaxis, __pyx_k_newaxis, sizeof(__pyx_k_newaxis), 1, 1, 1},
   {&__pyx_kp_prod, __pyx_k_prod, sizeof(__pyx_k_prod), 1, 1, 1},
   {&__pyx_kp_reshape, __pyx_k_reshape, sizeof(__pyx_k_reshape), 1, 1, 1},
-  {&__pyx_kp_empty, __pyx_k_empty, sizeof(__pyx_k_empty), 1, 1, 1},
   {&__pyx_kp_fill, __pyx_k_fill, sizeof(__pyx_k_fill), 1, 1, 1},
-  {&__pyx_kp_30, __pyx_k_30, sizeof(__pyx_k_30), 0, 1, 0},
-  {&__pyx_kp_25, __pyx_k_25, sizeof(__pyx_k_25), 0, 0, 0},
-  {&__pyx_kp_26, __pyx_k_26, sizeof(__pyx_k_26), 0, 0, 0},
+  {&__pyx_kp_43, __pyx_k_43, sizeof(__pyx_k_43), 0, 1, 0},
+  {&__pyx_kp_min, __pyx_k_min, sizeof(__pyx_k_min), 1, 1, 1},
+  {&__pyx_kp_range, __pyx_k_range, sizeof(__pyx_k_range), 1, 1, 1},
+  {&__pyx_kp_append, __pyx_k_append, sizeof(__pyx_k_append), 1, 1, 1},
+  {&__pyx_kp_object, __pyx_k_object, sizeof(__pyx_k_object), 1, 1, 1},
+  {&__pyx_kp_ndindex, __pyx_k_ndindex, sizeof(__pyx_k_ndindex), 1, 1, 1},
+  {&__pyx_kp_add, __pyx_k_add, sizeof(__pyx_k_add), 1, 1, 1},
+  {&__pyx_kp_zeros, __pyx_k_zeros, sizeof(__pyx_k_zeros), 1, 1, 1},
+  {&__pyx_kp_52, __pyx_k_52, sizeof(__pyx_k_52), 0, 1, 0},
+  {&__pyx_kp_sparse, __pyx_k_sparse, sizeof(__pyx_k_sparse), 1, 1, 1},
+  {&__pyx_kp_dok_matrix, __pyx_k_dok_matrix, sizeof(__pyx_k_dok_matrix), 1, 1, 1},
   {&__pyx_kp_28, __pyx_k_28, sizeof(__pyx_k_28), 0, 0, 0},
-  {&__pyx_kp_29, __pyx_k_29, sizeof(__pyx_k_29), 0, 0, 0},
+  {&__pyx_kp_41, __pyx_k_41, sizeof(__pyx_k_41), 0, 0, 0},
+  {&__pyx_kp_42, __pyx_k_42, sizeof(__pyx_k_42), 0, 0, 0},
+  {&__pyx_kp_44, __pyx_k_44, sizeof(__pyx_k_44), 0, 0, 0},
+  {&__pyx_kp_45, __pyx_k_45, sizeof(__pyx_k_45), 0, 0, 0},
+  {&__pyx_kp_46, __pyx_k_46, sizeof(__pyx_k_46), 0, 0, 0},
+  {&__pyx_kp_47, __pyx_k_47, sizeof(__pyx_k_47), 0, 0, 0},
+  {&__pyx_kp_48, __pyx_k_48, sizeof(__pyx_k_48), 0, 0, 0},
+  {&__pyx_kp_49, __pyx_k_49, sizeof(__pyx_k_49), 0, 0, 0},
+  {&__pyx_kp_50, __pyx_k_50, sizeof(__pyx_k_50), 0, 0, 0},
+  {&__pyx_kp_51, __pyx_k_51, sizeof(__pyx_k_51), 0, 0, 0},
+  {&__pyx_kp_53, __pyx_k_53, sizeof(__pyx_k_53), 0, 0, 0},
+  {&__pyx_kp_54, __pyx_k_54, sizeof(__pyx_k_54), 0, 0, 0},
   {&__pyx_kp___getbuffer__, __pyx_k___getbuffer__, sizeof(__pyx_k___getbuffer__), 1, 1, 1},
   {&__pyx_kp___releasebuffer__, __pyx_k___releasebuffer__, sizeof(__pyx_k___releasebuffer__), 1, 1, 1},
   {&__pyx_kp_info, __pyx_k_info, sizeof(__pyx_k_info), 1, 1, 1},
@@ -6067,7 +12726,9 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_kp_ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_kp_ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 318; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_min = __Pyx_GetName(__pyx_b, __pyx_kp_min); if (!__pyx_builtin_min) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 870; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_range = __Pyx_GetName(__pyx_b, __pyx_kp_range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 877; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_builtin_StopIteration = __Pyx_GetName(__pyx_b, __pyx_kp_StopIteration); if (!__pyx_builtin_StopIteration) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_builtin_RuntimeError = __Pyx_GetName(__pyx_b, __pyx_kp_RuntimeError); if (!__pyx_builtin_RuntimeError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   return 0;
@@ -6077,6 +12738,10 @@ static int __Pyx_InitCachedBuiltins(void) {
 
 static int __Pyx_InitGlobals(void) {
   __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  #if PY_VERSION_HEX < 0x02040000
+  if (unlikely(__Pyx_Py23SetsImport() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  #endif
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
   return 0;
   __pyx_L1_error:;
@@ -6121,10 +12786,24 @@ PyMODINIT_FUNC PyInit_ckdtree(void)
   __pyx_vtabptr_5scipy_7spatial_7ckdtree_cKDTree = &__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree;
   *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__build = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___build;
   *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__free_tree = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___free_tree;
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__count_nodes = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___count_nodes;
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__flatten = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___flatten;
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__unflatten = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___unflatten;
   *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__query = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query;
-  if (PyType_Ready(&__pyx_type_5scipy_7spatial_7ckdtree_cKDTree) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_5scipy_7spatial_7ckdtree_cKDTree.tp_dict, __pyx_vtabptr_5scipy_7spatial_7ckdtree_cKDTree) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyObject_SetAttrString(__pyx_m, "cKDTree", (PyObject *)&__pyx_type_5scipy_7spatial_7ckdtree_cKDTree) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__query_range = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_range;
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__query_ball_point_traverse_no_checking = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_ball_point_traverse_no_checking;
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__query_ball_point_traverse_checking = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_ball_point_traverse_checking;
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__query_ball_point = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_ball_point;
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__query_ball_tree_traverse_no_checking = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_ball_tree_traverse_no_checking;
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__query_ball_tree_traverse_checking = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_ball_tree_traverse_checking;
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__query_pairs_traverse_no_checking = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_pairs_traverse_no_checking;
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__query_pairs_add = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_pairs_add;
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__query_pairs_traverse_checking = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___query_pairs_traverse_checking;
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__count_neighbors_traverse = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___count_neighbors_traverse;
+  *(void(**)(void))&__pyx_vtable_5scipy_7spatial_7ckdtree_cKDTree.__sparse_distance_matrix_traverse = (void(*)(void))__pyx_f_5scipy_7spatial_7ckdtree_7cKDTree___sparse_distance_matrix_traverse;
+  if (PyType_Ready(&__pyx_type_5scipy_7spatial_7ckdtree_cKDTree) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_5scipy_7spatial_7ckdtree_cKDTree.tp_dict, __pyx_vtabptr_5scipy_7spatial_7ckdtree_cKDTree) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttrString(__pyx_m, "cKDTree", (PyObject *)&__pyx_type_5scipy_7spatial_7ckdtree_cKDTree) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_5scipy_7spatial_7ckdtree_cKDTree = &__pyx_type_5scipy_7spatial_7ckdtree_cKDTree;
   /*--- Type import code ---*/
   __pyx_ptype_5numpy_dtype = __Pyx_ImportType("numpy", "dtype", sizeof(PyArray_Descr)); if (unlikely(!__pyx_ptype_5numpy_dtype)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
@@ -6132,52 +12811,96 @@ PyMODINIT_FUNC PyInit_ckdtree(void)
   /*--- Function import code ---*/
   /*--- Execution code ---*/
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":3
+  /* "/root/package/scipy/spatial/ckdtree.pyx":3
  * # Copyright Anne M. Archibald 2008
  * # Released under the scipy license
  * import numpy as np             # <<<<<<<<<<<<<<
  * cimport numpy as np
- * cimport stdlib
+ * 
  */
   __pyx_1 = __Pyx_Import(__pyx_kp_numpy, 0); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   if (PyObject_SetAttr(__pyx_m, __pyx_kp_np, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   Py_DECREF(__pyx_1); __pyx_1 = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":7
- * cimport stdlib
+  /* "/root/package/scipy/spatial/ckdtree.pyx":13
+ *     void *realloc(void *ptr, size_t size) nogil
+ * 
+ * import copy_reg             # <<<<<<<<<<<<<<
+ * import kdtree
+ * import scipy.sparse
+ */
+  __pyx_1 = __Pyx_Import(__pyx_kp_copy_reg, 0); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_kp_copy_reg, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":14
  * 
+ * import copy_reg
  * import kdtree             # <<<<<<<<<<<<<<
+ * import scipy.sparse
+ * from scipy.lib._threads import check_n_jobs as _check_n_jobs, \
+ */
+  __pyx_1 = __Pyx_Import(__pyx_kp_kdtree, 0); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 14; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_kp_kdtree, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 14; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":15
+ * import copy_reg
+ * import kdtree
+ * import scipy.sparse             # <<<<<<<<<<<<<<
+ * from scipy.lib._threads import check_n_jobs as _check_n_jobs, \
+ *      run_threads as _run_threads
+ */
+  __pyx_1 = __Pyx_Import(__pyx_kp_25, 0); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_kp_scipy, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+
+  /* "/root/package/scipy/spatial/ckdtree.pyx":17
+ * import scipy.sparse
+ * from scipy.lib._threads import check_n_jobs as _check_n_jobs, \
+ *      run_threads as _run_threads             # <<<<<<<<<<<<<<
  * 
  * cdef double infinity = np.inf
  */
-  __pyx_1 = __Pyx_Import(__pyx_kp_kdtree, 0); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 7; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyObject_SetAttr(__pyx_m, __pyx_kp_kdtree, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 7; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = PyList_New(2); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 16; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_INCREF(__pyx_kp_check_n_jobs);
+  PyList_SET_ITEM(__pyx_1, 0, __pyx_kp_check_n_jobs);
+  Py_INCREF(__pyx_kp_run_threads);
+  PyList_SET_ITEM(__pyx_1, 1, __pyx_kp_run_threads);
+  __pyx_2 = __Pyx_Import(__pyx_kp_26, ((PyObject *)__pyx_1)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 16; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
+  __pyx_1 = PyObject_GetAttr(__pyx_2, __pyx_kp_check_n_jobs); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 16; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_kp__check_n_jobs, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 16; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   Py_DECREF(__pyx_1); __pyx_1 = 0;
+  __pyx_1 = PyObject_GetAttr(__pyx_2, __pyx_kp_run_threads); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 16; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttr(__pyx_m, __pyx_kp__run_threads, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  Py_DECREF(__pyx_2); __pyx_2 = 0;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":9
- * import kdtree
+  /* "/root/package/scipy/spatial/ckdtree.pyx":19
+ *      run_threads as _run_threads
  * 
  * cdef double infinity = np.inf             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_2 = PyObject_GetAttr(__pyx_1, __pyx_kp_inf); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  __pyx_3 = __pyx_PyFloat_AsDouble(__pyx_2); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_1 = PyObject_GetAttr(__pyx_2, __pyx_kp_inf); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   Py_DECREF(__pyx_2); __pyx_2 = 0;
+  __pyx_3 = __pyx_PyFloat_AsDouble(__pyx_1); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  Py_DECREF(__pyx_1); __pyx_1 = 0;
   __pyx_v_5scipy_7spatial_7ckdtree_infinity = __pyx_3;
 
-  /* "/usr/data/david/src/dsp/scipy/trunk/scipy/spatial/ckdtree.pyx":517
+  /* "/root/package/scipy/spatial/ckdtree.pyx":807
  * 
  *     def query(cKDTree self, object x, int k=1, double eps=0, double p=2,
- *             double distance_upper_bound=infinity):             # <<<<<<<<<<<<<<
+ *             double distance_upper_bound=infinity, int n_jobs=1):             # <<<<<<<<<<<<<<
  *         """query the kd-tree for nearest neighbors
  * 
  */
-  __pyx_k_24 = __pyx_v_5scipy_7spatial_7ckdtree_infinity;
+  __pyx_k_27 = __pyx_v_5scipy_7spatial_7ckdtree_infinity;
 
-  /* "/usr/data/david/local/lib64/python2.4/site-packages/Cython/Includes/stdlib.pxd":2
+  /* "/tmp/cy/Cython-0.10.3/Cython/Includes/stdlib.pxd":2
  * 
  * cdef extern from "stdlib.h":             # <<<<<<<<<<<<<<
  *     ctypedef unsigned long size_t
@@ -6613,6 +13336,84 @@ fail:;
      "Out of bounds on buffer access (axis %d)", axis);
 }
 
+static const char* __Pyx_CheckTypestring_nn___pyx_t_5numpy_int_t(const char* ts) {
+    int ok;
+    ts = __Pyx_ConsumeWhitespace(ts); if (!ts) return NULL;
+    if (*ts == '1') ++ts;
+    switch (*ts) {
+      case 'b': ok = (sizeof(__pyx_t_5numpy_int_t) == sizeof(char) && (__pyx_t_5numpy_int_t)-1 < 0); break;
+      case 'h': ok = (sizeof(__pyx_t_5numpy_int_t) == sizeof(short) && (__pyx_t_5numpy_int_t)-1 < 0); break;
+      case 'i': ok = (sizeof(__pyx_t_5numpy_int_t) == sizeof(int) && (__pyx_t_5numpy_int_t)-1 < 0); break;
+      case 'l': ok = (sizeof(__pyx_t_5numpy_int_t) == sizeof(long) && (__pyx_t_5numpy_int_t)-1 < 0); break;
+      case 'q': ok = (sizeof(__pyx_t_5numpy_int_t) == sizeof(long long) && (__pyx_t_5numpy_int_t)-1 < 0); break;
+      default: ok = 0;
+    }
+    if (!(ok)) {
+      PyErr_Format(PyExc_ValueError, "Buffer dtype mismatch (expected numpy.int_t, got %s)", __Pyx_DescribeTokenInFormatString(ts));
+      return NULL;
+    }
+    ++ts;
+    return ts;
+  }
+  
+static int __Pyx_GetBuffer_nn___pyx_t_5numpy_int_t(PyObject* obj, Py_buffer* buf, int flags, int nd, int cast) {
+  const char* ts;
+  if (obj == Py_None) {
+    __Pyx_ZeroBuffer(buf);
+    return 0;
+  }
+  buf->buf = NULL;
+  if (__Pyx_GetBuffer(obj, buf, flags) == -1) goto fail;
+  if (buf->ndim != nd) {
+    __Pyx_BufferNdimError(buf, nd);
+    goto fail;
+  }
+  if (!cast) {
+    ts = buf->format;
+    ts = __Pyx_ConsumeWhitespace(ts);
+    if (!ts) goto fail;
+    ts = __Pyx_CheckTypestring_nn___pyx_t_5numpy_int_t(ts);
+    if (!ts) goto fail;
+    ts = __Pyx_ConsumeWhitespace(ts);
+    if (!ts) goto fail;
+    if (*ts != 0) {
+      PyErr_Format(PyExc_ValueError,
+        "Buffer dtype mismatch (expected end, got %s)",
+        __Pyx_DescribeTokenInFormatString(ts));
+      goto fail;
+    }
+  } else {
+    if (buf->itemsize != sizeof(__pyx_t_5numpy_int_t)) {
+      PyErr_SetString(PyExc_ValueError,
+        "Attempted cast of buffer to datatype of different size.");
+      goto fail;
+    }
+  }
+  if (buf->suboffsets == NULL) buf->suboffsets = __Pyx_minusones;
+  return 0;
+fail:;
+  __Pyx_ZeroBuffer(buf);
+  return -1;
+}
+static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
+    const char *name, int exact)
+{
+    if (!type) {
+        PyErr_Format(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (none_allowed && obj == Py_None) return 1;
+    else if (exact) {
+        if (Py_TYPE(obj) == type) return 1;
+    }
+    else {
+        if (PyObject_TypeCheck(obj, type)) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%s' has incorrect type (expected %s, got %s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
 
 #if PY_MAJOR_VERSION < 3
 static int __Pyx_GetBuffer(PyObject *obj, Py_buffer *view, int flags) {
@@ -6679,6 +13480,34 @@ static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
     return result;
 }
 
+static PyObject *__Pyx_UnpackItem(PyObject *iter, Py_ssize_t index) {
+    PyObject *item;
+    if (!(item = PyIter_Next(iter))) {
+        if (!PyErr_Occurred()) {
+            PyErr_Format(PyExc_ValueError,
+                #if PY_VERSION_HEX < 0x02050000
+                    "need more than %d values to unpack", (int)index);
+                #else
+                    "need more than %zd values to unpack", index);
+                #endif
+        }
+    }
+    return item;
+}
+
+static int __Pyx_EndUnpack(PyObject *iter) {
+    PyObject *item;
+    if ((item = PyIter_Next(iter))) {
+        Py_DECREF(item);
+        PyErr_SetString(PyExc_ValueError, "too many values to unpack");
+        return -1;
+    }
+    else if (!PyErr_Occurred())
+        return 0;
+    else
+        return -1;
+}
+
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
     Py_XINCREF(type);
     Py_XINCREF(value);
@@ -6743,34 +13572,6 @@ raise_error:
     return;
 }
 
-static PyObject *__Pyx_UnpackItem(PyObject *iter, Py_ssize_t index) {
-    PyObject *item;
-    if (!(item = PyIter_Next(iter))) {
-        if (!PyErr_Occurred()) {
-            PyErr_Format(PyExc_ValueError,
-                #if PY_VERSION_HEX < 0x02050000
-                    "need more than %d values to unpack", (int)index);
-                #else
-                    "need more than %zd values to unpack", index);
-                #endif
-        }
-    }
-    return item;
-}
-
-static int __Pyx_EndUnpack(PyObject *iter) {
-    PyObject *item;
-    if ((item = PyIter_Next(iter))) {
-        Py_DECREF(item);
-        PyErr_SetString(PyExc_ValueError, "too many values to unpack");
-        return -1;
-    }
-    else if (!PyErr_Occurred())
-        return 0;
-    else
-        return -1;
-}
-
 static int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
     if (!type) {
         PyErr_Format(PyExc_SystemError, "Missing type object");
@@ -6837,24 +13638,6 @@ bad:
 }
 
 
-static void __Pyx_WriteUnraisable(const char *name) {
-    PyObject *old_exc, *old_val, *old_tb;
-    PyObject *ctx;
-    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
-    #if PY_MAJOR_VERSION < 3
-    ctx = PyString_FromString(name);
-    #else
-    ctx = PyUnicode_FromString(name);
-    #endif
-    __Pyx_ErrRestore(old_exc, old_val, old_tb);
-    if (!ctx) {
-        PyErr_WriteUnraisable(Py_None);
-    } else {
-        PyErr_WriteUnraisable(ctx);
-        Py_DECREF(ctx);
-    }
-}
-
 static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
     PyObject *pycobj = 0;
     int result;
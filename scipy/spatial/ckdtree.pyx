@@ -2,15 +2,24 @@
 # Released under the scipy license
 import numpy as np
 cimport numpy as np
-cimport stdlib
 
+cdef extern from "stdlib.h":
+    # declared nogil so that the query loop can run without the GIL
+    ctypedef unsigned long size_t
+    void free(void *ptr) nogil
+    void *malloc(size_t size) nogil
+    void *realloc(void *ptr, size_t size) nogil
+
+import copy_reg
 import kdtree
+import scipy.sparse
+from scipy.lib._threads import check_n_jobs as _check_n_jobs, \
+     run_threads as _run_threads
 
 cdef double infinity = np.inf
 
 
 
-
 # priority queue
 cdef union heapcontents:
     int intdata
@@ -25,21 +34,23 @@ cdef struct heap:
     heapitem* heap
     int space
 
-cdef inline heapcreate(heap* self,int initial_size):
+cdef inline void heapcreate(heap* self,int initial_size) nogil:
     self.space = initial_size
-    self.heap = <heapitem*>stdlib.malloc(sizeof(heapitem)*self.space)
+    self.heap = <heapitem*>malloc(sizeof(heapitem)*self.space)
     self.n=0
 
-cdef inline heapdestroy(heap* self):
-    stdlib.free(self.heap)
+cdef inline void heapdestroy(heap* self) nogil:
+    free(self.heap)
 
-cdef inline heapresize(heap* self, int new_space):
+cdef inline int heapresize(heap* self, int new_space) nogil:
+    # a heap cannot be resized below the number of items it contains
     if new_space<self.n:
-        raise ValueError("Heap containing %d items cannot be resized to %d" % (self.n, new_space))
+        return -1
     self.space = new_space
-    self.heap = <heapitem*>stdlib.realloc(<void*>self.heap,new_space*sizeof(heapitem))
+    self.heap = <heapitem*>realloc(<void*>self.heap,new_space*sizeof(heapitem))
+    return 0
 
-cdef inline heappush(heap* self, heapitem item):
+cdef inline void heappush(heap* self, heapitem item) nogil:
     cdef int i
     cdef heapitem t
 
@@ -55,10 +66,10 @@ cdef inline heappush(heap* self, heapitem item):
         self.heap[i] = t
         i = (i-1)//2
 
-cdef heapitem heappeek(heap* self):
+cdef heapitem heappeek(heap* self) nogil:
     return self.heap[0]
 
-cdef heapremove(heap* self):
+cdef void heapremove(heap* self) nogil:
     cdef heapitem t
     cdef int i, j, k, l
 
@@ -85,7 +96,7 @@ cdef heapremove(heap* self):
         j = 2*i+1
         k = 2*i+2
 
-cdef heapitem heappop(heap* self):
+cdef heapitem heappop(heap* self) nogil:
     cdef heapitem it
     it = heappeek(self)
     heapremove(self)
@@ -96,17 +107,17 @@ cdef heapitem heappop(heap* self):
 
 
 # utility functions
-cdef inline double dmax(double x, double y):
+cdef inline double dmax(double x, double y) nogil:
     if x>y:
         return x
     else:
         return y
-cdef inline double dabs(double x):
+cdef inline double dabs(double x) nogil:
     if x>0:
         return x
     else:
         return -x
-cdef inline double _distance_p(double*x,double*y,double p,int k,double upperbound):
+cdef inline double _distance_p(double*x,double*y,double p,int k,double upperbound) nogil:
     """Compute the distance between x and y
 
     Computes the Minkowski p-distance to the power p between two points.
@@ -133,12 +144,87 @@ cdef inline double _distance_p(double*x,double*y,double p,int k,double upperboun
                 return r
     return r
 
+cdef inline double _distance_power(double r, double p):
+    """Convert a distance to the internal distance**p representation"""
+    if p==1 or p==infinity:
+        return r
+    else:
+        return r**p
+
+cdef inline double _combine(double r, double t, double p):
+    """Add one coordinate difference t to a partial distance**p"""
+    if p==infinity:
+        return dmax(r,t)
+    elif p==1:
+        return r+t
+    else:
+        return r+t**p
+
+cdef double _min_distance_point(double*x, double*maxes, double*mins,
+        double p, int k):
+    """Compute the minimum distance**p between x and a hyperrectangle"""
+    cdef int i
+    cdef double r
+    r = 0
+    for i in range(k):
+        r = _combine(r,dmax(0,dmax(mins[i]-x[i],x[i]-maxes[i])),p)
+    return r
+
+cdef double _max_distance_point(double*x, double*maxes, double*mins,
+        double p, int k):
+    """Compute the maximum distance**p between x and a hyperrectangle"""
+    cdef int i
+    cdef double r
+    r = 0
+    for i in range(k):
+        r = _combine(r,dmax(maxes[i]-x[i],x[i]-mins[i]),p)
+    return r
+
+cdef double _min_distance_rectangle(double*maxes1, double*mins1,
+        double*maxes2, double*mins2, double p, int k):
+    """Compute the minimum distance**p between two hyperrectangles"""
+    cdef int i
+    cdef double r
+    r = 0
+    for i in range(k):
+        r = _combine(r,dmax(0,dmax(mins1[i]-maxes2[i],mins2[i]-maxes1[i])),p)
+    return r
+
+cdef double _max_distance_rectangle(double*maxes1, double*mins1,
+        double*maxes2, double*mins2, double p, int k):
+    """Compute the maximum distance**p between two hyperrectangles"""
+    cdef int i
+    cdef double r
+    r = 0
+    for i in range(k):
+        r = _combine(r,dmax(maxes1[i]-mins2[i],maxes2[i]-mins1[i]),p)
+    return r
+
+# hyperrectangles are stored as a single block of 2*k doubles,
+# the maxes followed by the mins
+cdef double* _split_rectangle(double*maxes, double*mins, int d,
+        double split, int k, int less):
+    """Allocate the hyperrectangle of the less or greater half of a split"""
+    cdef int i
+    cdef double* rect
+    rect = <double*>malloc(2*k*sizeof(double))
+    for i in range(k):
+        rect[i] = maxes[i]
+        rect[k+i] = mins[i]
+    if less:
+        rect[d] = split
+    else:
+        rect[k+d] = split
+    return rect
+
 
 
 # Tree structure
 cdef struct innernode:
     int split_dim
     int n_points
+    int start_idx
+    int end_idx
     double split
     innernode* less
     innernode* greater
@@ -148,6 +234,16 @@ cdef struct leafnode:
     int start_idx
     int end_idx
 
+# flat representation of the tree, one entry per node in depth-first
+# order, used for pickling and saving
+cdef struct flatnodes:
+    np.int32_t* split_dim
+    double* split
+    np.int32_t* start_idx
+    np.int32_t* end_idx
+    np.int32_t* less
+    np.int32_t* greater
+
 # this is the standard trick for variable-size arrays:
 # malloc sizeof(nodeinfo)+self.m*sizeof(double) bytes.
 cdef struct nodeinfo:
@@ -179,6 +275,10 @@ cdef class cKDTree:
     For large dimensions (20 is already large) do not expect this to run 
     significantly faster than brute force. High-dimensional nearest-neighbor
     queries are a substantial open problem in computer science.
+
+    The tree also supports all-neighbors queries, both with arrays of points
+    and with other kd-trees. These are implemented as compiled tree
+    traversals with the same signatures and results as those of KDTree.
     """
 
     cdef innernode* tree 
@@ -238,8 +338,9 @@ cdef class cKDTree:
         cdef double size, split, minval, maxval
         cdef double*mids
         if end_idx-start_idx<=self.leafsize:
-            n = <leafnode*>stdlib.malloc(sizeof(leafnode))
+            n = <leafnode*>malloc(sizeof(leafnode))
             n.split_dim = -1
+            n.n_points = end_idx-start_idx
             n.start_idx = start_idx
             n.end_idx = end_idx
             return <innernode*>n
@@ -254,8 +355,9 @@ cdef class cKDTree:
             minval = mins[d]
             if maxval==minval:
                 # all points are identical; warn user?
-                n = <leafnode*>stdlib.malloc(sizeof(leafnode))
+                n = <leafnode*>malloc(sizeof(leafnode))
                 n.split_dim = -1
+                n.n_points = end_idx-start_idx
                 n.start_idx = start_idx
                 n.end_idx = end_idx
                 return <innernode*>n
@@ -305,9 +407,9 @@ cdef class cKDTree:
                 q = end_idx-2
 
             # construct new node representation
-            ni = <innernode*>stdlib.malloc(sizeof(innernode))
+            ni = <innernode*>malloc(sizeof(innernode))
 
-            mids = <double*>stdlib.malloc(sizeof(double)*self.m)
+            mids = <double*>malloc(sizeof(double)*self.m)
             for i in range(self.m):
                 mids[i] = maxes[i]
             mids[d] = split
@@ -318,10 +420,13 @@ cdef class cKDTree:
             mids[d] = split
             ni.greater = self.__build(p,end_idx,maxes,mids)
 
-            stdlib.free(mids)
+            free(mids)
 
             ni.split_dim = d
             ni.split = split
+            ni.n_points = end_idx-start_idx
+            ni.start_idx = start_idx
+            ni.end_idx = end_idx
 
             return ni
                     
@@ -329,7 +434,153 @@ cdef class cKDTree:
         if node.split_dim!=-1:
             self.__free_tree(node.less)
             self.__free_tree(node.greater)
-        stdlib.free(node)
+        free(node)
+
+    cdef int __count_nodes(cKDTree self, innernode* node):
+        if node.split_dim==-1:
+            return 1
+        else:
+            return 1+self.__count_nodes(node.less)+self.__count_nodes(node.greater)
+
+    cdef int __flatten(cKDTree self, innernode* node, int i, flatnodes* f):
+        # store node as entry i and its subtrees after it;
+        # returns the first entry after the subtrees
+        cdef int j
+        f.split_dim[i] = node.split_dim
+        f.start_idx[i] = node.start_idx
+        f.end_idx[i] = node.end_idx
+        if node.split_dim==-1:
+            f.split[i] = 0
+            f.less[i] = -1
+            f.greater[i] = -1
+            return i+1
+        f.split[i] = node.split
+        f.less[i] = i+1
+        j = self.__flatten(node.less, i+1, f)
+        f.greater[i] = j
+        return self.__flatten(node.greater, j, f)
+
+    cdef innernode* __unflatten(cKDTree self, int i, flatnodes* f):
+        cdef leafnode* n
+        cdef innernode* ni
+        if f.split_dim[i]==-1:
+            n = <leafnode*>malloc(sizeof(leafnode))
+            n.split_dim = -1
+            n.n_points = f.end_idx[i]-f.start_idx[i]
+            n.start_idx = f.start_idx[i]
+            n.end_idx = f.end_idx[i]
+            return <innernode*>n
+        ni = <innernode*>malloc(sizeof(innernode))
+        ni.split_dim = f.split_dim[i]
+        ni.split = f.split[i]
+        ni.n_points = f.end_idx[i]-f.start_idx[i]
+        ni.start_idx = f.start_idx[i]
+        ni.end_idx = f.end_idx[i]
+        ni.less = self.__unflatten(f.less[i], f)
+        ni.greater = self.__unflatten(f.greater[i], f)
+        return ni
+
+    def __getstate__(cKDTree self):
+        cdef np.ndarray[np.int32_t, ndim=1] split_dim
+        cdef np.ndarray[double, ndim=1] split
+        cdef np.ndarray[np.int32_t, ndim=1] start_idx
+        cdef np.ndarray[np.int32_t, ndim=1] end_idx
+        cdef np.ndarray[np.int32_t, ndim=1] less
+        cdef np.ndarray[np.int32_t, ndim=1] greater
+        cdef flatnodes f
+        cdef int n_nodes
+        n_nodes = self.__count_nodes(self.tree)
+        split_dim = np.empty(n_nodes,dtype=np.int32)
+        split = np.empty(n_nodes,dtype=np.float)
+        start_idx = np.empty(n_nodes,dtype=np.int32)
+        end_idx = np.empty(n_nodes,dtype=np.int32)
+        less = np.empty(n_nodes,dtype=np.int32)
+        greater = np.empty(n_nodes,dtype=np.int32)
+        f.split_dim = <np.int32_t*>split_dim.data
+        f.split = <double*>split.data
+        f.start_idx = <np.int32_t*>start_idx.data
+        f.end_idx = <np.int32_t*>end_idx.data
+        f.less = <np.int32_t*>less.data
+        f.greater = <np.int32_t*>greater.data
+        self.__flatten(self.tree, 0, &f)
+        return dict(data=self.data,
+                    leafsize=np.array(self.leafsize),
+                    maxes=self.maxes,
+                    mins=self.mins,
+                    indices=self.indices,
+                    split_dim=split_dim,
+                    split=split,
+                    start_idx=start_idx,
+                    end_idx=end_idx,
+                    less=less,
+                    greater=greater)
+
+    def __setstate__(cKDTree self, state):
+        cdef np.ndarray[double, ndim=2] inner_data
+        cdef np.ndarray[double, ndim=1] inner_maxes
+        cdef np.ndarray[double, ndim=1] inner_mins
+        cdef np.ndarray[np.int32_t, ndim=1] inner_indices
+        cdef np.ndarray[np.int32_t, ndim=1] split_dim
+        cdef np.ndarray[double, ndim=1] split
+        cdef np.ndarray[np.int32_t, ndim=1] start_idx
+        cdef np.ndarray[np.int32_t, ndim=1] end_idx
+        cdef np.ndarray[np.int32_t, ndim=1] less
+        cdef np.ndarray[np.int32_t, ndim=1] greater
+        cdef flatnodes f
+        if <int>(self.tree) != 0:
+            self.__free_tree(self.tree)
+            self.tree = NULL
+
+        # the arrays are used in place, so memory-mapped arrays stay
+        # shared rather than being copied
+        self.data = np.ascontiguousarray(state['data'],dtype=np.float)
+        self.n, self.m = np.shape(self.data)
+        self.leafsize = int(state['leafsize'])
+        self.maxes = np.ascontiguousarray(state['maxes'],dtype=np.float)
+        self.mins = np.ascontiguousarray(state['mins'],dtype=np.float)
+        self.indices = np.ascontiguousarray(state['indices'],dtype=np.int32)
+
+        inner_data = self.data
+        self.raw_data = <double*>inner_data.data
+        inner_maxes = self.maxes
+        self.raw_maxes = <double*>inner_maxes.data
+        inner_mins = self.mins
+        self.raw_mins = <double*>inner_mins.data
+        inner_indices = self.indices
+        self.raw_indices = <np.int32_t*>inner_indices.data
+
+        split_dim = np.ascontiguousarray(state['split_dim'],dtype=np.int32)
+        split = np.ascontiguousarray(state['split'],dtype=np.float)
+        start_idx = np.ascontiguousarray(state['start_idx'],dtype=np.int32)
+        end_idx = np.ascontiguousarray(state['end_idx'],dtype=np.int32)
+        less = np.ascontiguousarray(state['less'],dtype=np.int32)
+        greater = np.ascontiguousarray(state['greater'],dtype=np.int32)
+        f.split_dim = <np.int32_t*>split_dim.data
+        f.split = <double*>split.data
+        f.start_idx = <np.int32_t*>start_idx.data
+        f.end_idx = <np.int32_t*>end_idx.data
+        f.less = <np.int32_t*>less.data
+        f.greater = <np.int32_t*>greater.data
+        self.tree = self.__unflatten(0, &f)
+
+    def __reduce__(cKDTree self):
+        return (copy_reg.__newobj__, (cKDTree,), self.__getstate__())
+
+    def save(cKDTree self, dirname):
+        """Save the tree to a directory of .npy files.
+
+        The tree is written as flat arrays (the data, the permutation of
+        the points into leaf order, and per-node split dimensions, split
+        values, index ranges and children) so that load_tree can map
+        them into memory without rebuilding the tree.
+
+        Parameters
+        ==========
+
+        dirname : string
+            The directory to write to; it is created if necessary.
+        """
+        kdtree._save_tree(dirname, self)
 
     def __dealloc__(cKDTree self):
         if <int>(self.tree) == 0:
@@ -344,7 +595,7 @@ cdef class cKDTree:
             int k, 
             double eps, 
             double p, 
-            double distance_upper_bound):
+            double distance_upper_bound) nogil:
         cdef heap q
         cdef heap neighbors
 
@@ -376,7 +627,7 @@ cdef class cKDTree:
         heapcreate(&neighbors,k)
 
         # set up first nodeinfo
-        inf = <nodeinfo*>stdlib.malloc(sizeof(nodeinfo)+self.m*sizeof(double)) 
+        inf = <nodeinfo*>malloc(sizeof(nodeinfo)+self.m*sizeof(double)) 
         inf.node = self.tree
         for i in range(self.m):
             inf.side_distances[i] = 0
@@ -432,7 +683,7 @@ cdef class cKDTree:
                         if neighbors.n==k:
                             distance_upper_bound = -heappeek(&neighbors).priority
                 # done with this node, get another
-                stdlib.free(inf)
+                free(inf)
                 if q.n==0:
                     # no more nodes to visit
                     break
@@ -448,10 +699,10 @@ cdef class cKDTree:
                 # here even if the cell's too far
                 if min_distance>distance_upper_bound*epsfac:
                     # since this is the nearest cell, we're done, bail out
-                    stdlib.free(inf)
+                    free(inf)
                     # free all the nodes still on the heap
                     for i in range(q.n):
-                        stdlib.free(q.heap[i].contents.ptrdata)
+                        free(q.heap[i].contents.ptrdata)
                     break
 
                 # set up children for searching
@@ -470,7 +721,7 @@ cdef class cKDTree:
                 # far child is further by an amount depending only
                 # on the split value; compute its distance and side_distances
                 # and push it on the queue if it's near enough
-                inf2 = <nodeinfo*>stdlib.malloc(sizeof(nodeinfo)+self.m*sizeof(double)) 
+                inf2 = <nodeinfo*>malloc(sizeof(nodeinfo)+self.m*sizeof(double)) 
                 it2.contents.ptrdata = <char*> inf2
                 inf2.node = far
                 # most side distances unchanged
@@ -497,7 +748,7 @@ cdef class cKDTree:
                 if far_min_distance<=distance_upper_bound*epsfac:
                     heappush(&q,it2)
                 else:
-                    stdlib.free(inf2)
+                    free(inf2)
                     # just in case
                     it2.contents.ptrdata = <char*> 0
 
@@ -513,8 +764,47 @@ cdef class cKDTree:
         heapdestroy(&q)
         heapdestroy(&neighbors)
 
+    cdef void __query_range(cKDTree self,
+            double*result_distances,
+            int*result_indices,
+            double*x,
+            int start,
+            int stop,
+            int k,
+            double eps,
+            double p,
+            double distance_upper_bound) nogil:
+        cdef int c
+        for c in range(start,stop):
+            self.__query(
+                    result_distances+c*k,
+                    result_indices+c*k,
+                    x+c*self.m,
+                    k,
+                    eps,
+                    p,
+                    distance_upper_bound)
+
+    def _query_block(cKDTree self, np.ndarray dd, np.ndarray ii,
+            np.ndarray xx, int start, int stop, int k, double eps,
+            double p, double distance_upper_bound):
+        """Answer the queries xx[start:stop] without holding the GIL
+
+        dd, ii and xx must be the contiguous result and query arrays
+        allocated by query; each worker thread fills its own rows.
+        """
+        cdef double* raw_dd
+        cdef int* raw_ii
+        cdef double* raw_xx
+        raw_dd = <double*>dd.data
+        raw_ii = <int*>ii.data
+        raw_xx = <double*>xx.data
+        with nogil:
+            self.__query_range(raw_dd, raw_ii, raw_xx, start, stop,
+                    k, eps, p, distance_upper_bound)
+
     def query(cKDTree self, object x, int k=1, double eps=0, double p=2, 
-            double distance_upper_bound=infinity):
+            double distance_upper_bound=infinity, int n_jobs=1):
         """query the kd-tree for nearest neighbors
 
         Parameters:
@@ -538,6 +828,10 @@ cdef class cKDTree:
             tree searches, so if you are doing a series of nearest-neighbor
             queries, it may help to supply the distance to the nearest neighbor
             of the most recent point.
+        n_jobs : integer
+            The number of threads to split the query points across. The
+            GIL is released while searching, so the threads run
+            concurrently. If -1, one thread per processor is used.
 
         Returns:
         ========
@@ -573,15 +867,15 @@ cdef class cKDTree:
         dd.fill(infinity)
         ii = np.empty((n,k),dtype='i')
         ii.fill(self.n)
-        for c in range(n):
-            self.__query(
-                    (<double*>dd.data)+c*k,
-                    (<int*>ii.data)+c*k,
-                    (<double*>xx.data)+c*self.m, 
-                    k, 
-                    eps,
-                    p, 
+        n_jobs = min(_check_n_jobs(n_jobs),n)
+        if n_jobs<=1:
+            self._query_block(dd, ii, xx, 0, n, k, eps, p,
                     distance_upper_bound)
+        else:
+            chunk = (n+n_jobs-1)//n_jobs
+            blocks = [(dd, ii, xx, c, min(c+chunk,n), k, eps, p,
+                       distance_upper_bound) for c in range(0,n,chunk)]
+            _run_threads(self._query_block, blocks, n_jobs)
         if single:
             if k==1:
                 return dd[0,0], ii[0,0]
@@ -593,3 +887,513 @@ cdef class cKDTree:
             else:
                 return np.reshape(dd,retshape+(k,)), np.reshape(ii,retshape+(k,))
 
+
+
+    cdef __query_ball_point_traverse_no_checking(cKDTree self,
+            object results, innernode* node):
+        cdef int i
+        for i in range(node.start_idx,node.end_idx):
+            results.append(self.raw_indices[i])
+
+    cdef __query_ball_point_traverse_checking(cKDTree self,
+            object results, innernode* node, double* maxes, double* mins,
+            double* x, double r_lo, double r_hi, double r, double p):
+        cdef int i
+        cdef leafnode* lnode
+        cdef double* rect
+        if _min_distance_point(x,maxes,mins,p,self.m)>=r_lo:
+            return
+        elif _max_distance_point(x,maxes,mins,p,self.m)<r_hi:
+            self.__query_ball_point_traverse_no_checking(results, node)
+        elif node.split_dim==-1:
+            lnode = <leafnode*>node
+            for i in range(lnode.start_idx,lnode.end_idx):
+                if _distance_p(self.raw_data+self.raw_indices[i]*self.m,
+                        x,p,self.m,r)<=r:
+                    results.append(self.raw_indices[i])
+        else:
+            rect = _split_rectangle(maxes,mins,node.split_dim,node.split,self.m,1)
+            self.__query_ball_point_traverse_checking(results,
+                    node.less, rect, rect+self.m, x, r_lo, r_hi, r, p)
+            free(rect)
+            rect = _split_rectangle(maxes,mins,node.split_dim,node.split,self.m,0)
+            self.__query_ball_point_traverse_checking(results,
+                    node.greater, rect, rect+self.m, x, r_lo, r_hi, r, p)
+            free(rect)
+
+    cdef object __query_ball_point(cKDTree self, double* x, double r,
+            double p, double eps):
+        results = []
+        self.__query_ball_point_traverse_checking(results, self.tree,
+                self.raw_maxes, self.raw_mins, x,
+                _distance_power(r/(1.+eps),p), _distance_power(r*(1.+eps),p),
+                _distance_power(r,p), p)
+        return results
+
+    def query_ball_point(cKDTree self, object x, double r, double p=2.,
+            double eps=0):
+        """Find all points within r of x
+
+        Parameters
+        ==========
+
+        x : array_like, shape tuple + (self.m,)
+            The point or points to search for neighbors of
+        r : positive float
+            The radius of points to return
+        p : float 1<=p<=infinity
+            Which Minkowski p-norm to use
+        eps : nonnegative float
+            Approximate search. Branches of the tree are not explored
+            if their nearest points are further than r/(1+eps), and branches
+            are added in bulk if their furthest points are nearer than r*(1+eps).
+
+        Returns
+        =======
+
+        results : list or array of lists
+            If x is a single point, returns a list of the indices of the neighbors
+            of x. If x is an array of points, returns an object array of shape tuple
+            containing lists of neighbors.
+        """
+        cdef np.ndarray[double, ndim=1] xx
+        x = np.asarray(x).astype(np.float)
+        if x.shape[-1]!=self.m:
+            raise ValueError("Searching for a %d-dimensional point in a %d-dimensional KDTree" % (x.shape[-1],self.m))
+        if p<1:
+            raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+        if len(x.shape)==1:
+            xx = np.ascontiguousarray(x)
+            return self.__query_ball_point(<double*>xx.data, r, p, eps)
+        else:
+            retshape = x.shape[:-1]
+            result = np.empty(retshape,dtype=np.object)
+            for c in np.ndindex(retshape):
+                xx = np.ascontiguousarray(x[c])
+                result[c] = self.__query_ball_point(<double*>xx.data, r, p, eps)
+            return result
+
+
+    cdef __query_ball_tree_traverse_no_checking(cKDTree self, cKDTree other,
+            object results, innernode* node1, innernode* node2):
+        cdef int i, j
+        for i in range(node1.start_idx,node1.end_idx):
+            l = results[self.raw_indices[i]]
+            for j in range(node2.start_idx,node2.end_idx):
+                l.append(other.raw_indices[j])
+
+    cdef __query_ball_tree_traverse_checking(cKDTree self, cKDTree other,
+            object results,
+            innernode* node1, double* maxes1, double* mins1,
+            innernode* node2, double* maxes2, double* mins2,
+            double r_lo, double r_hi, double r, double p):
+        cdef int i, j
+        cdef double* rect1
+        cdef double* rect2
+        if _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)>r_lo:
+            return
+        elif _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)<r_hi:
+            self.__query_ball_tree_traverse_no_checking(other, results,
+                    node1, node2)
+        elif node1.split_dim==-1:
+            if node2.split_dim==-1:
+                for i in range(node1.start_idx,node1.end_idx):
+                    l = results[self.raw_indices[i]]
+                    for j in range(node2.start_idx,node2.end_idx):
+                        if _distance_p(
+                                self.raw_data+self.raw_indices[i]*self.m,
+                                other.raw_data+other.raw_indices[j]*self.m,
+                                p,self.m,r)<=r:
+                            l.append(other.raw_indices[j])
+            else:
+                rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)
+                self.__query_ball_tree_traverse_checking(other, results,
+                        node1, maxes1, mins1, node2.less, rect2, rect2+self.m,
+                        r_lo, r_hi, r, p)
+                free(rect2)
+                rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
+                self.__query_ball_tree_traverse_checking(other, results,
+                        node1, maxes1, mins1, node2.greater, rect2, rect2+self.m,
+                        r_lo, r_hi, r, p)
+                free(rect2)
+        else:
+            rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)
+            self.__query_ball_tree_traverse_checking(other, results,
+                    node1.less, rect1, rect1+self.m, node2, maxes2, mins2,
+                    r_lo, r_hi, r, p)
+            free(rect1)
+            rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+            self.__query_ball_tree_traverse_checking(other, results,
+                    node1.greater, rect1, rect1+self.m, node2, maxes2, mins2,
+                    r_lo, r_hi, r, p)
+            free(rect1)
+
+    def query_ball_tree(cKDTree self, cKDTree other, double r, double p=2.,
+            double eps=0):
+        """Find all pairs of points whose distance is at most r
+
+        Parameters
+        ==========
+
+        other : cKDTree
+            The tree containing points to search against
+        r : positive float
+            The maximum distance
+        p : float 1<=p<=infinity
+            Which Minkowski norm to use
+        eps : nonnegative float
+            Approximate search. Branches of the tree are not explored
+            if their nearest points are further than r/(1+eps), and branches
+            are added in bulk if their furthest points are nearer than r*(1+eps).
+
+        Returns
+        =======
+
+        results : list of lists
+            For each element self.data[i] of this tree, results[i] is a list of the
+            indices of its neighbors in other.data.
+        """
+        if other.m!=self.m:
+            raise ValueError("Trees have different dimensionality")
+        if p<1:
+            raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+        results = [[] for i in range(self.n)]
+        self.__query_ball_tree_traverse_checking(other, results,
+                self.tree, self.raw_maxes, self.raw_mins,
+                other.tree, other.raw_maxes, other.raw_mins,
+                _distance_power(r/(1.+eps),p), _distance_power(r*(1.+eps),p),
+                _distance_power(r,p), p)
+        return results
+
+
+    cdef __query_pairs_traverse_no_checking(cKDTree self, object results,
+            innernode* node1, innernode* node2):
+        cdef int i, j, min_j
+        for i in range(node1.start_idx,node1.end_idx):
+            # a node paired with itself only yields each pair once
+            if node1==node2:
+                min_j = i+1
+            else:
+                min_j = node2.start_idx
+            for j in range(min_j,node2.end_idx):
+                self.__query_pairs_add(results,
+                        self.raw_indices[i], self.raw_indices[j])
+
+    cdef __query_pairs_add(cKDTree self, object results, int i, int j):
+        if i<j:
+            results.add((i,j))
+        else:
+            results.add((j,i))
+
+    cdef __query_pairs_traverse_checking(cKDTree self, object results,
+            innernode* node1, double* maxes1, double* mins1,
+            innernode* node2, double* maxes2, double* mins2,
+            double r_lo, double r_hi, double r, double p):
+        cdef int i, j, min_j
+        cdef double* rect1
+        cdef double* rect2
+        cdef double* less1
+        cdef double* greater1
+        cdef double* less2
+        cdef double* greater2
+        if _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)>r_lo:
+            return
+        elif _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)<r_hi:
+            self.__query_pairs_traverse_no_checking(results, node1, node2)
+        elif node1.split_dim==-1:
+            if node2.split_dim==-1:
+                for i in range(node1.start_idx,node1.end_idx):
+                    if node1==node2:
+                        min_j = i+1
+                    else:
+                        min_j = node2.start_idx
+                    for j in range(min_j,node2.end_idx):
+                        if _distance_p(
+                                self.raw_data+self.raw_indices[i]*self.m,
+                                self.raw_data+self.raw_indices[j]*self.m,
+                                p,self.m,r)<=r:
+                            self.__query_pairs_add(results,
+                                    self.raw_indices[i], self.raw_indices[j])
+            else:
+                rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)
+                self.__query_pairs_traverse_checking(results,
+                        node1, maxes1, mins1, node2.less, rect2, rect2+self.m,
+                        r_lo, r_hi, r, p)
+                free(rect2)
+                rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
+                self.__query_pairs_traverse_checking(results,
+                        node1, maxes1, mins1, node2.greater, rect2, rect2+self.m,
+                        r_lo, r_hi, r, p)
+                free(rect2)
+        elif node2.split_dim==-1:
+            rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)
+            self.__query_pairs_traverse_checking(results,
+                    node1.less, rect1, rect1+self.m, node2, maxes2, mins2,
+                    r_lo, r_hi, r, p)
+            free(rect1)
+            rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+            self.__query_pairs_traverse_checking(results,
+                    node1.greater, rect1, rect1+self.m, node2, maxes2, mins2,
+                    r_lo, r_hi, r, p)
+            free(rect1)
+        else:
+            # both subtrees are split; when a node is paired with itself
+            # the (greater, less) combination duplicates (less, greater)
+            less1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)
+            greater1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+            less2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)
+            greater2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
+            self.__query_pairs_traverse_checking(results,
+                    node1.less, less1, less1+self.m,
+                    node2.less, less2, less2+self.m,
+                    r_lo, r_hi, r, p)
+            self.__query_pairs_traverse_checking(results,
+                    node1.less, less1, less1+self.m,
+                    node2.greater, greater2, greater2+self.m,
+                    r_lo, r_hi, r, p)
+            if node1!=node2:
+                self.__query_pairs_traverse_checking(results,
+                        node1.greater, greater1, greater1+self.m,
+                        node2.less, less2, less2+self.m,
+                        r_lo, r_hi, r, p)
+            self.__query_pairs_traverse_checking(results,
+                    node1.greater, greater1, greater1+self.m,
+                    node2.greater, greater2, greater2+self.m,
+                    r_lo, r_hi, r, p)
+            free(less1)
+            free(greater1)
+            free(less2)
+            free(greater2)
+
+    def query_pairs(cKDTree self, double r, double p=2., double eps=0):
+        """Find all pairs of points whose distance is at most r
+
+        Parameters
+        ==========
+
+        r : positive float
+            The maximum distance
+        p : float 1<=p<=infinity
+            Which Minkowski norm to use
+        eps : nonnegative float
+            Approximate search. Branches of the tree are not explored
+            if their nearest points are further than r/(1+eps), and branches
+            are added in bulk if their furthest points are nearer than r*(1+eps).
+
+        Returns
+        =======
+
+        results : set
+            set of pairs (i,j), i<j, for which the corresponing positions are
+            close.
+        """
+        if p<1:
+            raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+        results = set()
+        self.__query_pairs_traverse_checking(results,
+                self.tree, self.raw_maxes, self.raw_mins,
+                self.tree, self.raw_maxes, self.raw_mins,
+                _distance_power(r/(1.+eps),p), _distance_power(r*(1.+eps),p),
+                _distance_power(r,p), p)
+        return results
+
+
+    cdef __count_neighbors_traverse(cKDTree self, cKDTree other,
+            np.int_t* results, double* r, int* idx, int n_idx,
+            innernode* node1, double* maxes1, double* mins1,
+            innernode* node2, double* maxes2, double* mins2, double p):
+        cdef int i, j, c, n_inner
+        cdef int* inner_idx
+        cdef double min_r, max_r, d, r_max
+        cdef double* rect1
+        cdef double* rect2
+        min_r = _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)
+        max_r = _max_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)
+
+        # radii beyond max_r count every pair at once, radii below min_r
+        # count nothing; only the rest need a closer look
+        inner_idx = <int*>malloc(n_idx*sizeof(int))
+        n_inner = 0
+        r_max = 0
+        for c in range(n_idx):
+            if r[idx[c]]>max_r:
+                results[idx[c]] += node1.n_points*node2.n_points
+            elif r[idx[c]]>=min_r:
+                inner_idx[n_inner] = idx[c]
+                n_inner += 1
+                r_max = dmax(r_max,r[idx[c]])
+
+        if n_inner==0:
+            pass
+        elif node1.split_dim==-1:
+            if node2.split_dim==-1:
+                for i in range(node1.start_idx,node1.end_idx):
+                    for j in range(node2.start_idx,node2.end_idx):
+                        d = _distance_p(
+                                self.raw_data+self.raw_indices[i]*self.m,
+                                other.raw_data+other.raw_indices[j]*self.m,
+                                p,self.m,r_max)
+                        for c in range(n_inner):
+                            if d<=r[inner_idx[c]]:
+                                results[inner_idx[c]] += 1
+            else:
+                rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)
+                self.__count_neighbors_traverse(other, results, r,
+                        inner_idx, n_inner,
+                        node1, maxes1, mins1, node2.less, rect2, rect2+self.m, p)
+                free(rect2)
+                rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
+                self.__count_neighbors_traverse(other, results, r,
+                        inner_idx, n_inner,
+                        node1, maxes1, mins1, node2.greater, rect2, rect2+self.m, p)
+                free(rect2)
+        else:
+            rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)
+            self.__count_neighbors_traverse(other, results, r,
+                    inner_idx, n_inner,
+                    node1.less, rect1, rect1+self.m, node2, maxes2, mins2, p)
+            free(rect1)
+            rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+            self.__count_neighbors_traverse(other, results, r,
+                    inner_idx, n_inner,
+                    node1.greater, rect1, rect1+self.m, node2, maxes2, mins2, p)
+            free(rect1)
+        free(inner_idx)
+
+    def count_neighbors(cKDTree self, cKDTree other, object r, double p=2.):
+        """Count how many nearby pairs can be formed.
+
+        Count the number of pairs (x1,x2) can be formed, with x1 drawn
+        from self and x2 drawn from other, and where distance(x1,x2,p)<=r.
+        This is the "two-point correlation" described in Gray and Moore 2000,
+        "N-body problems in statistical learning", and the code here is based
+        on their algorithm.
+
+        Parameters
+        ==========
+
+        other : cKDTree
+
+        r : float or one-dimensional array of floats
+            The radius to produce a count for. Multiple radii are searched with a single
+            tree traversal.
+        p : float, 1<=p<=infinity
+            Which Minkowski p-norm to use
+
+        Returns
+        =======
+
+        result : integer or one-dimensional array of integers
+            The number of pairs. Note that this is internally stored in a numpy int,
+            and so may overflow if very large (two billion).
+        """
+        cdef np.ndarray[double, ndim=1] rr
+        cdef np.ndarray[np.int_t, ndim=1] results
+        cdef np.ndarray[int, ndim=1] idx
+        cdef int n
+        if other.m!=self.m:
+            raise ValueError("Trees have different dimensionality")
+        if p<1:
+            raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+        if np.shape(r)==():
+            single = True
+            rr = np.array([r],dtype=np.float)
+        elif len(np.shape(r))==1:
+            single = False
+            rr = np.array(r,dtype=np.float)
+        else:
+            raise ValueError("r must be either a single value or a one-dimensional array of values")
+        n = rr.shape[0]
+        if p!=1 and p!=infinity:
+            rr = rr**p
+        results = np.zeros(n,dtype=int)
+        idx = np.arange(n,dtype='i')
+        self.__count_neighbors_traverse(other, <np.int_t*>results.data,
+                <double*>rr.data, <int*>idx.data, n,
+                self.tree, self.raw_maxes, self.raw_mins,
+                other.tree, other.raw_maxes, other.raw_mins, p)
+        if single:
+            return results[0]
+        else:
+            return results
+
+
+    cdef __sparse_distance_matrix_traverse(cKDTree self, cKDTree other,
+            object result,
+            innernode* node1, double* maxes1, double* mins1,
+            innernode* node2, double* maxes2, double* mins2,
+            double max_distance, double p):
+        cdef int i, j
+        cdef double d
+        cdef double* rect1
+        cdef double* rect2
+        if _min_distance_rectangle(maxes1,mins1,maxes2,mins2,p,self.m)>max_distance:
+            return
+        elif node1.split_dim==-1:
+            if node2.split_dim==-1:
+                for i in range(node1.start_idx,node1.end_idx):
+                    for j in range(node2.start_idx,node2.end_idx):
+                        d = _distance_p(
+                                self.raw_data+self.raw_indices[i]*self.m,
+                                other.raw_data+other.raw_indices[j]*self.m,
+                                p,self.m,max_distance)
+                        if d<=max_distance:
+                            if p!=1 and p!=infinity:
+                                d = d**(1./p)
+                            result[self.raw_indices[i],other.raw_indices[j]] = d
+            else:
+                rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,1)
+                self.__sparse_distance_matrix_traverse(other, result,
+                        node1, maxes1, mins1, node2.less, rect2, rect2+self.m,
+                        max_distance, p)
+                free(rect2)
+                rect2 = _split_rectangle(maxes2,mins2,node2.split_dim,node2.split,self.m,0)
+                self.__sparse_distance_matrix_traverse(other, result,
+                        node1, maxes1, mins1, node2.greater, rect2, rect2+self.m,
+                        max_distance, p)
+                free(rect2)
+        else:
+            rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,1)
+            self.__sparse_distance_matrix_traverse(other, result,
+                    node1.less, rect1, rect1+self.m, node2, maxes2, mins2,
+                    max_distance, p)
+            free(rect1)
+            rect1 = _split_rectangle(maxes1,mins1,node1.split_dim,node1.split,self.m,0)
+            self.__sparse_distance_matrix_traverse(other, result,
+                    node1.greater, rect1, rect1+self.m, node2, maxes2, mins2,
+                    max_distance, p)
+            free(rect1)
+
+    def sparse_distance_matrix(cKDTree self, cKDTree other,
+            double max_distance, double p=2.):
+        """Compute a sparse distance matrix
+
+        Computes a distance matrix between two cKDTrees, leaving as zero
+        any distance greater than max_distance.
+
+        Parameters
+        ==========
+
+        other : cKDTree
+
+        max_distance : positive float
+
+        p : float, 1<=p<=infinity
+            Which Minkowski p-norm to use
+
+        Returns
+        =======
+
+        result : dok_matrix
+            Sparse matrix representing the results in "dictionary of keys" format.
+        """
+        if other.m!=self.m:
+            raise ValueError("Trees have different dimensionality")
+        if p<1:
+            raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+        result = scipy.sparse.dok_matrix((self.n,other.n))
+        self.__sparse_distance_matrix_traverse(other, result,
+                self.tree, self.raw_maxes, self.raw_mins,
+                other.tree, other.raw_maxes, other.raw_mins,
+                _distance_power(max_distance,p), p)
+        return result
@@ -14,6 +14,9 @@ stored in a rectangular array.
 |cdist             | distances between between two collections of    |
 |                  | observation vectors.                            |
 +------------------+-------------------------------------------------+
+|cdist_chunked     | generates the rows of a ``cdist`` distance      |
+|                  | matrix in blocks of bounded size.               |
++------------------+-------------------------------------------------+
 |squareform        | converts a square distance matrix to a          |
 |                  | condensed one and vice versa.                   |
 +------------------+-------------------------------------------------+
@@ -137,6 +140,8 @@ Copyright (C) Damian Eads, 2007-2008. New BSD License.
 
 import numpy as np
 import _distance_wrap
+from scipy.lib._threads import check_n_jobs as _check_n_jobs, \
+     run_threads as _run_threads
 import types
 
 def _copy_array_if_base_present(a):
@@ -174,6 +179,272 @@ def _convert_to_double(X):
         X = X.copy()
     return X
 
+def _prepare_out(out, shape):
+    """
+    Returns the array the distances should be written to: a new zeroed
+    array if out is None, otherwise out itself after checking that the
+    C code can write into it directly.
+    """
+    if out is None:
+        return np.zeros(shape, dtype=np.double)
+    if not isinstance(out, np.ndarray):
+        raise TypeError('out must be a numpy array.')
+    if out.dtype != np.double:
+        raise TypeError('out must contain doubles.')
+    if out.shape != shape:
+        raise ValueError('out must have shape %s (got %s).' % (shape, out.shape))
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError('out must be a writeable C-contiguous array.')
+    return out
+
+_bool_metrics = set(['yule', 'matching', 'kulsinski', 'dice', 'rogerstanimoto',
+                     'russellrao', 'sokalmichener', 'sokalsneath'])
+
+def _cdist_kernel(mstr, XA, XB, p=2, V=None, VI=None, w=None):
+    """
+    Returns a function kernel(ia, ib, dm) that stores the distances
+    between the rows XA[ia] and XB[ib] (ia and ib are slices) in the
+    C-contiguous double array dm, using the compiled metric named by
+    mstr. Anything the metric needs from the whole of XA and XB (norms,
+    variances, the inverse covariance) is computed here, once. Returns
+    None if mstr does not name a compiled metric.
+    """
+    n = XA.shape[1]
+    if mstr in set(['euclidean', 'euclid', 'eu', 'e']):
+        XA = _convert_to_double(XA)
+        XB = _convert_to_double(XB)
+        def kernel(ia, ib, dm):
+            _distance_wrap.cdist_euclidean_wrap(XA[ia], XB[ib], dm)
+    elif mstr in set(['sqeuclidean', 'sqe', 'sqeuclid']):
+        XA = _convert_to_double(XA)
+        XB = _convert_to_double(XB)
+        def kernel(ia, ib, dm):
+            _distance_wrap.cdist_euclidean_wrap(XA[ia], XB[ib], dm)
+            dm **= 2.0
+    elif mstr in set(['cityblock', 'cblock', 'cb', 'c']):
+        XA = _convert_to_double(XA)
+        XB = _convert_to_double(XB)
+        def kernel(ia, ib, dm):
+            _distance_wrap.cdist_city_block_wrap(XA[ia], XB[ib], dm)
+    elif mstr in set(['hamming', 'hamm', 'ha', 'h']):
+        if XA.dtype == np.bool:
+            XA = _convert_to_bool(XA)
+            XB = _convert_to_bool(XB)
+            def kernel(ia, ib, dm):
+                _distance_wrap.cdist_hamming_bool_wrap(XA[ia], XB[ib], dm)
+        else:
+            XA = _convert_to_double(XA)
+            XB = _convert_to_double(XB)
+            def kernel(ia, ib, dm):
+                _distance_wrap.cdist_hamming_wrap(XA[ia], XB[ib], dm)
+    elif mstr in set(['jaccard', 'jacc', 'ja', 'j']):
+        if XA.dtype == np.bool:
+            XA = _convert_to_bool(XA)
+            XB = _convert_to_bool(XB)
+            def kernel(ia, ib, dm):
+                _distance_wrap.cdist_jaccard_bool_wrap(XA[ia], XB[ib], dm)
+        else:
+            XA = _convert_to_double(XA)
+            XB = _convert_to_double(XB)
+            def kernel(ia, ib, dm):
+                _distance_wrap.cdist_jaccard_wrap(XA[ia], XB[ib], dm)
+    elif mstr in set(['chebychev', 'chebyshev', 'cheby', 'cheb', 'ch']):
+        XA = _convert_to_double(XA)
+        XB = _convert_to_double(XB)
+        def kernel(ia, ib, dm):
+            _distance_wrap.cdist_chebyshev_wrap(XA[ia], XB[ib], dm)
+    elif mstr in set(['minkowski', 'mi', 'm', 'pnorm']):
+        XA = _convert_to_double(XA)
+        XB = _convert_to_double(XB)
+        def kernel(ia, ib, dm):
+            _distance_wrap.cdist_minkowski_wrap(XA[ia], XB[ib], dm, p)
+    elif mstr in set(['wminkowski', 'wmi', 'wm', 'wpnorm']):
+        XA = _convert_to_double(XA)
+        XB = _convert_to_double(XB)
+        w = _convert_to_double(w)
+        def kernel(ia, ib, dm):
+            _distance_wrap.cdist_weighted_minkowski_wrap(XA[ia], XB[ib], dm, p, w)
+    elif mstr in set(['seuclidean', 'se', 's']):
+        if V is not None:
+            V = np.asarray(V, order='c')
+            if type(V) != np.ndarray:
+                raise TypeError('Variance vector V must be a numpy array')
+            if V.dtype != np.double:
+                raise TypeError('Variance vector V must contain doubles.')
+            if len(V.shape) != 1:
+                raise ValueError('Variance vector V must be one-dimensional.')
+            if V.shape[0] != n:
+                raise ValueError('Variance vector V must be of the same dimension as the vectors on which the distances are computed.')
+            # The C code doesn't do striding.
+            [VV] = _copy_arrays_if_base_present([_convert_to_double(V)])
+        else:
+            X = np.vstack([XA, XB])
+            VV = np.var(X, axis=0, ddof=1)
+            X = None
+            del X
+        XA = _convert_to_double(XA)
+        XB = _convert_to_double(XB)
+        def kernel(ia, ib, dm):
+            _distance_wrap.cdist_seuclidean_wrap(XA[ia], XB[ib], VV, dm)
+    elif mstr in set(['cosine', 'cos']):
+        XA = _convert_to_double(XA)
+        XB = _convert_to_double(XB)
+        normsA = np.sqrt(np.sum(XA * XA, axis=1))
+        normsB = np.sqrt(np.sum(XB * XB, axis=1))
+        def kernel(ia, ib, dm):
+            _distance_wrap.cdist_cosine_wrap(XA[ia], XB[ib], dm,
+                                             normsA[ia], normsB[ib])
+    elif mstr in set(['correlation', 'co']):
+        XA2 = _convert_to_double(XA - XA.mean(1)[:,np.newaxis])
+        XB2 = _convert_to_double(XB - XB.mean(1)[:,np.newaxis])
+        normsA = _convert_to_double(np.sqrt(np.sum(XA2 * XA2, axis=1)))
+        normsB = _convert_to_double(np.sqrt(np.sum(XB2 * XB2, axis=1)))
+        def kernel(ia, ib, dm):
+            _distance_wrap.cdist_cosine_wrap(XA2[ia], XB2[ib], dm,
+                                             normsA[ia], normsB[ib])
+    elif mstr in set(['mahalanobis', 'mahal', 'mah']):
+        if VI is not None:
+            VI = _convert_to_double(np.asarray(VI, order='c'))
+            if type(VI) != np.ndarray:
+                raise TypeError('VI must be a numpy array.')
+            if VI.dtype != np.double:
+                raise TypeError('The array must contain 64-bit floats.')
+            [VI] = _copy_arrays_if_base_present([VI])
+        else:
+            X = np.vstack([XA, XB])
+            V = np.cov(X.T)
+            X = None
+            del X
+            VI = _convert_to_double(np.linalg.inv(V).T.copy())
+        XA = _convert_to_double(XA)
+        XB = _convert_to_double(XB)
+        # (u-v)V^(-1)(u-v)^T
+        def kernel(ia, ib, dm):
+            _distance_wrap.cdist_mahalanobis_wrap(XA[ia], XB[ib], VI, dm)
+    elif mstr == 'canberra':
+        XA = _convert_to_double(XA)
+        XB = _convert_to_double(XB)
+        def kernel(ia, ib, dm):
+            _distance_wrap.cdist_canberra_wrap(XA[ia], XB[ib], dm)
+    elif mstr == 'braycurtis':
+        XA = _convert_to_double(XA)
+        XB = _convert_to_double(XB)
+        def kernel(ia, ib, dm):
+            _distance_wrap.cdist_bray_curtis_wrap(XA[ia], XB[ib], dm)
+    elif mstr in _bool_metrics:
+        XA = _convert_to_bool(XA)
+        XB = _convert_to_bool(XB)
+        f = getattr(_distance_wrap, 'cdist_%s_bool_wrap' % mstr)
+        def kernel(ia, ib, dm):
+            f(XA[ia], XB[ib], dm)
+    else:
+        return None
+    return kernel
+
+def _cdist_blocked(kernel, dm, n_jobs, start=0):
+    """
+    Fills dm with the distances between the rows start to
+    start + dm.shape[0] of XA and all of XB using kernel, one block of
+    rows per call.
+    """
+    mA, mB = dm.shape
+    if n_jobs == 1:
+        kernel(slice(start, start + mA), slice(0, mB), dm)
+        return
+    # several blocks per thread so that none of them finishes early
+    step = max(1, -(-mA // (4 * n_jobs)))
+    blocks = [(slice(start + i, start + min(i + step, mA)), slice(0, mB),
+               dm[i:i + step])
+              for i in xrange(0, mA, step)]
+    _run_threads(kernel, blocks, n_jobs)
+
+def _pdist_kernel(mstr, X, p=2, V=None, VI=None):
+    """
+    Like _cdist_kernel, for the distances between the rows of X, with
+    the default variances and inverse covariance computed as pdist
+    does.
+    """
+    if mstr in set(['seuclidean', 'se', 's']) and V is None:
+        V = np.var(X, axis=0, ddof=1)
+    elif mstr in set(['mahalanobis', 'mahal', 'mah']) and VI is None:
+        VI = np.linalg.inv(np.cov(X.T)).T.copy()
+    elif mstr in set(['wminkowski', 'wmi', 'wm', 'wpnorm']):
+        # pdist has no weights to pass
+        return None
+    return _cdist_kernel(mstr, X, X, p, V, VI)
+
+_TILE_SIZE = 2 ** 18
+
+def _pdist_vectorized(metric, X, dm):
+    """
+    Fills the condensed distance matrix dm by calling metric(U, V) on
+    blocks of about _TILE_SIZE elements, where the rows U[k] and V[k]
+    are the observations of the k'th pair.
+    """
+    m, n = X.shape
+    size = max(1, _TILE_SIZE // max(1, n))
+    i0 = 0
+    k0 = 0
+    while i0 < m - 1:
+        # the rows i0 <= i < i1, at least one whole row per block
+        i1 = i0 + 1
+        npairs = m - i0 - 1
+        while i1 < m - 1 and npairs + m - i1 - 1 <= size:
+            npairs += m - i1 - 1
+            i1 += 1
+        rows = np.arange(i0, i1)
+        counts = m - 1 - rows
+        first = np.cumsum(counts) - counts
+        I = np.repeat(rows, counts)
+        J = np.arange(npairs) - np.repeat(first - rows - 1, counts)
+        dm[k0:k0 + npairs] = _call_vectorized(metric, X[I], X[J])
+        k0 += npairs
+        i0 = i1
+
+def _cdist_vectorized(metric, XA, XB, dm):
+    """
+    Fills the distance matrix dm between XA and XB by calling
+    metric(U, V) on blocks of about _TILE_SIZE elements, where the rows
+    U[k] and V[k] are the observations of the k'th pair.
+    """
+    mA, n = XA.shape
+    mB = XB.shape[0]
+    size = max(1, _TILE_SIZE // max(1, n))
+    flat = dm.reshape(mA * mB)
+    for k0 in xrange(0, mA * mB, size):
+        k = np.arange(k0, min(k0 + size, mA * mB))
+        flat[k0:k0 + len(k)] = _call_vectorized(metric, XA[k // mB], XB[k % mB])
+
+def _call_vectorized(metric, U, V):
+    d = np.asarray(metric(U, V))
+    if d.shape != (U.shape[0],):
+        raise ValueError('A vectorized metric must return one distance per row (expected shape %s, got %s).' % ((U.shape[0],), d.shape))
+    return d
+
+def _pdist_blocked(kernel, m, dm, n_jobs):
+    """
+    Fills the condensed distance matrix dm of m observations using
+    kernel. Each block of rows i0 <= i < i1 is computed against the
+    observations i0 and up into a temporary tile, whose entries above
+    the diagonal are then copied to their place in dm.
+    """
+    # keep the tiles near _TILE_SIZE doubles, and small enough that the
+    # triangular work can be balanced over the threads
+    size = min(_TILE_SIZE, max(1, m * (m - 1) // (8 * n_jobs)))
+    blocks = []
+    i0 = 0
+    while i0 < m - 1:
+        i1 = i0 + max(1, size // (m - i0))
+        blocks.append((i0, min(i1, m - 1)))
+        i0 = i1
+    def block(i0, i1):
+        tile = np.empty((i1 - i0, m - i0), dtype=np.double)
+        kernel(slice(i0, i1), slice(i0, m), tile)
+        for i in xrange(i0, i1):
+            k = i * m - i * (i + 1) // 2
+            dm[k:k + m - i - 1] = tile[i - i0, i - i0 + 1:]
+    _run_threads(block, blocks, n_jobs)
+
 def minkowski(u, v, p):
     r"""
     Computes the Minkowski distance between two vectors ``u`` and ``v``,
@@ -827,7 +1098,8 @@ def sokalsneath(u, v):
     return float(2.0 * (ntf + nft))/float(ntt + 2.0 * (ntf + nft))
 
 
-def pdist(X, metric='euclidean', p=2, V=None, VI=None):
+def pdist(X, metric='euclidean', p=2, V=None, VI=None, out=None, n_jobs=1,
+          vectorized=False):
     r"""
     Computes the pairwise distances between m original observations in
     n-dimensional space. Returns a condensed distance matrix Y.  For
@@ -1019,6 +1291,14 @@ def pdist(X, metric='euclidean', p=2, V=None, VI=None):
 
          dm = pdist(X, 'sokalsneath')
 
+       A function written with array operations can instead be
+       applied to many pairs at once by passing ``vectorized=True``.
+       It is then called with two arrays whose rows are the pairs of
+       vectors, and returns a vector of distances::
+
+         dm = pdist(X, (lambda U, V: np.sqrt(((U-V)**2).sum(axis=1))),
+                    vectorized=True)
+
     :Parameters:
        X : ndarray
            An m by n array of m original observations in an
@@ -1038,10 +1318,25 @@ def pdist(X, metric='euclidean', p=2, V=None, VI=None):
            The variance vector (for standardized Euclidean).
        VI : ndarray
            The inverse of the covariance matrix (for Mahalanobis).
+       out : ndarray
+           A C-contiguous array of doubles of shape
+           ``(m * (m - 1) / 2,)`` in which to store the result. If
+           not given, a new array is allocated.
+       n_jobs : int
+           The number of threads over which to spread the computation
+           for the named (compiled) metrics, or -1 to use all the
+           processors. The work is split into blocks of rows computed
+           with the GIL released.
+       vectorized : bool
+           If True, the function ``metric`` is called with two k by n
+           arrays ``U`` and ``V`` holding many pairs of observations
+           at once, and must return the k distances between the rows
+           ``U[i]`` and ``V[i]``. This avoids a Python function call
+           per pair when the metric is written with array operations.
 
     :Returns:
        Y : ndarray
-           A condensed distance matrix.
+           A condensed distance matrix (``out``, if it was given).
 
     :SeeAlso:
 
@@ -1073,9 +1368,12 @@ def pdist(X, metric='euclidean', p=2, V=None, VI=None):
 
     m = s[0]
     n = s[1]
-    dm = np.zeros((m * (m - 1) / 2,), dtype=np.double)
+    dm = _prepare_out(out, (m * (m - 1) / 2,))
+    n_jobs = _check_n_jobs(n_jobs)
 
-    if callable(metric):
+    if callable(metric) and vectorized:
+        _pdist_vectorized(metric, X, dm)
+    elif callable(metric):
         k = 0
         if metric == minkowski:
             for i in xrange(0, m - 1):
@@ -1109,11 +1407,16 @@ def pdist(X, metric='euclidean', p=2, V=None, VI=None):
         #if X.dtype != np.double and \
         #       (mstr != 'hamming' and mstr != 'jaccard'):
         #    TypeError('A double array must be passed.')
-        if mstr in set(['euclidean', 'euclid', 'eu', 'e']):
+        kernel = None
+        if n_jobs > 1:
+            kernel = _pdist_kernel(mstr, X, p, V, VI)
+        if kernel is not None:
+            _pdist_blocked(kernel, m, dm, n_jobs)
+        elif mstr in set(['euclidean', 'euclid', 'eu', 'e']):
             _distance_wrap.pdist_euclidean_wrap(_convert_to_double(X), dm)
         elif mstr in set(['sqeuclidean', 'sqe', 'sqeuclid']):
             _distance_wrap.pdist_euclidean_wrap(_convert_to_double(X), dm)
-            dm = dm ** 2.0
+            dm **= 2.0
         elif mstr in set(['cityblock', 'cblock', 'cb', 'c']):
             _distance_wrap.pdist_city_block_wrap(X, dm)
         elif mstr in set(['hamming', 'hamm', 'ha', 'h']):
@@ -1261,6 +1564,9 @@ def pdist(X, metric='euclidean', p=2, V=None, VI=None):
             raise ValueError('Unknown Distance Metric: %s' % mstr)
     else:
         raise TypeError('2nd argument metric must be a string identifier or a function.')
+    if out is not None and dm is not out:
+        out[:] = dm
+        dm = out
     return dm
 
 def squareform(X, force="no", checks=True):
@@ -1559,7 +1865,35 @@ def num_obs_y(Y):
     return d
 
 
-def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
+def _cdist_inputs(XA, XB):
+    """
+    Returns XA and XB as C-contiguous double arrays after checking that
+    they hold observations of the same dimension.
+    """
+    XA = np.asarray(XA, order='c')
+    XB = np.asarray(XB, order='c')
+
+    #if np.issubsctype(X, np.floating) and not np.issubsctype(X, np.double):
+    #    raise TypeError('Floating point arrays must be 64-bit (got %r).' %
+    #    (X.dtype.type,))
+
+    # The C code doesn't do striding.
+    [XA] = _copy_arrays_if_base_present([_convert_to_double(XA)])
+    [XB] = _copy_arrays_if_base_present([_convert_to_double(XB)])
+
+    s = XA.shape
+    sB = XB.shape
+
+    if len(s) != 2:
+        raise ValueError('XA must be a 2-dimensional array.');
+    if len(sB) != 2:
+        raise ValueError('XB must be a 2-dimensional array.');
+    if s[1] != sB[1]:
+        raise ValueError('XA and XB must have the same number of columns (i.e. feature dimension.)')
+    return XA, XB
+
+def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None,
+          out=None, n_jobs=1, vectorized=False):
     r"""
     Computes distance between each pair of observation vectors in the
     Cartesian product of two collections of vectors. ``XA`` is a
@@ -1756,6 +2090,14 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
 
          dm = cdist(XA, XB, 'sokalsneath')
 
+       A function written with array operations can instead be
+       applied to many pairs at once by passing ``vectorized=True``.
+       It is then called with two arrays whose rows are the pairs of
+       vectors, and returns a vector of distances::
+
+         dm = cdist(XA, XB, (lambda U, V: np.sqrt(((U-V)**2).sum(axis=1))),
+                    vectorized=True)
+
     :Parameters:
        XA : ndarray
            An :math:`m_A` by :math:`n` array of :math:`m_A`
@@ -1779,6 +2121,20 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
            The variance vector (for standardized Euclidean).
        VI : ndarray
            The inverse of the covariance matrix (for Mahalanobis).
+       out : ndarray
+           A C-contiguous :math:`m_A` by :math:`m_B` array of doubles
+           in which to store the result. If not given, a new array is
+           allocated.
+       n_jobs : int
+           The number of threads over which to spread the computation
+           for the named (compiled) metrics, or -1 to use all the
+           processors. Each thread computes blocks of rows of the
+           result with the GIL released.
+       vectorized : bool
+           If True, the function ``metric`` is called with two k by n
+           arrays ``U`` and ``V`` holding many pairs of observations
+           at once, and must return the k distances between the rows
+           ``U[i]`` and ``V[i]``, as for ``pdist``.
 
 
     :Returns:
@@ -1794,33 +2150,19 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
 #           verifiable, but less efficient implementation.
 
 
-    XA = np.asarray(XA, order='c')
-    XB = np.asarray(XB, order='c')
-
-    #if np.issubsctype(X, np.floating) and not np.issubsctype(X, np.double):
-    #    raise TypeError('Floating point arrays must be 64-bit (got %r).' %
-    #    (X.dtype.type,))
-
-    # The C code doesn't do striding.
-    [XA] = _copy_arrays_if_base_present([_convert_to_double(XA)])
-    [XB] = _copy_arrays_if_base_present([_convert_to_double(XB)])
-
+    XA, XB = _cdist_inputs(XA, XB)
     s = XA.shape
     sB = XB.shape
 
-    if len(s) != 2:
-        raise ValueError('XA must be a 2-dimensional array.');
-    if len(sB) != 2:
-        raise ValueError('XB must be a 2-dimensional array.');
-    if s[1] != sB[1]:
-        raise ValueError('XA and XB must have the same number of columns (i.e. feature dimension.)')
-
     mA = s[0]
     mB = sB[0]
     n = s[1]
-    dm = np.zeros((mA, mB), dtype=np.double)
+    dm = _prepare_out(out, (mA, mB))
+    n_jobs = _check_n_jobs(n_jobs)
 
-    if callable(metric):
+    if callable(metric) and vectorized:
+        _cdist_vectorized(metric, XA, XB, dm)
+    elif callable(metric):
         if metric == minkowski:
             for i in xrange(0, mA):
                 for j in xrange(0, mB):
@@ -1844,131 +2186,9 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
     elif isinstance(metric,basestring):
         mstr = metric.lower()
 
-        #if XA.dtype != np.double and \
-        #       (mstr != 'hamming' and mstr != 'jaccard'):
-        #    TypeError('A double array must be passed.')
-        if mstr in set(['euclidean', 'euclid', 'eu', 'e']):
-            _distance_wrap.cdist_euclidean_wrap(_convert_to_double(XA),
-                                                _convert_to_double(XB), dm)
-        elif mstr in set(['sqeuclidean', 'sqe', 'sqeuclid']):
-            _distance_wrap.cdist_euclidean_wrap(_convert_to_double(XA),
-                                                _convert_to_double(XB), dm)
-            dm **= 2.0
-        elif mstr in set(['cityblock', 'cblock', 'cb', 'c']):
-            _distance_wrap.cdist_city_block_wrap(_convert_to_double(XA),
-                                                 _convert_to_double(XB), dm)
-        elif mstr in set(['hamming', 'hamm', 'ha', 'h']):
-            if XA.dtype == np.bool:
-                _distance_wrap.cdist_hamming_bool_wrap(_convert_to_bool(XA),
-                                                       _convert_to_bool(XB), dm)
-            else:
-                _distance_wrap.cdist_hamming_wrap(_convert_to_double(XA),
-                                                  _convert_to_double(XB), dm)
-        elif mstr in set(['jaccard', 'jacc', 'ja', 'j']):
-            if XA.dtype == np.bool:
-                _distance_wrap.cdist_jaccard_bool_wrap(_convert_to_bool(XA),
-                                                       _convert_to_bool(XB), dm)
-            else:
-                _distance_wrap.cdist_jaccard_wrap(_convert_to_double(XA),
-                                                  _convert_to_double(XB), dm)
-        elif mstr in set(['chebychev', 'chebyshev', 'cheby', 'cheb', 'ch']):
-            _distance_wrap.cdist_chebyshev_wrap(_convert_to_double(XA),
-                                                _convert_to_double(XB), dm)
-        elif mstr in set(['minkowski', 'mi', 'm', 'pnorm']):
-            _distance_wrap.cdist_minkowski_wrap(_convert_to_double(XA),
-                                                _convert_to_double(XB), dm, p)
-        elif mstr in set(['wminkowski', 'wmi', 'wm', 'wpnorm']):
-            _distance_wrap.cdist_weighted_minkowski_wrap(_convert_to_double(XA),
-                                                         _convert_to_double(XB), dm, p, _convert_to_double(w))
-        elif mstr in set(['seuclidean', 'se', 's']):
-            if V is not None:
-                V = np.asarray(V, order='c')
-                if type(V) != np.ndarray:
-                    raise TypeError('Variance vector V must be a numpy array')
-                if V.dtype != np.double:
-                    raise TypeError('Variance vector V must contain doubles.')
-                if len(V.shape) != 1:
-                    raise ValueError('Variance vector V must be one-dimensional.')
-                if V.shape[0] != n:
-                    raise ValueError('Variance vector V must be of the same dimension as the vectors on which the distances are computed.')
-                # The C code doesn't do striding.
-                [VV] = _copy_arrays_if_base_present([_convert_to_double(V)])
-            else:
-                X = np.vstack([XA, XB])
-                VV = np.var(X, axis=0, ddof=1)
-                X = None
-                del X
-            _distance_wrap.cdist_seuclidean_wrap(_convert_to_double(XA),
-                                                 _convert_to_double(XB), VV, dm)
-        # Need to test whether vectorized cosine works better.
-        # Find out: Is there a dot subtraction operator so I can
-        # subtract matrices in a similar way to multiplying them?
-        # Need to get rid of as much unnecessary C code as possible.
-        elif mstr in set(['cosine', 'cos']):
-            normsA = np.sqrt(np.sum(XA * XA, axis=1))
-            normsB = np.sqrt(np.sum(XB * XB, axis=1))
-            _distance_wrap.cdist_cosine_wrap(_convert_to_double(XA),
-                                             _convert_to_double(XB), dm,
-                                             normsA,
-                                             normsB)
-        elif mstr in set(['correlation', 'co']):
-            XA2 = XA - XA.mean(1)[:,np.newaxis]
-            XB2 = XB - XB.mean(1)[:,np.newaxis]
-            #X2 = X - np.matlib.repmat(np.mean(X, axis=1).reshape(m, 1), 1, n)
-            normsA = np.sqrt(np.sum(XA2 * XA2, axis=1))
-            normsB = np.sqrt(np.sum(XB2 * XB2, axis=1))
-            _distance_wrap.cdist_cosine_wrap(_convert_to_double(XA2),
-                                             _convert_to_double(XB2),
-                                             _convert_to_double(dm),
-                                             _convert_to_double(normsA),
-                                             _convert_to_double(normsB))
-        elif mstr in set(['mahalanobis', 'mahal', 'mah']):
-            if VI is not None:
-                VI = _convert_to_double(np.asarray(VI, order='c'))
-                if type(VI) != np.ndarray:
-                    raise TypeError('VI must be a numpy array.')
-                if VI.dtype != np.double:
-                    raise TypeError('The array must contain 64-bit floats.')
-                [VI] = _copy_arrays_if_base_present([VI])
-            else:
-                X = np.vstack([XA, XB])
-                V = np.cov(X.T)
-                X = None
-                del X
-                VI = _convert_to_double(np.linalg.inv(V).T.copy())
-            # (u-v)V^(-1)(u-v)^T
-            _distance_wrap.cdist_mahalanobis_wrap(_convert_to_double(XA),
-                                                  _convert_to_double(XB), VI, dm)
-        elif mstr == 'canberra':
-            _distance_wrap.cdist_canberra_wrap(_convert_to_double(XA),
-                                               _convert_to_double(XB), dm)
-        elif mstr == 'braycurtis':
-            _distance_wrap.cdist_bray_curtis_wrap(_convert_to_double(XA),
-                                                  _convert_to_double(XB), dm)
-        elif mstr == 'yule':
-            _distance_wrap.cdist_yule_bool_wrap(_convert_to_bool(XA),
-                                                _convert_to_bool(XB), dm)
-        elif mstr == 'matching':
-            _distance_wrap.cdist_matching_bool_wrap(_convert_to_bool(XA),
-                                                    _convert_to_bool(XB), dm)
-        elif mstr == 'kulsinski':
-            _distance_wrap.cdist_kulsinski_bool_wrap(_convert_to_bool(XA),
-                                                     _convert_to_bool(XB), dm)
-        elif mstr == 'dice':
-            _distance_wrap.cdist_dice_bool_wrap(_convert_to_bool(XA),
-                                                _convert_to_bool(XB), dm)
-        elif mstr == 'rogerstanimoto':
-            _distance_wrap.cdist_rogerstanimoto_bool_wrap(_convert_to_bool(XA),
-                                                          _convert_to_bool(XB), dm)
-        elif mstr == 'russellrao':
-            _distance_wrap.cdist_russellrao_bool_wrap(_convert_to_bool(XA),
-                                                      _convert_to_bool(XB), dm)
-        elif mstr == 'sokalmichener':
-            _distance_wrap.cdist_sokalmichener_bool_wrap(_convert_to_bool(XA),
-                                                         _convert_to_bool(XB), dm)
-        elif mstr == 'sokalsneath':
-            _distance_wrap.cdist_sokalsneath_bool_wrap(_convert_to_bool(XA),
-                                                       _convert_to_bool(XB), dm)
+        kernel = _cdist_kernel(mstr, XA, XB, p, V, VI, w)
+        if kernel is not None:
+            _cdist_blocked(kernel, dm, n_jobs)
         elif metric == 'test_euclidean':
             dm = cdist(XA, XB, euclidean)
         elif metric == 'test_seuclidean':
@@ -2031,4 +2251,87 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
             raise ValueError('Unknown Distance Metric: %s' % mstr)
     else:
         raise TypeError('2nd argument metric must be a string identifier or a function.')
+    if out is not None and dm is not out:
+        out[:] = dm
+        dm = out
     return dm
+
+def cdist_chunked(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None,
+                  chunk_size=None, reduce_func=None, n_jobs=1,
+                  vectorized=False):
+    r"""
+    Generates the distance matrix ``cdist(XA, XB, metric, ...)`` in
+    blocks of consecutive rows, so that only one block has to be held
+    in memory at a time. This makes it possible to process the
+    distances between collections too large for the full
+    :math:`m_A` by :math:`m_B` matrix to fit in memory.
+
+    Any norms, variances or inverse covariances needed by the metric
+    are computed once from the whole of ``XA`` and ``XB``, so the
+    blocks are exactly the rows ``cdist`` would return.
+
+    For example, the index of the nearest row of ``XB`` to each row of
+    ``XA`` is computed with::
+
+      code = np.concatenate(list(cdist_chunked(XA, XB,
+                     reduce_func=lambda D, start: D.argmin(axis=1))))
+
+    :Parameters:
+       XA : ndarray
+           An :math:`m_A` by :math:`n` array of :math:`m_A`
+           original observations in an :math:`n`-dimensional space.
+       XB : ndarray
+           An :math:`m_B` by :math:`n` array of :math:`m_B`
+           original observations in an :math:`n`-dimensional space.
+       metric : string or function
+           The distance metric to use, as for ``cdist``.
+       p, V, VI, w :
+           The parameters of the metric, as for ``cdist``.
+       chunk_size : int
+           The number of rows in each block. By default, the blocks
+           hold about a million distances.
+       reduce_func : function
+           If given, ``reduce_func(D, start)`` is called on each block
+           ``D``, which holds the distances from the rows ``start`` to
+           ``start + D.shape[0]`` of ``XA``, and its result is
+           generated in place of the block.
+       n_jobs : int
+           The number of threads over which to spread the computation
+           of each block, as for ``cdist``.
+       vectorized : bool
+           Whether the function ``metric`` computes the distances
+           between many pairs at once, as for ``cdist``.
+
+    :Returns:
+       A generator of :math:`b` by :math:`m_B` distance matrices, with
+       :math:`b` at most ``chunk_size``, or of the results of
+       ``reduce_func``. Each block is a new array.
+    """
+    XA, XB = _cdist_inputs(XA, XB)
+    mA = XA.shape[0]
+    mB = XB.shape[0]
+    n_jobs = _check_n_jobs(n_jobs)
+    if chunk_size is None:
+        chunk_size = max(1, 4 * _TILE_SIZE // max(1, mB))
+    chunk_size = int(chunk_size)
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer (got %d).' % chunk_size)
+
+    kernel = None
+    if isinstance(metric, basestring):
+        kernel = _cdist_kernel(metric.lower(), XA, XB, p, V, VI, w)
+    elif not callable(metric):
+        raise TypeError('3rd argument metric must be a string identifier or a function.')
+
+    for start in xrange(0, mA, chunk_size):
+        stop = min(start + chunk_size, mA)
+        if kernel is not None:
+            D = np.empty((stop - start, mB), dtype=np.double)
+            _cdist_blocked(kernel, D, n_jobs, start)
+        else:
+            D = cdist(XA[start:stop], XB, metric, p, V, VI, w,
+                      vectorized=vectorized)
+        if reduce_func is not None:
+            yield reduce_func(D, start)
+        else:
+            yield D
@@ -0,0 +1,307 @@
+"""
+An updatable kd-tree built from a forest of static kd-trees.
+"""
+import numpy as np
+from ckdtree import cKDTree
+
+__all__ = ['DynamicKDTree']
+
+class DynamicKDTree(object):
+    """
+    kd-tree supporting insertion and deletion of points
+
+    The points are held in a "logarithmic" forest of static kd-trees
+    (Bentley and Saxe 1980): level j contains at most leafsize*2**j
+    points, and an insertion merges the new points with the smallest
+    levels into the first level that can hold them all. Each point is
+    therefore rebuilt into a tree O(log n) times over its lifetime, so
+    the cost of an update is proportional to the number of points
+    inserted rather than to the size of the tree.
+
+    Deleted points are only marked as such; a level is rebuilt without
+    them once they make up half of it.
+
+    Points are identified by integer ids, which are returned by insert
+    and reported by the queries in place of positions in a data array.
+    The points the tree was constructed with have ids 0 to n-1.
+    """
+
+    def __init__(self, data, leafsize=10):
+        """Construct an updatable kd-tree.
+
+        Parameters:
+        ===========
+
+        data : array-like, shape (n,m)
+            The initial points, which may be an empty (0,m) array.
+        leafsize : positive integer
+            The leafsize of the static trees, and the capacity of
+            the smallest level.
+        """
+        data = np.asarray(data, dtype=np.float)
+        if len(data.shape)!=2:
+            raise ValueError("data must be a two-dimensional array")
+        self.m = data.shape[1]
+        self.leafsize = int(leafsize)
+        if self.leafsize<1:
+            raise ValueError("leafsize must be at least 1")
+        self.n = 0
+        self._next_id = 0
+        self._alive = np.zeros(0, dtype=np.bool)
+        self._level = np.zeros(0, dtype=np.int32)
+        self._trees = []
+        self._ids = []
+        self._deleted = []
+        self.insert(data)
+
+    def __len__(self):
+        return self.n
+
+    def __capacity(self, j):
+        return self.leafsize*2**j
+
+    def __live(self, j):
+        """The live points and their ids in level j."""
+        ids = self._ids[j]
+        if self._deleted[j]==0:
+            return self._trees[j].data, ids
+        alive = self._alive[ids]
+        return self._trees[j].data[alive], ids[alive]
+
+    def __set_level(self, j, data, ids):
+        if len(ids)==0:
+            self._trees[j] = None
+            self._ids[j] = None
+        else:
+            self._trees[j] = cKDTree(data, leafsize=self.leafsize)
+            self._ids[j] = ids
+            self._level[ids] = j
+        self._deleted[j] = 0
+
+    def insert(self, points):
+        """Insert points into the tree.
+
+        Parameters
+        ==========
+
+        points : array-like, shape (b,m)
+            The points to insert.
+
+        Returns
+        =======
+
+        ids : array of integers, shape (b,)
+            The ids assigned to the new points.
+        """
+        points = np.asarray(points, dtype=np.float)
+        if len(points.shape)!=2 or points.shape[1]!=self.m:
+            raise ValueError("points must have shape (b,%d) but have shape %s" % (self.m, np.shape(points)))
+        b = points.shape[0]
+        ids = np.arange(self._next_id, self._next_id+b)
+        if b==0:
+            return ids
+        self._next_id += b
+        if len(self._alive)<self._next_id:
+            size = max(self._next_id, 2*len(self._alive))
+            self._alive = np.concatenate((self._alive,
+                    np.zeros(size-len(self._alive), dtype=np.bool)))
+            self._level = np.concatenate((self._level,
+                    np.zeros(size-len(self._level), dtype=np.int32)))
+        self._alive[ids] = True
+        self.n += b
+
+        # find the first level that can hold the new points together
+        # with everything in the levels below it
+        datas = [points]
+        idss = [ids]
+        total = b
+        j = 0
+        while True:
+            if j==len(self._trees):
+                self._trees.append(None)
+                self._ids.append(None)
+                self._deleted.append(0)
+            if self._trees[j] is not None:
+                data, live_ids = self.__live(j)
+                datas.append(data)
+                idss.append(live_ids)
+                total += len(live_ids)
+            if total<=self.__capacity(j):
+                break
+            j += 1
+        for i in range(j):
+            self._trees[i] = None
+            self._ids[i] = None
+            self._deleted[i] = 0
+        self.__set_level(j, np.concatenate(datas), np.concatenate(idss))
+        return ids
+
+    def delete(self, ids):
+        """Delete points from the tree.
+
+        Parameters
+        ==========
+
+        ids : integer or array of integers
+            The ids of the points to delete, as returned by insert.
+        """
+        ids = np.unique(np.atleast_1d(np.asarray(ids, dtype=np.int)))
+        if len(ids)==0:
+            return
+        if (ids[0]<0 or ids[-1]>=self._next_id
+                or not np.all(self._alive[ids])):
+            raise ValueError("Not all of the ids %s are in the tree" % ids)
+        self._alive[ids] = False
+        self.n -= len(ids)
+        counts = np.bincount(self._level[ids])
+        for j in np.nonzero(counts)[0]:
+            self._deleted[j] += counts[j]
+            # compact the level once half of it is dead
+            if 2*self._deleted[j]>=len(self._ids[j]):
+                data, live_ids = self.__live(j)
+                self.__set_level(j, data, live_ids)
+
+    def __query_level(self, j, xx, k, eps, p, distance_upper_bound):
+        """The k nearest live neighbors in level j of each row of xx.
+
+        Dead points may hide live ones, so the rows that find fewer than
+        k live neighbors are queried again for twice as many, until they
+        have k or the level has no more points to offer. The work thus
+        grows with k and the dead points near each row, not with all the
+        dead points of the level.
+        """
+        T = self._trees[j]
+        nq = xx.shape[0]
+        dd = np.empty((nq,k), dtype=np.float)
+        dd.fill(np.inf)
+        ii = np.empty((nq,k), dtype=np.int)
+        ii.fill(-1)
+        rows = np.arange(nq)
+        kk = min(k, T.n)
+        while len(rows):
+            d, i = T.query(xx[rows], k=kk, eps=eps, p=p,
+                           distance_upper_bound=distance_upper_bound)
+            d = np.reshape(d, (len(rows),kk))
+            i = np.reshape(i, (len(rows),kk))
+            found = i<T.n
+            ids = np.where(found, self._ids[j][np.minimum(i,T.n-1)], -1)
+            live = found & self._alive[np.maximum(ids,0)]
+            # a stable sort moves the live neighbors to the front in order
+            order = np.argsort(~live, axis=1, kind='mergesort')[:,:k]
+            r = np.arange(len(rows))[:,np.newaxis]
+            dd[rows,:order.shape[1]] = np.where(live, d, np.inf)[r,order]
+            ii[rows,:order.shape[1]] = np.where(live, ids, -1)[r,order]
+            if kk==T.n:
+                break
+            # rows whose last neighbor was found may have more beyond it
+            more = (live.sum(axis=1)<k) & found[:,-1]
+            rows = rows[more]
+            kk = min(2*kk, T.n)
+        return dd, ii
+
+    def query(self, x, k=1, eps=0, p=2, distance_upper_bound=np.inf):
+        """
+        query the tree for nearest neighbors
+
+        Parameters
+        ----------
+
+        x : array-like, last dimension self.m
+            An array of points to query.
+        k : integer
+            The number of nearest neighbors to return.
+        eps : nonnegative float
+            Return approximate nearest neighbors; the kth returned value
+            is guaranteed to be no further than (1+eps) times the
+            distance to the real kth nearest neighbor.
+        p : float, 1<=p<=infinity
+            Which Minkowski p-norm to use.
+        distance_upper_bound : nonnegative float
+            Return only neighbors within this distance.
+
+        Returns
+        -------
+
+        d : array of floats
+            The distances to the nearest neighbors.
+            If x has shape tuple+(self.m,), then d has shape tuple if
+            k is one, or tuple+(k,) if k is larger than one. Missing
+            neighbors are indicated with infinite distances.
+        i : array of integers
+            The ids of the neighbors. i is the same shape as d.
+            Missing neighbors are indicated with -1.
+        """
+        x = np.asarray(x, dtype=np.float)
+        if np.shape(x)[-1] != self.m:
+            raise ValueError("x must consist of vectors of length %d but has shape %s" % (self.m, np.shape(x)))
+        if k is None or k<1:
+            raise ValueError("Requested %s nearest neighbors; acceptable numbers are integers greater than or equal to one" % k)
+        retshape = np.shape(x)[:-1]
+        xx = np.reshape(x, (-1,self.m))
+        nq = xx.shape[0]
+        dd = np.empty((nq,k), dtype=np.float)
+        dd.fill(np.inf)
+        ii = np.empty((nq,k), dtype=np.int)
+        ii.fill(-1)
+        for j in range(len(self._trees)):
+            if self._trees[j] is None:
+                continue
+            d, ids = self.__query_level(j, xx, k, eps, p,
+                                        distance_upper_bound)
+            dd = np.concatenate((dd,d), axis=1)
+            ii = np.concatenate((ii,ids), axis=1)
+            order = np.argsort(dd, axis=1, kind='mergesort')[:,:k]
+            rows = np.arange(nq)[:,np.newaxis]
+            dd = dd[rows,order]
+            ii = ii[rows,order]
+        if k==1:
+            return np.reshape(dd[:,0],retshape)[()], np.reshape(ii[:,0],retshape)[()]
+        else:
+            return np.reshape(dd,retshape+(k,)), np.reshape(ii,retshape+(k,))
+
+    def __query_ball_point(self, x, r, p, eps):
+        results = []
+        for j in range(len(self._trees)):
+            T = self._trees[j]
+            if T is None:
+                continue
+            ids = self._ids[j][np.asarray(T.query_ball_point(x, r, p=p, eps=eps), dtype=np.int)]
+            results.extend(ids[self._alive[ids]].tolist())
+        return results
+
+    def query_ball_point(self, x, r, p=2., eps=0):
+        """Find all points within r of x
+
+        Parameters
+        ==========
+
+        x : array_like, shape tuple + (self.m,)
+            The point or points to search for neighbors of
+        r : positive float
+            The radius of points to return
+        p : float 1<=p<=infinity
+            Which Minkowski p-norm to use
+        eps : nonnegative float
+            Approximate search. Branches of the tree are not explored
+            if their nearest points are further than r/(1+eps), and branches
+            are added in bulk if their furthest points are nearer than r*(1+eps).
+
+        Returns
+        =======
+
+        results : list or array of lists
+            If x is a single point, returns a list of the ids of the neighbors
+            of x. If x is an array of points, returns an object array of shape tuple
+            containing lists of neighbors.
+        """
+        x = np.asarray(x, dtype=np.float)
+        if x.shape[-1]!=self.m:
+            raise ValueError("Searching for a %d-dimensional point in a %d-dimensional KDTree" % (x.shape[-1],self.m))
+        if len(x.shape)==1:
+            return self.__query_ball_point(x,r,p,eps)
+        else:
+            retshape = x.shape[:-1]
+            result = np.empty(retshape,dtype=np.object)
+            for c in np.ndindex(retshape):
+                result[c] = self.__query_ball_point(x[c], r, p=p, eps=eps)
+            return result
@@ -5,6 +5,9 @@ Spatial data structures and algorithms
 Nearest-neighbor queries:
 
     KDTree      -- class for efficient nearest-neighbor queries
+    cKDTree     -- compiled version of KDTree
+    DynamicKDTree -- kd-tree supporting insertion and deletion of points
+    load_tree   -- load a kd-tree saved with KDTree.save or cKDTree.save
     distance    -- module containing many different distance measures
 
 """
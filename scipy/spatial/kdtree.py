@@ -1,5 +1,6 @@
 # Copyright Anne M. Archibald 2008
 # Released under the scipy license
+import os as _os
 import numpy as np
 from heapq import heappush, heappop
 import scipy.sparse
@@ -192,6 +193,89 @@ class KDTree(object):
                     self.__build(idx[less_idx],lessmaxes,mins),
                     self.__build(idx[greater_idx],maxes,greatermins))
 
+    def __getstate__(self):
+        # The tree is stored as flat arrays, one entry per node in
+        # depth-first order, so that pickle does not recurse through the
+        # node objects and the tree can be saved in a layout that can be
+        # memory-mapped (see save).  flatten itself only recurses as deep
+        # as the tree.
+        split_dim = []
+        split = []
+        start_idx = []
+        end_idx = []
+        less = []
+        greater = []
+        indices = []
+        def flatten(node, start):
+            i = len(split_dim)
+            split_dim.append(-1)
+            split.append(0.)
+            start_idx.append(start)
+            end_idx.append(start)
+            less.append(-1)
+            greater.append(-1)
+            if isinstance(node, KDTree.leafnode):
+                indices.append(node.idx)
+                end = start+len(node.idx)
+            else:
+                split_dim[i] = node.split_dim
+                split[i] = node.split
+                less[i] = len(split_dim)
+                end = flatten(node.less, start)
+                greater[i] = len(split_dim)
+                end = flatten(node.greater, end)
+            end_idx[i] = end
+            return end
+        flatten(self.tree, 0)
+        return dict(data=self.data,
+                    leafsize=np.array(self.leafsize),
+                    maxes=self.maxes,
+                    mins=self.mins,
+                    indices=np.concatenate(indices).astype(np.int32),
+                    split_dim=np.array(split_dim,dtype=np.int32),
+                    split=np.array(split,dtype=np.float),
+                    start_idx=np.array(start_idx,dtype=np.int32),
+                    end_idx=np.array(end_idx,dtype=np.int32),
+                    less=np.array(less,dtype=np.int32),
+                    greater=np.array(greater,dtype=np.int32))
+
+    def __setstate__(self, state):
+        self.data = state['data']
+        self.n, self.m = np.shape(self.data)
+        self.leafsize = int(state['leafsize'])
+        self.maxes = state['maxes']
+        self.mins = state['mins']
+        indices = state['indices']
+        split_dim = state['split_dim']
+        split = state['split']
+        start_idx = state['start_idx']
+        end_idx = state['end_idx']
+        less = state['less']
+        greater = state['greater']
+        def unflatten(i):
+            if split_dim[i]==-1:
+                return KDTree.leafnode(indices[start_idx[i]:end_idx[i]])
+            else:
+                return KDTree.innernode(int(split_dim[i]), split[i],
+                        unflatten(less[i]), unflatten(greater[i]))
+        self.tree = unflatten(0)
+
+    def save(self, dirname):
+        """Save the tree to a directory of .npy files.
+
+        The tree is written as flat arrays (the data, the permutation of
+        the points into leaf order, and per-node split dimensions, split
+        values, index ranges and children) so that load_tree can map
+        them into memory without rebuilding the tree.
+
+        Parameters
+        ==========
+
+        dirname : string
+            The directory to write to; it is created if necessary.
+        """
+        _save_tree(dirname, self)
+
     def __query(self, x, k=1, eps=0, p=2, distance_upper_bound=np.inf):
 
         side_distances = np.maximum(0,np.maximum(x-self.maxes,self.mins-x))
@@ -772,6 +856,50 @@ class KDTree(object):
         return result
 
 
+def _save_tree(dirname, tree):
+    """Write the flat array layout of a KDTree or cKDTree to dirname"""
+    if not _os.path.isdir(dirname):
+        _os.makedirs(dirname)
+    state = tree.__getstate__()
+    state['tree_type'] = np.array(type(tree).__name__)
+    for name, value in state.items():
+        np.save(_os.path.join(dirname, name+'.npy'), np.asarray(value))
+
+def load_tree(dirname, mmap_mode='r'):
+    """Load a tree saved with KDTree.save or cKDTree.save.
+
+    Parameters
+    ==========
+
+    dirname : string
+        The directory the tree was saved to.
+    mmap_mode : None or string
+        Passed to numpy.load. By default the arrays are memory-mapped
+        read-only, so that many processes can share one copy of a large
+        tree without rebuilding it. Use None to read them into memory.
+
+    Returns
+    =======
+
+    tree : KDTree or cKDTree
+        A tree of the same type as the one that was saved.
+    """
+    from ckdtree import cKDTree
+    tree_types = {'KDTree': KDTree, 'cKDTree': cKDTree}
+    state = {}
+    for name in _os.listdir(dirname):
+        if name.endswith('.npy'):
+            state[name[:-4]] = np.load(_os.path.join(dirname, name),
+                                       mmap_mode=mmap_mode)
+    tree_type = str(np.asarray(state.pop('tree_type', '')))
+    if tree_type not in tree_types:
+        raise ValueError("%s does not contain a saved kd-tree" % dirname)
+    cls = tree_types[tree_type]
+    tree = cls.__new__(cls)
+    tree.__setstate__(state)
+    return tree
+
+
 def distance_matrix(x,y,p=2,threshold=1000000):
     """Compute the distance matrix.
 
@@ -58,7 +58,9 @@ extern PyObject *cdist_euclidean_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_euclidean(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -81,7 +83,9 @@ extern PyObject *cdist_canberra_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_canberra(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -104,7 +108,9 @@ extern PyObject *cdist_bray_curtis_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_bray_curtis(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -131,7 +137,9 @@ extern PyObject *cdist_mahalanobis_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_mahalanobis(XA, XB, covinv, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -155,7 +163,9 @@ extern PyObject *cdist_chebyshev_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_chebyshev(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -183,7 +193,9 @@ extern PyObject *cdist_cosine_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_cosine(XA, XB, dm, mA, mB, n, normsA, normsB);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -208,7 +220,9 @@ extern PyObject *cdist_seuclidean_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_seuclidean(XA, XB, var, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -231,7 +245,9 @@ extern PyObject *cdist_city_block_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_city_block(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -254,7 +270,9 @@ extern PyObject *cdist_hamming_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_hamming(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -277,7 +295,9 @@ extern PyObject *cdist_hamming_bool_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_hamming_bool(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -300,7 +320,9 @@ extern PyObject *cdist_jaccard_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_jaccard(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -323,7 +345,9 @@ extern PyObject *cdist_jaccard_bool_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_jaccard_bool(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -347,7 +371,9 @@ extern PyObject *cdist_minkowski_wrap(PyObject *self, PyObject *args) {
     mA = XA_->dimensions[0];
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
+    Py_BEGIN_ALLOW_THREADS
     cdist_minkowski(XA, XB, dm, mA, mB, n, p);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -373,7 +399,9 @@ extern PyObject *cdist_weighted_minkowski_wrap(PyObject *self, PyObject *args) {
     mA = XA_->dimensions[0];
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
+    Py_BEGIN_ALLOW_THREADS
     cdist_weighted_minkowski(XA, XB, dm, mA, mB, n, p, w);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -396,7 +424,9 @@ extern PyObject *cdist_yule_bool_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_yule_bool(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -419,7 +449,9 @@ extern PyObject *cdist_matching_bool_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_matching_bool(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -442,7 +474,9 @@ extern PyObject *cdist_dice_bool_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_dice_bool(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -465,7 +499,9 @@ extern PyObject *cdist_rogerstanimoto_bool_wrap(PyObject *self, PyObject *args)
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_rogerstanimoto_bool(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -488,7 +524,9 @@ extern PyObject *cdist_russellrao_bool_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_russellrao_bool(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -511,7 +549,9 @@ extern PyObject *cdist_kulsinski_bool_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_kulsinski_bool(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -534,7 +574,9 @@ extern PyObject *cdist_sokalmichener_bool_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_sokalmichener_bool(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -557,7 +599,9 @@ extern PyObject *cdist_sokalsneath_bool_wrap(PyObject *self, PyObject *args) {
     mB = XB_->dimensions[0];
     n = XA_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     cdist_sokalsneath_bool(XA, XB, dm, mA, mB, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -580,7 +624,9 @@ extern PyObject *pdist_euclidean_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_euclidean(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -601,7 +647,9 @@ extern PyObject *pdist_canberra_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_canberra(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -622,7 +670,9 @@ extern PyObject *pdist_bray_curtis_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_bray_curtis(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -647,7 +697,9 @@ extern PyObject *pdist_mahalanobis_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_mahalanobis(X, covinv, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -669,7 +721,9 @@ extern PyObject *pdist_chebyshev_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_chebyshev(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -693,7 +747,9 @@ extern PyObject *pdist_cosine_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_cosine(X, dm, m, n, norms);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -716,7 +772,9 @@ extern PyObject *pdist_seuclidean_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_seuclidean(X, var, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -737,7 +795,9 @@ extern PyObject *pdist_city_block_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_city_block(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -758,7 +818,9 @@ extern PyObject *pdist_hamming_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_hamming(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -779,7 +841,9 @@ extern PyObject *pdist_hamming_bool_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_hamming_bool(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -800,7 +864,9 @@ extern PyObject *pdist_jaccard_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_jaccard(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -821,7 +887,9 @@ extern PyObject *pdist_jaccard_bool_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_jaccard_bool(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -843,7 +911,9 @@ extern PyObject *pdist_minkowski_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_minkowski(X, dm, m, n, p);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -867,7 +937,9 @@ extern PyObject *pdist_weighted_minkowski_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_weighted_minkowski(X, dm, m, n, p, w);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("d", 0.0);
 }
@@ -889,7 +961,9 @@ extern PyObject *pdist_yule_bool_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_yule_bool(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -910,7 +984,9 @@ extern PyObject *pdist_matching_bool_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_matching_bool(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -931,7 +1007,9 @@ extern PyObject *pdist_dice_bool_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_dice_bool(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -952,7 +1030,9 @@ extern PyObject *pdist_rogerstanimoto_bool_wrap(PyObject *self, PyObject *args)
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_rogerstanimoto_bool(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -973,7 +1053,9 @@ extern PyObject *pdist_russellrao_bool_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_russellrao_bool(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -994,7 +1076,9 @@ extern PyObject *pdist_kulsinski_bool_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_kulsinski_bool(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -1015,7 +1099,9 @@ extern PyObject *pdist_sokalmichener_bool_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_sokalmichener_bool(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -1036,7 +1122,9 @@ extern PyObject *pdist_sokalsneath_bool_wrap(PyObject *self, PyObject *args) {
     m = X_->dimensions[0];
     n = X_->dimensions[1];
 
+    Py_BEGIN_ALLOW_THREADS
     pdist_sokalsneath_bool(X, dm, m, n);
+    Py_END_ALLOW_THREADS
   }
   return Py_BuildValue("");
 }
@@ -38,10 +38,10 @@ import os.path
 
 import numpy as np
 from numpy.testing import *
-from scipy.spatial.distance import squareform, pdist, cdist, matching, \
+from scipy.spatial.distance import squareform, pdist, cdist, cdist_chunked, matching, \
                                    jaccard, dice, sokalsneath, rogerstanimoto, \
                                    russellrao, yule, num_obs_y, num_obs_dm, \
-                                   is_valid_dm, is_valid_y
+                                   is_valid_dm, is_valid_y, euclidean
 
 _filenames = ["iris.txt",
               "cdist-X1.txt",
@@ -470,6 +470,129 @@ class TestCdist(TestCase):
             print (Y1-Y2).max()
         self.failUnless(within_tol(Y1, Y2, eps))
 
+    def test_cdist_n_jobs(self):
+        "Tests cdist(X, metric, n_jobs=3) against the single-threaded result."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        for metric in ['euclidean', 'sqeuclidean', 'cityblock', 'cosine',
+                       'correlation', 'seuclidean', 'mahalanobis',
+                       'minkowski', 'chebyshev', 'canberra', 'hamming']:
+            Y1 = cdist(X1, X2, metric)
+            Y2 = cdist(X1, X2, metric, n_jobs=3)
+            assert_array_equal(Y1, Y2)
+        Y1 = cdist(X1 < 0.5, X2 < 0.5, 'yule')
+        Y2 = cdist(X1 < 0.5, X2 < 0.5, 'yule', n_jobs=3)
+        assert_array_equal(Y1, Y2)
+
+    def test_cdist_out(self):
+        "Tests cdist(X, metric, out=Y) stores the result in Y."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        for metric in ['euclidean', 'sqeuclidean', 'test_euclidean']:
+            for n_jobs in [1, 2]:
+                out = np.empty((X1.shape[0], X2.shape[0]))
+                Y = cdist(X1, X2, metric, out=out, n_jobs=n_jobs)
+                self.failUnless(Y is out)
+                assert_array_equal(out, cdist(X1, X2, metric))
+
+    def test_cdist_out_memmap(self):
+        "Tests cdist(X, metric, out=Y) with a memory-mapped file Y."
+        from tempfile import mktemp
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        fn = mktemp()
+        try:
+            for n_jobs in [1, 2]:
+                out = np.memmap(fn, dtype=np.double, mode='w+',
+                                shape=(X1.shape[0], X2.shape[0]))
+                Y = cdist(X1, X2, out=out, n_jobs=n_jobs)
+                self.failUnless(Y is out)
+                out.flush()
+                del out, Y
+                Y = np.memmap(fn, dtype=np.double, mode='r',
+                              shape=(X1.shape[0], X2.shape[0]))
+                assert_array_equal(Y, cdist(X1, X2))
+                del Y
+        finally:
+            if os.path.exists(fn):
+                os.remove(fn)
+
+    def test_cdist_out_invalid(self):
+        "Tests cdist(X, metric, out=Y) with unusable arrays Y."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        mA, mB = X1.shape[0], X2.shape[0]
+        self.failUnlessRaises(ValueError, cdist, X1, X2, out=np.empty((mA, mB + 1)))
+        self.failUnlessRaises(ValueError, cdist, X1, X2, out=np.empty((mB, mA)).T)
+        self.failUnlessRaises(TypeError, cdist, X1, X2, out=np.empty((mA, mB), dtype=np.float32))
+        self.failUnlessRaises(TypeError, cdist, X1, X2, out=np.empty((mA, mB)).tolist())
+        self.failUnlessRaises(ValueError, cdist, X1, X2, n_jobs=0)
+
+    def test_cdist_vectorized(self):
+        "Tests cdist(XA, XB, f, vectorized=True) with an array metric f."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        f = lambda U, V: np.abs(U - V).sum(axis=1)
+        Y = cdist(X1, X2, f, vectorized=True)
+        assert_array_almost_equal(Y, cdist(X1, X2, 'cityblock'))
+        import scipy.spatial.distance as distance
+        old = distance._TILE_SIZE
+        distance._TILE_SIZE = 25
+        try:
+            Y = cdist(X1, X2, f, vectorized=True)
+        finally:
+            distance._TILE_SIZE = old
+        assert_array_almost_equal(Y, cdist(X1, X2, 'cityblock'))
+        self.failUnlessRaises(ValueError, cdist, X1, X2,
+                              lambda U, V: 0.0, vectorized=True)
+
+class TestCdistChunked(TestCase):
+    """
+    Test suite for the cdist_chunked function.
+    """
+
+    def test_cdist_chunked_blocks(self):
+        "Tests cdist_chunked(XA, XB) yields the rows of cdist(XA, XB)."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        for metric in ['euclidean', 'seuclidean', 'mahalanobis', 'correlation',
+                       'test_euclidean']:
+            Y = cdist(X1, X2, metric)
+            for chunk_size in [1, 3, X1.shape[0], 100]:
+                blocks = list(cdist_chunked(X1, X2, metric, chunk_size=chunk_size))
+                assert_equal(len(blocks), -(-X1.shape[0] // chunk_size))
+                self.failUnless(max([b.shape[0] for b in blocks]) <= chunk_size)
+                assert_array_equal(np.vstack(blocks), Y)
+
+    def test_cdist_chunked_callable(self):
+        "Tests cdist_chunked(XA, XB, f) with a Python metric."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        blocks = cdist_chunked(X1, X2, euclidean, chunk_size=4)
+        assert_array_almost_equal(np.vstack(list(blocks)), cdist(X1, X2))
+
+    def test_cdist_chunked_reduce(self):
+        "Tests cdist_chunked(XA, XB, reduce_func=f) yields the results of f."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        starts = []
+        def nearest(D, start):
+            starts.append(start)
+            return D.argmin(axis=1)
+        code = np.concatenate(list(cdist_chunked(X1, X2, 'cityblock',
+                                                 chunk_size=3, n_jobs=2,
+                                                 reduce_func=nearest)))
+        assert_array_equal(code, cdist(X1, X2, 'cityblock').argmin(axis=1))
+        assert_equal(starts, range(0, X1.shape[0], 3))
+
+    def test_cdist_chunked_invalid(self):
+        "Tests cdist_chunked with invalid arguments."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        self.failUnlessRaises(ValueError, list, cdist_chunked(X1, X2, chunk_size=0))
+        self.failUnlessRaises(ValueError, list, cdist_chunked(X1, X2[:,:2]))
+        self.failUnlessRaises(ValueError, list, cdist_chunked(X1, X2, 'nonexistent'))
+
 class TestPdist(TestCase):
     """
     Test suite for the pdist function.
@@ -1383,6 +1506,59 @@ class TestPdist(TestCase):
             print np.abs(pdist_y-right_y).max()
         self.failUnless(within_tol(pdist_y, right_y, eps))
 
+    def test_pdist_n_jobs(self):
+        "Tests pdist(X, metric, n_jobs=3) against the single-threaded result."
+        eps = 1e-12
+        X = eo['iris']
+        for metric in ['euclidean', 'sqeuclidean', 'cityblock', 'cosine',
+                       'correlation', 'seuclidean', 'mahalanobis',
+                       'minkowski', 'chebyshev', 'canberra', 'hamming']:
+            Y1 = pdist(X, metric)
+            Y2 = pdist(X, metric, n_jobs=3)
+            self.failUnless(within_tol(Y1, Y2, eps))
+        X = eo['pdist-boolean-inp']
+        assert_array_equal(pdist(X, 'dice'), pdist(X, 'dice', n_jobs=3))
+
+    def test_pdist_n_jobs_small_tiles(self):
+        "Tests pdist(X, n_jobs=2) when each block holds a single row."
+        import scipy.spatial.distance as distance
+        X = eo['pdist-double-inp']
+        old = distance._TILE_SIZE
+        distance._TILE_SIZE = 1
+        try:
+            Y = pdist(X, n_jobs=2)
+        finally:
+            distance._TILE_SIZE = old
+        self.failUnless(within_tol(Y, eo['pdist-euclidean'], 1e-07))
+
+    def test_pdist_out(self):
+        "Tests pdist(X, metric, out=Y) stores the result in Y."
+        X = eo['pdist-double-inp']
+        m = X.shape[0]
+        for metric in ['euclidean', 'sqeuclidean', 'test_euclidean']:
+            for n_jobs in [1, 2]:
+                out = np.empty((m * (m - 1) / 2,))
+                Y = pdist(X, metric, out=out, n_jobs=n_jobs)
+                self.failUnless(Y is out)
+                self.failUnless(within_tol(out, pdist(X, metric), 1e-12))
+        self.failUnlessRaises(ValueError, pdist, X, out=np.empty((m, m)))
+        self.failUnlessRaises(ValueError, pdist, X, n_jobs=-2)
+
+    def test_pdist_vectorized(self):
+        "Tests pdist(X, f, vectorized=True) with an array metric f."
+        X = eo['iris']
+        f = lambda U, V: np.sqrt(((U - V)**2).sum(axis=1))
+        Y_right = pdist(X, 'euclidean')
+        import scipy.spatial.distance as distance
+        old = distance._TILE_SIZE
+        for size in [old, 1, 1000]:
+            distance._TILE_SIZE = size
+            try:
+                Y = pdist(X, f, vectorized=True)
+            finally:
+                distance._TILE_SIZE = old
+            self.failUnless(within_tol(Y, Y_right, 1e-12))
+
 def within_tol(a, b, tol):
     return np.abs(a - b).max() < tol
 
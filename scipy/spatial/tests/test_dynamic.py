@@ -0,0 +1,121 @@
+from numpy.testing import *
+
+import numpy as np
+from scipy.spatial import DynamicKDTree
+from scipy.spatial import minkowski_distance as distance
+
+class test_dynamic_kdtree:
+    def setUp(self):
+        np.random.seed(1234)
+        self.m = 3
+        self.data = np.random.randn(50, self.m)
+        self.T = DynamicKDTree(self.data, leafsize=2)
+        self.points = dict(enumerate(self.data))
+
+    def insert(self, b):
+        new = np.random.randn(b, self.m)
+        ids = self.T.insert(new)
+        for i, x in zip(ids, new):
+            self.points[i] = x
+        return ids
+
+    def delete(self, ids):
+        self.T.delete(ids)
+        for i in ids:
+            del self.points[i]
+
+    def check_against_brute_force(self):
+        assert_equal(len(self.T), len(self.points))
+        ids = np.array(sorted(self.points.keys()))
+        data = np.array([self.points[i] for i in ids]).reshape((-1,self.m))
+        for x in np.random.randn(5, self.m):
+            ds = distance(data, x)
+            order = np.argsort(ds)[:4]
+            d, i = self.T.query(x, k=4)
+            assert_almost_equal(d[:len(order)], ds[order])
+            assert_array_equal(i[:len(order)], ids[order])
+            assert np.all(i[len(order):]==-1)
+            assert_equal(sorted(self.T.query_ball_point(x, 0.8)),
+                         ids[ds<=0.8].tolist())
+
+    def test_initial_ids(self):
+        d, i = self.T.query(self.data[7])
+        assert_equal(i, 7)
+        assert_almost_equal(d, 0)
+
+    def test_insert(self):
+        for b in [1, 5, 0, 60, 3]:
+            self.insert(b)
+            self.check_against_brute_force()
+
+    def test_delete(self):
+        ids = self.insert(20)
+        self.delete(ids[:10])
+        self.check_against_brute_force()
+        self.delete(range(25))
+        self.check_against_brute_force()
+
+    def test_churn(self):
+        for tick in range(20):
+            ids = self.insert(10)
+            self.delete(ids[::2])
+            self.check_against_brute_force()
+
+    def test_delete_everything(self):
+        self.delete(self.points.keys())
+        d, i = self.T.query(np.zeros(self.m), k=2)
+        assert np.all(np.isinf(d))
+        assert_array_equal(i, [-1, -1])
+        assert_equal(self.T.query_ball_point(np.zeros(self.m), 10.), [])
+
+    def test_delete_missing(self):
+        self.T.delete([3])
+        assert_raises(ValueError, self.T.delete, [3])
+        assert_raises(ValueError, self.T.delete, [1000])
+
+    def test_vectorized_query(self):
+        d, i = self.T.query(np.zeros((2,4,self.m)))
+        assert_equal(np.shape(d), (2,4))
+        assert_equal(np.shape(i), (2,4))
+        d, i = self.T.query(np.zeros((2,4,self.m)), k=3)
+        assert_equal(np.shape(d), (2,4,3))
+        r = self.T.query_ball_point(np.zeros((2,3,self.m)), 1.)
+        assert_equal(r.shape, (2,3))
+        assert isinstance(r[0,0], list)
+
+def test_query_after_heavy_deletion():
+    np.random.seed(1234)
+    data = np.random.randn(2000, 3)
+    T = DynamicKDTree(data)
+    # a third of each level is dead, below the compaction threshold,
+    # and the dead points crowd around the origin
+    near = np.argsort(distance(data, np.zeros(3)))
+    dead = np.union1d(np.arange(0, 2000, 3), near[:40])
+    T.delete(dead)
+    live = np.setdiff1d(np.arange(2000), dead)
+    x = np.vstack((np.zeros((1,3)), 0.1*np.random.randn(20, 3)))
+    for k in [1, 5]:
+        d, i = T.query(x, k=k)
+        d, i = np.reshape(d, (len(x),k)), np.reshape(i, (len(x),k))
+        for xi, di, ii in zip(x, d, i):
+            ds = distance(data[live], xi)
+            order = np.argsort(ds)[:k]
+            assert_almost_equal(di, ds[order])
+            assert_array_equal(ii, live[order])
+    d, i = T.query(np.zeros(3), k=3, distance_upper_bound=0.01)
+    assert np.all(np.isinf(d))
+    assert_array_equal(i, [-1, -1, -1])
+
+def test_empty():
+    T = DynamicKDTree(np.zeros((0,2)))
+    assert_equal(len(T), 0)
+    d, i = T.query([0.,0.])
+    assert_equal(d, np.inf)
+    assert_equal(i, -1)
+    ids = T.insert([[1.,1.]])
+    assert_array_equal(ids, [0])
+    assert_equal(T.query([0.,0.])[1], 0)
+
+
+if __name__=="__main__":
+    run_module_suite()
@@ -2,8 +2,12 @@
 # Released under the scipy license
 from numpy.testing import *
 
+import os
+import shutil
+import tempfile
+import pickle
 import numpy as np
-from scipy.spatial import KDTree, Rectangle, distance_matrix, cKDTree
+from scipy.spatial import KDTree, Rectangle, distance_matrix, cKDTree, load_tree
 from scipy.spatial import minkowski_distance as distance
 
 class ConsistencyTests:
@@ -214,6 +218,17 @@ class test_vectorization_compiled:
         for q, d, i in zip(qs,ds,i_s):
             assert_equal(self.kdtree.query(q),(d,i))
 
+    def test_vectorized_query_multithreaded(self):
+        qs = np.random.randn(100,3)
+        d1, i1 = self.kdtree.query(qs, k=3)
+        for n_jobs in [2, 7, -1]:
+            d2, i2 = self.kdtree.query(qs, k=3, n_jobs=n_jobs)
+            assert_equal(d1, d2)
+            assert_equal(i1, i2)
+
+    def test_invalid_n_jobs(self):
+        assert_raises(ValueError, self.kdtree.query, [0,0,0], n_jobs=0)
+
 
     def test_single_query_multiple_neighbors(self):
         s = 23
@@ -281,6 +296,42 @@ class test_random_ball_linf(test_random_ball):
         test_random_ball.setUp(self)
         self.p = np.inf
 
+class test_random_ball_compiled(ball_consistency):
+
+    def setUp(self):
+        n = 100
+        m = 4
+        self.data = np.random.randn(n,m)
+        self.T = cKDTree(self.data,leafsize=2)
+        self.x = np.random.randn(m)
+        self.p = 2.
+        self.eps = 0
+        self.d = 0.2
+
+class test_random_ball_compiled_approx(test_random_ball_compiled):
+
+    def setUp(self):
+        test_random_ball_compiled.setUp(self)
+        self.eps = 0.1
+
+class test_random_ball_compiled_far(test_random_ball_compiled):
+
+    def setUp(self):
+        test_random_ball_compiled.setUp(self)
+        self.d = 2.
+
+class test_random_ball_compiled_l1(test_random_ball_compiled):
+
+    def setUp(self):
+        test_random_ball_compiled.setUp(self)
+        self.p = 1
+
+class test_random_ball_compiled_linf(test_random_ball_compiled):
+
+    def setUp(self):
+        test_random_ball_compiled.setUp(self)
+        self.p = np.inf
+
 def test_random_ball_vectorized():
 
     n = 20
@@ -291,6 +342,16 @@ def test_random_ball_vectorized():
     assert_equal(r.shape,(2,3))
     assert isinstance(r[0,0],list)
 
+def test_random_ball_vectorized_compiled():
+
+    n = 20
+    m = 5
+    T = cKDTree(np.random.randn(n,m))
+
+    r = T.query_ball_point(np.random.randn(2,3,m),1)
+    assert_equal(r.shape,(2,3))
+    assert isinstance(r[0,0],list)
+
 class two_trees_consistency:
 
     def test_all_in_ball(self):
@@ -330,6 +391,31 @@ class test_two_random_trees_linf(test_two_random_trees):
         test_two_random_trees.setUp(self)
         self.p = np.inf
 
+class test_two_random_trees_compiled(two_trees_consistency):
+
+    def setUp(self):
+        n = 50
+        m = 4
+        self.data1 = np.random.randn(n,m)
+        self.T1 = cKDTree(self.data1,leafsize=2)
+        self.data2 = np.random.randn(n,m)
+        self.T2 = cKDTree(self.data2,leafsize=2)
+        self.p = 2.
+        self.eps = 0
+        self.d = 0.2
+
+class test_two_random_trees_compiled_far(test_two_random_trees_compiled):
+
+    def setUp(self):
+        test_two_random_trees_compiled.setUp(self)
+        self.d = 2
+
+class test_two_random_trees_compiled_linf(test_two_random_trees_compiled):
+
+    def setUp(self):
+        test_two_random_trees_compiled.setUp(self)
+        self.p = np.inf
+
 
 class test_rectangle:
 
@@ -393,6 +479,21 @@ class test_count_neighbors:
         for r,result in zip(rs, results):
             assert_equal(self.T1.count_neighbors(self.T2, r), result)
 
+class test_count_neighbors_compiled(test_count_neighbors):
+
+    def setUp(self):
+        n = 50
+        m = 2
+        self.T1 = cKDTree(np.random.randn(n,m),leafsize=2)
+        self.T2 = cKDTree(np.random.randn(n,m),leafsize=2)
+
+    def test_consistency_with_python(self):
+        rs = np.exp(np.linspace(np.log(0.01),np.log(10),5))
+        T1 = KDTree(self.T1.data,leafsize=2)
+        T2 = KDTree(self.T2.data,leafsize=2)
+        assert_equal(self.T1.count_neighbors(self.T2, rs),
+                     T1.count_neighbors(T2, rs))
+
 class test_sparse_distance_matrix:
     def setUp(self):
         n = 50
@@ -413,6 +514,22 @@ class test_sparse_distance_matrix:
     def test_zero_distance(self):
         M = self.T1.sparse_distance_matrix(self.T1, self.r) # raises an exception for bug 870
 
+class test_sparse_distance_matrix_compiled(test_sparse_distance_matrix):
+    def setUp(self):
+        n = 50
+        m = 4
+        self.T1 = cKDTree(np.random.randn(n,m),leafsize=2)
+        self.T2 = cKDTree(np.random.randn(n,m),leafsize=2)
+        self.r = 0.3
+
+    def test_consistency_with_python(self):
+        M1 = self.T1.sparse_distance_matrix(self.T2, self.r)
+        M2 = KDTree(self.T1.data,leafsize=2).sparse_distance_matrix(
+                KDTree(self.T2.data,leafsize=2), self.r)
+        assert_equal(sorted(M1.keys()), sorted(M2.keys()))
+        for k in M1.keys():
+            assert_almost_equal(M1[k], M2[k])
+
 def test_distance_matrix():
     m = 10
     n = 11
@@ -461,6 +578,84 @@ def test_onetree_query():
     yield check_onetree_query, T, 0.00001
     yield check_onetree_query, T, 1e-6
 
+def test_onetree_query_compiled():
+    np.random.seed(0)
+    n = 100
+    k = 4
+    points = np.random.randn(n,k)
+    T = cKDTree(points)
+    yield check_onetree_query, T, 0.1
+
+    points = np.random.randn(3*n,k)
+    points[:n] *= 0.001
+    points[n:2*n] += 2
+    T = cKDTree(points)
+    yield check_onetree_query, T, 0.1
+    yield check_onetree_query, T, 0.001
+    yield check_onetree_query, T, 0.00001
+    yield check_onetree_query, T, 1e-6
+
+def test_query_pairs_compiled_matches_python():
+    np.random.seed(1)
+    points = np.random.randn(200,3)
+    for p in [1, 2, np.inf]:
+        assert_equal(cKDTree(points,leafsize=2).query_pairs(0.3,p=p),
+                     KDTree(points,leafsize=2).query_pairs(0.3,p=p))
+
+class saved_tree_consistency:
+    def check_same_tree(self, T):
+        assert_equal(type(T), type(self.T))
+        assert_equal(T.n, self.T.n)
+        assert_equal(T.m, self.T.m)
+        assert_equal(T.leafsize, self.T.leafsize)
+        d1, i1 = self.T.query(self.x, k=3)
+        d2, i2 = T.query(self.x, k=3)
+        assert_array_equal(d1, d2)
+        assert_array_equal(i1, i2)
+        assert_equal(T.query_pairs(0.3), self.T.query_pairs(0.3))
+
+    def test_pickle(self):
+        for protocol in [0, 2]:
+            self.check_same_tree(pickle.loads(pickle.dumps(self.T, protocol)))
+
+    def test_save_load(self):
+        dirname = tempfile.mkdtemp()
+        try:
+            self.T.save(dirname)
+            self.check_same_tree(load_tree(dirname))
+            self.check_same_tree(load_tree(dirname, mmap_mode=None))
+        finally:
+            shutil.rmtree(dirname)
+
+    def test_load_mmap(self):
+        dirname = tempfile.mkdtemp()
+        try:
+            self.T.save(dirname)
+            T = load_tree(dirname)
+            assert not T.data.flags.writeable
+        finally:
+            shutil.rmtree(dirname)
+
+class test_saved_tree(saved_tree_consistency):
+    def setUp(self):
+        self.data = np.random.randn(200,3)
+        self.T = KDTree(self.data, leafsize=4)
+        self.x = np.random.randn(10,3)
+
+class test_saved_tree_compiled(saved_tree_consistency):
+    def setUp(self):
+        self.data = np.random.randn(200,3)
+        self.T = cKDTree(self.data, leafsize=4)
+        self.x = np.random.randn(10,3)
+
+def test_load_tree_not_a_tree():
+    dirname = tempfile.mkdtemp()
+    try:
+        np.save(os.path.join(dirname, 'data.npy'), np.zeros((3,2)))
+        assert_raises(ValueError, load_tree, dirname)
+    finally:
+        shutil.rmtree(dirname)
+
 
 if __name__=="__main__":
     run_module_suite()